@@ -0,0 +1,58 @@
+import importlib
+
+# Submodules are imported on first use, so the split overlay process can draw with `core.renderer` and
+# `core.markers` without pulling in NumPy and the feature modules
+_exports = {
+    "LatencyStats": "instrumentation",
+    "WakeupCounter": "instrumentation",
+    "CrosshairState": "renderer",
+    "CrosshairRenderer": "renderer",
+    "crosshair_stylesheet": "renderer",
+    "default_renderer": "renderer",
+    "render_crosshair": "renderer",
+    "render_label": "renderer",
+    "InputSource": "input_listener",
+    "FakeInputSource": "input_listener",
+    "PynputInputSource": "input_listener",
+    "DynamicCrosshair": "dynamic",
+    "CaptureSource": "contrast",
+    "ScreenCaptureSource": "contrast",
+    "SyntheticCaptureSource": "contrast",
+    "AutoContrast": "contrast",
+    "Marker": "markers",
+    "MarkerLayer": "markers",
+    "run_in_thread": "tasks",
+    "RenderCache": "render_cache",
+    "ImageLibrary": "image_library",
+    "MipmapPyramid": "mipmap",
+    "SessionProfiler": "profiler",
+    "StallWatchdog": "watchdog",
+    "QualityGovernor": "governor",
+    "QualityTier": "governor",
+    "PowerMonitor": "power",
+    "ForegroundSource": "foreground",
+    "FakeForegroundSource": "foreground",
+    "X11ForegroundSource": "foreground",
+    "WinEventForegroundSource": "foreground",
+    "default_foreground_source": "foreground",
+    "normalize_process_name": "foreground",
+    "StackingSource": "topmost",
+    "FakeStackingSource": "topmost",
+    "KeepOnTop": "topmost",
+    "ImageArray": "image_buffer",
+    "BufferPool": "image_buffer",
+    "image_view": "image_buffer",
+    "wrap_array": "image_buffer",
+    "icon": "icon_cache",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str):
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,62 @@
+"""
+Headless crosshair tools.
+
+    python -m core render --size 12 --color red -o crosshair.png
+    python -m core render --batch states.json --out-dir previews/
+
+A batch file is a JSON list of states, each using `ch_*` settings keys or plain field names (color, size...).
+"""
+import os, sys, json, argparse  # noqa E401
+from typing import Optional
+
+
+def _render(args: argparse.Namespace) -> int:
+    from PySide6.QtWidgets import QApplication
+    from .renderer import CrosshairState, CrosshairRenderer
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841
+    renderer = CrosshairRenderer()
+
+    if args.batch:
+        with open(args.batch, "r") as f:
+            states = [CrosshairState.from_settings(item) for item in json.load(f)]
+        os.makedirs(args.out_dir, exist_ok=True)
+        for index, image in enumerate(renderer.render_batch(states)):
+            path = os.path.join(args.out_dir, f"crosshair_{index:04d}.png")
+            if not image.save(path):
+                print(f"Failed to write {path}", file=sys.stderr)
+                return 1
+        print(f"Rendered {len(states)} crosshairs into {args.out_dir}")
+        return 0
+
+    state = CrosshairState(args.color, args.border_color, args.size, args.border, args.img, args.tint)
+    if not renderer.render(state).save(args.output):
+        print(f"Failed to write {args.output}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m core", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    render = commands.add_parser("render", help="Render crosshairs to PNG without a display")
+    render.add_argument("--color", default="red")
+    render.add_argument("--border-color", default="black")
+    render.add_argument("--size", type=int, default=8)
+    render.add_argument("--border", type=int, default=0, help="Border thickness")
+    render.add_argument("--img", default=None, help="Image crosshair")
+    render.add_argument("--tint", action="store_true", help="Recolor the image with --color")
+    render.add_argument("-o", "--output", default="crosshair.png")
+    render.add_argument("--batch", help="JSON list of states to render")
+    render.add_argument("--out-dir", default="renders", help="Output directory for --batch")
+    render.set_defaults(handler=_render)
+
+    args = parser.parse_args(argv)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # Rendering never needs a display
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+import math, logging  # noqa E401
+from typing import Optional, Iterable, TYPE_CHECKING
+
+import numpy as np
+from PySide6.QtWidgets import QLabel, QWidget
+from PySide6.QtGui import QImage, QGuiApplication, QColor
+from PySide6.QtCore import QObject, QTimer, QRect, Signal
+
+from .image_buffer import image_view, default_pool
+
+if TYPE_CHECKING:
+    from .markers import MarkerLayer
+
+SAMPLE_MARGIN = 16  # Pixels of background sampled around the crosshair, on each side
+MIN_RATE_HZ = 0.2  # Slowest sampling, lower rates from settings or presets are raised to it
+
+
+class CaptureSource:
+    """Provides screen pixels for a rectangle given in global logical coordinates"""
+
+    def grab(self, rect: QRect) -> Optional[QImage]:
+        raise NotImplementedError
+
+
+class ScreenCaptureSource(CaptureSource):
+    def grab(self, rect: QRect) -> Optional[QImage]:
+        screen = QGuiApplication.screenAt(rect.center()) or QGuiApplication.primaryScreen()
+        if screen is None:
+            return None
+        origin = screen.geometry().topLeft()
+        pixmap = screen.grabWindow(0, rect.x() - origin.x(), rect.y() - origin.y(), rect.width(), rect.height())
+        return None if pixmap.isNull() else pixmap.toImage()
+
+
+class SyntheticCaptureSource(CaptureSource):
+    """Returns prepared frames in order and keeps repeating the last one, for tests"""
+
+    def __init__(self, frames: Iterable[QImage]):
+        self.frames = list(frames)
+        self.grabbed: list[QRect] = []
+
+    def grab(self, rect: QRect) -> Optional[QImage]:
+        self.grabbed.append(QRect(rect))
+        if not self.frames:
+            return None
+        return self.frames.pop(0) if len(self.frames) > 1 else self.frames[0]
+
+
+def _opponent(color: QColor) -> tuple[float, float, float]:
+    """Luma and the two opponent chroma axes (0-255), the same projection used for the background"""
+    r, g, b = color.red(), color.green(), color.blue()
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b, r - (g + b) / 2, (g - b) * math.sqrt(3) / 2
+
+
+class AutoContrast(QObject):
+    """
+    Periodically samples the background around the crosshair and picks the most visible configured color.
+
+    Only a small square around the crosshair is captured and the crosshair disc and the markers of `marker_layer`
+    inside it are masked out, so the overlay never samples its own pixels. Stats are computed in place over
+    preallocated NumPy buffers, which are only reallocated when the sampled size or the masked markers change.
+    """
+    color_changed = Signal(str)
+
+    def __init__(
+            self,
+            window: QWidget,
+            crosshair: QLabel,
+            source: Optional[CaptureSource] = None,
+            marker_layer: Optional["MarkerLayer"] = None
+    ):
+        super().__init__(window)
+        self.window = window
+        self.crosshair = crosshair
+        self.marker_layer = marker_layer
+        self.source = source or ScreenCaptureSource()
+        self.colors: list[str] = []
+        self.hysteresis = 0.25
+        self.current: Optional[str] = None
+        self.luminance = 0.0  # Last background stats, luma 0-255, hue in degrees, saturation 0-1
+        self.hue = 0.0
+        self.saturation = 0.0
+
+        self._shape: Optional[tuple] = None
+        self._mask = np.empty(0, dtype=np.float32)
+        self._mask_count = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.sample)
+
+    def configure(self, colors: list[str], rate_hz: float, hysteresis: float) -> None:
+        self.colors = list(dict.fromkeys(colors))
+        self.hysteresis = hysteresis
+        if not rate_hz >= MIN_RATE_HZ:  # Also catches NaN
+            logging.warning(f"Auto contrast rate {rate_hz} Hz is too low, sampling at {MIN_RATE_HZ} Hz")
+            rate_hz = MIN_RATE_HZ
+        self._timer.setInterval(max(1, round(1000 / rate_hz)))
+        if self.current not in self.colors:  # Kept otherwise, the crosshair shows it until the next sample
+            self.current = None
+
+    def set_active(self, active: bool) -> None:
+        if active and self.colors:
+            if not self._timer.isActive():
+                self._timer.start()
+                self.sample()
+        else:
+            self._timer.stop()
+
+    def is_active(self) -> bool:
+        return self._timer.isActive()
+
+    def reset(self) -> None:
+        """Forget the applied color, the next sample re-applies the best one"""
+        self.current = None
+
+    def sample(self) -> Optional[str]:
+        center = self.crosshair.mapToGlobal(self.crosshair.rect().center())
+        side = self.crosshair.width() + 2 * SAMPLE_MARGIN
+        rect = QRect(0, 0, side, side)
+        rect.moveCenter(center)
+
+        image = self.source.grab(rect)
+        if image is None or image.isNull():
+            return None
+        if image.format() != QImage.Format.Format_RGB32:
+            image = image.convertToFormat(QImage.Format.Format_RGB32)
+
+        pixels = image_view(image)  # BGRA byte order
+        h, w = pixels.shape[:2]
+        self._ensure_buffers(h, w, w / side, self._marker_rects(rect, w / side))
+        self._update_stats(pixels)
+
+        color = self._choose()
+        if color != self.current:
+            self.current = color
+            self.color_changed.emit(color)
+        return color
+
+    def _marker_rects(self, rect: QRect, scale: float) -> tuple[tuple[int, int, int, int], ...]:
+        """Markers inside the sampled `rect` as (x0, y0, x1, y1) pixel ranges of the grabbed image"""
+        if self.marker_layer is None or not self.marker_layer.isVisible():
+            return ()
+        ranges = []
+        for marker in self.marker_layer.marker_rects():
+            marker.moveTopLeft(self.marker_layer.mapToGlobal(marker.topLeft()))
+            marker = marker.adjusted(-1, -1, 1, 1).intersected(rect)  # A pixel more for antialiased edges
+            if not marker.isEmpty():
+                marker.translate(-rect.topLeft())
+                ranges.append((
+                    math.floor(marker.left() * scale), math.floor(marker.top() * scale),
+                    math.ceil((marker.right() + 1) * scale), math.ceil((marker.bottom() + 1) * scale)
+                ))
+        return tuple(ranges)
+
+    def _ensure_buffers(self, h: int, w: int, scale: float, markers: tuple = ()) -> None:
+        radius = (self.window.ch_size / 2 + self.window.ch_border_thickness + 1) * scale  # type: ignore[attr-defined]
+        if getattr(self.window, "ch_dynamic", False):
+            radius *= max(1.0, self.window.ch_fire_spread)  # type: ignore[attr-defined]
+        shape = (h, w, radius, markers)
+        if shape == self._shape:
+            return
+
+        self._shape = shape
+        y, x = np.ogrid[:h, :w]
+        self._mask = (((x - (w - 1) / 2) ** 2 + (y - (h - 1) / 2) ** 2) > radius ** 2).astype(np.float32)
+        for x0, y0, x1, y1 in markers:
+            self._mask[y0:y1, x0:x1] = 0
+        self._mask_count = float(self._mask.sum())
+
+    def _masked_mean(self, values: np.ndarray) -> float:
+        tmp = default_pool().get("contrast.tmp", values.shape)
+        np.multiply(values, self._mask, out=tmp)
+        return float(tmp.sum()) / self._mask_count if self._mask_count else 0.0
+
+    def _update_stats(self, pixels: np.ndarray) -> None:
+        b, g, r = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+        lum = default_pool().get("contrast.lum", pixels.shape[:2])
+        tmp = default_pool().get("contrast.tmp", pixels.shape[:2])
+
+        np.multiply(r, 0.2126, out=lum, dtype=np.float32)
+        np.multiply(g, 0.7152, out=tmp, dtype=np.float32)
+        lum += tmp
+        np.multiply(b, 0.0722, out=tmp, dtype=np.float32)
+        lum += tmp
+        self.luminance = self._masked_mean(lum)
+
+        # Opponent chroma axes, their mean is the saturation-weighted circular mean of the hue
+        np.add(g, b, out=lum, dtype=np.float32)
+        lum *= -0.5
+        lum += r
+        a = self._masked_mean(lum)
+        np.subtract(g, b, out=lum, dtype=np.float32)
+        lum *= math.sqrt(3) / 2
+        c = self._masked_mean(lum)
+        self.hue = math.degrees(math.atan2(c, a)) % 360
+        self.saturation = min(1.0, math.hypot(a, c) / 255)
+
+    def _score(self, color: str) -> float:
+        luma, a, c = _opponent(QColor(color))
+        contrast = (max(luma, self.luminance) + 12.75) / (min(luma, self.luminance) + 12.75)
+        hue_distance = abs((math.degrees(math.atan2(c, a)) - self.hue + 180) % 360 - 180) / 180
+        chroma = min(1.0, math.hypot(a, c) / 255)
+        return contrast * (1 + hue_distance * chroma * self.saturation)
+
+    def _choose(self) -> str:
+        scores = {color: self._score(color) for color in self.colors}
+        best = max(scores, key=scores.get)  # type: ignore[arg-type]
+        if self.current in scores and scores[best] <= scores[self.current] * (1 + self.hysteresis):
+            return self.current
+        return best
@@ -0,0 +1,111 @@
+"""
+Desktop event plumbing shared by the sources that follow other applications' windows.
+
+Both kinds of source here are event driven: `X11EventThread` sleeps in `select()` until the X server sends an event,
+and WinEvent hooks are delivered by the GUI thread's message loop.
+"""
+import os, select, logging, threading  # noqa E401
+from typing import Callable, Optional
+
+
+class X11EventThread:
+    """
+    A python-xlib connection with a thread handing its events to `handler`.
+
+    `open()` connects and selects `event_mask` on the root window, so atoms can be looked up before `start()`
+    starts the thread. From then on only that thread uses the display: `started` runs there first, then `handler` for
+    every event, queued events are drained before the thread waits again. Stopping wakes the thread through a pipe.
+    """
+
+    def __init__(self, name: str, event_mask: int, handler: Callable, started: Optional[Callable] = None):
+        self.name = name
+        self.event_mask = event_mask
+        self.handler = handler
+        self.started = started
+        self.display = None
+        self.root = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake: Optional[tuple[int, int]] = None
+
+    def open(self) -> bool:
+        from Xlib import display
+
+        try:
+            self.display = display.Display()
+        except Exception as e:
+            logging.error(f"Cannot open the X display: {e}")
+            return False
+        self.root = self.display.screen().root
+        self.root.change_attributes(event_mask=self.event_mask)
+        self.display.flush()
+        return True
+
+    def start(self) -> None:
+        self._wake = os.pipe()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            os.write(self._wake[1], b"\0")
+            self._thread.join(timeout=1)
+            for fd in self._wake:
+                os.close(fd)
+            self._thread = self._wake = None
+        if self.display is not None:
+            self.display.close()
+            self.display = None
+
+    def atom(self, name: str) -> int:
+        return self.display.intern_atom(name)
+
+    def _run(self) -> None:
+        if self.started is not None:
+            self.started()
+        while True:
+            # Round-trips in `started` and the handler read events into the queue, select() would not see them
+            while self.display.pending_events():
+                self.handler(self.display.next_event())
+            readable, _, _ = select.select([self.display, self._wake[0]], [], [])
+            if self._wake[0] in readable:
+                return
+
+
+class WinEventHook:
+    """
+    An out-of-context `SetWinEventHook` for the events `first` to `last`, calling `handler(event, hwnd)`.
+
+    Delivered by the message loop of the thread that starts it, which has to be the GUI thread.
+    """
+    WINEVENT_OUTOFCONTEXT = 0x0000
+
+    def __init__(self, first: int, last: int, handler: Callable[[int, int], None]):
+        self.first = first
+        self.last = last
+        self.handler = handler
+        self._hook = None
+        self._callback = None  # The ctypes callback must outlive the hook
+
+    def start(self) -> bool:
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+        prototype = ctypes.WINFUNCTYPE(
+            None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND, wintypes.LONG, wintypes.LONG, wintypes.DWORD,
+            wintypes.DWORD
+        )
+        self._callback = prototype(lambda hook, event, hwnd, *_: self.handler(event, hwnd or 0))
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        self._hook = user32.SetWinEventHook(self.first, self.last, 0, self._callback, 0, 0, self.WINEVENT_OUTOFCONTEXT)
+        if not self._hook:
+            logging.error(f"SetWinEventHook failed for events {self.first:#x}-{self.last:#x}")
+            self._callback = None
+            return False
+        return True
+
+    def stop(self) -> None:
+        if self._hook:
+            import ctypes
+            ctypes.windll.user32.UnhookWinEvent(self._hook)  # type: ignore[attr-defined]
+        self._hook = self._callback = None
@@ -0,0 +1,173 @@
+import time
+from typing import Optional
+
+from PySide6.QtWidgets import QLabel, QWidget
+from PySide6.QtGui import QPixmap, QColor
+from PySide6.QtCore import Qt, QObject, QTimer, QEvent, QRect, QPoint
+
+from .input_listener import InputSource
+from .governor import QualityGovernor, QualityTier
+from .instrumentation import LatencyStats
+from .renderer import CrosshairState, default_renderer
+
+KEYFRAMES = 4  # Keyframes per transition, excluding the rest frame
+FRAME_INTERVAL_MS = 8
+
+
+def _mix(a: str, b: str, t: float) -> str:
+    ca, cb = QColor(a), QColor(b)
+    return QColor(
+        round(ca.red() + (cb.red() - ca.red()) * t),
+        round(ca.green() + (cb.green() - ca.green()) * t),
+        round(ca.blue() + (cb.blue() - ca.blue()) * t),
+    ).name()
+
+
+class DynamicCrosshair(QObject):
+    """
+    Input-reactive crosshair.
+
+    Two pre-defined transitions are driven by the input source: `fire` spreads the crosshair while its trigger is
+    held and `ads` blends the crosshair towards another color. Every (fire, ads) keyframe combination is rendered
+    once into a pixmap, transitions then only swap pixmaps on a layer above the crosshair. The frame timer runs only
+    while a transition is in progress, so no input means no work. With a `governor`, keyframes are rendered at the
+    device pixel ratio and animated at the frame rate of its current tier.
+    """
+
+    def __init__(
+            self,
+            window: QWidget,
+            crosshair: QLabel,
+            source: InputSource,
+            governor: Optional[QualityGovernor] = None
+    ):
+        super().__init__(window)
+        self.window = window
+        self.crosshair = crosshair
+        self.source = source
+        self.governor = governor
+        self.latency = LatencyStats("input_to_paint")
+
+        self._keyframes: dict[tuple[int, int], QPixmap] = {}
+        self._frame = (0, 0)
+        self._target = (0, 0)
+        self._pending_input_ns: Optional[int] = None
+
+        self.layer = QLabel(window)
+        self.layer.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.layer.setStyleSheet("background-color: transparent;")
+        self.layer.hide()
+        self.layer.installEventFilter(self)
+        self.crosshair.installEventFilter(self)  # Releasing back to rest paints the crosshair itself
+
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(governor.tier.frame_interval_ms if governor is not None else FRAME_INTERVAL_MS)
+        self._frame_timer.timeout.connect(self._step)
+
+        # Re-rendering keyframes on every slider tick is wasteful, wait until the user settles
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(250)
+        self._rebuild_timer.timeout.connect(self.render_keyframes)
+
+        self.source.changed.connect(self._on_input)
+        if governor is not None:
+            governor.tier_changed.connect(self._set_tier)
+
+    def start(self) -> bool:
+        self.render_keyframes()
+        return self.source.start()
+
+    def stop(self) -> None:
+        self.source.stop()
+        if self.governor is not None:
+            self.governor.tier_changed.disconnect(self._set_tier)
+        self._frame_timer.stop()
+        self._rebuild_timer.stop()
+        self._frame = self._target = (0, 0)
+        self._show_frame()
+
+    def invalidate(self) -> None:
+        """Crosshair settings changed, keyframes will be rendered again once the changes settle"""
+        self._keyframes.clear()
+        self._rebuild_timer.start()
+
+    def _set_tier(self, tier: QualityTier) -> None:
+        self._frame_timer.setInterval(tier.frame_interval_ms)
+        self.invalidate()  # The device pixel ratio may have changed
+
+    def render_keyframes(self) -> None:
+        w = self.window
+        base = w.ch_size  # type: ignore[attr-defined]
+        renderer = default_renderer()
+        source = renderer.source(w.ch_img) if w.ch_img else None  # type: ignore[attr-defined]
+        max_size = min(w.width(), w.height())
+        dpr = self.governor.device_pixel_ratio(w) if self.governor is not None else 1.0
+
+        self._keyframes.clear()
+        for i in range(KEYFRAMES + 1):
+            spread = 1 + (w.ch_fire_spread - 1) * i / KEYFRAMES  # type: ignore[attr-defined]
+            size = min(max_size, round(base * spread))
+            for j in range(KEYFRAMES + 1):
+                state = CrosshairState(
+                    _mix(w.effective_ch_color(), w.ch_ads_color, j / KEYFRAMES),  # type: ignore[attr-defined]
+                    w.ch_border_color,  # type: ignore[attr-defined]
+                    size,
+                    w.ch_border_thickness,  # type: ignore[attr-defined]
+                    w.ch_img,  # type: ignore[attr-defined]
+                    w.ch_tint  # type: ignore[attr-defined]
+                )
+                self._keyframes[(i, j)] = renderer.render_pixmap(state, source, dpr)
+        if self._frame != (0, 0):
+            self._show_frame()
+
+    def _on_input(self, trigger: str, pressed: bool, timestamp_ns: int) -> None:
+        w = self.window
+        fire, ads = self._target
+        if trigger == w.ch_fire_trigger:  # type: ignore[attr-defined]
+            fire = KEYFRAMES if pressed else 0
+        if trigger == w.ch_ads_trigger:  # type: ignore[attr-defined]
+            ads = KEYFRAMES if pressed else 0
+        if (fire, ads) == self._target:
+            return
+
+        self._target = (fire, ads)
+        self._pending_input_ns = timestamp_ns
+        self._step()  # First frame right away, the timer only paces the rest
+        if self._frame != self._target:
+            self._frame_timer.start()
+
+    def _step(self) -> None:
+        (fi, ai), (ft, at) = self._frame, self._target
+        fi += (ft > fi) - (ft < fi)
+        ai += (at > ai) - (at < ai)
+        self._frame = (fi, ai)
+        self._show_frame()
+        if self._frame == self._target:
+            self._frame_timer.stop()
+
+    def _show_frame(self) -> None:
+        if self._frame == (0, 0):
+            self.layer.hide()
+            self.crosshair.show()
+            return
+
+        if not self._keyframes:
+            self._rebuild_timer.stop()
+            self.render_keyframes()
+        pixmap = self._keyframes[self._frame]
+        center = self.crosshair.geometry().center()
+        rect = QRect(QPoint(), pixmap.deviceIndependentSize().toSize())
+        rect.moveCenter(center)
+        self.layer.setGeometry(rect)
+        self.layer.setPixmap(pixmap)
+        self.layer.show()
+        self.layer.raise_()
+        self.crosshair.hide()
+
+    def eventFilter(self, watched, event) -> bool:
+        painted = watched in (self.layer, self.crosshair) and event.type() == QEvent.Type.Paint
+        if painted and self._pending_input_ns is not None:
+            self.latency.record(self._pending_input_ns, time.perf_counter_ns())
+            self._pending_input_ns = None
+        return super().eventFilter(watched, event)
@@ -0,0 +1,189 @@
+import os, sys, logging  # noqa E401
+from collections import OrderedDict
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from .desktop import X11EventThread, WinEventHook
+
+MAX_NAMES = 64  # Resolved (window, pid) -> process name entries kept
+
+
+def normalize_process_name(name: str) -> str:
+    """Compare process names without case and without the Windows `.exe` suffix"""
+    name = os.path.basename(name).lower()
+    return name[:-4] if name.endswith(".exe") else name
+
+
+class ForegroundSource(QObject):
+    """
+    Source of foreground application changes.
+
+    `changed` is emitted with (process name, pid) whenever another window gets the focus, with an empty name when no
+    window has it. Names go through `normalize_process_name()`. Resolving a process name costs a system call or two,
+    results are cached per (window, pid). Subclasses may emit from any thread, Qt queues delivery to the GUI thread.
+    """
+    changed = Signal(str, int)
+
+    def __init__(self):
+        super().__init__()
+        self.current: Optional[str] = None
+        self._names: OrderedDict[tuple[int, int], str] = OrderedDict()
+
+    def start(self) -> bool:
+        return True
+
+    def stop(self) -> None:
+        pass
+
+    def process_name(self, pid: int) -> Optional[str]:
+        return None
+
+    def _emit(self, window: int, pid: int) -> None:
+        key = (window, pid)
+        name = self._names.get(key)
+        if name is None:
+            name = normalize_process_name(self.process_name(pid) or "") if pid else ""
+            self._names[key] = name
+            if len(self._names) > MAX_NAMES:
+                self._names.popitem(last=False)
+        else:
+            self._names.move_to_end(key)
+        if name != self.current:
+            self.current = name
+            self.changed.emit(name, pid)
+
+
+class FakeForegroundSource(ForegroundSource):
+    """Foreground source driven by hand, for tests and headless runs"""
+
+    def __init__(self):
+        super().__init__()
+        self.names: dict[int, str] = {}
+
+    def activate(self, name: str, pid: int = 1) -> None:
+        self.names[pid] = name
+        self._emit(pid, pid)
+
+    def process_name(self, pid: int) -> Optional[str]:
+        return self.names.get(pid)
+
+
+class X11ForegroundSource(ForegroundSource):
+    """Follows `_NET_ACTIVE_WINDOW` on the X11 root window through python-xlib, from property change events"""
+
+    def __init__(self):
+        super().__init__()
+        self._events: Optional[X11EventThread] = None
+
+    def start(self) -> bool:
+        try:
+            from Xlib import X
+        except ImportError as e:
+            logging.error(f"Foreground app profiles need python-xlib: {e}")
+            return False
+        self._events = X11EventThread("HolySightForeground", X.PropertyChangeMask, self._on_event, self._check_active)
+        if not self._events.open():
+            self._events = None
+            return False
+        self._active_atom = self._events.atom("_NET_ACTIVE_WINDOW")
+        self._pid_atom = self._events.atom("_NET_WM_PID")
+        self._events.start()
+        return True
+
+    def stop(self) -> None:
+        if self._events is not None:
+            self._events.stop()
+            self._events = None
+
+    def process_name(self, pid: int) -> Optional[str]:
+        try:
+            return os.readlink(f"/proc/{pid}/exe")
+        except OSError:
+            pass
+        try:
+            with open(f"/proc/{pid}/comm", "r") as f:  # Other users' processes, truncated to 15 characters
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def _on_event(self, event) -> None:
+        from Xlib import X
+
+        if event.type == X.PropertyNotify and event.atom == self._active_atom:
+            self._check_active()
+
+    def _check_active(self) -> None:
+        from Xlib import X
+        from Xlib.error import XError
+
+        events = self._events
+        try:
+            active = events.root.get_full_property(self._active_atom, X.AnyPropertyType)
+            window_id = active.value[0] if active is not None and len(active.value) else 0
+            pid = 0
+            if window_id:
+                window = events.display.create_resource_object("window", window_id)
+                prop = window.get_full_property(self._pid_atom, X.AnyPropertyType)
+                pid = prop.value[0] if prop is not None and len(prop.value) else 0
+        except XError as e:  # The window went away in the meantime
+            logging.warning(f"Failed to read the active window: {e}")
+            return
+        self._emit(window_id, pid)
+
+
+class WinEventForegroundSource(ForegroundSource):
+    """Follows `EVENT_SYSTEM_FOREGROUND` through a WinEvent hook"""
+    EVENT_SYSTEM_FOREGROUND = 0x0003
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+    def __init__(self):
+        super().__init__()
+        self._hook = WinEventHook(self.EVENT_SYSTEM_FOREGROUND, self.EVENT_SYSTEM_FOREGROUND, self._on_foreground)
+
+    def start(self) -> bool:
+        import ctypes
+
+        if not self._hook.start():
+            return False
+        hwnd = ctypes.windll.user32.GetForegroundWindow()  # type: ignore[attr-defined]
+        self._on_foreground(self.EVENT_SYSTEM_FOREGROUND, hwnd or 0)
+        return True
+
+    def stop(self) -> None:
+        self._hook.stop()
+
+    def process_name(self, pid: int) -> Optional[str]:
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        handle = kernel32.OpenProcess(self.PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+        try:
+            size = wintypes.DWORD(260)
+            buffer = ctypes.create_unicode_buffer(size.value)
+            if not kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+                return None
+            return buffer.value
+        finally:
+            kernel32.CloseHandle(handle)
+
+    def _on_foreground(self, event: int, hwnd: int) -> None:
+        import ctypes
+        from ctypes import wintypes
+
+        pid = wintypes.DWORD()
+        if hwnd:
+            ctypes.windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))  # type: ignore[attr-defined]
+        self._emit(hwnd, pid.value)
+
+
+def default_foreground_source() -> Optional[ForegroundSource]:
+    """The source for this platform, None where there is none"""
+    if sys.platform == "win32":
+        return WinEventForegroundSource()
+    if os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY"):
+        return X11ForegroundSource()
+    return None
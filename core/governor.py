@@ -0,0 +1,125 @@
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QObject, QTimer, Signal
+
+from .instrumentation import LatencyStats
+
+FRAME_BUDGET_MS = 8.0  # Half a 60 Hz frame, the rest belongs to the game
+WINDOW = 16  # Samples averaged per decision
+HEADROOM = 0.5  # Step back up once the cost falls below this fraction of the budget
+RECOVER_MS = 5000  # Try the next better tier after this long without an over-budget window
+
+
+@dataclass(frozen=True)
+class QualityTier:
+    name: str
+    fast_scaling: bool  # FastTransformation instead of SmoothTransformation for images
+    full_dpr: bool  # Pre-rendered pixmaps at the screen device pixel ratio, otherwise at 1.0
+    frame_interval_ms: int  # Dynamic crosshair animation frame interval
+
+
+TIERS = (
+    QualityTier("smooth", False, True, 8),
+    QualityTier("fast", True, True, 16),
+    QualityTier("low", True, False, 33),
+)
+
+
+class QualityGovernor(QObject):
+    """
+    Picks the render quality tier from the measured frame cost.
+
+    The overlay reports the duration of its paints and pixmap updates with `record()`. When the mean of a window of
+    samples goes over the budget, usually because the game saturates the CPU, the governor steps down a tier; when it
+    falls well below, or nothing went over budget for a while, it steps back up. Nothing is measured while nothing is
+    drawn, and the recovery timer only runs below the best tier, so an idle overlay stays idle. A `forced` tier
+    disables the adaptation.
+    """
+    tier_changed = Signal(object)  # QualityTier
+
+    def __init__(
+            self,
+            budget_ms: float = FRAME_BUDGET_MS,
+            forced: Optional[str] = None,
+            parent: Optional[QObject] = None
+    ):
+        super().__init__(parent)
+        self.budget_ns = budget_ms * 1e6
+        self.cost = LatencyStats("frame_cost")
+        self.steps_down = 0
+        self.steps_up = 0
+        self.forced = False
+        self._level = 0
+        self._window: list[int] = []
+
+        self._recover_timer = QTimer(self)
+        self._recover_timer.setSingleShot(True)
+        self._recover_timer.setInterval(RECOVER_MS)
+        self._recover_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self._recover_timer.timeout.connect(self._recover)
+
+        self.force(forced)
+
+    @property
+    def tier(self) -> QualityTier:
+        return TIERS[self._level]
+
+    def force(self, name: Optional[str]) -> None:
+        """Pin a tier by name, `None` or "auto" goes back to adapting, starting from the best tier"""
+        names = [tier.name for tier in TIERS]
+        if name not in (None, "auto", *names):
+            logging.warning(f"Unknown render quality {name!r}, expected auto or one of {names}")
+            name = None
+        self.forced = name not in (None, "auto")
+        self._recover_timer.stop()
+        self._set_level(names.index(name) if self.forced else 0)
+
+    def device_pixel_ratio(self, widget: QWidget) -> float:
+        return widget.devicePixelRatioF() if self.tier.full_dpr else 1.0
+
+    def record(self, start_ns: int, end_ns: Optional[int] = None) -> None:
+        self.cost.record(start_ns, end_ns)
+        if self.forced:
+            return
+        self._window.append(self.cost.last_ns)
+        if len(self._window) < WINDOW:
+            return
+
+        mean = sum(self._window) / len(self._window)
+        self._window.clear()
+        if mean > self.budget_ns:
+            self._recover_timer.start()  # Restarted, the load is still there
+            if self._level < len(TIERS) - 1:
+                self.steps_down += 1
+                self._set_level(self._level + 1)
+        elif mean < self.budget_ns * HEADROOM and self._level > 0:
+            self._recover()
+
+    def _recover(self) -> None:
+        if self.forced or self._level == 0:
+            return
+        self.steps_up += 1
+        self._set_level(self._level - 1)
+        if self._level > 0:
+            self._recover_timer.start()
+
+    def _set_level(self, level: int) -> None:
+        if level == self._level:
+            return
+        self._level = level
+        self._window.clear()
+        logging.info(f"Render quality: {self.tier.name}")
+        self.tier_changed.emit(self.tier)
+
+    def snapshot(self) -> dict:
+        return {
+            "tier": self.tier.name,
+            "forced": self.forced,
+            "budget_ms": self.budget_ns / 1e6,
+            "steps_down": self.steps_down,
+            "steps_up": self.steps_up,
+            "cost": self.cost.snapshot(),
+        }
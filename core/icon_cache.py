@@ -0,0 +1,40 @@
+"""
+Process-wide cache of the pre-sized application icons.
+
+`scripts/compiler.py` renders every icon at each of `ICON_SIZES` for 1x and 2x screens into `resources/sized/` and
+compiles them into `resources/icons.py`. `icon()` bundles the sizes of one icon into a single QIcon, created once
+per process and shared, so a menu icon is decoded from a 32 px PNG instead of a megapixel source.
+"""
+import os
+
+from PySide6.QtGui import QIcon
+from PySide6.QtCore import QSize
+
+ICON_SIZES = (16, 20, 24, 32, 48)  # Logical sizes, each rendered for 1x and 2x screens
+ICON_SCALES = (1, 2)
+RESOURCE_PREFIX = ":/icons"
+SIZED_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources", "sized")
+
+_icons: dict[tuple[str, str], QIcon] = {}
+
+
+def pixel_sizes() -> list[int]:
+    """Every rendered size in pixels, 1x and 2x sizes coincide where they can"""
+    return sorted({size * scale for size in ICON_SIZES for scale in ICON_SCALES})
+
+
+def icon(name: str, root: str = RESOURCE_PREFIX) -> QIcon:
+    """
+    The icon `name` ("holy_sight", "icon_1", ...) with all its sizes, Qt picks the one matching the size and the
+    device pixel ratio it is drawn at. `root` is the compiled resources by default, `SIZED_DIR` reads the same files
+    from disk for processes that do not import `resources.icons`.
+    """
+    key = (name, root)
+    cached = _icons.get(key)
+    if cached is None:
+        cached = QIcon()
+        for size in pixel_sizes():
+            cached.addFile(f"{root}/{name}_{size}.png", QSize(size, size))
+        if not cached.isNull():  # Null until `resources.icons` is imported, not cached so later calls find them
+            _icons[key] = cached
+    return cached
@@ -0,0 +1,111 @@
+"""
+Zero-copy bridge between QImage and NumPy.
+
+`image_view()` exposes the pixels of a QImage as an array without copying, `wrap_array()` goes the other way, and
+`BufferPool` keeps scratch arrays for per-frame work of a fixed size. 32-bit formats are viewed as (height, width, 4)
+uint8 in memory byte order (BGRA for ARGB32 on little endian), 8-bit formats as (height, width).
+"""
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+_CHANNELS = {
+    QImage.Format.Format_RGB32: 4,
+    QImage.Format.Format_ARGB32: 4,
+    QImage.Format.Format_ARGB32_Premultiplied: 4,
+    QImage.Format.Format_RGBX8888: 4,
+    QImage.Format.Format_RGBA8888: 4,
+    QImage.Format.Format_RGBA8888_Premultiplied: 4,
+    QImage.Format.Format_Grayscale8: 1,
+    QImage.Format.Format_Alpha8: 1,
+}
+
+MAX_POOLED = 32  # Scratch buffers kept, enough for a 10 px outline plus the tint and contrast buffers
+
+
+class ImageArray(np.ndarray):
+    """Array over QImage memory, holds the image so the memory stays valid as long as the view"""
+    image: Optional[QImage] = None
+
+
+def image_view(image: QImage, writable: bool = False) -> ImageArray:
+    """
+    View the pixels of `image` without copying.
+
+    Row padding is sliced off, so the view is not contiguous when a row is padded. A writable view detaches `image`
+    from images sharing its data first, writes never reach those.
+    """
+    channels = _CHANNELS.get(image.format())
+    if channels is None:
+        raise ValueError(f"Unsupported image format {image.format()}, convert it first")
+    h, w = image.height(), image.width()
+    buffer = image.bits() if writable else image.constBits()
+    pixels = np.frombuffer(buffer, dtype=np.uint8, count=image.sizeInBytes())
+    pixels = pixels.reshape(h, image.bytesPerLine())[:, :w * channels]
+    array = (pixels.reshape(h, w, channels) if channels > 1 else pixels).view(ImageArray)
+    array.image = image
+    return array
+
+
+def wrap_array(array: np.ndarray, image_format: QImage.Format = QImage.Format.Format_ARGB32_Premultiplied) -> QImage:
+    """
+    Wrap a (height, width, 4) or (height, width) uint8 array as a QImage sharing its memory.
+
+    A non-contiguous array (a crop of a larger one) is copied once. The QImage keeps the array alive, but copies made
+    on the C++ side (a QPixmap, a label) can outlive it: call `.copy()` before the image leaves the code that owns the
+    array.
+    """
+    channels = _CHANNELS.get(image_format)
+    if channels is None:
+        raise ValueError(f"Unsupported image format {image_format}")
+    shape = "(h, w, 4)" if channels > 1 else "(h, w)"
+    if array.dtype != np.uint8 or array.ndim != (3 if channels > 1 else 2) or array.shape[2:] not in ((), (4,)):
+        raise ValueError(f"Expected a uint8 array of shape {shape}, got {array.dtype} {array.shape}")
+    array = np.ascontiguousarray(array)
+    h, w = array.shape[:2]
+    return QImage(array.data, w, h, array.strides[0], image_format)
+
+
+class BufferPool:
+    """
+    Scratch arrays for per-frame work of a fixed size.
+
+    `get()` hands out the same array for the same name, shape and dtype until it is evicted, so steady-state frames
+    allocate nothing. The contents are left over from the last user, and an array is only valid until the next
+    `get()` of the same name. Meant for the GUI thread, it is not thread-safe.
+    """
+
+    def __init__(self, capacity: int = MAX_POOLED):
+        self.capacity = capacity
+        self._buffers: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str, shape: tuple[int, ...], dtype=np.float32) -> np.ndarray:
+        key = (name, tuple(shape), np.dtype(dtype).str)
+        array = self._buffers.get(key)
+        if array is not None:
+            self._buffers.move_to_end(key)
+            self.hits += 1
+            return array
+        self.misses += 1
+        array = np.empty(shape, dtype=dtype)
+        self._buffers[key] = array
+        if len(self._buffers) > self.capacity:
+            self._buffers.popitem(last=False)
+        return array
+
+    def clear(self) -> None:
+        self._buffers.clear()
+
+
+_default_pool: Optional[BufferPool] = None
+
+
+def default_pool() -> BufferPool:
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = BufferPool()
+    return _default_pool
@@ -0,0 +1,110 @@
+import os, json, time, hashlib  # noqa E401
+from typing import Optional
+
+import numpy as np
+from PySide6.QtGui import QImage, QImageReader
+from PySide6.QtCore import Qt
+
+from .image_buffer import image_view
+
+LIBRARY_DIR = "./config/library"
+MAX_SIZE = 400  # Largest crosshair size the size slider allows
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _trim_transparent(image: QImage) -> tuple[QImage, tuple[int, int, int, int]]:
+    """Crop fully transparent margins, returns the cropped image and the kept (x, y, w, h)"""
+    h, w = image.height(), image.width()
+    alpha = image_view(image)[..., 3]  # ARGB32 is BGRA in memory
+    rows = np.flatnonzero(alpha.any(axis=1))
+    cols = np.flatnonzero(alpha.any(axis=0))
+    if rows.size == 0:  # Nothing visible, keep the image as it is
+        return image, (0, 0, w, h)
+    rect = (int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1))
+    if rect == (0, 0, w, h):
+        return image, rect
+    return image.copy(*rect), rect
+
+
+class ImageLibrary:
+    """
+    Per-user store of normalized crosshair images.
+
+    Imported files are deduplicated by content hash, trimmed to their visible pixels, downscaled to the maximum
+    crosshair size and saved as straight-alpha ARGB32 PNG (converting to premultiplied on load is a single pass),
+    with a JSON metadata file next to each entry. Imports are remembered per source path, size and modification
+    time, so importing an unchanged file again doesn't hash it.
+    """
+
+    def __init__(self, directory: str = LIBRARY_DIR):
+        self.directory = directory
+        self._imported: dict[tuple[str, int, int], str] = {}
+
+    def contains(self, path: str) -> bool:
+        return os.path.dirname(os.path.abspath(path)) == os.path.abspath(self.directory)
+
+    def import_image(self, path: str) -> str:
+        """Import `path` and return the library file to reference from settings"""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        target = self._imported.get(key)
+        if target is not None and os.path.exists(target):
+            return target
+
+        digest = _file_digest(path)
+        target = os.path.join(self.directory, f"{digest[:32]}.png")
+        meta_path = os.path.join(self.directory, f"{digest[:32]}.json")
+        if os.path.exists(target) and os.path.exists(meta_path):
+            self._imported[key] = target
+            return target
+
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        if reader.format() in (b"svg", b"svgz") and source_size.isValid():
+            # Vector images are rasterized straight at the largest size instead of being scaled afterwards
+            reader.setScaledSize(source_size.scaled(MAX_SIZE, MAX_SIZE, Qt.AspectRatioMode.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            raise ValueError(f"Cannot decode {path}: {reader.errorString()}")
+
+        image = image.convertToFormat(QImage.Format.Format_ARGB32)
+        image, trim = _trim_transparent(image)
+        if image.width() > MAX_SIZE or image.height() > MAX_SIZE:
+            image = image.scaled(
+                MAX_SIZE, MAX_SIZE,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+
+        os.makedirs(self.directory, exist_ok=True)
+        if not image.save(target + ".tmp", "PNG"):
+            raise OSError(f"Cannot write {target}")
+        os.replace(target + ".tmp", target)
+
+        metadata = {
+            "source": os.path.basename(path),
+            "sha256": digest,
+            "source_size": [source_size.width(), source_size.height()],
+            "trim": list(trim),
+            "size": [image.width(), image.height()],
+            "imported": int(time.time()),
+        }
+        with open(meta_path, "w") as f:
+            json.dump(metadata, f, indent=4)
+        self._imported[key] = target
+        return target
+
+    def metadata(self, path: str) -> Optional[dict]:
+        try:
+            with open(os.path.splitext(path)[0] + ".json", "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
@@ -0,0 +1,92 @@
+import time, logging  # noqa E401
+
+from PySide6.QtCore import QObject, Signal
+
+
+class InputSource(QObject):
+    """
+    Source of global input state changes.
+
+    `changed` is emitted with (trigger, pressed, timestamp_ns). Triggers are `mouse_left`, `mouse_right`,
+    `mouse_middle` or `key_<name>`. Subclasses may emit from any thread, Qt queues delivery to the GUI thread.
+    """
+    changed = Signal(str, bool, object)  # object: nanosecond timestamps overflow a C int
+
+    def __init__(self, triggers: set[str]):
+        super().__init__()
+        self.triggers = triggers
+        self.pressed: set[str] = set()
+
+    def start(self) -> bool:
+        return True
+
+    def stop(self) -> None:
+        pass
+
+    def _emit(self, trigger: str, pressed: bool) -> None:
+        if trigger not in self.triggers:
+            return
+        # Drop OS key auto-repeat and duplicated hook events, only real state changes are forwarded
+        if pressed == (trigger in self.pressed):
+            return
+        if pressed:
+            self.pressed.add(trigger)
+        else:
+            self.pressed.discard(trigger)
+        self.changed.emit(trigger, pressed, time.perf_counter_ns())
+
+
+class FakeInputSource(InputSource):
+    """Input source driven by hand, for tests and headless runs"""
+
+    def press(self, trigger: str) -> None:
+        self._emit(trigger, True)
+
+    def release(self, trigger: str) -> None:
+        self._emit(trigger, False)
+
+
+class PynputInputSource(InputSource):
+    """Global mouse/keyboard hooks through pynput, each listener runs on its own thread"""
+
+    def __init__(self, triggers: set[str]):
+        super().__init__(triggers)
+        self._listeners = []
+
+    def start(self) -> bool:
+        try:
+            from pynput import mouse, keyboard
+        except ImportError as e:
+            logging.error(f"Dynamic crosshair needs pynput: {e}")
+            return False
+
+        # Only hook what the transitions use, so unrelated input never wakes us up
+        if any(t.startswith("mouse_") for t in self.triggers):
+            self._listeners.append(mouse.Listener(on_click=self._on_click))
+        if any(t.startswith("key_") for t in self.triggers):
+            self._listeners.append(keyboard.Listener(on_press=self._on_press, on_release=self._on_release))
+
+        for listener in self._listeners:
+            listener.daemon = True
+            listener.start()
+        return True
+
+    def stop(self) -> None:
+        for listener in self._listeners:
+            listener.stop()
+        self._listeners.clear()
+        self.pressed.clear()
+
+    def _on_click(self, x, y, button, pressed) -> None:  # noqa
+        self._emit(f"mouse_{button.name}", pressed)
+
+    def _on_press(self, key) -> None:
+        self._emit(f"key_{self._key_name(key)}", True)
+
+    def _on_release(self, key) -> None:
+        self._emit(f"key_{self._key_name(key)}", False)
+
+    @staticmethod
+    def _key_name(key) -> str:
+        name = getattr(key, "name", None) or getattr(key, "char", None) or str(key)
+        return name.lower()
@@ -0,0 +1,99 @@
+import time
+from collections import deque
+from typing import Optional
+
+from PySide6.QtCore import QObject, QEvent, QCoreApplication, QAbstractEventDispatcher
+
+
+class LatencyStats:
+    """Rolling latency statistics, recorded in nanoseconds and reported in milliseconds"""
+
+    def __init__(self, name: str, window: int = 512):
+        self.name = name
+        self.count = 0
+        self.last_ns = 0
+        self.max_ns = 0
+        self._total_ns = 0
+        self._samples: deque[int] = deque(maxlen=window)
+
+    def record(self, start_ns: int, end_ns: Optional[int] = None) -> None:
+        elapsed = (end_ns if end_ns is not None else time.perf_counter_ns()) - start_ns
+        self.count += 1
+        self.last_ns = elapsed
+        self.max_ns = max(self.max_ns, elapsed)
+        self._total_ns += elapsed
+        self._samples.append(elapsed)
+
+    def reset(self) -> None:
+        self.count = self.last_ns = self.max_ns = self._total_ns = 0
+        self._samples.clear()
+
+    def snapshot(self) -> dict:
+        samples = sorted(self._samples)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else 0
+        return {
+            "name": self.name,
+            "count": self.count,
+            "last_ms": self.last_ns / 1e6,
+            "mean_ms": (self._total_ns / self.count / 1e6) if self.count else 0.0,
+            "p95_ms": p95 / 1e6,
+            "max_ms": self.max_ns / 1e6,
+        }
+
+
+class WakeupCounter(QObject):
+    """
+    Counts timer events, paint events and event-loop wakeups of the GUI thread.
+
+    Counting installs an application-wide event filter, so it is only active between `start()` and `stop()`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.timer_events = 0
+        self.paint_events = 0
+        self.wakeups = 0
+        self._started = 0.0
+        self._running = False
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self.reset()
+        QCoreApplication.instance().installEventFilter(self)
+        QAbstractEventDispatcher.instance().awake.connect(self._on_awake)
+        self._running = True
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        QCoreApplication.instance().removeEventFilter(self)
+        QAbstractEventDispatcher.instance().awake.disconnect(self._on_awake)
+        self._running = False
+
+    def reset(self) -> None:
+        self.timer_events = self.paint_events = self.wakeups = 0
+        self._started = time.perf_counter()
+
+    def snapshot(self) -> dict:
+        seconds = max(time.perf_counter() - self._started, 1e-9)
+        return {
+            "seconds": seconds,
+            "timer_events": self.timer_events,
+            "paint_events": self.paint_events,
+            "wakeups": self.wakeups,
+            "timer_events_per_s": self.timer_events / seconds,
+            "paint_events_per_s": self.paint_events / seconds,
+            "wakeups_per_s": self.wakeups / seconds,
+        }
+
+    def _on_awake(self) -> None:
+        self.wakeups += 1
+
+    def eventFilter(self, watched, event) -> bool:
+        kind = event.type()
+        if kind == QEvent.Type.Timer:
+            self.timer_events += 1
+        elif kind == QEvent.Type.Paint:
+            self.paint_events += 1
+        return False
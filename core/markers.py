@@ -0,0 +1,88 @@
+from dataclasses import dataclass, asdict, fields
+from typing import Optional
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtGui import QPixmap, QPainter
+from PySide6.QtCore import Qt, QPoint, QRect
+
+from .renderer import CrosshairState, default_renderer
+
+
+@dataclass
+class Marker:
+    """A secondary crosshair drawn at an offset from the main crosshair center"""
+    color: str = "white"
+    border_color: str = "black"
+    size: int = 6
+    border_thickness: int = 0
+    img: Optional[str] = None
+    offset_x: int = 0
+    offset_y: int = 24
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Marker":
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def state(self) -> CrosshairState:
+        return CrosshairState(self.color, self.border_color, self.size, self.border_thickness, self.img)
+
+
+class MarkerLayer(QWidget):
+    """
+    Draws every secondary marker in a single paint pass.
+
+    Each marker is rendered once into a cached pixmap at `dpr`, painting only blits the cached pixmaps at their
+    offsets.
+    """
+
+    def __init__(self, parent: QWidget, anchor: QWidget):
+        super().__init__(parent)
+        self.anchor = anchor
+        self.markers: list[Marker] = []
+        self._pixmaps: list[Optional[QPixmap]] = []
+        self.dpr = 1.0
+
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+
+    def set_markers(self, markers: list[Marker]) -> None:
+        self.markers = markers
+        self._pixmaps = [None] * len(markers)
+        self.setVisible(bool(markers))
+        self.update()
+
+    def set_device_pixel_ratio(self, dpr: float) -> None:
+        if dpr != self.dpr:
+            self.dpr = dpr
+            self.set_markers(self.markers)
+
+    def invalidate(self, index: int) -> None:
+        self._pixmaps[index] = None
+        self.update()
+
+    def pixmap(self, index: int) -> QPixmap:
+        pixmap = self._pixmaps[index]
+        if pixmap is None:
+            pixmap = default_renderer().render_pixmap(self.markers[index].state(), dpr=self.dpr)
+            self._pixmaps[index] = pixmap
+        return pixmap
+
+    def marker_rects(self) -> list[QRect]:
+        """Where each marker is drawn, in layer coordinates"""
+        center = self.anchor.geometry().center()
+        rects = []
+        for marker in self.markers:
+            rect = QRect(0, 0, marker.size, marker.size)
+            rect.moveCenter(center + QPoint(marker.offset_x, marker.offset_y))
+            rects.append(rect)
+        return rects
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        for i, rect in enumerate(self.marker_rects()):
+            painter.drawPixmap(rect.topLeft(), self.pixmap(i))  # Drawn at its logical size, whatever `dpr` is
+        painter.end()
@@ -0,0 +1,48 @@
+from PySide6.QtGui import QImage
+from PySide6.QtCore import Qt, QSize
+
+MIN_LEVEL_SIZE = 4
+
+
+class MipmapPyramid:
+    """
+    Precomputed halved levels of a crosshair image.
+
+    Every requested size is scaled from the nearest larger level, so a resize never filters the full source and
+    large downscale ratios don't alias. Building uses only QImage, it is safe to run off the GUI thread.
+    """
+
+    def __init__(self, path: str, image: QImage):
+        self.path = path
+        level = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        self.levels = [level]
+        while min(level.width(), level.height()) // 2 >= MIN_LEVEL_SIZE:
+            level = level.scaled(
+                level.width() // 2, level.height() // 2,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self.levels.append(level)
+
+    @classmethod
+    def load(cls, path: str) -> "MipmapPyramid":
+        image = QImage(path)
+        if image.isNull():
+            raise ValueError(f"Cannot decode {path}")
+        return cls(path, image)
+
+    def level_for(self, target: QSize) -> QImage:
+        """Smallest level still at least as large as `target`"""
+        for level in reversed(self.levels):
+            if level.width() >= target.width() and level.height() >= target.height():
+                return level
+        return self.levels[0]
+
+    def scaled(self, size: int, fast: bool = False) -> QImage:
+        """The image fitted into a `size` square, like QPixmap.scaled with KeepAspectRatio"""
+        target = self.levels[0].size().scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio)
+        return self.level_for(target).scaled(
+            size, size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation if fast else Qt.TransformationMode.SmoothTransformation
+        )
@@ -0,0 +1,107 @@
+import os, logging  # noqa E401
+from typing import Optional
+
+from PySide6.QtCore import Qt, QObject, QTimer, Signal
+
+SYSFS_ROOT = "/sys"
+POLL_MS = 60_000  # sysfs attributes don't notify, and the power source rarely changes
+SAVER_PROFILES = ("low-power", "quiet", "cool")  # ACPI platform profiles that ask for power saving
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class PowerMonitor(QObject):
+    """
+    Battery and power-saver detection from Linux sysfs.
+
+    Reads `class/power_supply/*` and `firmware/acpi/platform_profile` below `sysfs`, which can point at a fake tree.
+    Saving is on while running on battery or while the platform profile asks for low power. Polling is slow and only
+    runs on machines that have a battery, on other machines the profile is read once and nothing wakes up for it.
+    """
+    changed = Signal()
+
+    def __init__(self, sysfs: str = SYSFS_ROOT, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.sysfs = sysfs
+        self.on_battery = False
+        self.profile: Optional[str] = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(POLL_MS)
+        self._timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self._timer.timeout.connect(self.poll)
+
+    @property
+    def saving(self) -> bool:
+        return self.on_battery or self.profile in SAVER_PROFILES
+
+    def start(self) -> bool:
+        """Read the current state and keep polling, returns False when there is nothing to watch"""
+        self.poll()
+        if not self._has_battery():
+            return False
+        self._timer.start()
+        return True
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def poll(self) -> None:
+        before = (self.saving, self.describe())
+        self.on_battery = self._read_on_battery()
+        self.profile = _read(os.path.join(self.sysfs, "firmware", "acpi", "platform_profile"))
+        if (self.saving, self.describe()) != before:
+            logging.info(f"Power saving {'on' if self.saving else 'off'}: {self.describe()}")
+            self.changed.emit()
+
+    def describe(self) -> str:
+        if self.on_battery:
+            return "battery"
+        if self.profile in SAVER_PROFILES:
+            return f"{self.profile} profile"
+        return "AC power"
+
+    def _supplies(self) -> list[str]:
+        root = os.path.join(self.sysfs, "class", "power_supply")
+        try:
+            return [os.path.join(root, name) for name in sorted(os.listdir(root))]
+        except OSError:
+            return []
+
+    def _has_battery(self) -> bool:
+        return any(self._is_system_battery(path) for path in self._supplies())
+
+    @staticmethod
+    def _is_system_battery(path: str) -> bool:
+        """A battery powering the machine, not the one of a wireless mouse or headset"""
+        return _read(os.path.join(path, "type")) == "Battery" and _read(os.path.join(path, "scope")) != "Device"
+
+    def _read_on_battery(self) -> bool:
+        mains_online = None
+        battery = discharging = False
+        for path in self._supplies():
+            # USB and UCSI ports are offline whenever nothing charges through them, only Mains tells about AC power
+            if _read(os.path.join(path, "type")) == "Mains":
+                mains_online = mains_online or _read(os.path.join(path, "online")) == "1"
+            elif self._is_system_battery(path):
+                battery = True
+                discharging = discharging or _read(os.path.join(path, "status")) == "Discharging"
+        if not battery:  # A desktop, whatever its supplies report
+            return False
+        if mains_online is not None:
+            return not mains_online
+        return discharging
+
+    def snapshot(self) -> dict:
+        return {
+            "saving": self.saving,
+            "on_battery": self.on_battery,
+            "profile": self.profile,
+            "polling": self._timer.isActive(),
+        }
@@ -0,0 +1,127 @@
+"""
+Process priority, I/O priority, CPU affinity and thread pool limits.
+
+On Linux the priority, I/O priority and affinity belong to the calling thread and are inherited by the threads it
+starts, so `apply_process_limits()` has to run before QApplication and any other thread is created.
+"""
+import os, sys, json, ctypes, logging, platform  # noqa E401
+from typing import Optional
+
+IO_CLASSES = {"realtime": 1, "best-effort": 2, "idle": 3}
+_IOPRIO_CLASS_SHIFT = 13
+_IOPRIO_WHO_PROCESS = 1
+_IOPRIO_SET = {"x86_64": 251, "i386": 289, "i686": 289, "aarch64": 30, "armv7l": 314}  # ioprio_set syscall numbers
+
+# Windows priority classes, by the smallest niceness that maps to them
+_WIN_PRIORITY_CLASSES = ((10, 0x40), (1, 0x4000))  # IDLE_PRIORITY_CLASS, BELOW_NORMAL_PRIORITY_CLASS
+
+SETTINGS_KEYS = ("process_nice", "process_io_class", "process_cpus", "process_max_threads")
+
+
+def parse_cpu_list(text: str) -> list[int]:
+    """
+    Parse "0,2-3" into [0, 2, 3], the format of taskset and /sys/devices/system/cpu/online. Raises ValueError for
+    anything else, reversed ranges included.
+    """
+    cpus: set[int] = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        first, last = int(first), int(last or first)
+        if first < 0 or last < first:
+            raise ValueError(f"invalid CPU range {part!r}")
+        cpus.update(range(first, last + 1))
+    return sorted(cpus)
+
+
+def load_process_settings(path: str) -> dict:
+    """The `process_*` settings, read on their own since they are needed before the window exists"""
+    try:
+        with open(path, "r") as f:
+            settings = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.error(f"Failed to load process settings: {e}")
+        return {}
+    return {key: settings[key] for key in SETTINGS_KEYS if settings.get(key) not in (None, 0, [])}
+
+
+def _set_io_class(io_class: str) -> None:
+    number = _IOPRIO_SET.get(platform.machine())
+    if number is None:
+        raise OSError(f"ioprio_set is unknown on {platform.machine()}")
+    level = 7 if io_class != "realtime" else 0  # Lowest level within the class, ignored for idle
+    value = (IO_CLASSES[io_class] << _IOPRIO_CLASS_SHIFT) | level
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.syscall(number, _IOPRIO_WHO_PROCESS, 0, value) != 0:
+        raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+
+
+def _set_nice(nice: int) -> None:
+    if sys.platform == "win32":
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        priority_class = next(value for minimum, value in _WIN_PRIORITY_CLASSES if nice >= minimum)
+        if not kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), priority_class):
+            raise ctypes.WinError()
+    else:
+        os.nice(nice)
+
+
+def _set_cpus(cpus: list[int]) -> None:
+    if sys.platform == "win32":
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        mask = sum(1 << cpu for cpu in cpus)
+        if not kernel32.SetProcessAffinityMask(kernel32.GetCurrentProcess(), ctypes.c_size_t(mask)):
+            raise ctypes.WinError()
+    else:
+        os.sched_setaffinity(0, cpus)
+
+
+def apply_process_limits(
+        nice: int = 0,
+        io_class: Optional[str] = None,
+        cpus: Optional[list[int]] = None,
+        max_threads: int = 0
+) -> dict:
+    """
+    Lower the priority of this process and keep it on `cpus`, returns what was applied.
+
+    `nice` is added to the niceness (on Windows, 1-9 means below normal and 10 and up idle), `io_class` is one of
+    `IO_CLASSES` (Linux only) and `max_threads` caps Qt's global thread pool. Zero and None leave a limit alone.
+    Failures are logged and skipped, a limit that cannot be applied never keeps the overlay from starting.
+    """
+    applied: dict = {}
+    if nice:
+        try:
+            _set_nice(nice)
+            applied["nice"] = os.getpriority(os.PRIO_PROCESS, 0) if hasattr(os, "getpriority") else nice
+        except Exception as e:
+            logging.error(f"Failed to lower the process priority: {e}")
+    if io_class:
+        try:
+            if io_class not in IO_CLASSES:
+                raise ValueError(f"expected one of {list(IO_CLASSES)}")
+            if not sys.platform.startswith("linux"):
+                raise OSError("I/O priority is only supported on Linux")
+            _set_io_class(io_class)
+            applied["io_class"] = io_class
+        except Exception as e:
+            logging.error(f"Failed to set the I/O priority to {io_class}: {e}")
+    if cpus:
+        try:
+            _set_cpus(cpus)
+            applied["cpus"] = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else cpus
+        except Exception as e:
+            logging.error(f"Failed to pin the process to CPUs {cpus}: {e}")
+    if max_threads:
+        from PySide6.QtCore import QThreadPool
+
+        QThreadPool.globalInstance().setMaxThreadCount(max_threads)
+        applied["max_threads"] = QThreadPool.globalInstance().maxThreadCount()
+
+    if applied:
+        logging.warning(f"Process limits applied: {applied}")
+    return applied
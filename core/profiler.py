@@ -0,0 +1,69 @@
+import os, time, logging  # noqa E401
+from typing import Optional
+
+
+def log_directory() -> str:
+    """Directory of the log file, falls back to the working directory"""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.FileHandler):
+            return os.path.dirname(handler.baseFilename)
+    return os.getcwd()
+
+
+class SessionProfiler:
+    """
+    cProfile and tracemalloc capture of a user session.
+
+    Nothing is imported or hooked until `start()`, so a disabled profiler costs nothing. cProfile only sees the
+    thread it was started on, which is the GUI thread.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self._profile = None
+        self._baseline = None
+
+    @property
+    def running(self) -> bool:
+        return self._profile is not None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        import cProfile
+        import tracemalloc
+
+        tracemalloc.start(25)
+        self._baseline = tracemalloc.take_snapshot()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self) -> Optional[str]:
+        """Stop capturing and write the results, returns the common path prefix of the written files"""
+        if not self.running:
+            return None
+        import pstats
+        import tracemalloc
+
+        self._profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        prefix = os.path.join(self.directory or log_directory(), f"profile_{time.strftime('%Y%m%d_%H%M%S')}")
+        try:
+            self._profile.dump_stats(f"{prefix}.prof")
+            snapshot.dump(f"{prefix}.tracemalloc")
+            with open(f"{prefix}.txt", "w") as f:
+                stats = pstats.Stats(self._profile, stream=f)
+                stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(40)
+                f.write("\nTop memory growth since profiling started:\n")
+                for stat in snapshot.compare_to(self._baseline, "lineno")[:40]:
+                    f.write(f"{stat}\n")
+            logging.warning(f"Profile written to {prefix}.*")
+        except Exception as e:
+            logging.error(f"Failed to write profile: {e}")
+            prefix = None
+        finally:
+            self._profile = None
+            self._baseline = None
+        return prefix
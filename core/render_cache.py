@@ -0,0 +1,96 @@
+import os, json, zlib, struct, hashlib, logging  # noqa E401
+from typing import Optional
+
+from PySide6.QtGui import QImage
+
+CACHE_DIR = "./config/cache"
+MAX_ENTRIES = 16
+
+# magic, version, width, height, bytes per line, QImage format, crc32 of the pixel data
+_HEADER = struct.Struct("<4sHIIIII")
+_MAGIC = b"HSRC"
+_VERSION = 1
+
+
+class RenderCache:
+    """
+    On-disk cache of final crosshair bitmaps.
+
+    Entries are raw QImage scanlines behind a small header, so loading is a single read without any decoding.
+    Keys hash the crosshair state together with the source image mtime and size, an edited image is a miss.
+    Truncated, corrupt or foreign files are removed and treated as a miss.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR):
+        self.directory = directory
+
+    @staticmethod
+    def key(state: dict) -> str:
+        data = dict(state)
+        img = data.get("img")
+        if img:
+            try:
+                stat = os.stat(img)
+                data["img_stat"] = [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                data["img_stat"] = None
+        return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def load(self, key: str) -> Optional[QImage]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logging.warning(f"Failed to read render cache entry: {e}")
+            return None
+
+        try:
+            magic, version, width, height, stride, fmt, crc = _HEADER.unpack_from(data)
+            pixels = data[_HEADER.size:]
+            if magic != _MAGIC or version != _VERSION or len(pixels) != stride * height or zlib.crc32(pixels) != crc:
+                raise ValueError("header or checksum mismatch")
+            image = QImage(pixels, width, height, stride, QImage.Format(fmt)).copy()  # Own the pixels
+        except Exception as e:
+            logging.warning(f"Discarding corrupt render cache entry {key}: {e}")
+            self.discard(key)
+            return None
+        return image
+
+    def store(self, key: str, image: QImage) -> None:
+        pixels = bytes(image.constBits())[:image.sizeInBytes()]
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, image.width(), image.height(), image.bytesPerLine(), image.format().value,
+            zlib.crc32(pixels)
+        )
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path + ".tmp", "wb") as f:
+                f.write(header + pixels)
+            os.replace(path + ".tmp", path)  # Readers never see a half-written entry
+            self._prune()
+        except OSError as e:
+            logging.warning(f"Failed to write render cache entry: {e}")
+
+    def discard(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _prune(self) -> None:
+        entries = [e for e in os.scandir(self.directory) if e.name.endswith(".bin")]
+        if len(entries) <= MAX_ENTRIES:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        for entry in entries[MAX_ENTRIES:]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
@@ -0,0 +1,198 @@
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, fields
+from typing import Optional, Iterable, TYPE_CHECKING
+
+from PySide6.QtWidgets import QLabel, QWidget
+from PySide6.QtGui import QPixmap, QImage, QColor
+from PySide6.QtCore import Qt, QPoint
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MAX_SOURCES = 8  # Decoded source images kept around for repeated renders
+MAX_IMAGES = 32  # Finished image crosshairs (scaled, tinted, outlined) kept, a few sizes and colors of one image
+
+
+def crosshair_stylesheet(color: str, border_color: str, size: int, border_thickness: int, img: Optional[str]) -> str:
+    """Build the stylesheet used by the crosshair label"""
+    return (
+        f"background-color: {'transparent' if img else color}; "
+        f"border: {0 if img else border_thickness}px solid {border_color}; "  # Images get a shape outline instead
+        f"border-radius: {size // 2}px;"
+    )
+
+
+@dataclass(frozen=True)
+class CrosshairState:
+    """Everything that decides how a crosshair looks"""
+    color: str = "red"
+    border_color: str = "black"
+    size: int = 8
+    border_thickness: int = 0
+    img: Optional[str] = None
+    tint: bool = False  # Recolor the image with `color`
+
+    @classmethod
+    def from_settings(cls, settings: dict) -> "CrosshairState":
+        """Build a state from `ch_*` settings keys or plain field names"""
+        names = {f.name for f in fields(cls)}
+        data = {key[3:] if key.startswith("ch_") else key: value for key, value in settings.items()}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def image_size(self) -> int:
+        """Size the image is fitted into, its outline takes the border thickness on every side"""
+        return max(1, self.size - 2 * self.border_thickness)
+
+    def stylesheet(self) -> str:
+        return crosshair_stylesheet(self.color, self.border_color, self.size, self.border_thickness, self.img)
+
+
+def render_label(label: QLabel, dpr: float = 1.0) -> QPixmap:
+    """Render a crosshair label on its own, without the window background behind it"""
+    pixmap = QPixmap(label.size() * dpr)
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    label.render(pixmap, QPoint(), renderFlags=QWidget.RenderFlag.DrawChildren)
+    return pixmap
+
+
+class CrosshairRenderer:
+    """
+    Renders crosshair states without a visible window.
+
+    The overlay label and headless renders are configured by the same `apply()`, so both produce the same pixels.
+    Only a QApplication is needed, the offscreen platform is enough.
+    """
+
+    def __init__(self):
+        self._label: Optional[QLabel] = None
+        self._sources: OrderedDict[str, QPixmap] = OrderedDict()
+        self._images: OrderedDict[tuple, QPixmap] = OrderedDict()
+
+    def source(self, path: str) -> QPixmap:
+        """Decoded source image, kept for the next renders of the same file"""
+        pixmap = self._sources.get(path)
+        if pixmap is None:
+            pixmap = QPixmap(path)
+            self._sources[path] = pixmap
+            if len(self._sources) > MAX_SOURCES:
+                self._sources.popitem(last=False)
+        else:
+            self._sources.move_to_end(path)
+        return pixmap
+
+    def apply(self, label: QLabel, state: CrosshairState, source: Optional[QPixmap] = None) -> None:
+        """Configure `label` to draw `state`"""
+        label.setFixedSize(state.size, state.size)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setStyleSheet(state.stylesheet())
+        if state.img:
+            label.setPixmap(self.image_pixmap(state, source))
+        else:
+            label.setPixmap(QPixmap())
+
+    def image_pixmap(
+            self,
+            state: CrosshairState,
+            source: Optional[QPixmap] = None,
+            fast: bool = False,
+            transient: bool = False,
+            source_kind: Optional[str] = None
+    ) -> QPixmap:
+        """
+        The image of `state` fitted into its size, recolored in tint mode and drawn over its shape outline.
+
+        Results are cached per source, image, size, tint color, outline and filter, so a color or border change only
+        reprocesses the small scaled bitmap. `fast` scales without the smooth filter, for the cheaper quality tiers.
+        `transient` frames are about to be replaced, they are scaled fast and skip the cache. A `source` other than
+        the decoded file is only cached when `source_kind` ("mipmap", ...) tells what it was built from.
+        """
+        fast = fast or transient
+        if source is None or source is self._sources.get(state.img):
+            source_kind = "file"
+        key = (
+            source_kind,
+            state.img,
+            state.size,
+            QColor(state.color).rgba() if state.tint else None,
+            state.border_thickness,
+            QColor(state.border_color).rgba() if state.border_thickness else None,
+            fast,
+        )
+        cacheable = not transient and source_kind is not None
+        pixmap = self._images.get(key) if cacheable else None
+        if pixmap is not None:
+            self._images.move_to_end(key)
+            return pixmap
+
+        source = source if source is not None else self.source(state.img)
+        size = state.image_size()
+        pixmap = source.scaled(
+            size, size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation if fast else Qt.TransformationMode.SmoothTransformation
+        )
+        if state.tint or state.border_thickness:
+            from .tint import tint_image  # NumPy is only imported once an image is processed
+            from .outline import outline_image
+
+            image = pixmap.toImage()
+            if state.tint:
+                image = tint_image(image, state.color)
+            if state.border_thickness:
+                image = outline_image(image, state.border_thickness, state.border_color)
+            pixmap = QPixmap.fromImage(image)
+
+        if cacheable:
+            self._images[key] = pixmap
+            if len(self._images) > MAX_IMAGES:
+                self._images.popitem(last=False)
+        return pixmap
+
+    def render_pixmap(self, state: CrosshairState, source: Optional[QPixmap] = None, dpr: float = 1.0) -> QPixmap:
+        """Render into a transparent pixmap of `dpr` device pixels per crosshair pixel"""
+        if self._label is None:
+            self._label = QLabel()
+        self.apply(self._label, state, source)
+        return render_label(self._label, dpr)
+
+    def render(self, state: CrosshairState) -> QImage:
+        """Render into a premultiplied ARGB32 image"""
+        image = self.render_pixmap(state).toImage()
+        if image.format() != QImage.Format.Format_ARGB32_Premultiplied:
+            image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        return image
+
+    def render_array(self, state: CrosshairState) -> "np.ndarray":
+        """Render and return a zero-copy (height, width, 4) uint8 view in BGRA byte order"""
+        from .image_buffer import image_view  # NumPy is only imported when arrays are asked for
+
+        return image_view(self.render(state))
+
+    def render_batch(self, states: Iterable[CrosshairState]) -> list[QImage]:
+        return [self.render(state) for state in states]
+
+
+_default_renderer: Optional[CrosshairRenderer] = None
+
+
+def default_renderer() -> CrosshairRenderer:
+    global _default_renderer
+    if _default_renderer is None:
+        _default_renderer = CrosshairRenderer()
+    return _default_renderer
+
+
+def render_crosshair(
+        color: str,
+        border_color: str,
+        size: int,
+        border_thickness: int,
+        img: Optional[str] = None,
+        source: Optional[QPixmap] = None
+) -> QPixmap:
+    """Render a crosshair into a transparent pixmap, exactly as the overlay label would draw it"""
+    return default_renderer().render_pixmap(CrosshairState(color, border_color, size, border_thickness, img), source)
@@ -0,0 +1,206 @@
+"""
+Record tray and move-mode interactions into a compact timestamped log and replay them headlessly.
+
+Log format (JSON Lines): the first line is a header with the starting settings, every following line is
+`[t_ms, kind, value]`. Replay from the project root:
+
+    python -m core.replay session.jsonl [--speed max|1.0] [--max-p95-ms 8]
+"""
+import os, sys, json, time, argparse, tempfile  # noqa E401
+from typing import Optional, Iterable, TextIO
+
+from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtCore import Qt, QObject, QEvent, QPoint, QPointF
+
+from .instrumentation import LatencyStats
+
+LOG_VERSION = 1
+
+_MOUSE_EVENTS = {
+    QEvent.Type.MouseButtonPress: "press",
+    QEvent.Type.MouseMove: "move",
+    QEvent.Type.MouseButtonRelease: "release",
+    QEvent.Type.MouseButtonDblClick: "double_click",
+}
+
+_STATE_KEYS = {"ch_color": "color", "ch_border_color": "border_color", "ch_img": "img", "ch_tint": "tint"}
+
+
+def _settings_of(window: QWidget) -> dict:
+    settings = {key: value for key, value in vars(window).items() if key.startswith("ch_")}
+    settings["ch_pos_x"], settings["ch_pos_y"] = window.pos().x(), window.pos().y()
+    return settings
+
+
+class InteractionRecorder(QObject):
+    """Writes one log line per slider step, color pick, image set/reset, move-mode toggle and drag event"""
+
+    def __init__(self, window: QWidget):
+        super().__init__(window)
+        self.window = window
+        self._file: Optional[TextIO] = None
+        self._start = 0.0
+        self._state = {key: getattr(window, key) for key in _STATE_KEYS}
+
+    def start(self, path: str) -> None:
+        w, menu = self.window, self.window.tray_menu  # type: ignore[attr-defined]
+        self._file = open(path, "w")
+        self._start = time.perf_counter()
+        self._file.write(json.dumps({"version": LOG_VERSION, "settings": _settings_of(w)}) + "\n")
+
+        menu.size_slider.valueChanged.connect(lambda v: self.record("size", v))
+        menu.opacity_slider.valueChanged.connect(lambda v: self.record("opacity", v))
+        menu.border_slider.valueChanged.connect(lambda v: self.record("border", v))
+        w.crosshair_changed.connect(self._on_crosshair_changed)  # type: ignore[attr-defined]
+        w.move_mode_changed.connect(lambda enabled: self.record("move_mode", enabled))  # type: ignore[attr-defined]
+        w.installEventFilter(self)
+
+    def stop(self) -> None:
+        if self._file is not None:
+            self.window.removeEventFilter(self)
+            self._file.close()
+            self._file = None
+
+    def record(self, kind: str, value) -> None:
+        if self._file is not None:
+            t = round((time.perf_counter() - self._start) * 1000, 1)
+            self._file.write(json.dumps([t, kind, value], separators=(",", ":")) + "\n")
+
+    def _on_crosshair_changed(self) -> None:
+        # Sliders are recorded from their own signals, only colors, image and tint need diffing
+        for key, kind in _STATE_KEYS.items():
+            value = getattr(self.window, key)
+            if value != self._state[key]:
+                self._state[key] = value
+                self.record(kind, value)
+
+    def eventFilter(self, watched, event) -> bool:
+        kind = _MOUSE_EVENTS.get(event.type())
+        if kind is not None and self.window.is_move_mode:  # type: ignore[attr-defined]
+            pos = event.globalPosition().toPoint()
+            self.record(kind, [pos.x(), pos.y(), event.button().value, event.buttons().value])
+        return super().eventFilter(watched, event)
+
+
+def load_log(path: str) -> tuple[dict, list[list]]:
+    with open(path, "r") as f:
+        header = json.loads(f.readline())
+        if header.get("version") != LOG_VERSION:
+            raise ValueError(f"Unsupported interaction log version: {header.get('version')}")
+        return header["settings"], [json.loads(line) for line in f if line.strip()]
+
+
+class _FrameCounter(QObject):
+    """Counts repaints of the top-level window, each UpdateRequest is one composed frame"""
+
+    def __init__(self):
+        super().__init__()
+        self.frames = 0
+
+    def eventFilter(self, watched, event) -> bool:
+        if event.type() == QEvent.Type.UpdateRequest:
+            self.frames += 1
+        return False
+
+
+def _dispatch(window: QWidget, kind: str, value) -> None:
+    menu = window.tray_menu  # type: ignore[attr-defined]
+    if kind == "size":
+        menu.size_slider.setValue(value)
+    elif kind == "opacity":
+        menu.opacity_slider.setValue(value)
+    elif kind == "border":
+        menu.border_slider.setValue(value)
+    elif kind == "color":
+        menu.set_ch_color(value)
+    elif kind == "border_color":
+        menu.set_ch_border_color(value)
+    elif kind == "img":
+        if value:
+            if window.ch_img:  # type: ignore[attr-defined]
+                menu.reset_custom_img()
+            menu.load_custom_img(value)
+        elif window.ch_img:  # type: ignore[attr-defined]
+            menu.reset_custom_img()
+    elif kind == "tint":
+        menu.tint_action.setChecked(value)
+    elif kind == "move_mode":
+        window.enable_move_mode() if value else window.disable_move_mode()  # type: ignore[attr-defined]
+    elif kind in ("press", "move", "release", "double_click"):
+        x, y, button, buttons = value
+        event_type = {v: k for k, v in _MOUSE_EVENTS.items()}[kind]
+        global_pos = QPointF(x, y)
+        local_pos = QPointF(window.mapFromGlobal(QPoint(x, y)))
+        event = QMouseEvent(
+            event_type, local_pos, global_pos,
+            Qt.MouseButton(button), Qt.MouseButton(buttons), Qt.KeyboardModifier.NoModifier
+        )
+        QApplication.sendEvent(window, event)
+    else:
+        raise ValueError(f"Unknown interaction kind: {kind}")
+
+
+def replay(window: QWidget, events: Iterable[list], speed: Optional[float] = None) -> dict:
+    """
+    Replay events against `window`, at `speed` times the recorded pace or as fast as possible when None.
+    Returns per-kind processing latency and the number of frames drawn.
+    """
+    app = QApplication.instance()
+    counter = _FrameCounter()
+    window.installEventFilter(counter)
+    stats: dict[str, LatencyStats] = {}
+    total = LatencyStats("all")
+
+    start = time.perf_counter()
+    for t, kind, value in events:
+        if speed:
+            delay = start + t / 1000 / speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        t0 = time.perf_counter_ns()
+        _dispatch(window, kind, value)
+        app.processEvents()  # Include the repaint caused by the event
+        t1 = time.perf_counter_ns()
+        stats.setdefault(kind, LatencyStats(kind)).record(t0, t1)
+        total.record(t0, t1)
+
+    window.removeEventFilter(counter)
+    return {
+        "wall_s": time.perf_counter() - start,
+        "frames": counter.frames,
+        "total": total.snapshot(),
+        "kinds": {kind: s.snapshot() for kind, s in stats.items()},
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m core.replay", description="Replay a HolySight interaction log")
+    parser.add_argument("log", help="Interaction log recorded with HOLYSIGHT_RECORD")
+    parser.add_argument("--speed", default="max", help="'max' or a multiplier of the recorded pace (default: max)")
+    parser.add_argument("--max-p95-ms", type=float, default=None, help="Fail when p95 per-event time exceeds this")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from resources import icons  # noqa: F401
+    from windows import HolySight
+
+    settings, events = load_log(args.log)
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841
+    with tempfile.TemporaryDirectory() as tmp:
+        settings_path = os.path.join(tmp, "settings.json")
+        with open(settings_path, "w") as f:
+            json.dump(settings, f)
+        window = HolySight(settings_path=settings_path)
+        report = replay(window, events, None if args.speed == "max" else float(args.speed))
+
+    print(json.dumps(report, indent=4))
+    if args.max_p95_ms is not None and report["total"]["p95_ms"] > args.max_p95_ms:
+        print(f"FAIL: p95 {report['total']['p95_ms']:.3f} ms > {args.max_p95_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import logging
+from typing import Callable, Any
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+_pending: set["_Relay"] = set()
+
+
+class _Relay(QObject):
+    finished = Signal(object)
+
+
+class _Task(QRunnable):
+    def __init__(self, fn: Callable[[], Any], relay: _Relay):
+        super().__init__()
+        self.fn = fn
+        self.relay = relay
+
+    def run(self) -> None:
+        try:
+            result = self.fn()
+        except Exception as e:
+            logging.error(f"Background task failed: {e}")
+            result = None
+        self.relay.finished.emit(result)
+
+
+def run_in_thread(fn: Callable[[], Any], callback: Callable[[Any], None]) -> None:
+    """Run `fn` on the global thread pool and deliver its result to `callback` on the GUI thread"""
+    relay = _Relay()
+    _pending.add(relay)
+
+    def deliver(result) -> None:
+        _pending.discard(relay)
+        relay.deleteLater()
+        callback(result)
+
+    relay.finished.connect(deliver)
+    QThreadPool.globalInstance().start(_Task(fn, relay))
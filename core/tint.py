@@ -0,0 +1,35 @@
+import numpy as np
+from PySide6.QtGui import QImage, QColor
+
+from .image_buffer import image_view, default_pool
+
+LUMA_BGR = np.array([0.114, 0.587, 0.299], dtype=np.float32)  # Rec. 601 weights in ARGB32 memory order
+
+
+def tint_image(image: QImage, color: str) -> QImage:
+    """
+    Recolor `image` with `color`, keeping its alpha and shading.
+
+    Every pixel becomes `color` scaled by its own luminance, so white parts take the exact color and dark outlines
+    stay dark. Computed on premultiplied pixels, where this is still a plain per-channel multiply.
+    """
+    source = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    result = QImage(source.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    h, w = source.height(), source.width()
+    if h == 0 or w == 0:
+        return result
+
+    src = image_view(source)
+    dst = image_view(result, writable=True)
+    luma = default_pool().get("tint.luma", (h, w))
+    rgb = default_pool().get("tint.rgb", (h, w, 3))
+
+    c = QColor(color)
+    tint = np.array([c.blueF(), c.greenF(), c.redF()], dtype=np.float32)
+    rgb[...] = src[..., :3]  # Converted in place, matmul on uint8 would allocate the float copy
+    np.matmul(rgb, LUMA_BGR, out=luma)  # Premultiplied, so never above alpha
+    np.multiply(luma[..., None], tint, out=rgb)
+    rgb += 0.5
+    dst[..., :3] = rgb
+    dst[..., 3] = src[..., 3]
+    return result
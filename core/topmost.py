@@ -0,0 +1,264 @@
+import os, sys, math, time, logging  # noqa E401
+from collections import deque
+from typing import Optional
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QObject, QEvent, QTimer, Signal
+
+from .desktop import X11EventThread, WinEventHook
+
+MAX_RAISES_PER_S = 5  # More means another topmost window fights back, raising harder only burns CPU
+
+
+class StackingSource(QObject):
+    """
+    Stacking order and focus changes of the desktop.
+
+    `changed` is emitted whenever another window may have moved above ours, `is_covered()` then tells whether one
+    did. Subclasses may emit from any thread, Qt queues delivery to the GUI thread.
+    """
+    changed = Signal()
+
+    def start(self, window_id: int) -> bool:
+        return True
+
+    def stop(self) -> None:
+        pass
+
+    def is_covered(self, window_id: int) -> bool:
+        return False
+
+    def raise_window(self, window: QWidget) -> None:
+        window.raise_()
+
+
+class FakeStackingSource(StackingSource):
+    """Stacking source driven by hand, for tests and headless runs"""
+
+    def __init__(self):
+        super().__init__()
+        self.covered = False
+
+    def cover(self) -> None:
+        self.covered = True
+        self.changed.emit()
+
+    def is_covered(self, window_id: int) -> bool:
+        return self.covered
+
+    def raise_window(self, window: QWidget) -> None:
+        self.covered = False
+
+
+class X11StackingSource(StackingSource):
+    """
+    Follows `_NET_CLIENT_LIST_STACKING`, `_NET_ACTIVE_WINDOW` and top-level `ConfigureNotify` events through
+    python-xlib. Queries from the GUI thread use a second connection, the event thread owns the first.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._events: Optional[X11EventThread] = None
+        self._query = None
+
+    def start(self, window_id: int) -> bool:
+        try:
+            from Xlib import X, display
+        except ImportError as e:
+            logging.error(f"Keeping the overlay on top needs python-xlib: {e}")
+            return False
+        self._events = X11EventThread(
+            "HolySightStacking", X.PropertyChangeMask | X.SubstructureNotifyMask, self._on_event
+        )
+        if not self._events.open():
+            self._events = None
+            return False
+        self._query = display.Display()
+        self._stacking_atom = self._query.intern_atom("_NET_CLIENT_LIST_STACKING")
+        self._pid_atom = self._query.intern_atom("_NET_WM_PID")
+        self._watched = {self._stacking_atom, self._query.intern_atom("_NET_ACTIVE_WINDOW")}
+        self._events.start()
+        return True
+
+    def stop(self) -> None:
+        if self._events is not None:
+            self._events.stop()
+            self._query.close()
+            self._events = self._query = None
+
+    def _on_event(self, event) -> None:
+        from Xlib import X
+
+        if event.type in (X.ConfigureNotify, X.MapNotify):
+            self.changed.emit()
+        elif event.type == X.PropertyNotify and event.atom in self._watched:
+            self.changed.emit()
+
+    def is_covered(self, window_id: int) -> bool:
+        """Whether a mapped client of another process above ours in the stacking order overlaps it"""
+        from Xlib import X
+        from Xlib.error import XError
+
+        root = self._query.screen().root
+        try:
+            stacking = root.get_full_property(self._stacking_atom, X.AnyPropertyType)
+            clients = list(stacking.value) if stacking is not None else []
+            if window_id not in clients:  # Not managed, the window manager keeps it where it is
+                return False
+            ours = self._root_rect(root, window_id)
+            for client in clients[clients.index(window_id) + 1:]:
+                window = self._query.create_resource_object("window", client)
+                if window.get_attributes().map_state != X.IsViewable:
+                    continue
+                pid = window.get_full_property(self._pid_atom, X.AnyPropertyType)
+                if pid is not None and len(pid.value) and pid.value[0] == os.getpid():  # Our own dialogs
+                    continue
+                x, y, w, h = self._root_rect(root, client)
+                if x < ours[0] + ours[2] and ours[0] < x + w and y < ours[1] + ours[3] and ours[1] < y + h:
+                    return True
+        except XError as e:  # A window went away in the meantime, the next event checks again
+            logging.warning(f"Failed to read the stacking order: {e}")
+        return False
+
+    def _root_rect(self, root, window_id: int) -> tuple[int, int, int, int]:
+        window = self._query.create_resource_object("window", window_id)
+        geometry = window.get_geometry()
+        origin = root.translate_coords(window, 0, 0)
+        return origin.x, origin.y, geometry.width, geometry.height
+
+
+class WinStackingSource(StackingSource):
+    """
+    Follows foreground and restore events through a WinEvent hook, covered means a visible window of another process
+    above ours in the z-order overlaps it. Raising re-asserts HWND_TOPMOST without activating the overlay.
+    """
+    EVENT_SYSTEM_FOREGROUND = 0x0003
+    EVENT_SYSTEM_MINIMIZEEND = 0x0017
+    GW_HWNDPREV = 3
+    HWND_TOPMOST = -1
+    SWP_NOSIZE, SWP_NOMOVE, SWP_NOACTIVATE = 0x0001, 0x0002, 0x0010
+
+    def __init__(self):
+        super().__init__()
+        self._hook = WinEventHook(self.EVENT_SYSTEM_FOREGROUND, self.EVENT_SYSTEM_MINIMIZEEND, self._on_event)
+
+    def start(self, window_id: int) -> bool:
+        return self._hook.start()
+
+    def stop(self) -> None:
+        self._hook.stop()
+
+    def _on_event(self, event: int, hwnd: int) -> None:
+        if event in (self.EVENT_SYSTEM_FOREGROUND, self.EVENT_SYSTEM_MINIMIZEEND):
+            self.changed.emit()
+
+    def is_covered(self, window_id: int) -> bool:
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+        user32.GetWindow.restype = wintypes.HWND
+        ours, other, pid = wintypes.RECT(), wintypes.RECT(), wintypes.DWORD()
+        user32.GetWindowRect(window_id, ctypes.byref(ours))
+        hwnd = user32.GetWindow(window_id, self.GW_HWNDPREV)
+        while hwnd:
+            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+            ours_too = pid.value == os.getpid()  # Our own dialogs
+            if not ours_too and user32.IsWindowVisible(hwnd) and not user32.IsIconic(hwnd):
+                user32.GetWindowRect(hwnd, ctypes.byref(other))
+                overlaps = other.left < ours.right and ours.left < other.right
+                if overlaps and other.top < ours.bottom and ours.top < other.bottom:
+                    return True
+            hwnd = user32.GetWindow(hwnd, self.GW_HWNDPREV)
+        return False
+
+    def raise_window(self, window: QWidget) -> None:
+        import ctypes
+
+        flags = self.SWP_NOSIZE | self.SWP_NOMOVE | self.SWP_NOACTIVATE
+        ctypes.windll.user32.SetWindowPos(int(window.winId()), self.HWND_TOPMOST, 0, 0, 0, 0, flags)  # type: ignore
+
+
+def default_stacking_source() -> Optional[StackingSource]:
+    """The source for this platform, None where there is none"""
+    if sys.platform == "win32":
+        return WinStackingSource()
+    if os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY"):
+        return X11StackingSource()
+    return None
+
+
+class KeepOnTop(QObject):
+    """
+    Raises a stays-on-top window again once another window covers it.
+
+    Nothing is polled: a check runs when the stacking source reports a stacking or focus change and when the window
+    is shown, and a burst of events is coalesced into a single check. The window is only raised when it is actually
+    covered, and never more than `MAX_RAISES_PER_S` times a second. A throttled check is retried once the
+    budget allows another raise.
+    """
+
+    def __init__(self, window: QWidget, source: Optional[StackingSource] = None):
+        super().__init__(window)
+        self.window = window
+        self.source = source
+        self.checks = 0
+        self.raises = 0
+        self.throttled = 0
+        self._running = False
+        self._pending = False
+        self._recent: deque[float] = deque(maxlen=MAX_RAISES_PER_S)
+
+    def start(self) -> bool:
+        if self._running or self.source is None:
+            return self._running
+        self.source.changed.connect(self.schedule_check)
+        if not self.source.start(int(self.window.winId())):
+            self.source.changed.disconnect(self.schedule_check)
+            self.source = None
+            return False
+        self.window.installEventFilter(self)
+        self._running = True
+        return True
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self.source.stop()
+        self.source.changed.disconnect(self.schedule_check)
+        self.window.removeEventFilter(self)
+        self._running = False
+
+    def schedule_check(self) -> None:
+        if not self._pending:
+            self._pending = True
+            QTimer.singleShot(0, self.check)
+
+    def check(self) -> None:
+        self._pending = False
+        if not self._running or not self.window.isVisible():
+            return
+        self.checks += 1
+        if not self.source.is_covered(int(self.window.winId())):
+            return
+
+        now = time.monotonic()
+        if len(self._recent) == self._recent.maxlen and now - self._recent[0] < 1.0:
+            if not self.throttled:
+                logging.warning("Another window keeps covering the overlay, raising it less often")
+            self.throttled += 1
+            # Checked again once the budget allows, the covering window may not send another event
+            self._pending = True
+            QTimer.singleShot(math.ceil((1.0 - (now - self._recent[0])) * 1000), self.check)
+            return
+        self._recent.append(now)
+        self.source.raise_window(self.window)
+        self.raises += 1
+
+    def eventFilter(self, watched, event) -> bool:
+        if watched is self.window and event.type() == QEvent.Type.Show:
+            self.schedule_check()
+        return False
+
+    def snapshot(self) -> dict:
+        return {"running": self._running, "checks": self.checks, "raises": self.raises, "throttled": self.throttled}
@@ -0,0 +1,84 @@
+import sys, time, logging, threading, traceback  # noqa E401
+from collections import deque
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+
+
+class StallWatchdog(QObject):
+    """
+    Detects GUI-thread stalls longer than a budget and records where the thread was stuck.
+
+    A watchdog thread posts a heartbeat to the GUI thread every `budget_ms` and waits up to `budget_ms` for it to be
+    handled. When it isn't, the main thread stack is captured with `sys._current_frames()`; once the heartbeat
+    finally gets through, the stall duration and stack are logged from the watchdog thread, off the GUI thread.
+    Heartbeats wake the event loop, so the watchdog is a diagnostic and is off unless a budget is configured.
+    """
+    _heartbeat = Signal(int)
+
+    def __init__(self, budget_ms: float, history: int = 64):
+        super().__init__()
+        self.budget = budget_ms / 1000
+        self.stalls: deque[dict] = deque(maxlen=history)
+        self.stall_count = 0
+
+        self._acked = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._gui_ident = 0
+        self._heartbeat.connect(self._ack)  # Queued, this object lives in the GUI thread
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._gui_ident = threading.get_ident()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="HolySightWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._acked.set()
+        self._thread.join(timeout=1)
+        self._thread = None
+
+    def snapshot(self) -> dict:
+        return {
+            "budget_ms": self.budget * 1000,
+            "stalls": self.stall_count,
+            "max_ms": max((s["duration_ms"] for s in self.stalls), default=0.0),
+            "recent": [{"duration_ms": s["duration_ms"], "where": s["where"]} for s in list(self.stalls)[-5:]],
+        }
+
+    def _ack(self, _seq: int) -> None:
+        self._acked.set()
+
+    def _run(self) -> None:
+        seq = 0
+        while not self._stopping.wait(self.budget):
+            seq += 1
+            self._acked.clear()
+            sent = time.perf_counter()
+            self._heartbeat.emit(seq)
+            if self._acked.wait(self.budget):
+                continue
+
+            # The GUI thread didn't get to the heartbeat in time, grab the stack while it is stuck
+            frame = sys._current_frames().get(self._gui_ident)
+            stack = traceback.format_stack(frame) if frame is not None else []
+            self._acked.wait()
+            if self._stopping.is_set():
+                return
+            self._record(time.perf_counter() - sent, stack)
+
+    def _record(self, duration: float, stack: list[str]) -> None:
+        where = stack[-1].strip().splitlines()[0] if stack else "unknown"
+        stall = {"duration_ms": duration * 1000, "where": where, "stack": "".join(stack)}
+        self.stalls.append(stall)
+        self.stall_count += 1
+        logging.warning(
+            f"GUI thread stalled for {stall['duration_ms']:.1f} ms "
+            f"(budget {self.budget * 1000:.0f} ms), main thread stack:\n{stall['stack']}"
+        )
@@ -0,0 +1 @@
+from .single_instance import SERVER_NAME, parse_args, send_command, request, CommandServer
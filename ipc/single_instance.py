@@ -0,0 +1,132 @@
+import json, getpass, logging, argparse  # noqa E401
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+from core.priority import parse_cpu_list
+
+SERVER_NAME = f"HolySight-{getpass.getuser()}"
+
+
+def _cpu_list(text: str) -> list[int]:
+    try:
+        cpus = parse_cpu_list(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"expected a CPU list like 2,3 or 2-3: {e}")
+    if not cpus:
+        raise argparse.ArgumentTypeError("the CPU list is empty")
+    return cpus
+
+
+def parse_args(argv: list[str]) -> dict:
+    """Parse command line flags into the command forwarded to the running instance"""
+    parser = argparse.ArgumentParser(prog="HolySight", description="Crosshair overlay")
+    parser.add_argument("--toggle", action="store_true", help="Show or hide the crosshair")
+    parser.add_argument("--preset", metavar="NAME", help="Apply config/presets/NAME.json")
+    parser.add_argument("--size", type=int, help="Set the crosshair size")
+    parser.add_argument("--center", action="store_true", help="Center the crosshair on the screen")
+    parser.add_argument("--split", action="store_true", help="Run the overlay alone, the tray UI starts on demand")
+    parser.add_argument("--config-ui", action="store_true", help=argparse.SUPPRESS)  # Spawned by the split overlay
+    # Startup-only, applied by the starting process and never forwarded
+    parser.add_argument("--nice", type=int, help="Lower the overlay priority by this niceness")
+    parser.add_argument("--io-class", choices=["best-effort", "idle"], help="Linux I/O scheduling class")
+    parser.add_argument(
+        "--cpus", metavar="LIST", type=_cpu_list, help="Keep the overlay on these CPUs, e.g. 2,3 or 2-3"
+    )
+    parser.add_argument("--max-threads", type=int, help="Cap the background thread pool")
+    args, _ = parser.parse_known_args(argv)  # Leave Qt's own arguments (-platform, -style...) alone
+    return {key: value for key, value in vars(args).items() if value not in (None, False)}
+
+
+def send_command(command: dict, timeout_ms: int = 200) -> bool:
+    """Forward `command` to the running instance, returns False when there is none"""
+    socket = QLocalSocket()
+    socket.connectToServer(SERVER_NAME)
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.write(json.dumps(command).encode() + b"\n")
+    socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    return True
+
+
+def request(command: dict, timeout_ms: int = 500) -> Optional[dict]:
+    """Send `command` to the running instance and wait for its answer, None when nobody answers"""
+    socket = QLocalSocket()
+    socket.connectToServer(SERVER_NAME)
+    if not socket.waitForConnected(timeout_ms):
+        return None
+    socket.write(json.dumps(command).encode() + b"\n")
+    socket.waitForBytesWritten(timeout_ms)
+    while not socket.canReadLine():
+        if not socket.waitForReadyRead(timeout_ms):
+            return None
+    try:
+        reply = json.loads(bytes(socket.readLine()))
+    except ValueError as e:
+        logging.warning(f"Ignoring malformed reply: {e}")
+        return None
+    socket.disconnectFromServer()
+    return reply if isinstance(reply, dict) else None
+
+
+class CommandServer(QObject):
+    """Local socket server of the running instance, emits one dict per received command line"""
+    command_received = Signal(dict)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self._on_new_connection)
+        self._socket: Optional[QLocalSocket] = None  # Connection of the command being handled
+
+    def listen(self) -> bool:
+        """Start serving commands, False when another instance already does or the server cannot start"""
+        if not self.server.listen(SERVER_NAME):
+            # The startup probe ran before the GUI was built, another instance may have started since. Only a socket
+            # nobody answers on is left over from a crashed instance and safe to remove
+            probe = QLocalSocket()
+            probe.connectToServer(SERVER_NAME)
+            if probe.waitForConnected(200):
+                probe.disconnectFromServer()
+                logging.warning("Another instance started at the same time, leaving the command server to it")
+                return False
+            QLocalServer.removeServer(SERVER_NAME)
+            if not self.server.listen(SERVER_NAME):
+                logging.error(f"Failed to start the command server: {self.server.errorString()}")
+                return False
+        return True
+
+    def close(self) -> None:
+        self.server.close()
+
+    def respond(self, reply: dict) -> None:
+        """Answer the command being handled, only valid inside a `command_received` slot"""
+        if self._socket is not None:
+            self._socket.write(json.dumps(reply).encode() + b"\n")
+
+    def _on_new_connection(self) -> None:
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda s=socket: self._read(s))
+            socket.disconnected.connect(socket.deleteLater)
+            if socket.bytesAvailable():
+                self._read(socket)
+
+    def _read(self, socket: QLocalSocket) -> None:
+        while socket.canReadLine():
+            line = bytes(socket.readLine()).strip()
+            if not line:
+                continue
+            try:
+                command = json.loads(line)
+            except ValueError as e:
+                logging.warning(f"Ignoring malformed command: {e}")
+                continue
+            if isinstance(command, dict):
+                self._socket = socket
+                try:
+                    self.command_received.emit(command)
+                finally:
+                    self._socket = None
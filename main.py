@@ -1,7 +1,6 @@
-import sys, logging  # noqa E401
-from PySide6.QtWidgets import QApplication
-from windows import HolySight
-from resources import icons  # noqa: F401
+import os, sys, logging  # noqa E401
+
+from ipc import parse_args, send_command
 
 logging.basicConfig(
     filename="logs.txt",
@@ -10,6 +9,79 @@ logging.basicConfig(
 )
 
 if __name__ == '__main__':
+    # Hand the command to a running instance before any GUI module is imported, so forwarding stays instant
+    command = parse_args(sys.argv[1:])
+    split = command.pop("split", False)
+    limits = {key: command.pop(key) for key in ("nice", "io_class", "cpus", "max_threads") if key in command}
+    if command.pop("config_ui", False):
+        # Tray menu of the split mode, started by the overlay process when its tray icon is clicked
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtGui import QCursor
+        from ipc import request
+        from windows import RemoteHolySight
+        from resources import icons  # noqa: F401
+
+        app = QApplication(sys.argv)
+        reply = request({"sync": True})
+        if reply is None or "state" not in reply:
+            logging.warning("No split overlay answered, closing the config UI")
+            sys.exit(1)
+        window = RemoteHolySight(reply["state"])
+        app.aboutToQuit.connect(window.flush)
+        window.tray_menu.popup(QCursor.pos())
+        sys.exit(app.exec())
+
+    if send_command(command):
+        sys.exit(0)
+
+    from PySide6.QtWidgets import QApplication
+    from overlay import SETTINGS_PATH
+    from core.priority import apply_process_limits, load_process_settings
+
+    # Before QApplication, so every thread the app starts inherits them. Flags override the settings
+    settings = {key[len("process_"):]: value for key, value in load_process_settings(SETTINGS_PATH).items()}
+    apply_process_limits(**{**settings, **limits})
+
+    if split:
+        # Only what drawing the crosshair needs is imported here, the tray UI runs in its own process on demand
+        from overlay import StandaloneOverlay
+
+        app = QApplication(sys.argv)
+        window = StandaloneOverlay()
+        if not window.server.listen():
+            sys.exit(0 if send_command(command) else 1)  # Another instance won the race, it takes the command
+        app.aboutToQuit.connect(window.server.close)
+        if command:
+            window.handle_command(command)
+        sys.exit(app.exec())
+
+    from ipc import CommandServer
+    from windows import HolySight
+    from resources import icons  # noqa: F401
+
     app = QApplication(sys.argv)
     window = HolySight()
+
+    server = CommandServer(window)
+    server.command_received.connect(window.handle_command)
+    if not server.listen():
+        sys.exit(0 if send_command(command) else 1)  # Another instance won the race, it takes the command
+    app.aboutToQuit.connect(server.close)
+    if command:
+        window.handle_command(command)
+
+    app.aboutToQuit.connect(window.profiler.stop)  # Writes the capture if profiling is still running
+    if os.environ.get("HOLYSIGHT_PROFILE"):
+        window.toggle_profiling()
+
+    if os.environ.get("HOLYSIGHT_INSTRUMENT"):
+        window.wakeup_counter.start()
+        app.aboutToQuit.connect(lambda: logging.warning(f"Instrumentation: {window.instrumentation()}"))
+
+    if record_path := os.environ.get("HOLYSIGHT_RECORD"):
+        from core.replay import InteractionRecorder
+        recorder = InteractionRecorder(window)
+        recorder.start(record_path)
+        app.aboutToQuit.connect(recorder.stop)
+
     sys.exit(app.exec())
@@ -0,0 +1,2 @@
+from .window import SETTINGS_PATH, OverlayWindow
+from .standalone import StandaloneOverlay
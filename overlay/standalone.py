@@ -0,0 +1,209 @@
+import os, sys, json, logging  # noqa E401
+from typing import Optional
+
+from PySide6.QtWidgets import QApplication, QLabel, QVBoxLayout, QSystemTrayIcon
+from PySide6.QtCore import Qt, QTimer, QProcess
+
+from ipc import CommandServer
+from core.icon_cache import icon, SIZED_DIR
+from core.renderer import CrosshairState, default_renderer
+from core.markers import Marker, MarkerLayer
+from .window import OverlayWindow, SETTINGS_PATH
+
+SAVE_DELAY_MS = 500  # Settings are written once a burst of state updates has settled
+LOOK_KEYS = ("ch_color", "ch_border_color", "ch_size", "ch_border_thickness", "ch_img", "ch_tint")
+
+
+def config_ui_arguments() -> list[str]:
+    """Arguments that start the config UI with the same interpreter or compiled executable"""
+    script = os.path.abspath(sys.argv[0])
+    return [script, "--config-ui"] if script.endswith(".py") else ["--config-ui"]
+
+
+class StandaloneOverlay(OverlayWindow):
+    """
+    Overlay process of the split mode (`main.py --split`).
+
+    Draws the crosshair and its markers and owns the settings file, nothing else. The tray menu runs in a config UI
+    process started when the tray icon is clicked, it reads the state with a `sync` command and sends every change
+    back as `{"state": {...}}`. A slow or crashed config UI never blocks the crosshair.
+    """
+    icon_root = SIZED_DIR  # Read from disk, this process skips resources.icons
+
+    def __init__(self, settings_path: str = SETTINGS_PATH):
+        super().__init__()
+        self.settings_path = settings_path
+        self.settings: dict = {}  # Every saved setting, including the ones only the config UI uses
+
+        self.ch_color: str = "red"
+        self.ch_border_color: str = "black"
+        self.ch_size: int = 8
+        self.ch_border_thickness: int = 0
+        self.ch_img: Optional[str] = None
+        self.ch_tint: bool = False
+        self.ch_markers: list[dict] = []
+        self.load_settings()
+        self._setup_window()
+
+        self.crosshair = QLabel(self)
+        self._build_crosshair()
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.crosshair, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.setLayout(layout)
+
+        self.marker_layer = MarkerLayer(self, self.crosshair)
+        self.marker_layer.setGeometry(self.rect())
+        self.marker_layer.lower()
+        self.marker_layer.set_markers([Marker.from_dict(m) for m in self.ch_markers])
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save_settings)
+
+        self.config_ui = QProcess(self)
+        self.config_ui.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedChannels)
+
+        self.server = CommandServer(self)
+        self.server.command_received.connect(self.handle_command)  # Listening is started by main.py
+
+        self.tray_icon = QSystemTrayIcon(self)
+        self.tray_icon.setIcon(icon("holy_sight", self.icon_root))
+        self.tray_icon.setToolTip("HolySight")
+        self.tray_icon.activated.connect(self.tray_activated)
+
+        self.disable_move_mode(init=True)
+
+        self.tray_icon.show()
+        self.show()
+
+    def state(self) -> dict:
+        """Everything the config UI needs to show the current settings"""
+        return {**self.settings, "visible": self.isVisible(), "move_mode": self.is_move_mode}
+
+    def apply_state(self, state: dict) -> None:
+        """Apply changed `ch_*` settings, only the parts that changed are redrawn"""
+        changed = {
+            key: value for key, value in state.items() if key.startswith("ch_") and self.settings.get(key) != value
+        }
+        if not changed:
+            return
+        self.settings.update(changed)
+        for key, value in changed.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+
+        if any(key in changed for key in LOOK_KEYS):
+            self._build_crosshair()
+        if "ch_opacity" in changed:
+            self.setWindowOpacity(self.ch_opacity)
+        if "ch_markers" in changed:
+            self.marker_layer.set_markers([Marker.from_dict(m) for m in self.ch_markers])
+        self._save_timer.start()
+
+    def handle_command(self, command: dict) -> None:
+        """Run a command forwarded from the command line or sent by the config UI"""
+        if "preset" in command:
+            self.apply_preset(command["preset"])
+        if "state" in command:
+            self.apply_state(command["state"])
+        if "size" in command:
+            self.apply_state({"ch_size": command["size"]})
+        if "move_mode" in command:
+            self.enable_move_mode() if command["move_mode"] else self.disable_move_mode()
+        if command.get("center"):
+            self.center_window()
+        if command.get("toggle"):
+            self.set_crosshair_visible(not self.isVisible())
+        if "visible" in command:
+            self.set_crosshair_visible(command["visible"])
+        if command.get("sync"):
+            self.server.respond({"state": self.state()})
+        if command.get("quit"):
+            self.exit_app()
+
+    def apply_preset(self, name: str) -> None:
+        path = os.path.join(os.path.dirname(self.settings_path), "presets", f"{os.path.basename(name)}.json")
+        try:
+            with open(path, "r") as f:
+                self.apply_state(json.load(f))
+        except FileNotFoundError:
+            logging.warning(f"Preset not found: {path}")
+        except Exception as e:
+            logging.error(f"Failed to apply preset {name}: {e}")
+
+    def set_crosshair_visible(self, visible: bool) -> None:
+        if visible:
+            self.show()
+            self.raise_()
+        else:
+            self.hide()
+
+    def open_config_ui(self) -> None:
+        """Start the config UI process, unless it is already open"""
+        if self.config_ui.state() != QProcess.ProcessState.NotRunning:
+            return
+        self.config_ui.start(sys.executable, config_ui_arguments())
+
+    def tray_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
+        """Handle system tray click events"""
+        if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
+            self.set_crosshair_visible(not self.isVisible())
+        elif reason in (QSystemTrayIcon.ActivationReason.Trigger, QSystemTrayIcon.ActivationReason.Context):
+            self.open_config_ui()
+
+    def disable_move_mode(self, init=False) -> None:
+        super().disable_move_mode(init)
+        if not init:
+            self._save_timer.start()  # Keep the new position
+
+    def exit_app(self) -> None:
+        self._allow_close = True
+        QApplication.quit()
+
+    def _build_crosshair(self) -> None:
+        state = CrosshairState(
+            self.ch_color, self.ch_border_color, self.ch_size, self.ch_border_thickness, self.ch_img, self.ch_tint
+        )
+        default_renderer().apply(self.crosshair, state)
+
+    def load_settings(self) -> None:
+        try:
+            with open(self.settings_path, "r") as f:
+                self.settings = json.load(f)
+
+            self.ch_color = self.settings.get("ch_color", "red")
+            self.ch_border_color = self.settings.get("ch_border_color", "black")
+            self.ch_size = self.settings.get("ch_size", 8)
+            self.ch_opacity = self.settings.get("ch_opacity", 1.0)
+            self.ch_border_thickness = self.settings.get("ch_border_thickness", 0)
+            self.ch_img = self.settings.get("ch_img", None)
+            self.ch_tint = self.settings.get("ch_tint", False)
+            self.ch_pos_x = self.settings.get("ch_pos_x", None)
+            self.ch_pos_y = self.settings.get("ch_pos_y", None)
+            self.ch_markers = self.settings.get("ch_markers", [])
+        except FileNotFoundError:
+            logging.warning("Settings file not found. Using default values.")
+        except Exception as e:
+            logging.error(f"Failed to load settings: {e}")
+
+    def save_settings(self) -> None:
+        self._save_timer.stop()
+        self.ch_pos_x, self.ch_pos_y = self.pos().x(), self.pos().y()
+        self.settings.update(ch_pos_x=self.ch_pos_x, ch_pos_y=self.ch_pos_y)
+
+        try:
+            with open(self.settings_path, "w") as f:
+                json.dump(self.settings, f, indent=4)
+        except Exception as e:
+            logging.error(f"Failed to save settings: {e}")
+
+    def closeEvent(self, event):
+        """Save the settings, the overlay only closes through `exit_app`."""
+        if self._allow_close:
+            event.accept()
+            self.save_settings()
+            self.keep_on_top.stop()
+        else:
+            event.ignore()
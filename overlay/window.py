@@ -0,0 +1,132 @@
+import sys
+from typing import Optional
+
+from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtCore import Qt, QPoint, Signal
+
+from core.icon_cache import icon, RESOURCE_PREFIX
+from core.topmost import KeepOnTop, StackingSource, default_stacking_source
+
+SETTINGS_PATH = "./config/settings.json"
+
+
+class OverlayWindow(QWidget):
+    """
+    Frameless, always-on-top, click-through window holding the crosshair, with the move mode to drag it around.
+
+    Subclasses create `crosshair`. Nothing here depends on the tray menu or the feature modules, so the split overlay
+    process stays small. `keep_on_top` raises the window again when another one covers it, from the platform's
+    stacking events or a given `stacking_source`. Icons come from `icon_root`, the compiled resources by default.
+    """
+    move_mode_changed = Signal(bool)
+    icon_root: str = RESOURCE_PREFIX
+
+    def __init__(self, stacking_source: Optional[StackingSource] = None):
+        super().__init__()
+        self.keep_on_top = KeepOnTop(self, stacking_source or default_stacking_source())
+        self._position_restored = False
+        self._allow_close = False
+        self.is_move_mode = False
+        self.drag_position: Optional[QPoint] = None
+        self.crosshair: Optional[QWidget] = None
+
+        self.ch_opacity: float = 1.0
+        self.ch_pos_x: Optional[int] = None
+        self.ch_pos_y: Optional[int] = None
+
+    def _setup_window(self) -> None:
+        self.setWindowTitle("HolySight")
+        self.setWindowIcon(icon("holy_sight", self.icon_root))
+        self.setFixedSize(500, 500)
+        self.setWindowOpacity(self.ch_opacity)
+
+        # Remove hints and set the window to transparent
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.WindowStaysOnTopHint |
+            Qt.WindowType.Tool
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+
+    def set_click_through(self, enabled: bool) -> None:
+        """Let clicks fall through to the window below, only needed on Windows"""
+        if sys.platform != "win32":
+            return
+        import win32gui
+        import win32con
+        window_handle = self.winId().__int__()
+        ex_style = win32gui.GetWindowLong(window_handle, win32con.GWL_EXSTYLE)
+        if enabled:
+            ex_style |= win32con.WS_EX_TRANSPARENT
+        else:
+            ex_style &= ~win32con.WS_EX_TRANSPARENT  # Remove WS_EX_TRANSPARENT, so we can move the window
+        win32gui.SetWindowLong(window_handle, win32con.GWL_EXSTYLE, ex_style)
+
+    def enable_move_mode(self) -> None:
+        self.is_move_mode = True
+        self.set_click_through(False)
+        self.move_mode_changed.emit(True)
+
+    def disable_move_mode(self, init=False) -> None:
+        self.is_move_mode = False
+        self.set_click_through(True)  # Make everything click-trough
+        if not init:
+            self.move_mode_changed.emit(False)
+
+    def center_window(self) -> None:
+        screen_geometry = QApplication.primaryScreen().geometry()
+        screen_center = screen_geometry.center()
+        window_rect = self.rect()
+        window_center = window_rect.center()
+        new_position = screen_center - window_center
+        self.move(new_position)
+
+    def mousePressEvent(self, event):
+        """Start dragging if clicking on move_cursor in move mode."""
+        if self.is_move_mode and event.button() == Qt.MouseButton.LeftButton:
+            # Check if the click is within move_cursor's geometry
+            if self.crosshair.geometry().contains(event.position().toPoint()):
+                self.drag_position = event.globalPosition().toPoint() - self.pos()
+                event.accept()
+            else:
+                event.ignore()
+        else:
+            event.ignore()
+
+    def mouseMoveEvent(self, event):
+        """Move the window if dragging in move mode."""
+        if self.is_move_mode and event.buttons() & Qt.MouseButton.LeftButton and self.drag_position is not None:
+            self.move(event.globalPosition().toPoint() - self.drag_position)
+            event.accept()
+        else:
+            event.ignore()
+
+    def mouseDoubleClickEvent(self, event):
+        """Center the window on double-click within move_cursor."""
+        if self.is_move_mode and self.crosshair.geometry().contains(event.position().toPoint()):
+            self.center_window()
+            event.accept()
+        else:
+            event.ignore()
+
+    def keyPressEvent(self, event):
+        """Exit move mode on Enter or Escape key."""
+        if self.is_move_mode and event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Escape):
+            self.disable_move_mode()
+            event.accept()
+        else:
+            event.ignore()
+
+    def showEvent(self, event):
+        """Restore saved position or center window on the first show, later shows keep the window where it is."""
+        if not self._position_restored:
+            self._position_restored = True
+            if self.ch_pos_x is not None and self.ch_pos_y is not None:
+                new_position = QPoint(self.ch_pos_x, self.ch_pos_y)
+                self.move(new_position)
+            else:
+                self.center_window()
+
+        super().showEvent(event)
+        self.keep_on_top.start()
@@ -1,9675 +1,3219 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.9.0
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x17J\
+\x00\x00\x01\xe7\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6$\xc8\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x01\
-\xe0PLTE\x00\x00\x00\xaa\xaa\xaa\xbf\xbf\xbf\xcc\xcc\
-\xcc\xd5\xd5\xd5\xdb\xdb\xdb\xbf\xbf\xbf\xc6\xc6\xc6\xcc\xcc\xcc\
-\xd5\xd5\xd5\xc4\xc4\xc4\xc8\xc8\xc8\xcc\xcc\xcc\xcf\xcf\xcf\xd2\
-\xd2\xd2\xc6\xc6\xc6\xc9\xc9\xc9\xce\xce\xce\xd1\xd1\xd1\xd3\xd3\
-\xd3\xca\xca\xca\xcc\xcc\xcc\xce\xce\xce\xd0\xd0\xd0\xd1\xd1\xd1\
-\xcb\xcb\xcb\xcf\xcf\xcf\xd0\xd0\xd0\xcb\xcb\xcb\xcc\xcc\xcc\xcd\
-\xcd\xcd\xce\xce\xce\xd0\xd0\xd0\xcb\xcb\xcb\xcc\xcc\xcc\xcd\xcd\
-\xcd\xce\xce\xce\xcf\xcf\xcf\xcb\xcb\xcb\xcc\xcc\xcc\xcd\xcd\xcd\
-\xce\xce\xce\xcf\xcf\xcf\xcb\xcb\xcb\xcc\xcc\xcc\xcd\xcd\xcd\xce\
-\xce\xce\xcf\xcf\xcf\xcf\xcf\xcf\xcc\xcc\xcc\xcd\xcd\xcd\xce\xce\
-\xce\xce\xce\xce\xcf\xcf\xcf\xcc\xcc\xcc\xcd\xcd\xcd\xce\xce\xce\
-\xce\xce\xce\xcf\xcf\xcf\xcc\xcc\xcc\xcc\xcc\xcc\xcd\xcd\xcd\xcd\
-\xcd\xcd\xce\xce\xce\xce\xce\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcc\xcc\
-\xcc\xcd\xcd\xcd\xce\xce\xce\xce\xce\xce\xcc\xcc\xcc\xcd\xcd\xcd\
-\xce\xce\xce\xce\xce\xce\xcc\xcc\xcc\xcd\xcd\xcd\xcd\xcd\xcd\xce\
-\xce\xce\xce\xce\xce\xce\xce\xce\xcd\xcd\xcd\xce\xce\xce\xce\xce\
-\xce\xce\xce\xce\xce\xce\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\
-\xce\xce\xce\xce\xce\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\
-\xce\xce\xcd\xcd\xcd\xce\xce\xce\xcd\xcd\xcd\xce\xce\xce\xce\xce\
-\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\xce\xce\xce\xce\xce\
-\xcd\xcd\xcd\xcd\xcd\xcd\xce\xce\xce\xce\xce\xce\xcd\xcd\xcd\xce\
-\xce\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\xce\xce\xcd\xcd\
-\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\xce\xce\
-\xce\xce\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\
-\xce\xce\xce\xce\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\xce\
-\xce\xce\xce\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\xce\xce\
-\xce\xce\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\xce\xce\xce\
-\xce\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\xce\
-\xce\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\xce\xce\
-\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xce\xce\xce\xce\
-\xce\xce\xcd\xcd\xcd;\x98F\x88\x00\x00\x00\x9ftRN\
-S\x00\x03\x04\x05\x06\x07\x08\x09\x0a\x0c\x0d\x0e\x0f\x10\x11\
-\x12\x13\x15\x16\x17\x18\x19\x1a\x1b\x1c\x22%&'()\
-*+,-./0123456789\
-:;<=>?@ABCDJKUVW\
-XYegjkmnop\x81\x82\x83\x84\x85\x86\
-\x87\x88\x8a\x8c\x91\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f\xa0\
-\xa2\xa6\xa7\xaa\xab\xad\xae\xaf\xb0\xb1\xb2\xb3\xb5\xb6\xc1\xc4\
-\xc6\xc7\xc8\xca\xcc\xd0\xd1\xd2\xd3\xd4\xd5\xd7\xd8\xdc\xdd\xde\
-\xdf\xe0\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xeb\xec\xed\xee\
-\xef\xf0\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xfb\xfc\xfd\xfe\
-vk\xc7\x0c\x00\x00\x00\x09pHYs\x00\x00\x0e\xc3\
-\x00\x00\x0e\xc3\x01\xc7o\xa8d\x00\x00\x14HIDA\
-Tx^\xed\xdd\xff\x7fT\xd5\x9d\xc7\xf1\xd1\x22\x94E\
-\xe2JA\x5c\x5c\x81\x05\x93\x80\x80\x0b\x94X\xba\xdb\xfa\
-\x0dtk\x8b\xf5K\xad\x02\x02\xbb\xf2\xa5`\xd7V\xa4\
-\xdd\x05\xb5%\x05V!AL\x02\x896@r\xff\xd5\
-}L\xc6\xc9\xcc\xbc\xe6\xde\x99{&s\xcf=\xe7\xc3\
-\xfb\xf9\xe3\xdc\xf7M\xee\xdc\xf7g\xbe\xdf\x99[\xa9\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x98\
-\xf1\xf0O\xdf\xf8\xf8\x8b/\xbf\xfc\xfc\xe3C\xfb\x1f\xe6\
-21\xef\xc9\xb7n$\x8bn\xbc\xb5\x9e\xcb\xc5\xb4\x15\
-o|\xd7\xa8\xbf\xea\xbbC+\x98\x11\xbb6\x7f\xd6Z\
-\x7f\xd5\xa5ML\x89U#\x13l\xbfjb\x849\xb1\
-i\xef\x1dv_3\xb3\x9fI\xb1(\xab\x7fM\xc0\x83\
-!\xbb\x7fM\xc0\x83\xa0S\xff\x9a\x00\xfb:\xf7\xaf\x09\
-\xb0\xae[\xff\x9a\x00\xdb\xba\xf7\xaf\x09\xb0,O\xff\x9a\
-\x00\xbb\xf2\xf5\xaf\x09\xb0*o\xff\x9a\x00\x9b\xf2\xf7\xaf\
-\x09\xb0\xc8\xa5\x7fM\x80=n\xfdk\x02\xacq\xed_\
-\x13`\x8b{\xff\x9a\x00Kz\xe9_\x13`Go\xfd\
-k\x02\xac\xe8\xb5\x7fM\x80\x0d\xbd\xf7\xaf\x09\xb0`)\
-\xfdk\x02\xe2\xb7\xb4\xfe5\x01\xb1[j\xff\x9a\x80\xb8\
--\xbd\x7fM@\xcc\xfa\xd1\xbf& ^\xfd\xe9_\x13\
-\x10\xab~\xf5\xaf\x09\x88S\xff\xfa\xd7\x04\xc4\xa8\x9f\xfd\
-k\x02\xe2\xd3\xdf\xfe5\x01\xb1\xe9w\xff\x9a\x80\xb8\xf4\
-\xbf\x7fM@L\x8a\xe8_\x13\x10\x8fb\xfa\xd7\x04\xc4\
-\xa2\xa8\xfe5\x01q(\xae\x7fM@\x0c\x8a\xec_\x13\
-\x10\xbeb\xfb\xd7\x04\x84\xae\xe8\xfe5\x01a+\xbe\x7f\
-M@\xc8|\xf4\xaf\x09\x08\x97\x9f\xfe5\x01\xa1\xf2\xd5\
-\xbf& L\xfe\xfa\xd7\x04\x84\xc8g\xff\x9a\x80\xf0\xf8\
-\xed_\x13\x10\x1a\xdf\xfdk\x02\xc2\xe2\xbf\x7fM@H\
-Ff\xd8\x8e\x0f3:\xbf@ \x86\xa6\xd8\x8d\x1fS\
-\xc3\xdc\x12)\xc3\xeaQ6\xd3\xc1W\xbc\x80\xba\x06\x9a\
-\x8c\x0ep[\xa4\x04\xc7\xd9K\x07\xd77\xf2\x12\xdax\
-\x9d\x97tp\x82\xdb\x22\xfe\xed\x98g-\xd9nl\xaa\
-\xf0\x22\xaalj:\x9d\x5c7\xf3;\xb85\xe2\xdd\x19\
-\xb6\x92mls\xa5\xfb\x00T6\x8f\xf1\xb2l\x1fq\
-k\xc4\xb7u\xf7YJ\xa6\xf1-\x95<\x03Py:\
-\xff\xa3\xc0\xdc\x93\xdc\x1e\xf1\xec ;\xc9\xb4\xd0\x7f\x9e\
-\x01\xa8l\x19\xe7\xa5\x99^\xe3\xf6\x88g\xa7XI\x96\
-\x9b[\x17\xf2\xbc\x98\x16B[o\xf2\xe2,g\xb19\
-\xe2\xdb%V\x92ab[-\xcf\xcb\xa9\x96z&\xef\
-\x04\x8c\xb6l\x8c\xf8\xf75+Iwk\xe8\xfb<\x17\
-\xd0\xf7\xb1\xa1[\x5c\x90nN'\x1e/\xd7\xb2|/\
-\x02'\x9e\xad\xaf\xc0%T\xcf\x0d\xe6\x9c,\xbd\x17T\
-\xae|\x030\xb9\xd8\x7f\xee\x01\xa8\x0c\xe6\xbb\x0f\xd0\x00\
-\x94,\xcf\x83\xf5\xc4\xf6F\x9e\xcb\xa8\x91\xdc\x9ez\x8a\
-i\xd0C@\xd9.\xb2\x92v\x93;\x9b\xf2\x5cHM\
-\xd1\xe1\x1c\xf7\x01z\x12X\xb6\x93\xac\xa4MK\xff.\
-\x03P\xd99\xc9\xa5m~\xd7\x9c\x97\x12\x1c`%4\
-\xb5\xab%\xcf\xc5\xd4\x12\xde\xd5\xf5\x83\xe6W[\xf2\xe2\
-\xdf\x9a{\xec\xa4\xd5\xf4\x8f[\xf3\x5cN\xad\xe9\xe7\xba\
-L\x80\xde\x0a.\xdfi\x96\xd2\xe2\xf6n\xc4\x19 \xc4\
-w\xdff\xa0\xc59\xc4\xc5\xbf\xed\x9d^\x08\xde\xd9\xc3\
-8\x13\xc4\xfc\x9eN\x87\x1b\xce7^^Ji\x8e\xb1\
-\x96\x86\xe9\xbd\x0c;\x0f@e\xef4#\x0d\xc7\x18\x96\
-\x12\xac\xbe\xcc^\xeaf\x9eg\xb6\x87\x01\xe8p\x1fp\
-\xe51f\xa5\x0c\x83\x19\xcf\xd4R\x0f\xdbe\x88\x98\xef\
-p\xd0\xf1\xd4 \x93R\x8e}\xa9\x130\x99\xd6\x7f/\
-\x03P\x19I\xfd\xfbS\xfb\x98\x93\xb2\x0c\xfe\x95\xed$\
-\xc9_j\x9f\xff\x13c\xc4\xfc\x82\xe1\xbf1\x96$\x97\
-u\xfb\x0f\xc8\xa3G\xe7Z\xeb\x99;\xbc\x8a\x99\x9a\xd6\
-X;\xe6k\x06N\xe0\xb5\xc6\xfc\xb1\xd5\xccH\xa9\x86\
-O5\x1d\x1cx\xefd\xfd\xe3\xff6\xcd-\xa6a\xbe\
-n\xc7GM#6wN\xaf\xff\xc2\xb3\xe6\x95\x0f\xbf\
-\x98M\x92\xd9/\xfe\xeb\xe5\xc7\xb9\xac\xa1\xb9\xec4\xcc\
-7\xac\x7f\xed\xec\xe8\x5c\x92\xcc\x8d\x9e}u=\x97I\
-(~\xf8C^\x02,\x9c\x98o\xf5\xd0\xc0\xc0C\xbc\
-L\xa2\xc2\xc2\x89y1\x86\x85\x13\xf3b\x0c\x0b'\xe6\
-\xc5\x18\x16N\xcc\x8b1,\x9c\x98\x17cX81/\
-\xc6\xb0pb^\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89y1\
-\x86\x85\x13\xf3b\x0c\x0b'\xe6\xc5\x18\x16N\xcc\x8b1\
-,\x9c\x98\x17cX81/\xc6\xb0pb^\x8ca\
-\xe1\xc4\xbc\x18\xc3\xc2\x89y1\x86\x85\x13\xf3b\x0c\x0b\
-'\xe6\xc5\x18\x16N\xcc\x8b1,\x9c\x98\x17cX8\
-1/\xc6\xb0pb^\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89\
-y1\x86\x85\x13\xf3b\x0c\x0b'\xe6\xc5\x18\x16N\xcc\
-\x8b1,\x9c\x98\x17cX81/\xc6\xb0pb^\
-\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89y1\x86\x85\x13\xf3b\
-\x0c\x0b'\xe6\xc5\x18\x16N\xcc\x8b1,\x9c\x98\x17c\
-X81/\xc6\xb0pb^\x8ca\xe1\xc4\xbc\x18\xc3\
-\xc2\x89y1\x86\x85\x13\xf3b\x0c\x0b'\xe6\xc5\x18\x16\
-N\xcc\x8b1,\x9c\x98\x17cX81/\xc6\xb0p\
-b^\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89y1\x86\x85\x13\
-\xf3b\x0c\x0b'\xe6\xc5\x18\x16N\xcc\x8b1,\x9c\x98\
-\x17cX81/\xc6\xb0pb^\x8ca\xe1\xc4\xbc\
-\x18\xc3\xc2\x89y1\x86\x85\x13\xf3b\x0c\x0b'\xe6\xc5\
-\x18\x16N\xcc\x8b1,\x9c\x98\x17cX81/\xc6\
-\xb0pb^\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89y1\x86\
-\x85\x13\xf3b\x0c\x0b'\xe6\xc5\x18\x16N\xcc\x8b1,\
-\x9c\x98\x17cX81/\xc6\xb0pb^\x8ca\xe1\
-\xc4\xbc\x18\xc3\xc2\x89y1\x86\x85\x13\xf3b\x0c\x0b'\
-\xe6\xc5\x18\x16N\xcc\x8b1,\x9c\x98\x17cX81\
-/\xc6\xb0pb^\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89y\
-1\x86\x85\x13\xf3b\x0c\x0b'\xe6\xc5\x18\x16N\xcc\x8b\
-1,\x9c\x98\x17cX81/\xc6\xb0pb^\x8c\
-a\xe1\xc4\xbc\x18\xc3\xc2\x89y1\x86\x85\x13\xf3b\x0c\
-\x0b'\xe6\xc5\x18\x16N\xcc\x8b1,\x9c\x98\x17cX\
-81/n\x96-\xe3%\x81a\xe1\xc4|`B\xde\
-\xbf\xeb\x0e\x9e\xbat3I\xc6/\x9e<\xb0\x96\xcb\xc2\
-1\xcb\xc6[\xfd\x9d\xf9p\x04\xbe\x7fw\x9c\xb9\xdf\xd8\
-\x8d\xf7Oo\xe7\xf2P\xdcl\xae\xbb\xdd\x18\xf3\xa1\x08\
-|\xff\xae>>\xdf\xbc\x1b\x93d\xfe\xd8\xa3\xcc\x84\xe1\
-B\xebv\xd2y\xe6\xc3\x10\xfa\xfe\x1d\x1am\xdd\xbc\xaa\
-\xcb\x83L\x05\xe10\xb7\xb3\xd5{\xcc\x07!\xf4\xfd;\
-2\xc5\xad\xab\x9a\xda\xc7\x5c\x08^\xe4f\xb6\xfa\x19\xf3\
-!\xd8\x97\xbe\x7fG\x98+\xcbOf\xb8m5S\x01\
-\xcd\xe8\xa2\x95\xd3\xdc\xccf\xd3+\x99\x0f\xc0Pj\xff\
-I2\xf3\x13&\xcb\xb1\xf7\x0e\xb7\xac\xee\xca\x00\xb3\x01\
-8\xca\xadlv\x98\xe9\x00\xac\xbe\xcc\xad\xac\x9b\xd9\xcf\
-l\x19\xb2n\xffUG\x19\x0e\xc0\x86\xbb\xdc\xca\x86\xd9\
-\x7fb:\x00\xc7\xb9\x95\x0d!\xdc\x07t\xea?\x99\x1b\
-f<\x00os+\x1b\xded6\x00;\xf0\xfc\xbfE\
-\xf9\x13\xd0\xb1\xff$9\xc5|\x00\x96\x9f\xe7V\xd6}\
-\xf2\x08\xb3\x018\xc3\xadlQ\xf6\x04d?\xfe\xd7\xdc\
-\xff\x11\xd7\x08\xc0\xda\xab\xdc\xcc\x9a/\xd73\x19\x80u\
-M\xef\xff\xa4)\xf7y@\x97\xdb\x7f\x92$\xafp\x95\
-\x10l\xbd\xc6\xcd\xac\xba\xba\x85\xb9\x10\x1c\xe4fR\x99\
-\xf7\x01\xdd\xfbO>\xe4:Ax\xfc\x0f\xdc\xce$\xf9\
-$\xc47\xd8+\x95S\xdc\xce6\xe5M@\xb7\xfb\xff\
-\xaa\xcf\xb9R\x18\x1ey\x1do\x07\xcc\xfe:\xc4\xc7\xff\
-J\xa5r\xa9u;\xd3\x94\xf5(\x90\xe3\xf6\x9f$\xb3\
-\x5c+\x14k\xdfm\x1a\x81\xe9\xf7C|\xfd\xb7\xe0V\
-\xf3\xde\xccP\xce\x04\xe4\xb9\xfd'I\xb2\x82\xeb\x05c\
-\xe5\x0b\xef}:6;;\xf6\xe9o\x7f\x1e\xe2\xfb\x7f\
-5\xcb:\xbd\x08\x5cT\xc6\x04\xe4\xec?Y\xce\x15\xc5\
-E\xbe\x01(a\x02r\xdd\xff\x87}\x80E\x1c\xba\x1c\
-\xbfP\xe7{\x02\xf2\xde\xfeC}\x12\x18\x8f\x8b\xdc\xa3\
-\x19\xfcN@\xde\xdb\x7f\xa8/\x03#r\x92{4\x8b\
-\xcfW\x83\xf9\xfbO^\xe6\xba\xe2\xe6\x00\xf7h&\x7f\
-\x13\x90\xfb\xfe?I\xee\xad\xe1\xca\xe2f\xcd=\xee\xd3\
-L\xbe\x1e\x05\x1cn\xff\xc9I\xae,\xaeNs\x9ff\
-\xf3s\x1f\xe0\xd2\xff\xdc\x10\xd7\x16W\xdb\xf3\xbd\x10\x5c\
-\xe0c\x02\x5c\xfaO\x8epmqw\x8c{\xb5\x83\xe2\
-'\xc0\xe1\xf1?I\xfe\x1a\xd4\xa1\xcb\xb1\xca>$,\
-E\xd1\xcf\x03\x9cn\xff\x93[\xb9\xba\xf4b0\xe3\xa0\
-\xd0T\xc5\xde\x078\xf5?\x13\xcca\xcb\xb1\x1bq\xda\
-\xed\x05N\x80\xd3\xfd\x7f\x91\x1b\xf2\xa0q\xdb\xf1\x85=\
-\x0a\xb8m\x86\xfa\xef\xa3=\xb7\xb9\x7f;(j\x02\x9c\
-\xfa\x9f~\x9e\xab\xcbR\xec.\x7f\x02\xdc\xfa\xd7\xe3\x7f\
-\x9f\x95>\x01\xea\xbfd\xff\xea\xf4Z\xa0\xef\x13\xe0\xd6\
-\x7f\x90_\x0b\x8d\xddseN\x80S\xff\x93\xbb\xb8\xba\
-\xf4\xc3\xb6o\xb8\xa7;\xe8\xef\x04\xa8\xff l\xcbs\
-\x84h]?'\xc0\xad\xff\x9d\x5c]\xfae\xb8\x9c\x09\
-p\xea\x7fb\x07W\x97\xfe\x19\xfa\x9a\xfb\xbb\x83~M\
-\x80\xfa\x0fH\x09\x13\xe0\xd6\xff\xb3\x5c]\xfak\xd0\xf7\
-\x048\xf5\xffMh\xbf^f\xd0`\xce\x03\xc5\x17,\
-}\x02\xd4\x7fp\x9e\xf19\x01N\xfd\x8f\xeb\xf3\x7f/\
-6^\xe7\x9e\xef`i\x13\xe0\xd6\x7f\x90\xdf\xaf\xb7\xc8\
-\xdb\x048\xf5?\xa6\xfe\xbdy\xfa+\xee\xfd\x0ez\x9f\
-\x00\xb7\xfe\xff\x85\xabKq\xbcL\x80\xfa\x0f\xd8?\x7f\
-\xc9\x06:\xe8m\x02\x9c\xfa\xbf\xb1\x99\xabK\xb1\x0a\x9f\
-\x00\xa7\xe3?Ktw\xfc\xc2\xe1\x17\xff\x81[\xef\xc3\
-\xaa\x97\x8e\x5c\x18\xef\xf0\xab\x93!q?@/\x96\xfe\
-kf\x8en\xe0\x15(\xdaS\x1f\xc4\xb5\x87\x1c' \
-\xae\xfe\xabw\x04o{\xfd)\x92\x15\xef\xe4\xff\xcef\
-\x18\xdc&\xc0\xe9\xf1?\x10\xe7\xd7\xf1Z\x14gC\xde\
-\x9fm\x08\x88\xcb\x048}\x11!\x18\xd7\xbc\xbd\x119\
-4\xce\xff\x1d\x83\xfc_\xd4\xd9<\xc9u\xe3p\xcd\xd3\
-O=n\x88\xb2\xff$\x99\xd8\xc4k\x92n\xf9\xffr\
-\xcdX\xfc\xc9\xcbo\xd2-\xff3\xffo,>\xcb\xb7\
-\x7f\xde\xe0z\xf1x\x9d\xd7\xa5\x08\xef\xf0\xbf\xc6\xe3\x10\
-\xafK\x9a'\xbf\xe3j\xf1\xb8\xe3\xe1A\xe0\xa9\xd8\x9e\
-\xff7\xf96\xcf\xef\xa1\xbf\xc5\xb5b\xf2.\xafM\xff\
-}\xc0\xff\x19\x93\x1cg\xc4x\xf8\x06W\x8a\xc9t\xe1\
-\xef\x09\xae\x8a\xf2\x15R\xdd\xd8\xc3\xbc>m~\xcau\
-\xe2\xf2\x02\xafO\xbf\xbd\xc4\xff\x18\x97\xee\xdf\xd9\x8d\xf8\
-)`\xd5\xfb\xbc>\xfdv\x84\xff1.\xbf\xe2\xf5i\
-\xf31W\x89K\xe1\xa7~\xedr\xea\xd9\xd0\xfd\x9e\xd7\
-\xa7\xcd\xe7\x5c%.\x85\x9f\xfc\xd9\xe5\x88\xcc\x00}\xc6\
-\xeb\xd3\xc6\xe5P\x93\x00\x15\xfe\xeb\xe4]N?\x1f\xba\
-\xff\xe3\xf5i\xa3\x01\xe8,\xf2\x01\xb8\xc6\xeb\xd3F\x0f\
-\x01\x9dE\xfe\x10p\x89\xd7\xa7\xcd\x7fs\x95\xb8\xe8I\
-`g\x1f\xf1\xfa\xb4\x89\xfce\xe0{\xbc>\xfdv\x98\
-\xff1.\xbf\xe4\xf5i\xb3\x9f\xab\xc4\xe5g\xbc>\xfd\
-\xf6\x22\xffc\x5c\xba\x1f\x13\x10\xf9[\xc1\x85\x9f\xffk\
-%N8\x18\x97\x1co\x05\xc7\xfda\xd0a^\x9b\xfe\
-;\xca\xff\x19\x93\x1c\x1f\x06U\xd6G\xfcq\xf0\xac\x87\
-\xf3?n\x88\xe4H\xf04\xdf>\xc1k\x93\xe6\x10W\
-\x8bG\x9e\x01_\xb2\xb7\xf9_\xe3\xd1\xfd\x93\x80\xaaG\
-\xfe\x87\xeb\xc5\xe2\x13/\xe7\xff]~\x9e\xff7\x169\
-\x0f\x09\xabl\x9a\xe0\x9aq\xb8\xea\xe1x\xa0\xaau\xa9\
-g\x9f\x0f\xdf\xc4F^\x93,q\x1e\x16~\xd5\xdb\xf7\
-\xd3\xb7F9\x01\xf9\x0f\x0b\x8f\xf3\x8b!\x9fx\xba\xfd\
-W=\xfe\x07\xfe\xf7\xf0\xb9}A4\xba\xaf\x86\xcd\xfe\
-\xda\xcb\xe3\x7f\xdd#\xaf\xc7\xf6v\x80\xcb\x17\x83\xaa\xe2\
-\x9a\x80\xe9\xf7=\xbc\xfek\xb5\xf6\xdd\xa8F\xc0\xb5\xff\
-x&`v\xec\xd3\xdf\xfe\xbc\xf0\xf7\xff\xd2\xac|\xe1\
-\xbdO\xc7\x22\xf9t\xd8\xbd\x7f\xc7\xe7\x01\xfa\x81\x08\xdf\
-\x0a\xff\x81\x08\xc7\x09\xd0O\xc4\xf8\xe5\xa1\x7f\xd7\x09\xf0\
-\xf6\x22L<\xfdH\x94\xe3\x04\xe8g\x02\xfd\xf1\xd4\xbf\
-\xeb\x04x\xfb~\xfe\x83\xce\xdb\x0fE:N\xc07\xdb\
-\xb8\xba\x14!\xdc\x1f\x0b\xd6\x8fE\xfb\xe0\xb5\x7f\xc7\x09\
-\xd0\xe9\x02\x8a\xe7\xf9\xe7\xe25\x01\x81\xf1~\xc2\x08\xd7\
-\x09\xd0)c\x0aU\xc2)c\x1c'@'\x0d+R\
-\x0c\xa7\x0d\xd3\x04\x14\xa7\xa4\xfe]'@'\x8e,H\
-i'\x8et\x9c\x80\xa9\xe7\xb8\xba\xf4C\x89\xa7\x8eu\
-\x9c\x00\x9d<\xba\x08Q\x9d>\xdc\xe1\xf03\xc9\xa7\xe4\
-\xfe]'\xa0\xfb\x8f\x11\x89\x93\xdd\xb7\xb9\x8f;(\xa2\
-\x7f\xc7\x09\x98\xd1\x04\xf4\xd5\x9e\xf2\xfbw\x9d\x80\x1e\x0e\
-B\x92,A\xf4\xef:\x01\x85m\xc6\x83'\x98\x1d\xef\
-t\xa4\xa8\xcb\x17\x11\xa4\x13\xa7/\xea\x14{\xd7\xeb4\
-\x01S\xc3\x5c]z\xb1\xcd\xe9\xfe\xbf\xd0\xfe\x1d\xef\x8c\
-\xae\xfe#W\x17w\x03\xa3\xdc\xaf\x1d\x14y\xff_\xe3\
-t\x1fp\x82k\x8b\xbb\xff\xe4^\xed\xa0\xe8\xdb\x7f\x95\
-\xcb\x04\xcc\xeb\xc3\xe1%\xdb5\xcf\xbd\x9a\xcdG\xffn\
-\x13\xd0\xfdW\xc9\xa4\x8b\xdfs\x9ff\xf3\xd3\xbf\xd3\xf3\
-\x80\xb9'\xb9\xb2\xb8Y\x7f\x9f\xfb4S\xf1\x8f\xffu\
-\x0e\xf7\x01\xafq]q\xf3\x0b\xee\xd1L\xben\xffU\
-\xf9'\xe0,W\x157\xe7\xb8G\xb3\xf8\xec\xdf\xe1Q\
-`\x94k\x8a\x9b\xab\xdc\xa3\x19\xfc\xdd\xff\xd7\xe4\xbd\x0f\
-\x98\xcb\xf1\xcb\x84\x92\xed\x07s\xdc\xa3\xe9\xfc\xde\xfe\xab\
-\xf2\xde\x07\x0cpEq\xf1\x18\xf7g:\xdf\xb7\xff\xaa\
-\x9c\x13\x10\xee\x00\xacz\xe9\xc8\x85\xf1\xbbw\xc7/\x1c\
-~\xb1\xf0s\x8d\xf5,\xdf\x00\x94\xd1\x7f\xceG\x81`\
-\x1f\x02\x9e\xfa\xa0i\xf3g\x8en\xe0\xf2@\xe4z\x08\
-\xf0\x7f\xff_\x93\xe7> \xd0'\x81+\xde\xc1\xf9?\
-\xef\xbe\xbd\x9c\x990\x5ci\xdd\xce4\xe5\xdc\xfe\xabr\
-\xdc\x07\xfc\x8e\xeb\x04a\xc3Eng\x92\x9c_\xc7T\
-\x10\xcer;\xdb\x94u\xfb\xaf\xea>\x01\xafr\x95\x10\
-\x0c\xa5\x9e\xff\xfdZ\x90\xbfo\xf0\x1f\xdcL*\xb3\xff\
-\xee\x8f\x02A\xbe\x15\xbc!\xb5\xff$\xb9\xe6\xf1\xa7&\
-s{\xa2\xcb[\xc1\xe5\xdd\xff\xd7t\xb9\x0f8\xc7|\
-\x00\x96\xff\x99[Y\xf7\xa7\x9c?\xa6\xecU\xe7\xb7\x02\
-\xcb\xbd\xfdWu\x9c\x80\xf9\x10\xbf-\xfe\x0e\xb7\xb2\xe1\
-uf\x03\xb0\xb3\xd3\xc7\xc1\xe5\xf7\xdfy\x02\x8e1\x1c\
-\x80\xa7\xf0\xfc\xbf\xd9\x9d\x10\x1f\x04Np+\x1bB\xe8\
-\xbf\xd3\xf3\x80+\x8f1\x1b\x80\x0f\xb8\x95\xcd\xdee:\
-\x00\xab/s+\xeb\xca~\xfc\xaf\xcb\xba\x0f\x98\x1ad\
-2\x00\xab26\xb6f:\xc4\xf7\x04\x872\xbe\x14\x16\
-\xc6\xed\xbfj$u\x0b\xa7\x82\xfc\x8a\xe8K\xdc\xccV\
-/0\x1f\x82}\xe9\xfb7\xa0\xc3\xee\x87\xff\xc6\xadK\
-\x92\xcb!\xde\xfe+\x95#\xdc\xceV\xef3\x1f\x84\xf0\
-\xf7\xef\xc0\x09<W\x9d?\xb6\x9a\x990t9\xf5k\
-\xe1\xa7\x9e\xedM\x04\xfbw\xc7GM\x1f[\xcc\x9d\x0b\
-\xf1\xf5\xdf\x82.?\xb2V\xf8\xc9\xa7{\x15\xc1\xfe]\
-\xff\xda\xd9\xd1\xb9$\x99\x1b=\xfb\xeaz.\x0bG\x97\
-\x1f\xf8/\xfc\xf4\xf3\xbd\x8bb\xff>40\xf0\x10/\
-\x0b\x0b\x1b'\xe6\xc3\x12\xfe\xfe\x0d\x1e\x0b'\xe6\xc5\x18\
-\x16N\xcc\x8b1,\x9c\x98\x17cX81/\xc6\xb0\
-pb^\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89y1\x86\x85\
-\x13\xf3b\x0c\x0b'\xe6\xc5\x18\x16N\xcc\x8b1,\x9c\
-\x98\x17cX81/\xc6\xb0pb^\x8ca\xe1\xc4\
-\xbc\x18\xc3\xc2\x89y1\x86\x85\x13\xf3b\x0c\x0b'\xe6\
-\xc5\x18\x16N\xcc\x8b1,\x9c\x98\x17cX81/\
-\xc6\xb0pb^\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89y1\
-\x86\x85\x13\xf3b\x0c\x0b'\xe6\xc5\x18\x16N\xcc\x8b1\
-,\x9c\x98\x17cX81/\xc6\xb0pb^\x8ca\
-\xe1\xc4\xbc\x18\xc3\xc2\x89y1\x86\x85\x13\xf3b\x0c\x0b\
-'\xe6\xc5\x18\x16N\xcc\x8b1,\x9c\x98\x17cX8\
-1/\xc6\xb0pb^\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89\
-y1\x86\x85\x13\xf3b\x0c\x0b'\xe6\xc5\x18\x16N\xcc\
-\x8b1,\x9c\x98\x17cX81/\xc6\xb0pb^\
-\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89y1\x86\x85\x13\xf3b\
-\x0c\x0b'\xe6\xc5\x18\x16N\xcc\x8b1,\x9c\x98\x17c\
-X81/\xc6\xb0pb^\x8ca\xe1\xc4\xbc\x18\xc3\
-\xc2\x89y1\x86\x85\x13\xf3b\x0c\x0b'\xe6\xc5\x18\x16\
-N\xcc\x8b1,\x9c\x98\x17cX81/\xc6\xb0p\
-b^\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89y1\x86\x85\x13\
-\xf3b\x0c\x0b'\xe6\xc5\x18\x16N\xcc\x8b1,\x9c\x98\
-\x17cX81/\xc6\xb0pb^\x8ca\xe1\xc4\xbc\
-\x18\xc3\xc2\x89y1\x86\x85\x13\xf3b\x0c\x0b'\xe6\xc5\
-\x18\x16N\xcc\x8b1,\x9c\x98\x17cX81/\xc6\
-\xb0pb^\x8ca\xe1\xc4\xbc\x18\xc3\xc2\x89y1\x86\
-\x85\x13\xf3b\x0c\x0b'\xe6\xc5\x18\x16N\xcc\x8b1,\
-\x9c\x98\x17cX81/\xc6\xb0pb^\x8ca\xe1\
-\xc4\xbc\x18\xc3\xc2\x89y1\x86\x85\x13\xf3b\x0c\x0b'\
-\xe6\xc5\x18\x16N\xcc\x8b1,\x9c\x98\x17cX81\
-/\xc6\xb0pb^\x8ca\xe1\xc4\xbc\xc4e\xd92^\
-\x02,\x9c\x98\x87\xae\x7f_J\xb3\xee\xe0\xa9K7\x93\
-d\xfc\xe2\xc9\x03k\xb9\xac\x81\x85\x13\xf3\x0d\xf9\xfe\xbe\
-\x94d\xc7\x99\xfb\x8d\x16\xef\x9f\xde\xce\xe5u\xcde\xa7\
-a\xbe.\xef\xdf\x97R\xac>>\xdf\xdcb\x92\xcc\x1f\
-{\x94\x99\x9a\xd6X;\xe6k\xf2\xff})\xc3\xd0h\
-k=U\x97\x07\x99Z\xc0\x181\xbf\xc0\xe1\xefK\x09\
-\xf6M\xb1\x9d\xaa\xa9\x11\xe6\xaa\x98\x22\xe6\xabF\xd2\xff\
-\xfe>\xe6\xa4\x1cC\xa9\xfd$\xc9L\xda\x040D\xcc\
-W\xfb\x9fa\xa8fJ\xf7\x01AX}\x99\xcd\xd4\xcd\
-<\xcfl/\x03\xb0\xe7\x0e3uW\x06\x98\x95\x12\x1c\
-g/\x0d\xd3{\x19v\x1f\x80\xbd\xd3\x8c4\x1ceX\
-\xfc\xdb\x81\xe7\xe7-\xee\xeca\x9c\x09b>\xfb\xf6\x9f\
-$\xc9\xdc0\xe3\xe2\xdd\x19\xb6\xd2\xe2\xf6n\xc4\x19 \
-\xc4w\xdff\xa0\xc5)\xc4\xc5\xbbuM\xef\xcf\xa4\x99\
-\xfeqk\x9e\xcb\xa95\xfd\x5c\xc6\xf3\xcb\xba\xfb?j\
-\xcd\x8bw\x07\xd9\x09M\xedj\xc9s1\xb5\x84wu\
-\xe9?I^i\xc9\x8b\x7f\xa7XI\x9b\xc9\x9d\xcdy\
-.\xa5\xe6\xec\xceI.m\xf3as^Jp\x89\x95\
-\xb4k\x99\x00.\xa4\xa6\xe8\xf0-.l\xf7yS^\
-\xca\xf05+I1\xd1\xf4\xd1\x0d\x97Q#\xb9}\x82\
-\xcbR\xcc6\xf2R\x86e\x9d^\x04.\x9a|vq\
-\x05.\xa2\xc5\xe0`\x8e\xdb\x7f\x92$+\x16W\x902\
-\xe4\x1b\x80dbq\x02\xb8\x84\xea\xb9\xc1<w-I\
-\x92,_\xdc\x14)\xc5M6\x92\xee\xd6\xd0\xf7y.\
-\xa0\xefcC\xf9n\xff\xc9\xdf\x9b6E\xcap\x91\x95\
-d\x98\xd8V\xcb\xf3r\xaa\xa5\x9e\xc99Wz\x12X\
-\xba\x93\xac$\xcb\xcd\xad\x0by^L\x0b\xa1\xady\xfb\
-\xd7\xcb\xc0\xd2\x1d`%\x99\xc6\xb7T\xf3\xbc\x94\xaa\x99\
--\xe3\xbc4\xd3\xcb\xdc\x1e\xf1l\xcd=v\x92ia\
-\x02x!U*\x95\xa7\xaf\xf3\xc2L\xf7\xd6p{\xc4\
-\xb7\xd3,%\xdb\xd8\xe6<\x03\xb0y\x8c\x97e;\xc9\
-\xad\x11\xef\xb6\xe7{!\xb8\xe0\xc6\xa6\xee\x03\xb0\xe9\x06\
-/\xca6W\x7fm!%:\xc6Z:\xb8\xbe\x91\x97\
-\xd0\xc6\xfc\xf7\xffIr\x84\xdb\x22%\xc8>$,\xc5\
-W\xbc\x80\xba\x06\x9a\xfce\x15\xb7E\xca0\xd8\xf5C\
-\xdbbL\xd6^XJ\xe9\xb2\x0e\xdb-V\xeaA\xc7\
-R\x8a\xbd\x9d\x0e\xdc+\xc8\xcc~n\x85\x94\xc7\xff\x04\
-\xa8\xff\xb0\xf8\x9e\x00\xf5\x1f\x1a\xbf\x13\xa0\xfe\xc3\xe3s\
-\x02\xd4\x7f\x88\xfcM\x80\xfa\x0f\x93\xaf\x09P\xff\xa1\xf2\
-3\x01\xea?\x5c>&@\xfd\x87\xac\xf8\x09P\xffa\
-+z\x02\xd4\x7f\xe8\x8a\x9d\x00\xf5\x1f\xbe\x22'@\xfd\
-\xc7\xa0\xb8\x09P\xffq(j\x02\xd4\x7f,\x8a\x99\x00\
-\xf5\x1f\x8f\x22&@\xfd\xc7\xa4\xff\x13\xa0\xfe\xe3\xd2\xef\
-\x09P\xff\xb1\xe9\xef\x04\xa8\xff\xf8\xf4s\x02\xd4\x7f\x8c\
-\xfa7\x01\xea?N\xfd\x9a\x00\xf5\x1f\xab\xfeL\x80\xfa\
-\x8fW?&@\xfd\xc7l\xe9\x13\xa0\xfe\xe3\xb6\xd4\x09\
-P\xff\xb1[\xda\x04\xa8\xff\xf8-e\x02\xd4\xbf\x05\xbd\
-O\x80\xfa\xb7\xa1\xd7\x09P\xffV\xf46\x01\xea\xdf\x8e\
-^&@\xfd[\xe2>\x01\xea\xdf\x16\xd7\x09P\xff\xd6\
-\xb8M\x80\xfa\xb7\xc7e\x02\xd4\xbfE\xf9'@\xfd\xdb\
-\x94w\x02\xd4\xbfU\xf9&@\xfd\xdb\x95g\x02\xd4\xbf\
-e\xdd'@\xfd\xdb\xd6m\x02\xd4\xbfu\x9d'@\xfd\
-\xdb\xd7i\x02\xd4\xff\x83 {\x02\xd4\xff\x83!k\x02\
-\xd4\xff\x83b$\xf5\xb4\xd0\x13\xfb\x98\x13\xab6\xa5\x9c\
-t\xfe\xe2F\xa6\xc4\xae\x15\x87\xbem\xad\xff\xdb_\xe9\
-,\xd0\x0f\x96'\xdel:=\xe8\xf8\x9bOp\xb9\x98\
-\xb7\xec\xdf\x7f\xf3\xc7\x1b\xb3\xb37\xfe\xf8\x9b\x7f\xfb\x01\
-\x97\x89\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\xc4\xeb\xff\x01o\xb4\xad\xce\xa7\xd95\xb1\x00\x00\x00\
+\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x01\x99IDAT8\xcb\xad\
+U;N#A\x14\xacz\xc3\x08i'0\xde\x10\x90\
+;\x99\x1b\xac%DF\xbaN\x9c\xac\xef\x00\x09'\xb0\
+\x84,\xb8\x01\xc1r\x07GN %\x1b\x81|\x84I\
+\xc6\xd2\x92\xad\xbdX\x1a#4\x9a\xaeMl\x04\xe6#\
+\xb0\xa7\xb2V\xf7+\xd5{\xafTM\xbc\x81\xfb\xfd\xfd\
+\xef>\x8a\xda\x94~\x8al\x02\xd8\x99_\xfd\xa14\x14\
+yey>\xa8%\xc9x\xb9\x96\xcf\x0f\x8a\xe3\xcd\xa9\
+s\xbfD\x9e\x88t\x90B\x90/\xde@\x12\xc8\x02\xd2\
+HR\xaf\x9ee}\xa6\xe9\xe3+\xc2\xc9\xc1\xc1\x16\x83\
+\xa0+\xb3C\x00\x11>\x01\x013\xf3\xfe\xb7\xca\xf2\xac\
+~}\xfd\x0f\x00l\xa1\x8cA\xd0\x15y\xfcY\xb2\xb9\
+\x9ao\x22\x8f\x19\x04]\xc5\xf1\xe6\x13\xe1\xc4\xb9\x8e\xcc\
+\x0eA\x86\xf8*\xc8\xd0\x9b\x1dM\x9c\xeb\x00\x00\xe7\x0b\
+\xb8\x01\x19c\x1dH\xa9\xe5\xf9\x9e\xf9(j\x83l`\
+]\x90\x0d\x1fEm\x83\xd4\x82\x14\xaeM(\x85\x90Z\
+\x1b0\xfb\xb1l\x9f\x15\x15Rd\xd3\x9e\x99v}N\
+`\xdbP1L\xc0]\x85|wF`\x08I\x15,\
+E\x00\x86\x06\xe9\x12dQ\xc1R\x0aH\x97fy>\
+\x000\xaa\xa0\xdd\x91\xe5\xf9\xc0jI2\x96\xf7=\x01\
+\xb3\x95\xbb\x05f\xf2\xbeWK\x92\xb1\x01@=\xcb\xfa\
+\xf4\xfe\x02R\xb1\xc2\xec\x0az\x7fQ\xcf\xb2\xfeS8\
+0M\x1fQ\x96\xa7\x90\xce\xbf\xa2T\xc0\x0c\xd29\xca\
+\xf2t\x91\x89\xaf\x02v\xe2\x5c\x87f'\x00\x1a\x1f\x06\
+,0\x92\xf7\xef\x07\xec[_\x00\xc8\x16\x80&\x80\xed\
+\x85\xcf\x00\x0c\xbdt\xf50\x9d\x0evoo\xff.\xd7\
+\xfe\x07H$\xc6\x92r\xd3\xe6\xed\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x09\x87\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x099IDATh\xde\xed\
+Y]lS\xe7\x19~\xde\xef\x1c;1\x04\xf2\x03N\
+b7qp\x0c\x0a\xe9\xba\x95j\xca\x04t\xbbp\xc5\
+F+\xaa-)?\x93\x06\x084m\x9d\xb4vEZ\
+\xf8\x19\x0ci\x17\xed\xca\x92\x16\xd4v\xbd\xd9\xc5\xa4V\
+\xd0^\xb4\xe9\xd2\x0e\xaa\x0dH1[U@\x14\xa9\xdd\
+\x86 \x01\x9c\x10'\x1c\xdb\x09M\x02\x0b\x84\xf8\x9c\xf3\
+\xbd\xbb\xb0\x13\x8eO\x1c'\xa1N[M\xfd$_\xf8\
+\xf3\xebs\xde\xe7\xfd\x9e\xf7\xf7\x03\xbe^\xff\xc7\xab-\
+\x14\xda\xd6\x16\x0am\x9b\xcdw\x88\xd9zp(\x14R\
+\x89E\x03\xb1h`fe\xb6\xdeC\xb9z\xd0\xc0\xc0\
+@a\x22\x91Xj\x02\xd5`\xf6\x81\xb9(\xdc\xd9\xb5\
+\x11\x00\x02\xd5\xfe7\xc04\x04P\x84\x19]\xba\x9e\xd7\
+\xee\xf7\x17\x0f}\xe9\x00\x98\x99z\xfb\xfb\x03B\xcau\
+\x90x\x1c\x8420\x17\x13\xd1|\x00\xea\xd5\xee\x08\x01\
+\x8cEUU\x0c\xc0\x00p\x83\x81!0\xe2\x82\xc4a\
+C\xc1;\x15nw\x98\x88\xf8\x0b\x05\xd0\xd7\xd7W\x90\
+\x90\xf2\x01\x01\xec\x02c5\x00W&\xb9\xab\xdd\x11\xa4\
+\x00L\xf6\xa8\x110\x8eJ\x89\xa6!\xa78\xff@i\
+\xe9\xf0\xac\xfb@<\x1e\x0f\xe8\xa6\xb9W0\xde\x02\xa3\
+~2\xe5\xa7\xb9\x5c \xd4\x93\xe0\xb7\x8a\x0d\xe3\xb7\xb1\
+X\xaczV\x01h\x9aV+\x19\x07\x09\xf4\x0c\x80\xca\
+\xec\xec\xe2;\x00\x1b)\xea\xdc\x010)M\x88\xa8\x92\
+Hl\x93\xa0\x83\xd7\xae\xf5\xd7\xe4\x9cB\x97/_\xce\
+\x9b3g^=\x094\x03\xf0e\x10\x19\x06\xd0N\x82\
+\xce\x82(\xa4\x12\x9d\x0a\x85B\xf1\x12w\xe9q\x00\x18\
+\xe8\xef\xfb\xfe\x8a\x15\x8f\x94\x93\xaa\xaf$\x88 \x81\xeb\
+\x00,\x05P\x90\x01z7\x11\xb6\x0f\x0f\x0f\x1f^\xb2\
+d\xc9\xe8T\xba\xa9\xd3\x01\x90R\xfey\xbb\xd5\x999\
+A\x84\xb3\x92\xe9\x1d\x01\xd9Z^\xea\x89X\x1d\xf2\xd8\
+\x89\x93g\x04\x80\x0d\x1b6\x98\x00\xae\x01x\x9b\x99[\
+\xa2\xd1\xa8\x0f\x10\x0d Z\xcb,\xbfCDN\xcbq\
+\xf8\x00\xec+((\x00\x80\x96\xcfM!M\xd3jS\
+\x96\xf7\xdbN\xcc\x04\xa1\xc9\xd0\xc5\xd6\xcb\x1d\x17_\xf5\
+z\xbd\xdd\xf6h\x22\xa4\xb1\x1f\xd2\xb5\xdfF\x17\xf6z\
+\xbd\xdd\x1d\x1d\x17_U\x04\xb6\x92\xa0f\x00\xa6U\x84\
+\x81\x003^\x9c\x0e\x9dh*\x875$\x1f\x22`\xb9\
+e[\x02t\xd94\xcc\xdd\x95\x95\xde\xd6\x5c\xc4rM\
+\x8b?\x01\x92\xfb\x00Z\x9cfT\xc2)}\x14\x9b\xab\
+\xaa\xca;g|\x02}}}\x05R\xf2\xcf\xc1\xbc\xcc\
+\x86\xf92A4VTx\x0e\xe7*\x09z<\xa5\x7f\
+eI\xdb\x01\xba\x92\xe6\xec\x8c\x87\x1cy\xf8\xd9\xf9\xf3\
+\xe7\x0bf\x0c \x91H|S2o$\xa2|+m\
+X\xe27\xe5\xe5\x0b\x8f\x12\x91\x91\xb3r\x80\xc8\xf0z\
+\xcb\xfe\x06\x81\xdd\xc9\x13\xbe\x1bfY\xf2\xa6\x85\x0b\x17\
+~cF\x14bf\xd2\xa2\xf1V\x22\xfc\xc8\xea\xb0B\
+\x11\x7f\xf0\x94\x95\xfd.M\x16\xeb\x95\x18\xcaK\x14\xa8\
+\x85N\xe4I\x01\xfd\xe6|\xec\xbf\x9e\xe9\xb9Q\xfc\xca\
+-\x90??\x1f\x0a\x09\xd0\x8ds8=\x18\xc4\xc94\
+C\xc4b}\xcf\x9a\xd2\xdc\x99\xe6\xd8\x8cV\x8f\xa7l\
+m\xa6\x8c\x9d\x11@OO\xcfbEu\xfc\xdb\x92\xa4\
+\x98\x99?2\x0d}\xab\xcf\xe7\x0b\x8f\xc9\x0d\xa2\xb1J\
+\x0a\xa5\x01\x0a\xad\x00\xd8\x97r\xc6^S\xca\xa3\xd2\xc4\
+\xfb\xe5x\xb1\x0f\x00\xfe\x8b\xed\xa5\x09E\xac\x81\xc0\xa3\
+\x00*\x00\xa8\xcc\x88\x90\xa4\xd3B\x8e\xfe\xa5\x18/]\
+M\xf3;\x93_'\xc2\xc3\x16\xe3\x8dH\xd3\xf8Ve\
+e\xe5\x95i\x85QEQ\xd6\xdb2\xec-\x12\xd4\x12\
+\x0e\x87\xbb\xc76>\xc3\xaf+\xa5C9\x04\xd02\x80\
+\xe7\x82h\xdc\x18\x8a\x10\xabUA\x8f\x0c\xea\x8d{\x01\
+`\xd4!~O\xc0\x1a\x00\x85cr\x04\xae\x83\xc2\x8f\
+I\xc5\xf9\xc4\x80\xbe\xeb'%h\x8a\x00\xc0\x85\x0b\x17\
+\xbakjj[\x00<8\x96'\x88\xc8%Tu-\
+\x80\xa6)O\xa0\xab\xab\xab(/\xcfu\x04\x16\x0b\x00\
+8\x07\x96\xeb\xbc^o7\x00\x0ca\xbb\xdft\x88C\
+\x00VX\x15\xb7\xf3\x10\xa0[\xa9/s\xb3\xc9\x11\xe8\
+tB\x1f\xdd\x5c\x8e\x97:S\xa1\xbb\x0a$Z\x00|\
+{LGf|\xe4\xcaw\xae)))\xb9\x91\xd5\x89\
+\x1d\x0e\xd7R&\x94\xa5\xa1\x14t\xd6\xe3\xf1D\x92H\
+\x9et\x18\x82\xd63h\xd9\xa4J\xa5\xcc\x06BA\xf2\
+\x93]\x8e\x81eN\x91\xb7\xee\x1c\x9et$\xa3\x92'\
+\xc2\xa0\x8fm\xa6.K$\x12K\xa7\x8cBB\xc8j\
+b.N\xdb\x94\x14\x1as \x1f\x0a\x17@`%\x81\
+]\xc8\xd9b\x17\x04V\xfaP\xb8`\x0c\x93\x80\x0c\xd9\
+\xa8Rd\x9a\xa8\x9e\x12\x00\x13U\x22Y\xcf\x8fo\xe9\
+*\x9d\xba\xfb\x07YD$\x16e\xb5\xea=\xc4Q&\
+,\x12\x90Ec[\x86\xc3q\xca&U(\x04Wf\
+\x05\x90l\x03\xa9\xc8\xe6\xdc\xa3gB\xa1\xf8\xdd\x88\xa6\
+0\xa7\xc7\xea\xdc\x9c\x01 \x19\xcax\x98<}\xe2D\
+\x0c\x80\xb5\x98S\x99\xa8\xc8\xde\x9e\x92\xb5\x01'\x16\x0d\
+\x0e\xa7Z\xad\xaa\x0e\x0bR6n\x8f\x8c|(\x19g\
+\x844\xf6?\xb8\xeaX\x9e\xe2\xc4\x9f\x18\xf4xn{\
+[>b&\xf0\x8b\x7f\xb5\xfd`T\x0a\xb5Q\x10\x96\
+\xcfq\xb9\xbe\x07\xd0\xb81\x0dC\xef\xd1\x13F'\x93\
+l]\x15\x0c\xbe<I&\x16\xa9l\xceiY=)\
+8\x0f\x0b\xe1\x8aI\xa6c`\x0c\xe7\xd0\xfc\xc3\x92\xe9\
+\xd8B\xb8b\x19\xcf\xc6\xa6\x8b\xb5\xf4#;\x85jj\
+j\x9f\x05a\x97\xe5\xb7;\x9e\xf2\xb2\xb9D4N\x9b\
+kx\xc6\xe7R\xf3\xff\xc8\x82~\x98\x13\xfd%\x0e\x8f\
+\x1a#O\xdf\x87W\x22\x96\xe8*\xa2\xb1\xf8-\x00\xf9\
+\xe3H\x18M\x1eO\xd9^\x2223\xfa@0\x184\
+\x98x\xc8V\xe7\xe4]\xbf~\xbd\xdc*w\x1f^\x89\
+\x98\x86\xb1\x83\x19\xed9\xb0~;\x1bb\xbbUy\x00\
+\xe8\xed\xed\xf5\x00\xc8\xbb\xeb\xe7\x18\xd3\xcd\xcc^\xcc\x11\
+E\xa4\x947\xad;\xa3\x86\xf1\xb0]\xcc\x8d\x03\x97X\
+\xe7z0>\x00\xb3~\x0f#\x0d\x9d\x19'\x1c:\xd7\
+\xbb\xb1\xef\xd2\x84\x12AUW\xa6Er\xc97A\x14\
+\x99:\x8c\x1a\xe8\x02\xd1`\x1a&\x89 3\xd3D\x10\
+\xcd\x97\x84\xae\xef\x00\xf0\xcfd\xe6\x9d\x89\xe1\xe9C\x15\
+r\xc7<4_\xca\x94\x9c\xa5D\xd0f\xd8A6\xd0\
+5%\x00]\x1fi\x07#\x9e\x9e\x89Q\x97l\x03'\
+\xeaQ\x8c\x03\x9fH\x1dO1\xa8c&\xb4q\xea\xfc\
+\xcbB\xfd\x85O(C\xb3\x1f\x8dF}$Pg\xfb\
+O\x5c\xd7G\xda\xa7\x04\xe0\xf7\xfb\x87\x18x\xdf\xc6\xab\
+\xa5\x10\xa2>\x14\x0ae,\xfe\xdch\xee\x98\x16\x9d,\
+\xb4\x99\x8f\xe6\x8eL\xca\xa7\xde\xd1\x00\xd0\xd2\xb4 #\
+p\xc4\xef\xf7\x0fM\xab\xa1q\xaa\xe2m\x00#\x96\xad\
+\x02H^\x17\x08\x04&\x9dP\xb9\xd1\xdc1\x15\x9d\xb2\
+\xd1fl\x05\x02\xf7W\x81h\xadmb1\x22\x85h\
+\x99vG\xe6v\xbb\xc3\xcc8f\xe3`\x9d\xa28\xb6\
+dcF1\x0e|:)\x9d\xa6\xa0\xcdx)\xee\x90\
+[\x00\xaa\xb3\xbd\xfbh\x85\xdb\x1d\x9e6\x00\x22b]\
+\x1aM\x00z\xac\xe1\x94\x04\xed\xd14\xad\x81\x99'\x1b\
+\xc7\xf0\x04:M\x836)\xc7U5Mk \xd0\x1e\
+k\xf8\x04\xd0#\xc1M\x93\xcdO'\xed\x89\xe78\x9d\
+\xff!\xe0\xcd\xe4\x84\xed\xae\x81@\xca\xbeX\xec\xfa\xea\
+, \xe0Fs\x87\xd4\xe5N0\x8e\x83q|*\xda\
+0\xb3\x1a\x8b]_\x0dR\xf6\xd9t\x1aa\xf0\x9bN\
+!\xce\xdf\xd3X%\x12\x8f\x07\x1c\x8c\x83\xcc\xbc\xc2>\
+V\x01c\xb7\xd7[\x96m\xacB\x83h\xf4\x01@\x11\
+\xf6G\xb2\xd1F\xd3\xb4\x86\xa4\xf2\xbc\xc4\x0a\x80\x08\xa7\
+\xf5Db\xb3\xb5\x8d\x9d\xf1hQ\xd3\xb4Z\x90\xf8{\
+j*G\x96\x02E2\xf8yS\x17\xaf\x87\xc3\x17\xba\
+\x83\xc1\xe0\x84)E[[\xdb\x02\x00X\xb5j\xd5g\
+\x99\xa2M p\x7f\x95\xe2\x90[R\xb4\x11\xe9\xcf\xe7\
+\x1e0?\xea\xf5z/~\xae\xc9\x9c\xd7\xeb\xbdH\x10\
+;\x08\xe8\xb4TT\x04@!\xd0N\xd5!_\xab\xa9\
+\xad}J\xd3\xb4*{\xb2\x93Bm\x94Bm\x9c0\
+\xf1\xd0\xb4\xaa\x9a\x9a\x9a\xa7U\x87|\x8d@;\x01(\
+V\xe5\x09\xe8$`\xc7T\xcaO{6:<|\xe3\
+\xbd\x82\x82B\x00\xf2\x05\xdbp7\x0f\xa0\xef\x82\xb1\x0c\
+$6i\xb1\xbe\x8f\xa3\xd1h\xc80\x8cS\x15\x15\x15\
+\xd1\x0fN\xfec\xf9Xa\xd6\xdb\xdb\xebQUu\xa5\
+\x16\x8b\x05\x89\xa8.\x15\xe73\x0c\xac\xb8\x07\xc0\x9e\xe1\
+\xe1\xe1\xf7r~\xc1\x91\x9c\x93*\x7f\x96R>d\x1b\
+x!\xc3\xf8|\xf4jw\xb7\x0a\x00\x8b\xaa\xaa\x0c[\
+d\x99\xf0nf\xbe\x03\xa2O\x89\xe5O\xa7c\xf9{\
+\xba\x1f\xf0z\xbd\x17\xf5\x046\x0b\xa2\x97m!vL\
+!\xeb'?\xd5\x8c\xa8\xa9\x92\xd8\xfe{\xda(J\x10\
+\xbdl\xea\xb4i&\xca\xdf\xd3\x0d\x8d\xcfW\x16V\x14\
+\xf1\x5c\xc24~\x0c\xc2\xbb\xb6\x8c=\xd35\x02\xa2w\
+\x05a\x83\xa2\x88\xe7|\xbe\xb2\xf0\x17rGfu\xc8\
+\xfe\xfe\xfe\x80n\xbb\xe4\x13\x82\xe63\xa7_\xf2\x11\xc1\
+H\x95\xc4\x83\xc4\x88\xb3\xc0\x11\x87\x10-\xee/\xe3\x92\
+/\xd3\x1a\x18\x18(\xbc}\xfbv-\xa9\xaa\x1f\xcc>\
+b*\xba\xd2\x19\xde\x08\x00\x8b\xab\x03o0\xf1\x10\x88\
+\x22l\xa0k\xee\xdc\xbc\xf6\xe2\xe2\xaf\xc05k\xb6\x15\
+\x0a\x85T\xc9\xa2\x0d\x00\x04\xc9U\x99\xf2D.\xd6\xac\
+\xdd\xd4'\xdbS\xd9\xcaR\xb6\xce\x96\xf2_\xaf\xaf\xc2\
+\xfa\x1f+\xc5:\xb7\xbeN\x80!\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x06\x9b\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x06MIDATx\xda\xe5\
+\x9bMl\xd4\xd7\x15\xc5\x7f\xe7\xfeg\x98/\x5cd0\
+\x8c\x91\xa8\xa0d\x11@\x82\x06\x10\x05J)\x82EB\
+\xbc\x80.j6\x94\xd0\x15e\x93\xec\xba\x8b\xe4R!\
+u]*\xb5n\xa3V-%Y\xd4\x12\x12,\x0ct\
+\x01\xa1\xb42\x10\x11;A\xa5\xd0\x05\x22R\x14\x18\x02\
+\xa6|\xcc\x97g\xfe\xefva\x120q\x0c8\xb6\xb1\
+=g;\xa3\xa7\xb9\xe7\xdew\xdf{w\xce\x11\xe3\x81\
+\x0e\x8c\xd5\xf3\xd3d-\x93*\x0e4[2zE\xa6\
+\x158Kd,\x04\xb5\xcaiFJ\x03\xe0^qq\
+\x07\xfc\x86;\x9f\x00\x97=\xf8\xc7\xa1\x16\xf7Us3\
+\xeeP\x0ae.\x5c\xaf\xb0\x8f0\xd6?Uc\xba\xda\
+Q\xb2\xe9d\xeb<\xcc\x17'\x886\x826\x83\x7fO\
+(3\x9a\xe5\x1c/\x83\xce\x83\x9f\xaa\x13\x9f!\xe8j\
+\xa5v\xe3&\xdb(M.\x02\x8e\xb44eR\x89\xa5\
+\x86\xd6\x83\xb6J\xac\x03f\x09\x8d\xc9\xfa\x8e;p\xd7\
+\x9d\xb3\xe0\xc7C\x1c\xce\x96\xeb\xf1%\xb6\xdf\xba\xffb\
+\x09\xe8\xc02\xeb\xe6\xad\x15\xf6\x9aL\xaf\x0b[!H\
+3\x8ep\xa8\xb8\x87\x8b\xee\xde\xedq\xf8{\xf9/7\
+\xcf\xd1E<\xf1\x04t\xcf^\x90\xb3\xd4\x8f\x85v\x00\
+\xab$\xa5\x98@\xb8{\x15\xf8\xd0\xdd\xbb\x8a^\xed\xa2\
+\xad\xff\xd3\x89!\xa0\x83DnC~\x13!\xda#\xd8\
+\x22\xa9\x85\x17\x08\x97\xdf\xf2\xc0I,\xfeC\xf1_\x85\
+\xd3\xec\xa3>~\x04\x1cii\xca\xa6\x92;M\xda\x8b\
+k)\xf2\xe4X\xed\xf3o\xd4\x1f\x5c5\xe4\xff\x09\xee\
+\x9d\xa5j\xed\xdd\xe7\xe9\x0d\xcf\xfe\xe3O5\xb5d\xab\
+\xb9\xb7L\xb6\x17g\x8e$c\x12\xc1\xdd\x03\xe2vp\
+\xef,\x05\xff\x0dm7>\x1f+\x02\x94>\x91_\x14\
+\xb9\xde\x96\xec\x0d\xa1\x04\x93\x18\x8e\xd7\xdd\xc3\xc1X\xbe\
+\xbf\xf2Z\xe1\xda`\xdf\xfczDO[0}\x22\xff\
+\x9d\xc8\xed\x17\x92\xed\x9a\xec\xc1\x0ffT\x86\xb4B\xae\
+9\xd1\xae\x5c_\xfdP\xf1\x7f#}\x7f\xe42\xeen\
+\x9d;\x98y\xed\x14\x8a\x98\x22\x10\x8a$\xed\x8c\x5co\
+\xd3\xdd:wt\x04\x1cii\xca\x9a\xde|X\xf6S\
+&\xf8\xa1$\xd8\x1bY\xd3\x9b\x1ciiz\xbe-\xd0\
+A\x22\xbbh\xd6OM\xfa\xb9P\x13S\x14B&\xb1\
+,\x11\xd9\xed\xdaK\x0f\xfa8\xfd\xd5\xb7\xc4\xb0\x15\x90\
+\xdb\x90\xdf4x\xd41\x87\xa9\x0eg\x8eI{s\x1b\
+\xf2\x9b\x9em\x0bt\xcf^@\x88\xf6\xe0Z:\xd9\x8e\
+\xbaQU\x81d\xb8\x96\x12\xa2=t\xcf^02\x01\
+\xedD9\xa5\xdaelA\x9ed\xba@\x9e\x94\xb1%\
+\xa7T;\xedC\xb7\xfd\x10\x022\xbb\xe7\xad\x95\xd4.\
+W\xcb\x8b\xbe\xe1\x8dq/\x90\x5c-\x92\xda3\xbb\xe7\
+\xad\x1d\x9e\x80#-MJ\xda\xab\xc0*\xa6/V)\
+i\xaf>~*|I@&\x1d-\x93\xabm\xa2_\
+u\x13\xdc\x0fRr\xb5e\xd2\xd1\xb2\xa1\x04\x1c%k\
+n\xeb$[\xce4\x87d\xcb\xcdm=G\xc9~I\
+@\x9a|\x1e\xf4\xfax\x0f3&G? \x0d\xda\x9a\
+N\xe5\xf3\x83\x04t`$Y,c-\x0d\x02\x19k\
+\x09,\xa6\x033V\xcfO'\x886\xe2\xccj\x14\x02\
+pf%,\xda\xc8\xea\xf9i#k\x19\xc4\xe6\xe9t\
+\xec=\xcb\xb1\x88\xb3\x99\xace,U\x1fhF\xac\xa1\
+\xd1 \xd6\xa4\xea\x03\xcdf\x1e\xad\x1c\xed\xdc~\x8aW\
+A\xc6<ZiB+hP\xc8\xf5]\x03\x96\xd0\xb0\
+\x0c\xf0\xb2I,l\xd8\xf8\xc5B\x03\xb5\xd2\xb8%\xd0\
+j\x12\xcd\x0d\x5c\x01\xcdF\x03\x5c\x7fG@\xdahp\
+\x18Pi\xe0\xf8+\xe6p\xa7Q\xa3w\xb8c\x04/\
+4l\xfe\x83\x17\xcc\xe1Z\x03W\xc053q\xa5a\
+\x1b\xa0\xb8b\xb1\xfbG\x8dJ@\xec\xfe\x91\x05\xc5\xbd\
+\x8eW\x1a\xaf\xfc\xbd\x12\xeaq\x9fU\x133\xee\xe0\x9c\
+o\xc0\x06p\xbe\x9a\x99\xd1o\x94B\x19q\xea\xa1\x14\
+\xadQ\xb2\xef\x88S\x94B\xd9\xb8p\xbdR\x0f\xf1\x19\
+\xc4\xdd\x06J\xff\xbdz\x88\xcfp\xe1z\xc5\xd8G\xc0\
+\xb8\xea\x81s\x0d\x13\xbe\xeb,\xc6U\xf6\x11\x0c\xa0R\
+-\x14\xc0\x8f{\x03\x5c\x8b\x07c\xf4\xe3\x95\xaa\x15\xbe\
+x\x0b\xc06JA\xa1\xc7=\x5c\x9c\xfe\xd9\x0f\x17\x83\
+B\x0f\xdb\xae\x97\x1e\x11\x00\x94+\xf1%\xc7\x8f9^\
+\x9d\xc6\xcd\xaf\xea\xf8\xb1r%\xbe\xf4\xf8kp\x10\xdb\
+o\xddw\x85\x13@\xef4.\x80^W8\xf1\xb8\x90\
+r\x88X\xa0^-~\x96|e\xe6L\x8c\xd5@f\
+\xba\xfcY\xf2\xf0\xd8\xbb\xed\xc1;K\x7f,\x1c\xe6\xd2\
+#\xed\xe0\xd0\x81H\x17q\xd1\xab]\x0e'q\xd5\xa6\
+O\xed\xab\xe6p\xb2\xe8\xd5\xae'\x95\xe5_\x9d\x08\xb5\
+\xf5\x7fJ\xa8\xbf\x03~\xd9\xdd\xc3\x94\x8f\xdd=\x80_\
+&\xd4\xdf\x19NQ>\xecH\xac\xd8s\xf3\xfd\x10B\
+'\xe2\xf6\x94\xcf\xbe\xb8\x1dB\xe8,\xf6\xdc|\x7f\xb8\
+\x8f\x87\xd7\x09\x9e&\xd4v\xa4\xaf$\x12\x96\x16|_\
+LM\xb5\x98\xe3\xf5\x80\xff\xba4P\xff\x1d{K\xc3\
+\xdeq\xbe>\xb0\xed\xb7\xee\x97b?\xe0\x84\x83\x8e\xc7\
+S0\xf8\xd8\x09\x07K\xb1\x1f\x18I>?rf\xdb\
+n|\x1e\xe3\xfb\xdd\xfd\xbd\xa9D\x82\xe3\xb1\xbb\xbf\x17\
+\xe3\xfb\x9f&\x9b\x7f\xaa\x06\xb8~\xa8x7\xda\x95\xeb\
+\x13\xcc\x02-\x9f\xec\xdb\xe1\xa1\x5c\xfe\xaf\xf5z\xf8e\
+\xb5\xed\xe6\xb5\xa7\xb7\x88gEw\xeb\xdc\x99\x91\xde\x02\
+\xfdl2\x1b&\xc0\x7f\xff \xf6\x03ci\x98x\x84\
+\x7f\xb64e\x8b\x89\x9f\x98\xdb^\xd0\x92Ie\x99\xc1\
+/\x07\x85\xceR\xae~\x88\x1f<\xbbe\xe6\xf9d\xf0\
+\x7f*\x0d\xd4^z\xd0\x97\xfcv\xe6\xbf\x98\xe5\x04\xf3\
+\x85\xb2/8\xf9\xfd\x01?\x0e\xf1\xafJ=\x85\xc3\xec\
+.=\xd7\x8b\xf6\x9b\xd9\xe6\x94j\x97i\x07\xb0RL\
+\xb0mn\xf0\xd1\xd6\xeb\xf8\xdf\x8a\xf1\xe8ms\xa37\
+B\xbc[\xbeW\x1bx\xf0A\xb4*\xf3o\x9c\x1b\x18\
+Y\xd0\x1cAb|\x03\xa7\xe2\x0a\xbd\xee\xfe\xe7\xa0\xf8\
+\xb7\xa5\xbb\x85\xc3\xfc\xa8<\xeai\xd6\xd8Yg\xd3\xd1\
+2s[\x8fi\xab\xdc\xd7\x81\xbe5\xb6\xd6Y\xbf\xe7\
+\xe8\x1c\xee\xc7\x82BO\xb92\x19\xac\xb3O\xe2\xe8\xfc\
+l:\x15\xf2\x04\x16'\x14\xfd\x10\xd8\x8cX#\x94\x1e\
+e\xe0\x15\x9c\x0f\x80Su\x8f\xff\x81q\xb5R-\x14\
+&\x9fy\xfaI<n\x9f/\x0f\xcc\xb6d\xb42B\
++\x82xY\xb0\x08\x94\x07f\x7f!\xcd}8\x8a\xeb\
+\x07/8\x5c3\xe7J\x8c\x7f\x1cjqo53\xa3\
+\x7f<\xed\xf3\xff\x073\x99\xc4\x5c\xbbI[\xa4\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x04j\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x04\x1cIDATh\xde\xd5\
+ZMO\x94W\x18=\xe7yq\xda\x0c\xcc\x90B\x98\
+\xd2\x044Q\xdb\x8d|\x86\x14\xc2\xc2dF\xfd\x01\xc5\
+\x1a\xdbMMp\xd1\xc6\x85.\xfa\x07\x80?\xd0&\xb8\
+h\xca\x82\xc4t\xd1\xd0\x1a\xf0\x07\x18!aA !\
+\x02\xea\xc6\xa0I\xc5D\xb1\x81\x04\x06\xc62\xce\xbd\xa7\
+\x0b\xa6\x86\x01\x8b\xc8\xe7\xbcg\xfb\xde\xfb\xde\xe7<\xe7\
+>\xf7\xe3y.\xb1G,\xb5\xb7W\xa8\xac\xec\xa4\x9c\
+\xab#Y'\xb2\x09@-\x80O\x01D\xf3\xcd2\x00\
+\xe6\x01\xccQ\x9a\x92\xf4\x90A\xf0\x90++O\xcb\xc7\
+\xc6\x16\xf72>w\xdb\xf1U2Y]\x12\x04\x17I\
+v\x80<\x05\xe08\x80`\x87\xdd\x1d\x80g\x90\x9eH\
+\x1a\xca97\x98\x18\x19yy\xe0\x04\x04p\xf9\xdc\xb9\
+/=y\x19\xe4\x0f \xcb\xb0\x0f\x90\xb4J\xe9W\xe7\
+\xfd\x1f\x95\xc3\xc3\x13\x04\xb4\xef\x04\x16\xda\xda\xe2VV\
+\xd6\x09\xf2\x06\xc8\x13\x1f\xe0m\xecX\x15\xe9/\x0f\xdc\
+D:\xdd_9>\xbe\xbc/\x04\x86\x93\xc9\x92z\xb2\
+%\x08\x82_\x004\x81$\x0e\x12\x92\x00L9\xe7\xae\
+=\x90&S##\xb9\xed\x9a\xdb\xfb\xfe\xd7\x1c\x04_\
+[\x10\xdc\x02\xd9|\xe0\xc6\x03\x00I\x90\xcd\x16\x04\xb7\
+\x1a\x83\xe0\xd2\xae\x15x\xd9\xd0P\x1aI$:I\xfe\
+\x0c\xa0\x04G\x83\x1c\xa4\x1f\xd7^\xbd\xea\xaf\x9e\x99Y\
+\xfd \x05\x22\x89D'\x81\xee#4\x1e\xf9\xb1\xbb\x22\
+\x89D\xe7\x8e\x15\x18N&K\x1a\x83\xe0\x12\xcd~;\
+b\xe3\x0b\x94\x90\xf7\xdfM;w{sLlQ\xa0\
+\x9el\x01\xd9]D\xc6\xaf+Av\xd7\x93-\xdb*\
+\xb0\xd0\xd6\x16\xb7Xl\x04d3\x8a\x11\xd2}\x9fN\
+'7.\xb1\xb6q\x93B,v\x15@\x13\x8a\x17M\
+\x88\xc5\xaej\x83\xe3\xdf\x12XH\xa5Z\x0d\xb8~(\
+K\xe5\x1e\x96X\x03\xae/\xa4R\xad[\x08\x04f\x97\
+\xf3;lq\x83<\x11\x98].\x88\x81\x95d\xb2:\
+[R2K\xb2\x14a\x80\xb4\x9a[[\xfb\xbcjt\
+\xf4\x85\x01@v\xfdT\x19\x0e\xe3\xd7U(\x8dD\x22\
+\x1d\x00`K\xed\xed\x15$;\x102x\xb2c\xa9\xbd\
+\xbd\xc2\xdeD\xa3\xa7@\x9e\x0e\x1b\x01\x90\xa7\xdfD\xa3\
+\xa7,\x90\xce\xe4oPaCm \x9d1o\xd6p\
+\x00g\xfb\xc3@\xe0\xcd\x1a\xcc\xa4F\x84\x14&5\x1a\
+\xc9\x9a\xb0\x12 Yc\x22\xab\xc3J@d\xb5A\x8a\
+\x22\xb4\x0c\x145\x84\x1c\x062\x83\xf0\x06A\xc6 \xcd\
+\x87x\x0a\xcd\x1b\xa4\xb9\xd0\x0a \xcd\x99'\xa7\xc3J\
+\xc0\x91\xd3f\xde\xcf`=W\x19:\xfb\xcd\xfb\x19s\
+\xe4#\x00a\x9cFs\x8e|d\xc72\x99'\x90f\
+C\x18\xc0\xb3\xc72\x99'V>6\xb6h\xd2P\xf8\
+\xec\xd7\x9d\xf2\xb1\xb1\xc5\xf5\x1bY6;\x04i5D\
+\xd6\xaf\xbalv\xf0\xed\xa5\xbejt\xf4\x05\xbc\xefc\
+\x08\x82\x99\x80\x83\xf7}U\xa3\xa3/\x0a\xb2\x12&\x0d\
+Hz\x16\x82\xa9\xf3\xcc\xa4\x81-i\x95\xf8\xf0\xf0\x04\
+\x80\xde|~\xbeh\xad\x07\xd0\x9b\xb7\xb5\x90\x00\x01\xf9\
+t\xba\x1f\xc0T\x11\x0b0\xe5\xd3\xe9\xfe\x8d%\xa8\x82\
+\xd3h\xe5\xf8\xf8\xb29w\x0d\xd2\xe3\x22\xf4\xfecs\
+\xee\xda\xe6\xd2\xd3\x96\xe3t\x5c\x9a4\xa9\x8b@\xae\x88\
+\x027gRW\x5c\x9a|\xc7\xb7wc\xe9\xc2\x85\xeb\
+\x1e\xe8\x02Yy\xc4\x9e_0\xa0\xa7\xfc\xee\xdd\x9b\xef\
+\xfa\xfc\xbf5\x80\xd7f\xfd\x1fy\x0f\x00?\xe1\x88j\
+\x05\x04r\x04z^\x9b\xf5o\xd3f{,\x9d?\xff\
+\xad'{@~q\xd8s^\xdewW\xdc\xbb\xf7\xfb\
+\xf67\xb2\xf7 \xee\xdcms\xee\x0a\xa4\xfb\x87\xb2\xc4\
+J\x924e\xce]\xf9\xc4\xfb?w\xa0\xd2\xce\x90\xaf\
+\xde\x5c\x05p\x83\xe4q\xeds2\x8c\x80\xcbo\xa4\xbd\
+~?\x0b\xdd\x05\xce\x01\xb8\x9cJ\xb5z\xf2\x1b\x98}\
+\x8f\xfd\xcahK\xab\xf0\xbe\xcf\xa4\x81\xf8A=5\xd8\
+\x8c\xbf\xcf\x9e\xfd,\x88D.\x1a\xf9\x95\xd6\x93\xc3\xb5\
+\xf8\xb0\xc7\x1es\x94f\xbdt\xc7e\xb3\x83\xff\x9dm\
+v\xa1\xdc\xde\xf0\xbc\xb5\xb5\xf2\xe3X\xec$\xa5:3\
+\xab\x87\xd4\x04\xb2F@5\xf3\xcfm\x04d\x08\xbc\x84\
+\xf4\x1c\xe4\x94\xf7\xfe\x81\xc8\x87\xff\xa4\xd3Ok&&\
+\x16\xf62\xfe\xbf\x0e`\xbd\x9d\x99z}&\x00\x00\x00\
 \x00IEND\xaeB`\x82\
-\x00\x00rM\
+\x00\x00\x03\x05\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00(\x00\x00\x00(\x08\x06\x00\x00\x00\x8c\xfe\xb8m\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x02\xb7IDATX\xc3\xcd\
+\xd9\xb1oVe\x14\xc7\xf1\xcfy \xd1\x84R\x17\x93\
+\xa6lR\xcb\x0c%\xc1\xd8\x98\x90\xd2At\xa0&\x12\
+\xec\x86#\xfe\x01u3M\xc5\xcd\x8d\xa9#l\x8a$\
+\x80\x0e\x96\x01\x1b\xa2i\x22\x89\xc5\xb9TF\x9a&,\
+\xb4\x90\xd8\xa4\xbd\xc7\xa1\xd7\x96\xd2V\xdbR\xde\xf7\xfe\
+\xa67\xf7&\xef\xfd\xe6w\xce}\xees~O\xd8\x83\
+rR\x87\xf4\x9e\xf0>N\x0a\xbdB\xb7\xca[ ,\
+\xe0\xb1\xf4P\x98V\x99\x12~\x8f\x01\xcfv\xfb\xac\xd8\
+1\xd4\xa8b\xd0q\xcb>S|\x82#8\xb4\x83\xff\
+H<\xc7c\xdcR\xb9\xee\x9e\x071\xa6\xda\x17\xc0L\
+\xe17\xefX\xf6\xa5pN\xe8\x92\xca^\x9c\x17*i\
+^\xfaQ\xe5[g<\x8a\x90{\x06\xccIo\xe2<\
+F\x85\x9e\xdd8\xfe\xff%1\x8b1\xdc\x88\x01\x7f\xef\
+\x1a0'u\xe0\x1b\x5c\x12\xde\xf0:\x94\x960n\xc1\
+W1dq\xc7\x809\xe9m\x5c\x15>\xdeW\xd7\xb6\
+\xef\xd1\x9f\xa5\x8b1\xe0\xc9\xcb7\xcb6\xce]\x15\xce\
+\xb6\x00\xee_\x93>\x14\xae\xe5m\x87\xff\x13\xb0\xee\xb9\
+\xcb\xb5s\x07\xb4N\x07\xf0\x91N\x97k\x86\xcd\x80\x99\
+B\xf1)\xbeh\x91s[9y\x09\xe73\xd7\x9f\xbf\
+\xf6#\x7fu\xd4\x8a\x09\xf4j\xaff\xad8\x1b\x83\xfe\
+Zs0G\x15\xcbF\xf0\xae\xf6\xab\xc7A#9\xba\
+\xca\xb6Z\xe2A\xc7\x85\xa16\x95vs\xa9\xd39\xa7\
+\x9dX\x07\x5cqA\xe8\xd2\x14\x85.\xc5\x05\x88\x9c\xd4\
+!\xfc\x81c\x9a\xa5\x87\x9e:Y\x14\xa7\xea\x0f\x7f\xd3\
+\xd4\xed\xb0SE\xa5\xbf\xde\x954M\x87\x14\xfdE\xe8\
+k\xc8\xcb\xb1\xd5\xba\xd8Wd\xe3z\xefE\x1d+B\
+w\x83\x01\xbb\x0b:\x1b\x8b\x97:\x8b&+V\x17\xea\
+\x85\x06#.\x14i\xae\xc1\x80sE\x98i0\xe0L\
+\x91\xa6\xebmw\xf3^\x11\xa6\x8bb\xaa\x9e[\x9b\xa6\
+\xe7*SE\xe5~=T7\xae\xff,\xba_b\xc0\
+3\xe1\xa6\xd8\xd9\xa4\xdf\xa2\xe5\xa5\xaa*\xb7b\xc8b\
+\xa9/\x5c\x97\xe6\x1b\xd4}\xf3\x85\xef\xd77\xacw\xfd\
+)\xdcnPy\x7fr\xcf\x83\x8dC\xd3]=\x8a\x09\
+\xd1\xf6\xb9d\xf3\xd0\x04\xcex\x84\xb1:\x8eh\x97\x96\
+\xac\xf8\xbaf\xd98\x17\xd7)\xd3\x0d\x8c\xb7i]L\
+i\x5c\xf1\xc3\x8b\x89Wl\x13}|WG\x1f\xadJ\
+\x17Vp\xc7A\xc3\xf1\xc1\xc6\x10i\xd3n\xa6NA\
+?\x97&Z\xe4d\xe2\x8et\xf1e\xb8-\x01k\xc8\
+'\x18\x96\xae\xbc\xe6\x9e\x5c\x92\xaexjx\xabd\x8b\
+v\x06\x98\xcc\xcaW\x080\xd7 S\xf8\xc5Q\xc5H\
+\xe3\x22\xe0\x0d\xa0\xa3\x8a\xd3N\xd4\x13\xff\xeeC\xf44\
+'\xdc\xdc\xf7\x10}\x9b\xd2\xaf\x1eC\x14\xfdR\x9f\xd0\
+\x8b#\xb2\x9eoV\x8f!\xe6\xa4\x99W=\x86\xf8\x07\
+\xae_\xe9s\xce\xfd}/\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\x01\xed\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x04\x85\x00\x00\x04\x84\x08\x06\x00\x00\x00\xfa\x10\xbf\x08\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x002\xc0\x00\x002\xc0\x01(d\
-Z\xdb\x00\x00q\xe2IDATx^\xec\xdd\x07\xb8\
-\xa5WY\xe8\xf1\x03V\x10\x10\x01\x11\x15\x15\xbbbA\
-\x88H\x8c\xe8!\xe7{\xd7w\x8eI\x08E\x06P\x01\
-)\x22J\x11n@P\x01\x03xiJS\xae\x22\x0a\
-\xd2Q\x01\x05\x14\x04D\x9a M\xa9R\xae\x80\x86\x00\
-!\x09s\xf6\xb7\xf7L\xa8\x02\x99\xbb\xd6dq3\xd9\
-\xb3\x92L9e\x97\xdf\xffy~\xcf@\xce\x99Sv\
-\xf9\xf6z\xdfI\xce\xacH\x92$\xedf\x9b\x1b\x1b\xd7\
-\xdd\xdb\xf7?4\xee\xba\x9b\xfd\x7f)\xdd\xf9+F\x11\
-\x0f\x18u\xdd\xc3\x8aIJ\x7f8D<\xa3\x18G<\
-gH\xe9uM\x11\xef\xca\xce\xdaB\xefj~\x9e\xec\
-\xe0\xd7Q\xbf\xa6\xf2\xf5}\xe5k-_\xf7\xa1\xdf\xc7\
-\xa1\xdf_\xf9~\xcb\xf7]o\x02I\x92$I\x92\xa4\
-\xf9msc\xe3j\xe3\xf5\xf5\xebe7\x9at]L\
-\x22n\x9b\xfd\xfa\x10\xf1\xe0\xec\xf1ei2N\xe9\xa5\
-\xd9\x1b\xb3\xf7g\xe7\x0e)\xfdO\xfe\xf5\xc0\x12\xfbB\
-vnVn\x8fr\xbb\xbc\xb4.\x98\xca\xed\xf5\xe0r\
-\xfb\x1d\xbc\x1d\xf3\xedYn\xd7r\xfb\x96\xdb\xb9\xde\xe4\
-\x92$I\x92$I[\xdb\x10\xf1\x8d\xe3\x94\xbe{\xd2\
-\xf7'd)\xbb]\xf6\x1bC\xd7=$\xbf\xed\x09\xe3\
-\x88gf\x7f\x9f\xbd)\xbf\xdf\x07\xb2\xf3\x86\x94\xbe\x98\
-\x7fm->\xd8B\xf5v>/\xfb\xc0\xc1\xdb\xff\xa2\
-\xfb\xe1\x99\xe5~)\xf7O\xb9\x9f\xea\xfdU\xee\xb7\x13\
-\xf2\xfb}w\xb9?\xeb]+I\x92$I\x92\x96\xb9\
-\xcfll\x5cw_\xd7\xfdt\xf9\xb7P\xc6\x11\xf7\x1f\
-\xa7\xf4\xa4IJ/\xca\xff\xfbm\xd9'\xcb\xf2\x81\x05\
-S\xee\xd7|\xff\x0e)\xfdm\xfe\xffO*\xf7{\xb9\
-\xff\xf7\xad\xaf\xff\xf4\xa8\xef\xbf\xa3>4$I\x92$\
-I\xd2<w\xfe\xea\xeau\xf6v\xdd\x8d7#n=\
-\xa4\xf4\x9bY\xf9Y<\x7f\x9d\xfd\xeb8\xe2c\xe3\x94\
-.\xbc\xc4\xc2\x00\xca\xe3\x22?>\xf2c\xe5o\xb2\xc7\
-\xe5\xc7\xca}\xf3\xff\xbf\xf5\xe6\xda\xdaO}j}\xfd\
-[\xebCK\x92$I\x92$\xedf\xfb\xba\xee\x9ay\
-\x90\xff\x89<\xbc\xdf<\xbb\xe7\xa8\xeb\x1e=\x8axn\
-\xfeg\xaf\xcf\xff\xff\xbf\xb2e\xffY=l\xa1\xfcx\
-\xfa\xe2\x10\xf1\xdf\xe3\x887\x8cRz^\xfe\xff\x8f\xc9\
-\xee\x95\xff\xd9\xe9\xe3\xb5\xb5\x1b\xed\xdf\xd8\xf8\xe6\xfa\xd0\
-\x94$I\x92$I\xc7\xdb\xfe\xd5\xd5k\x95\xbf\xa9j\
-\x14\xf1\xab\xe3\xbe\xff\xfd<\x90?'\x0f\xe8o\xcc\xbf\
-~\xfc\xd0\x81\x1dfD\xf9\x81\xd9o9\xf88\xcd\x8f\
-\xd7\xf2\xb8\xdd\xec\xba(\x8f\xe3\xfa\x90\x96$I\x92$\
-I\x87v\xc1\xda\xda\xb7\x0c)\xfd\x5c\x1e\xa6\x7fu\x12\
-\xf1\x07y\xb0~i\xfe\xdf\x1f\xcc\xff\xcc\x7f\xe2\xc5B\
-\xc8\x8f\xe5\x0f\xe5\xc7\xf4?LRz\xdc\xa4\xef\x7fm\
-\x88X\xf5\x9f\xa4I\x92$I\x92\x96\xa6\x8f\x9dx\xe2\
-\x95\x86\xbe\xbf\xc1(\xe2\xb6yH~H\xfe\xf59y\
-P~[\x1e\x9a'\xd3C4,\xbc\x88}\xf9y\xf0\
-o\xf9\xd7\xe7\x0e\x11\xbfW\xfe\xc6\xb4q\xd7\xdd\xf0\x9c\
-\xd3N\xbbr}\xcaH\x92$I\x924\x7f\xe5\xa1\xf7\
-\xbbG]\xb7\x91\x87\xde\xdf\xccC\xef\xff\xc9\xbf\xbe:\
-\xff\xb3\xb3/1\x14\x03\x87\x19\x22>\x9e\x9f/\xff\x9c\
-\x9f7\x7f\x92\xff\xf7}'}\xbf1\xe9\xba\xef\xa9O\
--I\x92$I\x92f\xa3\xf2\x03\x9f\xcb_\xe9\x9d\x87\
-\xd9;\xe7!\xf6Qy\x98\xfd\xdb\xfc\xeb\x7f\xe4_\xfd\
-\xa0g\xd8:\xff\x93\x9fW\xef+\xcf\xaf\xf2C\xd5\xf3\
-\xff\xbf\xf3\xa8\xefO*\xcf\xbf\xfaT\x94$I\x92$\
-i\xfb*\x7f\xcd\xfb\xd0u\xa7\x8d\x22\x1e\x90\x07\xd4\xbf\
-\x1a\x22\xde\x95\x87\xd4/N\x0d\xaf\xc0\x0e)\xcf\xbf\xf2\
-<,\xcf\xc7\xf2\xbc,\xcfO?\xd8Z\x92$I\x92\
-t\x5c\x9d\x9b\xd27\x8cR\xfa\x99IJ\xf7\xcc\x83\xe7\
-\x9fgo\xcf\x83\xe7\x17Z\x83)0C\xf2\xf3\xb4<\
-_\xcb\xf3\xb6<\x7f\xcb\xf3\xb8<\x9f\xebS[\x92$\
-I\x92\xa4K\xb6\xb9\xbaz\xddQ\xd7\x9d:D<8\
-{a\x1e.?t\xd8\xb0\x09\xcc\xab\x0f\x95\xe7uy\
-~\x97\xe7\xf9g\xd6\xd6\xbe\xbd>\xf5%I\x92$I\
-\xcb\xd6(\xa5\x1f\x1dR\xbaC\xf6\xb8\xec\xd5\xd9\xde\xc6\
- \x09,\xa0\xf2|/\xcf\xfbIJ\x7f\x98\x7f\xbdC\
-\xb9\x1e\xd4K\x83$I\x92$i\x91\xda{\xfa\xe9W\
-\x1d\xd6\xd6~v\xe8\xba\xfb\x0c\x11O\xcb\xfe=\xfbR\
-kX\x04\x96R\xf9\xd9D\xe5\xba\xf0\xb4I\xc4\xbd\xcb\
-\xf5\xa2\x5c7\xea%D\x92$I\x924/\xe5\xc1\xee\
-;\xb3\xd3\x87\x94\x1e\x9a\xfdm\xf6_\x8d!\x10\xe0\xb2\
-|\xa4^?\x1e\xba/\xa5\x9b\x97\xebJ\xbd\xc4H\x92\
-$I\x92f\xa5\xa1\xefo0t\xdd\x9d\xf2\xd0\xf6\x84\
-\xec\xb5\xd9\xa81\xe0\x01\x1c\xb3r]\x99D\xbc\xe6\xe0\
-u&_o.\xd8\xd8\xf8\xf1z\x09\x92$I\x92$\
-\xedT\xe3\xd5\xd5\xab\x8fR\xba}\x1e\xce\x9e\x91\x9d\xd5\
-\x1a\xe0\x00\xb6[\xb9\xfe\x94\xebP\xb9\x1e\x95\xebR\xbd\
-DI\x92$I\x92\xb6\xaa\xf3WW\xaf2\xe9\xba(\
-\xff\x19G\x1e\xc4^\x9e\x87\xb0az8\x03\xd8M\xf5\
-\xba\xf4\xf2r\x9d*\xd7\xabr\xdd\xaa\x970I\x92$\
-I\xd2\xd1\xb4\x19\xf1\xc3\xe3\x88\xbb\xe4\x01\xeb\xcf\xf3\xa0\
-\xf5\xdeC\x87/\x809\xf0\xde\x83\xd7\xaf|\x1d+\xd7\
-\xb3zi\x93$I\x92$MW\xfe\xa6\x9f\xcd\x94\xfa\
-!\xe2\xf7\xb2W\xe4aj\xdc\x18\xb2\x00\xe6N\xb9\x9e\
-\x1d\xbc\xae\xe5\xeb[\xb9\xce\xf9\x9b\xcd$I\x92$-\
-}\x9bkk\xd7\xcf\x03\xd2\xdd\xf2\xc0\xf4\x17yXz\
-_k\x98\x02X4\xe5zW\xae{\xe5\xfaW\xae\x83\
-\xf5\x92(I\x92$I\x8b[\x1e\x84\xbeq\x12\xb1\x9e\
-\x87\xa2\x87\xe5\x81\xe8\x95\xf9\xff\xef\x9b\x1e\x96\x00\x96\xcc\
-\xa4^\x0f\xcf,\xd7\xc7r\x9d\xac\x97LI\x92$I\
-\x9a\xefF)\xfd\xe88\xe2W\xf3\xb0\xf3\xb4<\xfc\xbc\
-\x7fj\x18\x02\xe0\x92\xde\x7f\xf0z\x99\xaf\x9b\x17\xac\xaf\
-\xffH\xbd\x94J\x92$I\xd2\xecW\xfeZ\xe6I\xdf\
-o\xe4\xc1\xe6\xe1y\xa8yU\xb6\x7fj\xe0\x01\xe0H\
-\x94\xebg\xb9\x8e\xe6\xeb\xe9\xc1\xeb\xaa\xbf\xf6^\x92$\
-I\xd2\xac\x95\x87\x95k\xe4\xc1\xe5\xd6\xa3\x94\x9e\x9c\x7f\
-\xfd\x8f\xc3\x06\x1b\x00\x8e\xdfE\xd7\xd7'ov\xdd/\
-\x94\xebn\xbd\x04K\x92$I\xd2\xceV\xfe\xc4z\xdc\
-\xf7\xb7\xcc\x03\xca\x93\xf2\xa0\xf2\x9eK\x0c.\x00l\xb7\
-\xf7\xe4k\xef\x1f\xe5_ou\xf6Mo\xfaM\xf5\xd2\
-,I\x92$I\xdb\xd3\xe6\xc6\xc6\xd5\x86\x88\xd3\xb3'\
-\x0c)\xbdsj@\x01`\x17\xe4k\xf2\xbb\xf25\xf9\
-\x89C\xd7\xdd\xc2\x0f\xaa\x96$I\x92\xb4e]\x98\xd2\
-7\xe4A\xe3\xb4<p<.\x0f\x1b\xff\xde\x1aH\x00\
-\x98\x0dea?\x89x|\xfe\xf5\xe6{O?\xfd\xaa\
-\xf5R.I\x92$IG\xd6\x85'\x9ex\xa5})\
-\xfd\xfc\x10\xf1\x07y\xb0x{k\xf0\x00`\xb6\x95E\
-~Y\xe8\xef\xeb\xbaS\xcb\x82\xbf^\xe2%I\x92$\
-\xe9\x92]\xb8\xb1\xf1u\x93\x88\xf5<H<:\x0f\x12\
-o\x9d\x1e.\x00\x98_e\xc1_\x16\xfd\xa3\x88S\xce\
-9\xed\xb4+\xd7K\xbf$I\x92\xa4e\xed\xdfO8\
-\xe1k&}\x9f\xf2\xc0\xf0\xc8<,\xbcyz\x88\x00\
-`\x01E\xbcu\x92\xd2cF]\xb7q\xd6\xea\xea\xd7\
-\xd7\x97\x04I\x92$I\x8b\xde\x813\xcf\xbcb\x1e\x08\
-\xba\xec\xf7\xf3p\xf0\xc6\xc3\x86\x05\x00\x96\xc6\x90\xd2[\
-\xf2\xeb\xc1\xa3&)\xf5\x07\xf6\xec\xf9\xda\xfaR!I\
-\x92$i\x91\xda\xbb\xb6vr\x1e\x00\x1e\x9e\x0f\xffo\
-\x98\x1e\x0a\x00`\x88\xf8\xd7QJ\x8f\x9c\xac\xaf\xc7\x81\
-\xd5\xd5\xaf\xae/\x1f\x92$I\x92\xe6\xb1\xf1\xea\xea\xd5\
-\xf3!\xff\xde\xe3\x88\xffh\x0d\x00\x00\xd0\x14\xf1\xc1Q\
-\xc4\x03\xf6\xaf\xae^\xab\xbe\xa4H\x92$I\x9a\xf5>\
-v\xe2\x89W\xca\x07\xfa[\x0d\x11O\xcd\xbf\x9e}\x89\
-C>\x00\x1c\x85\xfcZ\xf2\xc9!\xa5\xbf\x9c\xa4\xb4\xc7\
-_q/I\x92$\xcdhC\xdf\xdf`\x1c\xf1\xa0|\
-x\x7f]\xeb`\x0f\x00\xc7%\xe2MC\xd7=d\xd2\
-\xf7'\xd4\x97\x1eI\x92$I\xbb\xd5\xde\x93N\xbaj\
-\xf9\xd3\xdb!\xa5\xa7\x97?\xcdm\x1e\xe2\x01`\x0b\xe5\
-\xd7\x9bO\xe5_\x9f=\xea\xba_\x9a\x9cz\xea7\xd5\
-\x97$I\x92$I;Q\xf9S\xdaI\xc4\x83\xf3\xc1\
-\xfcM\xd3\x87u\x00\xd81\x11o\xcd\xbf>l3\xe2\
-\xc4\xfa\x12%I\x92$i\xab+\x7f\x1a;\x89\xf8\xc5\
-|\xf8~v\xfdS\xda\xf6\x01\x1d\x00v\xd8\x90\xd28\
-\xff\xfa\xfc\xa1\xeb\xeetnJ\xd7\xae/]\x92$I\
-\x92\x8e\xa7})\xdd$\x1f\xb4\x1f6\x5c\xf4\xa7\xb1\xcd\
-\xc38\x00\xcc\x8a\xfcz\xf5\x8e\xfc\xeb\xff\xce\xbf\xde\xb4\
-\xbe\x94I\x92$I:\xd2\xca\x9f\xb2\x96?m\xcd\x87\
-\xea\xe7\xe7C\xf5p\xe8a\x1b\x00\xe6\xc4\x05\xf95\xec\
-\x85\xe3\xbe\xbf\xeb\xde\x88o\xab/q\x92$I\x92Z\
-\x95?U\xcd\x87\xe8\xff=\x89\xf8\xf7\xa9\x835\x00\xcc\
-\xb3\xf7\xe4\xd7\xb8\xc7\x8e\xbb\xeef\xf5%O\x92$I\
-R\xf9\xd3\xd3\xf2\xa7\xa8\x93\x94^\x90\x0f\xcd\x17L\x1d\
-\xa2\x01`\x91|n\x88x\xf1(\xa5{|6\xe2;\
-\xebK\xa1$I\x92\xb4\x5c\x8d\xd7\xd7\xaf7I\xe9\x0f\
-\x87\x94\xf66\x0e\xcd\x00\xb0\xd0\xea\x0f\xa7~\xf2\xa4\xef\
-\xbf\xaf\xbe4J\x92$I\x8b\xdd\xbe\xae;u\x92\xd2\
-\x9f\x0f\xfe\x061\x008\xb8\x1c\xca\xaf\x89\xcf\x18\xf7\xfd\
--\x0f\xac\xac\x5c\xa1\xbe\x5cJ\x92$I\x8b\xd1\xde\xd3\
-O\xbf\xea\xbe\x94\xee\x90\x0f\xbd/\xca\x87\xdf/\xb6\x0e\
-\xc5\x00\xb0\xecF)\xbdt\x1cq\x97I\xdf_\xa3\xbe\
-\x84J\x92$I\xf3\xd9\x10\xf1\x9dCJ\xbf\x99\x7f}\
-M\xeb\xf0\x0b\x004D\xfcK\xfe\xf5\x8c\xc9\xc6\xc6\xf7\
-\xd6\x97TI\x92$i>\x1a\xfa\xfe\x06C\xc4\x99C\
-J\xef<\xec\xa0\x0b\x00\x1c\x99\x88\xff\x18]\xf4\xb7r\
-\xfed}\x89\x95$I\x92f\xb3\xf1\xda\xda\xc9\xf9\x10\
-\xfb\xa4!\xe2\xac\xc3\x0e\xb6\x00\xc0\xb1\xfa\xc4(\xe2O\
-6S\xea\xebK\xae$I\x92\xb4\xfb\x1d8\xf3\xcc+\
-\x8e#n\x9d\x0f\xac\xcf\xca&\x87\x1c`\x01\x80\xad\x14\
-\xf1\x99!\xa5\xe7\x8f\xba\xeev\x17nl|]})\
-\x96$I\x92v\xb6sVW\xaf\x95\x0f\xa8w\xcb\x07\
-\xd4\xbf?\xec\xd0\x0a\x00l\xb7W\x8c\x22~\xfdS\xeb\
-\xeb\xdfZ_\x9a%I\x92\xa4\xed\xedS\x11\xdf?\x8e\
-x@>\x8c\xbeq\xeap\x0a\x00\xec\xb4\x88\xb7\x0e)\
-\xfd\xce\xe6\xda\xda\xf5\xebK\xb5$I\x92\xb4\xb5M\xfa\
-\xfe\xa7\xf2\xe1\xf3\x91\xf9\xf0\xf9\xbe\xc3\x0e\xa4\x00\xc0n\
-\xfb\xcf!\xe2\x0fF)\xfdL}\xe9\x96$I\x92\x8e\
-\xafI\xc4z>h\xfeiv\xce!\x07O\x00`\x16\
-E|jH\xe9/\x86\xbe?\xad\xbe\x94K\x92$I\
-G\xde\xc7N<\xf1J\x93\x94n\x9f\x0f\x96\x7f\x95\x0f\
-\x96\x9fk\x1e:\x01\x80\x995D|)\xbf\x96\xbf(\
-\xffz\xc7\xcd\x8d\x8d\xab\xd5\x97xI\x92$\xa9\xddY\
-\xab\xab_?t\xdd\x9d\xf2a\xf2e\xd3\x87K\x00`\
-NE\xbc*\xffz\xb7\x03\xab\xabW\xa9/\xf9\x92$\
-I\xd2E\xe5C\xe2WO\xba\xee\x97\xf2\x81\xf1%\x97\
-8D\x02\x00\x8b\xe4\xe5CJ\xbfR\xfe\x8d\xe0z\x04\
-\x90$I\xd2\xb2v`e\xe5\x0a\x93\xbe\xbf]> \
-\xfem\xe3\xe0\x08\x00,\xa0Q\xc4\xdf\x0f}\xff\xcb\x07\
-N8\xe1k\xea\x91@\x92$I\xcb\xd4fJ\xb7\x19\
-RzA\xeb\xb0\x08\x00,\xbe!\xe2\xef\xca\x1f\x0e\x95\
-?$\xaa\xc7\x03I\x92$-r\xe3\xbe\xbfe>\x08\
->?\x1f\x04\xbf<}8\x04\x00\x96O\xf9C\xa2\xf2\
-\x87E\xf5\xa8 I\x92\xa4E+\x1f\xf8n>\x8ex\
-N\xf6\x85\xd6\x81\x10\x00Xb\x11_\xca\xbf>\xbf\xfc\
-\xe1Q=:H\x92$i\xde\x1bE\x9c\x92\x0fz\xcf\
-\x1cR\xfa\xeca\x07@\x00\x80C\x0c\x17\xfd\xe1\xd1\xb3\
-\x87\xbe?\xad\x1e%$I\x924oMR\xea\xf3\xc1\
-\xeei\xf9`\xb7\xff\xd0\xc3\x1e\x00\xc0\xe5\xc9g\x88\xcf\
-\x0c)\xfd\xe5\xa4\xef7\xea\xd1B\x92$I\xb3\xde8\
-\xa2\xcb\x07\xb9\xa7\xe6\x83\xdc\xb8u\xc8\x03\x008b\x11\
-\xfb\xf2\x99\xe2/&\xeb\xebQ\x8f\x1a\x92$I\x9a\xb5\
-\x86\x88\xd5Q\xd7\xfdi>\xb8m6\x0fu\x00\x00\xc7\
-(\x9f3F\xf9\x8c\xf1\x94\xf1\xda\xda\xc9\xf5\xe8!I\
-\x92\xa4\xdd.\x1f\xd2n\x9a\x0fk\x7f\x9c\x9dw\xe8\xe1\
-\x0d\x00`\xcbE\x9c\x9f\x7f}\xf2\xb0\xb6\xf6\xb3\xf5(\
-\x22I\x92\xa4\x9dn\xd4u?=\xa4\xf4\xc4|0;\
-\xe7\x12\x875\x00\x80m6D|\xb2\x9cC\xcay\xa4\
-\x1eM$I\x92\xb4\xdd\x9d\xbf\xbaz\x9d\xba\x0c\xfa\xdc\
-\xf4\x01\x0d\x00`\x87}\xae\x9cK\xca\xf9\xa4\x1eU$\
-I\x92\xb4\xd5\x8d\xfa\xfe;&\x11\xbf;\x8e\xf8`\xe3\
-@\x06\x00\xb0k\x86\x88\xff\x9b=\xf8\xb3\xf9\xbcR\x8f\
-.\x92$I:\xde\x0e\xac\xae~\xf5f\xd7\xdduH\
-\xe9u\xadC\x18\x00\xc0\xac8x^\xe9\xfb\xbb\x1e8\
-\xe1\x84\xaf\xa9G\x19I\x92$\x1dK\xa3\x94~>\x1f\
-\xb0\x9e?}\xe0\x02\x00\x98i\x11\x7f5\x8a8\xa5\x1e\
-i$I\x92t\xa4\xe5\xc3\xd4OL\x22\x1e?D\xec\
-=\xec\x90\x05\x000\x07\x86\x946\x0f\xfe\x1c\xc4\xb5\xb5\
-\x1b\xd5#\x8e$I\x92.\xad\xf2C\x1aG)\xfdV\
->H\xbdw\xfa`\x05\x000\x97\x22\xde7\x8ax\xd0\
-\xde\x88o\xabG\x1eI\x92$\x1d\xda\x90\xd2\x1d\xf2\xa1\
-\xe9U\xcd\xc3\x14\x00\xc0\x9c\xcbg\x9d\x7f\xde\xd7\xf7w\
-:\xb0\xb2r\x85z\xfc\x91$IZ\xee\xc6\x11]\xf6\
-\xac|P\xba\xb0u\x80\x02\x00X(\x11\xcf\x99\xa4\xd4\
-\xd7\xa3\x90$I\xd2\xf25Z_\xff\x91| zL\
->\x1c\x9ds\xd8a\x09\x00`\xb1\x9d7\xa4\xf4\x87\xc3\
-\xda\xda\x8f\xd7\xa3\x91$I\xd2\xe27\xe9\xfbk\x0c\x11\
-\xf7\xcd\xde\xd18 \x01\x00,\x8f\x88wg\xf7?7\
-\xa5k\xd7\xa3\x92$I\xd2b6\xea\xba\xdb\xe5\x03\xd0\
-\xcb\x0e;\x10\x01\x00,\xb1!\xa5W\x0e}\xff\xcb\xf5\
-\xc8$I\x92\xb48\xe5\x83\xce\xcfe\x7f1\x8e\xf8|\
-\xeb \x04\x00\xb0\xec\x86\x88/\xe7\xb3\xd23\xf3\xff^\
-\xabG(I\x92\xa4\xf9m_\xc4\xf7\x8f\x22~?\x1f\
-n>z\xe8\xa1\x07\x00\x80K\xf5\x89\xec\xd1\xfb\xd7\xd6\
-\xae_\x8fT\x92$I\xf3\xd3\xde\x93N\xba\xea\x90\xd2\
-=\xf3\x81\xe6-\x87\x1cp\x00\x008BC\xc4\xbf\x97\
-\x9f\xc3X~\x1ec=bI\x92$\xcdv\x9b\x11'\
-\xe6\x83\x8ce\x10\x00\xc0\x16\x18\x22\xde\x95\xdd\xb4\x1e\xb5\
-$I\x92f\xaf}\xeb\xeb?x\xf0\xafV\x8d\x18Z\
-\x07\x1a\x00\x00\x8eQ\xc4\xa7\xb3?\x1au\xdd\x8f\xd5\xa3\
-\x97$I\xd2l\x94\x0f+w\xce\xdex\x89\xc3\x0b\x00\
-\x00[j\x88x\xdb8\xe2\xeeg\xae\xac\x5c\xb1\x1e\xc3\
-$I\x92v\xa7\xbd]w\xe3|8\xf9\xb3|H\xf9\
-\xe2\xf4\xa1\x05\x00\x80\xed\x91\xcf_O\x1f\xf5\xfdI\xf5\
-H&I\x92\xb4s\x9ds\xdaiW\x1e\xba\xee>\xe3\
-\x88w\xb7\x0e*\x00\x00l\xbb\xf7\x8fR:csc\
-\xe3j\xf5\x88&I\x92\xb4\xbd\xe5\x03\xc8Z\xf6\xbcz\
-\x18\x01\x00`w\xfd\xcd$\xa5\xbe\x1e\xd5$I\x92\xb6\
-\xbe\xf3\xd6\xd6\xbee\x12\xf1\xbbC\xc4\x7f7\x0e#\x00\
-\x00\xec\x9e\xb3\xf3\x19\xed\xf7>\x13\xf1m\xf5\xe8&I\
-\x92\xb45\x0d]w\x8bq\xc4\xdf7\x0e \x00\x00\xcc\
-\x8a\x88\x7f\xccn]\x8fp\x92$I\xc7\xde\xa4\xef\xbf\
-/\x1f0\x1e=\xa4\xb4\xf7\xb0C\x07\x00\x003g\x88\
-\x18&\x11\x7f\xb0w}\xfd\x07\xeb\x91N\x92$\xe9\xe8\
-\xda\x97\xd2\x1d\xf2\xc1\xe2\xf5\xd3\x07\x0d\x00\x00\xe6\xc2\xbf\
-\x0c)\xfdJ=\xdaI\x92$]~\xe3\xae\xbb\xe1(\
-\xe2O\x86\x88\xcf7\x0e\x17\x00\x00\xcc\x8f\xff\x19Rz\
-\xca\xa4\xefO\xa8G=I\x92\xa4\xc3;\xb0g\xcf\xd7\
-\xe6C\xc3=\x87\x88w4\x0e\x14\x00\x00\xcc\xa9|\xbe\
-{\xd7$\xa5{\x9d\xb5\xba\xfa\xf5\xf5\xe8'I\x92t\
-Q\xf9\xa0\xb0\x9a\x0f\x0c\xcf\x9e>@\x00\x00\xb0@\x22\
-\x9e3\xee\xba\x9b\xd5#\xa0$IZ\xe6\xceY]\xbd\
-\xd6(\xe2A\xf9\x90\xf0\xa1\xc3\x0e\x0d\x00\x00,\x9c!\
-\xe2\xc3\xd9o\xef\xcf\xe7\xc0z$\x94$I\xcb\xd6\xd0\
-\xf7\xa7\xe5\x03\xc1\x8b[\x87\x05\x00\x00\x16\xdeK\xcay\
-\xb0\x1e\x0d%I\xd22T\xfe[\xf2|\x08(\x7f\xcd\
-\xfc\x17\xa7\x0e\x06\x00\x00,\x91z\x1e|\xb4\x9f5$\
-I\xd2\x124\x8a8e\x94\xd2\xcb\xa6\x0f\x04\x00\x00,\
-\xafr>,\xe7\xc4zd\x94$I\x8b\xd4\xb9)}\
-C~\xc1\xff\xad!\xe2\xac\xe9C\x00\x00\x00\xd4s\xe2\
-o\x95sc=BJ\x92\xa4yo\xd2\xf7?5\x8e\
-x\xe6\xf4\x0b?\x00\x00\x1c&\x9f\x1b\xcb\xf9\xb1\x1e%\
-%I\xd2\xbc\x96_\xd4\xef2\xa4\xf4o\xcd\x17|\x00\
-\x00h8x~\xcc\xe7\xc8z\xa4\x94$I\xf3\xd4\xa4\
-\xeb\xbe'\xbf\x98?.\xbf\xa8\x7fv\xfaE\x1e\x00\x00\
-\x8e\xc0g\xcby\xb2\x9c+\xeb\x11S\x92$\xcdz\xfb\
-R\xbay~\x11\x7f\xc5\xd4\x8b:\x00\x00\x1c\x8bW\x0c\
-\x11\xa7\xd7\xa3\xa6$I\x9a\xc5\xf2\x8b\xf57N\xfa\xfe\
-\xb7\xc7\x11\x1fk\xbc\x98\x03\x00\xc0\xb1\xc9\xe7\xcb!\xa5\
-\xdf)\xe7\xcdz\xf4\x94$I\xb3\xd2\xa8\xefO\x1aE\
-<\xb7\xf9\x22\x0e\x00\x00[\xa0\x9c7\xcb\xb9\xb3\x1eA\
-%I\xd2n\x97_\x9c\xef>D\xbc\xab\xf5\xc2\x0d\x00\
-\x00[\xe9\xe0\xb93\x9f?\xebQT\x92$\xedF\xfb\
-\xba\xee\x07\xf2\x0b\xf3\x93\x86\x94\xfeg\xfa\xc5\x1a\x00\x00\
-\xb6K=\x7f>\xa9\x9cG\xeb\xd1T\x92$\xedT\xf9\
-E\xf8V\xf9\xc5\xf8\xd5\x87\xbe8\x03\x00\xc0N\xaa\xe7\
-\xd1[\xd5#\xaa$I\xda\xce&}\x7f\x8d\xfc\xe2\xfb\
-\x90q\xc4'\xa7_\x94\x01\x00`\xc7\xe5si9\x9f\
-\x96sj=\xb2J\x92\xa4\xadnX_\xff\xd9\xfc\xa2\
-\xfbW\xcd\x17c\x00\x00\xd8M\xf9\x9cZ\xce\xab\xf5\xe8\
-*I\x92\xb6\xaaI\xc4\xaf\xe7\x17\xdb\xf7\x1e\xf6\xe2\x0b\
-\x00\x00\xb3\xe3\xbd\xe5\xdcZ\x8f\xb0\x92$\xe9x\xda\x5c\
-[\xbb\xfe(\xe2\xff\xe4\x17\xd8/O\xbd\xe0\x02\x00\xc0\
-\xcc\x19R\xba\xb0\x9c_\xcb9\xb6\x1ei%I\xd2\xd1\
-\xb6\x19q\xe2\x10qV\xeb\xc5\x16\x00\x00fY9\xc7\
-\x96\xf3l=\xdaJ\x92\xa4#\xe9}{\xf6|m~\
-!}\xa0\x1f&\x0d\x00\xc0<\x1b\x22\xce\x1dE<\xe8\
-@>\xdf\xd6\xa3\xae$I\xba\xb4&}\xff}\xe3\x8b\
-\xfes\xb1\xe6\x0b+\x00\x00\xcc\x9d\x88?\xd9\x17\xf1\xfd\
-\xf5\xc8+I\x92\xa6\xcb/\x98k\xa3\x88\x7f8\xecE\
-\x14\x00\x00\xe6\xdc(\xa5\x97mv]\xd4\xa3\xaf$I\
-\xfaJ\xf9\x85\xf2\xce\xd9{\x0e}\xe1\x04\x00\x80\x05\xf3\
-\xdeq\xdf\xdf\xb5\x1e\x81%IZ\xee676\xae6\
-D\x9c9\xa44n\xbch\x02\x00\xc0b\x89\xd8\x97\x7f\
-}\xf8\xe4\xa67\xfd\xa6z$\x96$i\xf9\x1au\xdd\
-\x8f\x0d\x11O?\xec\x85\x12\x00\x00\x16\x5c>\x07?c\
-\xe8\xfb\x1b\xd4\xa3\xb1$I\xcb\xd3\xa8\xebN\x1dRz\
-u\xeb\x05\x12\x00\x00\x96\xc1\x10\xf1\xda\xec\xf4zD\x96\
-$i\xf1\x1bu\xddo\x0c)}\xa8\xf5\xc2\x08\x00\x00\
-\xcb$\x9f\x8b\xffk\x12q\xefzT\x96$i1;\
-om\xed[\xf2\x0b\xdf\xa3\x87\x88\xcfO\xbf\x18\x02\x00\
-\xc0\xb2\x1aR\xfab\xf6\x87\x9bkk\xdf^\x8f\xce\x92\
-$-N\x93\xae\xbbq~\xa1{~\xebE\x10\x00\x00\
-8\xb8\x1cz\xc1\xbe\xf5\xf5\x9f\xaeGhI\x92\xe6\xbf\
-q\xdf\xff\xc28\xe2M\xad\x17>\x00\x00\xe0\x10\x11o\
-\x1d\xa5t\xfbz\x94\x96$i>;\xb0\xb2r\x85\xfc\
-\xc2vF~a\xfb\xd8a/v\x00\x00@\xd3\x10q\
-\xee(\xe2A\x07\xf6\xec\xf9\xdaz\xb4\x96$i~\xfa\
-\xec)\xa7|W~A{\xd2\xf4\x0b\x1c\x00\x00p\x84\
-\x22\xfed_\xc4\xf7\xd7#\xb6$I\xb3\xdf\x90\xd2\xcf\
-\x0d\x11\x7f\xd7|a\x03\x00\x00\x8e\xd8(\xa5\x97mv\
-]\xd4\xa3\xb6$I\xb3\xdb\x90\xd2\x1d\x86\x88w\xb4^\
-\xd0\x00\x00\x80c\xf2\xdeq\xdf\xdf\xb5\x1e\xb9%I\x9a\
-\xad\xce9\xed\xb4+O\x22~wHio\xe3E\x0c\
-\x00\x008\x1e\x11\xfb\xf2\xaf\x0f\x9f\xdc\xf4\xa6\xdfT\x8f\
-\xe0\x92$\xed~\xfb\xfb\xfe\x87\x86\x88\xa7\x1e\xf6\xc2\x05\
-\x00\x00l\xa9|\xee~\xc6\xd0\xf77\xa8GqI\x92\
-v\xaf\xf2\xf3\x83\xf2\x8b\xd3\xcb\xa6_\xac\x00\x00\x80m\
-\xf3\xeaI\xdf\xa7z$\x97$i\xe7\xcb/F\xb7\x1a\
-Rz\xcb\xd4\x0b\x14\x00\x00\xb0\xcd\xf29\xfc\x9d\xa3\x94\
-n_\x8f\xe6\x92$\xed\x5c\xf9\x85\xe8n\xf9\x85\xe8C\
-\xd3/N\x00\x00\xc0\x8e9;\x9f\xc9\xefU\x8f\xe8\x92\
-$m\x7f\xf9\xc5\xe7\x81\xd9\xe6!/F\x00\x00\xc0.\
-\x18\x22>=I\xe9\xa1\x17nl|]=\xaeK\x92\
-\xb4\xf5}\xa2\xeb\xae\x99_t\x1e\xdbz1\x02\x00\x00\
-v\xd5\x93\xf6F|[=\xbaK\x92\xb4u\xed\x8b\xf8\
-\xfe!\xe2i\x8d\x17\x1f\x00\x00`\x16D<g\xd4u\
-?V\x8f\xf0\x92$\x1d\x7f\xfb\x22N\x1c\x22\xfe\xae\xf9\
-\xc2\x03\x00\x00\xcc\x8c|n\xff\xc7\xfd\x11\xab\xf5(/\
-I\xd2\xb17\xea\xbaS\xc7\x11oh\xbd\xe0\x00\x00\x00\
-\xb3g\x88x[>\xc3\xdf\xba\x1e\xe9%I:\xfa\x86\
-\xae\xbbS~1y_\xeb\x85\x06\x00\x00\x98a\x11\x1f\
-\xce\xee^\x8f\xf6\x92$\x1dy\xf9\x05\xe4~C\xc4\xb9\
-\xcd\x17\x18\x00\x00`\xe6\xe5\xf3\xfc\x90\xfd\xf6\x99++\
-W\xac\xc7|I\x92.\xbd\xbd'\x9dt\xd5q\xc4\xef\
-g_h\xbd\xb0\x00\x00\x00\xf3e\xe8\xba?\xdc\xbf\xba\
-z\xadz\xe4\x97$\xe9\xf0\xc6\xeb\xeb\xd7\x1b\xa5\xf4\xa7\
-\xad\x17\x12\x00\x00`~\x0d)=}\xdf\xfa\xfa\x0f\xd6\
-\xa3\xbf$I\x177^_\xbfQ~\xa1\xf8\x9b\xd6\x0b\
-\x08\x00\x00\xb0\x10^2\xea\xfb\x93\xea\x08 I\xd2\xca\
-\xca\xa4\xefS~\x81x\xf5\xd4\x0b\x06\x00\x00\xb0x\xde\
-8\xa4t\xf3:\x0aH\x92\x96\xb9QJ\xb7\xcf/\x0a\
-\xefl\xbcX\x00\x00\x00\x0b(\x9f\xff?\x90\xfdJ\x1d\
-\x09$I\xcbX~!\xb8W~Q8{\xfaE\x02\
-\x00\x00Xx\xe7eg\xd4\xd1@\x92\xb4,]\xb8\xb1\
-\xf1u\x93\x94\x1e:D|z\xea\x85\x01\x00\x00X\x12\
-CJ_\x1c\xa5\xf4\xc8<\x17|c\x1d\x15$I\x8b\
-\xdc\xde\x88o\xcb/\x00O\x9a~A\x00\x00\x00\x96\xd3\
-\x10\xf1g\xf9\xd7\xef\xae#\x83$i\x11;\x7fu\xf5\
-*CJ\xaf\x9b~\x11\x00\x00\x00\x96\xde\x1b\xcb\xbcP\
-G\x07I\xd2\x22\xb5\xb9\xb6v\xfd!\xe2\xaf\x1a\x17\x7f\
-\x00\x00\x80\xf2o\x0c\xfd\xdd\xb8\xebnXG\x08I\xd2\
-\x22\x94/\xf0?1\xa4\xf4\xb7\xd3\x17}\x00\x00\x80)\
-\xff\xb0\x99\xd2M\xea(!I\x9a\xe7&}\xffS\xe3\
-\x88\x7fh\x5c\xec\x01\x00\x00\x0e\x17\xf1\xaaam\xedg\
-\xebH!I\x9a\xc7\xf6G\xdct\xc8\x17\xf4\xe6\x85\x1e\
-\x00\x00\xe0R\xd4\x9fE\xbaVG\x0bI\xd2<U.\
-\xe0~\xa84\x00\x00p\xcc\x22\xde4\xea\xba\x8d:b\
-H\x92\xe6\xa1I\xdfo\xe4\x0b\xf8\xbf6/\xec\x00\x00\
-\x00GhH\xe9\xedC\xc4\xe9u\xd4\x90$\xcdrC\
-\xd7\xdd\x22_\xb8\xff\xaduA\x07\x00\x008j\x11\xef\
-\x1e\xf7\xfd/\xd4\x91C\x924\x8b\x8dR\xda\x93/\xda\
-\xef9\xec\x22\x0e\x00\x00p\x1c\x86\x94>0\x8a\xf8\xc5\
-:zH\x92f\xa9\xa1\xef\x7fy\x1c\xf1\xc1\xd6\x05\x1c\
-\x00\x00\xe0x\x0d\x11\x1f\x1eR\xfa\x95:\x82H\x92f\
-\xa1q\xc4]\xf2E\xfa\xbf\xa6/\xda\x00\x00\x00[\xec\
-\xec<\x7f\xfcj\x1dE$I\xbb\xd9(\xa5{\xe4\x0b\
-\xf3\xc7\xa7.\xd4\x00\x00\x00\xdbb\x888wH\xe9\x9e\
-u$\x91$\xedFC\xd7\xdd'_\x90?\xd5\xbaP\
-\x03\x00\x00l\x97!\xa5\xcdq\xc4\xfd\xeah\x22I\xda\
-\xc9\xf2\x05\xf8\xfe\xf9b<\x99\xbe8\x03\x00\x00\xec\x88\
-\x88\xfd\xf9\xd7\xdf\xaa#\x8a$i'\x9a\xa4\xf4;C\
-\xc4g\x0f\xbb(\x03\x00\x00\xec\xa0<\x97|>{p\
-\x1dU$I\xdb\xd5\x0b\xf6\xec\xf9\xaa|\xc1=3\xfb\
-R\xeb\x82\x0c\x00\x00\xb0\xd3\x86\x94\xbe\x9c\x7f}\xf8\x81\
-\xd5\xd5\xaf\xae\xa3\x8b$i+\xfb\xd8\x89'^)_\
-h\x1fy\xe8\xc5\x17\x00\x00`fD<\xea\x9c\xd3N\
-\xbbr\x1da$I[\xd1\x10\xf1\x8d\x93\x94\xfe\xb0y\
-\xe1\x05\x00\x00\x98\x11CJ\x8f+\xf3K\x1de$I\
-\xc7\xd3\xfe\x8d\x8do\x1eG\xfcQ\xeb\x82\x0b\x00\x000\
-s\x22\xfe\xb8\xcc1u\xa4\x91$\x1dK\xe5\xbf\xc9\x9d\
-D\xbc\xb0y\xa1\x05\x00\x00\x98Qe\x8e\xf13\x86$\
-\xe9\x18+\xff\xca\xa5\x7fC\x08\x00\x00\x98[y\x9e\xf1\
-\x9f\x92I\xd2QV~\xa8\xf4\xe0g\x08\x01\x00\x00s\
-\xae\xcc5e\xbe\xa9\xa3\x8e$\xe9\xb2:p\xe6\x99W\
-\xcc\x17O\x7f\xcb\x18\x00\x00\xb0(\x1eY\xe6\x9c:\xf2\
-H\x92.\xad!\xe2\xcc\xc6E\x14\x00\x00`n\x959\
-\xa7\x8e<\x92\xa4VCJ\xbf\x93/\x98_\x9c\xbe\x80\
-\x02\x00\x00\xcc\xb9/\x96y\xa7\x8e>\x92\xa4C\x1bG\
-\xdc?\xfbL\xe3\xe2\x09\x00\x000\xff\xf2\xbc3\xcas\
-O\x1d\x81$I\xa5\xa1\xeb\xee3\xa44n^8\x01\
-\x00\x00\x16D\x99{\xca\xfcSG!IZ\xeeF)\
-\xddc\x888\xbfu\xc1\x04\x00\x00X4e\xfe\x99\xf4\
-\xfd\xaf\xd5\x91H\x92\x96\xb3|A\xbc\xf38\xe2\xe3\xd3\
-\x17I\x00\x00\x80\x85v\xd1\x1ct\xe7:\x1aI\xd2r\
-5\xe9\xba_\x1aR\xfa\xaf\xc3.\x8e\x00\x00\x00K\xa0\
-\xccC\xa3<\x17\xd5\x11I\x92\x96\xa3|\x01\xbc\xcd\x10\
-\xf1\xc1\xe9\x8b\x22\x00\x00\xc02\xa9s\xd1m\xea\xa8$\
-I\x8b]\xbe\xe8\x9d>\x8ax\xcf\xf4\xc5\x10\x00\x00`\
-)E\xbc\xbb\xccIud\x92\xa4\xc5l\xd2\xf7\x1b\xf9\
-\xa2\xf7\xf6\xc3.\x82\x00\x00\x00\xcb\xed\xed\xa3\xae\xdb\xa8\
-\xa3\x93$-V\xf9\x22\xb76\x8ex\xd3\xd4\x85\x0f\x00\
-\x00\x80\xe2\xa2yi\xad\x8eP\x92\xb4\x18\x0d\x117\xcd\
-^{\xd8E\x0f\x00\x00\x80\xff\xaf\xccMe~\xaa\xa3\
-\x94$\xcdw\x9b}\xffS\xf9\xe2\xf6\xca\xe9\x8b\x1d\x00\
-\x00\x00\x87\x1b\xf2\xfc4\xe9\xba\x1b\xd7\x91J\x92\xe6\xb3\
-|A\xfb\x89q\xc4\xdfO_\xe4\x00\x00\x00\xb8\x0cy\
-\x8e\x1a\xfa\xfe\x06u\xb4\x92\xa4\xf9jsm\xed\xfaC\
-J/j^\xe0\x00\x00\x00\xb8LC\xc4\x8b\xf6G\xfc\
-p\x1d\xb1$i>:\xbf\xef\xbfoH\xe9\xf9\xad\x0b\
-\x1b\x00\x00\x00G\xa6\xccU\x93\x93O\xfe\xde:jI\
-\xd2lw`u\xf5\xab\xf3\xc5\xeb\xd5\xd3\x173\x00\x00\
-\x00\x8e\xc9+\xca\x9cUG.I\x9a\xcd\x0e\xec\xd9\xf3\
-\xb5CJOl\x5c\xc4\x00\x00\x008Fe\xce*\xf3\
-V\x1d\xbd$i\xf6\xca\x17\xaa\x87\xb6.`\x00\x00\x00\
-\x1c\x9f2o\xd5\xd1K\x92f\xab|\x81\xbaW\xbeP\
-]0}\xe1\x02\x00\x00`K\x5cP\xe6\xae:\x82I\
-\xd2l4\x8a\xf8\xc5|\x81:{\xea\x82\x05\x00\x00\xc0\
-\xd6:\xbb\xcc_u\x14\x93\xa4\xdd-_\x90\xd6\x87\x88\
-w5.V\x00\x00\x00l\xb12\x7f\x959\xac\x8ed\
-\x92\xb4;M\xba\xee\xc6\xf9\x82\xf4\xda\xd6\x85\x0a\x00\x00\
-\x80\xed1\x89xM\x99\xc7\xeah&I;\xdb\xe4\xe4\
-\x93\xbfw\x88xQ\xeb\x02\x05\x00\x00\xc0\xf6\x9aD\xbc\
-\xb0\xcceuD\x93\xa4\x9dir\xea\xa9\xdf4\xa4\xf4\
-\xe7\xad\x0b\x13\x00\x00\x00;\xe6\xa9e>\xab\xa3\x9a$\
-m\x7fCJ\x8fi\x5c\x8c\x00\x00\x00\xd8ae>\xab\
-\xa3\x9a$mo\xa3\x94\x1e\x98/:\x17\xb6.F\x00\
-\x00\x00\xec\xac2\x9f\x959\xad\x8el\x92\xb4=\x8d#\
-~5_p6[\x17\x22\x00\x00\x00vG\x99\xd3F\
-y^\xab\xa3\x9b$mm\xe3\x88[\xe7\x8b\xcd\x87\xa6\
-/>\x00\x00\x00\xcc\x84\x0f\x95\xb9\xad\x8ep\x92\xb45\
-\x8d\xbb\xeef\xf9\xe2\xf2\xd6\xc6E\x07\x00\x00\x80YQ\
-\xe6\xb6<\xbf\xd5QN\x92\x8e\xafam\xed\xc7\x87\x88\
-W4/8\x00\x00\x00\xcc\x96\x88\x7f,s\x5c\x1d\xe9\
-$\xe9\xd8\xda\xdc\xd8\xb8\xee(\xa5\xe7\x1dv\x91\x01\x00\
-\x00`vE<\xb7\xccsu\xb4\x93\xa4\xa3\xeb\xc0i\
-\xa7]y\x94\xd2\x93\x9b\x17\x18\x00\x00\x00fZ\x99\xe7\
-\xca\x5cWG<I:\xf2\xf2E\xe4\xe1\xd3\x17\x15\x00\
-\x00\x00\xe6\xca\xc3\xeb\x88'IG\xd6\x10q\xdf|\xf1\
-\xf8\xdc\xd4\xc5\x04\x00\x00\x80\xf9\xf2\xb92\xdf\xd5QO\
-\x92.\xbb|\xc1\xb8c\xbep\x9c3u!\x01\x00\x00\
-`>\x9dS\xe6\xbc:\xf2IR\xbbQ\xd7\x9d:\x8e\
-\xf8\x8f\xc6E\x04\x00\x00\x80y\x95\xe7\xbc2\xef\xd5\xd1\
-O\x92.\xd9\xf9\xab\xab\xd7\xc9\x17\x8a\x8f7/ \x00\
-\x00\x00\xcc\xb7<\xef\x95\xb9\xaf\x8e\x80\x92tQ\xe7\xa6\
-tm\x7f\xf5<\x00\x00\xc0b+s_\x99\xff\xea(\
-(I++\xe3\x88GM_,\x00\x00\x00X@y\
-\xfe\xab\xa3\xa0\xa4eo\x92\xd2=\xf2\x85\xe1\xb3\x87]\
-(\x00\x00\x00XD\x9f-s`\x1d\x09%-k\xa3\
-\x94~~\x88\xf8\xbf\x8d\x8b\x04\x00\x00\x00\x0b\xaa\xcc\x81\
-e\x1e\xac\xa3\xa1\xa4ek\xff\xda\xda\xf5\xf3\x85\xe0U\
-\xad\x0b\x04\x00\x00\x00\x8b\xad\xcc\x83e.\xac#\xa2\xa4\
-e\xe9\xfc\xd5\xd5\xabLR\xfa\xf3\xd6\x85\x01\x00\x00\x80\
-\xe5P\xe6\xc22\x1f\xd6QQ\xd224t\xddCZ\
-\x17\x04\x00\x00\x00\x96K\x99\x0f\xeb\xa8(i\xd1\x1b\x22\
-\xee8\xa4\xb4\xd9\xba\x18\x00\x00\x00\xb0\x5c\xca|X\xe6\
-\xc4:2JZ\xd4\xf2\x13}u\x92\xd2;Z\x17\x02\
-\x00\x00\x00\x96S\x99\x13\xcb\xbcXGGI\x8b\xd6x\
-}\xfdz\xf9I\xfe\xe2\xd6\x05\x00\x00\x00\x80\xe5vp\
-^\xccsc\x1d!%-J\x07VV\xae\x90\x9f\xe4\
-O\x9a~\xd2\x03\x00\x00\xc0!\x9eT\xe6\xc7:JJ\
-Z\x84F)\x9d\xd1x\xb2\x03\x00\x00\xc0%\x94\xf9\xb1\
-\x8e\x92\x92\xe6\xbdq\xd7\xfd\xc28\xe2c\xad';\x00\
-\x00\x00\x5cB\x99\x1f\xf3\x1cYGJI\xf3\xda$\xe2\
-'\xf3\x93\xfa\x8d\x87=\xc9\x01\x00\x00\xe0\xd2\xbd\xb1\xcc\
-\x93u\xb4\x944o\x9d\x9b\xd2\xb5G)=o\xea\x89\
-\x0d\x00\x00\x00\x97\xab\xcc\x93e\xae\xac#\xa6\xa4yj\
-\x1c\xf1\xa8\xe9'5\x00\x00\x00\x1c\xb1<W\xd6\x11S\
-\xd2\xbc4I\xe9\x1e\xf9\x09\xfc\xd9\xc3\x9e\xd0\x00\x00\x00\
-p\xe4>[\xe6\xcb:jJ\x9a\xf5F)\xfd\xfc\x10\
-\xf1\x7f\x1bOf\x00\x00\x008*e\xbe,sf\x1d\
-9%\xcdj\xfb\xd7\xd6\xae\x9f\x9f\xb0\xafj=\x91\x01\
-\x00\x00\xe0X\x949\xb3\xcc\x9bu\xf4\x944k\x9d\xbf\
-\xbaz\x95IJ\x7f\xdez\x02\x03\x00\x00\xc0\xf1(\xf3\
-f\x99;\xeb\x08*i\x96\x1a\xba\xee!\xad'.\x00\
-\x00\x00l\x852w\xd6\x11T\xd2\xac4\xee\xba\x9b\x0d\
-)}\xb1\xf5\xa4\x05\x00\x00\x80\xadpp\xee\xcc\xf3g\
-\x1dE%\xedv\xc3\xda\xda\x8f\xe7'\xe7\x1b\xa7\x9f\xac\
-\x00\x00\x00\xb0\x0d\xdeX\xe6\xd0:\x92J\xda\xad\x0e\xec\
-\xd9\xf3U\xe3\x88?k<I\x01\x00\x00`{\xe49\
-\xb4\xcc\xa3u4\x95\xb4\x1b\x0d}\x7f\x9f\xe6\x13\x14\x00\
-\x00\x00\xb6Q\x99G\xebh*i\xa7\xdb\x1b\xd1\x0d\x11\
-\xff\xb7\xf5\xe4\x04\x00\x00\x80\xedT\xe6\xd12\x97\xd6\x11\
-U\xd2Nu\xfe\xea\xeau\x86\x94\xfe\xb6\xf5\xc4\x04\x00\
-\x00\x80\x9dP\xe6\xd22\x9f\xd6QU\xd2N4\x8ex\
-D\xeb\x09\x09\x00\x00\x00;*\xcf\xa7uT\x95\xb4\xdd\
-M\xfa\xfevCJ\x9b\xcd'#\x00\x00\x00\xec\xa02\
-\x9f\x969\xb5\x8e\xac\x92\xb6\xab\x0bR\xfa\xd1q\xc4\x1b\
-ZOD\x00\x00\x00\xd8\x15yN-\xf3j\x1d]%\
-mug\xae\xac\x5cqH\xe9)\xcd' \x00\x00\x00\
-\xec\xa22\xaf\x96\xb9\xb5\x8e\xb0\x92\xb6\xb2!\xe2\xde\xad\
-'\x1e\x00\x00\x00\xcc\x822\xb7\xd6\x11V\xd2V5\xee\
-\xfb\x93\xf3\x13\xec\x03\xd3O8\x00\x00\x00\x98!\x1f(\
-\xf3k\x1de%\x1do\x17\xa4t\xed!\xe2\x85\x8d'\
-\x1b\x00\x00\x00\xcc\x942\xbf\x969\xb6\x8e\xb4\x92\x8e\xa7\
-\xfc\xa4z\xd8\xf4\x93\x0c\x00\x00\x00f\xd8\xc3\xeaH+\
-\xe9X\x1bE\xdcv\x88\xd8\xdbx\x82\x01\x00\x00\xc0L\
-*sl\x99g\xebh+\xe9h\x1b\xad\xaf\xffH~\
-2\xbd~\xfa\xc9\x05\x00\x00\x00s\xe0\xf5e\xae\xad#\
-\xae\xa4\xa3i\x1c\xf1'\x8d'\x15\x00\x00\x00\xcc\x87<\
-\xd7\xd6\x11W\xd2\x916I\xe9\x9e\xcd'\x14\x00\x00\x00\
-\xcc\x912\xdf\xd6QW\xd2\xe55D\xac\x8e#\xde\xd7\
-z2\x01\x00\x00\xc0\x5c\xc9\xf3m\x99s\xeb\xc8+\xe9\
-\xd2\xfa\xe4\xc6\xc67\x0f)\xbd\xa0\xf9D\x02\x00\x00\x80\
-9T\xe6\xdc2\xef\xd6\xd1WR\xab!\xe2\xcc\xd6\x13\
-\x08\x00\x00\x00\xe6Y\x99w\xeb\xe8+i\xba\xfc$\xb9\
-M~\x92\x9c?\xfd\xc4\x01\x00\x00\x80yW\xe7\xdd\xdb\
-\xd4\x11X\xd2W:\x7fu\xf5*\xf9\x09r\xd6\xf4\x93\
-\x06\x00\x00\x00\x16E\x99{\xcb\xfc[GaI\xa5I\
-\xc4\xe3[O\x18\x00\x00\x00X$e\xfe\xad\xa3\xb0\xa4\
-\xfc\x84\xb8\xed8b_\xeb\xc9\x02\x00\x00\x00\x0b%\xcf\
-\xbfe\x0e\xae#\xb1\xb4\xbc\x0d\x11\xdf\x99\xfdS\xf3\x89\
-\x02\x00\x00\x00\x0b\xa8\xcc\xc1e\x1e\xae\xa3\xb1\xb4\x9c\x8d\
-#\x1e\xd1z\x82\x00\x00\x00\xc0B\xcb\xf3p\x1d\x8d\xa5\
-\xe5k\xd4u\xa7\xe6'\xc1'\x9bO\x0e\x00\x00\x00X\
-dy\x1e.sq\x1d\x91\xa5\xe5i_\xd7]s\x88\
-xq\xf3\x89\x01\x00\x00\x00K\xa0\xcc\xc5e>\xae\xa3\
-\xb2\xb4\x1c\x8d#\x1e\xd4zB\x00\x00\x00\xc0R\xc9\xf3\
-q\x1d\x95\xa5\xc5o\xdcu7\x1b\x22>\xdc|2\x00\
-\x00\x00\xc0\x1298\x1f\xe79\xb9\x8e\xcc\xd2\xe2v\xd6\
-\xea\xea\xd7\x8f#\x9e\xd3z\x22\x00\x00\x00\xc0R\xcas\
-r\x99\x97\xeb\xe8,-fC\xc4\xbd\x9bO\x00\x00\x00\
-\x00Xbe^\xae\xa3\xb3\xb4xM\x22~r\x1c\xf1\
-\xee\xd6\x83\x1f\x00\x00\x00\x96Z\x9e\x97\xcb\xdc\x5cGh\
-i\xb1\xca\x0f\xf0?k>\xf0\x01\x00\x00\x80\xb2\x18\xfa\
-\xb3:BK\x8bS~`\xdfe\x88\xf8R\xf3A\x0f\
-\x00\x00\x00\x94\xff\x84\xecKe~\xae\xa3\xb44\xff\xed\
-\x8f\xf8\xe1\xfc\xc0\xfe\xd7\xd6\x03\x1e\x00\x00\x00\xb8X\x99\
-\x9f\xcb\x1c]Gji\xbe\xcb\x0f\xe8\xc7\xb7\x1e\xe8\x00\
-\x00\x00\xc0\xe1\xca\x1c]Gji~\x9b\xa4\xb4g\x1c\
-\xb1\xaf\xf5 \x07\x00\x00\x00\x1a\xf2\x1c]\xe6\xe9:Z\
-K\xf3\xd7\x10\xf1\x9d\xf9\x81\xfc\xaa\xe6\x03\x1c\x00\x00\x00\
-\xb8ty\x9e.su\x1d\xb1\xa5\xf9*?\x80\x1f\xd1\
-|`\x03\x00\x00\x00\x97/\xcf\xd5u\xc4\x96\xe6\xa7}\
-\x11\xa7\x0c\x11\x9fl>\xa8\x01\x00\x00\x80\xcbU\xe6\xea\
-2_\xd7Q[\x9a\xfd\xf6u\xdd5\xf3\x03\xf7\xefZ\
-\x0fh\x00\x00\x00\xe0\xc8\x95\xf9\xba\xcc\xd9u\xe4\x96f\
-\xbbQ\xc4\x83Z\x0fd\x00\x00\x00\xe0\xe8\x959\xbb\x8e\
-\xdc\xd2\xec6D\xacf\x1fn=\x88\x01\x00\x00\x80\xa3\
-W\xe6\xec2o\xd7\xd1[\x9a\xbd\xceZ]\xfd\xfaq\
-\xc4sZ\x0f`\x00\x00\x00\xe08\xe4y\xbb\xcc\xddu\
-\x04\x97f\xab!\xa5;4\x1f\xb8\x00\x00\x00\xc0q+\
-sw\x1d\xc1\xa5\xd9\xe9\xfc\xbe\xff\xbe!\xe2\xcd\xad\x07\
--\x00\x00\x00p\xfc\xca\xdc]\xe6\xef:\x8aK\xb3Q\
-~p>|\xfa\xc1\x0a\x00\x00\x00l\xb9\x87\xd7Q\x5c\
-\xda\xfd\x86\x88\x9bf\xff\xddx\xa0\x02\x00\x00\x00[\xa8\
-\xcc\xdfe\x0e\xaf#\xb9\xb4\xbb\xe5\x07\xe3S[\x0fT\
-\x00\x00\x00`\xeb\x959\xbc\x8e\xe4\xd2\xee\x95\x1f\x8c\xb7\
-\xc9>{\xe8\x83\x13\x00\x00\x00\xd8Ve\x0e\xbfM\x1d\
-\xcd\xa5\x9do\x88\xf8\xc6\xfc |\xe9!\x0fJ\x00\x00\
-\x00`g\xbc\xb4\xcc\xe5uD\x97v\xb6I\xc4\xbd\x1b\
-\x0fJ\x00\x00\x00`\x07\x94\xb9\xbc\x8e\xe8\xd2\xce\xb5o\
-}\xfd\x07\xc7\x11ok=(\x01\x00\x00\x80\x1d\x90\xe7\
-\xf22\x9f\xd7Q]\xda\x99F)=\xb2\xf9\x80\x04\x00\
-\x00\x00vL\x99\xcf\xeb\xa8.m\x7f\xe3\xae\xbb\xd9\x10\
-\xf1\xb1\xd6\x83\x11\x00\x00\x00\xd89\x07\xe7\xf3<\xa7\xd7\
-\x91]\xda\xde\xf2\x03\xee\xe9\xad\x07\x22\x00\x00\x00\xb0\xf3\
-\xca\x9c^Gvi\xfb\x1a\xa5t\xfb!\xa5\xffi=\
-\x08\x01\x00\x00\x80\x9dW\xe6\xf42\xaf\xd7\xd1]\xda\xfa\
-\xf6u\xdd5\xf3\x83\xed\xe5\xd3\x0f>\x00\x00\x00`\xd7\
-\xbd\xbc\xcc\xedu\x84\x97\xb6\xb6q\xc4\xfd\x1a\x0f:\x00\
-\x00\x00`\x16\xe4\xb9\xbd\x8e\xf0\xd2\xd65Z_\xff\x91\
-!\xa5w4\x1ft\x00\x00\x00\xc0\xae+s{\x99\xdf\
-\xeb(/mM\x93\x94\x1e\xd3z\xc0\x01\x00\x00\x00\xb3\
-\xa3\xcc\xefu\x94\x97\x8e\xbfqD\x97\x1fX\xe7L?\
-\xd0\x00\x00\x00\x80\x99sN\x99\xe3\xebH/\x1d_\xf9\
-\xc1\xf4\xcc\xc6\x83\x0c\x00\x00\x00\x98Ey\x8e\xaf#\xbd\
-t\xec\x0d)\xdd!\xbb\xb0\xf9 \x03\x00\x00\x00fN\
-\x99\xe3\xcb<_G{\xe9\xe8;om\xed[\x86\x88\
-W\xb5\x1e`\x00\x00\x00\xc0\xec*\xf3|\x99\xeb\xeb\x88\
-/\x1d]\xe3\x88\x07\xb4\x1eX\x00\x00\x00\xc0\x1c\xc8s\
-}\x1d\xf1\xa5#o\xe8\xfb\x1b\xe4\x07\xd0{\x0e{@\
-\x01\x00\x00\x00\xf3\xe2=e\xbe\xaf\xa3\xbetd\x0d)\
-=\xae\xf1`\x02\x00\x00\x00\xe6H\x99\xef\xeb\xa8/]\
-~\xa3\x94~4?h\xbe\xd8z0\x01\x00\x00\x00\xf3\
-\xa3\xcc\xf7{\xfb\xfe\x87\xea\xc8/]vC\xc4\xd3Z\
-\x0f$\x00\x00\x00`\xfe\x949\xbf\x8e\xfc\xd2\xa57\x8a\
-8%?`\xf6O?\x80\x00\x00\x00\x80\xb9\xb5\xbf\xcc\
-\xfbu\xf4\x97\xda\x8d#\x9e\xd9x\xf0\x00\x00\x00\x00\xf3\
-,\xcf\xfbu\xf4\x97\x0eo\x888=?P>{\xd8\
-\x03\x07\x00\x00\x00\x98w\x9f-s\x7f]\x01H\x97l\
-\x1c\xf1\xdc\xc6\x83\x06\x00\x00\x00X\x04y\xee\xaf+\x00\
-\xe9\xe2\xf2\x03\xe3\xd6\xfe\xc61\x00\x00\x00X\x5c\x07\xe7\
-\xfe<\xff\xd7U\x80tQ\xf9\xc1\xf1\xd7\xd3\x0f\x16\x00\
-\x00\x00`\xe1\xfcu]\x05H++\x93\x88\xdb6\x1e\
-$\x00\x00\x00\xc0\x02*{\x80\xba\x12\xd02w`u\
-\xf5\xab\x87\x94\xfe\xb6\xf5 \x01\x00\x00\x00\x16O\xd9\x03\
-\x94}@]\x0dhY\x9bt\xdd/\xb5\x1e \x00\x00\
-\x00\xc0\xe2*\xfb\x80\xba\x1a\xd02v`u\xf5\xeb\xf3\
-\x03\xe1\xa5\xd3\x0f\x0c\x00\x00\x00`\xe1\xbd\xb4\xec\x05\xea\
-\x8a@\xcb\xd6\x90\xd2\xaf4\x1e\x14\x00\x00\x00\xc0\x12(\
-{\x81\xba\x22\xd02u`u\xf5*\xf9\x01\xf0\xf2\xe9\
-\x07\x04\x00\x00\x00\xb04^^\xf6\x03uU\xa0e)\
-\xdf\xf1w\x9bz \x00\x00\x00\x00\xcb\xe7nuU\xa0\
-ehr\xea\xa9\xdf4\x8exU\xe3\x81\x00\x00\x00\x00\
-,\x93\x88W\x95=A]\x19h\xd1\x9b\xa4t\x8f\xe6\
-\x03\x01\x00\x00\x00X:eOPW\x06Z\xe4\xf6o\
-l|\xf3\x10\xf1\xda\xd6\x83\x00\x00\x00\x00X>eO\
-P\xf6\x05uu\xa0Em\x92\xd2\xbdZ\x0f\x00\x00\x00\
-\x00`y\x95}A]\x1dh\x11\xfb\xf4\xfa\xfa\xb7\x8e\
-#\xfe\xa5u\xe7\x03\x00\x00\x00K,\xe2_\xca\xde\xa0\
-\xae\x10\xb4h\xe5;\xf8~\xcd;\x1e\x00\x00\x00 \xe2\
-~u\x85\xa0E\xea\xb3}\xff\x1d\xf9\x0e~\xf3aw\
-8\x00\x00\x00\xc0E\xde\x5c\xf6\x07u\x95\xa0Ei\x1c\
-\xf1\x80\xc6\x9d\x0d\x00\x00\x00p\xb1\x88\x07\xd4U\x82\x16\
-\xa1\xf3\xba\xee{\xf2\x1d\xfb\xf6\xc3\xeeh\x00\x00\x00\x80\
-Kz{\xd9#\xd4\x95\x82\xe6\xbdI\xc4o7\xeed\
-\x00\x00\x00\x80\xc3\x94=B])h\x9e;ku\xf5\
-\xeb\x87\x94\xf6\xb6\xeed\x00\x00\x00\x80\x86s\xcb>\xa1\
-\xae\x164\xaf\xe5;\xf2\x7fM\xdd\xb1\x00\x00\x00\x00\x97\
-\xe7\x7f\xd5\xd5\x82\xe6\xb1\xf1\xea\xea\xd5\xf3\x9d\xf8\xfa\xa9\
-;\x15\x00\x00\x00\xe0\xb2E\xbca\xd2\xf7\xd7\xa8+\x06\
-\xcd[\xf9N\xbc\xf3aw*\x00\x00\x00\xc0\x91\x88\xb8\
-K]1h\xde\x1a\x22^\xdc\xbcS\x01\x00\x00\x00.\
-\xc7(\xa5\x97\x1eXY\xb9B]3h^\x1a\xba\xee\
-\x16CJ\x17\xb6\xeeT\x00\x00\x00\x80#t\xab\xbaj\
-\xd0\xbc4\xa4\xf4\x97\x8d;\x12\x00\x00\x00\xe0\xc8E<\
-\xb3\xae\x1a4\x0f\xed__\xff\xd9!b\xd4\xbc3\x01\
-\x00\x00\x00\x8e\xdcd\xdc\xf7'\xd7\x95\x83f\xbd!\xe2\
-\xf1\x8d;\x11\x00\x00\x00\xe0X<\xa9\xae\x1c4\xcb]\
-\x90\xd2\x8f\x0e\x11\x1fi\xdc\x81\x00\x00\x00\x00\xc7\xe2\xa3\
-\x9f\xea\xba\x1b\xd6\xd5\x83f\xb5\xa1\xeb\x1e\xd2\xb8\xf3\x00\
-\x00\x00\x00\x8e\xc7\xc3\xea\xeaA\xb3\xd8g\xd6\xd6\xbe}\
-H\xe9\xdf\x1aw\x1c\x00\x00\x00\xc01\x1b\x22\xde5^\
-_\xbf^]Ah\xd6\x9a\xa4t\xcf\xd6\x1d\x07\x00\x00\
-\x00p\xdc\x22\xeeWW\x10\x9a\xa5\xce9\xed\xb4+\x0f\
-\x11\xff\xd4\xbc\xd3\x00\x00\x00\x00\x8e\xd3\x90\xd2\xeb\xc6\xab\
-\xabW\xaf\xab\x08\xcdJ\x93\x88_l\xdda\x00\x00\x00\
-\x00[\xe8\xceu\x15\xa1YiH\xe9o\x1aw\x14\x00\
-\x00\x00\xc0\x96\x19\x22^\x5cW\x11\x9a\x85&}\xbf\x91\
-\xef\x94\xcf\xb7\xee,\x00\x00\x00\x80\xad2\xa4t\xe1\xd0\
-u\xb7\xa8+\x09\xedv\xf9Ny\xca\xf4\x9d\x04\x00\x00\
-\x00\xb0\x1d\x86\x88g\xd4\x95\x84v\xb3})\xdd$\xdf\
-\x19\xe7\xb6\xee$\x00\x00\x00\x80\xad6D\x0c\xd9j]\
-Mh\xb7\x1aG<\xaau\x07\x01\x00\x00\x00l\x97!\
-\xa5'\xd6\xd5\x84v\xa3}]\xf7\x03\xf9\x8ex\xff\xf4\
-\x1d\x03\x00\x00\x00\xb0\x9d\x86\x88\xff\x1e\xfa\xfe\x06uE\
-\xa1\x9d.\xdf\x09\xbf5}\xa7\x00\x00\x00\x00\xec\x84!\
-\xe2\xf7\xea\x8aB;\xd9\xfe\x8d\x8do\x1eG\xbc\xa9u\
-\xa7\x00\x00\x00\x00l\xb7!\xa5w\x0e\x11\xdfYW\x15\
-\xda\xa9\xc6\x11\xbf\xda\xbaC\x00\x00\x00\x00v\xca\x90\xd2\
-o\xd6U\x85v\xa2\x03\xab\xab_\x9do\xf8\x7f\x98\xbe\
-#\x00\x00\x00\x00v\xd2\x10\xf1\xda\xcd\x8d\x8d\xab\xd5\x95\
-\x85\xb6\xbbq\xd7\xfdB\xeb\x8e\x00\x00\x00\x00\xd8iC\
-\xd7\xdd\xa9\xae,\xb4\xdd\x0d\x11\xcfh\xdd\x09\x00\x00\x00\
-\x00;m\x92\xd2\x0b\xea\xcaB\xdb\xd9\xb8\xebn\x98o\
-\xf0s\xa7\xef\x00\x00\x00\x00\x80\xdd0\xa4t\xc1(\xa5\
-\x9f\xa9\xab\x0bmW\xf9\x86\xfe\x9d\xd6\x1d\x00\x00\x00\x00\
-\xb0k\x22~\xbf\xae.\xb4\x1d\x1d8\xed\xb4+\xe7\x1b\
-\xf9\x0d\xcd\x1b\x1f\x00\x00\x00`\x97\x0c)\xfd\xdb\xfe\xd5\
-\xd5k\xd5\x15\x86\xb6\xbaM?`\x1a\x00\x00\x00\x98Q\
-CJw\xa8+\x0cmu\xf9\xc6\xfd\x8b\xd6\x8d\x0e\x00\
-\x00\x00\xb0\xeb\x22\x9e[W\x18\xda\xca.H\xe9G\xf3\
-\x8d\xfb\xf1\xe6\x8d\x0e\x00\x00\x00\xb0\xcb\x86\x946\xf7v\
-\xdd\x8d\xeb*C[\xd58\xe2\x01\xad\x1b\x1c\x00\x00\x00\
-`V\x0c)=\xb4\xae2\xb4\x15\x1d\xd8\xb3\xe7k'\
-)\xfds\xeb\xc6\x06\x00\x00\x00\x98\x15C\xc4\xbf\xee=\
-\xfd\xf4\xab\xd6\x95\x86\x8e\xb7|\x83\x9e\xde\xba\xa1\x01\x00\
-\x00\x00f\xcd$\xa5=u\xa5\xa1\xe3-\xdf\xa0\x7f:\
-}\x03\x03\x00\x00\x00\xcc\xa2IJO\xaf+\x0d\x1dO\
-{\xfb\xfe\x87\x86\x88\xffn\xdd\xc8\x00\x00\x00\x003\xe8\
-\x9cam\xed\xc7\xebjC\xc7\xda8\xe2~\x8d\x1b\x17\
-\x00\x00\x00`\x96=\xb0\xae6t,\x1dXY\xb9b\
-\xbe\x11_9u\xa3\x02\x00\x00\x00\xcc\xb4!\xe2\xb5\x1f\
-\xda\xd8\xf8\xba\xba\xe2\xd0\xd16\x8a8\xa5u\xc3\x02\x00\
-\x00\x00\xcc\xba\xa1\xebnQW\x1c:\xda\xc6\x11\x7f\xdc\
-\xbaQ\x01\x00\x00\x00f\xdd\x90\xd2S\xea\x8aCG\xd3\
-dc\xe3{\xf3\x8d\xf7\xa1\xd6\x8d\x0a\x00\x00\x000\xeb\
-\x86\x88\xb3\xca_\xa0UW\x1d:\xd2\xf2\x0dw\xef\xd6\
-\x0d\x0a\x00\x00\x0007\x22\xeeWW\x1d:\xd2\xf2\x0d\
-\xf7\xb2\xc3nH\x00\x00\x00\x8092\xa4\xf4\xca\xba\xea\
-\xd0\x914\xe9\xfb4D|\xa9uc\x02\x00\x00\x00\xcc\
-\x93I\xdfo\xd4\x95\x87.\xaf!\xe2\x09\xad\x1b\x11\x00\
-\x00\x00`\x0e=\xa9\xae<tY\x0d'\x9f\xfc]C\
-J\x1fh\xdc\x80\x00\x00\x00\x00\xf3\xe8\xfff\xdf]W\
-\x1f\xba\xb4&)\xddc\xea\x86\x03\x00\x00\x00\x98k\xa3\
-\xae\xfb\x8d\xba\xfa\xd0\xa55D\xbc\xb8u\xe3\x01\x00\x00\
-\x00\xcc\xb1\x97\xd6\xd5\x87Z\x8d\xfb\xfe\xe4!\xe2\xf3\x8d\
-\x1b\x0e\x00\x00\x00`~E|!\xff\xbaVW \x9a\
-n\x12\xf1\xd8\xc3n4\x00\x00\x00\x80\x050D\xfcA\
-]\x81\xe8\xd0\x0e\xac\xae~\xf5\x90\xd2\xde\xd6\x8d\x06\x00\
-\x00\x000\xef\xca\xde\xa3\xec?\xea*D_i\x14q\
-\xdb\xd6\x0d\x06\x00\x00\x00\xb0(\xca\xfe\xa3\xaeB\xf4\x95\
-\xf2\x0d\xf3\xa7\xd37\x14\x00\x00\x00\xc0\x82\xf9\xd3\xba\x0a\
-Q\xe9\xd3\xa7\x9cr\x9d!\xe2\x83\x8d\x1b\x0a\x00\x00\x00\
-`a\x94\xfdG\xd9\x83\xd4\x95\x88F\x11\xbf\xd8\xba\xa1\
-\x00\x00\x00\x00\x16M\xd9\x83\xd4\x95\x88\x86\x94\xfe\xbcu\
-#\x01\x00\x00\x00,\x9a\xb2\x07\xa9+\x91\xe5nsc\
-\xe3\xba\xf9\x06\xf9\xd0\xf4\x0d\x04\x00\x00\x00\xb0\xa0>T\
-\xf6!u5\xb2\xbc\x0d\x11wl\xdc8\x00\x00\x00\x00\
-\x0b\xab\xecC\xeajdy\x1bRzz\xeb\xc6\x01\x00\
-\x00\x00XTe\x1fRW#\xcb\xd9x}\xfdzC\
-\xc4\x7f\xb7n\x1c\x00\x00\x00\x80Eup\x1f\xb2\xbe~\
-\xbd\xba\x22Y\xbe\xf2\x8dp\xe7\xe9\x1b\x05\x00\x00\x00`\
-I\xdc\xb9\xaeH\x96\xaf\xfc\xcd?k\xea\xc6\x00\x00\x00\
-\x00X\x16\xcf\xaa+\x92\xe5jr\xf2\xc9\xdf\x9b\xbf\xf9\
-\xb3\xa7n\x0c\x00\x00\x00\x80eqv\xd9\x8f\xd4U\xc9\
-\xf24\x8a\xf8\xd5\xc6\x8d\x01\x00\x00\x00\xb04\xca~\xa4\
-\xaeJ\x96\xa7q\xc4s[7\x06\x00\x00\x00\xc0\xd2\x88\
-xn]\x95,G{O>\xf9\x07\xf37~\xcea\
-7\x04\x00\x00\x00\xc0r9\xa7\xecI\xea\xcad\xf1\x9b\
-\xa4t\x8f\xc6\x8d\x00\x00\x00\x00\xb0t\xca\x9e\xa4\xaeL\
-\x16\xbf!\xe2\xaf[7\x02\x00\x00\x00\xc0\xb2){\x92\
-\xba2Y\xec\xf6\xaf\xad]?\x7f\xc3\xe7M\xdf\x00\x00\
-\x00\x00\x00K\xea\xbc\xb2/\xa9\xab\x93\xc5mH\xe9^\
-\x8do\x1e\x00\x00\x00`i\x95}I]\x9d,n\x93\
-\x88\x17\xb6\xbey\x00\x00\x00\x80eU\xf6%uu\xb2\
-\x98\x0dkk?>\xa4\xb4\xd9\xfa\xe6\x01\x00\x00\x00\x96\
-U\xd9\x97\x94\xbdI]\xa1,^\xf9\x1b\xfc\xcd\xd67\
-\x0e\x00\x00\x00\xb0\xec\xca\xde\xa4\xaeP\x16\xaf!\xe2\xc5\
-\xado\x1a\x00\x00\x00`\xd9\x95\xbdI]\xa1,V\xe3\
-\xae\xbba\xfe\x06'\xd3\xdf0\x00\x00\x00\x00\x07M\xca\
-\xfe\xa4\xaeR\x16\xa7\xfc\x8d\x9d1\xf5\x8d\x02\x00\x00\x00\
-pIg\xd4U\xca\xe24\x8a\xf8\x87\xc67\x0a\x00\x00\
-\x00@U\xf6'u\x95\xb2\x18\x9d\xbf\xbaz\x9d\xd67\
-\x0a\x00\x00\x00\xc0%\x95=J]\xa9\xcc\x7f\x93\xbe\xff\
-\xb5\xd67\x09\x00\x00\x00\xc0%\x95=J]\xa9\xcc\x7f\
-C\xc43Z\xdf$\x00\x00\x00\x00\x97T\xf6(u\xa5\
-2\xdfMN=\xf5\x9b\xc6\x11\x1fl}\x93\x00\x00\x00\
-\x00L\x89\xf8`\xd9\xa7\xd4\xd5\xca\xfc\xb6/\xa5\x9fo\
-~\x83\x00\x00\x00\x004\x95}J]\xad\xcco\xe3\x88\
-G\xb4\xbe9\x00\x00\x00\x00.E\xc4#\xeaje~\
-\xcb\xdf\xc4?5\xbf9\x00\x00\x00\x00\xda\x22\xfe\xa9\xae\
-V\xe6\xb3\x0bR\xfa\xd1\xfc\x8d\x5cp\xd87\x06\x00\x00\
-\x00\xc0e\xb9\xa0\xecU\xea\x8ae\xfe\x1aE\xdc\xbd\xf1\
-M\x01\x00\x00\x00py\x22\xee^W,\xf3\xd7\x90\xd2\
-\xd3\x9b\xdf\x14\x00\x00\x00\x00\x97iH\xe9/\xeb\x8ae\
-\xbe\x1a\x22\xbe1\x7f\x03\x1f\x98\xfe\x86\x00\x00\x00\x008\
-\x22\x1f(\xfb\x95\xbaj\x99\x9fF]\xb7\xd1\xf8f\x00\
-\x00\x00\x008B\x93\xbe\xdf\xa8\xab\x96\xf9)\x7f\xe1\x0f\
-\x9b\xfeF\x00\x00\x00\x008*\x0f\xaf\xab\x96\xf9i\x88\
-xU\xe3\x1b\x01\x00\x00\x00\xe0HE\xbc\xaa\xaeZ\xe6\
-\xa3\xd1\xfa\xfa\x8f\xe4/z\x7f\xf3\x9b\x01\x00\x00\x00\xe0\
-\xc8D\xec/{\x96\xbar\x99\xfd\xf2\x17}\xb7\xc3\xbe\
-\x09\x00\x00\x00\x00\x8e\xda(\xe2W\xeb\xcae\xf6\x1b\x22\
-\x9e\xd6\xfa&\x00\x00\x00\x008:\x93\x88\xa7\xd5\x95\xcb\
-l\xb7\xb9\xb1q\xb5!\xa5\xf7\xb7\xbe\x09\x00\x00\x00\x00\
-\x8e\xda\xfb\xcb\xbe\xa5\xae^f\xb7IJ}\xe3\x8b\x07\
-\x00\x00\x00\xe0\x18\x8d\x22\xd6\xeb\xeaev\x1b\x22\xcel\
-}\xf1\x00\x00\x00\x00\x1c\x9b\xb2o\xa9\xab\x97\xd9mH\
-\xe9\x95\xad/\x1e\x00\x00\x00\x80cS\xf6-u\xf52\
-\x9bm\xae\xad]\x7f\x88\xd8\xd7\xfa\xe2\x01\x00\x00\x008\
-6e\xdfR\xf6.u\x053{\x8d\xfb\xfe\xae\xad/\
-\x1c\x00\x00\x00\x80\xe3\xd4\xf7w\xad+\x98\xd9kH\xe9\
-/\x9a_4\x00\x00\x00\x00\xc7\xa5\xec]\xea\x0af\xb6\
-\xda{\xd2IW\x1d\x22\xde\xd7\xfa\xa2\x01\x00\x00\x008\
->e\xefR\xf6/u\x153;M\xfa>\xb5\xbe`\
-\x00\x00\x00\x00\xb6F\xd9\xbf\xd4U\xcc\xec4D\xfc^\
-\xeb\x8b\x05\x00\x00\x00`k\x94\xfdK]\xc5\xccN\xf9\
-\x0b{\xcb\xf4\x17\x0a\x00\x00\x00\xc0\x96zK]\xc5\xcc\
-F\x9bkk\xdf>D|\xaa\xf1\x85\x02\x00\x00\x00\xb0\
-E\xca\xfe\xa5\xeca\xeaJf\xf7\xdb\x17qJ\xeb\x0b\
-\x05\x00\x00\x00`k\x95=L]\xc9\xec~C\xc4\xef\
-\xb6\xbeH\x00\x00\x00\x00\xb6V\xd9\xc3\xd4\x95\xcc\xee7\
-\xa4\xf4\x82\xd6\x17\x09\x00\x00\x00\xc0\xd6*{\x98\xba\x92\
-\xd9\xdd\x0e\x9cv\xda\x95\xf3\x17\xf3\xa1\xd6\x17\x09\x00\x00\
-\x00\xc0\xd6*{\x98\xb2\x8f\xa9\xab\x99\xddk\xd4\xf7'\
-\xb5\xbe@\x00\x00\x00\x00\xb6G\xd9\xc7\xd4\xd5\xcc\xee5\
-\xa4t\xcf\xd6\x17\x07\x00\x00\x00\xc0\xf6(\xfb\x98\xba\x9a\
-\xd9\xbd\xf2\x17\xf1\xe7\xad/\x0e\x00\x00\x00\x80\xedQ\xf6\
-1u5\xb3{\xe5/\xe4m\xd3_\x18\x00\x00\x00\x00\
-\xdb\xeamu5\xb3;m\xae\xad]\x7f\x1c\xf1\x85\xc6\
-\x17\x06\x00\x00\x00\xc0v\x89\xf8B\xd9\xcb\xd4\x15\xcd\xce\
-7\xea\xba_j~a\x00\x00\x00\x00l\xab\xb2\x97\xa9\
-+\x9a\x9do\x12\xf1\xd8\xd6\x17\x05\x00\x00\x00\xc0\xf6*\
-{\x99\xba\xa2\xd9\xf9\xc6\x11\xafj}Q\x00\x00\x00\x00\
-l\xb3\x88W\xd5\x15\xcd\xce\xb67\xe2\xdb\x86\x88\xf3\x9b\
-_\x14\x00\x00\x00\x00\xdb\xaa\xece\xca~\xa6\xaejv\
-\xaeQ\xc4)\xad/\x08\x00\x00\x00\x80\x9dQ\xf63u\
-U\xb3sMR\xfa\x9d\xd6\x17\x03\x00\x00\x00\xc0\xce(\
-\xfb\x99\xba\xaa\xd9\xb9\x86\x94\xfe\xa6\xf5\xc5\x00\x00\x00\x00\
-\xb03\xca~\xa6\xaejv\xa6sN;\xed\xca\xf9\x93\
-\xfeg\xeb\x8b\x01\x00\x00\x00`g\x94\xfdL\xd9\xd3\xd4\
-\x95\xcd\xf6\xb7o}\xfd\xa7[_\x08\x00\x00\x00\x00;\
-\xab\xeci\xea\xcaf\xfb\x1bu\xddo\xb4\xbe\x08\x00\x00\
-\x00\x00vV\xd9\xd3\xd4\x95\xcd\xf67D<\xb5\xf5E\
-\x00\x00\x00\x00\xb0\xb3\xca\x9e\xa6\xael\xb6\xbf\xfc\xc9\xde\
-\xd6\xfa\x22\x00\x00\x00\x00\xd8YeOSW6\xdb\xdb\
-\xfe\x88\x1f\x1eG|\xbe\xf5E\x00\x00\x00\x00\xb0\xc3\x22\
->_\xf65uu\xb3}\x8d\x22~\xb1\xf9\x05\x00\x00\
-\x00\x00\xb0+\xca\xbe\xa6\xaen\xb6\xaf!\xe2\xb1\xadO\
-\x0e\x00\x00\x00\xc0\xee(\xfb\x9a\xba\xba\xd9\xbe\xf2'z\
-\xe5\xf4'\x06\x00\x00\x00`W\xbd\xb2\xaen\xb6\xa7O\
-\xad\xaf\x7fk\xfe$\xe7M}R\x00\x00\x00\x00v\xd7\
-yeoSW8[\xdf\x10q\xd3\xc6'\x05\x00\x00\
-\x00`\x97\x95\xbdM]\xe1l}C\xdf\xdf\xa7\xf5I\
-\x01\x00\x00\x00\xd8]eoSW8[\xdf(\xe2\xff\
-\xb4>)\x00\x00\x00\x00\xbb\xab\xecm\xea\x0ag\xeb\x1b\
-G\xfcS\xeb\x93\x02\x00\x00\x00\xb0\xcb\x22\xfe\xa9\xaep\
-\xb6\xb6\xb3VW\xbf>\x7f\x82\xb3\x0f\xfb\x84\x00\x00\x00\
-\x00\xcc\x82\xb3\xcb\xfe\xa6\xaer\xb6\xae\xa1\xefo\xd0\xf8\
-d\x00\x00\x00\x00\xcc\x88ac\xe3\xc7\xeb*g\xeb\x9a\
-\xa4\xb4\xa7\xf5\xc9\x00\x00\x00\x00\x98\x0de\x7fSW9\
-[\xd7\xd0u\x0fi}2\x00\x00\x00\x00f\xc3$\xe2\
-\xc1u\x95\xb3u\xe5\x0f\xfc\xec\xe9O\x04\x00\x00\x00\xc0\
-Lyv]\xe5l]C\xc4\xdb\x1a\x9f\x08\x00\x00\x00\
-\x80Y\x11\xf1\xd6\xba\xca\xd9\x9a.H\xe9\xdaCJ\xe3\
-\xe6'\x03\x00\x00\x00`&\x94\xfdM\xd9\xe3\xd4\x95\xce\
-\xf17\xac\xad\xfdl\xeb\x13\x01\x00\x00\x000[\xca\x1e\
-\xa7\xaet\x8e\xbf\xfc\x01\xef6\xfd\x09\x00\x00\x00\x00\x98\
-Iw\xab+\x9d\xe3o\x88\xf8\x83\xc6'\x00\x00\x00\x00\
-`\xc6\x94=N]\xe9\x1c\x7f\xf9\x03\xbed\xfa\x13\x00\
-\x00\x00\x000\x93^RW:\xc7\xdf\x10\xf1\xc1\xc6'\
-\x00\x00\x00\x00`\xc6\x94=N]\xe9\x1c_\x9f\x8a\xf8\
-\xfe!\xa5/\xb7>\x09\x00\x00\x00\x00\xb3\xa5\xecq\xca\
->\xa7\xaev\x8e\xbd}]wj\xeb\x13\x00\x00\x00\x00\
-0\x9bF]wj]\xed\x1c{\xf9\x03\x9d1\xfd\x81\
-\x01\x00\x00\x00\x98i\xff\xab\xaev\x8e\xbdq\xc4\x9f5\
->0\x00\x00\x00\x003j\x88\xf8\xb3\xba\xda9\xf6\x86\
-\x94^\xd7\xfa\xe0\x00\x00\x00\x00\xcc\xa6!\xa5\xd7\xd6\xd5\
-\xce\xb1\xb5\xf7\xa4\x93\xae\x9a?\xd09\xd3\x1f\x18\x00\x00\
-\x00\x80\x99vN\xd9\xeb\xd4\x15\xcf\xd17\xe9\xfb\x13\x1a\
-\x1f\x14\x00\x00\x00\x80\x19W\xf6:u\xc5s\xf4\x8d\xba\
-\xee\x97Z\x1f\x14\x00\x00\x00\x80\xd96\x89\xf8\xc5\xba\xe2\
-9\xfa\xf2\x07x\xd8\xf4\x07\x04\x00\x00\x00`.<\xac\
-\xaex\x8e\xbe\xfc\x9b\x9f?\xf5\xc1\x00\x00\x00\x00\x98\x0f\
-\xcf\xaf+\x9e\xa3o\x88xG\xe3\x03\x02\x00\x00\x000\
-\xe3\xca^\xa7\xaex\x8e\xae\xcd\xb5\xb5o\xcf\x1f\xe0\x82\
-\xe9\x0f\x08\x00\x00\x00\xc0\x5c\xb8\xa0\xecw\xea\xaa\xe7\xc8\
-\x1b\xf7\xfd\xc9\x8d\x0f\x06\x00\x00\x00\xc0\xbc\xe8\xfb\x93\xeb\
-\xaa\xe7\xc8\x1bw\xdd]\x9b\x1f\x0c\x00\x00\x00\x80\xf9\xd0\
-uw\xad\xab\x9e#o\x888\xb3\xf9\xc1\x00\x00\x00\x00\
-\x98\x0be\xbfSW=G^\xfeMOk}0\x00\
-\x00\x00\x00\xe6C\xd9\xef\xd4U\xcf\x91\x97\x7f\xd3\xabZ\
-\x1f\x0c\x00\x00\x00\x80\xb9\xf1\xca\xba\xea9\xf2\x86\x94>\
-\xd0\xf8@\x00\x00\x00\x00\xcc\x8f\xf7\xd7U\xcf\x915^\
-]\xbdz\xfeM\xfb\xa7>\x08\x00\x00\x00\x00\xf3e\x7f\
-\xd9\xf3\xd4\x95\xcf\xe57\xea\xba\x1fk|\x10\x00\x00\x00\
-\x00\xe6L\xd9\xf3\xd4\x95\xcf\xe57\x8a8\xa5\xf5A\x00\
-\x00\x00\x00\x98/e\xcfSW>\x97\xdf(\xa5{\xb4\
->\x08\x00\x00\x00\x00\xf3e\xd2\xf7\xbfVW>\x97\xdf\
-(\xa5\xff\xdd\xfa \x00\x00\x00\x00\xcc\x99\xbe\xff\xfd\xba\
-\xf2\xb9\xfc\xc6\x11\xcfj~\x10\x00\x00\x00\x00\xe6K\xc4\
-3\xeb\xca\xe7\xf2\x9bD\xbc\xa6\xf9A\x00\x00\x00\x00\x98\
-+C\xc4k\xea\xca\xe7\xf2\xcb\xbf\xe1C\xd3\x1f\x00\x00\
-\x00\x00\x80\xb9\xf4\xa1\xba\xf2\xb9\xec\xf6ol|s~\
-\xe7\xcfM\xfdf\x00\x00\x00\x00\xe6\xd3\xe7\xca\xbe\xa7\xae\
-~.\xbd\xf1\xda\xda\x8d\x1a\xbf\x19\x00\x00\x00\x80y\xb5\
-\xb6v\xa3\xba\xfa\xb9\xf4\x86\xae\xbbE\xf37\x03\x00\x00\
-\x000\x97\xca\xbe\xa7\xae~.\xbd!\xe2\xde\xad\xdf\x0c\
-\x00\x00\x00\xc0|\x9a\xa4t\xaf\xba\xfa\xb9\xf4\x86\x88\xc7\
-\xb6~3\x00\x00\x00\x00\xf3i\x92\xd2c\xea\xea\xe7\xd2\
-\xcb\xef\xf8\xbcC\x7f\x13\x00\x00\x00\x00s\xefyu\xf5\
-s\xe9\xe5w\xfa\x97C~\x03\x00\x00\x00\x00\xf3\xef_\
-\xea\xea\xe7\xd2\x1b\x22\xcej\xfcF\x00\x00\x00\x00\xe6T\
-\xd9\xf7\xd4\xd5O\xbb\xbd\x11\xdf\x96\xdf\xe9K\xad\xdf\x0c\
-\x00\x00\x00\xc0|*\xfb\x9e\xb2\xf7\xa9+\xa0\xc3\xdbL\
-\xe9&\xad\xdf\x08\x00\x00\x00\xc0|+{\x9f\xba\x02:\
-\xbc\xfc\xc6\xdb\xb4~\x13\x00\x00\x00\x00\xf3\xad\xec}\xea\
-\x0a\xe8\xf0\xc6]\xf7\xbfZ\xbf\x09\x00\x00\x00\x809\x17\
-q\xbf\xba\x02:\xbcI\xc4\xe3\x9b\xbf\x09\x00\x00\x00\x80\
-\xb96D<\xbe\xae\x80\x0eo\x92\xd2\x0bZ\xbf\x09\x00\
-\x00\x00\x80\xf9V\xf6>u\x05tx\xf9\x1d\xde2\xfd\
-\x1b\x00\x00\x00\x00X\x08o\xa9+\xa0\xc3\x1bR\x1a7\
-~\x03\x00\x00\x00\x00s\xae\xec}\xea\x0a\xe8\x92\xed\xeb\
-\xbak\xb6~\x03\x00\x00\x00\x00\x8b\xa1\xec\x7f\xea*\xe8\
-\xe2\xf6E|\x7f\xeb\x9d\x01\x00\x00\x00X\x0ce\xffS\
-WA\x17\xb7/\xa5\x9b\xb4\xde\x19\x00\x00\x00\x80\xc5P\
-\xf6?u\x15tq\xa3\x88SZ\xef\x0c\x00\x00\x00\xc0\
-b(\xfb\x9f\xba\x0a\xba\xb8!\xa5;\xb4\xde\x19\x00\x00\
-\x00\x80\xc5P\xf6?u\x15tq\xf9\x1f\xfef\xeb\x9d\
-\x01\x00\x00\x00X\x0ce\xffSWA\x17\x97\xdf\xf0\xb0\
-\xe9w\x04\x00\x00\x00`\xa1<\xac\xae\x82..\xff\xc3\
-?\x9ez'\x00\x00\x00\x00\x16\xcb\x1f\xd7U\xd0\xc5\x8d\
-Rz\xde\xd4;\x01\x00\x00\x00\xb0H\x22\x9e[WA\
-\x177D\xbc\xa2\xf9\xce\x00\x00\x00\x00,\x84\xb2\xff\xa9\
-\xab\xa0\x8b\xcb\xff\xf0m\xadw\x06\x00\x00\x00`1\x94\
-\xfdO]\x05]\x5c\xfe\x87\x1fn\xbd3\x00\x00\x00\x00\
-\x8b\xa1\xec\x7f\xea*\xe8\xe2\xf2?\x1c\xb5\xde\x19\x00\x00\
-\x00\x80\xc5P\xf6?u\x15tQ\x93\xbe\xbfF\xeb\x1d\
-\x01\x00\x00\x00X,e\x0fTWB\x07\x97B\xdf\xd7\
-z'\x00\x00\x00\x00\x16K\xd9\x03\xd5\x95\xd0\xca\xcaf\
-J7i\xbd\x13\x00\x00\x00\x00\x8be\xd2\xf7?UW\
-B++\xa3\x94~\xbe\xf5N\x00\x00\x00\x00,\x96\xb2\
-\x07\xaa+\xa1\x95\x95\xa1\xef\x7f\xb9\xf5N\x00\x00\x00\x00\
-,\x96\xb2\x07\xaa+\xa1\x83K\xa1\xfb\xb4\xde\x09\x00\x00\
-\x00\x80\xc52t\xdd}\xeaJ\xe8\xe0_G\x7ff\xeb\
-\x9d\x00\x00\x00\x00X,e\x0fTWB++\xe3\x88\
-?j\xbd\x13\x00\x00\x00\x00\x0b&\xe2\x8f\xeaJ\xe8\xe0\
-R\xe89\xcdw\x02\x00\x00\x00`\xb1D<\xa7\xae\x84\
-\x0e\xfe\xe7c\xff\xd8|'\x00\x00\x00\x00\x16\xcd\xcb\xeb\
-J\xe8\xe0R\xe8\xad\x8dw\x00\x00\x00\x00`\xf1\xbc\xa5\
-\xae\x84VV\x86\x94>\xd4x\x07\x00\x00\x00\x00\x16L\
-\xd9\x03\xd5\x95\xd0\xc1\xa5\xd0f\xeb\x9d\x00\x00\x00\x00X\
-,e\x0ftp!49\xf5\xd4o\xca\xff\xe7\xc2\xd6\
-;\x01\x00\x00\x00\xb0X\xca\x1e\xa8\xec\x83V&\x1b\x1b\
-\xdf\xdbz\x07\x00\x00\x00\x00\x16S\xd9\x07\xadl\xae\xad\
-\xfdT\xeb\x8d\x00\x00\x00\x00,\xa6\xb2\x0fZ\x19w\xdd\
-\xcdZo\x04\x00\x00\x00`Au\xdd\xcd\xca\x0f\x99\xbe\
-y\xf3\x8d\x00\x00\x00\x00,\xa4\xb2\x0fZ\x99D\xdc\xb6\
-\xf5F\x00\x00\x00\x00\x16S\xd9\x07\xad\xe4\xffq\xe7\xe9\
-7\x00\x00\x00\x00\xb0\xd0\xee\xbc2\xea\xba\xdfh\xbc\x01\
-\x00\x00\x00\x80\x05U\xf6A\xe5\xdf\x14:c\xfa\x0d\x00\
-\x00\x00\x00,\xb43\xca\xcf\x14zp\xe3\x0d\x00\x00\x00\
-\x00,\xa8\xb2\x0fZ\x19\xa5\xf4\xc8\xd6\x1b\x01\x00\x00\x00\
-XLe\x1f\xb42D<\xa1\xf5F\x00\x00\x00\x00\x16\
-S\xd9\x07\x95\xa5\xd0\x9f\xb5\xde\x08\x00\x00\x00\xc0\xc2z\
-J\xf9A\xd3\xcf\x9a\xfa\x87\x00\x00\x00\x00,\xb2\x88g\
-\xadLRzA\xf3\x8d\x00\x00\x00\x00,\xa4!\xa5\x17\
-\x94\x7fS\xe8e\xd3o\x00\x00\x00\x00`\xa1\xfdC\xf9\
-\x99B\xafi\xbc\x01\x00\x00\x00\x80\x05U\xf6A+C\
-Joi\xbd\x11\x00\x00\x00\x80\x85\xf5\xe6\xf2o\x0a}\
-\xb8\xf1\x06\x00\x00\x00\x00\x16T\xd9\x07\x95\x9f)\xf4\xde\
-\xe97\x00\x00\x00\x00\xb0\xd0\xde[\x96B\xef\x9f\xfa\x87\
-\x00\x00\x00\x00,\xb6\xf7\x97\x9f)\xf4\x9f\x8d7\x00\x00\
-\x00\x00\xb0\xa0\xca>\xa8\xfcL\xa1\x8f\xb4\xde\x08\x00\x00\
-\x00\xc0b*\xfb\xa0\xb2\x14:\xab\xf5F\x00\x00\x00\x00\
-\x16S\xd9\x07\xad\x8c#>\xd6z#\x00\x00\x00\x00\x0b\
-*\xe2c\xe5\x07M\x9fs\xd8\x1b\x00\x00\x00\x00Xd\
-\xe7\x94\xa5\xd0yS\xff\x10\x00\x00\x00\x80\xc5v^Y\
-\x0a\xed\x9d\xfa\x87\x00\x00\x00\x00,\xb6\xbd\xe5\xaf\xa4\x1f\
-7\xde\x00\x00\x00\x00\xc0\x82*\xfb\xa0\xf2\x83\xa6\xf7\xb7\
-\xde\x08\x00\x00\x00\xc0\x82\x8a\xd8_\x96B\x9fi\xbe\x11\
-\x00\x00\x00\x80\xc5\x14\xf1\x99\xb2\x14\xfa|\xf3\x8d\x00\x00\
-\x00\x00,\xa6\x88\xcf\x97\x9f)\xf4\xc5\xe6\x1b\x01\x00\x00\
-\x00XHe\x1f\xb42D|\xa9\xf5F\x00\x00\x00\x00\
-\x16S\xd9\x07\xf9\xcf\xc7\x00\x00\x00\x00\x96\xcc\x10\xf1\x05\
-?h\x1a\x00\x00\x00`\xd9\x1c\xfcA\xd3)\xf9+\xe9\
-\x01\x00\x00\x00\x96\xcb\xfe\xf2\x83\xa6\xc7\x8d7\x00\x00\x00\
-\x00\xb0\xa0\xca>\xa8,\x856[o\x04\x00\x00\x00`\
-1\x95}P\xf9\xdb\xc7\xceo\xbd\x11\x00\x00\x00\x80\xc5\
-T\xf6Ae)\xf4\xc9\xd6\x1b\x01\x00\x00\x00XLe\
-\x1fT\xfe\xf6\xb1\x8f\xb5\xde\x08\x00\x00\x00\xc0b\x1a\x22\
->^\xfeM\xa1\xb3Zo\x04\x00\x00\x00`1\x95}\
-P\xf9A\xd3\x1fi\xbd\x11\x00\x00\x00\x80\xc5T\xf6A\
-e)\xf4\x9f\xad7\x02\x00\x00\x00\xb0\xb0\xfe\xb3,\x85\
->\xd0x\x03\x00\x00\x00\x00\x8b\xeb\x03\xe5g\x0a\xfdG\
-\xe3\x0d\x00\x00\x00\x00,\xaa\x88\xff(\x7f\xfb\xd8\xbb\x9b\
-o\x04\x00\x00\x00`1E\xbc\xbb\xfc\x9bBom\xbe\
-\x11\x00\x00\x00\x80E\xf5\x96\xf23\x85^\xd7x\x03\x00\
-\x00\x00\x00\x0bj\x88x\xedJ\xfe\x1f/\x9f~\x03\x00\
-\x00\x00\x00\x8bkH\xe9\xe5\xe5\xdf\x14zQ\xeb\x8d\x00\
-\x00\x00\x00,\xa6!\xe2\x85+\xa3\x88\xe7\xb4\xde\x08\x00\
-\x00\x00\xc0\xc2zv\xf9\xdb\xc7\x9e\xdax\x03\x00\x00\x00\
-\x00\x0bj\x88xj\xf9\x99BO\x9a~\x03\x00\x00\x00\
-\x00\x8bkH\xe9\x89\xe5\xdf\x14zT\xeb\x8d\x00\x00\x00\
-\x00,\xa8\x88G\x95\x1f4\xfd\xd0\xe6\x1b\x01\x00\x00\x00\
-XHe\x1fT~\xd0\xf4\x03Zo\x04\x00\x00\x00`\
-AE\xdc\x7fe\x92\xd2=\x9bo\x04\x00\x00\x00`!\
-\x0d)\xdd\xb3\xfcL\xa1\xbb\xb4\xde\x08\x00\x00\x00\xc0\x82\
-\x8a\xb8\xcb\xca(\xa5\xdb7\xdf\x08\x00\x00\x00\xc0B\x9a\
-\xf4\xfd\xedV\x86\x88\xd3[o\x04\x00\x00\x00`1\x95\
-}\xd0\xca\xb8\xebn\xd6z#\x00\x00\x00\x00\x0b\xaa\xeb\
-n\xb6\xb2\x19qb\xf3\x8d\x00\x00\x00\x00,\xa4\xb2\x0f\
-Z\xf9T\xd7\xfd@\xeb\x8d\x00\x00\x00\x00,\xa6\xb2\x0f\
-Z\xd9\xd7u\xd7l\xbd\x11\x00\x00\x00\x80\xc5T\xf6A\
-+\x07VV\xae0D\x0c\xadw\x00\x00\x00\x00`\xb1\
-\x94=P\xd9\x07\xad\x94\xf2\xff\xf9H\xeb\x9d\x00\x00\x00\
-\x00X,e\x0ftp!T\x1aRz{\xeb\x9d\x00\
-\x00\x00\x00X,e\x0fTWB++\xf9\x1f\xbcb\
-\xfa\x1d\x00\x00\x00\x00XH\xaf\xa8+\xa1\x83K\xa1\xe7\
-\x1d\xf2\x06\x00\x00\x00\x00\x16\xd7\xf3\xeaJ\xe8\xe0R\xe8\
-\xc9\x87\xbc\x01\x00\x00\x00\x80\xc5\xf5\xe4\xba\x12:\xb8\x14\
-z\xf8\xd4\x1b\x01\x00\x00\x00XL\x0f\xaf+\xa1\x83\x7f\
-\xfb\xd8}\x1b\xef\x00\x00\x00\x00\xc0\x82){\xa0\xba\x12\
-:\xb8\x14\xbac\xeb\x9d\x00\x00\x00\x00X,e\x0fT\
-WB++\xfb\x22Ni\xbd\x13\x00\x00\x00\x00\x8b\xa5\
-\xec\x81\xeaJ\xe8\xe0R\xe8\xc4\xd6;\x01\x00\x00\x00\xb0\
-X\xca\x1e\xa8\xae\x84VV\xf6u\xdd\x0f\xb4\xde\x09\x00\
-\x00\x00\x80\xc5R\xf6@u%\xb4\xb2\xb2\x7fu\xf5Z\
-\xadw\x02\x00\x00\x00`\xb1\x94=P]\x09\xad\xac\x1c\
-XY\xb9\xe2\x101\xb4\xde\x11\x00\x00\x00\x80\xc5P\xf6\
-?e\x0fTWB\x175\xa4\xf4\x91\xd6;\x03\x00\x00\
-\x00\xb0\x18\xca\xfe\xa7\xae\x82..\xff\xc3\xb7\xb7\xde\x19\
-\x00\x00\x00\x80\xc5P\xf6?u\x15tq\xf9\x1f\xbe\xb2\
-\xf5\xce\x00\x00\x00\x00,\x86\xb2\xff\xa9\xab\xa0\x8b\xcb\xff\
-\xf0\xf9\xadw\x06\x00\x00\x00`1\x94\xfdO]\x05]\
-\x5c~\xc3\x93\xa7\xdf\x11\x00\x00\x00\x80\x85\xf2\xe4\xba\x0a\
-\xba\xb8\xfc\x0f\x1f>\xf5N\x00\x00\x00\x00,\x96\x87\xd7\
-U\xd0\xc5\x0d\x11\xf7m\xbc#\x00\x00\x00\x00\x0b\xa2\xec\
-\x7f\xea*\xe8\xe2\xf2?\xbcc\xeb\x9d\x01\x00\x00\x00X\
-\x0ce\xffSWA\x177\xea\xbaS[\xef\x0c\x00\x00\
-\x00\xc0b(\xfb\x9f\xba\x0a\xba\xb8\xfc\x0f\x7f\xba\xf5\xce\
-\x00\x00\x00\x00,\x86\xb2\xff\xa9\xab\xa0\x8b\xdb{\xf2\xc9\
-?\xd8zg\x00\x00\x00\x00\x16C\xd9\xff\xd4U\xd0\xc5\
-\xed?\xed\xb4k\xb5\xde\x19\x00\x00\x00\x80\xc5P\xf6?\
-u\x15t\xc9\xf2\x1b/\x98~g\x00\x00\x00\x00\x16\xc2\
-\x05u\x05txC\xc4\xdb\x1a\xbf\x01\x00\x00\x00\x809\
-W\xf6>u\x05txCJ/j\xfd&\x00\x00\x00\
-\x00\xe6[\xd9\xfb\xd4\x15\xd0\xe1\xe57>\xb1\xf5\x9b\x00\
-\x00\x00\x00\x98oe\xefSW@\x877\x8a\xb8\x7f\xeb\
-7\x01\x00\x00\x000\xdf\xca\xde\xa7\xae\x80\x0e/\xbf\xf1\
-\xb6\xad\xdf\x04\x00\x00\x00\xc0|+{\x9f\xba\x02:\xbc\
-Q\xd7\xfdt\xeb7\x01\x00\x00\x000\xdf\xf6u\xddO\
-\xd7\x15\xd0\xe1mnl\x5cwH\xe9\xc2\xd6o\x04\x00\
-\x00\x00`>\x95}O\xd9\xfb\xd4\x15P\xbb\xfc\x8eg\
-O\xffF\x00\x00\x00\x00\xe6\xda\xd9u\xf5s\xe9\x8d#\
-\xde\xd4\xf8\x8d\x00\x00\x00\x00\xcc\xa9!\xe2_\xeb\xea\xe7\
-\xd2\xcb\xef\xf4\xd7\xad\xdf\x0c\x00\x00\x00\xc0|*\xfb\x9e\
-\xba\xfa\xb9\xf4\x86\x94\xfe\xb0\xf5\x9b\x01\x00\x00\x00\x98O\
-e\xdfSW?\x97^~\xa7\xdfl\xfdf\x00\x00\x00\
-\x00\xe6S\xd9\xf7\xd4\xd5\xcf\xa5\x97\xdf\xf1V\xd3\xbf\x11\
-\x00\x00\x00\x80\xb9v\xab\xba\xfa\xb9\xf4&\x11?\xd9\xf8\
-\x8d\x00\x00\x00\x00\xcc\xa9\xbd]w\xe3\xba\xfa\xb9\xf4\xce\
-_]\xbd\xce\x90\xd2\xff\xb4>\x00\x00\x00\x00\x00\xf3\xa5\
-\xecy\xca\xbe\xa7\xae~.\xbb\xfc\xce\xff\xd5\xfa \x00\
-\x00\x00\x00\xcc\x97\xb2\xe7\xa9+\x9f\xcb/\xff\x86\xd7O\
-\x7f\x00\x00\x00\x00\x00\xe6\xd2\xeb\xeb\xca\xe7\xf2\x1bG<\
-\xa7\xf1\x01\x00\x00\x00\x00\x983\xa3\x88\xe7\xd6\x95\xcf\xe5\
-7\x8exT\xeb\x83\x00\x00\x00\x000_F]\xf7\xe8\
-\xba\xf2\xb9\xfc\x86\x94\xee\xd9\xfa \x00\x00\x00\x00\xcc\x97\
-\xb2\xe7\xa9+\x9f\xcb/\xbf\xf3\xcd[\x1f\x04\x00\x00\x00\
-\x80\xf9R\xf6<u\xe5s\xf9\xe5\xdf\xf0\x13\xd3\x1f\x00\
-\x00\x00\x00\x80\xb9\xf4\x13u\xe5s\xf9\xed\xeb\xbak\x0e\
-\x11\x9fm|\x10\x00\x00\x00\x00\xe6D\xd9\xef\x94=O\
-]\xf9\x1cYCJ\xff\xd9\xfa`\x00\x00\x00\x00\xcc\x87\
-\xb2\xdf\xa9\xab\x9e#/\xff\xa6\x7fn}0\x00\x00\x00\
-\x00\xe6C\xd9\xef\xd4U\xcf\x917D<\xa3\xf5\xc1\x00\
-\x00\x00\x00\x98\x0fe\xbfSW=G\xde8\xe2\x11\xad\
-\x0f\x06\x00\x00\x00\xc0\x9c\x88xD]\xf5\x1cy\xf97\
-\xdd\xbd\xf9\xc1\x00\x00\x00\x00\x98\x0f\x11w\xaf\xab\x9e#\
-o\x92R\xdf\xfc`\x00\x00\x00\x00\xcc\x85\xb2\xdf\xa9\xab\
-\x9e#o\xbc\xbe~\xbd!\xe2\xf3\xad\x0f\x08\x00\x00\x00\
-\xc0l;\xb8\xd7Y_\xbf^]\xf5\x1c]\xf9\x03\xbc\
-g\xfa\x03\x02\x00\x00\x000\xfbF)\xbd\xb7\xaex\x8e\
-\xbe!\xe2\x85\xad\x0f\x0a\x00\x00\x00\xc0l+{\x9d\xba\
-\xe29\xfaF)=\xb2\xf5A\x01\x00\x00\x00\x98me\
-\xafSW<G\xdf\xd0uwj}P\x00\x00\x00\x00\
-f\xdb\xd0\xf7w\xaa+\x9e\xa3o3\xe2\xc4\xd6\x07\x05\
-\x00\x00\x00`\xb6\x95\xbdN]\xf1\x1c}\x93SO\xfd\
-\xa6!\xe2S\xad\x0f\x0c\x00\x00\x00\xc0l*\xfb\x9c\xb2\
-\xd7\xa9+\x9ec+\x7f\xa07N\x7f`\x00\x00\x00\x00\
-f\xda\x1b\xebj\xe7\xd8\x1b\x22\x9e\xde\xf8\xc0\x00\x00\x00\
-\x00\xcc\xa8\xb2\xcf\xa9\xab\x9dc/\x7f\xa0\x07N\x7f`\
-\x00\x00\x00\x00f\xd7(\xe2Au\xb5s\xec\x8d\xfb\xfe\
-\x96\xad\x0f\x0e\x00\x00\x00\xc0\x8c\xea\xfb[\xd6\xd5\xce\xb1\
-\xb7?\xe2\x87\x9b\x1f\x1c\x00\x00\x00\x80\x99\xb4\xb9\xb6v\
-\xfd\xba\xda9\xf6\x0e\xec\xd9\xf3U\xe3\x88\x0f\xb7>\x01\
-\x00\x00\x00\x00\xb3e\x88\xf8H\xd9\xe7\xd4\xd5\xce\xf1\x95\
-?\xe0\xcb\xa7?\x01\x00\x00\x00\x003\xe9\xe5u\xa5s\
-\xfcM\xfa\xfe\x09\x8dO\x00\x00\x00\x00\xc0\x8c\x19Rz\
-b]\xe9\x1c\x7f\xa3\x88_o}\x12\x00\x00\x00\x00f\
-\xcb$\xe2\xd7\xebJ\xe7\xf8\xdb\x9b\xd2Z\xeb\x93\x00\x00\
-\x00\x000s\xd6\xeaJ\xe7\xf8\xdb\x5c[\xfb\xf6!\xe2\
-\xd3\x8dO\x02\x00\x00\x00\xc0\xac\x88\xf8t\xd9\xe3\xd4\x95\
-\xce\xd64\xa4\xf4\x8e\xe6'\x03\x00\x00\x00`&LR\
-zG]\xe5l]C\xc4_\xb5>\x19\x00\x00\x00\x00\
-\xb3\xa1\xeco\xea*g\xeb\xca\x1f\xf8a\xd3\x9f\x08\x00\
-\x00\x00\x80\x99\xf2\xb0\xba\xca\xd9\xbaF]\xf7K\x8dO\
-\x04\x00\x00\x00\xc0\x8c(\xfb\x9b\xba\xca\xd9\xba&}\x7f\
-B\xeb\x93\x01\x00\x00\x000\x1b\xca\xfe\xa6\xaer\xb6\xae\
-\xbd'\x9dt\xd5!\xe2\x93\xadO\x08\x00\x00\x00\xc0\xee\
-*{\x9b\xb2\xbf\xa9\xab\x9c\xadmH\xe9u\xadO\x0a\
-\x00\x00\x00\xc0\xee*{\x9b\xba\xc2\xd9\xfa\x86\x88\xa7\xb6\
->)\x00\x00\x00\x00\xbb\xab\xecm\xea\x0ag\xeb\xcb\x9f\
-\xe0\x8c\xe9O\x08\x00\x00\x00\xc0L8\xa3\xaep\xb6\xbe\
-\xcd\xae\x8b\xc6'\x04\x00\x00\x00`\x97\x95\xbdM]\xe1\
-l}\xc3\xc9'\x7f\xd7\x101\xb4>1\x00\x00\x00\x00\
-\xbb\xa3\xeck\xca\xde\xa6\xaep\xb6\xa7!\xa5\xd7\xb6>\
-9\x00\x00\x00\x00\xbb\xa3\xeck\xea\xeaf\xfb\xca\x9f\xe4\
-\x89\xadO\x0e\x00\x00\x00\xc0\xee(\xfb\x9a\xba\xba\xd9\xbe\
-\xf2'\xf9\x95\xd6'\x07\x00\x00\x00`w\x94}M]\
-\xddl_C\xdf\xdf \x7f\xa2\x0b[_\x00\x00\x00\x00\
-\x00;\xab\xeci\xca\xbe\xa6\xaen\xb6\xb7!\xe2]\xad\
-/\x02\x00\x00\x00\x80\x9dU\xf64ue\xb3\xfd\xe5O\
-\xf6\x8c\xd6\x17\x01\x00\x00\x00\xc0\xce*{\x9a\xba\xb2\xd9\
-\xfe\xf2'\xbbo\xeb\x8b\x00\x00\x00\x00`g\x95=M\
-]\xd9l\x7f\xf9\x93\xad\xb6\xbe\x08\x00\x00\x00\x00vV\
-\xd9\xd3\xd4\x95\xcd\xf67^]\xbdz\xfe\x84g\xb5\xbe\
-\x10\x00\x00\x00\x00v\xc6\xc1\xfd\xcc\xea\xea\xd5\xeb\xcaf\
-g\xca\x9f\xf4\xc5\xad/\x06\x00\x00\x00\x80\x9dQ\xf63\
-uU\xb3s\xe5Ozf\xeb\x8b\x01\x00\x00\x00`g\
-\x94\xfdL]\xd5\xec\x5c\xc3\xfa\xfa-Z_\x0c\x00\x00\
-\x00\x00;\xa3\xecg\xea\xaaf\xe7\x1a\xaf\xaf_oH\
-i\xdc\xfa\x82\x00\x00\x00\x00\xd8^\x07\xf72\xeb\xeb\xd7\
-\xab\xab\x9a\x9d-\x7f\xf2\xd7\xb5\xbe(\x00\x00\x00\x00\xb6\
-W\xd9\xcb\xd4\x15\xcd\xce\x97?\xf9\x13[_\x14\x00\x00\
-\x00\x00\xdb\xab\xece\xea\x8af\xe7\xcb_\xc0\x9d\xa7\xbf\
- \x00\x00\x00\x00v\xc4\x9d\xeb\x8af\xe7\xcb\x9f\xfc'\
-\xa6\xbe\x18\x00\x00\x00\x00v\xc6O\xd4\x15\xcd\xee4D\
-\xbc\xab\xf1E\x01\x00\x00\x00\xb0M\xca>\xa6\xaefv\
-\xafq\xc43[_\x1c\x00\x00\x00\x00\xdb$\xe2\x99u\
-5\xb3{\xe5/\xe2~\xcd/\x0e\x00\x00\x00\x80\xed\x11\
-q\xbf\xba\x9a\xd9\xbd\xc6]w\xb3\xe6\x17\x07\x00\x00\x00\
-\xc0\xf6\xe8\xba\x9b\xd5\xd5\xcc\xee5^]\xbd\xfa8\xe2\
-\xa3\xcd/\x10\x00\x00\x00\x80\xadU\xf60\xab\xabW\xaf\
-\xab\x99\xdd-\x7fA/9\xec\x0b\x04\x00\x00\x00`;\
-\xbc\xa4\xaedv\xbf\xfc\xc5<l\xea\x8b\x03\x00\x00\x00\
-`{<\xac\xaedv\xbfq\xdf\xdf\xb2\xf1\x05\x02\x00\
-\x00\x00\xb0\xd5\xfa\xfe\x96u%\xb3\xfb\x9d\x9b\xd2w\xe7\
-/jr\xd8\x17\x09\x00\x00\x00\xc0V\x9a\x94=L]\
-\xc9\xccFC\xc4\xbb\x1a_(\x00\x00\x00\x00[\xa4\xec\
-_\xea*fv\xca_\xd8#\xa7\xbfP\x00\x00\x00\x00\
-\xb6\xd4#\xeb*fv\xda\xd7\xf7\xa75\xbeP\x00\x00\
-\x00\x00\xb6H\xd9\xbf\xd4U\xcc\xect\xce\xea\xea\xb5\x86\
-\x88\x0f\xb7\xbe`\x00\x00\x00\x00\x8eO\xd9\xbb\x94\xfdK\
-]\xc5\xccV\xf9\x0b|\xf6\xf4\x17\x0c\x00\x00\x00\xc0\x96\
-xv]\xc1\xcc^\x93\xbe\xff\x8d\xc6\x17\x0c\x00\x00\x00\
-\xc0q\x9at\xddo\xd4\x15\xcc\xec5\xee\xba\x1b\x0e\x11\
-\x9fo}\xe1\x00\x00\x00\x00\x1c\x9b\x83\xfb\x96\xae\xbba\
-]\xc1\xccfCJ\xafk}\xf1\x00\x00\x00\x00\x1c\x9b\
-\xb2o\xa9\xab\x97\xd9m\x1c\xf1\xa8\xd6\x17\x0f\x00\x00\x00\
-\xc01\x8axT]\xbd\xccnC\xc4\xe9\xcd/\x1e\x00\
-\x00\x00\x80cR\xf6-u\xf52\xbb\xed\xdf\xd8\xf8\xe6\
-!\xa5\x8f\xb4\xbe\x01\x00\x00\x00\x00\x8e\xce\x10\xf1\x91\xb2\
-o\xa9\xab\x97\xd9n\x1c\xf1\x9c\xd67\x01\x00\x00\x00\xc0\
-Q\x8axN]\xb9\xcc~CJ\xf7j~\x13\x00\x00\
-\x00\x00\x1c\x95IJ\xf7\xac+\x97\xd9o\xbc\xbe~\xa3\
-!\xe2\x0b\xado\x04\x00\x00\x00\x80#sp\xbf\xb2\xbe\
-~\xa3\xbar\x99\x8f\xf2\x17\xfe\xfa\xe9o\x04\x00\x00\x00\
-\x80\xa3\xf2\xfa\xbaj\x99\x9f\x86\x94\x1e\xd3\xf8F\x00\x00\
-\x00\x008r\x8f\xae\xab\x96\xf9i\xe8\xba[4\xbe\x11\
-\x00\x00\x00\x00\x8eP\xd9\xaf\xd4U\xcb\xfct\xde\xda\xda\
-\xb7\x0c)\xfdW\xeb\x1b\x02\x00\x00\x00\xe0\xb2\x95\xbd\xca\
-\x05)]\xbb\xaeZ\xe6\xabQJ\xcf\x9b\xfe\x86\x00\x00\
-\x00\x008\x02\x11\xcf\xad+\x96\xf9k\x88\xb8w\xf3\x9b\
-\x02\x00\x00\x00\xe02\x95\xbdJ]\xb1\xcc_{#~\
-rH\xe9\x7fZ\xdf\x18\x00\x00\x00\x00me\x9f2\xe9\
-\xfb\x13\xea\x8ae>\x1bG\xbc\xa1\xf5\xcd\x01\x00\x00\x00\
-p)\x22\xdePW+\xf3\xdb\x10\xf1\xd8\xe67\x07\x00\
-\x00\x00@S\xd9\xa7\xd4\xd5\xca\xfc6\xee\xfb[\xb6\xbe\
-9\x00\x00\x00\x00.E\xdf\xdf\xb2\xaeV\xe6\xb7\xf3W\
-W\xaf3D\xfcw\xf3\x1b\x04\x00\x00\x00\xe0\x12\xca\x1e\
-\xa5\xecS\xeaje\xbe\x1bRz~\xeb\x9b\x04\x00\x00\
-\x00\xe0\x92\xca\x1e\xa5\xaeT\xe6\xbf\xa1\xef\xef\xd3\xfa&\
-\x01\x00\x00\x00\xb8\xa4\xb2G\xa9+\x95\xf9o\xbc\xbe~\
-\xbd\xd67\x09\x00\x00\x00\xc0\x94\xf5\xf5\xeb\xd5\x95\xcab\
-4D\xbc\xba\xf9\x8d\x02\x00\x00\x00pP\xd9\x9f\xd4U\
-\xca\xe2\x94\xbf\xa9\xdfm}\xb3\x00\x00\x00\x00\x5c\xa4\xec\
-O\xea*eq\xda\xb7\xbe\xfe\xd3\xf9\x1b\xfb|\xeb\x1b\
-\x06\x00\x00\x00XveoR\xf6'u\x95\xb2X\xe5\
-o\xf0\x15\xd3\xdf0\x00\x00\x00\x00\x07\xbd\xa2\xaeP\x16\
-\xaf\xfc\xcd=p\xea\x9b\x05\x00\x00\x00\xe0\x22\x0f\xac+\
-\x94\xc5k\xb3\xef\x7fj\x1c\xf1\xe9\xc67\x0d\x00\x00\x00\
-\xb0\xbc\x22>]\xf6&u\x85\xb2\x98\xe5o\xf4\x1f\x0e\
-\xfb\xc6\x01\x00\x00\x00\x96\xdb?\xd4\xd5\xc9\xe26\x8e\xb8\
-\x7f\xe3\x1b\x07\x00\x00\x00X^\x11\xf7\xaf\xab\x93\xc5m\
-\xbc\xbe~\xa3!b_\xf3\x06\x00\x00\x00\x00X2\x07\
-\xf7$\xeb\xeb7\xaa\xab\x93\xc5.\x7f\xc3/\x99\xbe\x01\
-\x00\x00\x00\x00\x96\xd4K\xea\xcad\xf1\x1b\x22\xee\xdb\xb8\
-\x01\x00\x00\x00\x00\x96N\xd9\x93\xd4\x95\xc9\xe27\xf4\xfd\
-\x0d\xf27<j\xdd\x10\x00\x00\x00\x00\xcb\xa2\xecG\xca\
-\x9e\xa4\xaeL\x96\xa3IJ/j\xdd\x18\x00\x00\x00\x00\
-\xcb\xa2\xecG\xea\xaady\x1a\x22\xee\xdd\xba1\x00\x00\
-\x00\x00\x96E\xd9\x8f\xd4U\xc9\xf24Z_\xff\x91q\
-\xc4\xf9\xad\x1b\x04\x00\x00\x00`\xe1E\x9c_\xf6#u\
-U\xb2\x5c\x0d)\xfdM\xf3F\x01\x00\x00\x00Xpe\
-/RW$\xcb\xd7$\xe2\xd7[7\x0a\x00\x00\x00\xc0\
-\xa2+{\x91\xba\x22Y\xbe\xf6\xf6\xfd\x0f\x0d\x11\x9fl\
-\xdd0\x00\x00\x00\x00\x8b\xaa\xecC\xca^\xa4\xaeH\x96\
-\xb3|C<\xef\xd0\x1b\x05\x00\x00\x00`\x09<\xaf\xae\
-F\x96\xb7Q\xc4\xdd\xa7n\x14\x00\x00\x00\x80\x85V\xf6\
-!u5\xb2\xbcM\xfa\xfe\xfb\xc6\x11\x1fk\xdd@\x00\
-\x00\x00\x00\x0b'\xe2ce\x1fRW#\xcb]\xbeA\
-\x9e}\xd8\x0d\x04\x00\x00\x00\xb0\x98\x9e]W\x22\x1aG\
-\xdc\xa5q\x03\x01\x00\x00\x00,\x9e\x88\xbb\xd4\x95\x88\xce\
-M\xe9\xbb\x87\x88\xb3\x9a7\x14\x00\x00\x00\xc0\x82(\xfb\
-\x8f\xb2\x07\xa9+\x11\x95\x86\x94\xfe\xb2uc\x01\x00\x00\
-\x00,\x8a\xb2\xff\xa8\xab\x10}\xa5\xa1\xeb\xee\xd4\xba\xb1\
-\x00\x00\x00\x00\x16E\xd9\x7f\xd4U\x88\xbe\xd2Y\xab\xab\
-_\x9fo\x9c\x0b\xa6o,\x00\x00\x00\x80\x05qA\xd9\
-\x7f\xd4U\x88\x0e-\xdf8\x7f<uc\x01\x00\x00\x00\
-,\x8a'\xd7\x15\x88\xa6\x1bE\x9c\xd2\xb8\xc1\x00\x00\x00\
-\x00\xe6\xde\xa8\xebN\xad+\x10Mw`e\xe5\x8aC\
-\xc4\xabZ7\x1c\x00\x00\x00\xc0\xbc\x1a\x22\xfe\xe9\xc0\x9e\
-=_UW j5\x8e\xb8_\xeb\xc6\x03\x00\x00\x00\
-\x98cg\xd4\xd5\x87.\xad\xfd}\xffC\xe5\xef\xeco\
-\xdcx\x00\x00\x00\x00\xf3\xe8\xec\xcd\xb5\xb5\xeb\xd7\xd5\x87\
-.\xab!\xa5\xa74n@\x00\x00\x00\x80\xf9\x13\xf1\xd4\
-\xba\xf2\xd0\xe5\xb5/\xe2\xf4\xe6\x8d\x08\x00\x00\x000\x7f\
-nUW\x1e\xba\xbc\x0e\xec\xd9\xf3\xb5C\xc4k\x1a7\
-\x22\x00\x00\x00\xc0\xfc\x88x\xc3\x85\xb7\xb9\xcd\x95\xea\xca\
-CG\xd2(\xa5\xdfj\xde\x98\x00\x00\x00\x00sbH\
-\xe9w\xea\xaaCG\xda\xa8\xeb~l\x1c\xf1\xf1\xd6\x0d\
-\x0a\x00\x00\x000\xeb\x86\x94\xce\x1bw\xdd\x0d\xeb\xaaC\
-GS\xbe\xf1\xfe\xa2u\xa3\x02\x00\x00\x00\xcc\xbc\x88g\
-\xd6\x15\x87\x8e\xb6q\xd7\xfdB\xf3F\x05\x00\x00\x00\x98\
-q\xa3\x94n_W\x1c:\xda\xceM\xe9\x1b\xca\x0fd\
-j\xdd\xb0\x00\x00\x00\x003\xec-\xe3\xd5\xd5\xab\xd7\x15\
-\x87\x8e\xa5IJ\xbf\xd3\xb8a\x01\x00\x00\x00f\xd6\x10\
-qf]m\xe8X+?\x90\xe9\xe0\x0ffj\xdc\xc0\
-\x00\x00\x00\x00\xb3fHi\xd8\x97\xd2M\xeajC\xc7\
-\xd3\x10\xf1\x8c\xd6\x8d\x0c\x00\x00\x000\x83\x9e_W\x1a\
-:\xde&}\x7f\xbb\xc6\x0d\x0c\x00\x00\x000s\x86\xbe\
-\xbfS]i\xe8x\x1b\x22\xbe1{s\xeb\x86\x06\x00\
-\x00\x00\x98\x15CJ\xef\xbc \xa5k\xd7\x95\x86\xb6\xa2\
-!\xe2\xf7Z76\x00\x00\x00\xc0\xac\x18E<\xaa\xae\
-2\xb4UM\xba\xee\xc6CJ\x9b\xad\x1b\x1c\x00\x00\x00\
-`\xd7E|fH\xe9\xe7\xea*C[\xd9(\xe2\xb9\
-\xcd\x1b\x1d\x00\x00\x00`\x97\x0d)\xfdm]ah\xab\
-\xcb7\xee\x1dZ7:\x00\x00\x00\xc0\xae\x8b\xb8{]\
-ah\xab;gu\xf5ZCJoo\xde\xf0\x00\x00\
-\x00\x00\xbb%\xe2}\xa3\xbe\xff\x8e\xba\xc2\xd0v\x94o\
-\xe4G4o|\x00\x00\x00\x80]2\xa4\xf4\xb8\xba\xba\
-\xd0v5\xea\xfb\x93\xf2\x8d=\x99\xbe\xf1\x01\x00\x00\x00\
-v\xc3\x10\xf1\xa5I\xd7E]]h;\xcb7\xf6_\
-\xb7\xee\x04\x00\x00\x00\x80]\xf0\x0fue\xa1\xedn\x88\
-\xb8c\xe3\x0e\x00\x00\x00\x00\xd8q\xa3\x88_\xaf+\x0b\
-mw\x17\x9e~\xfaU\x87\x88\xd7\xb4\xee\x08\x00\x00\x00\
-\x80\x1d\xf4\x96\xf3WW\xafSW\x16\xda\x89&}\x7f\
-\x9f\xc6\x1d\x01\x00\x00\x00\xb0s\x22\x1eTW\x15\xda\xa9\
-\x86\x88\xef\x1cRzg\xf3\x0e\x01\x00\x00\x00\xd8n\x11\
-\x1f\xdc\xdb\xf7?TW\x15\xda\xc9\x86\x88\xdfk\xde)\
-\x00\x00\x00\x00\xdb\xef\xd1uE\xa1\x9dn\xe8\xfb\x1b\x0c\
-\x11\xff\xdd\xb8S\x00\x00\x00\x00\xb6\xcd\x10q\xee\xbe\x94\
-nRW\x14\xda\x8d\x86\x94\x9e\xd8\xbas\x00\x00\x00\x00\
-\xb6\xd1S\xeajB\xbb\xd5\xb8\xebn6\xa44n\xdc\
-9\x00\x00\x00\x00[nH\xe9s\x93\x88\xf5\xba\x9a\xd0\
-n6\x8exf\xebN\x02\x00\x00\x00\xd8jC\xc4_\
-\xd5\x95\x84v\xbbq\xdf\xdf\xb2u'\x01\x00\x00\x00l\
-\xb5I\xdf\xdf\xae\xae$\xb4\xdb\x1dXY\xb9B\xbeS\
-^2}'\x01\x00\x00\x00l\xa5!\xe2\x15g\xad\xae\
-~}]Ih\x16\x1aG\xdc\xa5ug\x01\x00\x00\x00\
-l\x95IJ\xf7\xa8\xab\x08\xcdJ\x93\xbe\xbf\xc68\xe2\
-\x0d\xad;\x0c\x00\x00\x00\xe0x\x0d)\xbd\xe5\x82\xb5\xb5\
-o\xa9\xab\x08\xcdR\xf9\x0e:c\xfa\x0e\x03\x00\x00\x00\
-\xd8\x0a\xa3\x88\x07\xd5\x15\x84f\xadI\xd7}O\xbe\x93\
-\xde;}\xa7\x01\x00\x00\x00\x1c\xa7\x0f\xec[_\xff\xc1\
-\xba\x82\xd0,6\x8exD\xe3\x8e\x03\x00\x00\x008f\
-\xa3\xae{t]=hV\x9b\xf4\xfd\x09C\xc4\xc7[\
-w \x00\x00\x00\xc0Q\x8b\xf8\xe4\xbe\x94nRW\x0f\
-\x9a\xe5\xf2\x1d\xf6\xe4\xc3\xee@\x00\x00\x00\x80c0\xa4\
-\xf4\x94\xbar\xd0\xac7\xe9\xba\xc8w\xda\x05\xd3w\x22\
-\x00\x00\x00\xc0Q\xfa\xec$b\xbd\xae\x1c4\x0f\x8d#\
-\x9e\xdb\xb8#\x01\x00\x00\x00\x8e\xc6\xf3\xeb\xaaA\xf3\xd2\
-(\xa5=\x8d;\x12\x00\x00\x00\xe0\x88\x8d\xfa\xfevu\
-\xd5\xa0y\xe9\xc0\x09'|\xcd\x90\xd2\xcb[w(\x00\
-\x00\x00\xc0\xe5\x8a\xf8\xc7\x0b76\xbe\xae\xae\x1a4O\
-\xe5;\xef\xee\xcd;\x15\x00\x00\x00\xe0r\x8cR\xbaG\
-]1h\xde\xba \xa5k\x8f#\xfe\xb5u\xc7\x02\x00\
-\x00\x00\x5c\x867_\xb0\xb6\xf6-u\xc5\xa0y,\xdf\
-\x89\x0f\x9c\xbaS\x01\x00\x00\x00.\xd3(\xe2Au\xb5\
-\xa0ym\xbc\xbaz\xf5!\xa5q\xeb\x0e\x06\x00\x00\x00\
-\x98vp\x8f\xb0\xbaz\xf5\xbaZ\xd0<7D\xfc^\
-\xebN\x06\x00\x00\x00\x98V\xf6\x08u\xa5\xa0yo\xdf\
-\xfa\xfa\x0f\x8e#\xde\xdd\xba\xa3\x01\x00\x00\x00\xfe\xbf\x88\
-w\x97=B])h\x11\x1a\x22~\xb7yg\x03\x00\
-\x00\x00Te\x7fPW\x09Z\x94\xce\xef\xfb\xef\x9bD\
-\xfc{\xeb\x0e\x07\x00\x00\x00({\x83\xb2?\xa8\xab\x04\
--R\xf9\x0e\xf67\x91\x01\x00\x00\x00\x97\xe6\x81u\x85\
-\xa0Ek\xbc\xbe~\xbd!\xe2m\x8d;\x1d\x00\x00\x00\
-Xb\x07\xf7\x05\xeb\xeb\xd7\xab+\x04-b\xf9\x8e>\
-c\xfa\x8e\x07\x00\x00\x00\x96\xde\x19uu\xa0Ems\
-c\xe3\xbaC\xc4\xbf6\xee|\x00\x00\x00`\x09\x95=\
-A\xd9\x17\xd4\xd5\x81\x16\xb9|g\xdf\xb7\xf5 \x00\x00\
-\x00\x00\x96O\xd9\x13\xd4\x95\x81\x16\xbdO\x9fr\xcau\
-\xc6\x11oh=\x10\x00\x00\x00\x80%\x12\xf1\x86\xb2'\
-\xa8+\x03-CCJ\xf7j>\x18\x00\x00\x00\x80\xa5\
-Q\xf6\x03uU\xa0e\xe9\x93\x1b\x1b\xdf<D\xbc\xa6\
-\xf5\x80\x00\x00\x00\x00\x16_\xd9\x0b\x94\xfd@]\x15h\
-\x99\x1a\xa5t\x8f\xd6\x83\x02\x00\x00\x00X|e/P\
-W\x04Z\xb6&\xa7\x9e\xfaM\xe3\x88W\xb5\x1e\x18\x00\
-\x00\x00\xc0\x02\x8bxU\xd9\x0b\xd4\x15\x81\x96\xb1\xfc@\
-\xb8\xdba\x0f\x0c\x00\x00\x00`\xd1\xdd\xad\xae\x06\xb4\xac\
-\xed=\xe9\xa4\xab\x0e\x11\xff\xd8xp\x00\x00\x00\x00\x0b\
-\xa8\xec\x01\xca>\xa0\xae\x06\xb4\xcc\x0d)\xfdJ\xebA\
-\x02\x00\x00\x00,\x9e\xb2\x07\xa8+\x01-{\x17\x9ex\
-\xe2\x95\xc6\x11\x7f\xdfz\xa0\x00\x00\x00\x00\x0b$\xcf\xff\
-e\x0fPW\x02\xd2\xc1\x7f[\xe8\x0e\xcd\x07\x0b\x00\x00\
-\x00\xb00\xca\xfc_W\x01\xd2E\x1d8\xe1\x84\xaf\x19\
-\x22\xfe\xae\xf5\x80\x01\x00\x00\x00\xe6_\x99\xfb\xcb\xfc_\
-W\x01\xd2\xc5\x8dR\xba}\xebA\x03\x00\x00\x00\xcc\xbf\
-2\xf7\xd7\x15\x80t\xc9\xce\x5cY\xb9\xe2$\xa5\x17\xb4\
-\x1e8\x00\x00\x00\xc0\xfc*\xf3~\x99\xfb\xeb\x0a@:\
-\xbc\xfc@\xb9\xcd\x10\xf1\xe5\xe9\x07\x0f\x00\x00\x000\x9f\
-\xea\x9c\x7f\x9b:\xfaK\x97^~\xa0<\xff\xd0\x07\x0f\
-\x00\x00\x000\xd7\x9e_G~\xe9\xb2\x1b\x22n\xdax\
-\x00\x01\x00\x00\x00sh3\xe2\xc4:\xf2K\x97_~\
-\xd0<e\xfaA\x04\x00\x00\x00\xcc\x9d\xa7\xd4Q_:\
-\xb2F}\x7f\xd2\x10\xf1\x91\xc6\x83\x09\x00\x00\x00\x98\x03\
-e\xae/\xf3}\x1d\xf5\xa5#/?x\xcel=\xa8\
-\x00\x00\x00\x80\xd9W\xe6\xfa:\xe2KGW~\x00}\
-w\xf6\xc6C\x1fP\x00\x00\x00\xc0\x5c(\xf3\xfcw\xd7\
-\x11_:\xfaF}\xffkS\x0f*\x00\x00\x00`\xc6\
-M\xf2<_G{\xe9\xd8\xfa\xd8\x89'^i\x92\xd2\
-\x0bZ\x0f0\x00\x00\x00`\xf6\x949\xbe\xcc\xf3u\xb4\
-\x97\x8e\xbd!\xa5\x9bg\xe3\xd6\x03\x0d\x00\x00\x00\x98\x1d\
-e~\xdf\x97\xe7\xf8:\xd2K\xc7\xdf8\xe2\x8f[\x0f\
-6\x00\x00\x00`\x86\xe4\xf9\xbd\x8e\xf2\xd2\xd6\xb4\xb7\xeb\
-n\x9c\x1f\x5c\x1f8\xec\xc1\x06\x00\x00\x00\xcc\x8a\x0f\x94\
-\xf9\xbd\x8e\xf2\xd2\xd65\xa4\xf4;\x8d\x07\x1c\x00\x00\x00\
-0\x03&yn\xaf#\xbc\xb4\xb5mnl\x5cw\x88\
-xm\xeb\x81\x07\x00\x00\x00\xec\x9e2\xaf\x97\xb9\xbd\x8e\
-\xf0\xd2\xd6\x97\x1fhw\x9e~\xe0\x01\x00\x00\x00\xbb,\
-\xe2.ut\x97\xb6\xa7\x03{\xf6|U~\xb0=\xef\
-\x12\x0f<\x00\x00\x00`7=\xaf\xcc\xebut\x97\xb6\
-\xafQ\xd7m\x0c\x11\x9f\x9az\x00\x02\x00\x00\x00;\xac\
-\xcc\xe7eN\xaf#\xbb\xb4\xfdMRz\x5c\xeb\xc1\x08\
-\x00\x00\x00\xec\x9c!\xe2\xf1uT\x97v\xa6\xa1\xefo\
-\x90\x1f|\xef\x99~0\x02\x00\x00\x00;\xe6=e>\
-\xaf\xa3\xba\xb4s\x8d\x22\x1e\xd0x@\x02\x00\x00\x00;\
-!\xcf\xe5uD\x97v\xb6\x0bR\xbav~\x10\xbe\xf2\
-\xb0\x07%\x00\x00\x00\xb0\xad\x86\x88W\x9d\xb7\xb6\xf6-\
-uD\x97v\xbe\xa1\xef\x7f9?\x10\xbf\xdcz\x80\x02\
-\x00\x00\x00[\xaf\xcc\xe1e\x1e\xaf\xa3\xb9\xb4{\x8d#\
-\x9e\xd9z\x90\x02\x00\x00\x00\xdb \xcf\xe1u$\x97v\
-\xb7\xfc\x80\x5c\xcb>q\x89\x07(\x00\x00\x00\xb0\x1d\xca\
-\xfc\xbdVGri\xf7\xcb\x0f\xc8G\x1f\xf2\x00\x05\x00\
-\x00\x00\xb6\xc7\xa3\xeb(.\xcdF\x9bkk\xd7\x1f\x22\
-\xfe\xbd\xf1`\x05\x00\x00\x00\xb6@\x99\xbb\xcb\xfc]G\
-qiv\x1aE\xfcj\xebA\x0b\x00\x00\x00\x1c\xbf2\
-w\xd7\x11\x5c\x9a\xad676\xae6\xa4\xf47\xad\x07\
-.\x00\x00\x00p\xec\xca\xbc]\xe6\xee:\x82K\xb3\xd7\
-\xa4\xefS~\xb0~t\xfa\xc1\x0b\x00\x00\x00\x1c\xb3\x8f\
-\x96y\xbb\x8e\xde\xd2\xec6\xa4\xf4\xd0\xc6\x03\x18\x00\x00\
-\x008\x06e\xce\xae#\xb74\xdb}z}\xfd[\xf3\
-\x83\xf6e\xd3\x0fb\x00\x00\x00\xe0\xa8\xbd\xac\xcc\xd9u\
-\xe4\x96f\xbf\xcd\x94n5\xa4\xb4\xd9x0\x03\x00\x00\
-\x00G\xa0\xcc\xd5e\xbe\xae\xa3\xb64?\xe5\x07\xefc\
-Z\x0fj\x00\x00\x00\xe0\xf2\x95\xb9\xba\x8e\xd8\xd2|5\
-\xe9\xfb\xef\xcb\x0f\xe0\xd7\xb5\x1e\xd8\x00\x00\x00\xc0\xa5+\
-\xf3t\x99\xab\xeb\x88-\xcd_\xf9A|\x87\xecs\xad\
-\x078\x00\x00\x00p\xb82G\x97y\xba\x8e\xd6\xd2\xfc\
-\x96\x1f\xd0O\x9e~\x80\x03\x00\x00\x00\x97\xea\xc9u\xa4\
-\x96\xe6\xbb\xa1\xefo\x90\x1f\xd0o\x9fz\x80\x03\x00\x00\
-\x00\x87{{\x99\xa3\xebH-\xcd\x7f\xa3\x94\xee\xd1x\
-\xa0\x03\x00\x00\x00\x87(\xf3s\x1d\xa5\xa5\xc5\xe8\xc0\x9e\
-=_5\xa4\xf4\x97\xad\x07<\x00\x00\x00p\xf0g\x09\
-\xfde\x99\x9f\xeb(--N\xa3\x94~&?\xc0?\
-\xd0z\xe0\x03\x00\x00\xc02+\xf3r\x99\x9b\xeb\x08-\
--^\xf9\x81~\xc6\xf4\x03\x1f\x00\x00\x00Hg\xd4\xd1\
-YZ\xcc676\xae\x96\x1f\xe8\x7f3\xf5\xc0\x07\x00\
-\x00\x80e\xf67e^\xae\xa3\xb3\xb4\xb8m\xa6\xd4\xe7\
-\x07\xfc\xd9SO\x00\x00\x00\x00XFg\x979\xb9\x8e\
-\xcc\xd2\xe27\xa4\xf4\xd0\xc6\x13\x01\x00\x00\x00\x96J\x99\
-\x8f\xeb\xa8,-G{#\xbe-?\xf0_\xdezB\
-\x00\x00\x00\xc02(sq\x99\x8f\xeb\xa8,-O\xf9\
-\x09p\xab\xfc\x04\xd8\x9c~R\x00\x00\x00\xc0\xa2\xab\xf3\
-\xf0\xad\xea\x88,-_\x93\x94\x1e3\xfd\xc4\x00\x00\x00\
-\x80EW\xe6\xe1:\x1aK\xcb\xd9\xa7\x22\xbe??\x19\
-^?\xfd\xe4\x00\x00\x00\x80\x05\xf6\xfa2\x0f\xd7\xd1X\
-Z\xde\x86\x94\xee\x90\x9f\x10\x9f\x9bz\x82\x00\x00\x00\xc0\
-\x22\xfa\x5c\x99\x83\xebH,i\x14\xf1\x7f\x1aO\x14\x00\
-\x00\x00X(e\xfe\xad\xa3\xb0\xa4\xd2\xfe\xd5\xd5k\x8d\
-#>\xdez\xc2\x00\x00\x00\xc0B(s\xef\xea\xea\xd5\
-\xeb(,\xe9+\x0d}\xff\xcb\xf9I29\xecI\x03\
-\x00\x00\x00\xf3oR\xe6\xde:\x02K\x9an\x1c\xf1\xa8\
-\xc6\x13\x07\x00\x00\x00\xe6[\x9ew\xeb\xe8+\xa9\xd5\xe6\
-\xc6\xc6u\xf3\x93\xe5\xa5\x87=y\x00\x00\x00`~\xbd\
-\xb4\xcc\xbbu\xf4\x95tiM\x22\xd6\xf3\x13\xe6#S\
-O \x00\x00\x00\x98G\x1f)sn\x1dy%]^\
-\xf9Is\xc6\xd4\x93\x08\x00\x00\x00\xe6\xd1\x19u\xd4\x95\
-t$}\xec\xc4\x13\xaf4\xa4\xf4\x97\x8d'\x13\x00\x00\
-\x00\xcc\x852\xd7\x96\xf9\xb6\x8e\xba\x92\x8e\xb4\xbd\x11?\
-9D\xbc\xad\xf5\xc4\x02\x00\x00\x80YV\xe6\xd92\xd7\
-\xd6\x11W\xd2\xd16\xa4\xf4+\xf9\x89\xf4\xe9\xd6\x13\x0c\
-\x00\x00\x00fQ\x99c\xcb<[G[I\xc7Z~\
-2\xfdA\xebI\x06\x00\x00\x00\xb3\xa8\xcc\xb1u\xa4\x95\
-t<\x8d\xd7\xd7\xaf\x97\x9fT/\x9f~\x92\x01\x00\x00\
-\xc0\x0czy\x99c\xebH+\xe9x\x1bu\xdd\xa9\xf9\
-\x89\xf5\xd1\xa9'\x1a\x00\x00\x00\xcc\x92\x8f\x96\xf9\xb5\x8e\
-\xb2\x92\xb6\xaa\xfc\xe4z\xe0\xd4\x93\x0d\x00\x00\x00f\xc9\
-\x03\xeb\x08+i+;\x7fu\xf5*\xf9\x09\xf6\xac\xa9\
-'\x1c\x00\x00\x00\xcc\x82g\x95\xb9\xb5\x8e\xb0\x92\xb6\xba\
-})\xddd\x12\xf1\xef\x8d'\x1f\x00\x00\x00\xec\x8a2\
-\xa7\x96y\xb5\x8e\xae\x92\xb6\xabq\xdf\xdf5?\xe9>\
-7\xfd$\x04\x00\x00\x80]\xf0\xb92\xa7\xd6\x91U\xd2\
-v7D<\xa1\xf1D\x04\x00\x00\x80\x1dU\xe6\xd3:\
-\xaaJ\xda\x89\xce\xef\xfb\xef\xcbO\xbcW\xb5\x9e\x90\x00\
-\x00\x00\xb0\x13\xca\x5cZ\xe6\xd3:\xaaJ\xda\xa9\x86\xae\
-\xbb\xc5\x90\xd2'ZOL\x00\x00\x00\xd8Ne\x1e-\
-si\x1dQ%\xedtC\xc4\xef\xb6\x9e\x9c\x00\x00\x00\
-\xb0\x9d\xca<ZGSI\xbb\xd1xu\xf5\xea\xf9\xc9\
-\xf8\xbcC\x9f\x98\x00\x00\x00\xb0\xcd\x9eW\xe6\xd1:\x9a\
-J\xda\xadF)\xfd\xcc8\xe2\xddSOP\x00\x00\x00\
-\xd8zy\xfe,sh\x1dI%\xedv\x9b)\xdd\xa6\
-\xf9d\x05\x00\x00\x80-T\xe6\xcf:\x8aJ\x9a\x95&\
-\x11\x8fm=a\x01\x00\x00`+\x94\xb9\xb3\x8e\xa0\x92\
-f\xa9O\xaf\xaf\x7f\xeb\x10\xf1\xd7\xad'.\x00\x00\x00\
-\x1c\x8f2o\x96\xb9\xb3\x8e\xa0\x92f\xad})\xddd\
-H\xe9\xcd\xad'0\x00\x00\x00\x1c\x8b2g\x96y\xb3\
-\x8e\x9e\x92f\xb5Q\xc4m\xf3\x93\xf6\x13\xd3Ob\x00\
-\x00\x008\x06\x9f(sf\x1d9%\xcdz\xf9\x09\xfb\
-\x80\xc6\x13\x19\x00\x00\x00\x8eJ\x99/\xeb\xa8)i\x1e\
-:\xb0g\xcfW\x8d#\xfe\xb8\xf5\x84\x06\x00\x00\x80#\
-\x92\xe7\xca2_\xd6QS\xd2\xbc4\xe9\xba\xef\xc9O\
-\xe2\x97\x1c\xf6\xa4\x06\x00\x00\x80\xcb\xf7\x922W\xd6\x11\
-S\xd2\xbc5\xee\xba\x9b\x0d)\xbd\xb3\xf1\xe4\x06\x00\x00\
-\x80\xa6\x83sd\x9e'\xebh)i^\x1b\xba\xeeN\
-C\xc4\xa8\xf5D\x07\x00\x00\x80C\x95\xf9\xb1\xcc\x91u\
-\xa4\x944\xefMRzH\xeb\xc9\x0e\x00\x00\x00\x87*\
-\xf3c\x1d%%-B\xe7\xaf\xae^eH\xe9/Z\
-Ox\x00\x00\x00(\xca\xdcX\xe6\xc7:JJZ\x94\
-\xf6\xaf\xad]\x7f\x88xU\xeb\x89\x0f\x00\x00\xc0r+\
-\xf3b\x99\x1b\xeb\x08)i\xd1\x9a\xf4\xfd\xc68\xe2\x83\
-\xad\x0b\x00\x00\x00\x00K*\xcf\x89e^\xac\xa3\xa3\xa4\
-Em\x94\xd2=\xf2\x13\xfe3\xcd\x0b\x01\x00\x00\x00\xcb\
-%\xcf\x87eN\xac#\xa3\xa4E/?\xf1\x1fy\xd8\
-\x85\x00\x00\x00\x80e\xf4\xc8:*JZ\x86>\xb9\xb1\
-\xf1\xcd\xe3\x88\xe74.\x06\x00\x00\x00,\x8b<\x17\x96\
-\xf9\xb0\x8e\x8a\x92\x96\xa5I\xdf\x9f\x90/\x00oh^\
-\x18\x00\x00\x00Xly\x1e,sa\x1d\x11%-[\
-\xf9Bp\xab\xec\xa3\x97\xb80\x00\x00\x00\xb0\xe8\xca\x1c\
-x\xab:\x1aJZ\xd6\x86\x88\xfb\x0e)]8u\x81\
-\x00\x00\x00`\x01\x95\xf9\xaf\xcc\x81u$\x94\xb4\xec\xe5\
-\x0b\xc2\x13Z\x17\x0b\x00\x00\x00\x16K\x99\xff\xea((\
-I++\xa3\xbe\xff\x8e|axQ\xeb\x82\x01\x00\x00\
-\xc0b(s_\x99\xff\xea((I\x17\xb5\xb9\xb1q\
-\xdd|\x918w\xfa\xa2\x01\x00\x00\xc0B8\xb7\xcc}\
-u\x04\x94\xa4K\xb6\xd9u\xbf0D|\xb8q\xf1\x00\
-\x00\x00`N\x1d\x9c\xf3\xf2\xbcWG?Ij7\x8e\
-\xb8{\xbe`\x0c\xad\x0b\x09\x00\x00\x00\xf3\xe5\xe0|\x97\
-\xe7\xbc:\xf2I\xd2e\x97/\x18\x0fj]L\x00\x00\
-\x00\x983y\xbe\xab\xa3\x9e$]~\x07VV\xae0\
-\x89xl\xf3\x82\x02\x00\x00\xc0\x5c\x18\x22\xfe\xa0\xccw\
-u\xd4\x93\xa4#k_\xd7]3_@\x9e\xd6\xba\xb0\
-\x00\x00\x000\xdb\xca<W\xe6\xba:\xe2I\xd2\xd1\xb5\
-/\xe2\xfb\xf3\x85\xe4\xefZ\x17\x18\x00\x00\x00fS\x99\
-\xe3>\xd5u?PG;I:\xb66#N\xcc\x17\
-\x95\xd7O_d\x00\x00\x00\x98I\xaf/s\x5c\x1d\xe9\
-$\xe9\xf8\x1aE\x9c2D\xfcG\xe3b\x03\x00\x00\xc0\
-\xac\xc8s\xdb\xbe<\xbf\xd5QN\x92\xb6\xa6!\xa5;\
-\xe4\x8b\xcc9\x87]t\x00\x00\x00\x98\x05\xe7\xec\xcbs\
-[\x1d\xe1$ik\x1b\x22\xee\x9b/4\x9f\x9b\xba\xf0\
-\x00\x00\x00\xb0\xbb>W\xe6\xb5:\xbaI\xd2\xf6\x94/\
-6\x0f\x9f\xba\xf8\x00\x00\x00\xb0\xbb\x1e^G6I\xda\
-\xbe\xceM\xe9\x1b\xf2\x05\xe7\xc9S\x17 \x00\x00\x00v\
-\xc7\x93\xcb\x9cVG6I\xda\xdeF}\xff\x1dCJ\
-\xcfo\x5c\x8c\x00\x00\x00\xd8!e.+\xf3Y\x1d\xd5\
-$ig\x1a\xfa\xfe\x06\xf9\x02\xf4\xca\xd6\x85\x09\x00\x00\
-\x80\xedU\xe6\xb12\x97\xd5\x11M\x92v\xb6q\xdf\x9f\
-\x9c/Doo]\xa0\x00\x00\x00\xd86o/\xf3X\
-\x1d\xcd$iw\xdaL\xe96CJ\xff\xd5\xb8H\x01\
-\x00\x00\xb0\xc5\xea\xfcu\x9b:\x92I\xd2\xee6\xe9\xfb\
-_\xcb\x17\xa6\xf1\xf4\xc5\x0a\x00\x00\x80\xadS\xe6\xae2\
-\x7f\xd5QL\x92f\xa3|a\xfa\xed\xd6E\x0b\x00\x00\
-\x80\xadQ\xe6\xae:\x82I\xd2\xect\xe0\xcc3\xaf8\
-\xa4\xf4\x87\xad\x0b\x17\x00\x00\x00\xc7\xa7\xcc[e\xee\xaa\
-#\x98$\xcdV\xfbWW\xaf5D<\xbdu\x01\x03\
-\x00\x00\xe0\xd8\x949\xab\xcc[u\xf4\x92\xa4\xd9\xec\xfc\
-\xd5\xd5\xab\xe4\x0b\xd6\xbbZ\x172\x00\x00\x00\x8e\xce\x90\
-\xd2\xbf\x959\xab\x8e\x5c\x924\xdbM\xfa\xfe\x84|\xf1\
-z\xf9\xf4\xc5\x0c\x00\x00\x80\xa3\xf2\xf2\xbdy\xbe\xaa\xa3\
-\x96$\xcdG\xfb\xba\xee\xa7\xf3\x05\xec\xd5S\x174\x00\
-\x00\x00\x8e\xcc\xabGy\xae\xaa#\x96$\xcdWC\xc4\
-\xea8\xe2\x0d\x8d\x8b\x1b\x00\x00\x00\x97&\xcfQe\x9e\
-\xaa\xa3\x95$\xcdg\x93\xbeO\xf9b\xf6\xd6\xe6\x85\x0e\
-\x00\x00\x80K(\xf3S\x99\xa3\xeaH%I\xf3\xdd\xbe\
-\xae;uH\xe9\x9d\xad\x0b\x1e\x00\x00\x00\x17)s\xd3\
-(\xcfOu\x94\x92\xa4\xc5(_\xe0n5D\xbco\
-\xfa\xa2\x07\x00\x00\xc0\xc1\x7fC\xa8\xccK\xb7\xaa#\x94\
-$-V\x93\xbe\xbf\xdd\x90\xd2\x87\xa6/~\x00\x00\x00\
-\xcb\xac\xccIe^\xaa\xa3\x93$-fC\xd7\xdd)\
-_\xf4>:}\x11\x04\x00\x00XR\x1f\xdd\x17q\xc7\
-:2I\xd2b7\x8a\xf8\xd5q\xc4'\x1b\x17C\x00\
-\x00\x80\xe5\x91\xe7\xa22\x1f\xd5QI\x92\x96\xa3!\xa5\
-{f\x9b\xcd\x0b#\x00\x00\xc0\x82+\xf3P\x99\x8b\xea\
-\x88$I\xcb\xd58\xe2~\xf9b\xb8\x7f\xfa\xe2\x08\x00\
-\x00\xb0\xe0\xf6\x97y\xa8\x8eF\x92\xb4\x9c\xe5\x8b\xe1\x03\
-\xf3\xc5\xf0\xf3S\x17H\x00\x00\x80\xc5t\xd1\xfc\xf3\xc0\
-:\x12I\xd2r7\xa4\xf4\x90\xc3.\x94\x00\x00\x00\x0b\
-\xa8\xcc?u\x14\x92$\x95\xc6\x11\x8fh]0\x01\x00\
-\x00\x16F\x9e{\xea\x08$I\xfaJ\xef\xdb\xb3\xe7k\
-')=\xa6y\xe1\x04\x00\x00\x98se\xde)sO\
-\x1d\x81$I\x87v\xfe\xea\xeaU\x86\xbe\x7fB\xeb\x02\
-\x0a\x00\x000\xaf\xca\x9cS\xe6\x9d:\xfaH\x92ZM\
-\xfa\xfe\x1a\xa3\x88?i]H\x01\x00\x00\xe6M\x99o\
-\xca\x9cSG\x1eI\xd2e\xf5\xe9SN\xb9\xce\x90\xd2\
-_\xb4.\xa8\x00\x00\x00\xf3\xa2\xcc5e\xbe\xa9\xa3\x8e\
-$\xe9H\x1a\x22\xbe3_D\x9f5}Q\x05\x00\x00\
-\x98\x13\xcf*sM\x1dq$IGS\xf9on\xf3\
-\x85\xf4\x8dS\x17V\x00\x00\x80Y\xf7F?CH\x92\
-\x8e\xb3}\x11\xdf\x9f/\xa8\xfe\x8d!\x00\x00`^<\
-\xbb\xcc1u\xa4\x91$\x1dO\xc3\xc9'\x7f\x97\x9f1\
-\x04\x00\x00\xcc\xba!\xe2ie~\xa9\xa3\x8c$i+\
-*?\x9c\xcd\xdfJ\x06\x00\x00\xcc\xaaQ\xd7\xfd\xe9\xa7\
-\xd6\xd7\xbf\xb5\x8e0\x92\xa4\xad\xac\xfc5\x8eC\xc4\x13\
-Z\x17`\x00\x00\x80\xdd2\xa4\xf4\xc4}]w\xcd:\
-\xbaH\x92\xb6\xa3\x0bS\xfa\x86|\xc1}L\xebB\x0c\
-\x00\x00\xb0\xd3&\x11\x8f\xdd{\xd2IW\xad#\x8b$\
-i;;p\xc2\x09_\x93/\xbe\x0f\x1fR\xfa\xf2\xf4\
-\x05\x19\x00\x00`\xc7\xf4\xfd\xef\x7fhc\xe3\xeb\xea\xa8\
-\x22I\xda\xa9\x86\x88\x07\x0f)}\xaeyq\x06\x00\x00\
-\xd8&y\x0e\xf9\x9f\xec\xa1\x07VV\xaeP\xc7\x13I\
-\xd2N7\x8ex@\xbe(O\xa6/\xd2\x00\x00\x00\xdb\
-a\x88\xf8t\x9eC\x1eTG\x12I\xd2n6\xa4\xf4\
-\x9b\xf9\xc2\xfc\xa9\xd6\x05\x1b\x00\x00`\xab\xe4\xb9c\xc8\
-\xbf\xfe\xaf:\x8aH\x92f\xa1IJ\xf7\x18G||\
-\xfa\xa2\x0d\x00\x00\xb0E\xce\x1dR\xbaW\x1dA$I\
-\xb3\xd48\xe2.\xf9\x22\xfd_\x8d\x8b7\x00\x00\xc0\xf1\
-8{\x14q\xf7:zH\x92f\xb1Q\xd7\xfdR\xbe\
-`\x7f`\xea\x02\x0e\x00\x00pL\x86\x88\x0f\x0f)\xfd\
-J\x1d9$I\xb3\xdcfJ\xb7\x19G\xbc\xbbuA\
-\x07\x00\x008\x0a\xef\x9f\xa4t\xfb:jH\x92\xe6\xa1\
-!\xa5\x9b\x8f#\xde\xd6\xb8\xa8\x03\x00\x00\x5c\xae!\xe2\
-]y\xa6\xb8u\x1d1$I\xf3\xd4(b=_\xcc\
-\xdf8}q\x07\x00\x00\xb8,C\xc4\xdb\x86\xbe?\xad\
-\x8e\x16\x92\xa4yl\xdcu7\x1bR\xfa\xe7\xd6\x85\x1e\
-\x00\x00\xa0\xe1\x8d\x93\x94\xfa:RH\x92\xe6\xb9Q\xdf\
-\x9f4D\xfcc\xe3b\x0f\x00\x00\xf0\xff\xe5\xb9\xe15\
-\xe5\x0f\x96\xeb(!IZ\x84&}\x7fB\xbe\xc0\xbf\
-\xb8u\xe1\x07\x00\x00\xc8\xf3\xc2+\xca\x1f(\xd7\x11B\
-\x92\xb4H\x9d\xbf\xbaz\x95|\xb1\xf73\x86\x00\x00\x80\
-K\x8a\xf8\x8f</\x5c\xa7\x8e\x0e\x92\xa4E\xec\xfc\x93\
-O\xfe\xde!\xe2\xa9\xcd\x17\x02\x00\x00`\xf9D<s\
-sm\xed\xfaud\x90$-r\xe3\xd5\xd5\xab\x8f\xba\
-\xee\xd1CJ_n\xbe(\x00\x00\x00Ka\x88x\x82\
-\x7fCH\x92\x96\xb0q\xdf?`Hio\xeb\xc5\x01\
-\x00\x00Xh\xfb\x87\xae{\xc8\x81\x13N\xf8\x9a:\x1e\
-H\x92\x96\xadq\xdf\xdfuH\xe9?\x1b/\x12\x00\x00\
-\xc0b\xfa\xe8\xa4\xef\x7f\xa3\x8e\x04\x92\xa4en\xdc\xf7\
-\xb7\xcc/\x0co\x9ez\xa1\x00\x00\x00\x16\xcc\x90\xd2;\
-'}\x7f\xbb:\x0aH\x92\xb4\xb2\x92_\x1c~.\xbf\
-H\xbcl\xfaE\x03\x00\x00X\x0c\xf9\xcc\xff\xea\xcd\xbe\
-Ou\x04\x90$\xe9\xe2F\xeb\xeb?\x92_,\x9e=\
-\xfd\xe2\x01\x00\x00\xcc\xb7!\xa5\xbf\xd9\xdb\xf7'\xd4\xa3\
-\xbf$I\x87\xf7\xa9\xf5\xf5o\xcd/\x18Ol\xbd\x90\
-\x00\x00\x00\xf3'\x9f\xef\x9f2^_\xbf^=\xf2K\
-\x92t\xe9}hc\xe3\xeb\xf2\x0b\xc7C\xf3\x0b\xc8\x05\
-\xd3/(\x00\x00\xc0|\xc8g\xfa/\xe6_\xff\xf7\xe6\
-\xc6\xc6\xd5\xeaQ_\x92\xa4#+\xbf\x88\xdc+\xbf\x88\
-\x9c}\xe8\x0b\x0b\x00\x000\x17\xce\xcb\xce\xa8G{I\
-\x92\x8e\xbeIJ\xb7\x1f\x22\xde5\xf5\x02\x03\x00\x00\xcc\
-\xae\x0fdw\xaeGzI\x92\x8e\xbdIJ}\xf6\xcf\
-S/4\x00\x00\xc0\x8c\x19\x22\xde\xb4/\xa5\x9b\xd7\xa3\
-\xbc$I\xc7\xdf$\xe2'\x87\x94^\xd0z\xe1\x01\x00\
-\x00f\xc2KG)\xfdL=\xc2K\x92\xb4u\x9d\xd7\
-u\xdf3D\xfcY\xe3\xc5\x07\x00\x00\xd8E\xf9\x9c\xfe\
-\x8c\xcd\x88\x1f\xaeGwI\x92\xb6\xbe\xfcb\xf3\x8d\xa3\
-\x88G\xe5_\xbf\xd4z1\x02\x00\x00vV>\x9b?\
-\xfe\xbc\xb5\xb5o\xa9GvI\x92\xb6\xb7q\xc4\xfd\xf3\
-\x8b\xcf\xa7Z/J\x00\x00\xc0\x0e\x88\xd8\x97\xcf\xe4\x0f\
->\xb0\xba\xfa\xd5\xf5\x98.I\xd2\xce\x94_\x84\xee\x92\
-}\xb0\xf9\x02\x05\x00\x00l\x9b!\xe2\xacI\xc4\xaf\xd7\
-\xa3\xb9$I;\xdf\xd0u\xb7\x18G\xfck\xeb\x85\x0a\
-\x00\x00\xd8zC\xc4\xbfO\x22n[\x8f\xe4\x92$\xed\
-^\xa3\xbe?)\xbf0\xbd\xb0\xf5\x82\x05\x00\x00l\xa9\
-\x97\x8e\xfb\xfe\xe4z\x14\x97$i\xf7\xdb\x5c]\xbd\xee\
-\x90\xd2\xe3\x86\x88/7^\xb8\x00\x00\x80\xe34J\xe9\
-\xc9\x93\xae\xfb\x9ez\x04\x97$i\xb6\x1aR\xfa\xcdI\
-\xc4\x7f\xb7^\xc4\x00\x00\x80c\xf2\x89q\xc4\x03\xfc@\
-iI\xd2\xcc7\xee\xfb[\xe6\x17\xae\xd7O\xbd\x90\x01\
-\x00\x00Gi\x88x\xf3$\xa5=\xf5\xa8-I\xd2\xec\
-7\xee\xba\x1b\xe6\x17\xb1gO\xbf\xa8\x01\x00\x00G(\
-\xe2\xaf6S\xbaI=bK\x924?\xed\xeb\xbak\
-\x8eR\xfa\xdf\xf9\xc5\xec\xd3\xcd\x179\x00\x00\xe00C\
-\xc4\x17&)=\xe6\xd3\xa7\x9cr\x9dz\xb4\x96$i\
->\x1bG\xdc}H\xe9\x03\xad\x17<\x00\x00\xe0b\xf9\
-\xdc\xfc\xa1\xec\x9e\xf5(-I\xd2\xfc7\x89X\xcf/\
-n\xafl\xbd\xf0\x01\x00\x00\x07\xbdz_\xd7\x9dZ\x8f\
-\xd0\x92$-N\x9b\x11?<\x8exj\xe3\xc5\x0f\x00\
-\x00\x96\xda\x10\xf1\xf4Q\xd7\xfdX=:K\x92\xb4x\
-\x9d\x9b\xd27\xe4\x17\xbc\x07\xe7\x17\xbe\xbd\xd3/\x84\x00\
-\x00\xb0l\xf2\xd9x\xc8~osc\xe3j\xf5\xc8,\
-I\xd2b\x97_\xf8\xee8\xa4\xf4\x8e\xd6\x0b#\x00\x00\
-,\x85\x88w\xe7_\xef\x5c\x8f\xc8\x92$-O\xfbS\
-\xfa\xb9!\xe2\xc5\x87\xbd8\x02\x00\xc0\xe2{\xe9\xb8\xef\
-O\xaeGcI\x92\x96\xaf\xf1\xfa\xfa\xf5\xc6\x11\x7f\xd4\
-x\x91\x04\x00\x80\x854J\xe9\xc9\x93\xae\xfb\x9ez$\
-\x96$iy;p\xe6\x99W\xcc/\x8eg\x8c#>\
->\xfd\x82\x09\x00\x00\x0b\xe4\x13\xf9\xcc\xfb\x80\x03\xab\xab\
-_]\x8f\xc2\x92$\xa9\x94_$o\x93_$\xdf4\
-\xf5\xc2\x09\x00\x00so\x88x\xf3$\xa5=\xf5\xe8+\
-I\x92\xa6\xdb\xec\xfb\x9f\xca/\x9a\xcf\x9f~\x11\x05\x00\
-\x80y5D\xfc\xd5fJ7\xa9G^I\x92ti\
-\x9d\xbf\xbaz\x9d!\xa5\xc7\x8c#>\xdfzQ\x05\x00\
-\x80y0D|a\x92\xcf\xb5\x9f>\xe5\x94\xeb\xd4\xa3\
-\xae$I:\x926S\xba\xcd\x90\xd2\xb8\xf5\x02\x0b\x00\
-\x00\xb3\xac\x9cc\xcby\xb6\x1em%I\xd2\xd16D\
-\xdc4\xbf\xa8>\xef\xd0\x17X\x00\x00\x98q\xcf+\xe7\
-\xd8z\xa4\x95$I\xc7\xdaxu\xf5\xea\xf9E\xf5w\
-\xf3\x8b\xab\xbf\x9d\x0c\x00\x80Y\xf6\xf1\x83\xe7\xd6|~\
-\xadGYI\x92\xb4\x15\xe5\x17\xd8\xd3\x87\x94^\xd9x\
-\xf1\x05\x00\x80]U\xce\xa9\xe5\xbcZ\x8f\xae\x92$i\
-\xab;\xff\xe4\x93\xbf7\xbf\xe0>.\xbf\xf0~v\xfa\
-\x85\x18\x00\x00v\xc1g'\xf9|:\xc9\xe7\xd4zd\
-\x95$I\xdb\xd98\xe2.\xf9\x05\xf8\xedS/\xc8\x00\
-\x00\xb0\x93\xde^\xce\xa5\xf5\x88*I\x92v\xaaI\xd7\
-\xddx\x88xF\xe3\xc5\x19\x00\x00\xb6U9\x87\x96\xf3\
-h=\x9aJ\x92\xa4\x9d\xee\x9c\xd3N\xbb\xf28\xe2\xfe\
-CJ\xff\xd5z\xb1\x06\x00\x80\xadt\xf0\xdc\x99\xcf\x9f\
-\xe5\x1cZ\x8f\xa4\x92$i7\x1bu\xddF~\x91~\
-\xe9\xf4\x8b6\x00\x00l\xa1\x97\x96sg=\x82J\x92\
-\xa4Yisc\xe3\xba\xa3\x88G\x0d)M\x1a/\xe0\
-\x00\x00p\xac&\xe3|\xce,\xe7\xcdz\xf4\x94$I\
-\xb3\xd8\xa8\xeb~)\xbfh\xbf\xa9\xf1b\x0e\x00\x00G\
-'\x9f+'\xf9|Y\x8f\x9a\x92$i\xd6\x1b\xfa\xfe\
-\x06\xf9\x05\xfc\xcf\x9a/\xec\x00\x00p$\xf2y\xb2\x9c\
-+\xeb\x11S\x92$\xcdK\x07\xf6\xec\xf9\xaa\xa1\xeb\xee\
-\x93_\xd0?p\xd8\x0b<\x00\x00\x5c\x8a!\xe2\x83\xe5\
-\x1cY\xce\x93\xf5h)I\x92\xe6\xb1q\xdf\x9f\x9c_\
-\xd8_\xd8z\xc1\x07\x00\x80C\x1d<7\xe6\xf3c=\
-JJ\x92\xa4yo\xff\xc6\xc67\xe7\x17\xf83\xb3\xf3\
-[/\xfe\x00\x00,\xb7rN,\xe7\xc5rn\xacG\
-HI\x92\xb4Hm\xa6t\x9bI\xc4kZ\x07\x01\x00\
-\x00\x96S9\x1f\x96sb=2J\x92\xa4E\xed\xfc\
-\xd5\xd5\xab\xe4\x17\xff\xa7L\x1f\x06\x00\x00XJO.\
-\xe7\xc3zT\x94$I\xcb\xd0$\xe2\xb6C\xc4?5\
-\x0e\x06\x00\x00,\xba|\x0e,\xe7\xc1z4\x94$I\
-\xcb\xd6\x10\xf1\x9d\xf9@\xf0\x88\xfc\xeb'\x9b\x87\x05\x00\
-\x00\x16J>\xf7\x9d\x9b\xcf\x7f\xbf?\x9c|\xf2w\xd5\
-#\xa1$IZ\xe6\xf6E\x9c\x92\x0f\x08\x7f\xd7:8\
-\x00\x00\xb0\x18\xf2y\xef\xc5\xfb\xba\xee\xd4z\x04\x94$\
-I\xba\xa8I\xdf_#\x1f\x16\x1e8\xa4\xf4\xa1\xe9\x03\
-\x04\x00\x00s,\xe2\xc3C\xc4o\xef_]\xbdV=\
-\xfaI\x92$\x1d\xde\x90\xd2\xcf\xe5\xc3\xc3\xb3\x0f;L\
-\x00\x000\x7f\x22\x9e;\xee\xba\x9b\xd5\xa3\x9e$I\xd2\
-ew`\xcf\x9e\xaf\x1dR\xbag\xf6\xce\xe6\xe1\x02\x00\
-\x80\xd9\x16\xf1\xeeI\xc4\xbd?v\xe2\x89W\xaaG<\
-I\x92\xa4#o\xbc\xbe~\xa3|\xa8\xf8\xd3|\xa8\xf8\
-\xc2a\x07\x0d\x00\x00fO\xc4\x97\x86\x88\xa7N\xba\xee\
-\xc6\xf5H'I\x92t\xec\x0d]w\xa7|\xc0\xf8\x97\
-\xe6\xc1\x03\x00\x80\xd9\x10\xf1\xaf\xd9]\xea\x11N\x92$\
-ik\xda\xd7u?0D\xfcA>h\x8c\x9a\x87\x10\
-\x00\x00vG\xc4\xbeI\xc4\xe37\xd7\xd6\xae_\x8fn\
-\x92$I[_>t\xdcz\x88\xf8\xc7\xe6\x81\x04\x00\
-\x80\x1d\x95\xcfe\xff4\x89\xb8m=\xaaI\x92$m\
-o\x9f\x89\xf8\xb6|\x00\xf9\xbd|\x109{\xfa`\x02\
-\x00\xc0\x0e\x88\xf8d\xf6\x88\xe1\xe4\x93\xbf\xab\x1e\xd1$\
-I\x92v\xaeIJ\xfd\x90\xd2\x0b\x9a\x07\x15\x00\x00\xb6\
-\xc5\x10\xf1\xe2Q\xd7\x9dZ\x8fd\x92$I\xbb\xd3\xe6\
-\xc6\xc6\xd5\xf2\xe1\xe4\x8c\xec\xfd\x87\x1eV\x00\x00\xd8Z\
-C\xc4\x87\xc7\x11\x0f:gu\xf5Z\xf5(&I\x92\
-\xb4\xfb\xed\xeb\xfb\x93\x86\x94\xfe\xb2u\x80\x01\x00\xe0\xf8\
-\x8c\x22\x9e;\xee\xba\x9b\xd5\xa3\x97$I\xd2\xec\xb5\x99\
-\xd2m\x86\x88\xb3Z\x87\x19\x00\x00\x8e\xda\xb9CJw\
-\xa8G-I\x92\xa4\xd9.\x1f^\xbe\xbb\xfc \xea\x83\
-\xff\x8as\xfbp\x03\x00\xc0e\xfb\xe8\xb8\xef\x7f\x7f_\
-\xd7\xfd@=bI\x92$\xcdO\xa3\x8b\xfe\x93\xb2\xa7\
-\x8c#>\xdd8\xe8\x00\x000e\x88\xf8B\xf6\xb4\xfd\
-)\xfd\x5c=RI\x92$\xcdo\xe3\x88[\xe7\xc3\xcd\
-\x8b[\x07\x1f\x00\x00\xfe\xbf\x97\x8d\xba\xeev\xf5\x08%\
-I\x92\xb4\x18\x95\xbf\xa5lH\xe9^C\xc4[\x1b\x07\
- \x00\x80\xa5\x95\xcfG\xff\x9e\xddw\xd2\xf7\xd7\xa8G\
-'I\x92\xa4\xc5\xab\xfcw\xf1\xe5\xbf\x8f\xcf\x07\xa0\xb3\
-\xa7\x0fD\x00\x00K\xe6\x13\xd9\xa37\xd7\xd6\xae_\x8f\
-J\x92$I\x8b\xdf\x10\xb1\x9a=m\x1c\xf1\x85\xa9\xc3\
-\x11\x00\xc0B\xcbg\xa0/g\xcf\xc8\xff{\xad\x1e\x8d\
-$I\x92\x96\xafQJ\xb7\x1fRz\xf9\xf4a\x09\x00\
-`\x11\xe5s\xcf+\x87\xae\xfb\xe5z\x14\x92$IZ\
-\xee\xf6u\xdd5\xc7\x11\xf7\x9b\xa4\xf4\x8e\xd6\xe1\x09\x00\
-`\xeeE\xbc;\xbb\xff\xb9)]\xbb\x1e\x81$I\x92\
-\xf4\x95F)\xfd\xe8\x10\xf1\xd8|`\xfad\xf30\x05\
-\x000\x7f\xce\x1bR\xfa\xc3am\xed\xc7\xeb\x91G\x92\
-$I\x97\xd6\xa4\xebb\x94\xd2\xb3\x1b\x87*\x00\x80\xf9\
-\x11\xf1\x9cIJ}=\xe2H\x92$\xe9H\x1b\x22\xee\
-\x98\x0fS\xff\xd4<d\x01\x00\xcc\xaeW\x0f}\x7f\xa7\
-\x03++W\xa8\xc7\x1aI\x92$\x1dm\x9f>\xe5\x94\
-\xeb\x8cRz\xe08\xe2?\x1a\x07.\x00\x80\x991D\
-\xbco\x14\xf1\xa0O\xaf\xaf\x7fk=\xcaH\x92$\xe9\
-x\x1bw\xdd\x0d\x87\xbe\x7f\xc2\x90\xd2f\xeb\x10\x06\x00\
-\xb0[\xca\xf9${\xe2xm\xedF\xf5\xe8\x22I\x92\
-\xa4\xad\xae\xfe0\xea\x17\xb7\x0ed\x00\x00;\xad\x9cK\
-\xca\xf9\xa4\x1eU$I\x92\xb4\xdd\xe5\x03\xd8\xe9\xe3\x88\
-\xe7\x0e)\xfdO\xeb\x80\x06\x00\xb0]\xf2\xf9\xe3\x8b\x07\
-\xcf!\xf9<R\x8f&\x92$I\xda\xe9\xf2\xc1\xecV\
-\xf9P\xf6W\xf9\xd7/\x1fzX\x03\x00\xd8jCJ\
-\x17\xe6_\xff:\x9f=n]\x8f\x22\x92$I\xda\xed\
-F)\xed\x19\x22^8}x\x03\x00\xd8\x0aCJ/\
-\x1aE\xdc\xb6\x1e=$I\x924K\x1dXY\xb9\xe2\
-(\xa5\xdb\x0f\x11\x7f\xd7:\xcc\x01\x00\x1c\x83\x97\x8c\xba\
-\xee\x97\x0e\xec\xd9\xf3U\xf5\xc8!I\x92\xa4Y\xed\xc0\
-\x09'|\xcd\xa4\xef\x7f9\x1f\xe2^:u\xa8\x03\x00\
-8\x22\xa3\x94^\xb6/\xe2\x8e\x17nl|]=b\
-H\x92$i^\xfa\xd8\x89'^iH\xe9W\xb2\x97\
-\xb7\x0e{\x00\x00\x0d\xaf\x18G\xdc\xe5\xdc\x94\xbe\xa1\x1e\
-)$I\x924\xaf\x9d\xbf\xbaz\x95q\xdf\xdf5\x1f\
-\xf2^9u\xe8\x03\x00\xf8\x8aW\x8f#\xee>D|\
-c=BH\x92$iQ*\x87\xbc\x83\x87\xbd\x94\xfe\
-\xb9q\x10\x04\x00\x96P>\x17\xbcn\xd4u\xbf1\xe9\
-\xfbk\xd4#\x83$I\x92\x16\xb5Ot\xdd5\xcb\xe1\
-\xaf\x1c\x02[\x87C\x00`)\xbcq\xe8\xba\xfb\xfc\xbf\
-\xf6\xee=F\xb3\xb2>\xe0\xf8\x864b-\xbd\xa46\
-\x08D\xd4V,\xd6\xd2\x0b\x8d$\x98\xa2\xe3\xce\xf9=\
-g&\x9b-\x96\xca\x96\xb6\x16\xe5\x22\x8a-\xf5\x0a\xad\
-\xd6T\xda\xd8HK\x93\x9aH\xec\x8a\xd4JU\x90\x8a\
-\x7f`\x846&R\x0aX\xd1\xb4E\xa5-\xd64@\
-\xb9\x04\x5cv\xdes\xde\xd9]\xb0\x91v\xb7\xbfg\xf6\
-l:\x8eo\xe2\xb2\x97\xd9\xb9|>\xc97gf \
-\xb8\xfb\xbe\xefy\x9e\xe77\xbe\x99\xd9Y\xca\xb1\xc3\x11\
-\x01\x00\x80\xf5\xa2\x1e\x02\xbb\x88K\xf2Px\xc7\x92C\
-\xa2$IZ\xa3u\xa5\xdc\xd5G\xbcu{\xc4\x09\xc3\
-\x91\x00\x00\x80\xf5j\xd7\xcc\xcc\xf1]\xc4[\xb2/N\
-:<J\x92\xa4\xd5_W\xca?\xf5\x11\x97\xe6~\xff\
-\xbc\xe1\x08\x00\x00\x00{\x8d\xda\xf6\xc4<,\xbe#\x0f\
-\x8b_\x9et\x98\x94$I\xab\xaf\xae\x94\xbbso\x7f\
-\xe7\xb8i~b\xd8\xf2\x01\x00`\xb2n\xe3\xc6\xe7\xe7\
-\x01\xf2\xcdy\x80\xbcu\xd2\xe1R\x92$\xad\x8a\xee\xa8\
-\xffg\xcf\xb8mO\x1a\xb6x\x00\x00\xd8?s\xb3\xb3\
-?\xd4E\x9c\xdb\x95\xf2\xe9<X>\xb5\xe4\xa0)I\
-\x92Vf\x9f\xe9\x9b\xe6\x82\xf9\xa6y\xf6\xb0\xa5\x03\x00\
-\xc0\x81\xeb\xdavsW\xca5}\xc4\xe3\x13\x0e\x9f\x92\
-$\xe9\x08\x96{t\x9f{\xf4\xb5\xf9\xf1Y\x97o\xd8\
-p\xd4\xb0}\x03\x00\xc0\xa13*\xe5\x17\xbb\x88+\xf3\
-\xd0\xf9\x8d\xc5\x87QI\x92\xb4\xfc\xe5\x9e|\x7fW\xca\
-\xfb\xfb\xa6y\xe5\xb0U\x03\x00\xc0\xe157=\xfd\x92\
-<\x84\xbe+\x0f\xa3_\x9atH\x95$I\x87\xaf\xdc\
-\x7f\xff%{O\xd7\xb6?7l\xcd\x00\x00\xb0\xbcv\
-m\xdat\xdc(\xe2\xe2<\x98\xfe\xdd\xa4C\xab$I\
-:tu\xa5|\xbek\x9a\xdfy\xb2mO\x1c\xb6b\
-\x00\x008\xb2v\xcf\xce\x1e=j\x9as\xf2\xb0z}\
-\x1f\xf1\xc4\xa4\x83\xac$Iz\xfa\xe5\xde\xfa\xed.\xe2\
-\xc6q\xdb\xbef\xdb\xd4\xd41\xc3\xd6\x0b\x00\x00+O\
-\x1eZ\xcb(\xe2\x83y\x90}d\xe9\xc1V\x92$\xed\
-_]\xc4\xb6\xae\x94\x0f\xcfGl\x1a\xb6X\x00\x00X\
-\x1d\xc6\x11/\xed\xdb\xf6\xbdy\xa8\xfd\xd7I\x87]I\
-\x92\xf4\xdd\xe5\xbe\xf9\x1f\xe3R\xfed\xbei^6l\
-\xa9\x00\x00\xb0:\x8dgg_\x98\x87\xdc\xb7\x8f\x22\xee\
-Xz\xf0\x95$I{\xebJ\xb9\xab\x8f\xf8\xbd\x1dm\
-\xfb\xe2a\x0b\x05\x00\x80\xb5a\xdc\xb6?\x9a\x87\xdd\xf3\
-\xf3\xe0{\xd3\xd2\x83\xb0$I\xeb\xb8[r\x8f|\xc3\
-\xce\xe9\xe9\xe7\x0c[&\x00\x00\xac]]\xc4\x19\xe3\x88\
-\x1b\xbbR\x9e\x9ap8\x96$iM7\xec\x7f\x9f\xed\
-\x9b\xe6\x95\xc3\xd6\x08\x00\x00\xebK\x1e\x86O\xcd\x83\xf1\
-\xbb\xfa\x88\xdb\x97\x1e\x98%IZk\xe5\x9e\xf7\xc5.\
-\xe2=\xe3\xa69m\xd8\x0a\x01\x00`}\xdb\xb3y\xf3\
-\xb3\xfa\xa6yu\x1e\x96\xaf\xc9C\xf3\xc3K\x0f\xd1\x92\
-$\xad\xd6ro\xfbf\x1fq\xed\xb8m\xcf\xe9\x22~\
-x\xd8\xfa\x00\x00\x80\xa5v\x96r\xca\xa8\x94\xcb\xf2\xe0\
-|\xeb\xa4\xc3\xb5$I\xab\xa2\x88\xdb\xc7\xf5\xdd\xb0M\
-s\xea\xb0\xc5\x01\x00\x00\xfbc\xcf\x96-\xcf\xe8\x22\xce\
-\xecJ\xd9\x9a\xd7\x07&\x1e\xb8%IZY=\xbc\xf0\
-\xae\xd7\xa6y\xf5c\xa5\xfc\xc0\xb0\xa5\x01\x00\x00\x07\xaa\
-\xfez\xde>\xe2\xad]\xc4\xe7&\x1c\xc0%I:\xa2\
-\x0d\xefn\xbdl\xd44?3l]\x00\x00\xc0\xa1\xb4\
-g\xc3\x86\xa3F\x11\x9b\xf2\xe0\xfd\x81<\x80\xff\xe7\xe2\
-\x03\xb9$I\xcbY}\x17\xeb\xc2\xbbY\x9b\xe6U\xf5\
-\xdd\xad\xc3V\x05\x00\x00\x1cn\xdb\xda\xf6\xa4<\x90_\
-\x92\x07\xf3\x9b\xf3\xfa\xbfK\x0f\xeb\x92$\x1d\x8er\xcf\
-\xf9\xdc\x5c\xd3\xbc\xad\xbe\x8bu\xd8\x92\x00\x00\x80#e\
-\xae\x946\x0f\xe9\x7f\x9e\x87\xf5{\x97\x1e\xde%I:\
-\xd8r\x8f\xa9\xefN\xfd\xc0|\xc4\xa6=\x97_~\xd4\
-\xb0\xfd\x00\x00\x00+E\xb7q\xe3\xf3G\x11\x17\xe7\xc1\
-\xfd\xa6>\xe2\xbf\x17\x1f\xe8%Iz:\x0d\xefB\xad\
-\xefF\xbdd\xdc\xb6'\x0d[\x0d\x00\x00\xb0\xd2\xf5m\
-\xbb1\x0f\xf2W\xe6\x81\xfe\x9e\xc5\x87|I\x92\xbeG\
-\xf7\xd6w\x9f\xd6w\xa1\x0e[\x0a\x00\x00\xb0\x1a\xed\xda\
-\xb4\xe9\xb8q)\xbf\x96\x07\xfc\xab\xbbR\xbe1\xe1\xf0\
-/IZ\xe7\xe5\xfep\xdf8\xe2/\xe7K\xf9\xcd\xb9\
-\xd9\xd9\xe7\x0e[\x08\x00\x00\xb0V<\x11qB\xd7\xb6\
-\xaf\xc9\xc3\xff5\xbd\xdf^&I\xeb\xba.\xe2\xfe\xdc\
-\x0f\xfe\xaak\x9a\xd7\xe6\xc7\xcf\x1b\xb6\x0a\x00\x00`\xad\
-\x1b\xb5\xed\x899\x04\x9c\x9b\x03\xc1Gr8\xb8o\xe9\
-\xb0 IZ\x93\xfdW\x1fqm^\xcf\xebgf^\
-0l\x09\x00\x00\xc0zU\x7f@uW\xca\xeb\xba\x88\
-\x8f.\x0c\x0c\x93\x07\x09I\xd2j,\xe2\xa1\xbc~\xac\
-o\x9a\x0b\xf2\xfa\xe3\xc3\xd2\x0f\x00\x00\xf0\x9d\xea\xc0\x90\
-\x03\xc4\xf9\xa3:@\xec\x1d$&\x0f\x19\x92\xa4\x95\xdc\
-#\xa3\x88O\xe4\xf5\xc2\xf1\xec\xec\x0b\x87%\x1e\x00\x00\
-`\xff\xd4A\x22\x87\x8a\xd7\xf7{\x07\x8bG\x16\x0d\x1b\
-\x92\xa4\x15V\x17\xf1h^\xaf\xcb5\xfb\xa2\xf9\x88\x17\
-\x0dK9\x00\x00\xc0\xc1\xa9\x03\xc6\xa8m\xdf\x90\x03\xc7\
-\xf59p\xd4\xc1c\xe2P\x22IZ\xd6\x1e\xcb5\xf9\
-\x93\xa3R\xde\xb8}\xe3\xc6\x93\x87%\x1b\x00\x00\xe0\xf0\
-\xd8\xde\xb6/\x1eE\x5c\x9c\xc3\xc8\x0d\xd97\x17\x0d'\
-\x92\xa4\xc3]\xc4\xb6\xae\x94\xbf\x195\xcd\x9bv\xe4z\
-<,\xcd\x00\x00\x00\xcbknz\xfa%\xe3R~+\
-\xfbT\x0e)\xdb'\x0e0\x92\xa4\x83\xaa\xae\xaf]\xc4\
-\x8du\xbd\xdd\x91\xeb\xee\xb0\x04\x03\x00\x00\xac\x0cs\x11\
-?\xd5G\x9c\x9f\xc3\xcb\x87s\x88\xb9g\xe9P#I\
-zZ\xdd\xb3\xb0\x9e\xe6\xbaZ\xd7\xd7a\xa9\x05\x00\x00\
-X\xd9\xb6MM\x1d3n\x9a\xc8\x81\xe6\x0fr\xb0\xb9\
-\xa5\x8b\xe8\x96\x0c;\x92\xa4E\x0d\xeb\xe4-u\xdd\xac\
-\xebg]G\x87%\x15\x00\x00`\xf5\x9a\x9f\x9999\
-\x87\x9d\xf3\xfa\x88\x0fe_[<\x08I\xd2:\xeek\
-\x0b\xebb\xae\x8fu\x9d\x1c\x96L\x00\x00\x80\xb5i\xcf\
-\xe6\xcd\xcf\xca!\xa8\x19G\xbc;\x07\xa1\x9b\xb3\xb9a\
-8\x92\xa4\xb5^]\xefn^X\xffr\x1d\xac\xeb\xe1\
-\xb04\x02\x00\x00\xac?\xf3M\xf3\x93]\xdb\xbe\xb6+\
-ek\x17\xf1\x95%\x03\x94$\xad\xea\x86umk\xae\
-q\xaf\xab\xeb\xdd\xb0\xf4\x01\x00\x00\xb0\xd8C\xa7\x9f\xfe\
-\xfd\xdbK\x99\xce!\xea\xf7G\x11\x9f\xcd!\xcao4\
-\x93\xb4\xaa\xaa\xeb\xd6\xc2\xfa\x95\xebX]\xcf\xea\xba6\
-,q\x00\x00\x00\xec\xaf\xc7#^\x94\x83\xd5\xb9\xa3\xa6\
-\xf9\x8b\x1c\xb4\xee\x9e4\x80I\xd2\x91\xae\xaeO\x0b\xeb\
-T\xaeWu\xdd\x1a\x960\x00\x00\x00\x0e\x95Q)\xa7\
-\xe4\xd0\xf5\xce\x1c\xc0n\xcbA\xec[K\x073IZ\
-\xa6\xbeU\xd7\xa1\xba\x1e\xd5uiX\xa2\x00\x00\x00X\
-\x0e\x8f\xcf\xcc\x1c?n\xdb\xd9q\xfd&Q\xc4\x0d}\
-\xc4\xd7'\x0cn\x92t\xf0\xe5\xfaR\xd7\x99\xba\xde\xd4\
-u\xa7\xae?\xc3R\x04\x00\x00\xc0\x91\xb6gj\xea\x99\
-s\x11\xa7\x8fKyc\x0eq\xf5\x87\xba\xde\x95\xd7'\
-\xbfc\xb0\x93\xa4\xef\xdd\x93\xc3\xfa\xb1\xb5\xae'u]\
-\xa9\xeb\xcb\xb0\xd4\x00\x00\x00\xb0\x1a\xcc\xcf\xcc\x9c<j\
-\x9as\xfa\x88\xf7e\x7f\xdbE<\xbad\xf8\x93\xb4\xce\
-[X\x17r}\xa8\xebD]/\xea\xba1,!\x00\
-\x00\x00\xac\x15;K9v\x5cJ;*\xe5ws\x18\
-\xbc.\xfb\xf7}\x83\xa1\xa4uS\xbd\xef\xaf\xab\xeb@\
-]\x0f\xea\xba0,\x11\x00\x00\x00\xac\x17\xff\xb6e\xcb\
-3\xc6MsZ\x1fq\xd1(\xe2\x83y\xfdB\xb6k\
-\xd1\xf0(i5W\xef\xe7\xbc\xaf\x87\xfb\xfb\xa2z\xbf\
-\xd7\xfb~X\x02\x00\x00\x00\xe0\xff\xd5_'\x9d\xc3\xe4\
-\xd9\xd9\x1fg7g\x0f/\x0c\x97\x92VC\xf5~\xad\
-\xf7m\xbd\x7f\xcf\xf6\xeb\xe1\x01\x00\x008`{\xa6\xa6\
-\xbe\xaf\xfe\xa0\xd9.\xe2\x92\x1c2\xaf\xca\xee\xeaJ\xe9\
-\xf3:i \x95\xb4L\x0d\xf7a\xfd\x81\xd0W\xd5\xfb\
-s\x1c\xf1\xd2z\xbf\x0e\xb7.\x00\x00\x00\x1cz\xbbg\
-g\x8f\xee\xa6\xa7\x7f6\x87\xd1\xb3s\x18}w^\xff\
-:\xaf_\xca\xba:\xacJ:t-|\xf3'\xef\xaf\
-\xfc\xf8c\xe3\xbc\xdfF\xa5l\xa9\xf7\xdf\x03~#\x18\
-\x00\x00\x00+\xc5c\xa5\x1c\xdbE\x9c1W\xca\x85y\
-\xfd\xd3\x1cdo\xcaA\xf6\xde\xbc\xfe\xcf\xe2!W\xd2\
-w\xd7\x95\xb2;\xef\x95\xaf\x8fJ\xf9L\xde?W\xe6\
-\xd7.\xec\xa6\xa7_\xee\x07A\x03\x00\x00\xb0j\x8d\xdb\
-\xf6\xa4\xf9\x88M9\xe4\xbe-\xdb\x9a\x03\xef\xdf\xe7\xf5\
-\x91:\x08K\xeb\xb1\xbc\x07\x1e\xedJ\xb9-\xafW\xe7\
-\xe7o\xef\x9afs\xde#~\xfe\x0f\x00\x00\x00k\xdf\
-\xb6\xa9\xa9c\xfa\x99\x99_\x18E\xfcz\x0e\xc6\x97\xe7\
-\x80|}^\xff9\x07\xe4\x1d\x8b\x87gi5\x97\xaf\
-\xe9'\xf2\xb5}w^o\xc8\xcf\xffh\xdc4\xbfQ\
-\x7f\xf6\xcf\xee3\xcf\xfc\xc1\xe1V\x00\x00\x00\x00\xaa\xfa\
-\xcd\xa2:4\xe7\x00}^\xdf\xb6\xef\xed#>\x9e\x1f\
-\xdf\x99W\xbf\x05M+\xb9\xc7\xb2\xfa:\xfdx}\xdd\
-\x8e\x22^__\xc7\xf5\xf5<\xbc\xb4\x01\x00\x00\x80\x03\
-5\xdf4\xcf\xce\xc1\xfb\xe7\xbbR~i\xdc\xb6o\xca\
-\x01\xfc}\xc37\x8d\xfe!\xbfv_\xf6\xeda@\x97\
-\x0eY\xf9\xbaz\xaa\x8b\xb8?_k\xb7g\x9f\xc8\xaf\
-]\x91_\xfb\xed\xfc\xda\x99}\xd3\x9c\xbac\xf3\xe6\x1f\
-\x1b^\xa2\x00\x00\x00\xc0\x91\xb0sz\xfa9\xc3\xbb\x8c\
-\xce\xca\xa1\xfd\xcd\xd9\x9f\xe5\x10\xff\xc9\xec\x0b\xf9\xb5\x07\
-\xf3\xf3\xdd\xfb\x06}i_\xf5u\xd1E<\x94\xaf\x93\
-\x7f\xccn\x18\xe7\xeb&?\x7fK~\xfc+\xe3\xa69\
-m\xd7\xa6M\xc7\x0d/1\x00\x00\x00`5\x9a\x9b\x9d\
-}\xee\xa8i^\x96C\xff\x96\xbe\xfep\xdfR\xde\x9f\
-}\xba\x8b\xf8r\xf6\xe8\xd2o\x16h\xedT\x9f\xdf\x85\
-\xe7\xb9>\xdf\xf9\xbc\x8f\x22\xde\x91\xfdj}=\xd4\xd7\
-\xc5\xf0\x12\x01\x00\x00\x00\xd6\x9b\x07\xa6\xa6\x9e\xf9D\xc4\
-\x09;K9eG)\xaf\xe8K9+\xbb0\xbb,\
-\xbb\xa2\x8f\xb8z\x1cqcvk~\xfc\xd5\xac\xbe\xb3\
-dW\xfd\x86\x83\x96\xb9\xfa\xb8\xef}\xfc\xbfZ\x9f\x8f\
-\xfa\xbc\xe4\xc7\xf5\xb7x]\x91\xd5\xe7\xab>o\xf5\xdd\
-b\xaf\x18\xe5\xf3\xb9=\x9f\xd7\xfa\xfc\x0eO5\x00\x00\
-\x00\xc0\xc1\xd9=;{\xf4\xae\x99\x99\xe3w\xce\xcc\xfc\
-\xf4\x8e\x99\x99\x97\xf7m\xfb\xcb}\xd3\x5c\xd0G\x5c\x9a\
-\xd5\x9fw\xf4\xa1q)\x9f\xca>\xdfE|\xa5/\xe5\
-\xc1lg6\xf9\x9b\x1d\xeb\xb3\xfax<X\x1f\x9f\xfa\
-8\xd5\xc7\xab>n\xc3\xe3w\xe9\xc2\xe3\x99\x8fk}\
-|\xeb\xe3\x5c\x1f\xef\xfa\xb8\x0fO\x01\x00\x00\x00\xc0\xea\
-\xd1OM\xfdH?3\xf3\x82.\xe2\x8cQ\xd3\xcc\xf6\
-\xf57\xad\x0d\xe5\xe7\x7f\xb8\xaf\xfc\xfc\xaa\xfcw>Z\
-\xab\xef\x86\xe9J\xb9\xad\x96_\xbf3\xbf\xf6\xc0\xc4J\
-\xe9\xf3\x9fO\xfa\xe6\xcb\x01U\xff{\x13\xffw\xb2\xfc\
-\xe7w\xee\xfb3-\xfc\xf9\x86?k~\xfd\xaa%\x7f\
-\x8f\xc5\x7f\xbf\xd9\xfcw\xce\xa8\x7f\xff\xfa8\x0c\x0f\x09\
-\x00\xc02\xda\xb0\xe1\xff\x00\x14C\xfb\xf8\xb1+h\x86\
+\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x01\x9fIDAT8\xcb\xad\
+\x95\xcfnRa\x10\xc5\x7f\xe7\xeb\xbd\x16\xb9MS\xbb\
+\xa3&\xb8q\xefB\x8c\xaf\x80,$\xfea\xe1\x1b\xd4\
+\x8dO`\xd2\x10}\x06\xed\x0bt\xc5\xc2\xb0\xa1\xdd\xba\
+\xd4\xf0\x08\xaeH\x84\x95\xa4A\xee\xa5\xe6\x06\x8e\x0b\xa2\
+\xa6\x88\x91\x16~\xbbI\xbe9\x99/3sF,\xe3\
+lw?\xa1X\x17z$\xa9bs\x1b@\xe2\xab\xed\
+\xae\xf1iJ\xd6\xa6:\x1a.\xa6\xeaR\xd4a;\xd9\
+*=\x17:\xc2\xba\x83\x1c\x0b]zcl\xac\x1c\xdc\
+\xb3\xddL=hQ\xe3\xc7\xdf\x82\x1f\xf6\xf6\x92\xe4\xe6\
+\xeb`\x1d\x82\x12V\xc0v\xe6\xe0\xf7i:y\xcb\x93\
+\xf3s\x80\xad\xdf\x95\x15n5\xe5\xf0J\xa8\xc0\x8aH\
+\x8aA\x0f\xe2\x1b\xd1v\xfeb\xfc\x91\x13\xa6\x01 Q\
+\xa9\x11\xacCA\xcc\x15\x11\xc4\x9a\xe9e\xa2Rc\x1e\
+\x9f\xed\xee\xef\xb0\xf3I\xd2]\xd6\xc0\xf6\x971\xe3\x87\
+!\xa1X\x07\x95Y\x1b\x95\x13\x8a\xf5HR\x0d\x1c/\
+6\xfc\xeaz\x8e\x85j\x91\xd0}\x16F\xe3ZzH\
+\x98J\xf85\xb4\x9b\xc0p\x10\xd80A\xd0\xdf\x94\x98\
+\xa0\x1f,w\x8d\xbd\xfewm\xcb\xdd`\xbb3\xdf\xcd\
+u\x15\x95\xdb\xee\x84\x94\xac\x0d\xeem\xa0%\xbd\x94\xac\
+\x1d\xa8\x8e\x86\xb6\x9b\xb6\xb35\xb6$\xb3\xdd\xa4:\x1a\
+\x06\x80\xd4\x83\x96\xf1\xb1!\xbf\xc6\xa8\xe4\xc6\xc7\xa9\x07\
+\xad?ns\xc24\x7f\x16}\x8e\xa3\xa8\x00\xdc\x9b\xbb\
+\xc8\x8a\x95\xe1w\xe9d\xf2\x86\xc7\x17\xe9r\x83U\xa9\
+!\xe9\x08T\xfe\xa7\xc1\xa2\x1c\xff\xcf`\x97\x9d\x00\xa9\
+&\xabb\xe9`\xbe\xae\xee[\xee\xce\xa6\xb3\xd3\xec\x22\
+k\xf3\xf4\xfb\xb7\xc5\xd4\x9f\xe2\x0c\xc8;\xf8\xb1w7\
 \x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00s\x8c\
+\x00\x00\x02V\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x04\x85\x00\x00\x04\x84\x08\x06\x00\x00\x00\xfa\x10\xbf\x08\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x002\xc0\x00\x002\xc0\x01(d\
-Z\xdb\x00\x00s!IDATx^\xec\xdd\x07\x9c\
-\xa5W]\xf0\xf1\x11Q\xc9\xceyfIB\xd8\xbd\xe7\
-\xdcd\x11\x83%\x16TD\x8a\x0d|\x15\x10\x04D\x11\
-\x10\xa9*\xa2\xf47\xa0\xa8\x88\x01\x94\xa6\x08\xbc\xf2*\
-\xd2\x04i\x9a\x80\x021\x99{\x9e;\x09\x0b\x82 \x88\
-\x14\xa5\xbc\x02\x8a\x80\x14\x01)\x16\x8a\xb4\xf79\x9b\x83\
-!\xb3g\x93-Sn\xf9\xfe>\x9f\xefg53;\
-\xe5\x96\xe7\x9e\xff?afE\x92$i7;i=\
-\x8dC\x1e}\xe3\xea$\xdd\xe8K\xbaI\xbc\xdb\xff\xc8\
-\xf1A\xab\x93\xd1\xc3\x8a\xd0\xa7\xdf\x09\xd3\xf4\xccK\xc4\
-\xe7t}<\xd8\x94\xd3\x1b\x86\xf7}\xd7V)\x1f\xaf\
-\xf9y\x06\xe5\xeb\xf8\x9f\xafi\xf8\xfa\xbe\xf4\xb5\x96\xaf\
-\xfb\xcb\xbf\x8f/\xff\xfe\xca\xf7[\xbe\xefz\x13H\x92\
-$I\x92$\xcdo\xa7\xac\x9f\xb2\xb6w\xb2\xef\x1a{\
-'\xa3\xef\x5c\x9d\xc4\x1fZ\x9d\xc6\xdb\x85i\xfc\x85\x90\
-\xe3CBN\xbf;x\xe6\xe0%]\x9f^1x\xcb\
-\xe0\x03]\x8e\xff=\xfc\xf9\xc5\xe5\x15?3\xf8\xc0\xf0\
-\x7f\x97\xdb\xe3\x15\xe5\xf6\xa9\xb7\xd3p{\x0d\xb7\xdbp\
-\xfb\x95\xdb\xb1\xdc\x9e\xe5v-\xb7o\xb9\x9d\xebM.\
-I\x92$I\x92\xb4\xb5\x9d\xbcq\xcd\xbd{\xfb}_\
-\xbb\xb7\x1f]g-\x8f~x5\xc7\xdb\x87\x1c\x7f1\
-\xf4\xf1\xd7\x87?\x1f\x1frz\xd6\xe0\xfc.\xa7W\x0e\
-\xde\xda\xf5\xe9\x83\xc3\x9f\x9f\xbdt\xd9\xc1\xb6\xb9\xe4v\
-.\xb7\xf7[\xcb\xed_\xee\x87K\xee\x8f\xe1~\xb9\xe4\
-\xfe\xf9\xc5r\x7f\x95\xfb\xad\xdc\x7f\xe5~,\xf7g\xbd\
-k%I\x92$I\xd22w\xd2\xc14\xee&\xf1\x06\
-\xab\x93x\xbb.\xc7\x07\x86\x1c\x9f\xd8\xf5\xf1\x85\xa1\x8f\
-\xaf\x19\xfe|\xffa\x8b\x08\x16@|\xff\xa1\xfb7\xc7\
-?;t\x7f\x0f\xf7{\xf9\xaf\x90\xba\x8dx\x83\xab\xe4\
-xz}hH\x92$I\x92\xa4yn\xcf\x05\x07\xf6\
-\xaf\xad\x8f\xaf\x1b&\xe9\xc7\xbb>\xdd\xaf\xfc\xac\x9b\xe1\
-\xcf?\x1d\xfe\xfc\xab\xe1\xcf\xf7\x0c\xbep\xc9\xa2\x00\xfe\
-\xc7{\x0e=>r:wx\xdc<\xae\x9b\xa6\xfb\x87\
-i\xfa\xf1\xb5<\xfe\xee=\x933F\xf5\xa1%I\x92\
-$I\x92v\xb3n#\x9e\xba\xa7\x8f\xdf\xde\xf5\xf1\x96\
-\xa1\x8f\xf7\x1a\xfe|\xf4\xf0\xe7s\x87?_6\xfc\xf9\
-\x8f~V\x0f[*\xa7\xcf\x86\x9c\xfeix\x5c\xbd|\
-x|=ox\x9c=f\xb5\x8f\xf7\xee\xa6\xf1V\xe5\
-g\x1d\x85\xf5\xfd\xa7\xd5\x87\xa6$I\x92$I:\xd1\
-\xc2\xf9\xa3\xab\x1d\xfaMU\x93\xf1\xcf\x0dC\xf9o^\
-\xf2\xdb\xb6\xca\x0fi\x8e\xef=lh\x87]\x17?\x10\
-\xfa\xf8\xeaC\x8f\xd3\xf2x\x1d\x1e\xb7\xe5\x07d\x97\xc7\
-q}HK\x92$I\x92\xa4/o\xf5\xa2\xab\xef\x0b\
-\xfd\xf8\xfb\xc3t\xfcs!\xa7\xdf\x1e\x94\xdf\xd0\xf5\xb6\
-a\xb0\xf6?\xf1b!\x84\x1c\xdf\x1e\xfa\xf4\x17\x83\xc7\
-\x0d~~x\xac\xff\x80\xffI\x9a$I\x92$iy\
-:w|\xd2\x9e\x9c\xae]~\xb8s\xb8\xe4\xb7D=\
-g\xf8\xf35\xc3\x9f\x1fo\x0d\xd2\xb0\xc8B\x9f>1\
-<\xf6\xfffx\x0e<w\xf8\xf37\xcaoL\xdb\xb3\
-\x1e\xbfct\xfehO}\xc6H\x92$I\x924\x7f\
-\xed\xed\xcf\xf8\xda\xb5<\xbe\xd90\xfc\xde\xaf\x9b\xa6\xff\
-;\xfc\xb91\x0c\xc1\xef\xfe\xf2\xa1\x18h\xc8\xf1\xbd]\
-N\x17\x0d~\xbf\x9b\xa4\xfb\xafm\x8co\xb6w\xe3\x8c\
-k\xd6\xa7\x96$I\x92$I\xb3Q\xf9\x81\xcf\xe5W\
-zw\x93x\xb7a\x98}\xd4\xe0\xcf\x06\x7f?\xf0\x83\
-\x9ea\xeb\x0c\xcf\xa7\xf8\xe6\xc1\x9f\x0d\x1e=(\xcf\xb7\
-\x1b\x96\xe7_}*J\x92$I\x92\xb4}\x95_\xf3\
->\x0c\xa2?:xP\x97\xd3\x9f\x0c\xde0\xf8lc\
-\x80\x05vBy\xfe]\xf2<\x1c\x9e\x8f\xe5y\x19\x7f\
-\xd4\x0f\xb6\x96$I\x92$\x9dP\xfb\xfa}\xab\xe1\xc2\
-\xd1\xf7\x84K~\xdd\xfbSC\x8e\xaf\x1d\xfe\xfcLs\
-0\x05fH\xfcL}\xbe>\xb5<\x7f\xcb\xf3\xb8<\
-\x9f\xebS[\x92$I\x92\xa4\xcbv\xd2z\x1aw\xd3\
-t\x8ba\x98|H\x97\xe3\x0b\x86?\xdf\xde\x1e8\x81\
-ys\xe8\xf9|\xc9\xf3\xfa!\xe5y~\xd2E\xe3T\
-\x9f\xfa\x92$I\x92\xa4ek\xb5\x1f\x7f\xcb0,\xde\
-)L\xd2\xe3\x86?7\xba\x9c>\xfc\xe5C$\xb0\xc0\
-.y\xbe\x97\x1f\xfe\xfe;\xc3\x9fw*\xd7\x83zi\
-\x90$I\x92$-R\xa7\xbe\xf2\xd4.LF\xdf\xb7\
-\x96G\xf7\x1d\x86\xc1\xa7\x0f\x83\xe0\xeb\x86A\xf0s\xff\
-3 \x02\xcb-\xa7\xcf\x1e\xba.\x0c\xd7\x87\xb5\xe9\xe8\
->\xe5zQ\xae\x1b\xf5\x12\x22I\x92$I\x9a\x97N\
-\xde\x18\x9d\xd1M\xe2\xadB\x1f\x1f\xda\xe5\xf8g!\xc7\
-\x7fl\x0e\x82\x00G0\x5c?\xdey\xe8\xfaQ\xae#\
-}\xbce\xb9\xae\xd4K\x8c$I\x92$iV\xda\x93\
-\xd3\xb5\xbb\x9c\xee\x12r|\xfc0\xbc\xbdt\x18\xe2\xfe\
-\xad5\xe4\x01\x1c\xafC\xd7\x95\x1c/>t\x9d\x19\xae\
-7\xab\x17\xa5o\xab\x97 I\x92$I\xd2N\xb5\xf7\
-\xe0\x81\xab\xae\xf6\xf1\x0ea\x9a\x9e\x19\xfa\xf4\xae\xd6\x00\
-\x07\xb0\xdd\xca\xf5\xa7\x5c\x87\xca\xf5\xa8\x5c\x97\xea%J\
-\x92$I\x92\xb4U\x9dv\xf0\xb4\xb0\xba\x11\x7f\xa8\xfc\
-\xcf8\x06\x17\x0e>\xda\x1a\xd0\x00vK\xb9.\xd5\xeb\
-\xd3C\xcb\xf5\xaa\x5c\xb7\xea%L\x92$I\x92t,\
-\x85\xe9\xfeo\xea\xa6\xf1\xee]\x1f\x9f:\xf8\xbb\xd6\x10\
-\x060\xbb\xcauk\xb8~\x0d\xd7\xb1r=\xab\x976\
-I\x92$I\xd2\xe6\xcao\xfaY\xebG7\x09\xd3\xf8\
-\x1b\xa1\x8f\x93\xc1\xc7\xda\x83\x16\xc0|)\xd7\xb3C\xd7\
-\xb5\xe1\xfaV\xaes~\xb3\x99$I\x92\xa4\xa5/\x5c\
-\xb4\xff\xac\xd0\x8f~\xb6\xeb\xe3\xd3\x06on\x0dS\x00\
-\x0b'\x0f\xd7\xbb\x1c\x9fV\xae\x7f\xe5:X/\x89\x92\
-$I\x92\xb4\xb8\x9d\xbcq\xcd\xbdk\xd3\xf1M\x87\xa1\
-\xe8a\xa1\x8f9\xe4\xf8\x89\xc3\x86%\x80%2\x5c\x07\
-?>(\xd7\xc3s\xca\xf5\xb1\x5c'\xeb%S\x92$\
-I\x92\xe6\xbb\xd5~\xfc-a:\xfe\xb9n\x9a\x9e\xde\
-\xe5\xf4\x96\xd6P\x04@U\xae\x939=\xbd\x5c7W\
-/>\xfd\x9b\xeb\xa5T\x92$I\x92f\xbf\xf2k\x99\
-\xd76\xc67\x1b\x86\x9b\x87\x87\x9c\xfa\xc1\xbf\x1f6\xf4\
-\x00p\x85\xca\xf5\xb3\x5cG\xbbIzx\xb9\xae\xfa\xb5\
-\xf7\x92$I\x92f\xae\xb5<>%L\xd3\x8f\x87I\
-zR\x97\xe3\xdf\xb7\x86\x1b\x00N\xd0p}\x0d}z\
-R\xc8\xe9'\xcau\xb7^\x82%I\x92$ig+\
-\xff\xc6:\xe4\xd1\x8f\x85>>q\x18T\xde\xd4\x1c`\
-\x00\xd8&\xf1M!\xc7\xff\x13\xfa\xf1m\xf6^p\xc6\
-\xc9\xf5\xd2,I\x92$I\xdb\xd3)\xeb\xa7\xacu\xd3\
-x\xaba\x10y\xfc0\x94\xbc\xfe\xf0!\x05\x80\x1d7\
-Mo\x08}|B\x98\x8cn\xed\x07UK\x92$I\
-\xda\xb2\xf6\xf5\xfbV\xbb\x1c\x7f4\xf4\xe9q\x83\xd75\
-\x07\x12\x00fB\xc8\xe9\xf5a\x9a~\xb7\xeb\xe3-O\
-}\xf1\xa9]\xbd\x94K\x92$I\xd2Q\xf6\xaa\xf1I\
-\xc3p\xf1#\xc3p\xf1\xdb\xa1\x8f\xaf\xdd<t\x000\
-\xfb\xca\x22?L\xd2\xe3\xbai\xbaEY\xf0\xd7+\xbc\
-$I\x92$mj\xfd\xcc\xafY\x9b\x8eo\xda\xf5\xf1\
-\xd1!\xc7\xbfn\x0d\x18\x00\xcc\xa7\xb2\xe0/\x8b\xfen\
-=\xdd|\xe5\xfc\xd1\x9ez\xe5\x97$I\x92\xb4\xb4=\
-e\xe5\xab\xd6\xf2\xe8\x87\xbb>>r\x18\x16^\xd5\x1a\
-$\x00X,\x97,\xfe\xe3c\xd6\xf2\xf8f+\x07\x0f\
-\x5c\xa5\xbe\x22H\x92$IZ\xf8\xbe\xb8r\xa5\xd5\xf5\
-\xf8\xbf\xba\x9c~s\x18\x0e^\xb1yX\x00`y\x84\
-\x1c_\xdd\xe5\xf8\xa8\xb5~t\x93\x95\xf3\xce\xfa\xea\xfa\
-J!I\x92$i\x91Z\xcd\xe9\xc6\xdd$=|8\
-\xfc\xbf\xbc5\x18\x00\xb0\xdcB\x9f\xfejx\x8dx\xe4\
-\xeaF\xfc\xa1\x95\x83+W\xae/\x1f\x92$I\x92\xe6\
-\xb1\xbd\x07\x0f\x5cu5\x8f\xee3\x1c\xf2\xff\xbe5\x00\
-\x00\xc0\x11\xbcmx\xedxP8\x7ft\xb5\xfa\x92\x22\
-I\x92$i\xe6;w|R\xe8\xc7\xb7\x19\x0e\xf3O\
-\x099\xbd\xbbq\xd0\x07\x80\xa3\x14\xdf\x1f&\xe9\x8f\xc2\
-4\xfd\xa4_q/I\x92$\xcdh{r\xbav\xc8\
-\xe9\xc1\xc3\x01\xfe`\xfb`\x0f\x00' \xa7W\x86>\
-\xfe\xfa\xde~t\x9d\xfa\xd2#I\x92$i\xb7*\xff\
-\xd6\xb6\xfc\xdb\xdb\xd0\xa7g\x94\x7f\x9b\xdb<\xc4\x03\xc0\
-\xd6\xfaP\xc8\xf1\xd9kyt\xc7\xbd\xaf8\xe3\xe4\xfa\
-\x92$I\x92$i'*\xff\x966L\xe3C\xca\xbf\
-\xb5m\x1c\xd6\x01`G\x5c\xf2\xeb\xed\xd3\xc3\xba\xf5t\
-\xfd\xfa\x12%I\x92$i\xab\xdb{\xc1\x19'\xafM\
-G?U\xfe\xed\xecp\x00\xff\xd0\x97\x1f\xca\x01`7\
-\x0d\xafM\x1f\x0b}z~\x97\xd3]V\xfb}W\xaf\
-/]\x92$I\x92N\xa4\xe1\xb0}\xbd\xc1\xc3\xea\xbf\
-\x8dm\x1e\xc6\x01`V\x84\x9c\xfev\xf8\xf3\xb7\xc2\xc6\
-\xe8{\xebK\x99$I\x92\xa4\xa3\xad\xfc[\xd6\xf2o\
-[\x87\x83\xf5\xf3C\x1f?\xba\xf9\xc0\x0d\x00\xb3nx\
-\x0d\xfb\x8f.\xc7\x17\x0c~\xe6\xa4\xe9\xe9\xb1\xbe\xc4I\
-\x92$Ij\x15\xd6G\xdf;\x1c\xa4\x7f+\xf4\xe9u\
-\x9b\x0f\xd7\x000\xbf\xe2\x9b\xba\x1c\x1f\xbb\xba\x91nT\
-_\xf2$I\x92$\x95\x7f{Z\xfe-j7M\xe7\
-\x1d\xfa\xb7\xaa\xcd\xc34\x00,\x80\x1c?5\xfc\xf9\xa2\
-\xd0\xa7{\x9e\xbc1:\xa3\xbe\x14J\x92$I\xcb\xd5\
-\xde\xc9\xbek\x0c\x87\xe2\xdf\x19\x0e\xc7\x1f\xbe\xcc\x81\x19\
-\x00\x96@\xf9\xe1\xd4\xc3\x9fOZ\xcb\xe33\xebK\xa3\
-$I\x92\xb4\xd8u\xd3t\x8b\xae\x8fO\x1d\x0e\xc2~\
-\x83\x18\x00K\xef\xd0o.\x9b\xa6g\x86<\xfa\xb1\x95\
-/\xae|E}\xb9\x94$I\x92\x16\xa3S_yj\
-7\x1c|\xef\xd4\xf5\xf1\x85]N\x9f\xdd| \x06\x00\
-\x0e\xfdp\xea\x97t\xd3x\xf7\xb5<>\xa5\xbe\x84J\
-\x92$I\xf3Y\xf9y\x09\xdd$\xdd\xaf\xcb\xf1\xe2\xd6\
-\xe1\x17\x00h\xfa\xcb\xae\x8fg\xaf]|\xfa\xd7\xd5\x97\
-TI\x92$i>\xda\x93\xd3\xb5C\x8e\xe7\x84\x9c^\
-\xdf8\xe8\x02\x00G#\xc7\xbf\xef&\xe9\xb7\xd6\xa6\xa7\
-\x7fW}\x89\x95$I\x92f\xb3\xd5\x9cn\x1cr|\
-b\xe8\xd3\xbb\x9a\x87[\x00\xe0\xd8\xe5\xf8/]N\xbf\
-\xbf\xb6>\xbaI}\xc9\x95$I\x92f\xa0/\xae\x5c\
-)L\xd2\x8f\x87>\xfeq\xc8\xf1\xe3\xcd\xc3,\x00p\
-\xc2B\x9f\xfe+\xe4\xf4\xfc\xd5\x1co\xbf\xb2~\xe6\xd7\
-\xd4WbI\x92$ig\x0b\xe7\x8f\xae\x16\xfa\xd1\xcf\
-\x0e\x87\xd3\xf3[\x07W\x00`\xfb\x84>N\xc2$\xfe\
-\xc2\x9e\xc9\x19\xa3\xfa\xd2,I\x92$mo\xdd4]\
-\xab\xcb\xf1A\xc3\x81\xf4\x15\x9b\x0f\xa8\x00\xc0\xce\x0a9\
-\xfeu\xe8\xd3\xaf\x86\xf5\xfdg\xd5\x97jI\x92$i\
-k[\xcb\xe3\xef\xee\xfa\xf8\xc8\xc1\x9b[\x87R\x00`\
-\xf7\x84>\xfdC\xc8\xe9\xb7C?\xfa\x9e\xfa\xd2-I\
-\x92$\x9dXk\xd3\xf1M\x87\xc3\xe6\x1ft9\xbeo\
-\xf3\x01\x14\x00\x989\x1f\xea\xfa\xf8\xb4\xe1u\xfbG\xeb\
-K\xb9$I\x92t\x0c\x9d;>i\xb5\x8fw\xe8r\
-\xfa\x93\xe1P\xf9\xa9\xc6\x81\x13\x00\x98e9}\xae\xeb\
-\xe3\x0b\xbbi\xba\xf3)\xeb\xa7\xac\xd5WxI\x92$\
-\xe9\x08\x1d<p\x95\xe1\x10y\x97\x90\xe3\x05\xcd\x03&\
-\x000wBN}\xf9\xe5\x10\xa7\x1d<-\xd4W|\
-I\x92$\xa9vp\xe5\xcak\xd3\xf1\x1d\x87\x83\xe3\x8b\
-7\x1f$\x01\x80\xc5\x10\xfaxa\xd7\xc7\xbb\x96\xff\x22\
-\xb8\x9e\x00$I\x92\xb4\xb4}q\xe5+Vs\xbc\xfd\
-p@\xfc\xb3\xd6\xe1\x11\x00X<!\xa7\xf3\xd7\xf2\xf8\
-\xa7W^w\x9d\xaf\xaa'\x02I\x92$-S\xa1O\
-\xb7\xedr:\xafuX\x04\x00\x96@\x8e\x7f^\xfe\xe5\
-P\xf9\x97D\xf5x I\x92\xa4E.\xe4\xd1\x8f\x85\
->=\xbf\xcb\xe9\xf3\xcd\x03\x22\x00\xb0\x5cr:\xaf\xfc\
-\xcb\xa2zT\x90$I\xd2\xa2\xd5\xf5\xf1\x96!\xc7\xe7\
-\x0c\x7f~\xa6y \x04\x00\x96\xd9\xe7BN\xcf/\xff\
-\xf2\xa8\x1e\x1d$I\x924\xefu\xeb\xe9\xe6\xc3!\xef\
-Y]\x8e\x9fl\x1c\x00\x01\x00.\x95\xe3gB\x1f\x9f\
-=\xfc\xf9\xa3\xf5(!I\x92\xa4yk\xad\x1f\xdd\xa4\
-\xcb\xe9\xe9\xa1O\xff\xde<\xf4\x01\x00\x1c\xc1p~\xf8\
-\xaf\xc1\x1f\xad\xe5\xf1\xcd\xea\xd1B\x92$I\xb3\xde\xea\
-z\xfc_]\x8eO\x099~\xacu\xc8\x03\x008Z\
-\xa1O\x9f\x18\xce\x15O[\xdd\x88?T\x8f\x1a\x92$\
-I\x9a\xb5\xc2t\xfc\x03\xc3\xe1\xed\x0fBN\x1f\xd9|\
-\xa0\x03\x008\x11\xa1\x8f\xff\xd6\xe5\xf4\xe4\xd5\x9cn\x5c\
-\x8f\x1e\x92$I\xda\xed\xc2\xc6\xe8{\x87\x83\xda\xef\x0d\
-\x07\xb6\x0fn>\xc0\x01\x00l\xa9\x9c\xfe5\xf4\xe9I\
-a2\xfa\xbez\x14\x91$I\xd2N\xd7M\xe2\x0dB\
-\x1f\x9f\xd0\xe5\xf8\xbe\xe6\xa1\x0d\x00`\xdb\xc4\xf7\x1f:\
-\x87\x0c\xe7\x91z4\x91$I\xd2v\xb7\xe7\x82\x03\xfb\
-\xeb2\xe8S\xedC\x1a\x00\xc0\x0e\x19\xce#\xe5\x5cR\
-\xce'\xf5\xa8\x22I\x92\xa4\xad\xee*9\x9e\x1e\xa6\xe9\
-\xd7\x86\x03\xd8\xdb\x0e;\x90\x01\x00\xec\xa2\x90\xd3\xff\x0b\
-9>\xa4\x9cW\xea\xd1E\x92$I'\xdc\xc1\x95+\
-w9\xfe\xcc\xe0`\xeb\x10\x06\x000;\x86\xf3\xcap\
-nYy\xddu\xbe\xaa\x9ed$I\x92t<\x0d\x87\
-\xab\x1f\x09}z\xfe\xe1\x07.\x00\x80\x19\x96\xd3\x9ft\
-\xd3t\xf3z\xa4\x91$I\xd2\xd1\xb6\xa7\x8f\xdf\x1e\xa6\
-\xe9w\x87\x03\xd5\x87\x9b\x07-\x00\x80\x19\x17r\xfaH\
-\xf9yC{'\xa3\xef\xacG\x1cI\x92$\x1d\xa9=\
-\x17\x9c\xb6\xbf\xeb\xe3/u9\xfe]\xebp\x05\x000\
-\x7f\xe2\x9bCN\x0f>izz\xacG\x1eI\x92$\
-}y\xc3\xa1\xe9N\xc3\x81\xa9?\xfc \x05\x00\xb0\x00\
-r\xba\xa8\xdbHwY\xf9\xe2\xcaW\xd4\xe3\x8f$I\
-\xd2r\xb7:\x8d\xff+\xf4\xf1\x8f\x87\x83\xd2\x17\x9a\x07\
-(\x00\x80\x05\x12\xa6\xf19k\xfd\xe8&\xf5($I\
-\x92\xb4|\xadNN\xff\xe6\xae\x8f\x8f\xe9r|_\xeb\
-\xc0\x04\x00\xb0\xc0>\x18\xfa\xf4;\xab\xeb\xe9\xdb\xea\xd1\
-H\x92$i\xf1[\xcb\xe3S\xbai\xba\x7f\xc8\xe9o\
-\x1b\x07$\x00\x80%\x12\xdf\xd8\xe5\xf8\xc0\xd5~\xdf\xd5\
-\xebQI\x92$i1[\xcd\xf1\xf6!\xc7\x0b\xda\x87\
-\x22\x00\x80\xe54\x9c\x8f\xf2Z\x1e\xfft=2I\x92\
-$-N\xa1\x1f\x7f\x7f\xd7\xc7\xa7\x0d>\xdd:\x08\x01\
-\x00,\xbd\x9c>\x1frz\xd6j\x9f~\xb0\x1e\xa1$\
-I\x92\xe6\xb7n\x9a\xae5\x1cp~s8\xe0\xfcs\
-\xf3\xf0\x03\x00\xc0&\xf1_\x06\x8f\x0e\x17\xed?\xab\x1e\
-\xa9$I\x92\xe6\xa7S_|j\x17\xfax\xaf\x90\xe3\
-\xab\xdb\x87\x1d\x00\x00.O\xe8\xd3\xeb\xca\xcfa,?\
-\x8f\xb1\x1e\xb1$I\x92f\xbbn=]?\xf4\x96A\
-\x00\x00[\x22\xa77\x84\xf5\xd1\xf7\xd6\xa3\x96$I\xd2\
-\xec\xd5]\x1c\xbf\xa1\xfcj\xd5\xd0\xc7\x8f6\x0f4\x00\
-\x00\x1c\x97\x90\xd3\x7f\x86\x1c\xff\xcf\xeat\xfc\xad\xf5\xe8\
-%I\x924\x1bu\x93x\xb7.\xa7W\xb4\x0e1\x00\
-\x00l\x8d\xd0\xc7\xd7\x84\x9c\xee\xb1r\xce\xca\x95\xea1\
-L\x92$iwZ[\x1f_\xb7\xcb\xf1\x0f\xbb\x9c>\
-\xdb:\xb8\x00\x00\xb0\xf5B\x9f\x9e1\x9c\xc1nX\x8f\
-d\x92$I;\xd8\xf9\xa3=ky|\xdf\xae\x8fo\
-l\x1dT\x00\x00\xd8vo\xe9&\xf1\xecS\xd6OY\
-\xab'4I\x92\xa4\xedm\xb5O?\x18\xfa\xf8\xbc\xc6\
-\xc1\x04\x00\x80\x9dw\xeeZ?\xbaI=\xaaI\x92$\
-m}\xab\x17]}_\x98\xa6_\x0b9\xfeS\xe30\
-\x02\x00\xc0.\x09}z\xf7pF\xfb\x8d\x93\xa6\xa7\xc7\
-zt\x93$I\xda\x9a\xc2dt\xeb\x90\xd3\xf9\xadC\
-\x08\x00\x00\xb3!\xe4\xb8\x1e\xa6\xe9\xc7\xeb\x11N\x92$\
-\xe9\xf8[\xcb\xe33\xbb>>\xba\xcb\xe9\xc3\xad\x83\x07\
-\x00\x00\xb3%\xf4\xf1\xa3!\xa7\xdf\xee&\xf1\x1b\xea\x91\
-N\x92$\xe9\xd8\x1a\x0e\x15w\xear|\xd9\xe6\x83\x06\
-\x00\x00s\xe1/\xbb>\xde\xb5\x1e\xed$I\x92\xae\xb8\
-\xbd\x1b\xf1;\xba\x9c~\x7f8D|\xbaq\xb8\x00\x00\
-`~\xfc\xf7p\xae{\xf2\xde~t\x9dz\xd4\x93$\
-Ij\xf4\xe6\xb3\xbe:\xf4\xf1^\xa1O\x7f\xdb8P\
-\x00\x000\xafrz\xc3j\x1f\xef\xbdr\xf0\xc0U\xea\
-\xc9O\x92$\xe9\x92\xc2\xfa\xf8\x07B\x8e\xcfn\x1e\x22\
-\x00\x00X\x08\xc3y\xef9\xab\x93t\xa3z\x04\x94$\
-I\xcb\x5c8\x7ft\xb5\x90\xd3\x83\x87\x03\xc2\xdb[\x07\
-\x07\x00\x00\x16K\xe8\xe3;\x86\xf3\xdf\xaf\x84\x83\xa3\xab\
-\xd5#\xa1$IZ\xb6\xba\x1c\x7ft8\x18\xbch\xf3\
-A\x01\x00\x80%\x90\xd3\x8b\xcby\xb0\x1e\x0d%I\xd2\
-Rt\xf0\xc0U\xea\xaf\x99\xffl\xf3\x80\x00\x00\xc0r\
-8t\x1e\x8c\x8f\xf6\xb3\x86$IZ\x82\xbai\xbay\
-\xc8\xf1\x82\xe6\xa1\x00\x00\x80\xa5t\xe8|8\x9c\x13\xeb\
-\x91Q\x92$-R\xfb\xfa}\xab]\x1f\x7f)\xf4\xe9\
-]\xad\x83\x00\x00\x00\xcb\xed\x92sb\xfc\xa5rn\xac\
-GHI\x924\xef\xad\xe5\xf1w\x87\x9c\x9e\xd5z\xf1\
-\x07\x00\x80/W\xce\x8d\xe5\xfcX\x8f\x92\x92$i^\
-\xebr\xbc{\xc8\xf1oZ/\xf8\x00\x00\xd0r\xe8\xfc\
-8\x8dw\xafGJI\x924O\xed\xdd8\xe3\x9a\xa1\
-O\x8f\xeb\xfa\xf8\xc9\xd6\x0b=\x00\x00\x5c\xbe\xf8\xc9r\
-\x9e,\xe7\xcaz\xc4\x94$I\xb3\xde\xf0\x02~\xcb\xd0\
-\xc7I\xfb\xc5\x1d\x00\x00\x8e\xde\xa1s\xe5$\xde\xaa\x1e\
-5%I\xd2,v\xf2\xc65\xf7\x86\x9c~ex\xf1\
-~\xcf\xe6\x17s\x00\x008\x01\xef\x09\x93\xf4\xab\xe5\xbc\
-Y\x8f\x9e\x92$iV\xear\xbca\xe8\xe3s\x1b/\
-\xe0\x00\x00\xb0%\x0e\x9d7\x87sg=\x82J\x92\xa4\
-\xdd.\xe4t\x8f.\xa77\xb4^\xb8\x01\x00`K\x0d\
-\xe7\xcer\xfe\xacGQI\x92\xb4\x1bu\x1b\xf1\xebC\
-\x8eO\xecr\xfc\xef\xe6\x0b6\x00\x00l\x87\xe1\xfcy\
-\xe8\x1c:\x9cG\xeb\xd1T\x92$\xedT\xa1\x1f\xdff\
-xA\xde8\xec\x05\x1a\x00\x00v\xceF9\x97\xd6#\
-\xaa$I\xda\xce\xd6\xf2\xf8\x94\xd0\xc7_\xef\xfa\xf8\xfe\
-\xc6\x8b2\x00\x00\xec\xb0\xf8\xfer>-\xe7\xd4zd\
-\x95$I[]\x98\x8c\xbe\xaf\xcb\xe9O\xda/\xc6\x00\
-\x00\xb0\x8b\x86sj9\xaf\xd6\xa3\xab$I\xda\xaa\xc2\
-4\xfeB\xd7\xc7\xbfk\xbe\x00\x03\x00\xc0L\x88\x7fW\
-\xce\xad\xf5\x08+I\x92N\xa4\xb0\xbe\xff\xac.\xa7\xff\
-;\xbc\xc8~\xfe\xf0\x17]\x00\x00\x9819}\xa1\x9c\
-_\xcb9\xb6\x1ei%I\xd2\xb1\xd6\xad\xa7\xeb\x87>\
-\xbd\xab\xf9b\x0b\x00\x003\xec\xd09v8\xcf\xd6\xa3\
-\xad$I:\xaa\xce;\xeb\xabC?\xfee?L\x1a\
-\x00\x80\xb9\x96\xe3\x07BN\x0f^y\xf3Y_]O\
-\xba\x92$\xe9H\xad\xe5\xf1\x99\xdd\xf4\xd0\xff\x5c\xac\xfd\
-\xc2\x0a\x00\x00\xf3&\xa7\xdf\x1f\xce\xb8\xd7\xaaG^I\
-\x92\xb4\xb9\xd5>\xfd`\xe8\xd3_4_H\x01\x00`\
-\x8e\x85\x1c/X\x9d\xc4\x1f\xaaG_I\x92\xf4\xa5\xba\
->\xde\xad\xcb\xf1M\xad\x17P\x00\x00X\x0c\xf1\xef\x86\
-3\xef\xcf\xd4#\xb0$I\xcb\xdd)\xebg\xae\x85\x1c\
-\xcf\x19|\xac\xfd\xc2\x09\x00\x00\x8b#\xf4\xe9\x13\xdd$\
-=|\xef\x05g\x9c\x5c\x8f\xc4\x92$-_\xab\x17\x8e\
-\xbfuxQ|F\xeb\xc5\x12\x00\x00\x16Y\x98\xa6g\
-\xee\xc9\xe9\xda\xf5h,I\xd2\xf2\xd4M\xd2-\x86\x17\
-\xc3\x8d\xcd/\x8e\x00\x00\xb0<\xe2K\xbbI\xbcU=\
-\x22K\x92\xb4\xf8\x85\x1c\x7fq\xf0\xf6\xf6\x0b#\x00\x00\
-,\x8f\xe1\x5c\xfc\x8fk\xd3\xd1}\xeaQY\x92\xa4\xc5\
-l\xf5\xa2\xab\xef\xeb\xfa\xf8\xe8\xc1\xa7[/\x88\x00\x00\
-\xb0\x94r\xfal\xe8\xd3\xef\x9c\xf4\x17\xe3T\x8f\xce\x92\
-$-Nk\x1b\xe3\xeb\x86\x9c\x9e\xdf|\x11\x04\x00\x00\
-\xcar\xe8\xbcn#\xde\xa0\x1e\xa1%I\x9a\xffBN\
-?1\xbc\xc0\xbd\xb2\xf9\xc2\x07\x00\x00\xfc\x8f\x90\xe3_\
-\xaf\xf6\xf1\x0e\xf5(-I\xd2\x9c\xf6\xc5\x95\xaf\xe8&\
-\xf1\xec\xe1\xc5\xed=\x9b_\xec\x00\x00\x80#\xc8\xf1\x03\
-!\xa7\x07\xaf\xbc\xf9\xac\xaf\xae'kI\x92\xe6\xa7\xab\
-^\xbc\xff@\xc8\xf1\x89\xcd\x179\x00\x00\xe0\x8a\xe5\xf4\
-\xfb\xdd4]\xab\x1e\xb1%I\x9a\xfdB?\xfe\xfe.\
-\xc7?o\xbe\xb0\x01\x00\x00G-\xe4x\xc1\xea$\xfe\
-P=jK\x924\xbb\x0d/\x5cw\x0a9\xfd\xed\xe6\
-\x173\x00\x00\xe0x\xc5\xbf\xebr\xfc\x99z\xe4\x96$\
-i\xc6:\x7f\xb4'L\xd3\xafu9}\xb8\xfdB\x06\
-\x00\x00\x1c\xaf\xd0\xa7Ot\x93\xf4\xf0\xbd\x17\x9cqr\
-=\x81K\x92\xb4\xfb\x85<\xfa\xc6.\xc7\xa7\xb4^\xbc\
-\x00\x00\x80\xad\x13\xa6\xe9\x99{r\xbav=\x8aK\x92\
-\xb4{\x95\x9f\x1f\x14\xfaxA\xeb\x05\x0b\x00\x00\xd8\x16\
-\x1bky\xf4\xc3\xf5H.I\xd2\xce\x17\xd6\xc7\xb7\x09\
-9\xbe\xba\xf1\x22\x05\x00\x00l\xaf\xd7\xaf\xf6\xf1\x0e\xf5\
-h.I\xd2\xce\x15\xfa\xf1\xcf\x86\x1c\xdf\xdexq\x02\
-\x00\x00v@\xc8\xe9\xdd\xab\x93x\xefzD\x97$i\
-\xfb\x0b\xfd\xf8\x97\x87\x17\xa0\x8f\xb4^\x98\x00\x00\x80\x9d\
-3\x9c\xcb\xff3\xf4\xf1\xa1+\xebg~M=\xaeK\
-\x92\xb4\xf5u\x7f\x1eO\xedr|l\xeb\xc5\x08\x00\x00\
-\xd8=\xa1\x8fO<izz\xacGwI\x92\xb6\xae\
-n\x9a\xae\xd5\xe5\xf8\xf4\xd6\x0b\x10\x00\x00\xb0\xfbB\x8e\
-\xcfY\xbdp\xfc\xad\xf5\x08/I\xd2\x89\xd7M\xd3\xf5\
-\xbb\x1c\xff\xbc\xf5\xc2\x03\x00\x00\xcc\x8e\x90\xe3z\x98\x8e\
-\x7f\xa0\x1e\xe5%I:\xfe\xbaI\xbaE\x97\xe3\xcb[\
-/8\x00\x00\xc0\xec\x09\x93\xf8\x9a0M?^\x8f\xf4\
-\x92$\x1d{]Nw\xe9\xfa\xf8\xe6\xd6\x0b\x0d\x00\x00\
-0\xbbB\x1f\xdf\x11r\xbaG=\xdaK\x92t\xf4u\
-\xd3\xf4\x80.\xc7\x0f\xb4^`\x00\x00\x80\xd9\x17\xfa\xf8\
-\xd1\x90\xd3\xaf\xac\x9c\xb3r\xa5z\xcc\x97$\xe9\xc8\x9d\
-\xfa\xe2S\xbb.\xa7\xdf\xec\xfa\xf8\x99\xd6\x0b\x0b\x00\x00\
-0_B\x9f~'\x1c\x1c]\xad\x1e\xf9%I:\xbc\
-\xbd\x93}\xd7\x18^4\xfe`\xf3\x8b\x08\x00\x000\xdf\
-B\x9f\x9e\xd1M\xe27\xd4\xa3\xbf$I\x97\xb6\xf7\xa2\
-\xd1wv9\x9d\xdbz\x01\x01\x00\x00\x16\xc2\x8b\xbb\x1c\
-oXG\x00I\x92VV\xd6\xf2\xe8\x87\x87\x17\x88\x8d\
-M/\x18\x00\x00\xc0\xa2\xc9\xe9\x15]\x1foYG\x01\
-I\xd22\xb7\xda\xc7;\x0c/\x0e\xaf?\xec\xc5\x02\x00\
-\x00XL9\xbd\xb5\xeb\xe3]\xebH IZ\xc6V\
-'\xf1\xde!\xa7w7_(\x00\x00\x80E\xf6\xc1\xae\
-\x8fg\xd7\xd1@\x92\xb44\xad\x9f\xf95\xa1\x8f\x0f\x0d\
-9\xfdg\xe3\xc5\x01\x00\x00X\x069}\xb6\xcb\xf1\x91\
-'o\x5cso\x9d\x14$I\x8b\xdcI\xd3\xd3c\xe8\
-\xe3\x13\x9b/\x0a\x00\x00\xc0\xf2\xc9\xf1\x0f\xf7\xf6g|\
-m\x1d\x19$I\x8b\xd8i\x07O\x0b]\x1f\x0f6_\
-\x08\x00\x00\x80e\xf6\x8a2/\xd4\xd1A\x92\xb4H\x85\
-\x8b\xf6\x9f\x15r\xfa\x93\xc6\xc5\x1f\x00\x00\xa0\xfc\x17C\
-\x7f\xbew#~G\x1d!$I\x8b\xd0\x9e>~\xfb\
-p\x81\xff\xb3\xe6\x85\x1f\x00\x00\xa0\x0a}\xfa\x8b\xe1\xcf\
-\xeb\xd5QB\x924\xcf\xad\xe5\xf1w\xd7\x0b{\xf3\xa2\
-\x0f\x00\x00\xf0\xe5BN}\x98\x8c\xbe\xaf\x8e\x14\x92\xa4\
-y,l\x8c\xbe\xb7\x5c\xd0[\x17z\x00\x00\x80#\xca\
-\xf1\xe0j\x9f~\xb0\x8e\x16\x92\xa4y\xaa\x5c\xc0\xfdP\
-i\x00\x00\xe0\xb8M\xd3+\xd7\xf2\xf8fu\xc4\x90$\
-\xcdCk\x1b\xe3\x9b\x85>\xfdU\xf3\xc2\x0e\x00\x00p\
-\x94B\x1f_\xdbM\xe2\xad\xea\xa8!I\x9a\xe5\xc2d\
-t\xeb\x90\xd3\xdf\xb4.\xe8\x00\x00\x00\xc7.\xbeq\x98\
-1~\xa2\x8e\x1c\x92\xa4Y,L\xd2O\x0e\x17\xec7\
-\xb5/\xe4\x00\x00\x00\xc7)\xa7\xb7\xaeMG?UG\
-\x0fI\xd2,\xb5\x96\xc7?=\x5c\xac\xdfv\xd8\xc5\x1b\
-\x00\x00`\x0b\x84>\xbe\xa3\xeb\xe3]\xeb\x08\x22I\x9a\
-\x85\xba\x1c\xef>\x5c\xa0\xff\xb1u\xe1\x06\x00\x00\xd8*\
-!\xa7w\x87\xe9\xf8\xe7\xea(\x22I\xda\xcdB\x9f\xee\
-\xd9\xf5\xf1\xbd\xad\x0b6\x00\x00\xc0\x96\xcb\xf1\x03\xa1\x8f\
-\xf7\xaa#\x89$i7Z\xcb\xe3\xfbv9}\xa8y\
-\xa1\x06\x00\x00\xd8&!\xa7\x8f\x0c\xb3\xc8\x03\xeah\x22\
-I\xda\xc9\xba\x1c\x1f\x18r\xfcx\xeb\x02\x0d\x00\x00\xb0\
-\xddBN\xff\xde\xf5\xf1\x97\xea\x88\x22I\xda\x89B\x9f\
-~\xb5\xcb\xf1\x93\xad\x0b3\x00\x00\xc0\xce\x89\x9f\x0e9\
->\xa4\x8e*\x92\xa4m\xeb\xbc\x95\xaf\x1c.\xb8\xe7\x0c\
-\x17\xdf\xcf\x1d~1\x06\x00\x00\xd8\x15\x9f\xef&\xe9\xe1\
-+\x07W\xae\x5c'\x17I\xd2\x96v\xee\xf8\xa4\xae\x8f\
-\x8fl\x5c\x80\x01\x00\x00v_\x8e\x8fZ9\x7f\xb4\xa7\
-N0\x92\xa4\xad\xe8\xe4\x8dk\xee\x0d}\xfa\x9d\xe6\x85\
-\x17\x00\x00`F\x0cs\xcb\xe3\xca\xfcRG\x19I\xd2\
-\x89\x14\xd6\xf7\x9f\x16\xa6\xf1\xff\xb4.\xb8\x00\x00\x00\xb3\
-&\xf4\xf1\xf7\xca\x1cSG\x1aI\xd2qup\xe5\xca\
-]\x8e/h]h\x01\x00\x00f\xd60\xc7\xf8\x19C\
-\x92t\x9c\x1d\xfa\x9f\x8ce\xff\x85\x10\x00\x000\x9f\xca\
-<\xe3\x7fJ&I\xc7\xda\xb9\xe3\x93\xfc\x0c!\x00\x00\
-`\xde\x95\xb9\xa6\xcc7u\xd2\x91$]n_\x5c\xb9\
-\x92\xdf2\x06\x00\x00,\x8c\x1c\x1fY\xe6\x9c:\xf1H\
-\x92\x8eT\xc8\xf1\x9c\xe6\x85\x14\x00\x00`N\x959\xa7\
-\x8e<\x92\xa4V\xa1O\xbf\xda\xe5\xf4\xd9\xd6E\x14\x00\
-\x00`n\x0dsN\x99w\xea\xe8#I\xfa\xf2\xba\x1c\
-\x1f8\x5c$\xff\xaby\x01\x05\x00\x00\x98s\x87\xe6\x9d\
-a\xee\xa9#\x90$\xa9\xb4\x96\xc7\xf7\x0d9~\xacu\
-\xe1\x04\x00\x00X\x14e\xeeY\xcb\xa3\xfb\xd6QH\x92\
-\x96\xbb0I\xf7\xecr\xfa\xd7\xd6\x05\x13\x00\x00`\xe1\
-\x0c\xf3O\xe8\xd3\xcf\xd7\x91H\x92\x96\xb3\xae\x8fw\x1b\
-\xbc\xb7y\xa1\x04\x00\x00XXe\x0e\x8aw\xab\xa3\x91\
-$-Wk\xd3\xf1\x1dC\x8e\xff\xd8\xbe@\x02\x00\x00\
-,\xb62\x0f\xad\xe5\xf1\x1d\xeb\x88$I\xcbQ\xe8\xd3\
-m\x87\x8b\xe0\xdb6_\x14\x01\x00\x00\x96\xcc\xdb\xca|\
-TG%IZ\xec\xbai\xbcU\x97\xe3\x9b\x1a\x17C\
-\x00\x00\x80%\x14\xdfX\xe6\xa4:2I\xd2b\xb6\x96\
-\xc77\x0b}|m\xfbB\x08\x00\x00\xb0\x9c\xca\x9cT\
-\xe6\xa5::I\xd2b\xb5\xda\xa7\x1f\xecrze\xeb\
-\x02\x08\x00\x00\xb0\xf4\x86y\xa9\xccMu\x84\x92\xa4\xc5\
-(\xac\x8f\xbe\xb7\xeb\xe3K\x9b\x17>\x00\x00\x00\xaa\xf8\
-\xd22?\xd5QJ\x92\xe6\xbb\xb5<\xfe\xee\xd0\xc7\xdc\
-\xbe\xe0\x01\x00\x00\xf0\xe5B\x8eymc|\xdd:R\
-I\xd2|\xb6\xa7\x8f\xdf\x1er:\xbfu\xa1\x03\x00\x00\
-\xa0\xad\xccQ{r\xbav\x1d\xad$i\xbe\x0a\xeb\xfb\
-\xcf\xea\xfa\xf8\xc2\xd6\x05\x0e\x00\x00\x80+\x12_\x18\xa6\
-\xfb\xbf\xa9\x8eX\x924\x1f\xad\xe5\xf1\x99!\xa7\xe7\xb7\
-/l\x00\x00\x00\x1c\x8d2W\xad\xad\x9f\xfeuu\xd4\
-\x92\xa4\x19\xef\xe0\xca\x95\x87\x8b\xd7\xc6\xe6\x8b\x19\x00\x00\
-\x00\xc7.\xf4qR\xe6\xac:qI\xd2\x8cv\xdeY\
-_\x1d&\xf1\x09\xad\x0b\x19\x00\x00\x00\xc7\xa7\xccYe\
-\xde\xaa\x93\x97$\xcd^\xc3\x85\xea\xa1\xad\x0b\x18\x00\x00\
-\x00'\xa6\xcc[u\xf4\x92\xa4\xd9ju\x12\xef\x1dr\
-\xfa\x8f\xd6\xc5\x0b\x00\x00\x80\x13S\xe6\xad2w\xd5\x11\
-L\x92f\xa3\xb5\xc9\xe8\xa7\x86\x0b\xd4\xbb[\x17.\x00\
-\x00\x00\xb6F\x99\xbb\xca\xfcUG1I\xda\xdd\xd6&\
-\xe3\x9bv9\xbd\xa1u\xc1\x02\x00\x00`\x8b\x0d\xf3\xd7\
-\xdadt\xd3:\x92I\xd2\xee\xb4\xb6>\xben7\x89\
-/m^\xa8\x00\x00\x00\xd8\x1e9^\x5c\xe6\xb1:\x9a\
-I\xd2\xce\xb6\xb6~\xfa\xd7u}|a\xf3\x02\x05\x00\
-\x00\xc0\xf6\xca\xf1\x05e.\xab#\x9a$\xedL{/\
-8\xe3\xe4\xae\x8fOm^\x98\x00\x00\x00\xd8\x199>\
-\xa5\xccguT\x93\xa4\xed\xaf\x9b\xc4\xc74/H\x00\
-\x00\x00\xec\xaca>\xab\xa3\x9a$moa2\xfa\xe5\
-.\xa7/4/F\x00\x00\x00\xec\xaca>+sZ\
-\x1d\xd9$i{\x0a\x93\xf1\xcf\x85\x9c>\xd2\xbc\x10\x01\
-\x00\x00\xb0+\xca\x9cV\xe6\xb5:\xbaI\xd2\xd6\x16&\
-\xe9\xc7C\x8eoo]\x80\x00\x00\x00\xd8]e^+\
-s[\x1d\xe1$ikZ\x9d\xa4\x1b\x0d\x17\x98\xbfn\
-]x\x00\x00\x00\x98\x0den+\xf3[\x1d\xe5$\xe9\
-\xc4Z]O\xdf\x16&q\xd2\xba\xe0\x00\x00\x000[\
-B\x8e\xebe\x8e\xab#\x9d$\x1d_'\xad\xa7q\x98\
-\xc4\xe7\xb5.4\x00\x00\x00\xcc\xa6\xd0\xc7\xe7\x96y\xae\
-\x8ev\x92tl\x8d\xce\x1f\xed\x09\x93\xf4\xa4\xd6\x05\x06\
-\x00\x00\x80\xd9V\xe6\xb92\xd7\xd5\x11O\x92\x8e\xben\
-\x92\x1e\xde\xba\xb0\x00\x00\x000'\x86\xb9\xae\x8ex\x92\
-tt\x0d\x17\x8e\xfbw9~\xaayQ\x01\x00\x00`\
->\x94\xb9n\x98\xef\xea\xa8'I\x97\xdfp\xc1\xb8\xf3\
-p\xe1x_\xf3\x82\x02\x00\x00\xc0|)\xf3\xdd0\xe7\
-\xd5\x91O\x92\xda\x0d\x17\x8a[\x0c\x17\x8c\xbfo^H\
-\x00\x00\x00\x98Oe\xce\x1b\xe6\xbd:\xfaI\xd2e\xdb\
-s\xc1\x81\xfd]\x1f\xdf\xdb\xbc\x80\x00\x00\x000\xe7\xe2\
-{\xcb\xdcWG@I\xba\xa4\xd5~\xdf\xd5\xfd\xeay\
-\x00\x00\x80\xc5V\xe6\xbe2\xff\xd5QP\x92VV\xba\
-\x1c\x1f\xd5\xba`\x00\x00\x00\xb0`\x86\xf9\xaf\x8e\x82\x92\
-\x96\xbd\xd0\xa7{v}\xfcd\xf3b\x01\x00\x00\xc0\x82\
-\x89\x9f,s`\x1d\x09%-k\xc3\x05\xe1GBN\
-\xff\xef\xf0\x8b\x04\x00\x00\x00\x8b\xaa\xce\x81?RGC\
-I\xcbV\xb8h\xffY\xc3\x85\xa0\xdf|q\x00\x00\x00\
-`\xf1\x95y\xb0\xcc\x85uD\x94\xb4,\x9dv\xdei\
-\xa1\xeb\xe3S[\x17\x06\x00\x00\x00\x96E|j\x99\x0f\
-\xeb\xa8(i\x19\x0a}\xfc\xf5\xf6\x05\x01\x00\x00\x80e\
-R\xe6\xc3:*JZ\xf4\xbai\xbas\xc8\xe9#\xad\
-\x8b\x01\x00\x00\x00\xcb\xe5\xd0|8\xcc\x89ud\x94\xb4\
-\xa8\x85\xf5\xf1\x0f\x84>\xfdm\xebB\x00\x00\x00\xc0r\
-*sb\x99\x17\xeb\xe8(i\xd1\xda;\xd9w\x8d\xe1\
-\xc9\xfe\xa2\xcdO~\x00\x00\x00\x18\xbc\xa8\xcc\x8du\x84\
-\x94\xb40}q\xe5+B\x1f\x9f\xd8x\xd2\x03\x00\x00\
-\xc0!en,\xf3c\x9d$%-B\xdd$\x9e\xdd\
-z\xc2\x03\x00\x00\xc0e\x0c\xf3c\x1d%%\xcd{!\
-\xa7\x9f\x18\x9e\xd8\xef9\xec\x89\x0e\x00\x00\x00\x87{O\
-\x99#\xebH)i^[\x9b\x9e\xfe]\xc3\x13\xfa\x15\
-\x9b\x9e\xe0\x00\x00\x00py^Q\xe6\xc9:ZJ\x9a\
-\xb7V\xfb}W\x0f\x93\xf8\xbc\xc6\x93\x1b\x00\x00\x00.\
-W\x99'\xcb\x5cYGLI\xf3T\x97\xe3\xa3ZO\
-l\x00\x00\x008*\xc3\x5cYGLI\xf3R\xe8\xd3\
-=\xbb>~\xb2\xf9\xa4\x06\x00\x00\x80\xa3\x12?Y\xe6\
-\xcb:jJ\x9a\xf5\x86'\xee\x8f\x84\x9c\xfe\xdf\xe1O\
-f\x00\x00\x0086u\xbe\xfc\x91:rJ\x9a\xd5\xc2\
-E\xfb\xcf\x1a\x9e\xb0\xfd\xe6'1\x00\x00\x00\x1c\xaf2\
-g\x96y\xb3\x8e\x9e\x92f\xad\xd3\xce;-t}|\
-j\xeb\x09\x0c\x00\x00\x00'&>\xb5\xcc\x9du\x04\x95\
-4K\x85>\xfez\xfb\x89\x0b\x00\x00\x00'\xae\xcc\x9d\
-u\x04\x954+\xadN\xd2\x8d\xba\x9c>\xdbz\xd2\x02\
-\x00\x00\xc0\x96\x18\xe6\xce2\x7f\xd6QT\xd2n\xb7\xba\
-\x9e\xbemxb\xbe\xa2\xf9\x84\x05\x00\x00\x80\xad4\xcc\
-\x9fe\x0e\xad#\xa9\xa4]\xeb\xbc\x95\xaf\xecr\xfc\xc3\
-\xe6\x13\x15\x00\x00\x00\xb6\xc30\x87\x96y\xb4N\xa6\x92\
-v\xa3\xb5<\xbeo\xf3\x09\x0a\x00\x00\x00\xdb\xa8\xcc\xa3\
-u4\x95\xb4\xd3\xad\xae\xc7\xff\x15r\xfa\x7f\xad''\
-\x00\x00\x00l\xa72\x8f\x96\xb9\xb4\x8e\xa8\x92v\xaa=\
-\x17\x1c\xd8\xdf\xe5\xf8g\xad'&\x00\x00\x00\xec\x88a\
-.-\xf3i\x1dU%\xedD]N\x8fh>!\x01\
-\x00\x00`'\x0d\xf3i\x1dU%mw\xab9\xde>\
-\xe4\xf4\x91\xe6\x93\x11\x00\x00\x00vP\x99O\xcb\x9cZ\
-GVI\xdb\xd5j?\xfe\x96.\xc7\x97\xb7\x9e\x88\x00\
-\x00\x00\xb0+\x869\xb5\xcc\xabut\x95\xb4\xe5\x9d\xb3\
-r\xa5.\xa7'7\x9f\x80\x00\x00\x00\xb0\x9b\x86y\xb5\
-\xcc\xadu\x82\x95\xb4\x95\xad\xe6\xd1}\x9aO<\x00\x00\
-\x00\x98\x01en\xad#\xac\xa4\xadj5\xa7\x1bw9\
-\xbd\xb5\xf5\xa4\x03\x00\x00\x80\x990\xcc\xade~\xad\xa3\
-\xac\xa4\x13m\xb5\xdfw\xf5.\xc7\x174\x9fp\x00\x00\
-\x000K\x86\xf9\xb5\xcc\xb1u\xa4\x95t\x22\x0dO\xaa\
-\x87\x1d\xf6$\x03\x00\x00\x80\xd9\xf5\xb0:\xd2J:\xde\
-V'\xf1v]N\x1fn<\xc1\x00\x00\x00`6\x0d\
-sl\x99g\xebh+\xe9X[\x9d\x9c\xfe\xcd]\x8e\
-/k>\xc1\x00\x00\x00`\x96\x0d\xf3l\x99k\xeb\x88\
-+\xe9X\xear\xfa\xfd\xe6\x13\x0b\x00\x00\x00\xe6\xc10\
-\xd7\xd6\x11W\xd2\xd1\x16\xfax\xaf\xe6\x13\x0a\x00\x00\x00\
-\xe6H\x99o\xeb\xa8+\xe9\x8a\x0a\xd3\xf1\x0ft}|\
-s\xeb\xc9\x04\x00\x00\x00\xf3%\xbe\xb9\xcc\xb9u\xe4\x95\
-t\xa4\xc2\xfa\xfe\xd3\xba\x9c\xcek?\x91\x00\x00\x00`\
-\x0e\x0dsn\x99w\xeb\xe8+\xa9U\xc8\xf1\x9c\xe6\x13\
-\x08\x00\x00\x00\xe6X\x99w\xeb\xe8+is\xa1O\xb7\
-\xedr\xfa\xd7\xd6\x93\x07\x00\x00\x00\xe6\xda0\xef\x96\xb9\
-\xb7\x8e\xc0\x92\xbe\xd4i\x07O\x0b\xc3\x93\xe3]\xcd'\
-\x0e\x00\x00\x00,\x802\xf7\x96\xf9\xb7\x8e\xc2\x92Ja\
-\x9a~\xb7\xf5\x84\x01\x00\x00\x80ER\xe6\xdf:\x0aK\
-Z\x9d\xc4\xdb\x85>}\xa2\xf5d\x01\x00\x00\x80ER\
-\xe6\xdf2\x07\xd7\x91XZ\xdeN\xde\x18\x9d1<!\
-\xa6\xad'\x0a\x00\x00\x00,\xa22\x07\x97y\xb8\x8e\xc6\
-\xd2r\xd6M\xd3#ZO\x10\x00\x00\x00Xh\xc3<\
-\x5cGci\xf9\xea&\xe9\x16]\x1f\xdf\xdf|r\x00\
-\x00\x00\xc0B\x1b\xe6\xe1a.\xae#\xb2\xb4<u\x1b\
-\xf1\xd4\xe1\x09\xf0\xa2\xf6\x13\x03\x00\x00\x00\x96\xc10\x17\
-\x0f\xf3q\x1d\x95\xa5\xe5(\xe4\xf4\xe0\xf6\x13\x02\x00\x00\
-\x00\x96G\x99\x8f\xeb\xa8,-~\xab\x93t\xa3\xd0\xc7\
-w\xb4\x9e\x0c\x00\x00\x00\xb0L\xca|\x5c\xe6\xe4:2\
-K\x0b\xdc\xc1\x03W\x09\xd3\xf8\x9c\xd6\x13\x01\x00\x00\x00\
-\x96Q\x99\x93\xcb\xbc\x5c'gi1[\xcd\xa3\xfb\xb4\
-\x9e\x00\x00\x00\x00\xb0\xcc\xca\xbc\x5cGgi\xf1Z\x9b\
-\x9e\xfe]]\x1f\xdf\xd8z\xf0\x03\x00\x00\xc0r\x8bo\
-,ss\x1d\xa1\xa5\xc5\xaa\xcb\xf1\x0f\xdb\x0f|\x00\x00\
-\x00\xa0\xcc\xcdu\x84\x96\x16\xa7\xe1\x81}\xf7\xe1\x01\xfe\
-\xb9\xc3\x1e\xf0\x00\x00\x00\xc0\x97|\xae\xcc\xcfu\x94\x96\
-\xe6\xbf0\xdd\xffM\xa1O\x7f\xd5x\xb0\x03\x00\x00\x00\
-_\xa6\xcc\xcfe\x8e\xae#\xb54\xdf\x85\x9c~\xb7\xf5\
-@\x07\x00\x00\x00\x0eW\xe6\xe8:RK\xf3[\x98\xa6\
-\x9f\x0c}\xfaD\xebA\x0e\x00\x00\x00\x1c\xae\xcc\xd1e\
-\x9e\xae\xa3\xb54\x7f\x9d\xbc1:#\xe4\xd4\xb7\x1e\xe0\
-\x00\x00\x00\xc0\x91\x95y\xba\xcc\xd5u\xc4\x96\xe6\xab.\
-\xa7G\xb4\x1e\xd8\x00\x00\x00\xc0Q\x18\xe6\xea:bK\
-\xf3S7M7\xef\xfa\xf8\xfe\xe6\x83\x1a\x00\x00\x008\
-\x0a\xc3\x5c=\xcc\xd7u\xd4\x96f\xbfn#\x9e\xda\xe5\
-\xf8\xe7\xed\x074\x00\x00\x00p\xd4\xca|=\xcc\xd9u\
-\xe4\x96f\xbb\x90\xd3\x83\x9b\x0fd\x00\x00\x00\xe0\x98\x95\
-9\xbb\x8e\xdc\xd2\xec\x16\xa6\xe3\x1f\x08}|G\xebA\
-\x0c\x00\x00\x00\x1c\xbb2g\x97y\xbb\x8e\xde\xd2\x0c\xf6\
-\xcc\x03W\x099>\xa7\xf5\x00\x06\x00\x00\x00\x8e_\x99\
-\xb7\xcb\xdc]'pi\xb6\xea\xd6\xd3\x9dZ\x0f\x5c\x00\
-\x00\x00`\x0b\x0csw\x1d\xc1\xa5\xd9i-\x8f\xcf\x0c\
-9\xbd\xaa\xf9\xa0\x05\x00\x00\x00NX\x99\xbb\xcb\xfc]\
-Gqi6\xea&\xe9\xe1\xad\x07,\x00\x00\x00\xb0\x85\
-\x86\xf9\xbb\x8e\xe2\xd2\xee\x17\xd6G\xdf\x1br\xfc\xa7\xe6\
-\x83\x15\x00\x00\x00\xd82e\xfe.sx\x1d\xc9\xa5\xdd\
-\xad\xcb\xf1)\xad\x07*\x00\x00\x00\xb0\x0d\x869\xbc\x8e\
-\xe4\xd2\xee\x15\xfat\xdb\xae\x8f\x9fl>H\x01\x00\x00\
-\x80m\x10?Y\xe6\xf1:\x9aK;\xdf\xc9\x1b\xd7\xdc\
-;<\x08_\xd2~\x80\x02\x00\x00\x00\xdb\xa5\xcc\xe3e\
-.\xaf#\xba\xb4\xb3\xadMG\xf7i=0\x01\x00\x00\
-\x80\xedW\xe6\xf2:\xa2K;Wwq\xfc\x86\xd0\xc7\
-\xd7\xb4\x1e\x94\x00\x00\x00\xc0\xf6;4\x97\x0f\xf3y\x1d\
-\xd5\xa5\x9d\xa9\xcb\xf1\x91\xad\x07$\x00\x00\x00\xb0\x83\x86\
-\xf9\xbc\x8e\xea\xd2\xf6\xb7:I7\x1a\x1ex\xef9\xec\
-\x81\x08\x00\x00\x00\xec\xb4\xf7\x949\xbd\x8e\xec\xd2\xf6\x16\
-\xfa\xf4\x8c\xc6\x83\x10\x00\x00\x00\xd8\x05eN\xaf#\xbb\
-\xb4}\xad\xf6\xf1\x0e]\x8e\xff\xddz\x10\x02\x00\x00\x00\
-\xbb`\x98\xd3\xcb\xbc^Gwi\xeb\xeb6\xe2\xa9!\
-\xc7\x0b\x9b\x0f@\x00\x00\x00`\xd7\x1c\x9a\xd7\x87\xb9\xbd\
-\x8e\xf0\xd2\xd6\xd6\xe5\xf4\x80\xd6\x03\x0f\x00\x00\x00\x98\x01\
-\xc3\xdc^Gxi\xebZ\x9d\x9c\xfe\xcd\xa1O\x7f\xdb\
-|\xd0\x01\x00\x00\x00\xbb\xae\xcc\xede~\xaf\xa3\xbc\xb4\
-5u}|L\xeb\x01\x07\x00\x00\x00\xcc\x92\xf8\x98:\
-\xcaK'\xde\xea4\xfe\xaf.\xc7\xf7\xb5\x1fl\x00\x00\
-\x00\xc0\xcc\x18\xe6\xf72\xc7\xd7\x91^:\xb1BN\xcf\
-j>\xd0\x00\x00\x00\x80\x99S\xe6\xf8:\xd2K\xc7_\
-\xb7\x9e\xee\xd4\xe5\xf4\x85\xd6\x83\x0c\x00\x00\x00\x98Ae\
-\x8e\x1f\xe6\xf9:\xdaK\xc7\xde\xeaK\xae\xbe/\xe4\xd4\
-7\x1f`\x00\x00\x00\xc0\xcc*\xf3|\x99\xeb\xeb\x88/\
-\x1d[]\x8e\x0fj=\xb0\x00\x00\x00\x8090\xcc\xf5\
-u\xc4\x97\x8e\xbe=9]\xbb\xeb\xe3\x9b\x9a\x0f*\x00\
-\x00\x00`\x0e\xc47\x95\xf9\xbe\x8e\xfa\xd2\xd1\x15\xfa\xf4\
-\xb8\xf6\x03\x0a\x00\x00\x00\x98\x17e\xbe\xaf\xa3\xbet\xc5\
-\xad\xf6\xe3o\xe9r\xfal\xeb\xc1\x04\x00\x00\x00\xcc\x91\
-a\xbe\x0fy\xf4\x8du\xe4\x97.\xbf.\xc7\xa77\x1f\
-H\x00\x00\x00\xc0\xfc\x19\xe6\xfc:\xf2KG\xae[O\
-7\x0f}\xfa\xf7\xe6\x83\x08\x00\x00\x00\x98;\x87\xe6\xfc\
-a\xde\xaf\xa3\xbf\xd4.\xe4\xf4\xac\xd6\x03\x08\x00\x00\x00\
-\x98_e\xde\xaf\xa3\xbftx\xdd$\xde\xaa\xeb\xe3'\
-[\x0f\x1e\x00\x00\x00`\x9e\x0d\xf3\xfe0\xf7\xd7\x15\x80\
-t\xd9B\x1f\x9f\xdb~\xe0\x00\x00\x00\x00\xf3\xae\xcc\xfd\
-u\x05 ]Z\x98\xa4\x1f\xf7\x1b\xc7\x00\x00\x00`\x81\
-\x95\xdfD6\xcc\xffu\x15 ]\xd2\xf0\xe0\xf8\xd3\xc3\
-\x1e,\x00\x00\x00\xc0\xa2\xf9\xd3\xba\x0a\x90VVV\xa7\
-\xf1v\x8d\x07\x09\x00\x00\x00\xb0\x80\xca\x1e\xa0\xae\x04\xb4\
-\xd4\x1d\x5c\xb9r\x97\xe3\x9f\xb5\x1e$\x00\x00\x00\xc0\x02\
-\xca\xf1\xcf\xca>\xa0n\x06\xb4\xac\xadM\xc7wl>\
-@\x00\x00\x00\x80\x85U\xf6\x01u5\xa0\xa5\xec\xe0\x81\
-\xab\x84\x9c^\xd2zp\x00\x00\x00\x00\x8b\xab\xec\x03\xca\
-^\xa0n\x08\xb4lu}\xbck\xeb\x81\x01\x00\x00\x00\
-,\x83x\xd7\xba\x22\xd02u\xda\xc1\xd3B\xc8\xf1\xc2\
-\xf6\x83\x02\x00\x00\x00Xte/P\xf6\x03uU\xa0\
-e)\xf4\xa3\x9fm= \x00\x00\x00\x80\xe5Q\xf6\x03\
-uU\xa0eh\xef\x05g\x9c\x1cr\xea[\x0f\x06\x00\
-\x00\x00`y\x94\xfd@\xd9\x13\xd4\x95\x81\x16\xbd\xd0\xa7\
-{\xb6\x1e\x08\x00\x00\x00\xc0\xf2){\x82\xba2\xd0\x22\
-\x17\xd6\xf7\x9f\xd6\xf5\xf1\xa5\xad\x07\x01\x00\x00\x00\xb0\x8c\
-\xe2K\xcb\xbe\xa0\xae\x0e\xb4\xa8\xad\xf6\xf1\xde\xed\x07\x00\
-\x00\x00\x00\xb0\xac\xca\xbe\xa0\xae\x0e\xb4\x88\xed\x99\x9c1\
-\x1a\xee\xe8\xbf\xdc|\xc7\x03\x00\x00\x00K\xef/\xcb\xde\
-\xa0\xae\x10\xb4hu9=\xa0q\xa7\x03\x00\x00\x00|\
-\xb1\xec\x0d\xea\x0aA\x8b\xd4Ur<=\xf4\xe9U\xcd\
-;\x1d\x00\x00\x00XzeoP\xf6\x07u\x95\xa0E\
-\xa9\xcb\xf1A\xad;\x1c\x00\x00\x00\xe0\x7f\xe4\xf8\xa0\xba\
-J\xd0\x22\xb4\xf7\x823\xae\x19\xfa\xf8\xda\xe6\x9d\x0d\x00\
-\x00\x00P\x95\xfdA\xd9#\xd4\x95\x82\xe6\xbd\x90\xd3\xaf\
-\xb4\xeeh\x00\x00\x00\x80\xcd\xca\x1e\xa1\xae\x144\xd7\x1d\
-<p\x95\xe1\x0e\xfd\xf0\xe6;\x18\x00\x00\x00\xa0-~\
-\xa0\xec\x13\xeafA\xf3\xdapg\xfe\xef\xc3\xef\x5c\x00\
-\x00\x00\x80\xcb\xf5\xbf\xebjA\xf3\xd8\xde\x83\x07\xae\xda\
-\xe5\xf8\xb2\xc6\x1d\x0b\x00\x00\x00pd9\xbe|-\x8f\
-O\xa9+\x06\xcd[\xdd$\xde\xady\xc7\x02\x00\x00\x00\
-\x5c\x91\x1c\xef^W\x0c\x9a\xb7\x86;\xf0E\x87\xdd\xa1\
-\x00\x00\x00\x00G!\xe4\xf4\x92\x95/\xae|E]3\
-h^\x0a\x93\xd1\xad\xbb\x9c\xbe\xd0\xbaS\x01\x00\x00\x00\
-\x8eF\xe8\xc7\xb7\xa9\xab\x06\xcdKa\x92\xfe\xa8ug\
-\x02\x00\x00\x00\x1c\xad\x90\xd3\xb3\xea\xaaA\xf3P\xb8\xe8\
-\xf4\xef\x0b}\xfc\xb7\xd6\x9d\x09\x00\x00\x00p\xb4B\x8e\
-\x1f_\xcd\xe9\xc6u\xe5\xa0Y/\xe4\xf4\xbb\xad;\x12\
-\x00\x00\x00\xe0X\x85>>\xb1\xae\x1c4\xcb\xad\xf6\xe3\
-o\x099\xbe\xb3u'\x02\x00\x00\x00\x1c\xab\x90\xd3?\
-\xefY\x8f\xdfQW\x0f\x9a\xd5B\x1f\x7f\xbdu\x07\x02\
-\x00\x00\x00\x9c\x80\x87\xd5\xd5\x83f\xb1\x93.\x1a\xa7\x90\
-\xe3\xdf4\xee8\x00\x00\x00\x80\xe3\x97\xd3\x1b\xf6N\xf6\
-]\xa3\xae 4k\x85>\xde\xaby\xc7\x01\x00\x00\x00\
-\x9c\xa8\x9c\x1ePW\x10\x9a\xa5F\xe7\x8f\xf6\x84>M\
-\x9bw\x1a\x00\x00\x00\xc0\x09\x8b\x07\xf7\x1e<p\xd5\xba\
-\x8a\xd0\xac\xb46\x1d\xfdT\xfb\x0e\x03\x00\x00\x00\xd8\x22\
-\x93x\xb7\xba\x8a\xd0\xac\xd4\xe5tn\xf3\xce\x02\x00\x00\
-\x00\xd8:/\xaa\xab\x08\xcdBky|\xb3\xae\x8f\x9f\
-n\xdcQ\x00\x00\x00\x00[\xe9\x0ba2\xbau]I\
-h\xb7\x1b\xee\x90'o\xba\x83\x00\x00\x00\x00\xb6E\xc8\
-\xe9\x99u%\xa1\xddl\xb83\xae\xd7\xe5\xf8\x81\xcdw\
-\x10\x00\x00\x00\xc0v\x08}\xfch\x98\x8e\x7f\xa0\xae&\
-\xb4[u9>\xaau\x07\x01\x00\x00\x00l\x970\x89\
-O\xa8\xab\x09\xedF\xddF\xfc\xfa\xe1\x8ex\xcb\xe6;\
-\x06\x00\x00\x00`;\x85\x9c\xfeiON\xd7\xae+\x0a\
-\xedt]\x1f\x7f\xa9u\xc7\x00\x00\x00\x00l\xb70\x8d\
-\xbfQW\x14\xda\xc9\xc2\xfa\xfe\xd3\xba\x9c^\xd9\xbaS\
-\x00\x00\x00\x00\xb6[\xc8\xe9\xf5'o\x8c\xce\xa8\xab\x0a\
-\xedTa:\xfe\xb9\xd6\x1d\x02\x00\x00\x00\xb0\x83\xeeW\
-W\x15\xda\x91\x0e\xae\x5c9\xf4\xe9/\x1aw\x04\x00\x00\
-\x00\xc0\x0e\x8a/=e\xfd\x94\xb5\xba\xb1\xd0v\x17r\
-\xfa\x89\xf6\x1d\x01\x00\x00\x00\xb0\xc3r\xbaK]Yh\
-\xbb\x0b9=\xb3y'\x00\x00\x00\x00\xec\xb4i:\xaf\
-\xae,\xb4\x9d\xedY\x8f\xdf\xd1\xf5\xf1\x03\xcd;\x01\x00\
-\x00\x00`\x87\x85\x9c\xfe#\xf4\xa3\xef\xa9\xab\x0bmW\
-\xa1O\xbf\xda\xba\x03\x00\x00\x00\x00vMN\xbfYW\
-\x17\xda\x8eF\xaf\x1b\xed\xe9r|y\xf3\xc6\x07\x00\x00\
-\x00\xd8%!\xa7\xbf\x09\xe7\x8f\xaeVW\x18\xda\xea\xfc\
-\x80i\x00\x00\x00`\x86\xdd\xa9\xae0\xb4\xd5u9>\
-\xadq\x83\x03\x00\x00\x00\xec\xba\xd0\xc7\xe7\xd6\x15\x86\xb6\
-\xb2\xd5~\xfc-]\x8e\xefm\xdd\xe8\x00\x00\x00\x00\xbb\
--\xe4\xf4\x91\xb5\xf5\xf1u\xeb*C[U\x97\xe3\x83\
-Z78\x00\x00\x00\xc0\xac\x08\x93\xf8\xd0\xba\xca\xd0\x96\
-t\xdeY_=\xdc\xb0\x17m\xbe\xa1\x01\x00\x00\x00f\
-I\xe8\xd3_\x9d\xfa\xcaS\xbb\xba\xd1\xd0\x89\xd6M\xe3\
-\xadZ74\x00\x00\x00\xc0\xac\x09\xd3\xf4\x93u\xa5\xa1\
-\x13m\xb8A\xff`\xf3\x0d\x0c\x00\x00\x000\x8bB\x9f\
-\x9eQW\x1a:\x91B\x1e}c\xc8\xe9\x9fZ72\
-\x00\x00\x00\xc0\xcc\xc9\xf1}\xab\xeb\xe9\xdb\xeajC\xc7\
-[\x97\xd3\x03\x9a70\x00\x00\x00\xc0\x8c\x0a\xfd\xf8\x97\
-\xebjC\xc7\xd59+W\x0a}\xcc\xad\x1b\x17\x00\x00\
-\x00`v\xc5\x97\xae\xac\x9f\xf95u\xc3\xa1c\xad[\
-O7o\xdf\xb0\x00\x00\x00\x00\xb3-LF\xb7\xae+\
-\x0e\x1dk\xa1\x8f\xbf\xd7\xbaQ\x01\x00\x00\x00f^N\
-O\xae+\x0e\x1dKk\x17\x9f\xfeu!\xc7\xb77o\
-T\x00\x00\x00\x80\x19\x17\xfa\xf4\xae\xf2\x0b\xb4\xea\xaaC\
-G\xdbj\x1e\xdd\xa7u\x83\x02\x00\x00\x00\xcc\x8d\x9c\x1e\
-PW\x1d:\xdaB\x8e\x174oL\x00\x00\x00\x809\
-\x11r\xccu\xd5\xa1\xa3i-\x8f~x\xb8\xe1>\xb7\
-\xf9\x86\x04\x00\x00\x00\x987ky|\xb3\xba\xf2\xd0\x15\
-\x15r||\xebF\x04\x00\x00\x00\x987\xa1\x8fO\xac\
-+\x0f]^W\xbd`\xff\x81.\xa7\xb7\xb6nD\x00\
-\x00\x00\x80y\x13\xfa\xf4\xff\xf6\xf6\xfb\xbe\xb6\xae>t\
-\xa4\x86\x1b\xea\x9e\xad\x1b\x10\x00\x00\x00`^\x85\x1c\x7f\
-\xb1\xae>t\xa4\x86\x1b\xeaE\x9bo8\x00\x00\x00\x80\
-y\x16rzI]}\xa8\xd5jN7\xee\xfa\xf8\xe9\
-\xd6\x8d\x07\x00\x00\x000\xbf\xe2gV\xfb\xf4\x83u\x05\
-\xa2\xcdu\xd3\xf4\xd8\xf6\x0d\x07\x00\x00\x000\xdfBN\
-\xbf]W \xbaL\x07W\xae<\xdc@\x1f\xde|\x83\
-\x01\x00\x00\x00,\x88\x0f\x97\xfdG\xdd\x84\xe8K\xadN\
-\xe2\xed\x1a7\x16\x00\x00\x00\xc0\xc2(\xfb\x8f\xba\x0a\xd1\
-\x97\x1an\x98?\xd8|C\x01\x00\x00\x00,\x98?\xa8\
-\xab\x10\x95\xf6\x1c<\xb0\x7f\xb8Q\xde\xb6\xe9F\x02\x00\
-\x00\x00X4o+{\x90\xba\x12\xd1\xdat\xf4S\x8d\
-\x1b\x09\x00\x00\x00`\xe1\x94=H]\x89\xa8\x9b\xc4\xa7\
-\xb6n$\x00\x00\x00\x80\x853\x89O\xad+\x91\xe5\xee\
-\xa4\xf54\x0e9\xbe\xbdy#\x01\x00\x00\x00,\x98\xb2\
-\x07)\xfb\x90\xba\x1aY\xde\xbaI\xbas\xeb\x06\x02\x00\
-\x00\x00XX\x93t\xe7\xba\x1aY\xdeB\x9f\x9e\xd1\xbc\
-q\x00\x00\x00\x00\x16T\xd9\x87\xd4\xd5\xc8r\xb6w\xb2\
-\xef\x1a!\xc7\x7fj\xdd8\x00\x00\x00\x00\x8b\xaa\xecC\
-\xca^\xa4\xaeH\x96\xaf\xae\x8fwk\xdd0\x00\x00\x00\
-\x00\x8b/\xde\xad\xaeH\x96\xaf\xd0\xc7?n\xdf(\x00\
-\x00\x00\x00\x8b\xad\xecE\xea\x8ad\xb9Z[?\xfd\xeb\
-B\x9f\xde\xdd\xbaQ\x00\x00\x00\x00\x16]\xd9\x8b\x94\xfd\
-H]\x95,Oa2\xfe\xb9\xd6\x0d\x02\x00\x00\x00\xb0\
-,\xca~\xa4\xaeJ\x96\xa7\xd0\xc7\xe7\xb6n\x0c\x00\x00\
-\x00\x80eQ\xf6#uU\xb2\x1cu\x93\xf8\x0d]\x8e\
-\xefk\xdd\x18\x00\x00\x00\x00K\xa3\xecG&\xf1\x1b\xea\
-\xcad\xf1\x0b}\xbag\xf3\x86\x00\x00\x00\x00X2e\
-ORW&\x8b\xdf\xf0\x0d\xff\xe9\xe6\x1b\x00\x00\x00\x00\
-`I\xfdi]\x99,v\xe1\xa2\xfdg\x0d\xdf\xec\x07\
-7}\xf3\x00\x00\x00\x00\xcb\xea\x83e_RW'\x8b\
-\xdb\xea$\xde\xbb\xf1\xcd\x03\x00\x00\x00,\xad\xb2/\xa9\
-\xab\x93\xc5\xad\xcb\xf1\x05\xado\x1e\x00\x00\x00`i\xe5\
-\xf8\x82\xba:Y\xccV\xd7\xd3\xb7\x85\x9c>\xd2\xfc\xe6\
-\x01\x00\x00\x00\x96T\xd9\x97\x94\xbdI]\xa1,^\xc3\
-7y\xbf\xcd\xdf4\x00\x00\x00\x00\x87\xdc\xaf\xaeP\x16\
-\xaf\xe1\x9b{\xd1\xa6o\x16\x00\x00\x00\x80K\xbc\xa8\xae\
-P\x16\xab\xbd\x1b\xf1;B\x8e\x1fo|\xc3\x00\x00\x00\
-\x00K\xaf\xecM\xca\xfe\xa4\xaeR\x16\xa7\xae\x8fg\xb7\
-\xbea\x00\x00\x00\x00\xbe$\x9e]W)\x8bS\x98\xa4\
-\xbfh\x7f\xb3\x00\x00\x00\x00\x14e\x7fRW)\x8b\xd1\
-\x9e\x0b\x0e\xeco}\xa3\x00\x00\x00\x00\x5cV\xd9\xa3\xd4\
-\x95\xca\xfc\x17\xfa\xf4\xf3\xado\x12\x00\x00\x00\x80\xcb*\
-{\x94\xbaR\x99\xffBN\xcfl}\x93\x00\x00\x00\x00\
-\x5cV\xd9\xa3\xd4\x95\xca|\xb7\xf7\x823N\x1e\xbe\xa1\
-\xb7m\xfe\x06\x01\x00\x00\x00hz[\xd9\xa7\xd4\xd5\xca\
-\xfc6|#?\xb2\xe9\x1b\x03\x00\x00\x00\xe0\xf2\xfdH\
-]\xad\xcco]N\x8fh|c\x00\x00\x00\x00\x1cI\
-N\x8f\xa8\xab\x95\xf9-\xf4i\xda\xfc\xe6\x00\x00\x00\x00\
-8\x92i]\xad\xccg\xab\xfd\xf8[BN\xff\xd1\xf8\
-\xc6\x00\x00\x00\x008\x82\xb2O){\x95\xbab\x99\xbf\
-\x86o\xe0\x1e\xado\x0c\x00\x00\x00\x80\xcbW\xf6*u\
-\xc52\x7f\x85>=\xa3\xf5M\x01\x00\x00\x00p\xf9\xc2\
-$\xfdQ]\xb1\xccW'o\x5cso\x97\xd3[[\
-\xdf\x14\x00\x00\x00\x00W \xa7\xb7\x96\xfdJ]\xb5\xcc\
-Oky|\xb3\xe67\x04\x00\x00\x00\xc0Q)\xfb\x95\
-\xbaj\x99\x9f\x86/\xfca\x9b\xbf\x11\x00\x00\x00\x00\x8e\
-\xc1$=\xbc\xaeZ\xe6\xa7\x90S\xdf\xfcf\x00\x00\x00\
-\x008*e\xbfRW-\xf3\xd1\xea\xe4\xf4o\x1e\xbe\
-\xe8\x7fo}3\x00\x00\x00\x00\x1c\x9d\xb2_){\x96\
-\xbar\x99\xfdB?\xfe\xd9\xd67\x02\x00\x00\x00\xc0\xb1\
-\x09\x93\xf1\xcf\xd5\x95\xcb\xec\xd7\xe5\xf4\xf4\xd67\x01\x00\
-\x00\x00\xc01\xca\xe9\xe9u\xe52\xdb\x9d\xb2~\xca\xda\
-\xf0\xc5\xbe\xa5\xf9M\x00\x00\x00\x00plrzK\xd9\
-\xb7\xd4\xd5\xcb\xec\xb6\xd6\x8fn\xd2\xfc\x06\x00\x00\x00\x00\
-8.k\x93\xd1M\xeb\xeaev\x0b9\x9e\xd3\xfa\xe2\
-\x01\x00\x00\x008>e\xdfRW/\xb3\xdb\xf0E\xe6\
-\xd6\x17\x0f\x00\x00\x00\xc0\xf1)\xfb\x96\xbaz\x99\xcd\xc2\
-\xfa\xfe\xb3\x86/\xf2\x13\xad/\x1e\x00\x00\x00\x80\xe3\x13\
-\xfa\xf8\x89\xb2w\xa9+\x98\xd9\xab\xcb\xf1gZ_8\
-\x00\x00\x00\x00'(\xc7\x9f\xa9+\x98\xd9k\xf8\xe2\x9e\
-\xd6\xfc\xa2\x01\x00\x00\x00819>\xad\xae`f\xab\
-S_|j7|qon~\xd1\x00\x00\x00\x00\x9c\
-\xa0\xf8\xe6\xb2\x7f\xa9\xab\x98\xd9i-\x8f~\xb8\xfd\x05\
-\x03\x00\x00\x00\xb0\x15\xca\xfe\xa5\xaebf\xa7\x90\xe3o\
-\xb4\xbeX\x00\x00\x00\x00\xb6F\xd9\xbf\xd4U\xcc\xec\x14\
-\xfa\xf8\xea\xd6\x17\x0b\x00\x00\x00\xc0\xd6(\xfb\x97\xba\x8a\
-\x99\x8dN\xfa\x8bq\x1a\xbe\xb0\x0fm\xfeB\x01\x00\x00\
-\x00\xd8R\x1f*{\x98\xba\x92\xd9\xfd\xbai\xbay\xe3\
-\x8b\x04\x00\x00\x00`\xabM\xd3\xcd\xebJf\xf7\x0b\xd3\
-\xf4k\xcd/\x12\x00\x00\x00\x80-U\xf60u%\xb3\
-\xfbu9\x9d\xd7\xfa\x22\x01\x00\x00\x00\xd8b9\x9dW\
-W2\xbb\xdb\xe8u\xa3=!\xc7\xb77\xbfH\x00\x00\
-\x00\x00\xb6T\xd9\xc3\x94}L]\xcd\xec^]\x8e7\
-l}\x81\x00\x00\x00\x00l\x93\x1coXW3\xbbW\
-\xe8\xe3\xbd\x9a_\x1c\x00\x00\x00\x00\xdb\xa2\xecc\xeaj\
-f\xf7\xea&\xf1\xa9\xad/\x0e\x00\x00\x00\x80m2\x89\
-O\xad\xab\x99\xdd+\xf4\xf15\xcd/\x0e\x00\x00\x00\x80\
-mQ\xf61u5\xb3;\x85\xf5\xfdgu}\xfcL\
-\xeb\x8b\x03\x00\x00\x00`\xbb\xc4\xcf\x94\xbdL]\xd1\xec\
-|kyt\xc7\xf6\x17\x06\x00\x00\x00\xc0v*{\x99\
-\xba\xa2\xd9\xf9\xbaizl\xeb\x8b\x02\x00\x00\x00`\x9b\
-M\xd3c\xeb\x8af\xe7\x0b9\xf5\xcd/\x0a\x00\x00\x00\
-\x80mU\xf62uE\xb3\xb3\x9d4==v9\xfd\
-k\xeb\x8b\x02\x00\x00\x00`\x9b\xe5\xf4\xafe?SW\
-5;W\xb7\x9en\xde\xfc\x82\x00\x00\x00\x00\xd8\x19\xeb\
-\xe9\xe6uU\xb3s\x85>\xfdj\xf3\x8b\x01\x00\x00\x00\
-`G\x94\xfdL]\xd5\xec\x5c\xc3'>w\xf3\x17\x02\
-\x00\x00\x00\xc0\x8e:\xb7\xaejv\xa8\xf3G{BN\
-\xff\xd0\xf8B\x00\x00\x00\x00\xd8!e?S\xf64u\
-c\xb3\xfdu\x1b\xf1\x06\xad/\x04\x00\x00\x00\x80\x1d\xb6\
-\x11oPW6\xdb_\xc8\xf1\x17\x9b_\x04\x00\x00\x00\
-\x00;\xaa\xeci\xea\xcaf\xfb\xebr|J\xeb\x8b\x00\
-\x00\x00\x00`\x87\xe5\xf8\x94\xba\xb2\xd9\xfeB\x1f_\xd3\
-\xfc\x22\x00\x00\x00\x00\xd8QeOSW6\xdb[\x98\
-\xee\xff\xa6\xae\x8f\x9fn}\x11\x00\x00\x00\x00\xec\xb4\xf8\
-\xe9\xb2\xaf\xa9\xab\x9b\xedkm2\xfa\xa9\xf6\x17\x00\x00\
-\x00\x00\xc0n(\xfb\x9a\xba\xba\xd9\xbe\xba\x1c\x1f\xdb\xfa\
-\xe4\x00\x00\x00\x00\xec\x92\x1c\x1f[W7\xdbW\xe8S\
-n~r\x00\x00\x00\x00vE\xd9\xd7\xd4\xd5\xcd\xf6\xb4\
-gr\xc6\xa8\xcb\xe9\x83\xadO\x0e\x00\x00\x00\xc0.\xc9\
-\xe9\x83eoSW8[_X\x1f}o\xf3\x13\x03\
-\x00\x00\x00\xb0\xab\xca\xde\xa6\xaep\xb6\xbe\xb5<\xbeo\
-\xeb\x93\x02\x00\x00\x00\xb0\xbb\xca\xde\xa6\xaep\xb6\xbe.\
-\xa7\xff\xdb\xfa\xa4\x00\x00\x00\x00\xec\xb2\x9c\xfeo]\xe1\
-l}\xa1O\xd3\xe6'\x05\x00\x00\x00`W\x95\xbdM\
-]\xe1lq\x07\x0f\x5c%\xe4\xf4\xee\xd6'\x05\x00\x00\
-\x00`w\x95\xbdM\xd9\xdf\xd4M\xce\xd6\xb5'\xa7k\
-\xb7>!\x00\x00\x00\x00\xb3a\xf5\xa2\xf4mu\x95\xb3\
-u\x85i\xfa\xc9\xd6'\x03\x00\x00\x00`6\x94\xfdM\
-]\xe5l]\xa1\x8f\xbf\xde\xfad\x00\x00\x00\x00\xcc\x86\
-0\x8d\x0f\xa9\xab\x9c\xad+\xf4\xf1\xd9\xadO\x06\x00\x00\
-\x00\xc0l\x089>\xbb\xaer\xb6\xae\xd0\xc7\xd7\xb4>\
-\x19\x00\x00\x00\x00\xb3!\xe4\xf8\xd7u\x95\xb35\xad\xf6\
-\xfb\xae>|\xd0\x8f\xb5>\x19\x00\x00\x00\x00\xb3\xa1\xec\
-o\xca\x1e\xa7\xaetN\xbc0\x19}_\xeb\x13\x01\x00\
-\x00\x000[\xca\x1e\xa7\xaetN\xbc\xd0\x8f\x7f\xb6\xf5\
-I\x00\x00\x00\x00\x98-\xa1\x1f\xfdl]\xe9\x9cx!\
-\xa7\xdfn}\x12\x00\x00\x00\x00fK\xd9\xe3\xd4\x95\xce\
-\x897|\xc0\x17o\xfe\x04\x00\x00\x00\x00\xcc\xa4\x17\xd7\
-\x95\xce\x897|\xb0\xb7m\xfa\xe0\x00\x00\x00\x00\xcc\xa6\
-\xb7\xd5\x95\xce\x89\xd5M\xd3\xb5\x86\x0f\xf6\xf9M\x1f\x1c\
-\x00\x00\x00\x80\xd9\xf4\xf9\xb2\xcf\xa9\xab\x9d\xe3o\xf8 \
-\xb7h|p\x00\x00\x00\x00f\xd5$\xdd\xa2\xaev\x8e\
-\xbf\xae\x8fg7?8\x00\x00\x00\x00\xb3\xea\x7f\xd7\xd5\
-\xce\xf1\xd7\xe5\xf8\x87\x8d\x0f\x0c\x00\x00\x00\xc0\xac\xca\xf1\
-\x0f\xebj\xe7\xf8\x1b>\xc8\xc1\xe6\x07\x07\x00\x00\x00`\
-F\xc5\x97\xd6\xd5\xce\xf1u\xea\x8bO\xed\xba\x1c\xdf\xd7\
-\xfe\xe0\x00\x00\x00\x00\xcc\xa4\x1c\xdfW\xf6:u\xc5s\
-\xec\xed\xedG\xd7i~`\x00\x00\x00\x00fZ\xd9\xeb\
-\xd4\x15\xcf\xb1\xb7\x96Gwl}P\x00\x00\x00\x00f\
-\xdb\xdat\xf4Su\xc5s\xec\x0d\x1f\xe0a\x9b? \
-\x00\x00\x00\x00s\xe1au\xc5s\xec\x85>=\xbf\xf1\
-\x01\x01\x00\x00\x00\x98qe\xafSW<\xc7\xde\xf0\x97\
-\xff\xb6\xf5A\x01\x00\x00\x00\x98m!\xa7\xbf\xad+\x9e\
-c\xeb\xa4\x8b\xc6i\xf8\xcb\xff\xd1\xfa\xa0\x00\x00\x00\x00\
-\xcc\xb6\xb2\xd7)\xfb\x9d\xba\xea9\xfaVs\xbaq\xeb\
-\x03\x02\x00\x00\x000\x1f\xca~\xa7\xaez\x8e\xbe.\xc7\
-\x9fi}0\x00\x00\x00\x00\xe6D\x8e?SW=G\
-_\xc8\xf1\x9c\xe6\x07\x03\x00\x00\x00`.\x94\xfdN]\
-\xf5\x1c}]\x8eOo}0\x00\x00\x00\x00\xe6D\x8e\
-O\xaf\xab\x9e\xa3/\xe4\xd47?\x18\x00\x00\x00\x00s\
-!\xf4)\xd7U\xcf\xd1\xd7\xe5\xf4\xd6\xd6\x07\x03\x00\x00\
-\x00`n\xbc\xa5\xaez\x8e\xae\xbd/:p\xd5\xd0\xa7\
-\x7fo| \x00\x00\x00\x00\xe6D\xd9\xef\x94=O]\
-\xf9\x5cq\xab\xd3\xf1\xb7\xb6>\x10\x00\x00\x00\x00\xf3e\
-\xf5\xc2\xf1\xb7\xd6\x95\xcf\x15\xd7M\xd3\xcd[\x1f\x04\x00\
-\x00\x00\x809\xb3\x9en^W>W\x5c\xe8\xd3=\x9b\
-\x1f\x04\x00\x00\x00\x80\xb9\x12\xfa\xf4\xf3u\xe5s\xc5\x0d\
-\x7f\xe1\xb76\x7f\x00\x00\x00\x00\x00\xe6PN\xbfYW\
->W\x5c\xe8\xe3\x1f7?\x08\x00\x00\x00\x00s%\xe4\
-\xf4\xac\xba\xf2\xb9\xe2\xba\x1c/n}\x10\x00\x00\x00\x00\
-\xe6L\x8e\x17\xd7\x95\xcf\x15\x17r|{\xf3\x83\x00\x00\
-\x00\x000W\xca\x9e\xa7\xae|.\xbf\xb0\xbe\xff\xb4.\
-\xc7O\xb5>\x08\x00\x00\x00\x00s&\xc7O\x95}O\
-]\xfd\x1c\xb9\xbd\x93\xd1w6?\x00\x00\x00\x00\x00s\
-\xa9\xec{\xea\xea\xe7\xc8\x85\xc9\xe8\xd6\xad\xbf\x0c\x00\x00\
-\x00\xc0|*\xfb\x9e\xba\xfa9r\xabyt\x9f\xd6_\
-\x06\x00\x00\x00`>\xad\xf6\xf1\xdeu\xf5s\xe4\xba\x1c\
-\x1f\xdb\xfa\xcb\x00\x00\x00\x00\xcc\xab\xf8\x98\xba\xfa9r\
-\xa1O\xcfk\xffe\x00\x00\x00\x00\xe6Q\xe8\xe3\xf3\xea\
-\xea\xe7\xc8\x0d\xef\xf8\x97\x9b\xff\x22\x00\x00\x00\x00s\xed\
-/\xeb\xea\xe7\xc8\x85>\xbd\xab\xf1\x17\x01\x00\x00\x00\x98\
-Se\xdfSW?\xedN\x9a\x9e\x1e\x87w\xfc\xdc\xe6\
-\xbf\x08\x00\x00\x00\xc0\x5c\xfb\x5c\xd9\xfb\xd4\x15\xd0\xe1\x0d\
-\xefp\xbdM\x7f\x01\x00\x00\x00\x80\xc5p\xbd\xba\x02:\
-\xbc\xd0\xa7\xdb6\xfe\x02\x00\x00\x00\x00s\xae\xec}\xea\
-\x0a\xe8\xf0\x86w\xf8\xdf\x9b\xff\x02\x00\x00\x00\x00\x0b`\
-\x9a\x1ePW@\x87\x17\xa6\xe9w\x9b\x7f\x09\x00\x00\x00\
-\x80\xb9V\xf6>u\x05tx\xdd4\x9d\xd7\xfaK\x00\
-\x00\x00\x00\xcc\xb9\x9c\xce\xab+\xa0\xc3\x0b9\xbe\xba\xf9\
-\x97\x00\x00\x00\x00\x98ke\xefSW@\x877\xbc\xf1\
-c\xad\xbf\x04\x00\x00\x00\xc0|+{\x9f\xba\x02\xbal\
-\xddF<\xb5\xf5\x17\x00\x00\x00\x00X\x10\x1b\xf1\xd4\xba\
-\x0a\xba\xb4n\x9a\xae\xd5|g\x00\x00\x00\x00\x16\xc34\
-]\xab\xae\x82.mx\xc3\xf5\x0e{G\x00\x00\x00\x00\
-\x16\xc9\xf5\xea*\xe8\xd2\xba\xf5t\xf3\xc6;\x02\x00\x00\
-\x00\xb0(\xd6\xd3\xcd\xeb*\xe8\xd2\x867\xdc\xe9\xb0w\
-\x04\x00\x00\x00`\x91\xdc\xa9\xae\x82.m\xf8\x87\xf7\xdb\
-\xf4N\x00\x00\x00\x00,\x96\xfb\xd5U\xd0\xa5\x0d\xff\xf0\
-a\x9b\xde\x09\x00\x00\x00\x80\xc5\xf2\xb0\xba\x0a\xba\xb4\xd0\
-\xa7\xdfk\xbc#\x00\x00\x00\x00\x0b\x22\xf4\xf1\xf7\xea*\
-\xe8\xd2\xc2$>\xaf\xf5\xce\x00\x00\x00\x00,\x86\xd0\xc7\
-\xe7\xd6U\xd0\xa5\x0d\xffp\xd2zg\x00\x00\x00\x00\x16\
-C\x98\xc4I]\x05]Z\xe8\xe3kZ\xef\x0c\x00\x00\
-\x00\xc0b(\xfb\x9f\xba\x0a\xba\xb4\xe1\x1f\xbe\xa3\xf5\xce\
-\x00\x00\x00\x00,\x86\xb2\xff\xa9\xab\xa0K\x1b\xfe\xe1\xbf\
-\xb5\xde\x19\x00\x00\x00\x80\xc5P\xf6?u\x15tIk\
-y|J\xeb\x1d\x01\x00\x00\x00X,e\x0fTWB\
-\x87\x96Bg\xb6\xde\x09\x00\x00\x00\x80\xc5R\xf6@u\
-%\xb4\xb22\xfc\x83\xebm~\x07\x00\x00\x00\x00\x16\xcf\
-Z\x1e\x7fw]\x09\x1dZ\x0a\xfd\xc8\xe6w\x00\x00\x00\
-\x00`!\xfdH]\x09\x1d\xfa\x9f\x8f\xfdt\xe3\x1d\x00\
-\x00\x00\x00X0e\x0fTWB\x87\x96B\xf7m\xbd\
-\x13\x00\x00\x00\x00\x8b\xa5\xec\x81\xeaJhe%\xe4x\
-N\xeb\x9d\x00\x00\x00\x00X,e\x0fTWB\x87\x96\
-B\xff\xa7\xf5N\x00\x00\x00\x00,\x96\xb2\x07\xaa+\xa1\
-\x95\x950\x8d\xcfi\xbd\x13\x00\x00\x00\x00\x8b%\xe4\xf8\
-\x9c\xba\x12:\xf4_\x0a\xad\xb7\xde\x09\x00\x00\x00\x80\xc5\
-\x12\xfaxa]\x09\x1dZ\x0a\xfdu\xeb\x9d\x00\x00\x00\
-\x00X,\xa1\x8f\xaf\xae+\xa1CK\xa1\xb7\xb7\xde\x09\
-\x00\x00\x00\x80\xc5R\xf6@u%T\x96B\xe9#\xad\
-w\x02\x00\x00\x00`\xb1\x94=\xd0\xa1\x85\xd0\xdeW\x9c\
-qr\x97\xd3\x17Z\xef\x04\x00\x00\x00\xc0\x82\xc9\xe9\x0b\
-e\x1f\xb4\xb2v\xf1\xe9_\xd7|\x07\x00\x00\x00\x00\x16\
-R\xd9\x07\xad\xac\xe5\xf1w\xb7\xde\x08\x00\x00\x00\xc0b\
-*\xfb\xa0\x95\xd5I\xbaQ\xeb\x8d\x00\x00\x00\x00,\xa6\
-\xb2\x0fZ\xe9\xfax\xcb\xd6\x1b\x01\x00\x00\x00XT\xf1\
-\x96+\xab\xd3x\xbb\xf6\x1b\x01\x00\x00\x00XDe\x1f\
-\xb4\xd2M\xe2\xddZo\x04\x00\x00\x00`AM\xe2\xdd\
-VB\x8e\xbf\xd8|#\x00\x00\x00\x00\x0b\xa9\xec\x83\xca\
-\xcf\x14:\xbb\xf5F\x00\x00\x00\x00\x16U<{%L\
-\xe3C\xdao\x04\x00\x00\x00`\x11\x95}\xd0J\x97\xe3\
-#[o\x04\x00\x00\x00`A\xe5\xf8\xc8\xf23\x85\x1e\
-\xdf|#\x00\x00\x00\x00\x0b\xa9\xec\x83\xca\x7f)\xf4\x87\
-\xad7\x02\x00\x00\x00\xb0\xb0\x9e\xbc\x12\xfa\xf8\xc7\x8d7\
-\x00\x00\x00\x00\xb0\xa0\xca>h\xa5\x9b\xa6\xf3Zo\x04\
-\x00\x00\x00`A\xe5t^\xf9\x99B\x174\xdf\x08\x00\
-\x00\x00\xc0B\x0a}\xfa\x8b\xf23\x85.n\xbd\x11\x00\
-\x00\x00\x80\x05\x95\xe3\xc5\xe5\xbf\x14zu\xf3\x8d\x00\x00\
-\x00\x00,\xa4\xd0\xa7W\x95\x1f4\xfd\x8e\xd6\x1b\x01\x00\
-\x00\x00XLe\x1f\xb4\xd2\xf5\xf1\xefZo\x04\x00\x00\
-\x00`Q\xc5\xbf[\x19\xfe\x8f\xb7\x1c\xfe\x06\x00\x00\x00\
-\x00\x16\xd8[VBN\xff\xd0x\x03\x00\x00\x00\x00\x0b\
-\xaa\xec\x83\xca\x0f\x9a~g\xeb\x8d\x00\x00\x00\x00,\xa6\
-\xb2\x0fZ\x09}zW\xeb\x8d\x00\x00\x00\x00,\xa6\xb2\
-\x0f*?S\xe8=\x9b\xdf\x00\x00\x00\x00\xc0B{\xcf\
-J\x97\xe3\xfb\x1ao\x00\x00\x00\x00`Q\xe5\xf8\xbe\xf2\
-_\x0a}\xf0\xb07\x00\x00\x00\x00\xb0\xc8>X\x96B\
-\x1f\xde\xf4\x0f\x01\x00\x00\x00Xl\x1f.\xbf}\xecc\
-\x8d7\x00\x00\x00\x00\xb0\xa0\xca>h%\xe4\xf4\xef\xad\
-7\x02\x00\x00\x00\xb0\x98\xca>\xa8\xfcJ\xfa\xffj\xbd\
-\x11\x00\x00\x00\x80\xc5T\xf6A+]\x1f?\xddz#\
-\x00\x00\x00\x00\x8b*~z\xa5\xcb\xe9\xb3\xed7\x02\x00\
-\x00\x00\xb0\x90r\xfal\xf9\xedc\x9f;\xec\x0d\x00\x00\
-\x00\x00,\xb2\xcf\xf9\x9f\x8f\x01\x00\x00\x00,\x9b\x1c?\
-S\xfeK!?h\x1a\x00\x00\x00`\xb9\xfcW\xf9\xed\
-c~%=\x00\x00\x00\xc0\x12)\xfb\xa0\x95\x90\xe3\xc7\
-Zo\x04\x00\x00\x00`1\x95}\xd0J\xc8\xe9#\xad\
-7\x02\x00\x00\x00\xb0\x98\xca>\xa8\xfcJ\xfa\x7fm\xbd\
-\x11\x00\x00\x00\x80\x05\x95\xd3\xbf\x96\xdf>\xf6\xfe\xe6\x1b\
-\x01\x00\x00\x00XP\xf1\xfd\xe5\xb7\x8f\xbd\xe7\xf07\x00\
-\x00\x00\x00\xb0\xb0r|o\xf9\xedc\xefj\xbe\x11\x00\
-\x00\x00\x80\x85T\xf6A+\xa1\x8f\xefl\xbd\x11\x00\x00\
-\x00\x80\xc5T\xf6A\xe5\xb7\x8f\xfdC\xeb\x8d\x00\x00\x00\
-\x00,\xa6\xd0\xa7\x7f(\xbf}\xec\xad\xad7\x02\x00\x00\
-\x00\xb0\xa0rz\xebJ\x97\xe3\xdf7\xdf\x08\x00\x00\x00\
-\xc0b\xca\xf1\xef\xcb\xaf\xa4\x7fc\xf3\x8d\x00\x00\x00\x00\
-,\xa8\xf8\xc6\x95\x90\xe3_\xb7\xdf\x08\x00\x00\x00\xc0\x22\
-\x0a9\xbe\xba\xfc\xcf\xc7\x0e\xb6\xde\x08\x00\x00\x00\xc0\xa2\
-\x8a/-\xff\xa5\xd0\x85\xed7\x02\x00\x00\x00\xb0\x88\xca\
->\xa8\xfcL\xa1\x17\xb6\xde\x08\x00\x00\x00\xc0\x82\xca\xf1\
-\x05\xe5\xbf\x14zN\xf3\x8d\x00\x00\x00\x00,\xa4\x90\xe3\
-\xb3\xcb\xcf\x14zJ\xeb\x8d\x00\x00\x00\x00,\xa8\x1c\x9f\
-R\xfeK\xa1'6\xdf\x08\x00\x00\x00\xc0B\x0a}|\
-\xc2J7\x8d\x8fj\xbd\x11\x00\x00\x00\x80\x05\x95\xe3\xa3\
-VB\x1f\x1f\xda|#\x00\x00\x00\x00\x0b)L\xe2C\
-\xcb\xcf\x14zP\xeb\x8d\x00\x00\x00\x00,\xa8i|`\
-\xf9/\x85\xee\xd5|#\x00\x00\x00\x00\x0b\xa9\xec\x83\xca\
-\x7f)t\xf7\xd6\x1b\x01\x00\x00\x00XP9\xde}e\
-u=\xde\xa1\xf9F\x00\x00\x00\x00\x16\xd2j\x8e\xb7/\
-\xbf}\xecV\xad7\x02\x00\x00\x00\xb0\xa0\xa6\xf1V+\
-\xab\x93t\xa3\xe6\x1b\x01\x00\x00\x00XHe\x1f\xb4\xd2\
-\xad\xa7\xeb\xb7\xde\x08\x00\x00\x00\xc0\x82ZO\xd7_\xe9\
-.\x8c_\xdf|#\x00\x00\x00\x00\x8b\xe9\xc2\xf8\xf5+\
-\xddF<\xb5\xf9F\x00\x00\x00\x00\x16\xd3F<ue\
-\xe5\x8b+_\x11\xfa\xf8\xd1\xe6;\x00\x00\x00\x00\xb0P\
-\xca\x1e\xa8\xec\x83VJ!\xc7w\xb6\xde\x09\x00\x00\x00\
-\x80\xc5R\xf6@\x87\x16B\xa5\xe1\xffym\xeb\x9d\x00\
-\x00\x00\x00X,e\x0fTWB++\xa1\x8f\x93\xd6\
-;\x01\x00\x00\x00\xb0X\xca\x1e\xa8\xae\x84\x0e-\x85\x9e\
-\xd7z'\x00\x00\x00\x00\x16K\xd9\x03\xd5\x95PY\x0a\
-\xa5'\xb5\xde\x09\x00\x00\x00\x80\xc5R\xf6@u%\xb4\
-\xb22\xfc\x83\x87o~\x07\x00\x00\x00\x00\x16\xd2\xc3\xeb\
-Jhe\xa5\x9b\xa4\xfb7\xde\x01\x00\x00\x00\x80E3\
-I\xf7\xaf+\xa1CK\xa1;7\xdf\x09\x00\x00\x00\x80\
-\xc52Iw\xae+\xa1\x95\x95n\x9an\xde|'\x00\
-\x00\x00\x00\x16\xcb4\xdd\xbc\xae\x84\x0e-\x85\xae\xdf|\
-'\x00\x00\x00\x00\x16\xcb4]\xbf\xae\x84VV\xba\x8d\
-\xf8\xf5\xcdw\x02\x00\x00\x00`\xb1l\xc4\xaf\xaf+\xa1\
-\x95\x95p\xfe\xe8j\xcdw\x02\x00\x00\x00`\xa1\x94=\
-P]\x09\x0d\x9d\xb3r\xa5\xd0\xc7\x8f\xb6\xde\x11\x00\x00\
-\x00\x80\xc5P\xf6?e\x0fT7B\x974\xfc\xc3w\
-\xb6\xde\x19\x00\x00\x00\x80\xc5P\xf6?u\x15ti\xc3\
-?|m\xeb\x9d\x01\x00\x00\x00X\x0ce\xffSWA\
-\x97\x16r\xcc\xadw\x06\x00\x00\x00`1\x94\xfdO]\
-\x05]Z\xc8\xe9\xf9\xadw\x06\x00\x00\x00`1\x94\xfd\
-O]\x05]\xda\xf0\x86'm~G\x00\x00\x00\x00\x16\
-\xca\x93\xea*\xe8\xd2\x86\x7f\xf8\xf0M\xef\x04\x00\x00\x00\
-\xc0byx]\x05]Z7M\xf7o\xbc#\x00\x00\
-\x00\x00\x8bb\x9a\xee_WA\x97\xd6M\xd2\x9d\x9b\xef\
-\x0c\x00\x00\x00\xc0b\x98\xa4;\xd7U\xd0\xa5\x0d\xff\xf0\
-\x16\xcdw\x06\x00\x00\x00`1L\xd2-\xea*\xe8\xd2\
-\xbaI\xbcA\xf3\x9d\x01\x00\x00\x00X\x0c\x93x\x83\xba\
-\x0a\xba\xb4\xe1\x1f~C\xf3\x9d\x01\x00\x00\x00X\x0c\x93\
-\xf8\x0du\x15ti\xe1\xe0\xe8j\xcdw\x06\x00\x00\x00\
-`!\x94\xfdO]\x05]\xb6\x90\xd3\x7f\xb4\xfe\x02\x00\
-\x00\x00\x00\xf3\xad\xec}\xea\x0a\xe8\xf0B\x1f_\xd3\xfa\
-K\x00\x00\x00\x00\xcc\xb7\xb2\xf7\xa9+\xa0\xc3\xeb\xfa\xf8\
-\xc2\xd6_\x02\x00\x00\x00`\xde\xc5\x17\xd6\x15\xd0\xe1\x85\
->>\xa1\xfd\x97\x00\x00\x00\x00\x98ge\xefSW@\
-\x87\xd7\xe5\xf8\xc0\xd6_\x02\x00\x00\x00`\xce\xe5\xf8\xc0\
-\xba\x02:\xbc\xd5I\xbc]\xf3/\x01\x00\x00\x000\xd7\
-\xca\xde\xa7\xae\x80\x0e\xaf\x9b\xc4\x1b\xb4\xfe\x12\x00\x00\x00\
-\x00sn\x12oPW@\x87w\xd2z\x1aw9}\
-\xa1\xf9\x17\x01\x00\x00\x00\x98O9}\xa1\xec}\xea\x0a\
-\xa8]\xc8\xe9\xdd\xcd\xbf\x0c\x00\x00\x00\xc0\x5c\x0a}z\
-w]\xfd\x1c\xb9n\x9a^\xd9\xfa\xcb\x00\x00\x00\x00\xcc\
-\xa7\xd0\xa7\xbf\xaa\xab\x9f#7\xbc\xe3\x9fn\xfe\x8b\x00\
-\x00\x00\x00\xcc\xb5?\xad\xab\x9f#\x17\xfa\xf4;\x8d\xbf\
-\x08\x00\x00\x00\xc0\x9c*\xfb\x9e\xba\xfa9r\xc3;\xde\
-o\xf3_\x04\x00\x00\x00`\xae\xdd\xaf\xae~\x8e\x5c\xe8\
-\xc7\xb7i\xfcE\x00\x00\x00\x00\xe6T\xd9\xf7\xd4\xd5\xcf\
-\x91[\x9b\x9e\xfe]\xad\xbf\x0c\x00\x00\x00\xc0|Z[\
-\x1f_\xb7\xae~\x8e\xdc\x9e\x0bN\xdb\xdf\xe5\xf8\xdf\xad\
-\x0f\x00\x00\x00\x00\xc0\x9c\xc9\xf1\xbf\xf7\x5cp`\x7f]\
-\xfd\x5c~!\xc7\x7fl~\x10\x00\x00\x00\x00\xe6J\xd9\
-\xf3\xd4\x95\xcf\x15\xd7\xe5\xf8\xb2\xd6\x07\x01\x00\x00\x00`\
-\xde\xc4\x97\xd5\x95\xcf\x15\x17r|N\xfb\x83\x00\x00\x00\
-\x000OB\x1f\x9f[W>W\x5c7\x8d\x8fj}\
-\x10\x00\x00\x00\x00\xe6M|t]\xf9\x5cq\xa1\x8f\xf7\
-j\x7f\x10\x00\x00\x00\x00\xe6I\xd9\xf3\xd4\x95\xcf\x15\xd7\
-\xf5\xf1\x96\xad\x0f\x02\x00\x00\x00\xc0\xbc\x89\xb7\xac+\x9f\
-+nO\x1f\xbf\xbd\xfdA\x00\x00\x00\x00\x98'e\xcf\
-SW>W\x5c\xb7\x11O\xedr\xfcd\xeb\x03\x01\x00\
-\x00\x000'\xca~g#\x9eZW>GW\xc8\xe9\
-\x1f\x9a\x1f\x0c\x00\x00\x00\x80\xb9P\xf6;u\xd5s\xf4\
-u9]\xd4\xfa`\x00\x00\x00\x00\xcc\x89\x9c.\xaa\xab\
-\x9e\xa3/\xe4\xf4\xcc\xe6\x07\x03\x00\x00\x00`.\x94\xfd\
-N]\xf5\x1c}]N\x8fh}0\x00\x00\x00\x00\xe6\
-DN\x8f\xa8\xab\x9e\xa3/\xe4t\x8f\xe6\x07\x03\x00\x00\
-\x00`.\x94\xfdN]\xf5\x1c}k\xfd\xe8&\xad\x0f\
-\x06\x00\x00\x00\xc0|(\xfb\x9d\xba\xea9\xfa\xf6N\xf6\
-]\xa3\xeb\xe3\xa7[\x1f\x10\x00\x00\x00\x80Y\x17?]\
-\xf6;u\xd5sl\x0d\x7f\xf9M\xed\x0f\x0a\x00\x00\x00\
-\xc0L\xcb\xf1\xef\xea\x8a\xe7\xd8\x1b\xfe\xf2\x0b\x9a\x1f\x14\
-\x00\x00\x00\x80\xd9\x96\xe3\x0b\xea\x8a\xe7\xd8\x1b\xfe\xf2#\
-\x9b\x1f\x14\x00\x00\x00\x80\xd9\x96\xe3#\xeb\x8a\xe7\xd8\xeb\
-r\xbaK\xf3\x83\x02\x00\x00\x000\xdbr\xbaK]\xf1\
-\x1c{\xddz\xba~\xf3\x83\x02\x00\x00\x000\xdb\xa6\xe9\
-\xfau\xc5s\xec\xed}\xc5\x19'\x0f\x1f\xe4C\x87}\
-P\x00\x00\x00\x00f\xd9\x87\xca^\xa7\xaex\x8e\xaf\xe1\
-\x83\xbcb\xd3\x07\x05\x00\x00\x00`\xb6\xbd\xa2\xaev\x8e\
-\xbf\xd0\xa7g4>0\x00\x00\x00\x003\xaa\xecs\xea\
-j\xe7\xf8\x0b\xfd\xf8\x97[\x1f\x1c\x00\x00\x00\x80\xd9\x14\
-rzp]\xed\x1c\x7f!\x8f~\xac\xf5\xc1\x01\x00\x00\
-\x00\x98Me\x9fSW;\xc7_\x98\xee\xff\xa6\xd6\x07\
-\x07\x00\x00\x00`6\x85\xf5\xfdg\xd5\xd5\xce\x09t\xde\
-\xcaW\x86>\xbe\xa3\xf5\x09\x00\x00\x00\x00\x98-!\xc7\
-w\x96}N\xdd\xec\x9cX\xc3\x07\xbb\xb0\xf5I\x00\x00\
-\x00\x00\x98-e\x8fSW:'\xde\xf0\xc1\x1e\xdf\xfa\
-$\x00\x00\x00\x00\xcc\x96\xd0\xc7'\xd4\x95\xce\x89\x17&\
-\xf1\x17Z\x9f\x04\x00\x00\x00\x80\xd9\x12\xa6\xf1\x17\xeaJ\
-\xe7\xc4[\xed\xd3\x0f\xb6>\x09\x00\x00\x00\x00\xb3\xa5\xec\
-q\xeaJ\xe7\xc4;\xe9\xa2q\x0a9\xfdg\xeb\x13\x01\
-\x00\x00\x000\x1b\xca\xfe\xa6\xecq\xeaJgk\x0a}\
-\xfa\xdb\xd6'\x03\x00\x00\x00`6\x94\xfdM]\xe5l\
-]!\xa7?i}2\x00\x00\x00\x00fDN\x7fR\
-W9[\xd7\xf0\x81\x1fv\xd8'\x02\x00\x00\x00`\x96\
-<\xac\xaer\xb6\xae\xb5<\xbac\xe3\x13\x01\x00\x00\x00\
-0#\xd6\xf2\xf8\x8eu\x95\xb3u\xed\xedG\xd7i}\
-2\x00\x00\x00\x00fC\xd9\xdf\xd4U\xce\xd6u\xea\x8b\
-O\xed\xba>\xbe\xbf\xf5\x09\x01\x00\x00\x00\xd8m\xf1\xfd\
-e\x7fSW9[\xdb\xf0\xc1\x0f\xb6?)\x00\x00\x00\
-\x00\xbb+\x1e\xac+\x9c\xad\xaf\xcb\xf1)\xedO\x0a\x00\
-\x00\x00\xc0\xae\xca\xf1)u\x85\xb3\xf5u}<\xbb\xf9\
-I\x01\x00\x00\x00\xd8e\xf1\xec\xba\xc2\xd9\xfaV'\xf1\
-\x87\xda\x9f\x14\x00\x00\x00\x80\xddT\xf66u\x85\xb3\xf5\
-]\xf5\x82\xfd\x07B\x1f?\xda\xfa\xc4\x00\x00\x00\x00\xec\
-\x8e\xb2\xaf){\x9b\xba\xc2\xd9\x9e\xba>\xbe\xb4\xf5\xc9\
-\x01\x00\x00\x00\xd8-\xf1\xa5uu\xb3}\x85I|B\
-\xfb\x93\x03\x00\x00\x00\xb0\x1b\xca\xbe\xa6\xaen\xb6\xaf\xae\
-\x8fwm}r\x00\x00\x00\x00vK\xbck]\xddl\
-_{r\xba\xf6\xf0\xc9\xbep\xf8'\x07\x00\x00\x00`\
-\x17|\xa1\xeck\xea\xeaf{\xebrzC\xe3\x0b\x00\
-\x00\x00\x00`\xa7\xe5\xf4\x86\xba\xb2\xd9\xfeBN\xcfl\
-~\x11\x00\x00\x00\x00\xec\xa8\xb2\xa7\xa9+\x9b\xed\xaf\x9b\
-\xa6\xfb\xb7\xbe\x08\x00\x00\x00\x00v\xd84\xdd\xbf\xael\
-\xb6\xbf0\x1d\xff@\xf3\x8b\x00\x00\x00\x00`G\x95=\
-M]\xd9l\x7f{_t\xe0\xaa\xa1O\xefj}!\
-\x00\x00\x00\x00\xec\x8c\xb2\x9f){\x9a\xba\xb2\xd9\x99\x86\
-O\xfc\xa2\xcd_\x08\x00\x00\x00\x00;\xeaEuU\xb3\
-s\x85\x1c\xcfi|!\x00\x00\x00\x00\xec\x90\xb2\x9f\xa9\
-\xab\x9a\x9d+l\x8cn\xdd\xfab\x00\x00\x00\x00\xd8\x19\
-e?SW5;\xd7\xde\xc9\xbek\x84\x1c?\xd6\xfa\
-\x82\x00\x00\x00\x00\xd8^e/S\xf63uU\xb3\xb3\
-u}<\xd8\xfa\xa2\x00\x00\x00\x00\xd8n\xf1`]\xd1\
-\xec|\xa1\x8fOh\x7fQ\x00\x00\x00\x00l\xa7\xb2\x97\
-\xa9+\x9a\x9d\xaf\x9b\xc4\xbb\xb5\xbe(\x00\x00\x00\x00\xb6\
-\xd9$\xde\xad\xaehv\xbe=}\xfc\xf6\xe6\x17\x05\x00\
-\x00\x00\xc0\xb6*{\x99\xba\xa2\xd9\x9d\xba\x9c\xde\xd0\xfa\
-\xc2\x00\x00\x00\x00\xd8&9\xbd\xa1\xaefv\xaf\x90\xd3\
-\xb3\x9a_\x1c\x00\x00\x00\x00\xdb\xa2\xecc\xeajf\xf7\
-\xearz@\xeb\x8b\x03\x00\x00\x00`\x9b\xe4\xf4\x80\xba\
-\x9a\xd9\xbdV7\xd2\x8d\x9a_\x1c\x00\x00\x00\x00\xdb\xa2\
-\xecc\xeajf\xf7\xda{\xf0\xc0UCN\xff\xdc\xfa\
-\x02\x01\x00\x00\x00\xd8Ze\x0fS\xf61u5\xb3\xbb\
-\x0d_\xd0\x8b7\x7f\x81\x00\x00\x00\x00l\x8b\x17\xd7\x95\
-\xcc\xee7|1\x0f\xdb\xf4\xc5\x01\x00\x00\x00\xb0=\x1e\
-VW2\xbb_\xc8\xe3\x1fk|\x81\x00\x00\x00\x00l\
-\xb1\xb2\x87\xa9+\x99\xddoo\xbf\xefkC\x8e\x1fo\
-}\xa1\x00\x00\x00\x00l\x8d\xb2\x7f){\x98\xba\x92\x99\
-\x8d\xba\x9c\xde\xd0\xfab\x01\x00\x00\x00\xd8\x229\xbd\xa1\
-\xaebf\xa7\xae\x8f\x8fl~\xb1\x00\x00\x00\x00l\x91\
-\xf8\xc8\xba\x8a\x99\x9d\xba\x1c\x7f\xb4\xfd\xc5\x02\x00\x00\x00\
-\xb0%r\xfc\xd1\xba\x8a\x99\x9d\xc2\xf9\xa3\xab\x85>\xbe\
-\xa3\xf9\x05\x03\x00\x00\x00pB\xca\xde\xa5\xec_\xea*\
-f\xb6\x1a\xbe\xb8g\xb7\xbeh\x00\x00\x00\x00NL\xd9\
-\xbb\xd4\x15\xcc\xec\x15r\xfc\xc5\xd6\x17\x0d\x00\x00\x00\xc0\
-\x89){\x97\xba\x82\x99\xbd\xf6\xac\xc7\xef\xe8\xfa\xf8\xe9\
-\xd6\x17\x0e\x00\x00\x00\xc0\xf1\x8a\x9f.{\x97\xba\x82\x99\
-\xcd\x86/\xf2`\xfb\x8b\x07\x00\x00\x00\xe0\xb8\xe4x\xb0\
-\xae^f\xb7n\x1a\x1f\xd5\xfc\xe2\x01\x00\x00\x008>\
-9>\xaa\xae^f\xb7n\x12o\xd5\xfc\xe2\x01\x00\x00\
-\x008>\x93x\xab\xbaz\x99\xdd\xc2\xfa\xfe\xd3B\x1f\
-\xdf\xd9\xfc\x06\x00\x00\x00\x008&!\xc7w\x96}K\
-]\xbd\xccva\x1a\x9f\xd3\xfa&\x00\x00\x00\x0086\
-!\xc7\xe7\xd4\x95\xcb\xec\xb7:\x89\xf7n}\x13\x00\x00\
-\x00\x00\x1c\x9b\xd0\xc7{\xd5\x95\xcb\xec\xb7w2\xfa\xce\
-\xae\x8f\x9fi}#\x00\x00\x00\x00\x1c\xa5\x1c?S\xf6\
-,u\xe52\x1f\x0d_\xf4\xcb\x9a\xdf\x0c\x00\x00\x00\x00\
-G'\xc7\x97\xd5U\xcb\xfc\xd4\xf5\xf11\xcdo\x06\x00\
-\x00\x00\x80\xa3\x14\x1f]W-\xf3S\x98\x8cn\xdd\xfe\
-f\x00\x00\x00\x008\x1ae\xbfRW-\xf3\xd3\xeaK\
-\xae\xbe/\xe4\xf8\x8f\xado\x08\x00\x00\x00\x80\xcbW\xf6\
-*\xab\xfd\xbe\xab\xd7U\xcb|\x15&\xf1y\xado\x0a\
-\x00\x00\x00\x80\xcb\x17\xfa\xf8\xdc\xbab\x99\xbf\xd6\xf2\xe8\
->\xado\x0a\x00\x00\x00\x80\xcb\xb7\x9aG\xf7\xa9+\x96\
-\xf9k\xed\xc2\xfd\xdf\xd5\xe5\xf8\xdf\xado\x0c\x00\x00\x00\
-\x80#\xc8\xf1\xbf\xf7\xf6\xa3\xeb\xd4\x15\xcb|6|\x13\
-/o~s\x00\x00\x00\x00\xb4\xe5\xf8\xf2\xbaZ\x99\xdf\
-\xba\x9c\x1e\xdb\xfc\xe6\x00\x00\x00\x00h\xcb\xf1\xb1u\xb5\
-2\xbf\x85<\xfe\xb1\xe67\x07\x00\x00\x00@S\xd9\xa7\
-\xd4\xd5\xca\xfc\xb6\xe7\x82\x03\xfbCN\xff\xd4\xfa\x06\x01\
-\x00\x00\x00\xb8\xac\xb2G)\xfb\x94\xbaZ\x99\xef\x86o\
-\xe6\xf9\xado\x12\x00\x00\x00\x80\xcb*{\x94\xbaR\x99\
-\xff\xd6\xf2\xf8\xbe\xado\x12\x00\x00\x00\x80\xcb*{\x94\
-\xbaR\x99\xff\xf6N\xf6]\xa3\xf5M\x02\x00\x00\x00p\
-Ye\x8fRW*\x8bQ\x97\xd3F\xeb\x1b\x05\x00\x00\
-\x00\xa0\xcai\xa3\xaeR\x16\xa70I\xbf\xd6\xfcf\x01\
-\x00\x00\x008\xa4\xecO\xea*eq\xea6\xe2\x0d\xba\
->~\xba\xf5\x0d\x03\x00\x00\x00\x10?]\xf6'u\x95\
-\xb2X\x85>N\xda\xdf4\x00\x00\x00\xc0r+{\x93\
-\xbaBY\xbcB?\xfe\xe5\xd67\x0d\x00\x00\x00\xb0\xec\
-\xca\xde\xa4\xaeP\x16\xaf\xb5<\xfe\xee\x90\xd3\x7f\xb6\xbe\
-q\x00\x00\x00\x80eU\xf6%eoRW(\x8bY\
-\xe8\xd3_\xb4\xbey\x00\x00\x00\x80eU\xf6%uu\
-\xb2\xb8u9>\xb0\xf5\xcd\x03\x00\x00\x00,\xad\x1c\x1f\
-XW'\x8b\xdb\xde\xc9\xe8;C\x1f?\xd1\xbc\x01\x00\
-\x00\x00\x00\x96L\xd9\x93\x94}I]\x9d,v\xc37\
-\xfc\xe2\xcd7\x00\x00\x00\x00\xc0\x92zq]\x99,~\
-\xdd4\xdd\xbfq\x03\x00\x00\x00\x00,\x9fi\xba\x7f]\
-\x99,~{r\xbav\xe8\xe3\xbf5o\x08\x00\x00\x00\
-\x80%Q\xf6#eORW&\xcbQ\xd7\xc7\x17\xb6\
-n\x0c\x00\x00\x00\x80\xe5\x11_XW%\xcb\xd3j\x1e\
-\xdd\xa7}c\x00\x00\x00\x00,\x87\xb2\x1f\xa9\xab\x92\xe5\
-iur\xfa7w9\xfdk\xeb\x06\x01\x00\x00\x00X\
-x9\xfdk\xd9\x8f\xd4U\xc9r5\xdc\x00\xe7\x1ev\
-\x83\x00\x00\x00\x00,\x87s\xeb\x8ad\xf9\x0a\xd3\xf8\x0b\
-\x8d\x1b\x04\x00\x00\x00`\xe1\x95\xbdH]\x91,_!\
-\x8f\xbe\xb1\xeb\xe3\xfb[7\x0c\x00\x00\x00\xc0\xe2\x8a\xef\
-/{\x91\xba\x22Y\xceB\x9f\x9e\xd7\xbeq\x00\x00\x00\
-\x00\x16S\xd9\x87\xd4\xd5\xc8\xf2\x16r\xbaG\xeb\xc6\x01\
-\x00\x00\x00XTe\x1fRW#\xcb\xdbZ\x1e\x9f9\
-\xdc\x18\xef\xd9|\xe3\x00\x00\x00\x00,\xa8\xf7\x94}H\
-]\x8d,w!\xc7g7n \x00\x00\x00\x80\x85S\
-\xf6 u%\xa2.\xc7\xbb\xb7n$\x00\x00\x00\x80\x85\
-\x93\xe3\xdd\xebJD{\xfb}_\x1b\xfa\xf4\xae\xe6\x0d\
-\x05\x00\x00\x00\xb0 \xca\xfe\xa3\xecA\xeaJD\xa5\xe1\
-F\xf9\xa3\xd6\x8d\x05\x00\x00\x00\xb0(\xca\xfe\xa3\xaeB\
-\xf4\xa5\xba\x9c\xee\xd2\xba\xb1\x00\x00\x00\x00\x16FNw\
-\xa9\xab\x10\xfdO\x07\x0f\x5c%\xe4\xf4\x1f\xcd\x1b\x0c\x00\
-\x00\x00`\xce\x95\xbdG\xd9\x7f\xd4M\x88\xbe\xbc\xd0\xc7\
-\xdfk\xddh\x00\x00\x00\x00\xf3.\xf4\xe9Iu\x05\xa2\
-\xcdu\xd3t\xf3\xd6\x8d\x06\x00\x00\x000\xf7&\xe9\x16\
-u\x05\xa2\xc3:g\xe5J!\xa7\xbey\xc3\x01\x00\x00\
-\x00\xcc\xa9\xd0\xa7\xe9\xcay+_Y7 j\xd5M\
-\xd3\x03Z7\x1e\x00\x00\x00\xc0\xfc\x8ag\xd7\xd5\x87\x8e\
-T\xc8\xa3o,\xbf\xb3\xbf}\x03\x02\x00\x00\x00\xcc\x97\
-\xd0\xa7w\x87\xf5\xfdg\xd5\xd5\x87.\xaf.\xa7'\xb7\
-nD\x00\x00\x00\x80\xb9\x93\xe3S\xea\xcaCWT7\
-\x8d\xb7j\xde\x88\x00\x00\x00\x00s&\xf4\xe3\xdb\xd4\x95\
-\x87\xae\xb0\xf3\xce\xfa\xea.\xc7\x8b[7$\x00\x00\x00\
-\xc0\xdc\xc8\xf1\xe5+\xaf\x1a\x9fT7\x1e:\x9a\xba>\
-\xfeR\xf3\xc6\x04\x00\x00\x00\x98\x13\xa1O\xbfZW\x1d\
-:\xdaV/\x1c\x7fk\xd7\xc7\xf7\xb6nP\x00\x00\x00\
-\x80\x99\x97\xd3\x07\xf7\xac\xc7\xef\xa8\xab\x0e\x1dK]\x1f\
-\x9f\xd6\xbcQ\x01\x00\x00\x00f\x5c\xc8\xe9Yu\xc5\xa1\
-cm\xb8\xf1~\xa2u\xa3\x02\x00\x00\x00\xcc\xba\xd5>\
-\xde\xa1\xae8t\xac\xed\xeb\xf7\xad\x96\x1f\xc8\xd4\xbaa\
-\x01\x00\x00\x00fU\xe8\xe3\xab\xf7\xbe\xe8\xc0U\xeb\x8a\
-C\xc7S\xf9\x81L\xad\x1b\x17\x00\x00\x00`V\x85\x1c\
-\xcf\xa9\xab\x0d\x1do{6\xe2w\x94\x1f\xcc\xd4\xba\x81\
-\x01\x00\x00\x00fM\xe8\xe3G\x87?\xafWW\x1b:\
-\x91\xc24=s\xf3\x0d\x0c\x00\x00\x000\x8bB\x9f\x9e\
-_W\x1a:\xd1Vs\xbc}\xebF\x06\x00\x00\x00\x98\
-99\xdd\xa5\xae4t\xa2\x9d\xbcq\xcd\xbd!\xa7W\
-5oh\x00\x00\x00\x80\x19\x11rz\xfdj\xbf\xef\xea\
-u\xa5\xa1\xad(\xe4\xf8\x1b\xad\x1b\x1b\x00\x00\x00`f\
-\xe4\xf8\xa8\xba\xca\xd0V\xb5\xb61\xben\xc8\xe9#\xcd\
-\x1b\x1c\x00\x00\x00`\x97\x85>\xfdW\xe8\xc7\xdf_W\
-\x19\xda\xcaB\x1f\x9f\xdb\xba\xd1\x01\x00\x00\x00v]\x8e\
-\x7fVW\x18\xda\xea\x86\x1b\xf8N\x87\xdd\xe0\x00\x00\x00\
-\x003 \xe4t\x8f\xba\xc2\xd0V\x17\xce\x1f]-\xe4\
-\xf8\xda\xd6\x0d\x0f\x00\x00\x00\xb0{\xe2\x9b\xaf\x92\xe3\xe9\
-u\x85\xa1\xed\xa8\xcb\xe9\x11\xed\x1b\x1f\x00\x00\x00`w\
-\x84>=\xae\xae.\xb4]u9\xde0\xe4\xf8\xf1\xd6\
-\x1d\x00\x00\x00\x00\xb0\xe3r\xfa\xdc\xea$\xfeP]]\
-h;\x1bn\xf0?=\xec\x0e\x00\x00\x00\x00\xd8\x05\xa1\
-O\x7fQW\x16\xda\xee\xbaI\xbas\xebN\x00\x00\x00\
-\x00\xd8ia\x12\x7f\xa1\xae,\xb4\xdd\x9d\xfa\xcaS\xbb\
-.\xc7\x8b[w\x04\x00\x00\x00\xc0N\x09}|\xf5\x9e\
-\x0b\x0e\xec\xaf+\x0b\xedDky|\xdf\xd6\x9d\x01\x00\
-\x00\x00\xb0S\xc24=\xb8\xae*\xb4S\x9d\xbc1:\
-#\xe4\xf4\xfa\xd6\x1d\x02\x00\x00\x00\xb0\x03\xde\x16\xf2\xe8\
-\x1b\xeb\xaaB;Y\x98\xc6\xdfh\xdc!\x00\x00\x00\x00\
-; >\xba\xae(\xb4\xd3\xed\xc9\xe9\xda!\xa7\x7fj\
-\xdf1\x00\x00\x00\x00\xdb%~`\xf8\xf3zuE\xa1\
-\xdd(\xf4\xf1\x09\x87\xdf1\x00\x00\x00\x00\xdb\xea\xc9u\
-5\xa1\xddju\x92n\x14r\xfcX\xe3\xce\x01\x00\x00\
-\x00\xd8z9~jm:\xbei]Mh7\x0b9\
-=\xaby'\x01\x00\x00\x00l\xb5\x9c\xfe\xa4\xae$\xb4\
-\xdb\x85<\xfe\xb1\xe6\x9d\x04\x00\x00\x00\xb0\xc5Vs\xbc\
-}]Ih\xd7\xfb\xe2\xcaW\x0cw\xca\x8b7\xdfI\
-\x00\x00\x00\x00[)\xf4q\xb2\xf2\xcc\x03W\xa9\x1b\x09\
-\xcdB]\x8ewo\xddY\x00\x00\x00\x00[%\xf4\xe9\
-\x9eu\x15\xa1Yi-\x8fO\xe9r|y\xeb\x0e\x03\
-\x00\x00\x008Q!\xc7W\xaf^t\xf5}u\x15\xa1\
-Y\xaa\xeb\xe3\xd9\xad;\x0d\x00\x00\x00\xe0D\x85\x9c\x1e\
-\x5cW\x10\x9a\xb5\xf6n\x9cq\xcd.\xc7\xbfk\xddq\
-\x00\x00\x00\x00'\xe0\xad\xdd\xc5\xf1\x1b\xea\x0aB\xb3X\
-7M\x8fh\xdcq\x00\x00\x00\x00' >\xba\xae\x1e\
-4\xab\xed\xedG\xd7\xe9r|o\xfb\x0e\x04\x00\x00\x00\
-8V\xf1\xfd\xc3\x9f\xd7\xab\xab\x07\xcdr\xc3\x1d\xf5\xa4\
-\xcb\xdey\x00\x00\x00\x00\xc7)\xa7'\xd7\x95\x83f\xbd\
-\xd5I\xfc\xa1\xd0\xa7\xffh\xde\x91\x00\x00\x00\x00G-\
-~rm:\xbei]9h\x1e\x0a}|n\xfb\xce\
-\x04\x00\x00\x008:\xa1O\xcf\xaf\xab\x06\xcdKa\x92\
-~\xb2ug\x02\x00\x00\x00\x1c\xad\xd5\x1co_W\x0d\
-\x9a\x9b^w\x9d\xaf\x0a9^\xd8\xbaC\x01\x00\x00\x00\
-\xaeH\xc8q}e\xfd\xcc\xaf\xa9\x9b\x06\xcdS!\xa7\
-{\xb4\xeeT\x00\x00\x00\x80+\x12\xfat\xcf\xbab\xd0\
-\xbc\xb5\xda\xef\xbb\xfap\x07\xfeU\xeb\x8e\x05\x00\x00\x00\
-8\x92\xd0\xa7W\xad^t\xf5}u\xc5\xa0y,\xf4\
-\xa3_n\xdd\xb9\x00\x00\x00\x00G\x12rzp]-\
-h^\xdb{\xf0\xc0UC\x8e\x1fk\xdd\xc1\x00\x00\x00\
-\x00\x9b\x95=B\xd9'\xd4\xd5\x82\xe6\xb9\xe1\xce\xfc\x8d\
-\xd6\x9d\x0c\x00\x00\x00\xb0Y\xd9#\xd4\x95\x82\xe6\xbd\xee\
-\xe2\xf8\x0d]\x1f\xdf\xd8\xba\xa3\x01\x00\x00\x00.\x15\xdf\
-X\xf6\x08u\xa5\xa0E(L\xd2\xaf\xb5\xefl\x00\x00\
-\x00\x80K\x94\xfdA]%hQZ\xcb\xe33C\x9f\
-^\xd7\xba\xc3\x01\x00\x00\x00\xca\xde\xa0\xec\x0f\xea*A\
-\x8bT\xe8\xc7~\x13\x19\x00\x00\x00\xd0T\xf6\x06u\x85\
-\xa0Ek\xefd\xdf5\xc2$\xbe\xa6u\xc7\x03\x00\x00\
-\x00\xcb\xab\xec\x0b\xca\xde\xa0\xae\x10\xb4\x88u}<\xbb\
-u\xe7\x03\x00\x00\x00\xcb,\x9e]W\x07Z\xd4NZ\
-O\xe3\xd0\xa7\xbfj?\x00\x00\x00\x00\x80eS\xf6\x04\
-e_PW\x07Z\xe4\xbaI\xba\x7f\xebA\x00\x00\x00\
-\x00,\xa1I\xba\x7f]\x19h\xd1\xdbs\xf0\xc0\xfe.\
-\xc7\x977\x1f\x08\x00\x00\x00\xc0\xf2\xc8\xf1\xe5eOP\
-W\x06Z\x86V'\xf1\xde\xcd\x07\x03\x00\x00\x00\xb04\
-\xca~\xa0\xae\x0a\xb4,\x85\xf5\xfd\xa7u9^\xdcz\
-@\x00\x00\x00\x00K \xc7\x8b\xcb~\xa0\xae\x0a\xb4L\
-\x85>\xdd\xb3\xf9\xa0\x00\x00\x00\x00\x16^\xd9\x0b\xd4\x15\
-\x81\x96\xad\xbd\x17\x9cqr\xc8\xa9o=0\x00\x00\x00\
-\x80\xc5U\xf6\x01e/PW\x04Z\xc6B?\xfa\xd9\
-\xd6\x83\x03\x00\x00\x00X\x5ce\x1fPW\x03Z\xd6N\
-}\xf1\xa9]\xc8q\xbd\xf5\x00\x01\x00\x00\x00\x16O\xd9\
-\x03\x94}@]\x0dh\x99\xeb\xfax\xd7\xd6\x83\x04\x00\
-\x00\x00XD\xf1\xaeu%\xa0\xa5\xefU\xe3\x93BN\
-\xe7\xb7\x1f(\x00\x00\x00\xc0\xa2(\xf3\x7f\xd9\x03\xd4\x8d\
-\x80\xb4\xb2\xd2\xad\xa7;\xb5\x1e,\x00\x00\x00\xc0\x02\x19\
-\xe6\xff\xba\x0a\x90j\xaf\xbb\xceWu9\xfey\xf3\x01\
-\x03\x00\x00\x00\xcc\xbfa\xee/\xf3\x7f\xdd\x04H\x97\xb6\
-\xda\xc7;4\x1f4\x00\x00\x00\xc0\xdc+s\x7f]\x01\
-H\x9b:g\xe5J\xdd4\x9d\xd7z\xe0\x00\x00\x00\x00\
-sl\x98\xf7\xcb\xdc_7\x00\xd2\xe1\x85>\xdd\xb6\xcb\
-\xe9\xf3\xcd\x07\x10\x00\x00\x000\x7f\x869\xbf\xcc\xfbu\
-\xf4\x97\x8e\xdc\xf0@y~\xf3A\x04\x00\x00\x00\xcc\x9d\
-2\xe7\xd7\x91_\xba\xfc\xc2\xfa\xe8{[\x0f\x22\x00\x00\
-\x00`\x0e\xad\xa7\xeb\xd7\x91_\xba\xe2\x86\x07\xcd\x93\x0f\
-{\x10\x01\x00\x00\x00\xf3\xe6\xc9u\xd4\x97\x8e\xae.\xc7\
-\x1b\x86\x1c\xdf\xd9x0\x01\x00\x00\x00s\xe0\xd0\x5c?\
-\xcc\xf7u\xd4\x97\x8e\xbe\xe1\xc1sN\xebA\x05\x00\x00\
-\x00\xcc\xbe2\xd7\xd7\x11_:\xb6\xf6\xf6g|m\x97\
-\xd3+Z\x0f,\x00\x00\x00`\xa6\xbd\xa2\xcc\xf5u\xc4\
-\x97\x8e\xbd\xd0\xa7\x9fo<\xb0\x00\x00\x00\x80\x19V\xe6\
-\xf9:\xdaK\xc7\xd9\xb9\xe3\x93\xbai:\xaf\xf5\x00\x03\
-\x00\x00\x00f\xd00\xc7\x97y\xbeN\xf6\xd2\xf1\xd7\xf5\
-\xf1\x96!\xc7\x8f5\x1fh\x00\x00\x00\xc0\xcc\xb8d~\
-\x8f\xb7\xac#\xbdt\xe2\x85>\xfe^\xeb\xc1\x06\x00\x00\
-\x00\xcc\x8e2\xbf\xd7Q^\xda\x9a\xd6\xd6\xc7\xd7\xedr\
-zk\xeb\x01\x07\x00\x00\x00\xcc\x84\xb7\x96\xf9\xbd\x8e\xf2\
-\xd2\xd6\x15\xfa\xf4\xab\x8d\x07\x1c\x00\x00\x000\x03\xca\xdc\
-^Gxik;i=\x8d\xbb>\xbe\xb4\xf5\xc0\x03\
-\x00\x00\x00vS|i\x99\xdb\xeb\x08/m}\xc3\x83\
-\xecn\xed\x07\x1f\x00\x00\x00\xb0kr\xbc{\x1d\xdd\xa5\
-m\xea\xbc\x95\xaf\x0c}|^\xf3\x01\x08\x00\x00\x00\xec\
-\xb82\xa7\x97y\xbdN\xee\xd2\xf6\xb5\x96\xc77\x1b\x1e\
-t\x1f\xda\xfc \x04\x00\x00\x00v\xdc\x87\xca\x9c^G\
-vi\xfb\x0b}z\x5c\xe3\x81\x08\x00\x00\x00\xec\xa0\x90\
-\xd3\xef\xd6Q]\xda\x99\xf6\xe4t\xed\xae\x8foj=\
- \x01\x00\x00\x80\x9d\x10\xdfT\xe6\xf3:\xaaK;W\
-\x97\xe3\x83\xda\x0fJ\x00\x00\x00`\xdb\x0dsy\x1d\xd1\
-\xa5\x9dm\xb5\xdfw\xf5\xd0\xa7\xdc|`\x02\x00\x00\x00\
-\xdb&\xe4\xd4\xaf\xbe\xe4\xea\xfb\xea\x88.\xed|ky\
-\xfc\xd3\xc3\x83\xf1\xf3\x9b\x1f\x9c\x00\x00\x00\xc0\xb6\xf9|\
-\x99\xc7\xebh.\xed^!\xa7g5\x1e\xa0\x00\x00\x00\
-\xc06(sx\x1d\xc9\xa5\xddm\xb5O?\xd8\xf5\xf1\
-_Z\x0fT\x00\x00\x00`+\xc5\x7f)sx\x1d\xc9\
-\xa5\xddoxP>\xba\xfd`\x05\x00\x00\x00\xb6N|\
-t\x1d\xc5\xa5\xd9(\xac\xef?+\xf4\xe9u\xed\x07,\
-\x00\x00\x00p\xa2\xca\xdc]\xe6\xef:\x8aK\xb3S\x98\
-\x8c\x7f\xae\xf5\xa0\x05\x00\x00\x00N\x5c\x99\xbb\xeb\x08.\
-\xcdV\xa7\xac\x9f\xb26<H\xcf\xdd\xfc\xa0\x05\x00\x00\
-\x00N\xd8\xb9e\xee\xae#\xb84{\xad\xe5\xd1\x0f\x87\
->\xfds\xe3\xc1\x0b\x00\x00\x00\x1c\x872g\x97y\xbb\
-\x8e\xde\xd2\xec\x16\xfa\xf8\xd0\xd6\x83\x18\x00\x00\x008v\
-e\xce\xae#\xb74\xdb\xed\x99\x9c1\x1a\x1e\xb0\x17\xb4\
-\x1e\xc8\x00\x00\x00\xc0\xd1+\xf3u\x99\xb3\xeb\xc8-\xcd\
-~a}|\x9b\x90\xd3GZ\x0fh\x00\x00\x00\xe0\x8a\
-\x95\xb9\xba\xcc\xd7u\xd4\x96\xe6\xa7\xae\x8f\x8fi=\xa8\
-\x01\x00\x00\x80\xa3\x11\x1fSGli\xbeZ\xcb\xe33\
-\x87\x07\xf0\xc1\xf6\x03\x1b\x00\x00\x008\xb2x\xb0\xcc\xd5\
-u\xc4\x96\xe6\xaf\xe1\x81|\xa7.\xc7O\x1d\xfe\xe0\x06\
-\x00\x00\x00\x9a.\x99\xa3\xefTGki~\x0b}z\
-\xd2a\x0fp\x00\x00\x00\xa0\xa9\xcc\xd1u\xa4\x96\xe6\xbb\
-=9];\xf4\xf1\xb5\xad\x07:\x00\x00\x00p\xa92\
-?\x979\xba\x8e\xd4\xd2\xfc\x17\xfat\xcf\xd6\x83\x1d\x00\
-\x00\x00\xb8T\x99\x9f\xeb(--H\xe7\xad|\xe5\xf0\
-\xc0\xfe\xa3\xd6\x03\x1e\x00\x00\x008\xb4\x10\xfa\xa32?\
-\xd7IZZ\x9cB?\xfa\x9e.\xa7\xb7\xb6\x1e\xf8\x00\
-\x00\x00\xb0\xd4\x86y\xb9\xcc\xcdu\x84\x96\x16\xaf\xae\x8f\
-g7\x1f\xfc\x00\x00\x00\xb0\xd4\xe2\xd9ut\x96\x16\xb3\
-S\xd6\xcf\x5c\x1b\x1e\xec\xe7\x1e\xfe\xe0\x07\x00\x00\x80\xa5\
-un\x99\x97\xeb\xe8,-nk\xfd\xe8&!\xa7w\
-7\x9e\x04\x00\x00\x00\xb0T\xca|\x5c\xe6\xe4:2K\
-\x8b_\xe8\xe3C[O\x06\x00\x00\x00X&e>\xae\
-\xa3\xb2\xb4\x1c\x9d4==\x86\x1c/l=!\x00\x00\
-\x00`\x19\x94\xb9\xb8\xcc\xc7uT\x96\x96\xa7\xd0\x8fo\
-\x13r\xfaH\xeb\x89\x01\x00\x00\x00\x8b\xac\xcc\xc3e.\
-\xae#\xb2\xb4|u}|L\xeb\xc9\x01\x00\x00\x00\x8b\
-->\xa6\x8e\xc6\xd2r\xd6M\xd3\xb5\xba\x1c_\xd6~\
-\x82\x00\x00\x00\xc0\x02*s\xf00\x0f\xd7\xd1XZ\xde\
-\x86'\xc4\x9d\x86'\xc4\xa7\x0e{\x92\x00\x00\x00\xc0\xa2\
-\xb9d\xfe\xbdS\x1d\x89%u9\xfd\xdf\xc3\x9e(\x00\
-\x00\x00\xb0h\x86\xf9\xb7\x8e\xc2\x92J\xe1\xfc\xd1\xd5\xba\
->\xbe\xb7\xf9\x84\x01\x00\x00\x80\x85\x10\xdf\xbb\xf7\xe0\x81\
-\xab\xd6QX\xd2\x97Z\xcb\xe3\x9f\x0e9~\xbc\xfd\xc4\
-\x01\x00\x00\x80\xf9U\xe6\xdd2\xf7\xd6\x11X\xd2\xe6\xba\
-\x1c\x1f\xd5z\xf2\x00\x00\x00\xc0\x5c\x1b\xe6\xdd:\xfaJ\
-ju\xd2z\x1a\x87>\xbd\xa4\xf9\x04\x02\x00\x00\x809\
-T\xe6\xdc2\xef\xd6\xd1W\xd2\x91Z\x9b\x8eo\x1a\xfa\
-\xf8\xce\xd6\x13\x09\x00\x00\x00\xe6I\x99o\xcb\x9c[G\
-^IWT\xd7\xc7\xb3[O&\x00\x00\x00\x98/\xf1\
-\xec:\xeaJ:\xaa\xce\x1d\x9f\x14&\xe9\x8f\xdaO(\
-\x00\x00\x00\x98}e\xae-\xf3m\x9dt%\x1dmk\
-\x17\xee\xff\xae\xd0\xc7\xd7\xb4\x9eX\x00\x00\x000\xcb\xca\
-<[\xe6\xda:\xe2J:\xd6\xba>\xde5\xe4\xf4\x9f\
-\xad'\x18\x00\x00\x00\xcc\xa2K\xe6\xd8x\xd7:\xdaJ\
-:\xde\x86'\xd3o\xb7\x9ed\x00\x00\x000\x8b\xca\x1c\
-[GZI'\xd2\xde\xc9\xbek\x84\x1c/l=\xd1\
-\x00\x00\x00`\x96\x94\xf9\xb5\xcc\xb1u\xa4\x95t\xa2u\
-\x93t\x8b\xd0\xa7\x7fn=\xe1\x00\x00\x00`\x16\x1c\x9a\
-[\x87\xf9\xb5\x8e\xb2\x92\xb6\xaa\xd0\x8f\x7f\xb9\xf5\xa4\x03\
-\x00\x00\x80YP\xe6\xd6:\xc2J\xda\xcaN;xZ\
-\x08}\xfc\xe3\xd6\x13\x0f\x00\x00\x00vS\x99W\xcb\xdc\
-ZGXI[\xdd\xf0D\xbb^\xe8\xd3\xeb6?\xf9\
-\x00\x00\x00`\xb7\xd49\xf5zut\x95\xb4]u9\
-\xfeL\xd7\xc7Om~\x12\x02\x00\x00\xc0\xce\x1b\xe6\xd3\
-aN\xad#\xab\xa4\xed.\xe4\xf8\xf8\xf6\x93\x11\x00\x00\
-\x00vN\x99O\xeb\xa8*i'Z\xcb\xe33CN\
-}\xeb\x09\x09\x00\x00\x00;\xa1\xcc\xa5e>\xad\xa3\xaa\
-\xa4\x9d*LF\xb7\xeer\xfc\x97\xd6\x13\x13\x00\x00\x00\
-\xb6\xd50\x8f\x96\xb9\xb4\x8e\xa8\x92v\xba0I\xbf\xd6\
-|r\x02\x00\x00\xc06*\xf3h\x1dM%\xedF{\
-\x0f\x1e\xb8j\xe8\xe3\xf3ZOP\x00\x00\x00\xd8\x0ee\
-\x0e-\xf3h\x1dM%\xedV\xa1\x1f}O\xd7\xc77\
-\xb6\x9e\xa8\x00\x00\x00\xb0\xb5\xe2\x1b\xcb\x1cZGRI\
-\xbb]\xe8\xd3m\xdbOV\x00\x00\x00\xd8:e\xfe\xac\
-\xa3\xa8\xa4Y\xa9\x9b\xa6\xc7\xb6\x9e\xb0\x00\x00\x00\xb0%\
-\x86\xb9\xb3\x8e\xa0\x92f\xa9=\x933F\xc3\x93\xf4O\
-\x0f{\xd2\x02\x00\x00\xc0\x89\xfb\xd32w\xd6\x11T\xd2\
-\xac5<I\xaf\x17\xfa\xf4\xaaMO\x5c\x00\x00\x008\
-nu\xce\xbc^\x1d=%\xcdj\xab\x93x\xbb.\xc7\
-\x7f\xd9\xfc$\x06\x00\x00\x80c6\xcc\x97e\xce\xac#\
-\xa7\xa4Yox\xd2>\xa8\xf9d\x06\x00\x00\x80c1\
-\xcc\x97u\xd4\x944\x17\x9d\xb7\xf2\x95\xa1\x8f\xbf\xd7|\
-B\x03\x00\x00\xc0Q(se\x99/\xeb\xa4)i^\
-\xda{\xc1\x19\xd7\x1c\x9e\xc4/\xde\xfc\xa4\x06\x00\x00\x80\
-\xa3\xf0\xe22W\xd6\x11S\xd2\xbc\xb5:I7\x1a\x9e\
-\xc8\xaf\xdf\xf4\xc4\x06\x00\x00\x80\xcb\xf3\xfa2O\xd6\xd1\
-R\xd2\xbc\xd6\xe5t\x97\xd0\xc7\x7fk<\xc9\x01\x00\x00\
-\xe02\x0e\xcd\x8f\xc3\x1cYGJI\xf3\xde\xf0\xa4\xfe\
-\xf5\xd6\x93\x1d\x00\x00\x00\xbe\x5c\x99\x1f\xeb()i\x11\
-:\xed\xe0i\xa1\xcb\xf1i\xad'<\x00\x00\x00\x1c2\
-\xcc\x8de~\xac\xa3\xa4\xa4E)\x5c\xb4\xff\xac\x90S\
-\xdf|\xe2\x03\x00\x00\xb0\xd4\xca\xbcX\xe6\xc6:BJ\
-Z\xb4\xd66\xc67\x1b\x9e\xeco\xdb\xfc\xe4\x07\x00\x00\
-`\xa9\xbd\xad\xcc\x8but\x94\xb4\xa8\x85>\xddsx\
-\xc2\xff\xd7\xa6\x0b\x00\x00\x00\x00\xcb\xe9\xbf\xca\x9cXG\
-FI\x8b^\x97\xe3#\x1b\x17\x02\x00\x00\x00\x96\xcd0\
-\x1f\xd6QQ\xd22\x14\xd6\xf7\x9f\x16r|N\xf3\x82\
-\x00\x00\x00\xc0R(sa\x99\x0f\xeb\xa8(iY\xda\
-\xdb\x8f\xae\xd3\xe5\xf8\xf2\xd6\x85\x01\x00\x00\x80\x057\xcc\
-\x83e.\xac#\xa2\xa4e+\xf4\xe3\xdb\x84\x9c\xfe\xb9\
-y\x81\x00\x00\x00`!\x959\xb0\xcc\x83u4\x94\xb4\
-\xacu\xd3t\xff.\xa7/\xb4.\x14\x00\x00\x00,\x98\
-2\xff\x0ds`\x1d\x09%-{!\xc7\xc77/\x16\
-\x00\x00\x00,\x942\xff\xd5QP\x92VV\xae\x92\xe3\
-\xe9]\x1f_\xd8\xba`\x00\x00\x00\xb0(\xe2\x0b\xcb\xfc\
-WGAI\xba\xa4\x93\xd6\xd3x\xb8@|\xa0}\xe1\
-\x00\x00\x00`\xbe\xc5\x0f\x94\xb9\xaf\x8e\x80\x92t\xd9B\
-N?\x11\xfa\xf8\x8e\xf6\x05\x04\x00\x00\x80yT\xe6\xbc\
-2\xef\xd5\xd1O\x92\xda\x0d\x17\x8a{\x84\x1c?\xda\xba\
-\x90\x00\x00\x000_\xca|W\xe6\xbc:\xf2I\xd2\xe5\
-7\x5c0\x1e\xdc\xba\x98\x00\x00\x000_\xc24=\xb8\
-\x8ez\x92t\x14}q\xe5+\xbaizl\xeb\x82\x02\
-\x00\x00\xc0|\x089\xfdv\x99\xef\xea\xa4'IGW\
-\xb7\x11O\xedr|z\xeb\xc2\x02\x00\x00\xc0\x8c\xcb\xe9\
-\xe9e\xae\xab#\x9e$\x1d[\xdd4]\xab\xcb\xf1\xcf\
-\x9b\x17\x18\x00\x00\x00fS\x99\xe3.\x8c__G;\
-I:\xbe\xba\xf5t\xfd\xae\x8f/k^h\x00\x00\x00\
-\x981\xc3\xfc6M\xd7\xaf#\x9d$\x9dX\xc3\x05\xe5\
-\xe6]\x8e\x7f\xdf\xbe\xe0\x00\x00\x000\x13\xca\xdc6\xcc\
-ou\x94\x93\xa4\xadi\xb8\xc0\xdci\xb8\xc0\xbc\xef\xb0\
-\x8b\x0e\x00\x00\x00\xbb\xef\x92y\xedNu\x84\x93\xa4\xad\
-\xad\x9b\xa4\xfb\x0f\x17\x9aO\x1dv\xf1\x01\x00\x00`\xf7\
-\x949m\x98\xd7\xea\xe8&I\xdb\xd3p\xa1yx\xf3\
-\x22\x04\x00\x00\xc0nyx\x1d\xd9$i\xfb\xda\xd7\xef\
-[\x1d.8O\xdat\x01\x02\x00\x00`w<\xa9\xcc\
-iud\x93\xa4\xed\xed*9\x9e\x1erz~\xe3b\
-\x04\x00\x00\xc0\x0e)sY\x99\xcf\xea\xa8&I;\xd3\
-\x9e\x9c\xae\x1dr\xcc\xad\x0b\x13\x00\x00\x00\xdb\xab\xccc\
-e.\xab#\x9a$\xedl\xab9\xdd8\xf4\xf1\xb5\xad\
-\x0b\x14\x00\x00\x00\xdb\xa3\xcca\xab\x17\xa5\x1b\xd7\xd1L\
-\x92v\xa7\xd0\xa7\xdb\x86\x1c\xff\xb1u\xa1\x02\x00\x00`\
-k\x95\xf9\xab\xccau$\x93\xa4\xddm\xb8 \xfd\xfc\
-pa\xfaX\xeb\x82\x05\x00\x00\xc0\xd6(sW\x99\xbf\
-\xea(&I\xb3Q\xc8\xe9WZ\x17-\x00\x00\x00\xb6\
-F\x99\xbb\xea\x08&I3\xd49+W\x0a}\xfa\x9d\
-\xd6\x85\x0b\x00\x00\x80\x13S\xe6\xad2w\xd5\x09L\x92\
-f\xabppt\xb5\xe1B\xf5\x8c\xd6\x05\x0c\x00\x00\x80\
-\xe3S\xe6\xac2o\xd5\xd1K\x92f\xb3\xd3\x0e\x9e\x16\
-\xba\x9c\xde\xd0\xba\x90\x01\x00\x00plBN\x7fS\xe6\
-\xac:rI\xd2l\xb7\xb7\x1f]'\xf4\xf1\xc2\xd6\x05\
-\x0d\x00\x00\x80\xa3\x13r\xbc\xb0\xccWu\xd4\x92\xa4\xf9\
-\xa8\x9b\xc4\x1b\x0c\x17\xb1\x8d\xcd\x175\x00\x00\x00\x8e\xca\
-F\x99\xab\xea\x88%I\xf3U\x98\x8e\x7f\xa0\xcb\xf1\xe5\
-\x8d\x8b\x1b\x00\x00\x00G2\xccQe\x9e\xaa\xa3\x95$\
-\xcdgky\xf4\xc3!\xc7\xbfn^\xe8\x00\x00\x00\xb8\
-\x8c2?\x959\xaa\x8eT\x924\xdfu\xd3t\x8b\x90\
-\xd3\xeb[\x17<\x00\x00\x00.qhn\x9a\xa4[\xd4\
-QJ\x92\x16\xa3\xd0\x8fo\xd3\xf5\xf1\xcd\xad\x0b\x1f\x00\
-\x00\x00\xf1\xcden\xaa#\x94$-V\xab9\xde>\
-\xe4\xf8\xf6\xf6\x05\x10\x00\x00`9\x959\xa9\xccKu\
-t\x92\xa4\xc5\xac\xcb\xe9.\xa1O\xff\xdc\xba\x10\x02\x00\
-\x00,\x9bC\xf3\xd14\xdd\xb9\x8eL\x92\xb4\xd8\x85\xc9\
-\xf8\xe7\xba>\xbe\xbfuA\x04\x00\x00X\x1e\xf1\xfde\
->\xaa\xa3\x92$-G\xa1\x8f\xf7\x0a9}\xa4}a\
-\x04\x00\x00Xle\x1e*sQ\x1d\x91$i\xb9\xea\
-rz@\xe8\xd3\xbf\xb7.\x90\x00\x00\x00\x8b\xea\xd0\x1c\
-4\xccCu4\x92\xa4\xe5,\xf4\xa3_\xee\xfa\xf8\xe9\
-\xd6\x85\x12\x00\x00`\xf1\xc4O\x979\xa8\x8eD\x92\xb4\
-\xdc\x85>\xfez\xfbb\x09\x00\x00\xb0X\xca\xfcSG\
-!IR\xa9\xcb\xe9\x11\xad\x0b&\x00\x00\xc0\xc2\x18\xe6\
-\x9e:\x02I\x92\xfe\xa7\xf3\xce\xfa\xea\xae\x8f\x8fi^\
-8\x01\x00\x00\xe6^|L\x99{\xea\x04$I\xfa\xf2\
-N;xZ\x089>\xbe}\x01\x05\x00\x00\x98Oe\
-\xce)\xf3N\x1d}$I\xad\xd6\xf2\xf8\x94.\xa7\xdf\
-o]H\x01\x00\x00\xe6\xce0\xdf\x949\xa7\x8e<\x92\
-\xa4\xcbk\xcf\x05\x07\xf6w9>\xadyA\x05\x00\x00\
-\x98\x17\xc3\x5cS\xe6\x9b:\xeaH\x92\x8e\xa6\x937F\
-g\x84>\xfeq\xf3\xc2\x0a\x00\x000\xe3\xca<S\xe6\
-\x9a:\xe2H\x92\x8e\xa5\xf2\xbf\xb9\x1d.\xa6\xaf\xd8|\
-q\x05\x00\x00\x98q\xaf\xf03\x84$\xe9\x04\xeb\xa6\xe9\
-Z\xfe\x8b!\x00\x00`^\x84\x1c\x9f]\xe6\x98:\xd2\
-H\x92N\xa4\xab^\xb0\xff\x80\x9f1\x04\x00\x00\xcc\xbc\
-\x1c\x9f~\xd5\x8b\xf7\x1f\xa8\xa3\x8c$i+\xdas\xb0\
-\xfc\xf0i\xbf\x95\x0c\x00\x00\x98Y\x7f\xb0gr\xc6\xa8\
-\x8e0\x92\xa4\xad\xac\xfc\x1a\xc7\x90\xe3\xe3\x1b\x17_\x00\
-\x00\x80]\x13\xfa\xf8\x84n#\x9eZG\x17I\xd2v\
-\xb4\xaf\xdf\xb7\xdaM\xe2cZ\x17b\x00\x00\x80\x1d7\
-M\x8f=\xf5\xc5\xa7vud\x91$mk\xaf\xbb\xce\
-W\x0d\x17\xdf\x87\x0f>\x7f\x99\x8b1\x00\x00\xc0N\xca\
-\xe97W\xd6\xcf\xfc\x9a:\xa9H\x92v\xaa\x90\xe3C\
-\xba\x1c?\xd5\xbc8\x03\x00\x00l\x97\x1c\xff;\xf4\xf1\
-\xa1\xc3X\xf2\x15\x97L'\x92\xa4\x1do\xb8\x18?(\
-\xe4\xf8\xf1\xe6\x85\x1a\x00\x00`\x8b\x85\x9c\xfes\xf0\xe0\
-:\x92H\x92v\xb3n\x92\xee7\x5c\x9c?\xb4\xf9b\
-\x0d\x00\x00\xb0\x95B\x8e\x1f\x1d\xfe\xfc\xdfu\x14\x91$\
-\xcdB\xa1O\xf7\xec\xfa\xf8\xde\xcd\x17m\x00\x00\x80-\
-\xf2\x81\xd5I\xbcw\x1dA$I\xb3T\x97\xe3\xddC\
-\x8e\xff\xd8\xb8x\x03\x00\x00\x1c\xb7\x90\xd3\xbb\x07\xf7\xa8\
-\xa3\x87$i\x16[\xcb\xe3;v9\xbd\xb5u!\x07\
-\x00\x008V\xa1\x8f\xef\xe8\xfax\xd7:rH\x92f\
-\xb9\xd0\xa7\xdb\x0e\x17\xed7\xb6.\xe8\x00\x00\x00\xc7\xe0\
--k}\xbcC\x1d5$I\xf3P\xd7\xc7[\x86>\
-\xbe\xa6qQ\x07\x00\x00\xb8b9\xbd!L\xd3\x8f\xd7\
-\x11C\x924O\xadMF7\x1d.\xe4\xafh^\xe0\
-\x01\x00\x00\x8e\xe0\xd0\xbf`\xce\xf1G\xebh!I\x9a\
-\xc7V7\xd2\x8d\x86\x8b\xfaE\x9b/\xf2\x00\x00\x00M\
-9\xbdb\xad\x1f\xdd\xa4\x8e\x14\x92\xa4y\xae\xcb\xf1\x86\
-!\xc7\xf5\xe6\x05\x1f\x00\x00\xe0Kr\xbcxu\x92n\
-TG\x09I\xd2\x22\xb4\xb7\x1f]g\xb8\xc8\xbf\xe8\xb0\
-\x8b>\x00\x00\xc0 L\xe2\xa4\xfc\x0b\xe5:BH\x92\
-\x16\xa9\xd3\x0e\x9e\x16\x86\x8b\xbd\x9f1\x04\x00\x00\x5cV\
-\x8e\x7f\xbf\xe7\x82\x03\xfb\xeb\xe8 IZ\xc4\xd6\xd6O\
-\xff\xba\xe1\x82\xff\x94\xe6\x0b\x01\x00\x00\xb0tBN\xcf\
-\x0a\xeb\xfb\xcf\xaa#\x83$i\x91\xdb{\xf0\xc0U\xbb\
->>zx\x01\xf8\xfc\xe6\x17\x04\x00\x00`y\x84\x1c\
-\x1f\xef\xbf\x10\x92\xa4%\xac\xcb\xf1A]N\x1fn\xbd\
-8\x00\x00\x00\x8b+\xf4\xe9\xdfC\x1f\x7f}\xe5u\xd7\
-\xf9\xaa:\x1eH\x92\x96\xad.\xc7\x9f\x099\xfdC\xeb\
-\x85\x02\x00\x00X<\xc3\xf9\xff\x9fC\x8e\xbfXG\x02\
-I\xd22\x17\xf2\xe8\xc7B\x9f^\xd5z\xc1\x00\x00\x00\
-\x16G\xc8\xe9\xf5\xab9\xde\xbe\x8e\x02\x92$\xad\xac\x84\
-~\xfc\xfd\xa1\x8f\x17\xb4^8\x00\x00\x80\x85\xb0\xb1\x96\
-G?\x5cG\x00I\x92.mur\xfa7\x87\x1c\x9f\
-\xddx\xf1\x00\x00\x00\xe6\xdb\xb9{\xfb\xd1u\xea\xd1_\
-\x92\xa4\xc3\xdb39c\x14\xfa\xf8\x84\xc6\x8b\x08\x00\x00\
-0\x8frz\xf2\xde\xc9\xbek\xd4#\xbf$I\x97\xd3\
-\xfa\x99_\x13\xfa\xf8\xd0\xd0\xa7\xffh\xbe\xa8\x00\x00\x00\
-\xb3/\xa7\xcf\x0e\x7f\xfe\xd6)\xeb\xa7\xac\xd5\x93\xbe$\
-IG\xd7\xea$\xde;\xe4\xf4\xee\xc3^\x5c\x00\x00\x80\
-Y\xf7\xc1\xae\x8fg\xd7\xa3\xbd$I\xc7\xdeZ\x1f\xef\
-\xd0\xe5\xf4\x86\xc6\x8b\x0c\x00\x000\x8brzk7\x89\
-w\xabGzI\x92\x8e\xbf\xb5~t\x93\xe1\xc5\xe5\xa2\
-\xc3^l\x00\x00\x80\xd9\x92\xd3+\xbb>\xde\xb2\x1e\xe5\
-%I:\xf1\xd6\xa6\xfb\xbfkx\x819\xaf\xf9\xc2\x03\
-\x00\x00\xec\xba\xd0\xa7\x97\x84~\xf4=\xf5\x08/I\xd2\
-\xd6\xb5\xf7\x823\xae\xd9\xe5\xf8\x87\xad\x17 \x00\x00`\
-\xf7\x84\x9c\x9e\x19\xa6\xfb\xbf\xa9\x1e\xdd%I\xda\xfaN\
-\xde\xb8\xe6\xde.\xc7G\x0d/<\x9f\xdb\xfcB\x04\x00\
-\x00\xec\xbc\x90\xd3\xef\xae\xbe\xe4\xea\xfb\xea\x91]\x92\xa4\
-\xed\xad\x9b\xc6\x07v9}\xa8\xf5\xa2\x04\x00\x00l\xbf\
-\xd0\xa7O\x84\x1c\x1f\xb2rp\xe5\xca\xf5\x98.I\xd2\
-\xce\xd4\xe5x\xf7\xe1\xc5\xe8m\x9b_\x9c\x00\x00\x80\xed\
-\x15rzW\x98\xc6_\xa8GsI\x92v\xbe0\x19\
-\xdd:\xf4\xe9\xafZ/T\x00\x00\xc0\xd6\x1b\xce\xdf\xaf\
-[\x9d\xc4\xdb\xd5#\xb9$I\xbbW\x97\xe3\x0d\x07/\
-h\xbd`\x01\x00\x00[\xa7\xfc\x86\xb1\xd5\x9cn\x5c\x8f\
-\xe2\x92$\xed~'\xad\xa7\xf1\xf0\x02\xf5\xb8.\xa7\xcf\
-\xb7^\xbc\x00\x00\x80\x13\x13&\xe9I{7\xce\xb8f\
-=\x82K\x924[\x0d/V\xf7\x0b9\xfd\xd3\xe6\x17\
-0\x00\x00\xe0x\xc5\x7f\xe9r|\x90\x1f(-I\x9a\
-\xf9B\x1e\xfd\xd8\xf0\xa2\xf5\xb2\xf6\x0b\x1a\x00\x00p\xb4\
-BN\xaf\x0a\xd3\xf4\x93\xf5\xa8-I\xd2\xec\xb7w#\
-~G\xc8\xf1\xd9\xad\x176\x00\x00\xe0(\xe4\xf4'\xc3\
-\x9f\xd7\xabGlI\x92\xe6\xa7n#\x9e:\xbc\x88\xfd\
-V\xc8\xe9?/\xf3\xe2\x06\x00\x00\x1cY\x8e\x9f\xe9\xfa\
-\xf8\x98=\x07\x0f\xec\xafGkI\x92\xe6\xb30M\xf7\
-\xe8rzk\xf3\x05\x0f\x00\x00\xf8\x1f!\xc7\xb7\x87>\
-\xde\xab\x1e\xa5%I\x9a\xff\xd6\xa6\xe3\x9b\x0e/p\xb9\
-\xf5\xc2\x07\x00\x00\x1c\xb2\xd1M\xd3-\xea\x11Z\x92\xa4\
-\xc5)L\xf7\x7fS\x97\xe3S\x1a/~\x00\x00\xb0\xd4\
-B\x9f\x9e\xb1z\xe1\xf8[\xeb\xd1Y\x92\xa4\xc5k_\
-\xbfo5\xe4\xf8\x90\xe1\x85\xef\xc3\x9b_\x08\x01\x00`\
-\xd9\x84>~4L\xe3o\x9c\xb2~\xcaZ=2K\
-\x92\xb4\xd8u\x93t\xe7\xd0\xa7\xbfm\xbd0\x02\x00\xc0\
-r\x88o\xec&\xf1n\xf5\x88,I\xd2\xf2\x14\xfa\xf1\
-\xf7\x0f/\x86/:\xfc\xc5\x11\x00\x00\x16[\xe8\xd3K\
-Vs\xbaq=\x1aK\x92\xb4|\xed\x9d\xec\xbbF\xc8\
-\xf1\xff\xb4^(\x01\x00`\x11\x85Iz\xd2\xde\x8d3\
-\xaeY\x8f\xc4\x92$-q\xe7\xac\x5c\xa9\xeb\xe3\xd9]\
-\x8e\xefm\xbdh\x02\x00\xc0b\x88\xff2\x9cy\x1f\xb4\
-rp\xe5\xca\xf5$,I\x92J\xa1O\xb7\xed\xa6\xe9\
-\x95\xed\x17P\x00\x00\x98_!\xa7W\x85i\xfa\xc9z\
-\xf4\x95$I\x9b[\xcb\xe3\xef\x0e}z~\xeb\x85\x14\
-\x00\x00\xe6RN\x7f2\xfcy\xbdz\xe4\x95$IG\
-j\xcf\x05\xa7\xed\xef\xfa\xf8\x98\xc1\xa7\x0f{A\x05\x00\
-\x80y\x91\xe3g\xca\xb9v\xcf\xc1\x03\xfb\xebQW\x92\
-$\x1dM\xe5\x7fN\x16r\xfcX\xf3\x05\x16\x00\x00f\
-X9\xc7\x96\xf3l=\xdaJ\x92\xa4c-\xac\x8f\xbe\
-wx1}^\xeb\x85\x16\x00\x00fQ9\xbf\x96s\
-l=\xd2J\x92\xa4\xe3m\xef\xc1\x03W\x0d\x93\xf4k\
-]\xef\xb7\x93\x01\x000\xcb\xe2{\xcb\xb9\xb5\x9c_\xeb\
-QV\x92$mE\xdd4\xde*\xe4\x98\xdb/\xc0\x00\
-\x00\xb0{\x0e\x9dS\x87\xf3j=\xbaJ\x92\xa4\xadn\
-m\xfd\xf4\xaf\x0b}z\x5c\x97\xe3'[/\xc6\x00\x00\
-\xb0\xa3\x86si9\x9f\x96sj=\xb2J\x92\xa4\xed\
-lx\xf1\xbd{\xe8\xe3k\x9b/\xcc\x00\x00\xb0\x03\x0e\
-\x9dG\x87si=\xa2J\x92\xa4\x9djmc|\xdd\
-\x90\xd33[/\xd0\x00\x00\xb0\x9d\xca9\xb4\x9cG\xeb\
-\xd1T\x92$\xedx\xe7\x8f\xf6t\xd3\xf8\xc0\x90\xe3?\
-\xb6^\xac\x01\x00`+\x1d:w\x0e\xe7\xcfr\x0e\xad\
-'RI\x92\xb4\x9b\xad\xe5\xf1\xcdB\x9f^\xd2z\xe1\
-\x06\x00\x80\xadP\xce\x9b\xe5\xdcY\x8f\xa0\x92$iV\
-:i=\x8d\xbb\x1c\x1f\x15r\xfcx\xebE\x1c\x00\x00\
-\x8e\xc7\xa1\xf3\xe5p\xce,\xe7\xcdz\xf4\x94$I\xb3\
-\xd8Z\x1e\xdf\xb1\xcb\xe9\x95\xad\x17t\x00\x008&\xc3\
-\xb9\xb2\x9c/\xebQS\x92$\xcdz{r\xbav\x97\
-\xe3\x1f6_\xd8\x01\x00\xe0hL\xe3\x1f\x96se=\
-bJ\x92\xa4\xb9\xe9\xbc\x95\xaf\x5c\xcb\xe3\xfb\x0e/\xe8\
-o=\xec\x05\x1e\x00\x00\x8e\xecm\xe5\x1cY\xce\x93\xf5\
-d)I\x92\xe6\xb1\xd5\x9cn\xdc\xe5\xf8\x82\xc6\x8b=\
-\x00\x00\x5c\xd6pn,\xe7\xc7z\x94\x94$I\xf3^\
-\xf8\xcb\xfd\xa7\x85\x1c\xcf\xe9r\xfa\xd7\xe6\x8b?\x00\x00\
-\xcbm8'\x96\xf3b97\xd6#\xa4$IZ\xa4\
-B\x9fn\xdb\xe5xq\xf3 \x00\x00\xc0r\x1a\xce\x87\
-\xe5\x9cX\x8f\x8c\x92$iQ;\xed\xe0iax\xf1\
-\x7f\xf2a\x87\x01\x00\x00\x96\xd1\x93\xca\xf9\xb0\x1e\x15%\
-I\xd22\xb4:\x89\xb7\x0b}\x9a6\x0e\x06\x00\x00,\
-\xb8r\x0e\x5c\x9d\xc6\xdb\xd5\xa3\xa1$IZ\xb6N\xde\
-\x18\x9d\xd1\xe5\xf4\x88\xae\x8f\xefo\x1d\x16\x00\x00X0\
-9~`8\xff\xfd\xe6U/\xd8\x7f\xa0\x1e\x09%I\
-\xd22\xd7M\xd3\xcd\x87\x03\xc2\x9f7\x0f\x0e\x00\x00,\
-\x8a\x17\x0d\xe7\xbe[\xd4#\xa0$I\xd2%\xad\xe5\xf1\
-)\xa1\x1f\xfdr\xc8\xf1\xed\x8d\x03\x04\x00\x00s*\xf4\
-\xf1\x1d!\xa7_\x09\xe7\x8f\xaeV\x8f~\x92$I\x87\
-\x17\xfa\xf1\xf7\x87\x1c\x9f\xdd:P\x00\x000_B\x1f\
-\x9f\xbb:I7\xaaG=I\x92\xa4+\xe8\xcdg}\
-\xf5p\x80\xb8W\xc8\xe9\xf5\xad\xc3\x05\x00\x00\xb3.\xbe\
-qm:\xba\xcf\xca\xb9\xe3\x93\xea\x09O\x92$\xe9\xe8\
-\xdb;\x19}\xe7p\xa8\xf8\x83\xe1P\xf1\x99\xc3\x0f\x1a\
-\x00\x00\xcc\xa0\xcfu9>em}|\xddz\xa4\x93\
-$I:\xfe\xba\x9c\xee2\x1c0\xfer\xd3\x81\x03\x00\
-\x80\x19\x12\xfa\xf4W\xdd4\xde\xbd\x1e\xe1$I\x92\xb6\
-\xa6n#~}\xc8\xe9\xb7C\x1f\xff\xadu\x08\x01\x00\
-`w\x84>}\x22L\xd3\xef\x86\xf5\xfdg\xd5\xa3\x9b\
-$I\xd2\xd67\x1c8~<\xe4\xb8\xde:\x90\x00\x00\
-\xb0\xb3B\x9f\xa6\xab\x93x\xbbzT\x93$I\xda\xde\
-N\x9a\x9e\x1eC\x8e\xbf1\x1cB\xde\xdd:\x9c\x00\x00\
-\xb0\xdd\xe2\xfb\xbbiz\xc4U/\xd8\x7f\xa0\x1e\xd1$\
-I\x92v\xae\xb5~t\x93.\xa7\xf3\xda\x07\x15\x00\x00\
-\xb6G|Q7I\xb7\xa8G2I\x92\xa4\xdd\xe9\x94\
-\xf53\xd7\x86\x83\xc9\xd9\xc3\x01\xe5-\x87\x1fX\x00\x00\
-\xd8*\xa1\x8f\xef\x08\xd3\xf4\xe0p\xfe\xe8j\xf5(&\
-I\x92\xb4\xfbu9\xde0L\xd2\x1f\xb5\x0e0\x00\x00\
-\x9c\x98\xd0\xc7\xe7\xaeN\xd2\x8d\xea\xd1K\x92$i\xf6\
-\x0a}\xba\xed\xe0]\xad\xc3\x0c\x00\x00\xc7*~\xa0[\
-Ow\xaaG\xad\xff\xdf\xde\xbd\xc0X~\xd5\x05\x1c\x1f\
-Qiw\xee\xf9\xdfm\xb7ng\xee9wwy,\
-\x0f\xd7\x8a\x82\x90H\x04DDB\x1a\xac\x16\x85\x22\xb5\
-<\x0a\xe5!\xef7H\xa0\x1a\x0c\xe5\x91\xd0\x04\x02\x05\
-Z\x05y\x96\x96H\x09\xdb\xb9\xe7\x7fg\xeb\x08E\x0a\
-\xb1<\xe4)!\xbc\x9b\x05\x84@\xa2\x80B-z\xce\
-\xec\x1flg\xff\xca\xd2}\xcd\x9d\xf9|\x92o\xeel\
-\x9a\xb43\xf7\xfe\xff\xe7\xff;\xd3\xff\xde\x0b\x00\xb0\xbe\
-mm\x17n}\xe0\x8d\xa8\xe3\xe7\xfa\x87\x1bI\x92$\
-\xfd\x7f\x856}\xa9\xc9\xe9E\xcdr\xbc}7b\x01\
-\x00\xcc\x8e\xfaW\xca\xca0sQ\xc8\xe9\xbb}\xc3\x8e\
-$I\x92\xd6\x94\xe3\x0fJ\x97\x84v|\xafn\xa4\x02\
-\x00\x98]a\x9a\x1eX\x86\x9cw\x1d4\xf4H\x92$\
-\xe9'\x85\x1c\xf7\x0er<\xab\x1b\xa1\x00\x006\x86m\
-K\xdb\x86\x836>\xa1\x0c;\x1f\xec\x1b\x82$I\x92\
-6k\xa1M\xd76\x93\xf4\x94a\x1eo\xebF'\x00\
-\x80\x8d\xa7\xfe\xbd\xf8\xfa\xf7\xe3CN_\xee\x1b\x8a$\
-I\x926O\xf1\xba\xd2\x05a\xdf\xe2\x9enT\x02\x00\
-\xd8\xf8\xc2t\xfc\xdbMN\x97\x94A\xe8\x07\xfdC\x92\
-$I\xd2\x06-\xa7\x1b\xc24\xbda\xd0\xa6\xfbt\xa3\
-\x11\x00\xc0\xe63h\xe3CB\x8eW\xf6\x0eL\x92$\
-I\x1b\xac2\xf7\xe4a\x1e\x9f\xdd\x8dB\x00\x00\x9b[\
-\xb3\x1cOirzjh\xd3\x87\xfb\x86'I\x92\xa4\
-\xd9/~\xac\xc9\xf1\x19\x83v\xe1\xd4n\x04\x02\x00\xe0\
-\xc7\x06\xed\xf8\xb42,\xbd\xb4\x0cM\xfb\xfb\x87)I\
-\x92\xa4\x19+\xa7\xaf\x876\xbd|\xb0\x94\xee\xd4\x8d<\
-\x00\x00\xfc_\x06\xcb\xf1\xbe!\xc77\xf5\x0eV\x92$\
-I3R\x99g\xde<lG\xf7\xebF\x1c\x00\x00\x0e\
-U3I\xe7\x846M\xfb\x86,I\x92\xa4u\xdcr\
-\x93\xd3\xc3\xe6\xfe{\xee\xe7\xba\xb1\x06\x00\x80\x9f\xd5\xfc\
-\xca\xae\xc50\x19=\xbb\xc9\xf1\x13=\x03\x97$I\xd2\
-:*~2\xe4\xf4\x9c\xf9\xc9\xceQ7\xca\x00\x00p\
-\xb8\xb6.\xc7;\x87\x1c_Q\x06\xado\xf5\x0fa\x92\
-$I\xc7\xa7:\x9f\x846^\xb8u2\xbaK7\xba\
-\x00\x00p\xa4\xad\xbe\x19u\x9b\xde\xb5v\x18\x93$I\
-:N\xbd\xab\xce'\xdd\xa8\x02\x00\xc0\xd1\xd6L\xe2\x19\
-\xa1\x8doir\xfca\xcfp&I\x92t\xf4\xca\xe9\
-\xfa\xd59d\x1a\xcf\xe8F\x13\x00\x00\x8e\xb5\xd0\x8e\xcf\
-,\x83\xd9\xdb\xcb\x80v\xc3A\x03\x9b$I\xd2\x91\xed\
-G\xa5K\xc3$=\xb0\x1bE\x00\x008\xde\xcap\xf6\
-\xa0&\xc7\xcb\xd7\x0cn\x92$IG\xa8\xf8\xce\xc1$\
->\xb8\x1b=\x00\x00XW\xce\x9f\xbb\xc5\xa0\x8d\x0fi\
-r\xfc\xbb\xfeaN\x92$\xe9g\xee\x8aa\x1e=t\
-\xee\xb2\xb9\x9f\xef&\x0e\x00\x00\xd6\xadk\x7f\xe3\x17\x87\
-y|vh\xd3\xbb{\x06;I\x92\xa4\x9fZ\xc8q\
-o3M\xe7\xcc-\xed>\xa1\x9b0\x00\x00\x98\x19\xef\
-\x18oi\xda\xf8\xf02\xd4]\xd97\xecI\x92$\xad\
--\xb4q\xd2L\xe3#\x17\xda\x85A7Q\x00\x000\
-\xab\xb6\xafl\x0fM\x8e\xe7\x96!/\xf7\x0d\x7f\x92$\
-I\xa5\xe5\x90\xd3y'/\xdffk7B\x00\x00\xb0\
-Q\xd4!/L\xd3yMN\xfbz\x06AI\x92\xb4\
-)\x8b+!\xc7\xc7\x0f\xf3x[72\x00\x00\xb0Q\
-5\xcb\xf1\x94:\xfc59\xae\xf4\x0f\x87\x92$i\xc3\
-\x97\xd3\xd5\xc3<z\xd2\xa0]8\xb5\x1b\x11\x00\x00\xd8\
-,\xea\x10X\x86\xc1'\x96\xc1\xf0}\x07\x0d\x8a\x92$\
-iC\x16r\xbc\xa6\x99\xa6\xa7n\x99\xee\x88\xddH\x00\
-\x00\xc0f5?\xd99*\xc3\xe1SBN\x1f\xe8\x1b\
-\x1e%I\xd2\xec\x17r\xfc\xa7&\xc7g\x9e\xbc<\xda\
-\xd9\x8d\x00\x00\x00p\xc0\x899\xee(\xc3\xe23B\x1b\
-?\xd47LJ\x92\xa4\x99\xec#!\xa7\xe7n\xdd\xbb\
-\xf36\xdd%\x1f\x00\x00\xfa\x9d\xb4wqW\x19 \x9f\
-\xdc\xe4x\xd5\x9a\xa1R\x92$\xcdN\xef\xab\xff\xb3g\
-\x98\xc7\xbb\xbbK<\x00\x00\x1c\x9amK\xdb\x86\xcd$\
-\x9d\xd3\xb4\xf1\x9dMN\xd7\xf7\x0c\x9b\x92$i\x9d\x15\
-\xda\xf4\xee&\xc7s\xeb\x07Kt\x97t\x00\x00\xb8\xf9\
-\xcap\xf9\x80\xd2\xc5e\xd8\xfc\xd7\xb5\xc3\xa7$I:\
-\xbe\x856~'\xe4\xf4\xc6\xd0\x8e\xcf\x9c;\x7f\xee\x16\
-\xdd\xe5\x1b\x00\x00\x8e\x9c\xd0\x8e~\xab\x0c\x9d/\x0bm\
-\xfal\xdfP*I\x92\x8e]\xe5\x9a\xfc\x85\xd0\xc6\x0b\
-\x07\x93t\xef\xeeR\x0d\x00\x00GWXZ\xdc\x13\xda\
-\xf4\xbc\x90\xe3\x07\xfb\x86TI\x92t\xf4*\xd7\xe0\x0f\
-\x97k\xf0\x0b\xe7s\xfa\xb5\xee\xd2\x0c\x00\x00\xc7\xd6\xfc\
-\xca\xae\xc50\x89\x8f\x0bm\x9c\xf4\x0d\xad\x92$\xe9\x08\
-\x96\xd3\xbea\x1e=\xa9~bhw)\x06\x00\x80\xe3\
-li\xf7\x09\x83\x1c\xcf\x0a9\xbd-\xb4\xe9{\xbd\x83\
-\xac$I\xfa\xd9\xcb\xf1\x87\xa5\xcb\x87y|\xf6\xf6\x95\
-\xed\xa1\xbb\xf2\x02\x00\xc0\xfa3\xcc\xa3\xdfkrzu\
-\x19`\xaf\xeb\x1dn%I\xd2O/\xa7o4\x93\xf8\
-\xfaf\x9aN\xef.\xb1\x00\x000\x1b\x86\xd3\x1dw-\
-\x03\xed\x8b\x9a\x1c?\xd1;\xecJ\x92\xa4\x83\x0a9\xfd\
-K\xd3\xc6\x974\xcb\xf1\xee\xdd%\x15\x00\x00f\xd3p\
-i\xc7m\xcbp\xfb\xf4&\xc7\xf7\xf5\x0d\xbf\x92$\xa9\
-\xfe2(^\x13\xa6\xe99!\x8f\xee\xd8]B\x01\x00\
-`c\x18\xe6\xf1\xb6f\x1a\x1fY\x06\xdf+\xd6\x0e\xc2\
-\x92$m\xd6B\x1b\xaf\x0cmz\xcc`\xdf\xa9\x0b\xdd\
-%\x13\x00\x006\xae\xb04\xbaG}\xd3\xcc&\xa7\xeb\
-\xfb\x06dI\x926t\xe5\xfa\x17\xda\xf4\x9e\xc1$\xdd\
-\xbb\xbb4\x02\x00\xc0\xe62\xbf\x14\xef\x5c\x86\xe2\xe75\
-9\xbe\xb7wh\x96$i\x03U\xaey\x1f\x089\xbe\
-p\xb8<\xbe[w)\x04\x00\x80\xcdmt\xedh>\
-\xe4\xf4GM\x8e\x177m\xfcj\xdf -I\xd2L\
-\x96\xd3\xd7\xcb5\xee\x8d\x83\x1c\xcf:y\xf96[\xbb\
-K\x1f\x00\x00\xb0\xd6\xa0\x1d\x9f\xd6\xb4\xf1YM\x8eW\
-\xf5\x0e\xd7\x92$\xcdB9\xbe\xb7\xde\x0d[\xef\x8a\xed\
-.q\x00\x00\xc0!\xb9l\xcf-\x9bi<\xa3\xc9\xe9\
-\xa22T\x7f\xb1w\xe0\x96$i]U\xefv\x8d\x17\
-\xd7\xbb_\x17\xda\x85AwE\x03\x00\x00n\xae\xfa\xf1\
-\xbc\xcd4=\xb5\x0c\xd9m\xff\x10.I\xd2ql\xf5\
-\xee\xd6\xf8\xac\xc1\x95\xe3_\xed.]\x00\x00\xc0\x11u\
-\xfe\xdc-\x9ai:=\xb4\xf1\x95\xa5\xcf\xf5\x0e\xe6\x92\
-$\x1d\x83V\xefb\xadw\xb3NF\x7f0\xf7\xc9=\
-\xb7\xec\xaeT\x00\x00\xc0\xd16\xcc\xe3\xdd\xc3<zb\
-h\xe3\xde2\x94\xdf\xd07\xb0K\x92t\xa4\xeb\xeeZ\
-}Z\xbd\x8b\xb5\xbb$\x01\x00\x00\xc7\xcb\xb0\x1d\xdd/\
-\xe4\xf8\x8a&\xa7O\xaf\x1d\xde%I:\xdc\xea\xdd\xa9\
-\xa1M\xaf\xacw\xab\xd6\xbbV\xbb\xcb\x0f\x00\x00\xb0^\
-\x9ct\xd5\xe2\xae0\x89\x8f+\x03\xfc\x15M\x1b\xffs\
-\xedP/I\xd2!\x97\xd3\x0d\xf5n\xd4zWj\xbd\
-;\xb5\xbb\xd4\x00\x00\x00\xeb\xdd \xa7\xdf\x099\xbd\xac\
-\xc9\xf1\xe3\xbd\xc3\xbe$I\xfd}\xba\xde}Z\xefB\
-\xed.)\x00\x00\xc0,\x9a\xdf\xbbkq\xd8\xc6\x874\
-9\xbe.\xe4\xf4\xd9\x9e\xe1_\x92\xb4\xc9\x0b9~\xbe\
-\x99\xa6K\xca\xd7\x7f\xbae)\x8d\xbbK\x08\x00\x00\xb0\
-Ql\x99\xee\x88\xc3<>\xbb\xc9\xf1b\x9f^&I\
-\x9b\xbb\x90\xd3\x17B\x9b\xfe\xa6\xc9\xe9a'/\x8fv\
-v\x97\x0a\x00\x00`\xa3;1\xc7\x1d\xcd$\x9dS6\
-\x04\x7f\x1d\xda\xf8\xf9\xbe\x0d\x83$icU\xd6\xfc/\
-\x85\x9c\xde\xd8\xb4\xf1\x11['\x0b\xb7\xea.\x09\x00\x00\
-\xc0fu\xd2\xde\xc5]e\x83\xf0\xf00Mo(\x9b\
-\x85/\xf5m$$I3\xdbWB\x8eojr<\
-wk\xbb\xf3\xd6\xdd\xd2\x0f\x00\x00pS[\xdb\x85[\
-7\xd3\xf8\xc8\xd5\x0dD\xd9H\xac\xd9XH\x92f\xa1\
-\x1c\xaf\x0bm|Kh\xc7\x8f\x1a^\xb5\xe3\xb6\xdd\x12\
-\x0f\x00\x00ph\xeaF\x22L\xc6\x8f\xae\x1b\x8b\xba\xc1\
-\xe8\xddxH\x92\xd6Iq\x7fh\xd3[CN\xe75\
-\xd3t\xbbn)\x07\x00\x008<u\x83Q6\x1b\x8f\
-)\x9b\x8d\xb7\xd5\x8dG\xff\x86D\x92tl\x8b_k\
-rz{Y\x9f\x1f\xdbL\xe2\x1d\xba%\x1b\x00\x00\xe0\
-\xe8\x08yt\xc70\x89\x8f+\x1b\x92KK_\xbf\xe9\
-\x06E\x92tT\xcb\xe9\x1b\xe5\xf1\x1d!\xc7\xc7\xd7\xf5\
-\xb8[\x9a\x01\x00\x00\x8e\xad\xb0\xb4\xb8'\xb4\xf1\xcf\x9a\
-i\xba\xaclT\xbey\xd0\xe6E\x92t\xf8\xd5\xf55\
-\xc7\xcb\xebz\x1b\xf6-\xee\xe9\x96`\x00\x00\x80\xf5!\
-L\x17\x7f\xb9\xbeIu3\x89\xaf/\x9b\x97\x8f\xf7n\
-l$I\x87V]G\xebzZ\xdf\xfc\xbf\xac\xaf\xdd\
-R\x0b\x00\x00\xb0\xbem_\xd9\x1e\x06\xcb\xf1\xbea\x12\
-_\x10r\xbc\xb2\xf4\xed\xdeM\x8f$i\xb5\xbaN\xae\
-\xae\x97m|A]?\xeb:\xda-\xa9\x00\x00\x00\xb3\
-\xab\xb9*\xde\xa1i\xe3#\x9a\x1c_[\xfa\xe7\xbe\x0d\
-\x91$m\xba\xeaz8-\xebb]\x1f\xcb:\xd9-\
-\x99\x00\x00\x00\x1b\xd3\xe8\xda\xd1\xfc`\x1a\x7f7\xe4\xf8\
-\xfc\xd2\xde\x90\xd3\xb7z7K\x92\xb4\xc1\x0am\xfaV\
-h\xcb\xba7\x8d\xcf\xaf\xeb`]\x0f\xbb\xa5\x11\x00\x00\
-`\xf3i\x96\xe3\xed\x9b\xe5\xf4\xb0\xb2a\xba\xa8\x99\xa6\
-\x8f\xae\xddDI\xd2Lw`]\xbb\xa8i\xe3\xc3\xeb\
-z\xd7-}\x00\x00\x00\xdc\xc4\x07\xc6[\x06m\xbaO\
-\x98\xa6?\x0fmzO\xd9H\xf9D3I\xb3\xd67\
-\xeb\xfaU\xd7\xb1\xba\x9e\xd5u\xad[\xe1\x00\x00\x008\
-T\xcd4\xdd\xaetN\xd9d\xbd\xa6\xf4\x91\x1bm\xba\
-$i=U\xd7\xa7\xd7\xac\xaeWe\xdd\xea\x960\x00\
-\x00\x00\x8e\x94A;>-\xe4\xf4\xdc\xa6\x8d+M\x8e\
-\xff\xb1fS&I\xc7\xa6\xd5\xf5'\xae\xd4\xf5\xa8\xae\
-K\xdd\x12\x05\x00\x00\xc0\xb10?\xd99\x1a.\x8f\xef\
-\x7f\xe0\x97D\xe9\xd2\xd2gn\xb2i\x93\xa4#W]\
-_.\xad\xebM]w\xea\xfa\xd3-E\x00\x00\x00\x1c\
-w+\xbbNl\x96\xd2o\x866=\xb6l\xde.\x0a\
-9^\xd3\xb4\xf1\xfb7\xda\xd4I\xd2!\x14\xbf\x7f`\
-\xfd(\xebH]O\xca\xbaR\xd7\x97n\xa5\x01\x00\x00\
-`\x164\x93x\x87A\x8eg5\xd3\xf8\xe2\xb2\xc9[\
-*\x9b\xbd\xfd\x07o\x00%m\xee\xe2\xfe\xd5\xf5\xa1\xac\
-\x13\xab\xebEY7\xba%\x04\x00\x00\x80\x8db\xd0.\
-\x9c:lG\xf7\x0b\x93\xd1\xb3C\x9b\xdeZ6\x84\x9f\
-:x\x83(i\x83\xf7\xa9z\xfe\xd7u\xa0\xae\x07u\
-]\xe8\x96\x08\x00\x00\x006\x8d\xcb\xf6\xdcr\xb8<\xbe\
-[\xc8\xe9\xbc&\xa7W7\xd3\xf4\xfe\xf2\xf5w{6\
-\x91\x92f\xb0\xd5\xf3\xb9\x9c\xd7\xf5\xfc\xae\xe7y=\xdf\
-\xeby\xdf\xad\x00\x00\x00\x00\xf0\xbf\xea\xc7I\x876\xfd\
-q\xd9P\xfeU\xc8qo\xd3\xc6\xaf\xae\xddhJZ\
-\xaf\xc5\xaf\x1e8o\xcb\xf9[\xcfc\x1f\x0f\x0f\x00\x00\
-\xc0\xcd\xb62\xf7\x0b\xf5\x8df\x07y\xf4\xc4\xb2\xd1|\
-Uh\xe35e\xd3\xf9\x9d\x9bnD%\x1d\xeb\xeay\
-X\xcf\xc7\xf2\xf5\xab\xea\xf99\x9c.\xde\xb5\x9e\xaf\xdd\
-\x99\x0b\x00\x00\x00G\xc1\xd2\xee\x13\x06K\xe9N\xf5N\
-\x84\xb21}~\xd9\x98\xfemy\xfc`y\xfc\xf6\xda\
-\x8d\xab\xa4\xc3k\xf5\x97?\xf5\xfc\xca\xf1M\xab\xe7\xdb\
-$=h\xb0/\xdd\xc9'\x82\x01\x00\x00\xb0n\xd47\
-\xac\x0d\xcb\xa3{\x84v\xf4\xa8&\xa7\x97\x96\xae(}\
-\xball\xffk\xedFW\xd2\x9ar\xfaQy\xfcL\
-\xc8\xe9\xdd\xa5\x97\x85v\xfc\xa80\x19\xdd\xd3\x1bA\x03\
-\x00\x000\xb3\x86y\xbc\xbb\x99\xa6\xd3\xcb\x86\xf7i\xa5\
-\x8b\x9a6\xfe}\xe9\xba\x9fl\x86\xa5MW\xdc_Z\
-ir|]y|zy|\x80\xf7\xff\x01\x00\x00`\
-S\xd8~\xd9\xf6\xb0u2\xba\xcbp2\xfa\x93\x90\xe3\
-\xf9!\xa7\xb7\x856][\xfa\xb7\xfeM\xb44{\x95\
-\xe3\xfa{MN\x1f)__Z\xfa\xcb\xe1t\xfc\xd0\
-\xfa\xde?\xa7\xbc\xff\x94\xa6;\x15\x00\x00\x00\x80j\xfb\
-\xca\xf6P7\xcd\xcd$>\xa2l\xa6_\x14\xa6\xf1\xcd\
-e3}u\xe3S\xd0\xb4\xae\x8b_+\x8fW\xaf\x1e\
-\xaf\xf5\xb8\x9d\x8c\x1f]\x8f\xe3z<w\x876\x00\x00\
-\x00ps5\xcb\xf1\x94\xf96\xfez\xd9\x80\xff~\xc8\
-\xf1\xf1M\x8e/.\x8fe\x13\x1e\xff\xa1<~\xbe<\
-\xfe\xf0\xe0\xcd\xbat\x98\xe5t}9\xbe\xbeP\x8e\xaf\
-\xf7\x866\xbe\xa5\x1c\x7f\x17\x0c&\xf1\x09\xcd4\x9e\xb1\
-u9\xde9\xac\x8c~\xa9;D\x01\x00\x00\x80\xe3a\
-\xb0\xef\xd4\x85\xe1t\xc7]C;>\xb3l\xe6\x9f\x1c\
-\xda\xf4\xf2\xb2\xa1\x7f{\xe9\xfd!\xa7/\x97\xc7\xfaF\
-\xbe\xfd\x1b\x7fm\xe6\xeaq\xf1\x95r\xbc\xfccy\xbc\
-t\xf5\xb8\x99\xa4\xa7\x84Iz\xe0pi|\xb7\xf9\x95\
-]\x8b\xdd!\x06\x00\x00\x00\xcc\xa2-Ki\xdcL\xe2\
-\xdd\xc34=\xa8\xbe\xb9oh\xe3\x85\xe5\xf1\x9d\xe5\xf1\
-C\xe5q\xff\x8d~I\xa0\x0dW\xdc\xdf\xbd\xce\xf5\xf5\
-\xbe\xb0\xc9\xf1\x19\x83I|p=\x1e\xeaq\xd1\x1d\x22\
-\x00\x00\x00\xc0\xa6\xb3\xb2\xeb\xc4-\xd3\x1dq\xd0\x8eO\
-\x0b\xed\xf8^ai|\xe6\xeaG\xeb\xb7\xf1Y\xa5\x0b\
-\x9a\xfa)Q9^^\xba\xaa\xfc\xf9cM\xbd\xb3$\
-\xa7\xef\x1e\xfc\xcb\x07\x1d\xed\xba\xe7\xfd+\xab\xafC}\
-=\x0e\xbc.\xf5S\xbc.\xa8\xafW}\xdd\x0e\xbc~\
-\xe3{\xd5\xd7\xb3\xbe\xae\xf5\xf5\xed^i\x00\x00\x00\x80\
-\xc3\xb4\xb4\xfb\x84\xf9\xc9\xce\xd1`\xb2\xe3W\xc2\xbe\x1d\
-\xf7\x0cy\xf4\x87M\x8e\xe7\x96\x9eYzq\xe9\xb5\xcd\
-4]\xd6\xb4i_\x93\xd3G\xeb_a+\xfd\xfb\x8d\
-\x7f\xc1\xb1\xd9\xab\xcfG}^\xea\xf3S\xfe\xbco\xf5\
-\xf9\xaa\xcf\xdb\x81\xe7\xaf>\x8f\xe7\xd6\xe7\xb5>\xbf\xf5\
-y\xae\xcfw}\xde\xbbW\x00\x00\x00\x00`vl]\
-\xd9u\xd2\xd6\xc9\xc2\xad\xc2\xd2\xe8\x1e\xc3<\xbe\xff\xea\
-'\xadu\x0d&\xa3\xbf\xf8qM\x9b^\x15\xa6\xe9\x0d\
-\xb5\xa6\xde\x0d\xd3\xc6\x95\x03\xa5\xabC\x9b\xbe\xd8[\x8e\
-\xdf\xf9\xf1/\x5c\x8eD\xf5\xdf\xd7\xfb\xdf)\x95\x7f^\
-?\x15\xee\xc0\xf7T\xbe\xbf\x9f|\xaf\xe5\xfb\xbe\xc9\xcf\
-q\xa3\x9f\xaf\xfe\xbc\xf5\xe7\xae?\x7f}\x1e\xba\xa7\x04\
-\x00\xe0\x18\x9a\x9b\xfb\x1f\x16\xf3+Z\xaa3\x1eW\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00X\xcd\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x02\x08IDATH\xc7\xb5\
+\x95\xc1j\x1aQ\x14\x86\xff\xffL\xc4F\x04g\xe2\x22\
+uc\x03vW\xa1)\xd3E\xb1\xb5H\x16>A\x1e\
+\xa1+\x1f\xa0\xa5\x0bW.\x12\xb2O)y\x14\xbb\x11\
+\xa4\xd2E\x074\xd8\xa5E\x84\x22B\x86f\xc0Z\xcb\
+\xe8=]\xa4\x96\x84\x9a\xb46\xce\xb7<\xf7\xde\xffp\
+\x0e\xf7\x9c\x9f\xb8\x86/\xae\x9bH\xda\xf6\x03U-\x1b\
+\xf2)\xc9\x87\x04\xd2\x00\xa0\x80\xaf\xaa\x1dQ}?\x03\
+\xde\xa5\x83\xa0K\xcf\x9b,\xd3\xe1\xb2\xe0\xd7\xbd\xbd{\
+\x10\xa9\x01x\x0e \x0br\xe9=\xa8*\x80\x81\xaa6\
+\x7f\xcc\xe7\xd5L\xa3\xd1\xbf1\xc1G\xd7\x8d\xe5l\xbb\
+\x02\xf25\xc8m\xac\x82\xea\x08\xaa\x07\xbd\xf3\xf37\x8f\
+=/\x5c\x84\xad\xcb\xe2\xf7\x1d\xe7\x85\x92\x07$\xb7\xb0\
+*dR\x81g\xe9\xcdM\x7f\xdfq:'\xc3\xa1\x01\
+\x00Y\x9c\xe7l\xbbb\x80#\x92I\xfc'$\x93\x06\
+8\xca\xd9v\xe5J\x8b\x86\xa5\xd2\xce\x9d\x8d\x8d\x0f+\
+\xb7\xe5\x86vMg\xb3'\x99F\xa3/\xea\xba\x89\xb8\
+e\xd5\xd6&~Q\xcav\xdc\xb2j\xea\xba\x09\xf1S\
+\xa9<\xc9\x22\xd6\x0c\xc9\xa2\x9fJ\xe5\xc5\x02\xca\x00\xb2\
+X?Y\x0b(\x8b\x92\x85k\xff\xf9-KP\xb2 \
+\x10\xd9ET\x88\xec\xcab\xfc\xa3\x80@Z\x101\xa2\
+\x80\x1f\xa1\xbe/0\xa6\x1d\x95\xba\x1a\xd3\x16\x92\xad_\
+[q\xcd\xea\xaa$[27\xa6\x0e`\x10A\x01\x83\
+\xb91uI\x07A\x17d3\x829h\xa6\x83\xa0+\
+\xf4\xbc\xc94\x0c\xabP\x1d\xad\xb1=\xa3i\x18V\xe9\
+y\x13\x01\x80L\xa3\xd1\x871\x87P\x1d\xafA|\x0c\
+c\x0e\x17\xee\xf6{\x0ezApL\xe0\xe5\xad\x92\xa8\
+\x8eU\xf5U/\x08\x8e\xffp\xb4\x93\xe1\xd0\xec;N\
+g+\x1e\x1f\x83|\x84U\x8dGu\x04cj\x9f\x83\
+\xe0\xede\xcb\x5cn\xfa\xa5\xd2\x0eb\xb1\x1aT\x8b\xff\
+b\xfa \x9b\x08\xc3\xaa\xf37\xd3\xbf\xf2\xd6u\x13~\
+*\x95\xb7D\xcaT-\xe8\xc5R\x5c\xec-\x9f\xc6\xb4\
+\x95l\x891\xf5\xefgg\x9f\xee\x9e\x9e~[\xa6\xf3\
+\x13\xc6\xb1\xe1\x19H\xce\xc8/\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x09m\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x09\x1fIDATx\xda\xed\
+\x9dMl\x5c\xd5\x1d\xc5\xcf\xb9o\xec\xf1\xc4\x1e\xc7N\
+\xb1c>\x9a8L\x08\x0bRW\x8dS,\x1b;\x0c\
+\x9e&R\x09\x0b\xca\xa2\x0b\xd8d\x11\x0a*\x15\xa4\x95\
+\x10M%P`Q\xa0\x91ZZ\xa4\x92\x0a*eQ\
+\xba@\xa2\xa8R(\xaa\x1bO\xa6q>\x14\x8a\x83\x88\
+\xc8\x82\x10'\x0e(\xc5v\x5c{\xb0\xc7\x19\x7f\xcc\xbb\
+\xa7\x0b\xbbT&\xb1\xe3\xcf\x99\xb1}\xcf\xd6~of\
+~\xe7\xfd\xff\xf7\xfe\xef\xbd\xef^\x22\xcf$\xc0\x5c\xbe\
+\xfb\xee\xf2\xe2\xd2\xd2u\x94n\xb2R\xc4\x18\xb3^\xe4\
+FHU\x04*E\x96K*!\x10\x98\xb8&C2\
+E\xa9_@\x0f\xc8.J\xe7\xad\xb5\x97\x0c\xd9!\xb2\
+wh`\xe0\xb3[\xdf\x7f\xbf\x9f\x80\xcd\xa7\xdf\xcb|\
+\xf9\x22\x83\x0d\x0d\x95#\xc1`c\xc0\x98\x1d\x227\x82\
+\x5c\x0f\xe9&\x00\xabA\xce\xed{J\x02\xf0%\xc8^\
+H\x97(\x9d\xcfX\xdb\x12\x1c\x199\x16>q\xa2g\
+E\x1b\xd0USS\x1c,+\xdb\x84\xc2\xc2(\xc8\xef\
+\x13\xb8W@a\x96~\xf4(\x80\x7fJz\x0f@b\
+\xa4\xa7\xe7\x5c\xd5\x993C+\xc2\x80\x8b\xd5\xd5E\xe5\
+\x91H#\xc8\xdd\x00\xb6\x88\xbc\x1d\x80\x97\xa3\xe7\xc0'\
+p\xc1J\x1f\x1a\xe9\xf5\xfe\x8e\x8ec\x1b:;\x87\x97\
+\xa5\x01\xc9X\xecv\x901\x01{H\xde\xa9\xdcA\x9f\
+JV\xd2'\x92^\xf1\x80\xc3e\xad\xad\x17\x96\x85\x01\
+\x8aFK\xfa=\xefA\x92O\x0a\xd8L2\x84|\x96\
+\x94&\xf0\xb1\x95~\xe7\x0f\x0f\xff\xb5\xe2\xf8\xf1\xc1%\
+i@_m\xedj\x96\x96\xde\x8b@\xe0\x05\x00\xdf\x02\
+`\xb0\xb4d!}\xec\xfb\xfesf` \xb1\xa6\xbd\
+\xfd\xcb%c@*\x1a\xad\x1a\xf3\xbc\x17i\xccN\x01\
+\x15X\xca\x92z!\x1d*\xf0\xfd\xbd%\x89DW^\
+\x1b\xa0\xfa\xfaP\x7fq\xf1.\x02O\x83\xdc\x80\xe5$\
+\xe9\xa2\x80\xfd\xe5CC\x07y\xf2d:\xef\x0c\xe8j\
+h\xa8,,*\xfa)=\xef\xc7\x00J\xb1<5 \
+\xdf\xff}\xc1\xf0\xf0o\x16\xaa\x8e\x98\xb7\x01\x02Lr\
+\xdb\xb6o\xa3\xb0\xf0\x0f\x00\xb6\xce\xb9hZ:\x91 \
+\x02\x1fht\xf4\xb1\x7f\x1c=z\xe6\x87\x80\x9fS\x03\
+\x92\xb1\xd8v\x90\xbf\x14\xb9\x15+I\xd6\xb6[\xe9\x17\
+\xdf\x88\xc7[rb\x80\xa2\xd1\xa2~\xf2!z\xde\x01\
+\x90a\xacDI\x83\xc6\xf7\x1f/\x95\xfe\xc2DbN\
+\x05\xdc\x9c\xbb\x86\xc9@\xe0a\x06\x02/\xafX\xf8\x00\
+@\x86}\xcf\xfbU\x9f\xe7=\x92\xb5\x08P4Z\x94\
+\x0c\x04\x1e\x06p\x00d\x01\x9c\x00i\x0c\xc0\xe3e\x99\
+\xcc\x9fg\x1b\x09\xb3\x8e\x80~\xf2!\x90\xcf;\xf8\x93\
+\x22\xa1\x00\xe4\xf3\xfd\xe4C\x8b\x96\x82\xde\x02\xbcd,\
+\xb6\x9d\x9ew\x00\xc0m\x8e\xfa5\xba\x8d\x9ew \x19\
+\x8bm\x7fk\x16\xe3\x5c3NA\xfd\xdb\xb6}\x07\x05\
+\x05\xaf\xc3\x98Z\xc7z\xfa\xdeQft\xf4G\x15m\
+m\xa7\x17\xcc\x80\xae\x86\x86\xca\xa2U\xab\x0e\x89\xfc\xae\
+#<\x03\xa8\xd2\xbf\x86\xaf^}\xa0j\x06\xc5\xda\x0d\
+S\xd0\xe7\xf5\xf5\xa1\xc2Ph\x8f\x80\xad\x0e\xed\x8c\x8b\
+\xd3\xadE\xa1\xd0\x1e\xd5\xd7\x87\xe6m@qq\xf1.\
+\x1a\xf3\xc4\xb2\xafp\x17\xb6Q\xa6\x8cy\xa2\xbf\xb8x\
+\xd7\xbcRP*\x1a\xad\x1a\x0b\x04N,\xbb\x81\xb5\xec\
+uO/\x16d2\x0d\xd3\x8d\xa2N\x19\x01}\xb5\xb5\
+\xabG<\xef%\x07\x7f^\x91\xb0a\xc4\xf3^\xea\xab\
+\xad]=k\x03XZ\x1a5\xe4NGq~2\xe4\
+N\x96\x96Fg\x95\x82\xae\xdcsO8\x10\x0a\x1d\x03\
+Y\xe3\x10.H*:\x93I\xa7\x1b\xaf7\xbdy\xdd\
+\x08\x08\x04\x83\x0f\x82\xdc\xec\xc8-X*\xda\x1c\x08\x06\
+\x1f\x9cQ\x0a\xeann\x8e\xc0\x98'\xb1\xf4\xe6p\xf3\
+:\x13\xc1\x98'\xbb\x9b\x9b#74 @\xc6\x00\xdc\
+\xe5\x98-\xb8\xee* \xbf7\xad\x01\xaa\xae.\x22\xb9\
+\x07\xf9\xbetdi\xa6\xa1\x90!\x9f\xfa\xfck\xc5\xd9\
+$\x03\xfa\x22\x91&\x92w:Z\x8b\xd4\x16\x93w\x86\
+W\xadj\xbc\xae\x01]55\xc5\x1c_.\xe8r\xff\
+b\xb6\x05\xe4\xee\xae\x9a\x9a\xe2k\x0c\x08VVn\x22\
+\xb9\xc51Z\xf4(\xd8\x12\xac\xac\xdctm\x0a\x92\xee\
+\x03\xe0\xaa\xde\xc5\xd7\x86\x09\xd6_3\x80\xbc\x1f\xf9\xb7\
+`v9\xca\x9b`\xfd\x7f\x03Ruuk\x01ls\
+l\xb2\xa6m\x13\xcc\xc7\x0d\xc8\x84\xc3\x8dn\x8e7\xab\
+]\xd2\x82L8\xdc\x08\x00F\x80\xb1\xc0\x0eG%\xbb\
+\xb2\xc0\x0e\x01\xc6\x0c\xc6b\xe5\x86\x8c8$Y\xee\x8f\
+\x92\x91\xc1X\xac\xdc\xf8\xe4:\x00\xeb\x1d\x92\xack\xbd\
+O\xae3\xd6\xda\x0aI\x15\x8eG\x96\xeb\x01\xa9\x82\xd6\
+V\x18\x02\x11,\xdf\xe5\xe4\xf9\xacRkL\xc4\x18r\
+\xbd\x9bp\xcfIO\x88\x90\xaa\x8d\xc8;\x1c\x8d\x9cy\
+\xb0\xd1H\xaar(r\xd6\x0eT\x19\x92\x95\x0eE\xce\
+\x22\xa0\xd2\x00(s(r\xa62C\xa0\xc4q\xc8Q\
+\x04\x00%Fn\x0c(wm\x00Y\xe0f\xbfr,\
+\xc3\xf1\xd7k\x9cr\x91\x82\xa41# \xe5P\xe4(\
+\x05\x01)\x03 \xe9P\xe4LI#\xa9\xc7q\xc8Y\
+!\xd6cHv9\x149+\xc4\xba\x8c\xa4\xf3\x0eE\
+\xce\x22\xe0\xbc\x01\xd99\xb1\xbb\xa0S\x96\xe9\x1b\xb2\xd3\
+\xc8\xf7/\x00\x18pD\xb2\xae\x01\xdf\xf7/\x18K^\
+\x01\xd0\xebxd]\xbd\x1ey\xc5\x04\xc9K /9\
+\x1eYo\x81/\x0dY\xfb\x99\x09\xb7\xb6\xf6K\xeap\
+D\xb2\xde\x04t\xdc\x92H\xf4\x19\x8e\xef\x97\xd9\xe2\x90\
+d\xdd\x80\x16\x02\xd6\x00@0\x95j\x83\x1b\x13\xca&\
+\xfd\xb1 \xd0\x06L,M,9u\xaa\x1b\xc0QG\
+&K\xe9\x1f8Z\xd2\xda\xda\xfd\x95\x01\x00`\xc77\
+\xb2\xf6\x1d\x9eE\x97\xef\x8f\xb3\xc6$\x03\x0c\x19\x07p\
+\xd1\xf1Yt]\x9c`=\xd9\x80\xb2\x9e\x9es\x94N\
+;>\x8b\x9c~\xac\xfd\xb0\xcc\x98s\xd7\x18\xc03g\
+\x86 \xbd\x81<;ab\x99\xc9\xfa\xd6\xfe\x91--\
+C\xd7\x18\x00\x00\x83W\xaf\x1e\xa3\xf4\x89\xe3\xb4HO\
+\xbftn\xcd\xf0\xf0\xa4\xce\xce$\x03\xbey\xf2d\xda\
+J\xbf\x85\x94v\xb8\x16\xbc\xeb\x99\x86\xf4\xca\xd7\xf7\x9d\
+\xbefR\xdeH\x87\x01\x9cu\xc4\x16\x5cg1\xce\x16\
+\xd3\x1aP\x16\x8fw\x00x\xd5\xb5\x05\x0b\x9b\xfb\x01\xbc\
+:\xc1vz\x03\x00 \x93N\xbf\x03\xc9E\xc1\xc2\xa5\
+\x9f\xb3\x99t\xfa\x9d\xeb\xfd\xe9\xba\x06T\x1c?>\x08\
+\xdf\x7f\x16\x92\x1b\xa6\x9e?\xfc^\xf8\xfe\xb3S\x1d\x85\
+2\xe5\xc2,\x0d\x0c$ \xbd\xeb\x08\xce\xb7\xeb\xc3w\
+\xe5y\x89i\x86%\xa6\xd6\x95\xa6\xa6\x9b\xbd\xa2\xa2\x13\
+\x04\xaa\x1d\xc99\xa933<\xdcP\xd1\xd6\xf6\xc5T\
+\xff0\xed\xd2\xc4\x8a\xb6\xb6/`\xed~\xb8)\xcb\xb9\
+h@\xd6\xee\x9f\x0e\xfe\x0d\x0d\x00\x80t2yP\xd6\
+\xbe\xe6&\xeeg\x95\xf7%k_K'\x93\x07o\x98\
+\xa1fr\xbf\xee\xba\xba\xb5\x85\xe1\xf0!\xac\xb4S2\
+\xe6n\xc0\x07\xa3\x83\x83\x0f\xac\x1d\x1f\xe6\xc7\xbc\x22\x00\
+\x00\xd6\x9e:\xd5Mk\x1f\x83\x1b\xac\x9b\x09\xfc\xd3\xb4\
+\xf6\xb1\x99\xc0\x9f\xb1\x01\x00\xd0\x12\x8f\x7fDk\xf7B\
+r\x8by\xa7\x86\x9f\xa2\xb5{[\xe2\xf1\x8ff\xdcI\
+\x9a\xedg\xf4\xc5b\x8f\x90|\x19\xe4\xad\x8e\xf8$\xf8\
+\x97%=\xb3\xa6\xb5\xf5\xcd\xd9\x5c6\xeb\x174\xca}\
+\xffmZ\xbb\xcf\xcd!O\x82?Fk\xf7\x95\xfb\xfe\
+\xdb\xb3.\x13\xe6\xfa\x99\xffin\xdem\x8c\xd9\xb7\xe2\
+#A\xbaLk\xf7\x95\xc5\xe3o\xcc\xe5\xf29\xbf\xa2\
+\xb4\xc6\xda?)\x93yF+\xb9M\x90RFzf\
+0\x9d~s\xae\xb7\x98\xffAn\xcd\xcd;d\xcc\x8b\
+Xi\x1b\xfeI\x1f\x1a\xdf\xdf\xbb\xfa\xc8\x91\xbf\xcf\xe7\
+6\xf3~I\xaf%\x1eo\xa5\xb5\x8f\xc2\xda\xf6\x15Q\
+\xacI\x82\xb5\xed\xf4\xfdGK\x8f\x1c9<\xdf\xdb-\
+\xd8&\x1d\xdduuk\x0bJJ~Fc\x1e\xc7r\
+>\xcc\xd3\xda\x03c\xa9\xd4\xafg\xda\xcf\xcf\x9a\x01\x00\
+p\xb9\xb6vU\xa8\xacl\x17\x8dy\x1a\xcbo\x00\xaf\
+S\xd6\xeeO'\x93\x07omo\xbf\xbaP7]\x94\
+mj\x86\x9a\x9an\x1e-,|\x11\xe4N\x907-\
+e\xea\x94z\x05\xfc\xadpd\xe4\xe7\xc57\x18X\xcb\
+\x1b\x03\x80\x89#\xcd\xc3\xe1\xfb\x10\x08\xbc\x00\xf2.,\
+\xcd#\xcd\xcfBz.\xe9\xfb\x89\x0d\x89\xc4\xa2\xbcM\
+\xba\xe8\x1b5}ZWWZ^R\xf2\x03\x8f\xfc\x89\
+\x80\xcd$\x8b\xf2\xbc\x8d\x1d\xa6t\xd6\x07^\xedO\xa5\
+\xde\xb9\xe3\xd4\xa9E\x1d\x8a\xcf\xdaNY\xc9\xe6\xe6\x88\
+\x05\xb6\xc3\x98\xa7Hn\xca\xc3\x88\xb0\x92>\x85\xb5\xaf\
+d\xac=\x5c\x99Hd\xe5\xe5\xc5\xacoU\xf6y}\
+}(\x1c\x0a5\x81\xdc-r\x0b\xc9j\xe5h\xcbd\
+\x02\xbe\xa4N\x92\xa7\x01\xbc\xb1:\x95j[\xc8\xf3\xe2\
+\xf3\xd2\x80\xff\xa9'\x1a-)4f\x93\xc8\xfb\x00\xdc\
+\x0f\xb2)k\xbb\xf7Jc\x90\xda\xac\xf4\x9e\x07\xc4G\
+\xad=W\x99H\xa4r\xf4\x10\xe4\x87R\xd1hU\xc6\
+\xf3\x1a-\xb9\x83d\x04\xd2z\x91\x15\x94\xc2s\xdeT\
+P\x12\xc8AHW@^\x92\xd4a\xa4\x96\x80\xef\x1f\
+\x9b\xeep\xb5\x15i\xc0W\xcc\x00\xf3\xefhtM\xb1\
+1\xeb|\xa9\x82\xc6D\x00T\x13\xd8(\xa0\x8ad%\
+\x812\x01a\x90\x81\x09\xd0\x19\x02\x83\x02\x92\x92z\x08\
+t\x098\x0f\xa0\xd3\xb3\xb6C\xe4\x95!k?\xbb%\
+\x91\xe8c\x9e-8\xfb/\xf5\x1c\xc1\x19[g\xef\x1c\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x09\xd5\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x09\x87IDATx\xda\xed\
+[}l\x13\xe7\x19\xff=\xe7s\x9c@\xf3e'\x8e\
+\xcf\x0e03 \x84I-\x1f\x9dT\xad\x8c\x91\x04m\
+j(\xda\xd4t\xfb\xa3\xa0\xa9Ch\x936>\xaa\xa2\
+\xc1\x0a\x7ftLZ'V@\x02\xdaM\x95\xd6\x0e\x0d\
+\xb6\xfd1@\x15\x0c\xbaB\xb0C\xd7\x0eM\xa2\x806\
+4\x0c\xae\x16\x1a\x92;;\xc1\x0e\x14\xd2\xd8\xb1\xef\x9e\
+\xfd\x81\xa3\x81}g\xdf9q\xcc&\x1e\xc9Rr\xf7\
+\xbe\xef\xbd\xbf\xdf\xfb\xdc\xf3\xf5\xbe\x07<\x92G\xf2H\
+\xca%\xa7\x03\xc1s\xdd\xc1\x9e\xbf\x95s\x0eb9\x1f\
+N\xa0\xa7\xc0\xe5]\x04\xa1\x1c\x0f\x0d\x87\xc3\x8e\xbe\xbe\
+>\xef\xf8\xff\xd7\xaf_\x97._\xbe\x5c\xf1\x7f\xa9\x01\
+\xf1x\xbc6\x91Hu@\xe0\xa5`,\x060\x1f\x80\
+\x1b\x00\x8d\xb7\xa9pT\xcaNG%\xcbJ$\x0a \
+\x04\xc6E\x80>L&+\x02~\x7f\xfd\xad\xd2ja\
+\x09\x84\x99\x1dJ4\xda\x05\xa6\xef\x02\xdc\x0e\xc0\xae\xd7\
+\xee_WB\x00\x80\x05\xad\xf3\x8d\x86J\x11\xe8\x0c\x13\
+\x1f\x1c\xb9s\xe7\xc8\xdc\xb9s\x93\x0f5\x01\xa1P\xa8\
+\xba\xa6\xaen=\x18\x9b\x004\x15jo\x82\x80\xfb%\
+\x0a\xc6^Q\x14\xf6\xbb\xdd\xee\xbb\x0f\x95\x0d`f\x8a\
+D\x22kkj\xeb\xc2`\xbcf\x06|\x11\xd2\x04\xc2\
+kiU\x0b\x0f(\xca\xf7&k\xf1&L\x80,\xcb\
+\xb3\xe4H\xf4\x8c\xc6x\xbbD\xc0\xb3\xc5C\xa0w\x94\
+H\xe4t,\x16k.+\x017n(\x9d \xe1\x02\
+\x01m\x16\xbbj\x00b\xf7\xdbJ\xc0\x9aCdFG\
+r,ui` \xfa\xf5\xb2\x1000\xa0\xac\xb7\x89\
+t\x0c\x80\xd3D\xf3\x18@\x07\x09\xbcV <\x9eL\
+\x8cN\xf7J\x9e\x86\xf1\x9b^\xc9\xe3R\xd3\xa9\xe9j\
+\x9a\x9e`\xf0Z0\x0eeH)$.\x12\xf8\x84,\
+\xcb?\x98R7(\xcb\x91W@\xf8\xb9\x89\xf7\xf0,\
+X\xdb'I\xd2q\x22J\xe9\xdcW\xc7\xff\x981c\
+\xc6(\x80\x7fd~\xbfef\xbb28\xb8\x0a\x1a6\
+\x01\xbc,/\x06\x12~\xad(\xd1\xc7$\xa9iw\xc9\
+\x09\x18\x18P\xd6\x17\x04O\xb8\xa4\xa5\xf9\xe5\xe6f)\
+X`\xb8\x8d\x86C\xdc#\xec(\x80\xa3\x91H\xa4]\
+\x03\xed\x01\xf3\x13F\xcd\x19\xfc\xba,\xcbw\xbd^\xef\
+[%s\x837\x14\xa5\xd3\x06:\x06\xc0f4i\xd6\
+x\xc7\xd5\xabWv\xb6\xb5\xb5\xa5'9\xb6\x10\x95h\
+\xf4'`\xbc\x9ag\xe1\xd2\xac\xd1J\x9f\xaf\xe9\xd4\xa4\
+\x13 \xcb\xf2,\x06]$\xa2z\x83\x19\xdeL\xa7\xb9\
+k\xe6L\xef\x07\xa5t\x01\x8a\xa2,g\xe00@.\
+\x03\xaab\x9aZ\xb1\xb0\xb9\xd9\xd5?iF\x90\x99\x09\
+$\x1c\xc8\x03\xbe_\xd3\xc4\xa7K\x0d\x1e\x00$I\xea\
+a\xcd\xbe\x94\x01\xd9`M]dK\x1d\x98T/ \
+G\xa3k\x01,7\xb8=\xa4\xd9\xc5\x8e\xe6\xe6\xc6k\
+S\x95\xc0\xf8|\x0d!\xd8\xc5\x8e,Wz\xbfZw\
+\xf4+\xca\x8b\x93\xf2\x0a\x84B\xa1\xea\x9a\xda\xdaO\x00\
+r\xeb\xc5\xea`\xa1\xc3\xebu\xff\xb5\x1c\x99\xdc\xbd\xd7\
+\x81N\x1b\xd8\x84\x88@\x98\xe3\xf1xF&\xa4\x015\
+5u\x1b\x0c\xc0\x03\x84\x9f\x96\x0b\xfc\xf8\xeb@\xa0\x9f\
+\x19E\x8c\xaa\x8a\x0d\x13\xd2\x80p8\xec\x98\xfeXu\
+_&}\xcd\x8e\xc4.y\xa5\xa6'\x89H\xd5M\x83\
+\xb1u\xa6j\xe7N\x01ha\xa0\x92\x19\x11\x82\xf6\xd1\
+?\xd3\xe7{\xda\xd0\xa3\xeb!\x18\xaf\x8aq\xf1\xf3v\
+\x0dx\xdaF\xe4\x01(\xa9\x81C\xe9\x94\xf6\x9e\x07\xbb\
+z\x8d\xbc\x83\x1c\x89~L\xc0\xe3zZ0r\xf7\xce\
+\x17\xf2e\x91T\xc0\xf2\xaf\x06\x09\x87\xf4\x9eK\xe0v\
+I\x92zrC\xbe\x0d\xcd\xb0O\xdb\x0d\xe0y\x90\xae\
+\x86\xf5\x91\x8aW\x9c\xea\xce?<@\x98m\xcbj\xb6\
+\xe1\x17\x00\xcd\xd0aF\x03\xf3\xbbH\xa7_ra\xcf\
+\x8d\xec\xdb\xfd\xfd\xfd\x1d\x82M\xec\x86\xfeD_\xf0y\
+<\x7f,\x92\x80\xc8\xfb \xe8\xc5\xdag\xbd\x92'\xc7\
+(\xde\xb4o\xfe\xb2\x00\xf1\x04\x13\x1a\x0b\xaa\x1e\xe3\xad\
+\xfa\xd4\xf0\x06\x00\x88\xdb\xeb\xde\x00\xd1\xf7\x0b\xbb#\xc4\
+\x18\xea\xca\x86\xd4\xae\xbf\xe7\xceU\xf9\x00D_\xd5\xe9\
+\xf4\x17\xaf$=c\x99\x80\xe1\xe1\xe1\xba\xd1DrP\
+\xb7\x98\xc1Z\x97\xd7\xeb=\xfa\xc0\x04\xb0y\x96\xc3.\
+~\x0c\x82\xcbt\x10\xc2\x18\xca\xacR\xa3\x85>1J\
+\xa5\x97\xd4c\xf7\xa7\x0f\x04i\xb2\xdce#\xe1\xb0\x9e\
+\xa1\x1euT4~\xd1\xe9\xbcm\xc9\x08\x8e\x8e\x8ev\
+\x18Trb\x92$\x1d\xcf\xbeX)\x8a\xfb\xad\x80\x1f\
+\x07n\x05|\xa6\x8fK\x15mod_o\x96\xa4c\
+\x06\x09\x94\xbd*\x91j/\xc2\x0b\x08K\x0d\xd6\xe0d\
+vbs\x13/\xb52\xf1\xb3Se\xfd\x89\xb02\x86\
+\xcd\x0brr\x07\xa2\x93\xfa\x1d\xb4\xa5E\x10\xc0\x8bu\
+\xafjZN\x82#\x88\x15\xcf\x82\x880u\x0c\x10\x89\
+\xb6\x959sS\xd9 \xf9\xa2\xc5\xd6\x09 j\xd1\xad\
+d\xd8\xe8|\xce5\xc2\x97\xa6:\x06`\xa2\x059\xf3\
+\x10s\xe7\x961t-\x96\x08`f\x87\x9e\xef'\x22\
+-=:\x1a\xce}\x00U\x95!\x0e\x9a\x96sel\
+,\xacWYb\xc0c\xb4\xef \xe8\x97\xban\xba\xf4\
+<\x043\x0f\xfb\xfd\xfeD\xee\x03xp\xaa\xd1\x13\x10\
+\xcd\xbe\x96)\xaa\x0c\xeb5w\xbb\xdd\xce\x82n\xf0t\
+ x\x8e@O\x99x\xbe\x0a`\xe3\x8a\xf6\xe5\xbf\x02\
+\x80x\xc5\xd6\x17\x18\xf8\xfd\x14\x13\xb0\xda9v/\x98\
+\xea\x0e\xf4\xfc\x10\xc0>\xa3:EV\xc7s+\xda\x96\
+\x7fEW\x03\x88\xa8\xa8\x9d:u\x8c\x8f\x83q{\xea\
+\x0c\x00n\xabc|\xbc\xa8\xbe\x9a\x89@\xa8\xafo\xc8\
++\xda\xd5\x01\xbd\x18\xe0\xfeb\xe6\x03\xaeP\xfc\xf1\x16\
+\x12\x84\x9dS\x82_\xd3\xb66\xa4_\xff\xa5n\xc9N\
+VbD\x94\xa3\xeev\xd1\xe6mllTL\xd9\x80\
+d\xf2V\x0c\xfaejgooo\xa5^\x1fWz\
+\xda.\xd2\xf8\xcf%G\xaf\xe1D }]\xb7\xf8\xd9\
+\xdb\xdb[iP\xb4\xe1\x86\x86\x86\x98i#\x98\xc9\x9e\
+\xf4\x0c\x1bUUU\xcd\xd5\x7f\xb5vh\xb7\xd3\x83\xdf\
+\x06\xf0~\x09\xe1\x9fr\xa6+\x9f\xff\x0e\xfe\xa4\x9b\x81\
+\x8a\xa28O_\xaby\x90\x88\xc6\xac\xd6\x03B\x06.\
+\xf2I\xa3\x0e~\x1cH|6\x16\xfdV\x89H8\xe5\
+\x1c\xab\xfc&aG\xc2\xa8\x81(\x8aK\x0c,_\xa8\
+\x88@\x08\x17t\x0d\x1eS{\xbeY\x96\x88\x84\x82\xe0\
+\xef-\x8e\xc1\xdc\x0c\xb0\xe4'@\xa3\x0f\xf5\xc7\xe2N\
+f\xb6O!\x09&\xc1\xb3\x9d\xc1\x9dV\xb0\xe4% \
+\x99\xfc<\x00 \xa5\x13\x0d:\x15EYUh\xd6\x93\
+D\x82)\xf0\x99\xfa\xe0*=\xeb\x0f \x95\xc1b\x8d\
+\x00\xbf\xdf\x7f\x8b\x19\xfa\xc9\x05\x09\x1b\xcd\xcc~\x82$\
+\x98\x06\x9fY\x99M\x06\xba\x11\xf0\xfb\xfd\xb7\x8a\xc8\x06\
+\x01\x02\xfd\xce\xe0\xd6\xd7\xfa\x15\xa5\xad\x84$X\x02\xaf\
+(J\x1b@\xcb\xf4m\x16\x1f\xcc\xd77/\x01\x92\xe4\
+>l\xe0\x0e!0\xed\x09\x06\x83b\x09H\xb0\x04>\
+\x18\x0c\x8aL\xc2\x1e\x83\xdb\xd1\xc4\xc8\xc8\xe1\xa2\x09 \
+\xa2$\x18{\x0d\xd4cakk\xeb\x16\xb3Kj\x92\
+\x04kj\x0f\xa0\xa5\xa5u+\x98\x17\x1a\xbc\xaa{\x0b\
+\x9d+2\xb112T]S\xab\x86\xa1s\xfa\xe3\xde\
+f\xa8\xba\xc2\xeb5\xbf%\xd6\x8b\x17+k*\x9a\xde\
+\x05\xf0\x8d\x89\x82\x97ey\x19\x09\xb6n\x03\xaf\x14\x15\
+m\xc2\x9cB\xe7\x89\x0an\x8c\xcc\x9f\xdfx\x87\x09\xdb\
+\x8d\x5c\x0f\x88\x8e\x0c\x0d\x0d\xcd\x9b\xa0&X\x06?4\
+44\x0f$\x1c1r\xc9L\xd8f\xe60\x95\xa92\
+\x163\x93\x12\x89\x06`\xb8?H\xfd\xac\xa5W\xf8|\
+\xbe\xabV4\xa1\xd6\xee\xfe\x0d\x00\xd4\xa7\xaa\xd6Y\x05\
+\x9fJkg\x00n6\x00\x15\xf4x\x9a:\xccd\xb7\
+\xa6\xebx\x03\xf1\xf8LJ\x8e]\x84\xd1\x91\x18\xe6\x9b\
+\x80\xad\xcb\xebu\x97t\x87X\x96\xe5e :\x02P\
+\x83A\x938k\xea\x22\x9f\xcf\xd7gf<\xd3g\x84\
+|Ng\x1fAX\x83\xfb\x8e\xb5d\x19\x84\x06\x12\xb8\
+[\x96#\xdb\xcdz\x07K)0\xb3M\x96\xe5\xed$\
+\xd8\xba\xf3\x80W\x09\xbc\xc6,xK\x1a\xf0_\x9f;\
+\xf8#\x86\xb6?o_\xa2K\xc4\xda\xcb\x92\x94\xff\x88\
+L\xa6\x92\x83\xf1\xca\x92\x91\xf4+J\x9b@\xc2\x1eC\
+k?\xce\x11x\x83O\x92\xde\xb4\x82\xc7\xf2)1I\
+r\xbf\xc9\x1a\xb6!\xdf\xb16\xe6\x85\x0c\x0a\xc8J\xa4\
+G\x96\xa3\xcf\xe5\xc9\x1d\xf6e~\xba\x06V\x96\xe5\xe7\
+dE9+\x80\x02\x05\xc1k\xd8f\x15|Q\x1a\x90\
+\xa5\x09{M\xd5\xe1\x808\x08'YU\x83\x9a\xa6\x9d\
+O\xa7\x9b\xaf\xf9\xfd\x94\xe8\x0e\xf4pF\x03\xa8\xb7\xb7\
+\xb7R\x14\xc5y\xa2(.a\xa2v\xd6\xb8\xd3 \xb6\
+\xcf\x0d\xf6\xc0\x9b\x8a\x01?!\x022!\xe83\x0c:\
+\x04sg\x05\xb3\x16\x98\x87\xaf\x84\xae:\x01`A\xeb\
+\xfcXf\x0c\xb28\xc8\xb0FX3C\x92N\x16\x8b\
+aB'E%Iz\x8f\xb5\x8aE`\xee\xb1J|\
+\xd6\xea\xba\xac/\x06\xf7$\x13\xbch\x22\xe0'L\x00\
+\x00\xf8|\xce>I\xf2\xb43a\x1dtj\xf5\x93-\
+\x04DY\xc3:\xc9\xe3i\x9f=\xdb\xfb\xe9D\xc7\x9b\
+\x94\xd3\xe2D\xc4>\x8f\xe7\xed\xcfn\xdf\x9a\x0b\xc26\
+\x22*\x05\x11Q0\xb6\xdbl\xc2\x1c\x9f\xcf\xf3v\xb1\
+%\xfcI\xb5\x01F\x12\x0e\x87\x1d\xd5\xd5\xd5]\xda$\
+|0\x01p\x00\xcc\x07%I:LD\x0f\xf7\x07\x13\
+\xba\xe6?\x1e\xaf\x1dI$:l\x82\xb0\x14\x8c\xc5D\
+haF\x13\x00\xca\x22\x80\x89\x10e\xc6U0.\x00\
+\xdaGUUUg\xea\xeb\xff\x07?\x991\xa3!\x0e\
+\x87\xc3u\xed\x93\x7f\x0f\x00\xc0\xbc9\xb3}\xc9d2\
+V\x8aOb\x1ej\xe9\x0e\xf4\xf0x,P.)\xeb\
+w\x83 \x9c\xcb\xde\xab{$\x8f\xe4\x91L\xa9\xfc\x07\
+\xdcL.\x17_\xae_\xf9\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\x02_\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x02\x11IDATX\xc3\xcd\
+\xd7?O\x14Q\x14\x05\xf0\xdf{.\xac\x09\x09\xd1\x86\
+Ph\x82\x95\x16\x9aH\x5c\xe80kBAl$R\
+\xe0\x87@k>\x82\xb5\xf0!\xa4\x90H\x83\x14&n\
+\xb0\xe3O0\xc1\x02+I\xb4 4\x18\xe2&\xb2l\
+\xe6Y8\x8a\x04\x04\x84e\x97S\xcf\xbc{\xeeyw\
+\xee\x9c\x13\x1c\x83\x94\x04\x15\x1d\xea\xba\x14\xf4\x8b\xca\x92\
+^\xf4\xe0j\xfe\xd8\x16\xd6\x05+2\x15u\x0b\x0a6\
+\x95UC\x90\x8e:?\x1cY|V\xa7\xa2\xdb\x82'\
+\xa2G\xb8~\xdc;H\xf8\x82\x19\x99)?\xac\x86\x87\
+\xb6\xff\x8b@\xde\xf5M\x8c\x08\xc6\xd0\xedt\xd8\x90L\
+\xaa\x9b6h\xed05\x0e\x10HK\xdaT\x0d\xc8<\
+\xc3\x90\xa0\xe8,Hv0'\x99\xd0i>\x94\xec\xfe\
+\x93@Z\xd2\xe6\xbb!\x8c\x0bJ\x92v\x8d@P\x93\
+,\xcb<\xd7\xe9\xcd\xdf$\xe2>\xd9\xab\x060\x8e\xbe\
+\x86\x15\xff\xa5B;J\xa2q\xdb\xee\xa7\xb4\xd7\xf8\x1f\
+\x02*n\xca<\x13\x94\xd0\xa6\xf1h\x13\xdc\x13<\xf5\
+\xd6\xad}\x04\xd2\xacN\x8c`\xa8\xa1\x9d\x1f\xae\xc4\x90\
+\x82\xc7yM1%A\xd1m\x8c\x9dy\xe0N6\x0f\
+E\xc1\x98\xcb\xee\xa4$D\x15\x1d.\x19\x15N\xfd\xa9\
+\x9d\x06\xdd\xa2Q\x15\x1dQ]\x17\x865\x1b\xc9\xb0\xba\
+\xae\xa8\xa0/\xdfp\xcdEpMA\x7f\xc4\x83\x13\xac\
+\xd7\xf3\xa1\x10\x95\xa3\xe8\xaeV!\xe9\x8d\x92\x1e\xad\xc3\
+\x8d(\xfc\xf9\xa5\xb6\xe2\x12\xaeD-F\x94l\xb5p\
+\x06\xbeE\xc1z\x0b\x05\xf8\x1ce>\xb4p\x06V\xa2\
+\xe8]n\xa3\x9a\x7f\x01\x99JT\xb3\x98{\xb8f\x97\
+\xff\xaan!*\xd8\x94\x99i\x81\xfc\xaf\x15lFe\
+U\xc9Kl4\xb1\xfc\x86\xcc\x94\xb2j\x0cA\xb2\xe3\
+\xa3d27\x90\xe7-\xfd\x8ed\xd2\x0f\xab!H\x11\
+r\xdf\xfe\x0as\x82\xda9\xca^\xc3\x9c\xba\xe9\xdfY\
+ao\x13\x96}\x12\xbd\x90,\xb1\xdf:7\x08\xbb\x92\
+e\xc9\x84Ak\x07Li\x08\x92\x0e\xef\xf1\x1c\x8b\x0d\
+U\xe2\xd7YK\xb9-\x9f\xff;\xa0\x5c\xac`r!\
+\xa2\xd9\x85\x08\xa7\xcd\x8c\xe7?\x01\xd7+\xd28\x9bT\
+\xbf\xab\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03N\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x03\x00IDATX\xc3\xc5\
+\x97\xcdK\x5cg\x18\xc5\xcfy\xde\xeb\x8c:\x83\x10\x8d\
+N\x85\x0a6-$\x14\x84\x08\xd1E\xc0fB\xa1H\
+6\x06\x84d\xd1?\xa1IKw\x81\xfe\x03-d\xd5\
+\xb8\xea\xba\x1b\x03\x82\xd9\xc8\x10\x081\xc9\xa2`\xa6\x18\
+p\xd5M\xb1D\xe88\x13\x15Bn'\xe3\xdc\xf7=\
+]\x8c\xa9\xd3\xd8\x1a\x13'3gu\xe1~<\xbf\xe7\
+\x83\xf7>\x87x\xb3\x88\xfb\x83\x99t\xcc!\xeb\xe2\x84\
+\x83]\x94x\x96\xd4(\xc0\x13\x8dG\xb4#p\x9d\xd0\
+\x13\x8fp?\xd4\xf5\xb8\x96Q\x19\x17+1\x00\x1d\xfe\
+\xf1\xc3\xb4\xd4\xdf\xd7\x83h\xcc\x9c\xbb\x02\xf02\x81\x11\
+\x82\x87\xbe#H\x02\x9e\x02Z\x0c\xde\xdf\xae\x22Y\xc3\
+\xa5\xed\xe7o\x07 0uw\xf8t\xe41k\xce\xbe\
+\x220\x8cw\x90\xa4R\xa0\xe6\x12`a\xf7\x8b?\x7f\
+\x03\x0fV\xe3 @\x11]\xdd[\xb9\xa9H\xeek\x10\
+\xd3\x04\xd38\x86\x04\xd5 \x14\x12\xfa\x1f_\x0el>\
+\xc29\xd4\xff\x1f\xa0\x88\xae\xde\xad\xdc\xb4\xc1\xdd\x00x\
+\x8e@\x0a-\x90\x80]@\xc5\x00\xff\xfd_\x03\x9b\x85\
+f\x08k.{\xf7Vnj/\xf8D\xab\x82\xefe\
+\x99\x028ap7\xba\xb7rS\xd0~\xe2\xee\xd5E\
+\xea\xfc\xf0\x99.\xd9w /\xb42x\x13\x84\x03\x98\
+3q\x00\xbfg\x9f\xf8\x9f_<\xdb\xaf\xc0R\x7f_\
+\x04\xcc6z\xde\xfa\xe0\xff\xaa\x041\x1d\x01\xb3X\xea\
+\xefk\x00\x08\xecA4f\xe2\xb5\xe3\x0e\xdc\xd1 \x98\
+6\xf1Z\x0f\xa21\x08t\xc8\x0ffS\xde}cf\
+\x9f\xa3M\x22\x99\x15\x10\xd77z\x1eY:\xe6\x10\xcd\
+f\xd0f\xd1l&\x1ds\xc8\xccq\x92\xc0H\xdb\x01\
+\x80\x11s\x9c4g\x96\x7f\xd3\xf1\xfa\x9ef\x81\xce,\
+o\x02\xcf\xa2C\x920n\x84>\xea\x14\x00\x89Q\xdb\
+\xff\xa5v\x04\xe1\x84\xa1\xc32@;\x9d\x0b\xaf\x1d\x93\
+\xb0\xde\xc1!\x5c7\x12\xab\x1d\x1c\xc2U\xf3!,\x0b\
+R\xdb\xb3\x87\xe4CX\xb6\xe0\xb5\xd2\xd8\xe1\xda\x0d\x80\
+\xa7\xc1k\xc5j\x19\x95\x15\xc2\x9d\xb6\x03\x84p\xa7\x96\
+Q\xd9\x90\xaf\xc4ra^R\xa9}\xc3\xa7\x92\x5c\x98\
+G\xbe\x12\x1b\x08U\x93d-Ps\x82jm\xe8}\
+-Ps\xd5$Y\x03\xa1\xc6Ati\xfby\x02,\
+@(4\x16\xc8\xf7\xd6\xf7]\x08\x85\x04Xx\xe5\x15\
+\xfe\xd9\x09\xfd\xc7/\xb6\xed\xc3\xde\xb2\x91\xa7\x01~\xc0\
+\xa6{-\x0a^\x07TL\xe4\x7f\xa8\xfdR\xfa\x15\x0f\
+\x1a\x1ea?\xc8\x03(\xf96\xde\x88\xaa\xbd%\x82\xa7\
+\x00\xe6Z\x05\xd1\xbc\x96WOn\xde\xc3\x97\xf0\x87\x1a\
+\x93L%\xf7\x19\xcd]\x07ZdL\x80\x82\x82\xbf\x15\
+\x0fn>|\xdd\x98\x1c\xcc\xf0'\x84\xfa'\xf1\x1f\x18\
+\xc9\xae\x12\xa8P\xf8\x94d\xf6\x18\xd6\xecf\xbd\x8e\xb9\
+\x97+\xa5bs\xe6G7\xa7Q4FoWi6\
+sds*l\x88aQ\x0c\xf3\xd5\xe4]\xcc\xe9k\
+F\x15\xcb{\xf6\xdcq\xd2\x99\xe5%\x8c\x93\x1c\x05\xf7\
+v\x09iG\xd2:\x89U\x1f\xc2r\xf0Z\xa9eT\
+F\xbe\x12\xff\x97!m\xd6\xdf\xfa>V\xf5\x0d\x91\x10\
+\xe7\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03V\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x03\x08IDATx\xda\xed\
+\x9b]N\xdb@\x14\x85\xcf\x1d\x85%P\xf6\xe1\xc1\xdb\
+(\xaaD\x0aA\x81G\x8aD+\xd6R**\xf1\xca\
+_(\xadT\xa9\xdb\xb0=f\x19D,\xa1\xf1\x1c^\
+\x1cd\x8c\xf3\x87\xec\xd8\xc4s\xa5H\x965\x89\xe7|\
+\xb93s\xe7^\x0f\xe0\xac\xdd&u=\xd8\x18\xb3M\
+\xf2\x14\x00E\xe4\xc4\xf3\xbc?\xad\x01`\x8c\xd9%y\
+\x09\xa0\x93\xde\x1a\x89\xc8\x81\xe7y\x83\x95\x07P \x1e\
+uB\x90\x86\x88\xaf\x0d\x824H|-\x10\xa4a\xe2\
+\x97\x0eAU\xfd\x800\x0c\xbb\x05\xe2\xff\x174\xcd\xde\
+\xeb\x90\xbc\x88\xe3\xb8\xfb\xee\x01\x88\xc8YN\xfc\x08@\
+\xbf\xa0i\x9f\xe4(\x0b\xc1Z{\xb6\x0a\x00\x98\x15o\
+\xad\xdd\xd7Z\xdf\xe5\xdbi\xad\xefD\xa4\x9f\x02Z\x9a\
+U\x0e\x80\xe4\x11\x80G\x00\x8f$\xf7|\xdf\xbf\x9d\xd4\
+Vk\xfd\x8b\xe4\xde\xb8=\x80\xa3\x95\x8d\x04\xa3(b\
+N|-}Qh\xb99\x00\x0e\x80\x03\xe0\x008\x00\
+\x0e\x80\x03\xe0\x008\x00m\xb5\x99\x09\x8a0\x0c\xbb\xe9\
+\x96\x16\x00\xbeh\xad\xff\x96\xb4I\x1a\x8a\xc8\xc6\xf8\xba\
+,A\xf7\xf7\xf7\x9f\x92$9O\x7f\xf7xss\xf3\
+\xf7\x9b= \x08\x82\x9e\x88\xdc\x00XO?\xe7\xa5\xb9\
+\x9eR\x87\x00\x1eH\x0e\xd3\xebR,\x15\xbf\x0e`]\
+Dn\x8c1\xbd7\xed\x06\x83 \xe8)\xa5.r^\
+\xf2\xa8\xb5\xfe\xd0d\x976\xc6\x0cIf\xfb85\xbd\
+\xa6\x16\x10?\x22y\xdc\xf41m\xad\xfd\x8a\x97I\x95\
+\x0e\xc9\x8bI\x9e\xa0\x0a\x08\xee\x16\x89\xb7\xd6\xee\xcf\x1a\
+OM\xb0\xb4\x8f\xaf\xd2k\x93 H^\xfc\x84\x04f\
+\xbf(\x8d\xd5dK'\xefk\x00k\xd3\x86\x83d\xc4\
+o\x93\x1c`\xfe\xd4\xf5\xdc\xb3\xbdR\xea\xd0\xf3\xbc\x7f\
+\x8b|/\x8e\xe3\xad$I\xce\xc7+E\x896\x12\x91\
+\xde\xb8\x16\xa92\x1d=-[<\x00\x88\xc8\x06\xc9\x85\
+W\x8f\x8a\xc4\x8f\x87\xc3\xf7\xa29\x80U\xb9#Ii\
+\xeaPQ\x99\x7f\xea\x04\x15\xa4\xa4I\x0eI.\xbc\xce\
+\x8f\xe3\x84\x0a4\x8fR\xad\xab=\x09\xc6q\xdc\xb5\xd6\
+\xce\x9c\x04_,\x83\x9e\xe7\xdd\x8a\xc8~\xce\x13\xd6\x00\
+\x5c\x07A\xb0\xfb^\xc4GQ\xb4\x93$\xc9\xcd,\xf1\
+\x85q\x80\xe7y\xb7\xd6\xda\x83|0\xa1\x94\xba\x5cF\
+\xad\xae\x8c\xe5\x0f\xc0\x95\x88t\xe6\x89\x06\x0b#A\xdf\
+\xf7\x07E\x10\x96Q\xab+\xc1~\xe6\x83\xb8\x85C\xe1\
+)\x10\xca\x1c\xa3[a\x18>\x84a\xf8`\x8c\xf9X\
+\xe2\xb2\xcby\xc5\xcf\xdc\x0d\xfa\xbe?\xa8\xaaV7^\
+\xe7\xdf\x1a'L\xb1\xe7Z\xa4Rjo\xd6;\x06\xae\
+6\xd8\xf6\x8c\x90\x03\xe0\x008\x00\x0e\x80\x03\xe0\x008\
+\x00\x0e\x80\x03\xd0V\xebT\xfd\x80EkuU\xd5\x22\
+k\xf3\x80|\xadnZf)\x8a\xa2\x9d\xaaj\x91\xb5\
+y\x80\x88\x90|\xde\xf8u\x94R\x97Q\x14\xd9\x02\xf1\
+\x9fI\xe639\xef\x7f\x0e(\xaa\xd5\x01\xb8*h\xfa\
+*\x8d\xb5\x8cZd\xeb\x0fL\xb8#3\xcb\x1co\xad\
+>45\x07\x84\xd5?67\x05B{\x0eNf \
+l[k\x7f\x00\x80R\xea[]Gg\x9d\xb5\xdd\x9e\
+\x00\x0a\xa1\xdd\xdd\xf4\x8es\xe0\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x03\xa8\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00(\x00\x00\x00(\x08\x06\x00\x00\x00\x8c\xfe\xb8m\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x03ZIDATX\xc3\xd5\
+\x98=L\x1cW\x14\x85\xbf\xfb\x96\xfd\x09\xb3\xebj\xc1\
+^\xba\xc4\x98\xda&\x8a-\xe8H\x15b\x09\x12\x11\xad\
+D*Zz\xbb\xcd\xca\x9b2\xa9\xdc\xc4]\xbaDA\
+\xb6b(\x0cE$\xba\x8d\xec(\x90\x1a\x12J6\xc0\
+V\x1e\x86\xec\x0c\xde9)@\x18\xc5\x0b\x18\x0c\xec\xe4\
+TS\x8c\xde|:\xf7\xdey\xef\x1d\xe3,Z\xec\xc9\
+\xe7#w\x1b\xdc00\x88\x18\xc0\xac\x04\x5c\xd9\x7f\xe3\
+%R\x1dc\x05X\x82\xb8\xb6\x9d\x89_0\xb2\xb5}\
+\xdaO\xd9[\xbfY\xc1u\x0f\x15o\x1a\x99\xb2\xc1\xe7\
+f\xf4\x09<\xc3\x8e]CH\x06\x81\xc4\xba\xe0g\x11\
+\xcd\xec\xfc\xda\xf8\x83\x07\xc4\xe7\x03(,\xfbK\xef\xfb\
+\xe9V\xea>\xe6\xc6@\xd7\x0csg1^(\x06\xfb\
+\x1b\xc5s\xbbq\xeb\xdbpts\x0dCg\x07\x5c$\
+\xe7E\xa5\x09\xc3*@\xffIn\x9d\x12vU\xb1\xaa\
+A\xae\xfe\x98\x11\x9a\xa7\x07\x5c\xec\xc9{Q\xd7\xd7&\
+7mF\x96\x0b\x90D(\x8b\xbf\x0b\x9a\xbb_1\xde\
+\xf0\xdf\x1ep\xaeP\xf4\xb2\x85\xef\x0d\xee\x9e\xa7kG\
+\xf5\xa8\xc4\xb3 \xf2\xa7\x18\xf3\x1b'\x03\xce\x16\x0b^\
+.\xf3\x83\xc1\xa8a).AB-\xc1|\xd0\x8c\xbe\
+\xfc\xaf\x93\xee\x8d\x9e\xcb\xa5\xab\xfb\xce]\x0a\xdc\x9eK\
+\x962\xb8\xeb\xe5\xd2U\x16\xc9\xb5\x07\x14\xe6E\xa5\x09\
+\x93\x9b\xbe\xe8\xb2\x1e\x01i&7\xed5K_\xa0\xd7\
+\x95=x\xc8>\xeb\xbd\x9eNu\xcd\x1bv\x83\x0eJ\
+hu\xb7\xf5j4\xfct\xf3\xaf\xd7\x0eVpi\x97\
+\xba\x07\xf4\xd3y\xf5\xa7]\xea\x1e\x95=6\x07\xd0=\
+T\xbc\x89\xb9\xb1N\x94\xb6]\xa9\xc1\x8dw\x7fT\xbc\
+u\x00h.S\x06]#)2]\xb5\xaeLy\x0f\
+x\xb1'\x9f\x0f\xd3\xbf\x9b\xd9\x00\x09\x92\xa4\x95\xed\xec\
+\xee\x87\xcek\xba;f\xf4\x910\x99\xd1\xe75\xdd\x1d\
+g\xce\x0d\x09\xbc\xa4\x01\x0a<3\x1bv\xc0`\x12\x86\
+\xa3\xfd\xb0\xd8\xa0\x03\x06H\xaa\x8c\x1b\x0eY_b\x01\
+e}\x0e\xa3\x90`\x07\x0b\x8e\x84\xcb!\xfc\xe4\x96\x18\
+\xdfaZOn\x89\xb5\xee\x10\xab\x09vp\xd5\x81\x96\
+\x84\x94<6\x09\xb4\xe4$\xd5\x0c\x82\xe4\x0d0\x81\xa4\
+\x9a\x0br\xf1s\x89\xc4\xf5\xa1\xc4z\x90\x8b\x9f;F\
+\xb6\xb6\x05O\xf7.\xd5\x89)o,x\xca\xc8\xd6\xb6\
+\x03\xd0\xabh\x06\xd9F\x82v\x90\x0d\x99f\x0e\x0e\xac\
+;\xbf5\x96\xb1x.9\x0d\x18\xcf\xed\xd4\xea\xcb\xff\
+\xa3K\x13\x10\x8en\xae)VU\x22\xec\xe0`\x84\x8a\
+U\x0dG7\xd7\xde\xbc\x17\x1b\x0ar\xf5\xc7\x22~\xd4\
+\x89\xff\xa2\x90D\xfc(\xf0\xebO\x0e'^\xed\xa3\x8f\
+l\xe6G3>\xb9\xd4\xe8C,\x04a4y|\xf4\
+\x010\xde\xf0\x83\xc8\x9f\x92X\xb8\x0c'\xf7\xc3\xa3\x85\
+ \xf2\xa7\xda%\x5c\xed\x8f[c~#\x08\xa3II\
+\x0f\xc5\xc5\xf5\xa4 \x94\xf40\x08\xa3\xc9v\xc9V\xfb\
+\x12\x1f\xd6\x0c\xefy\x85\xd2\x84\x99U0\xae\x9fs\x80\
+\xf9\xa7b=\x08\xfc\xfa\x13\xca\xfcs\xcc\x96w\xe2J\
+\x96\x9d\xef\xfd \x9dJ\xdd\x077\x06\xba\xfa\x8e\x11\xf0\
+\x06\xc4s\xbb]\xado\xc2\x8f\xdf5\x02>\xac\x0a\xae\
+{\xb8t\xcbdes|f:e\x88n\xacK\xcc\
+\x8a\xe8\xa7\x9dZc\xf9\xfcB\xf4v\x9a-\x16\xbcL\
+\xea\xb6\xa5l\x18\xd9 \xb2\x01\xb0\x12\xa6+\xfb[\xd5\
+KP\x1d\xd3\x0a\xa6%\xb5T\x0b\xa2\xd6\x8b\xa3b\xde\
+\xe3\xf4/:n\x97\x97(,\xc9\xa3\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x01\xcd\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x01\x7fIDATH\xc7\xb5\
+\xd6\xb1K[Q\x18\x05\xf0\xdf\xbd\xe8b\x04\x07\x077\
+\xdb\xa9\x15*\xe8\xd0\xa1X2d\xa8\xfdG\x0a\x82\xdd\
+\x95\x82N\x0aUw\x0b\xd2\xfe\x15n\xea\xd0!(\xed\
+fA\xa1:\x85l\x1d\xb2\xa9\x83\x86\x5c\x87\xbch\xc5\
+$\x18\x93w\xd6{\xdf9\xf7;\xef~\xdf\xb9A\x07\
+\xa4]#\x0a\xa6E\xf3\x829\xccb<[\xae\xe1X\
+r\xa4a\xdf\x98\x93\xf0\xd6U;\x9e\xd0\x96\xfc\xd0\x0b\
+\xd7\xd6Q\x14Lv\xda\x87\x84\xaa\xa4\x8c\xd5PR\xe9\
+*\x90v\x0c\x9b\xb2\xa8\xe1\x8b`B/H\xfea\xc3\
+\xb9\xed\xb0\xe0\xe6\x91@\xda1\xec\xb5O\xd8\xc2\xa8\xe7\
+\xe1\x02\xcb\xce|o\x89\xc4\xbb\xa5)\x8b}\x92\xcb\xbe\
+\xdd\xf4\xca\xe7\x07\x15d\x9e\xff\xee\xd9\x96\xeev\xbd\x0b\
+%\x95\x98v\x8d\xb8\xb6>0\xf2\xe6\xb1'\x04ki\
+O!*\x98F\xd1\xe0Q4\xe4M4\xe4Cv\x15\
+\x07\x8dI\xd1|\xd4\xf0\xbe\xcb=\xef\xcf\xa8`.\x8a\
+f\xe4\x87\xd9(\xdd\xb5\x7f\x1e5\x8cG9#\x0aj\
+\xb9\xb1'\xb5(\xf9\x93c\x01\xc7Qp\x98M\xc5\xc1\
+\x9f?9\x8a\xea\x0e$\xd5\x1c\x04\xaa\x1a\xf6\xa3K'\
+(\xe7 PVw\xda\x1cv?\xbd\xc4\xaf\x5c\x86\x1d\
+\x84\x92\x8a\xe8k6\xcf\xfb\xc5\x056Z\xe9v\xdf\x07\
+\x7f}\xc3R\x9f\x22\xcd\xc09\xb7}\xdf\x07\xad\xa6[\
+p\xe3\xcc\x0f\xc1JVb\xef\xb6$\xab\xff\xa7Y\xe7\
+\xd0o\xfe\x93\xb5'\x87>e\xe9\x09\xa1\xff\xecgK\
+\xddi\xf8\xe8\xb2\x1d\xcf-\x8c {\x8e\xfc~v\xba\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03q\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00(\x00\x00\x00(\x08\x06\x00\x00\x00\x8c\xfe\xb8m\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x03#IDATX\xc3\xed\
+XAk\x13A\x14\xfe\xde\xdb)\x85\xcc)`\xbc\x98\
+\x93B\x8b\x15L\x08-\x04z\xd0\x22\x05\xa1\x8a9\xf5\
+\xe0\xa1\xe0\xa9\x1e\x14\x8bx\xd1\x1f\xd0\xa3\x15=\xf5$\
+\x14\xe9\xa1 D\xecA\xf0\xb0Z(\x84\xa6\x84\xb4\xa0\
+\xd0\xa2\xb7x\xd1\x5c\x07J\xdd\xd9\xe7\xc1YYKl\
+\x13\xb3%9dN\xb33\xbb\xef}3o\xde\xfb\xbe\
+\x1d\xa0\xcf\x1b%e\xa8^\xaf\x9f\x0b\x82\xe0!3\x0b\
+3/\xe5\xf3\xf9o}\x03\xb0V\xabeDd\x19@\
+\xc9\x0d\xbdQJ\xcd\xe7r\xb9\xef\xdd\xda\xe6n\x0dT\
+*\x95\xac\x03w\xd3-\x98\x00\xdc\x08\x82`ygg\
+'\xdb\xd3\x1d\xdc\xde\xde>CD\xcf\x00\xdcnaK\
+\x00\xac\x8a\xc8\xc2\xf8\xf8x\xb3';HD+\x0e\x1c\
+\x00|\x8eME\xfd\xdb\xcc\xbc\xd2\xcb\x10_\x06\xf0\x13\
+@\x19\xc0bl|QD\xca\x00~\x8aH\xae\x1b\x07\
+\xaa\x9b\x8f\xc30\xbc\xc3\xcc#D\xb4\x06`LD\xa2\
+\x9dm\x18c\xe6\xb5\xd6\xb3a\x18\xee\xf7E\x99\xa9\xd5\
+jWD\xe4\x83\x03x\xb5P(|L\xc2.\xa3\xcf\
+\xdb\x00\xe0\x00\xe0\x00`\xa7u\xd0\xd1\xd7\x0a\x80\xcba\
+\x18\xde\x99\x98\x98x\xdf\x8e\xa1 \x08\x9a\x9e\xe7}\x89\
+\xfa\xed\x02\xa8V\xab\xd3\x9e\xe7\xbd\x14\x91]\x11\x99;\
+J\x8b|\x94\xf8\x1d\xb7^\x07\x90a\xe6\x91v\x1d\x19\
+c\xf6\xac\xb5%km\xc9\x18\xb3\xd7v\x08\x99GD\
+$\x03\xe0:\x11=;*0\xe8\x18\xc9T&\xa2\xf9\
+B\xa1\xf0\xe34C\xb8\xb1\xb1\x91I\xa5R\xcbD\xd4\
+R\xaaQ$6\xad\xb5/\x9cdR\x8e\xec\x17\x89\xa8\
+qRX\x8d1{SSSA\xaby\xdf\xf7U:\
+\x9d\x1e\x0d\xc3\xf0\xccqvD$KD\x8fEd\x0c\
+\x80\x05\xb0\xeey\xde\xbd|>\xffM9G\x0f\xdd\x0a\
+\xa2\x1d\x1d\x03\xf0*\xe2\xd6\x7f5\xcf\xf3\xbeh\xadK\
+\x00>\xb5\x9aO\xa7\xd3\xa3\xd6\xda2\x80\x0b'\xd1j\
+\xcc\x97\x02p+\x0c\xc3\xaf\x00\x1e\xb1;\x07\xf2?\xe1\
+9i\x01\x87\x87\x87\xc9d13/Yk\xcfw\x1a\
+bkm\xf3\xb8\x840\xc6\xeci\xadKJ\xa9\x8eC\
+\xcc\xccK\x7f%\xc9\xe6\xe6\xe6\xd9\xe1\xe1\xe1e\x22\xba\
+\xd5OI\xf2\xa7\xccLNN~\x0f\x82\xe0>\x80U\
+74#\x22\xb3\xed:\xf2}_\xd5\xeb\xf5K[[\
+[\x97|\xdfo[gj\xadg\x89h\xc6=\xae*\
+\xa5\xee\xc7\x7f\xb6\xfe\xaa\x83\xc5b\xb1!\x22\x0b\x00\xde\
+\x01hv\x226\xa3\x84\xf0<\xaf\xac\xb5\x1e\xed@\xf4\
+\xee\x03h\x12\xd1;\x11Y\xc8\xe5r\x8d\xd3\x14\xac\xbe\
+\x13\xacSI\x09V\x95\xf0\x91\xa2\xa4\xcf\xe8@\xcd\x0c\
+\x00\x0e\x00\x9ef\x16W\xab\xd5if\x1e1\xc6\xac\xb5\
+b\x88\xe8\xc7\xbd]\xd1\x9b8@\xa7\x843Z\xebk\
+\x22\xf2:\xce\xad\xa9T\xea\x01\x80\x19f\xfe\x01 \xdb\
+\x13\x80\x22\xb2\xeb\xd4w\x09@\x9c=\x9e\x10\xd1E\xd7\
+\xdf\xed\xd9\x19\x14\x91\xb9\x18w_\x8cME\xfdU\xf7\
+N\xef*\x7f\xa5R\xc9\x0e\x0d\x0d=\x8fI5\x00\x08\
+\x00\xac;\xe2o\xf44\x8b\x8b\xc5b\xe3\xe0\xe0\xe0.\
+\x80\xb7\xf8}i)\x0e\xdc|\xb7\xe0\x12\xe5\xce\xe8\x12\
+\x1d\x00\x94RO\x93\xbaD\xef\xfb\xf6\x0b\xaeBsm\
+\xae\x8c\x8b\xdd\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x07\xd9\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x07\x8bIDATx\xda\xed\
+\xddol\xddU\x1d\xc7\xf1\xd79mY\xd7\xb1e\xe8\
+:\x881\x1b\xee\x0f$(\xc2\xf0\x81\xf8`c\xff`\
+\xc9F\x8c\x84\xc4D\x12\x13p\xf2@\x0c\x9a \x7f\x8c\
+<X\xa61q\x9b`\x82Qb\x86\xec\x81\xe1\x09\x11\
+\x8c&\xabt\x1b\xeb\x5c1Fc\x183\x0e\xe3\xd8\x06\
+]b`\x1b\xb8\xc5n\xac\xc8\xbd\xbf\xe3\x83[f\xb7\
+\xae[\xff\xdc\xde{\xdb\x9e\xf7\xb3\xde\xe6\xde\xde~\xbe\
+\xe7\xfb\xe7\x9c\xdf9\xe7\x1b4\x18i\x83h\xa9\xab\xb4\
+\x98\x87ve\x8bD\xf3\xb1\x08\xd7`.f\xa7df\
+\x08\x9a!%\xa5\x10\xf4\xe2\x14\x8e\xe3\x1d\x85\xc3\xa2\xb7\
+\x04\x87\x94\xbc+\xe9\xd1\xedd\xd8\xa8h\xa4\xff74\
+\x8c\xf0\x9d\xe6j\xb1Tt\x87`\xa1\xc2\xb5\x829\x98\
+5\x86\xef\x99\xd0+9!\xe8\xc1\xe1r\xc9\x8e&\xba\
+\xc3j\xc7\xa6\xb4\x01\xd2_\xb59\xe9z-\x96'\xee\
+\x0c,\xa32\xa2k@)%\xdd\x89\xed1\xda\xad\xcf\
+\xc1\xb0\xc6\x99)a\x80\xd4a\x9a6\xcb\x14\xee\x17-\
+\xc1\x02\xc4:\x8d\x83B\xf2&\xf6)l\x15\xed\x0d+\
+\xf4MJ\x03\xa4\x9d\x16h\xb2Z\xf0\x90h\xb1T7\
+\xd1\x87R\xa2\x90\x1c\x12<\xa9dWX\xe5\xf0\xa40\
+@\xea4C\x8b\xbbE\x0f\xe23h\xd5\xd8\xf4I\x0e\
+H\x9e\x12\xbc\x18V8=!\x0d\x90:\xcc*\xb7Z\
+\xde\x14\xfd\x10\x9fn\xa4\x84?\x82\x04~@\xf0\xb83\
+\xf6\x84\xb5\xfe3a\x0c\x90v\xb9Z\xb4Y\xb0N\xf0\
+q\x13\x9b\xf7\xb0\xdd\x19\x8f\x85u\xdeih\x03\xa4.\
+\xad\x82\xfb\xf0]\xcc3\xb98\x8a\x1fI\xb6U3Q\
+\x87*\x8a?\x07\x0f\x0b\x1e\xc0L\x93\x90\x94\x9c\x0e\xfc\
+\xccYO\x84\xb5N4\x84\x01\xd2\x06\xd1r\x9f\x15\xfc\
+\x12K&`\xac\x1fynH^S\xb2\xde+\xf6\x8f\
+uf=\xf6Rp\xb9\x95\x82gq\xcb\x14\x10\xbf2\
+h\x83%Z<k\x99\xd5u\xf3\x80\xfex\x7f\x17\x9e\
+A\x9b\xa9Hr\x16\xf7\xe3\x85\xd1\xe6\x858\x06\xdf\xb9\
+\x07?\x9e\xb2\xe2W\x86\xeft\xc1\x16\x85\xaf\xd6\xcc\x03\
+R\x97V\xd1=\x92_\xd4p\xed\xa6\xd1)){@\
+\xf4\xab\x91z\xc2\xc8=\xa0p\x97\xe4\x07Y\xfc\xf3h\
+\xd6d#\xee\x1e7\x0f\xe8\xafvV\x0a~;\xa5\xc3\
+\xce\xa59\xab\xecK\xf6\xda5\xdc\xeah\xf8\x1ep\x9b\
+\x1b\x05\x9b\xb3\xf8\x97d\xba&\x9b\xactSU=\xa0\
+\x7f\x92\xf5\x92\xe0sY\xe3a\xb1\xcf\xfb\xd6\x0cg\xb2\
+\x16\x87!~\xab\xe8;\x82[\xb2\xae\xc3\xe6fm\x1e\
+N\xcf\x9b^\x8d\x10t\xaf\xe4\x9bSd\x92U\xbd\x02\
+5y\xc0\x1c\xf7\x8d)\x04\xa5Ns]\xe1/\x82\xf9\
+Y\xd3QqT\xf2\xf9\xb0b\xe8U\xd4!= u\
+\x98\xe5\x0a\x9b\xb3\xf8cb\x9e`s\xea0k\xe4!\
+\xa8\xd5r\xdc\x995\x1c3k\xb5Z1\xa2\x10\x94:\
+\xcd0\xcd\x9fpc\xd6\xaf\x0a$\x07p\xeb\xc5\x1eo\
+^\xdc\x03\xaep\x97\xca\xf3\xdbLuR\xf2\x0dC\xcd\
+\x92\x07\x19 \xed\xb4\x00\xdf\xceUOuM\x90\x82o\
+\xa5\x97-\xbc\xbc\x07\xb4X%\xe4\xd1_}'p\x83\
+\xe8\xf6K\xe6\x80\xd4aZ\x9an\x7f\x08\xae\xcf\x92\x8d\
+\x0b\x07%7\x0d\x5c1\x8d\x17\xacd,\x0d\xd1\xe2\xac\
+\xd3\xb8\xb9\xc1\x22\xc9m\x17\x0dA\xe9w\xda\x04\xf77\
+\xdc\x8e\xb5\xc9U\x0dE\xd1\xd7S\xa7\x19\x83=`\xa6\
+\xebT\x1e\xaag\xc6\xd7\x08K4\xff?\xc4\xc7\x01\xee\
+\xb1\x82\xc1Y:S\xf50\xf4)\xac\x1cl\x80d\x1d\
+9\xfc\xd4\x80(Zw^\x15\x94\xf6jW\xf8\x17Z\
+\xb2>5\xa1\xa4\xd5'\xc3\xad\x8e\xc5\xfe\x1f\x97f\xf1\
+kJ\xb3\xffZ\x0a1m\x10\x05wdMjL\xd9\
+\x9a\xb4A\x8c\xbe`\xb6\xca\x01\xb8Lm\x93\xf1\x82\xde\
+\xe5>\x165\x99\x9f\xd7\xfc\xeb\xc2\xfc\x99M\xe6EQ\
+\xbb\xa4=\xebQs\xda\x95\xb4G\xd1\x02a\xe8'6\
+\x99qc\xa6dq\xc4\xb5\xf2\xd2s}\xb2@4?\
+\xa6\x9c\x80\xebi\x82\x85Q\xe5\xf8\x7f\xa6>\x5c\x13C\
+\xc8\x09\xb8\x8e\x5c\x1dqU\xd6\xa1n\xcc\x8e\xb82\xeb\
+P7\xae\x8c\xf2>\xffz\xd2\x1cS.A\xebJ\x0c\
+|\x98e\xa8\x1b\xa5\xc8\xf8^F\x91\xb9$\xa7#N\
+f\x1d\xea\xc6\xa9\x98Ru\x8e\xdcgF\xc5\xb1H\xf5\
+o\x00\xc9\x0c\x9bwb\xe0P\xd6\xa1N$\x87#\xde\
+R\xb9\x9c(Sk\xf9\x0b=Q\xe1\x884>\xb7A\
+e.I\xaf\xe0\x8d\xa8\xd9\x09!'\xe2:pB\xb3\
+\x13Q\x8b\x1eIO\xd6\xa3\xe6\xf4(;\x1au:%\
+'\xe2zd\x80#\xf6\xf8w\x0c\x1b\x15\xa2\x1dY\x91\
+\x1a\x13\xec\x08\x1b\x15\x95\x9dq}^\x91\xd7\x84jI\
+I\xd2M\xfff\xdc\xb0\xc6q\xc9\xde\xacK\xcd\xc2\xcf\
++\x1f\x1d\xde\x1e\xb8=};\x8du\xb5\xfb$\xa5\xc0\
+\xf6\x8f~\x18\xb8=\xbdKr$\xeb3\xee\xa3\xffM\
+\x85\xdd\x83\x0d\xd0\xeb\xa0\xe0\xd5\xac\xd0\xb8'\xdf}J\
+\xfe9\xc8\x00\xe1\x8b\xde\x97l\x15r\x18\x1aG\xf1\x0b\
+\x85g\x06\xf6*8\xffD\xccY\xdd\x0aod\xa5\xc6\
+-\xfc\x1c\x12\xfca\xe0K\xe7\x19 \xac\xf5\x81\xe0\x09\
+j\xdb\xc4`\x8a\xd0'\xf9\xc9\x85\xb7*\x0e>\x13\xf6\
+\xa1\x97\xf1\xf7\xacW\xd5y]a\xe7\x85/\x0e2@\
+\xb8\xdd\x11eO\xc9K\xd4\xd5\x0d>\xc9O/\xd6\x95\
+#\x0e1O{\x11\x07\xb2nU\xe3\x1f\xf8\xf5\xc5~\
+qQ\x03\x845\xce\x08\x1eWi^\x90\x19\x1b\xef)\
+|o\xa8V(C\x9f\x0b>c\xcf\xc0\x19[f\xd4\
+\xc1\xe7\xf7\xdat\x0d]\x99^\xea\xbd\xbb\x5c\xad\xd9\x9f\
+\xc9g\xc8FY\xf7\x1fU\x8c\xf2\xd2>\x08\xab\x1d+\
+\xca6\xa17\xab9bNK6]J\xfc\xcb\x1a\x00\
+b\xb4M\xf2\xf3\x5c\x15\x8d0\xf0\x14\x9ev\xdc\xb6\xcb\
+;\xc9p>\xadC\xbb6/\x91o\xcf\x1d&\xfbD\
+k\xc2\xb2*\x5c]\xdc?C>!Y\x8f}Y\xdb\
+\xcb\x8e\xfd\xfd\x82\xf5\xc3\x11\x7f\xd8\x06\x00{\xfcM\xf2\
+(\xde\xcf*\x0f\xc9Y\x85G-\xb3\x7f\xf8yz\xa4\
+\x06\xde\xe3+*\xadK>\x91\xf5>\x8f\xb7%\x8f\x84\
+\x15\x9e\x1b\xc9\x9b\x9aG\xe1b\xbf\x11M\xcf-L.\
+X;(\xdb za\xe4\x95\xeah\xffb\x97\xf5M\
+\xc1\xf7\xb3'x[\xd9\x86\xb0\xca\xd6\xd1\xbcy\xd4#\
+\xb8\x89\xe7\xfa\xf3\xc1\xd4mc\xc5Y\xc9#\xa3\x19\xf9\
+c\xf6\x80s\x11\xa9\xcb\xea\xc4\x96\x10\xdc<\xc5\xc4\x7f\
+M\xd9ca\xd5\xd8\xf6T\x8d\xfd\x8e\xb8=v\x07\xee\
+\xc3\xabSd\xb2\x96\xb0O\xf05{\xed\x1a\xfbjE\
+\xb5\xbeU\x87\xf6\xa2\xcd\xc3\x91o\x98\xa4\xcd<q\xba\
+(<\x1d\x9bm\x19n\x9d_3\x03@z\xdets\
+\xddk\xf2\xb6\xb3\xdd\xe4\xb8m\xe1\xcb\xceV\xebC\xc7\
+\xb3\xa1\xf3\x16\xd1Z&EC\xe7\x0e\xc9\xa3\x97[X\
+k\x18\x03\xf4\x87\xa4YfX.M\xe0\x96\xe6\xc9\xeb\
+\x92\xc7\xb5\xe9\x0a\xb7N\xa0\x96\xe6\xe7\xfd\x17\xfb\xcd\xf0\
+\x9e\xbbE\x0f\xaa4\x85hmp\xe1\xfbTz\xc9?\
+\xa5\xf0\xe2PO\xb2&\x8c\x01\xce\x19\xa2\xdb\x02e\xab\
+%\x0f\x89\x167\xdc%\xe1A\xd1\xbfo\xe7I%\xbb\
+.\xf6\x00}B\x1b`@h\x9a\xa6\xcd2\x95>\xbc\
+K\xb0@\xfd\xaeL.$o\xaa,\x1foU\xd8[\
+\xcd~\xf1\x0di\x80s\x86\xe84C\xab\xeb\x94\xad\x10\
+\xad\x93,\x13j\xb6\xb6TB\xb7d\xbbh\xb7>\x07\
+\x07n\x17\x9c\x12\x06\x18d\x90?\x9a\xeb\x03KEk\
+\xb0P2_0\x07\xb3\xc6\xf0=\x13z%'\x04=\
+8,\xd9\xa1\xac;\xacv\xac1\x22_\xa3\x95\x1e\x1b\
+DK]\xa5\xc5<\xb4+[\x84kE\x0bU\xee\xb7\
+\x9b\x8b\xd9\x92\x99\xe7<&)\x09zq\x0a\xc7UN\
+\xff\x1f\xc6[\x82CJ\xde\x95\xf4\xe8vr\xb8mf\
+k\xc5\xff\x00\x08\x18%\x1e\xe6\x01\xe9\xf7\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x02E\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x01\xf7IDAT8\xcb\xad\
+\x93?K[Q\x18\xc6\x7f\xef\xc9\xbd\x0ai@\xac\xd0\
+\x86K!X\x10\x84\xeaV?\x80C\x06\xe9\xa4t\x8a\
+C\xdb\xc9.\xa5R\x8a[\xa0\xe2&\x0e\x19\xfa\x01\xec\
+\xd0Lb\xa6\xe2\xd0\xe1|\x80v\x15J\xefP\x82\xe6\
+\xfe)\xb6!\x14/\xd8k\xce\xdbA\xad\x8a\xd1\xa5}\
+\xc7\xc3\xf9\xbd\xe7<\xef\xf3\xbcpCYkK\xd6\xda\
+\xd2Mwd\xd0a\xbb\xdd\x1e\xf5\xfd\xe1\xb9n\xafW\
+\x05\x18\x1d\x19\xf9\x98\xe7G;\x95J\xa5{c\x03U\
+\xf5\xa2$\xa9\x0b\xf2\x1a(fY\xe6\x00\x8a\xc5\xa2\x01\
+2E7\xbe~)\xaf\xcd\xce\xca\xf1\x19c.\xc3i\
+K\x90\xba*-\xd4\xcdt\xf6\xf7\xa6:\xfb{S\xa8\
+\x9bAh\x09R\x9f\x9cL\xb7\xadU\xef\xca\xb7\xe38\
+]\x8d\xe2\xc4EQ\xbat\x9d\xde(J\x9fGq\xe2\
+\xe28}sIB\xbb\xdd\x1e\xf5\x87\x86\xf7Ui\x05\
+\xc1\x8b'?\xbd\xfb/\x11\x1e\xf4\xd5mz\x80\x8a<\
+C\xd9\xbd}\xfc\xad\x11'o\xdf\xe1\xdc|\x9e\xff\xbe\
+W\xa9T\xba\x1e\x80\xef\x0f\xcf\x01E\xc15\x0e\xbc\xf1\
+W\xc6\xb0\x0eP\xc0<\xd5\x93g\x0c\x02]o\xdc\xe0\
+\xfa\x0d\xc4,\xfa\xbe?\x074\x8d\xb5\xb6\xd4\xed\xf5\xaa\
+Y\x96\xb9\xdd0<,\x08\xd3\x17Fl\x90\xf39!\
+L\x87ax\x98e\x99\xeb\xf6~U\xad\xb5%sQ\
+\xe3\x10`\xd4m\xa2\x9a_\x19\x80jn\xd4l\x0e\xb4\
+1\x8a\x92\x1a\xc2{\xd4\xcd\x04A\xf0\xf9Ga\xe51\
+\x86&\x22\xfe\x19\x8c\xa36\xd6_\xdf\x8a\xa2\xe8!b\
+>\xa1,\x06A\xb9i\x00\xf2\xfch\xe7\xc4g\xb3\x0c\
+0\xd6_\xdf\xc2QC5\xbf\x08\x9f:\xbf\x0cd\xa7\
+\xccyu\x06\xd8xPXY8(\xac,\xfc\xb51\
+M\x97\xa28q\x9d8^\xbd\x92\xc4\xf3 \xf1H\x95\
+\xa6\xe0\x1aa\x18\x1e\x02LLL\xdc\x02\xb3\x8cPS\
+\xf8\x10\x94\xef\xce\x8b\x9c\xa4q@\x94\xbf\xd7\x05\xbd&\
+\xca\xb2\x11\x94\xef\xac\x9d\xc1\xffe\x99\xf8\xd7u\xfe\x03\
+C\xe1\x13\xe3\x83\xd8\xe4\xec\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\x12\xcf\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x12\x81IDATx\xda\xed\
+]\x7fp[\xd5\x95\xfe\xbe\xfb\x9e\xe4_I\xfc#\x91\
+m\xd9Vb'q\xdb\x09\x09%\x0cP\xa0\x90BK\
+v\xa6la\x96\xee@w\x0b\xed2\x90\x96\xa5\x0c\xb0\
+I\x1bv:\x0b\x81\x00\xbb\xb4\xa1M\xa6\xd0\xe9\xecB\
+\x98\x01\x02\xcc\x16\xba\xdbniaw\x1c&\x04Zh\
+\xd9.!i\x9a\x09\x84\xc6\xd8\xb2,Y\xb2\xe58\xc6\
+\xbf\xa4\xf7\xee\xd9?$\x07\x07\x22\xbd'\xe9\xd9\xb1[\
+\x9f\x19\xcd8\xd1{W\xef\x9d\xef\xde\xef\x9c{\xee\xb9\
+\xe7\x02\xf32/\xf32/\xf3\xf2\xe7*\x9c\xab\x0f\xbe\
+{\xf7\xee\xc5\x9a\xc6\x15\x00\xa0\xc4~\xfe\xb2\xcb.\x1b\
+\x98\x8b\xefa\xceU\x004\x8d+\x0c\xc5m\x00`k\
+\x03\x00\x1e\x9f\x07`f\x87\xee2\x11\x04\x00\xc0Pj\
+\xd9\x5c}\x0f5\xcf\xc2\xf3\x00\xb8\x16\x11\xe1\xc0\xc0\xc0\
+\xa2p8\xbe\xd2\xef/\xaf?1\x8cM\xb3>\x16\x8b\
+-?|\xf8\xf0B\x11\xe1\x1c\x1b\xc9\xb3K\xf6\xec\xd9\
+c\xb6\xb6\xb6.1+*\x02\x0ah\x83\xc8Y\x00\xcf\
+ \xb0\x86d\x8b\x88,\x00\xc0D\xa2\x1f\x89\xfe~\x00\
+\xc0\x92%\x8bQ\x1f\x08\x00\x80\x90\x1c\xd6Z\xf7\x80\xfc\
+=\x05\x07\x95\xc2\xfe4\xf0\x9e5\xa6\x12\xad\xad\x81~\
+\x92\xd6<\x00\xa7\x90p8\x5c\xe7\xf3\xf9\xd6\xda\xb6\xac\
+#y&\xc8U\x80\xac\x00`\x9c\xea\xfa\x1c\x00\x9cJ\
+l\x11\x1c\xa5\xe2\x1f(8`\xdb\xf2\x8aHz_(\
+\x14J\xce\x03\x00\xa0\xab\xab\xab\xd6\xef\xf7\xdf\xa8\xc1\xcb\
+\x09Y\x01\xb0\xc9\x8dsP\x00\x00S\xc5\x02\x10\x11\xe0\
+\xa8\x02_(/\xf7\xef\xac\xad\xad=\xf6g\x07@8\
+\x1c\xaePJ\x9d\xad\x94\xf1%\x01\xbe\x0c\xa0\xae\xd0g\
+)\x12\x80\x0f\x1b\x95\x01\x80O\x8b\xd8\xcfj\xad\xdf\x0c\
+\x85Bc\x7f\xd2\x00\x88\x88\x11I$\xd6(K\x7f\x09\
+\xc4\xb5\x00Z\x8a}\x06O\x00\xc8>\x16\x80\x1e\x08v\
+i\x83\xcf6\xd7\xd7\x1f$i\xcf\x94N\x8c\x19T\xbe\
+\x8a\xc5\xe3\x1b\x95\x96{\x05\xf2\x05\x92\xb5\xa5t\x80\xd1\
+\xd1Q\x8c\x8e\x8e\x02\x00*++QUUUJ'\
+\xac\x06q\x9e\x02>3<<R\xb6`A\xd5\x1b{\
+\xf7\xee\x95?\x89\x11 \x22e\xb1X\xec\x02\x0dl!\
+x\x89W\xbf\xe9\xe1\x088\xd5\x98\xd8\x0d\xa8\xfbFF\
+\x86~\xdb\xde\xde>1g\xe7\x01Y\xe5\xdf&\xe0N\
+/\x95?\x03\xdd\xf2s\x02\xbd\xb3\xaaj\xd1-\x07\x0f\
+\x1e\xf4\xcfI\x00\xc2\xe1\xa1\xbaX,v\xbf\x80w\x01\
+X\xe1\xa1\xf2m\x001\x81$\xa7\x00=\x08\xa0/\xfb\
+\x9d'\x10\x90h\x07\xe5\xee\xba\xba%[\x07\x07\x07k\
+\xe6\x14\x00\x91H|\xad2F\x9f\x01\xd5F\x00\x0b\x8a\
+\x19<$\x8e\x038\x04\xc8\xff@\xf4w\x14q\x85i\
+\xa8\xf6`cCeS\xb01\x98H\xf4?4yq\
+29\xf8\x83\xa6`c\xe3\xc4\xf8\xd8\x02m[\x1fW\
+\xc4\x95\x10|\x07\xe0\x7fg\xda\xc0p\xd6\xd8\x16*\x8b\
+@l\x1e\x1d\x9f\xd8\x15\x0e\x87\xcf\x9c\x0e]y\x1e\x8c\
+\xeb\xea\x8a\x9eAC\x1e\x86\xf0\xc2\x22\xc3\x02\x9d\x02y\
+\x05T\xaf[)\xf9\xb5m\x8f\xbf\xdb\xd6\xd66\xee\xe6\
+\xc6\xecu\xefd?\xcfwvv\x96WTT\xac\xd4\
+\x9a\x17\x01\xfa\x02\x90\x17\x03h-p4\x1a\x04.7\
+L\xdf\xc2H$rSss\xf3\xdb\xb3\x16\x80\xae\xae\
+\xae3|ej;D.,\x82r\xa2\x02yZl\
+\xf5TUUYWMM\xcd\x10\xc9|\xbd\xd6\x12\x81\
+&!\xd9\x09V.@\x0e\x8a\xc8\x1f\xba\xbb\xbb\x7fl\
+\x18\xc62\xc30\xae\x13\xf0Z\x00\x8d\x052\xc5:\xa5\
+\x8c\xed\x91Hd\x93\x97 \x98^\xd2N\xa6\xe7\xcb\x85\
+\x05\x10\xad%\x22a-\xfa1\x9fa\xeclhh\xec\
+s{oZ[/\xf8\x95y\x0e\x04P\x94_:\xfc\
+\x8e\x00\x18\xcc~\xde\xea\x8c\xc7\xbf\xe7\xb3\xed\xaf)\xf0\
+\x06\x00!\x97\xee8\x05\xf8<\x95Q\x15\x0e\x87o\x0b\
+\x85B\x07f\x8d\x1b\x1a\x0e\x87\xeb\x0c\xc3|\x06\xe4_\
+\x14\xd0\xe60\xc8\x9fS\xf4\xce`0\xf8r1\xbf\xdb\
+\xd1\xd1Q\x0d\x00\xeb\xd7\xaf\x1f*\xe6\xfeh4q\xa9\
+Po\x80\xc8\x15Y[\xe5\xe6\xd9\xb5\x00/T\x96\x97\
+}\xc5\x8b0F\xc9\x00d\x5c\xcd\xf8\xfd 6\x8a\x88\
+\xdb\x89\xdd(\x88\x8d\x14\xf9i0\x18\xec/\xd2@z\
+\xd2\x01c\xb1X@\x93_\x84\x96\xef\x03\xa8t\xeb\x89\
+\x89\xe0\xc1\xc1d\xff\xdd\xabW\xafN\x9d6\x00D\xa4\
+\xac7\x16\xbb\x9d\xe0\x9d.{PZ\x04o\x88\xb66\
+\xb7\xb4\xb4\xbc>\x9b\x5c\xff\xbe\xbe\xbeO\xdb\x22\xdb \
+8\x17\x80\xcf\x05}\x0e\x09d\xeb\xc8\xf0\xf0\x8fJ\x99\
+\xac\x95\xe4\x86Fb\xb1\x0b\x09~\x1d\xc0BW`\x12\
+\xbf0\x0d~\xa3\xb9\xb9\xf97\xb3m\xeeU__\xff\
+\x9aV\xea\x16\x02/\xba\x19\x91\x22R\x0d\xe1\xdfWU\
+U}\xea\xb4\xcc\x03DD)p\x0b\x80\xe5.o\xd9\
+\xab-\xdfm\x0d\x0d\x0d\x07\x1c\xbc\x9b\xd3\xc3E\xa4\xb4\
+\xd4\xd7\xbf\xa5\xb5}+\x04\xaf\xb9\xd4B;\x94\xba\xb3\
+\x94U8U\xa4\xf2\x8d\xdeXl\x13\x80\xcf\xb8\xe8\xf9\
+)\x10?\xd5~\xdfu--\x8b{f{\x14\xa2\xb9\
+\xb9\xb9[\xc4\xfe\xb2@\x9e\x07\x90v\x1c\xd3\x82\xcb\xa2\
+\xd1\xbe\xdb\x0b\xb0\x7f\xa5\x03\xd0\xdb\xdb{&\x81\xeb\xdd\
+\xd9\x10\xbea\x90\xf7\xb4,\x9e\xfd\xca\x9f\x0a\x82\xcf0\
+\xb6\x08\xf0;\x17tD!n\x88\xc7\xe3g\xcc\x08\x00\
+\xe1p\xb8\x024\xae\x11A\xbb\x8b\xcbG\x14es}\
+}\xfd\xef1\xc7$\x10\x08\xec\x87Vw\x10p\x5c\xa4\
+!\xf01[\xe4\x1a\x11)\x9fv\x00\xfc~\xff\xd9$\
+\xaf#\xe9\xe4)\x0cC\xf4\xa6\xc6\xc6\xc6\xdf\xccF\xce\
+wc\x13\x9a\x9b\xeb\x7f\xa5!\x9b\xb3\xb1\xa4\xbcj\x81\
+\xe0+\xbd\xbd\xf1\xb3\xa7}&li\xfd7\x04\x9b\xf3\
+\xd1\x0fIK\xb4\xfc\x9c\xe4O\x0bm?\x81\x1b\x16\x0a\
+\xca\xab*P\xa9c\x98\x18j\xc7\xc3%\xc5\xe3;q\
+}\xf9\x02\xd4\xd4\x02~\x1a\xe0H\x1d\xbe[\xd0\xa4\xcd\
+ \x7fbk\x5cD\xe2\x9a<3f\x02\x08\x91r\x0d\
+\xe0\xd6\x80\x171\x0f\x18\x1c\x1c\xac\x19\x1b\x9fx\x17\xc0\
+b\xa7\xf7\xb6!7\x84\x5c\xcep\x07\xf0O!\xf1Y\
+_ \xe4b\x82\xcb4\xc4OP\x08y_\x80#Z\
+\xcb\xcb\xe3\xf6{?\x0b\xe19Wk\xb6\x11|\xbd\xd2\
+o,\xfa+\xa5\xd4g\x05XI\xa0\x0a \x01IC\
+$,\x94_Yi<\xdf\x88\xefu\xba\xd1QO,\
+v\xa9\x12<\x96\x0d\xe4\xe5\x93\xfe\x89\xf2\xb2\xf6\xb6\x02\
+f\xc8\x05\x01\x10\x89F7\x13\xfc\xae\xc3}\x02\xe2\xce\
+\xa6\xc6\xc6\x7f\xc9\xd7\xd6\x11\xdcZV\x8b\x8aO\xd2\x87\
+\x0d\x04\xae\x97\xa9\xa3\x91\xe4\xa4\xbb\xf5\x81\xe7\x85(\x81\
+\x7f\xd5\x96\xf5\xe3\x00\xb6\xbfs\xaa6\x8fc\xd3\xc7&\
+L\xf5\xb7\x84q\x13)\x8d\x1fi\xef\xa46i\x0b\xf4\
+SvZ\x1e9\x8e\x897\x9dFZ4\x1a\xbdK\xc0\
+\xadN\xef\xae!\x9b[\x82\xc1\xef{n\x03\xc2\xe1p\
+\x1d\xc0\xcf\xbb\x00-f\x90\x8f\xe5ucq\xb5\xb1\xc4\
+Wq\x13}|\x02\xe0\x8dB\xfa@\xf2\xc4g\xaa\xe2\
+\xb2\x1f*6\x81\xdcb\xf8\xcc\x9dIs\xf3\xc52\xe5\
+9\x04`\xd2\xdc|q\xda\xe7{L\xd1\xb8\x93\x0a\xc1\
+S\xb6wR\x9b0\x15\xd4W\x0d\x9fz\xa2\xc6,\xbb\
+EpI^:6\x0c\xe3Qd\x16}\xf2\x9b\x0e\xf0\
+\xf2\x8c\xae<\x06@)\xdf\xd9\xcc\xacl\xe5\x9f#\x80\
+O744\xe4|\xd0=\xb8\xc4L\xfa\xdan\xd5\xc0\
+V\x10\x9f\x00\x0bp\x04\x08S\xc8\x8b\x85\xfc\xe1\x80\xf1\
+\xad+\x05W\x1b\x82\xab\x8dc\xc6\x1dW\x08\xf9C@\
+>\x0d\xba\xb7kB(\x92\xed\x8a\xc6\x96\xa4y\xde\xed\
+\x82\xbb\xcd<3\xe5\x18 \xcf\xb8\xa0\x94\x15>\x9f\xef\
+,O\x01\x10\x11S`\xaf\x03\xd0\xe4\xc4\xfd\xa6\xc2S\
+\xb9\xc1\xb9\xb5\xec,\xf3S\xb7\x01\xbc\x07@u\x09\xb6\
+u\x8dR\xc6sI\xdf\xf2\x03I\xdf\xf2\x03\xa2\xf8\x13\
+\x00k>\xd2\xdb\xdd\x03[\x0drK\xd2\x1c\xff\x87N\
+\x5c\x9f\xd3\x95\xd4\xb6\xbd\x0b\x80\x93\xddh\x16\xe1\xba=\
+{\xf6\x98\x9e\x01\x90H$\x96(\x1ag:xM\x22\
+\x90W\xfc~\x7fWN#\x8e\xcas\x85\xb89\xfb\xc2\
+\xc5\x07\x02I\x0a\xe1\x03\xb1\x0a\xc4\xaa\xcc\xdf,-\xb2\
+K,\x02qs5\x02\xe7\xe6\x0c\x81\xdav\x17D^\
+u\x98\x9c\x99B\x9c\xb9j\xd5\xaa\xc5\x9e\x01\xa0\xb5\x0e\
+@a\x95\xc3\xd0\x1b\xa6\xa8\xd7kjjr\xbay\xe2\
+\x93[$\x93\xef9KE\xda\xc4\xc7[r}\xbbt\
+\xe9\xd2c0\xd4\xeb\x00\xde\xcf\xdb\x8a\xd6g\x88H\xc0\
+3\x00l\xa0\x8d\xe0\xf2\xfc\xdc\x8f\x1e\xcb\x92_\xe7\x9a\
+t\xc5\xf0\xad\xd5\x00\xaf)\xb9\xa7N\xf3\xec\x0b\xe0\xd5\
+I\xfc\xe3\x9a\x5c\x03O\x89\xefW\x00\xc2\xf9\xed\xa5Z\
+\xee\xc2eu\x0f\x80\x12\x9e\xe5\x1clb\xb7m\x8f\xbd\
+\x9b\xeb[\x9f\xa9\xae\x02\xe6@\xee>\xa1\xc4\xd4W\xe5\
+\xfazl\xac\xf6]@\xc2\xf9hHDL\xadq\x96\
+g\x00\x00\xb2\xda\x85\xa5\xde\x97+{!\xeb]\x5c0\
+\x87\x02\x11\xe7\xe7\xf2\x88\xda\xda8.\xc0[\xce\x83\x09\
+gx\x06\x80\x00\x8e\x00h\x95{\x0a\xde\x8b\xe1 \x89\
+\x869\x14\x07j\x18\xc3X\xee\xac\x09\xcd\xd7\x5c\xe8l\
+\x8d'\x00d\x17\x1bB\x8e\xd7)u8\xd7we0\
+\x17\x08\xe0\x9f\xd5\xfc\x7f\x92\xf2\xa4l4\xb3\xca\x97C\
+'\xc6a\x17\xcd\x84\xdc,\xd48\x02088\xb8\x08\
+\x80S\xea\xb1=>4\x94\xc70\xa50\xc7$o\xf4\
+6\x9d~\xbf\x1b\x80vhc\xe1\xdbo\xbf\xbd\xa0d\
+\x00FFF\xea\x9d\xc2\x0f\x04\xe2\xf9\x16\xa65|\x83\
+\x02\x8c\x03\x22sD\xfb\xe3\x1a2\x98\xeb\xfb\xb6\xb6\xb6\
+q\x92\xfdNLVQQ\xe3\xe8\x8a~\xc4\xd0L\xee\
+@'\xb0\x0c\x00\xde\xeb\xee\xa9_\xb4p\xa1\x03M\xe9\
+\xb2\x8e\x97\xf6\xdc\x9d\xfd\xa7\x95\xd6\xd6\x0b\x97\xaf_\xbf\
+o\xf2\xfbn\x0c\x0d\xb4\xb2&\x06\xc1\xdc\xc8\x8f&b\
+\xdd\x18:i\xe7\xfd\x0b\x1d{\xd7\xfa\x94\xbe|Rg\
+\xb1\xbe>\xbfb\xfe\xfe{lh\xe8\x9b\x1d/\xed\x89\
+gA\xed:\xd5\x8e~\xf3\xa3\xf6%\xb3\x03}r\x13\
+\xf4\xc4\xc4\x04\x12\x13\x8e!\xf9:\x92\xf7L\xd2\x91_\
+\x99\xe7ttt\x5c?\x990u\x0e\x1eI\xf7\xeb\xcd\
+\xaf\x83\xfc\xcb\xb90\x02\x94\xe6\xeb\xe7\xe0\x91\x13\xeb\xc1\
+\x1d\x1d\x1d\xd5Pz\x0b\xc0+\x99\x8d]\x0d\x0c\xb8\xda\
+\xe3\xf7\x8dI\xb3\xa7\x88\xc4\xa9v\xf4\xcf\xd8>\xe1J\
+\xcb\xbfK\x80\xd19\xc0?\xef\xc3:u<+\x9b\x87\
+\xea\xa9U1?:\xe9\xb2\x9f\xb7\xb5qb\xfb\xbf\xcf\
+4\x1b\x16U/\xba\xd9\xa1\xf1\xe4@29\x99.n\
+)\xca//\xfd\xdc\xc9\xe9\x82\x95\xf8\xe7\xf0\x00\xee\xf8\
+\x09 _\xcd,\x8e\xccJ\xed\x8b\x00\xff\xb1\x18\xdb\xba\
+\xa7\xfe\xef\xfa\xf5\xeb\x87:::\xee\xa5\xe9\xff\xdd\xa4\
+\xce\xea\xeajo\xcfn\xb3\xca)CC\xc7\x7fdY\
+V\x1c\x00l\xad\xbb\x94\xd8\xcf\x9f\xc2~\xe6\x97p8\
+\xbe\xd20\xf5\x11\x07\xbf9\x1allp\x8a\x94b\xc0\
+w\xc7\xf9\x00\x9f\x00\xf1\xb1Y\xda\xfb\xdf\x01\xe4\xef\x16\
+\xa7\xb79&\x8e\xf5FcQ8dX\x1b\x8a+\x1b\
+\x1a\x1a\xfeX\x92\x17\x94J\x99\x09'\xb7LD\xeaE\
+\xc4q+\xcfC\xe9mo@\xe3.@\xc2SW\xbb\
+f\x89\xf6{\xa0\xf5\x96\xba\xf4\xb67\x9c\xae<r\xe4\
+H\x19\x00'\x0fGL\xd3L\x94\xec\x86._^{\
+\x1c\xc0\x88\xc3eF\x22\x91X\xea\xd4\xd6V@\xd7\xd9\
+\xa3\xff\x05[\xee\x0582\x8b\x88gD\xdb\xbc\xb7\xce\
+\x1e\xff\x19\x9d\xfd{TWW/u\xd2\x9d\x88\x8c\xd4\
+\xd5\xd5\x0d\x97\x0c@6\xba\xd9\xed\x18\x8a\xd0\xfc\x84;\
+\x0f\xef\xe1\x89\xa8\xfd\xde\x93\x22r?$\x7fXw\xa6\
+\x94\x0f\x91\xfb\x97\xd8\xe5O\xd0e\x06FZk7\xef\
+\x1av\x93\x8e\xa3\xdc)\x0d\x07\x9d\x01\xb0?\xed\xf6\xa5\
+W\xe3\xb9T\xcc\xea\xdc\xa1\xb5\xbd\x09@\xefi\xa4\xa3\
+\xa8\xd8\xb2i\xb1U\xb9\x9d\xd8\xeaz\xbaN\x0d\xe7M\
+(\xa4\xabd4wn\xa8\xa2#\x00\x02Y\xdb\xd9\xd9\
+Y^\x08\x08\xef\xdb\xfd\xbb\xb4m\xdfs:\xe8HD\
+F\xb4\xa5\xefY\xa2+\x9f,D\xf9\x99w\x94\xb5\x8e\
+*s\xa13\xd7\x00h\xcb\xda\xef\xb4}\x9fd\xc8\xa8\
+\xa8XY\x88\x12\xda\xf0\xf8x\x9f\xdd\xf5\xc4L\xd3\xd1\
+\x09\xda\xd1\x95\x8f\x13[\xc7\x0b\xb9\xb7\xa2\xa2b%\xc8\
+\x10\xf2'\xa6\xd9T\xea-\xcf\x000\x0c\xa3S\xb4\x1c\
+u\x00\xa0Ei}Q\xa1\xa9\xda\xa7\x81\x8e\x8a\xa2\x9d\
+,p\xd4\x9a\x17\x91l\xc9O\xc7r4m\xdb\xefy\
+\x06\xc0\x98R\x09\xc9\xec\xb7\xcd\xf7p\x0bI\x9e\x7f\xec\
+\xd8\xb1\x82\xb3\x1df\x8a\x8e\x8a\xa5\x9d\x131\xad\xee\xee\
+\x1a\xa1>_D\x16:\x5cz\xc8\x1aS\x09\xcf\x00h\
+\x0d\x04\xfaA\xd9\x8f\x1c\xdbAO\x0c\x02\xc1\xba\x91\x91\
+TQ\x05\xf4\xa6\x9b\x8eJ\xa1\x9d\x0fz\xb6\xb1\x8c\xe0\
+:\x87\x09\xac\x05\xca\xfe\xd6\xd6@\xbfg\x00\x90\xb4\xa0\
+\xf5\xab\x80\xf4:\x5c\xd8J\xea\xeb\x8aU\xd24\xd2Q\
+\xd1\xb43U\xca\xcb}\xd7\xc2q\xb1]z\x0d\xf2\x15\
+\xb7\xa5\xd1\x5c\x07\xe3\xf4\x82\x05o\x0a\xf8GG\xac\x14\
+\xaf\xed\xeb\xebk(\x05\x04/\xe9\xa8T\xda\x99\x94\xbe\
+\xbe\xbe\x86l\x8d#\xe6\xf7\x06\xf9\xc7t:\xbd\xcfm\
+\xbb\xae\x01\x08UW'\x95\xe2\x8b..\x0d\x8a\xc8\x8d\
+\xa5(\xcd+:\xf2\x82v&\xc5\x16\xd9 \x22\xce\xbb\
+\xeb\xb5\xbcXH=\xba\x82\xc2\xd1\xe5~\xff\xa3\x98R\
+\xa5$\xf73`C8\x1a\xbd\xa4\x94\x17\xf6\x80\x8e<\
+\xa1\x1d\x00\x88F\xa3\x97@\xe0\xa6S\x0dTV\x96?\
+ZH\xdb\x05\x01P[[{\x8c\xe03N\xc19\x92\
+!C\xb8!\x1a\x8d\x06J\x05\xa1\x18:\xf2\x8av\xb2\
+\xca\x0f\x88p\x03\x1d|\x7fd\x92\x9e\x9e)t\xf7|\
+\xc1\x0b2J\xf1\xdf\x01F\x1c\x14`\x82\xb8R\xc8\xab\
+J\xe5\xf0B\xe9\xc8K\xda\xc9h\x95W\x81\xb8RD\
+L\x87\xdf\x8dh\xc5\x1f\x17\xac\xcfBoH\xa5\xea\xdf\
+\x84\xc8S\x22\xe2\xd4\xb3\x16@\xb0\xbd\xa7\xa7\xef\x82R\
+\xab\xd9\x16@G\x9e\xd1\x8e\x88\xb0\xa7\xa7\xef\x02\xd1\xb2\
+\x03\x0e5\x8fD$Ep\x97N\xa5\xde\x9cv\x00B\
+!\x8e\x89\xd8\xcf\x92<\xe2\x1c\xc3C\x15\x95<\x18\x8f\
+\xc7\xd7\x94\xda\x13\x9d\xe8\xc8K\xda\x01\x80x<\xbe\x86\
+J\x1e$Y\xe1\xe4\xf9\x90|G\x9b\xea\xd9b\xca^\
+\x16\xb5&\xdc\xd4\xd4t\x80\xe0\xe3\xee\xe6\x108\xd7\xb2\
+ekO\xcf@\xcbt\xd1\x91\xd7\xb4\xd3\xd33\xd0b\
+\xd9\xb2\x95\xc4yp\xb1jH\xc5\xc7\x9b\x03\x81\xa2\xb6\
+\xe2\xb2\x84!\xaab\xb1\xbe\xdd\x02\x5c\xe2\xa2\x1d\x01\xe4\
+Um\xfb\xaf\xf5b\xb7\xfcA\x5c\xed\x0f\x1a\xad_\x85\
+R\xdf\xcc\xb8]\xd8^g\x97?\xe1E\xcf\xef\x19\x18\
+h\xe1D\xeaif\xaak9\xbe\x97\x00/756\
+\x5cFR\x17\xf3{EgEd~P\xee\x03p\xd4\
+\x1d\xd0\x5cG\x95~\xb8\xa7\xa7\xe7\x93^\xd8\x84\xa4=\
+\xbe\x8b\xa27P\xf4\x86\xa4=\xfa\xa4\x17\x9c\xdf\xd7\xd7\
+w&'\xd2\x0f\xbbT>\x00\x1c\x15[\xee+V\xf9\
+%\x8d\x80\xecCO\x96\xa5\xbc\x0byr)\xa7\xdap\
+\x11\xfc\xafipsCC\xc3\xac*W\xd3\xd3\xd3s\
+\x812|\xdb\x009\x0f\x80\xdfE\x07<\xaem}\x7f\
+SS\xe3C$'N\x0b\x00\x1f\x80PP\xc1&\x01\
+0\xaaE\x7f\xd3 \xff3\x18\x0c&N\xa7\xe2\xa3\xd1\
+h@\xc8\xab \xd8\x8eL\xc1&\xbaP\xbe\xadE\xef\
+hjl\xbc\xb3\x14\xe5\x97DAS\x1ef\xc2\xb2R\
+\x0f\x88\xd6\xbb\xe1\xae\xf2\x15\x01T)\xaa\x07\x85\xdc\x11\
+\x8d&\x8a\x9e1wttTO\x96-+v\x86+\
+\xe4\x0e\x08\xbe\xe7V\xf9\x99>\x87\x0emY\x0f\x94\xaa\
+|OF\xc0\xa4D\x22\x91\xb5\xa4\xf10\x08\xd7\x15\x13\
+'\x8b\xf6A\xf0\xd8\xb8\xc1\x9d\xcb\xf3lo\xfd\xb0d\
+s5\xb7d\x8c\xb0u\xef\xfa)\xb9\xa8n\x02k\xb6\
+\xc8\x8d\x10l \x19r\x9ad\x9d4z\x05\xaf\x89\xd8\
+\xb7677\xef\xf3Bo\x9eUMlnn\xde\x17\
+\x8dF\xbf.\xc2\x1d \xd6\xbb\x01!\xfb\xe2m \xee\
++\xd7rK$\x1a}:e\xdbO+\xdb\xeeZ\xba\
+t\xe9\xb1|Y\x05\x99DY^IB\xb2\x19k\xfb\
+\xf2\x19\xd8c\xc7\x8eU\xa7R\xa9eZ\xe3:-\xb8\
+\x16\x92I\xaa*\xc0!\x10\x08:H\xd9\xd8\xd4\xd4|\
+\xc8+\xbdyZ74\x18\x0c\x1e\x8aF\xa3\x1b\x85|\
+\x04\x82Bj\x87\x12@\x90\xe0\xb7\xca\x0c\xf3\xaf\xc5\xf0\
+\xbd\x12\x89\xc5~\x1b\x8b\xc5^\x1d\x1b\x1b\xcbU\xb8\xd5\
+\xe4\x07\x9b\xbcO\xf9\x1e\x93\x85[\xa3\xd1\xe8EB\x9e\
+O`\x1d\xc0VH\xc1#_D\xf0\x9a\xa2l\x0c\x06\
+\x83\x87\xbc\xd4\x99\xe7\x95s\x83\xc1\xe0\xa1H$r+\
+\xa8\x1ePJ]VD%\xa96BZ\x09~Q\x0b\
+\xc2ee\xe5\xe1H$\xfa\x16\x0c\xfe\xda\xa7\xd4\xe1\xa1\
+\xa1@w{\xfb\xa9\xb9\xf7\xc8\x91#e\xd5\xd5\xd5K\
+\xd3Z\x7f\x22\x93:\x22k\xb5 De\xb4 \xb3\x8c\
+X0\xe5\x92\xb4\xb5\xd6\xbb!\xfa\xdbA\x0f{\xbe\xe7\
+6\xe0\xc3\x12\x0e\x87\xeb\x94i~\x9b\xe0M.]\xd4\
+|^\xd3I\xf3\x0f\x11I\xf4\xc5\xe3e\x03\x03\xc9Z\
+\x00X\xb2dq\xb2>\x10H!\x93.\xa8<|\xc7\
+a\x82\xfffY\xe5\x0f\x84B\xd5\xd3r\xe6\xcc\xb4\x1d\
+\xe4\x16\x0a\x85\x92\x22rg,\x16\x8bK\x06\x84\xe5E\
+*\x83\x1f\xe2\x02\x03@\xe3\x876G\xd4y\xfc\xf8\x02\
+\xe0\xa8\xad\xe5\x91\x96\xa6\x86\x1fx\xe1\xedL\x9b\x1b\xea\
+\xe4\xa2666>D\xc8\xd7D\xcb\xcb8}\x05Z\
+\x0bE\xfce\xc2\xd8`\xa5\xc6\x1f\x9aN\xe5O\xeb\x08\
+\x98\x0a\x02\x80=\x22\xb27\x16\x8bo\x12\xe8\xebE\xd0\
+\x9e-y6k\xf6\x09\x88H\x8a\xe4\x11\x82\x8f76\
+\xd6o/%\xbc0\xab\x00\xf8\x10w\xef\xe8\xed\xed}\
+\x09\xe45\x22\xb8\x8e\xcc_\xfal\xa6t\x0f0b(\
+\xec\xb2m\xfb\xb9`S\xd3\x81\x99R\xfe\x8c\x020\xe9\
+Q\x00\xd8\x17\x0e\x87\x0f+\xe5\xff\x05\x95|\x09\x82/\
+K\x11\xc7Xy$\x03$\x9e\xd1\xb6\xf5lZ\xeb\xff\
+\xfb\x93?\xc6*\x87\xaf^S^^\xfe5\xad\xf1y\
+\x12+\xc0\xe9>\xc8Mz3\xe95\xf2\xa2\x95J\xed\
+\x5c\xb6l\xd9\xe0i\xb67\xb3C\xc2\xe1\xa1:\x9fo\
+l\xad-\xd9\xa3\x0c\x85\xabHY!R\xfaQ\x86 \
+\x8f\x02rHD\xf6C\xebW\xb3\x87\xb6\xcd\x8a\xa3\x0c\
+g\xcdy\xc2Y?\xfb\xa5=\x22{W\xc5\xe3\x8bS\
+i\xa9W\xcanS\xca\xfc\xa4\x86\xac&d5\xa9B\
+\x93\x87y\xe6\xe2s\x12\xef\x8b ,\xc0A\x05\x1e\xd4\
+\xda\xdao\x18F\xa7R*\x11\x08\xcc\x1f\xe6Y\xaa\xa7\
+\xc2d2\xb9ptt\xb4\xbe\xf3\xbd\xeeM\xa9t\xfa\
+f\x00\xf0\xf9\xca~\xb4\xfc\xe3+vT\x1aF\xbc\xae\
+\xaenx.\x15\x8a\x9dS'jg\x15{\x1c\xc0\xf1\
+\x8e\x97\xf6\xf4Mn\x82\xb6\xacT<T_\xff.\xe6\
+\xa0\xcc\x9f\xa8=?\x02\x8av\xde\xbb\x14\x91\x80d6\
+A\xcf\x030\xd3C7\xbb\xa3\x7f\xf2\xef\xf9\xb14/\
+\xf32/\xf32/sM\xfe\x1f\xdc\xa3\x18\xc5\x13\x96\
+\x8d\xbf\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x02\x07\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x01\xb9IDATH\xc7\xed\
+U\xbbnSA\x10=g\xf6\x96n]R\x82\x1bl\
+yu%\x9b&\xff\xc0\x17\xe0*M\x1a+R\x04\xdf\
+\x10d\x81HA\xe3\xca\xfe\x02\xfe \x85\x0b\xa4\xfb\xd0\
+\xfa\x1ah\xe0\x13H\xe9\xea^\xef\x0eEl\x09E\xb2\
+\xb3\x89\x8c\x04\x12\xa7\x1c\xcd\x9c3;3G\x0bDB\
+U\xa5\xaa\xaaN\x9e\xe7\x1dU\x95\xd8:\x89%w\xce\
+\x9dx\xef\xe7$\xe7\xce\xb9\x93X\x91\xa8\xa4<\xcfS\
+\x00\x93\x10B\x0a \x050Y.\x97\xe9\xd1\x04Dd\
+\x06@\x01\xdc\x90\xfc\x09@C\x08\xb3\x98\xda$&\xc9\
+\x18\xf3\xae\xae\xebo\xc6\x98\xcb\xdb\x89\xe9\x1b\x00]\x1c\
+\x1bEQ\x5c\x17Eq\xfd\x90\x1a\xc1\x1f\xc6\xbf/\x90\
+\xec\xee<\xcf\xf3TDf$\xdf\xa7i:\xdd\xb3\xec\
+O\x87\xc8\xb2,;\x15\x91sc\xcc\xa8\xdf\xef\x97$\
+C\xb23Q\x92$\x13\x00\xeb\xa6i\xbe\xee#\xb0\xd6\
+~\xb8\xe7\xda\xbe\x00X\xab\xeaG\xe7\xdc\x85\xaa.X\
+UU\xc7{?\xdf\x9a\xe8\x06\xc0w\x00\xfen\xe7w\
+\xc9\x9dsc\xef\xfd\xcb\xdfc$\x05\xc03Um\x03\
+(U\xf5UR\xd75H\x1e\x9c\xa3\xf7\xfe\xd1;\xe0\
+nD\x00&\x00\xb4i\x9a\xf1p8\xfc\xfc\x18\xb2\xb2\
+,_\x00\xb8\xe2m\xc7\x17\xd6\xda\x85\x90\x0c\xd6\xda\xc5\
+f\xb39\x0b!\xb4\x92$y\xbe\x8f\xc097v\xce\
+\x8d\x0f\xbc\xb4\x0b\xa0E\xf2\xccZ\xbb \x19\xfe;\xf9\
+/q\xf2}\xc8\xb2\xectk\x22\xd9]\x8b\xf7\xbe;\
+\x18\x0c\xa6G\x11\x10\x91s\x00k\x00O\xb6\xa1+\x11\
+i\x01\x98\x1eeD!\x84\x11I\xaaj[U\xdb$\
+i\x8c\x19E\x19\xed!\x9f>\x80\xb7\xdb\xd0\xeb\xd8;\
+g\xec\xb2TUV\xab\xd5S\x00\xe8\xf5z?bM\
+\xf4\x0b5\xc3\xd9\x02\x18\x9eHv\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x07\xb5\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00(\x00\x00\x00(\x08\x06\x00\x00\x00\x8c\xfe\xb8m\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x07gIDATX\xc3\xe5\
+X]l\x14\xd7\x15\xfe\xce\x9d\x1f{\xa9\xf0Om\xb3\
+\xbb^06`U\x85V\xa2\xa2\x8fUjWXJ\
+\x22\x92Vih\xa444\x92QQ[0/\x09$\
+\xad* \xa8jR\x13\xe5\x01\xe8\x03\x95\xe2\x87\x94>\
+\x10\xd2*4T\xa9\xb4\x14\x1b\xa5/A@\x83R\xec\
+\x14b\x8c\x7f\xd6\xbb\x8bq\x0cN\xca\xda3;\xf7\xeb\
+\xc3\xce\xe2\xc9z\x97.6H\x91r\xa5\xd1\xce\xde;\
+s\xcf7\xe7\x9c\xef\x9e\x1f\xe0\xcb4\xe2\xf1xu<\
+\x1e\xaf\xbe\x9f{\x9a\xf7s31\xac=\xfe\xeds_\
+\x08\x80\x89Db\x89a\x18a\xad\x8d:R\xd7\x0e\x0e\
+\x0d\xae\x07\x88D\x22\xd1!bO)\xe5Mz\x9e\x97\
+\x8e\xc5b\xb7\x17\xfc\xd1\x0byijj\xaa&\xe38\
+\x9b\xa0\xf5\x0f\x08i\x15`\x05\x80\xea\xc4xR\x01D\
+\xac\xb1Q\x03\xb8E`T W\xa0\xf0v\xc8\xb6O\
+\xd6\xd6\xd6\xde|\xa0\x00S\xa9\xd4\xaa\xac\xd6[\x95\xa8\
+m\x00\xea\xe7it<\x09\x1f`\xb1\xd7o@pD\
+\x01=\x91H\xe4j\xb92U9\x0f\x91\xb4\x12\x89\xd4\
+S\x9a8\xa6D\xbdP\x0c\x1c\x00\xe6.\xf1\x7f\xe7\x8d\
+z\x10/j\xf2X2\x99\xdc|\xee\x1c\xad\xfb\xa2\xc1\
+\x89\x89\x89\xa5\xb3\xae\xdb\xa5D\xed\x05`\x17,g\x01\
+\x5c\x06qAD\xae^\x1d\xba\xf6(\x14\xd0\xbc\xb2\xe9\
+]RZ\x14\xb8\x01\x22\xad\x85\xbeN\xd2\x81`\x8fe\
+\x18\xbf_\xb6l\xd9g\x0b&\xc9\xc4\xc4\xc4R\xc7\xc9\
+\xbe\xa2\x94\xea,\x00w\x03\x903\x02}XD\xfa\xc3\
+\x91\xf04\x80\xd9K\x03\x03\x16\x004F\x22{\xaf\x01\
+\x15\xa1t\xba\x8a\xe4Z\x12]\x10y(\xafy\x11\xb1\
+A\xee\xf3<\x1d\xbb~\xfd\xfa\xaf\xee\x06R\xdd\xcd\xac\
+\xb3\xae\xdb%J:\x01T\x06\xccx\x89\x82N/\xeb\
+l\x89F\xa3}\x91H\xe4\xba\x88\xcc\x88\x08\x0d\xe1A\
+CxPD\xd8\x222\x13\x89D\xaeG\xa3\xd1>\xcf\
+\xcb>C\xc1V\x00\x97\xee\x98_\xa4\x92\xe4O]\xcf\
+\xdb~7s\x974q\x22\x95zJ\x887\x02\x9a\xcb\
+\x828\xaeu\xb6k\xf9\xf2\xe5\x93\x0ba\xff\xf4\xf4t\
+\xdd\x7fo\xdf>L\xe2\xc9\xbc\xf5H:\x14<\xb3<\
+\x1a=^\xb6\x06GFFVCsW\x00\x1cI\x1c\
+\xcff\x9d\xe7\x17\x0a\x0e\x00\xaa\xaa\xaa&M\xc3xN\
+\x04o\xe55)\x22\xb6\x10\xbb\x87\x87S\xab\xca\x06h\
+\x9av\xa7\x88\xac\x0fL]\xa2\xcev555\x8d/\
+62444\x8c\x7fe\xc9\x92\x1d \x07\xee\x98Q\
+\xe4[\x96\x85\xce\xb2L<55Us;3\xf3\xb1\
+\x88\xd4\xe5\x09A\x8d\xceX,\xf2N\xce\x097\x1b7\
+\xb1\xea\x1b\xda\xd2m\x80\xac\xd3\x94\xcf\x84\xd9\x7f\xba\x9e\
+\xf3^\x14\x87&\x00\xe0St58F\xe5C\x10\xf9\
+\x0e\x04K\x01\xfc[\xb9\xec\xab\xc1\xb5\x0f\x05\xc7=\xdf\
+\x85\x1e\x87fO^\x0e\xc9\x1bN\xa8\xb2\xb5\xa5\xe00\
+\x9f\xc7\xe2L&\xf3\x98\x88\xaa\x0b\xd0\xe5\x8c\xd6\xd9S\
+\x00\xd0\x8b6\xf3\xa6\xd1\xfc\xb4V\xdc\x07H3DD\
+\x09\x00\x9a\xdbm1\xffv+\xbb\xeb\x05\x00pM\xe9\
+\x86\xc8\xa3\x10\xdfEHjK\x0dO\xea\xe6\x97z\xbd\
+\xb6\xa3\xed\xe8\xcbj\xd7\x8d\x1b\x86y\x06\xc0\x13\xbe\x16\
+\xeb+2\x99M\x00\x8e\x96\xd4`\x22\x91X\x22\xca|\
+\x03\xe0\x0f\xf3\xc4\x10\xb0#\x1a\x8d\xf6\x01\xc0\xa4\xb1\xfb\
+I(\xf9\x13@\x0b\x22RH{@f\xfc?\x95%\
+\xd6]h\xfe\xb8\xce\xeb~\x0b\x00\x92\xc9d\x1b!\xf1\
+;\x8a\x22\xff\xecE#[V\x88d\x8a\xfa\xa0a\x18\
+a\x01[\x03S\x97E\xa4\x1f\x00>\xc1\xb6j\x08~\
+\x06\x81=O\xb8\xaf\x02\x08B\xb9\xab\xe4\xbaM\xe1\xcf\
+?\xc1\xb6j\x7f\xaa\x1f\xc0\x959F\xa85\xdep:\
+R\x92$\x8e\xc3zM4\xe5\xffk\xe2B&\x1c\x9e\
+\xce=\xb8t\x0d\x94\xb4.:%Sj\x8d\xc2W\xd7\
+\x00@8\x1c\x9e\x06q\xfe\xce\xa2\xd6M\xb6\xad\xebJ\
+\x02\xac\xa8P5\x22\xa8\xca\x1b\xc5\x10\xb9\xda\x0c\xcc\x02\
+\x806\xcdP\x91P\xb7\x90ak\x93!\xff~\x96\xc2\
+\xa1\xc0\xe1]\xad\x94\xaa\x99\xe7\x83\xf1x\xbcZ\x0ck\
+\x8fm\xdb\xebC\xa1\xd0\xf7\xf2\x00\x9dY\xe7|f&\
+\x137\x84\x07\xbf\xd9\xfen-l\xf9\xab\x00k\x16\x83\
+\x8e\xc0\xc7p\xf8\xf8\x87\xbd\x8fLy\x94\x9d\xa1%\xa1\
+\x8e\x0a\xcb\xde@\x1f\xcb\xccL\xe6\x1f\xb3\xb3\xceEz\
+\xee\xfe\x8e\x8e\x8e[\xaadRR0Nc\xe8\xb2\x90\
+}\x8b61\xd9w\x1aC\x97\xe7\xcc\x9a\x97\x96\x93K\
+~\x9e\xb8\x05,Nw\x88\xe2\xdf}\xd3\x93\x9a\xbfi\
+l\x8c\xec\x15\x11\xe62\x84\xdd_\x17\x0bo\x02\xb2\x16\
+R^\xaa\x16\xf8n\x0d\xb0\x9f.~T\x8f\xee\x01\x9f\
+\xd82>\x9ezI\x94\xfc\xda\xc7\xa2\xa9\xe5\xe1X,\
+\x1c/\xea\x83\x9e\xd27\x01\xdc\x9a\xf3g\xd5\x0c\xa0b\
+.\xa1\xeb\x1e\xd0.\x9f\x050\xb0\x00\xe5}d\x80\xcf\
+\xe6\xc1\xe5\xdd^DZ\x02\x8a\xba\xe5c(N\x12[\
+\xe4\x06\x81\xd19\x16\xebo\xa7\xd3\xe9\xaa\xcf\x85*\x1c\
+\xb8@\xb0\x93\xc4\xf9\xdc\xd9V\x96\xf6\xce\x13^g\x8d\
+{\xe0Bp:\xb777\x04\x9ck\xd4\x16\xb9Q\x12\
+\xa0\xe7yi\x01\xaf\x04\x8e\xaeV\x92k\xe7\xa5\xc6n\
+\xf7Y\xcfu\xb7B$Q\x06\xbc1\xe5bk\xbd\xfb\
+\xea\xfb\x85\x0b.\xb9\xd6Oh}\x7f\xe3\x15\xcf\xf3\xd2\
+%\x01\xc6b\xb1\xdb\xa0:\x11\x0c\x85\x84\xda1::\
+\x1a*\xdc<\x8c\xd7.f\x1dw\x13\x83\xe7X\x11\xcd\
+)\x07\x9bj\xf1\xbb\x8b\x85K\xa3\xa3\xa3!\x83\xe8\x0a\
+\x86[M\x9e(\xac\x00\xe79z(d\xbfC2\x90\
+R\xf1\xbb\xca\xb26\x16\x93\x1f\xc6k\x17\x01\xfe\x02\xc4\
+\xa5\x1c\x09\x02\x84 \xfa\x09o{1p\x00\xa0,k\
+\xa3\x9fe\xdf\xc9\xd2=\xd7=\xf9\x7f\xd3\xad\xda\xda\xda\
+\x9b\x029\x02\xc0\xcb[T\x01\xbf\x1d\x1b\x1b\xab+&\
+\xa8\xde\xed>\xab]\xfd\x93\x02\xe2|d@o)f\
+V\x00\x18\x1b\x1b\xab\x13\xe2\xe5@\xf1\xe5A\xd4\x91\x95\
++WN\x95\x95\x0ff\xb3\xd2C\xf2\x83\xb98\x8fu\
+\xca4\x0f\x8d\x8c\x8c\x14\xad'\xf3\xc4\x01\xf1>\xc8\xb3\
+\xc5\x08\x11H\x86\x1b\x95i\x1e\x02\x10\xf4\xed\x7f)\xe8\
+\x9e\x07\x9e\xf2O`\xf7\xd7r\x80\xbb\xffSJs\xca\
+4\x0f\x81\xd8\x1c\xf0=G\xc0-\xd1h\xf4\xcd{\x02\
+H\xd2J\xa6\xd3\xcf\x83\xd8SP4\xf5S\xf0K\xed\
+\xba\xa7V\xacX\x91\x09\xbe\xd3\xdb\xdb\x1b\x01\x80\xf6\xf6\
+\xf6T!!\x94em\x14\xf2e@\xd6\x06\xe4\xce@\
+\xb0?\x1a\x0e\xbf*\x22\xee=Uu\x22\xe2Z\x86q\
+X \xaf\x03\x98\x09|\xd0:!z\x0c\xd3\xfec2\
+\x99lK\xa5R\xcbHV\x92\x14\x8f\xb2\xd3\xa3\xec$\
+)$+S\xa9\xd4\xb2\xd1d\xb2\xcd0\xcc\xa3B\xf4\
+\x00\xb2.\x08N \xaf[\x86q\xb8\x14\xb8\xb2\x0bw\
+\xd7\xf3v\x80\xd8W\xbcp\xe7\x15P\xce\x93\x1c\xba6\
+<\xf2\x08\x90+\xdcs\x11\xa2x\xe1\x0e\xc0\x81`\x9f\
+e\x18\x87\x1b\x1a\x1a>]to\x86\xa45>\x9e~\
+\x02\xc2]~1e\x14{,\xd7\x9b\x01b\x8d\xd1R\
+{{ ? \xe5@cc\xf8/w\xd3\xdc=\xb5\
+\xdf\xfc\x8d\x8e\x8d\x8c\x8c\x9cS\xa6\xd9Y\xa2y$s\
+n\x8a\xe2\xcd#\xe2\x0f\xd9\xac\xdb\xd3\xd4\xd44\xf8\xe0\
+\xdbo\x99\xccc\x10\xf9~Y\xed7z'\x5c\xd7=\
+Y\xec\x9c{ \x00\x83E\x96k\x18a\xdb0\xea\xe8\
+\xe8\xda\xc1\xa1\xc1\x17\x01`u\xcb\xeaW\xc4VS\xca\
+[|\x03sQ\x1dV_\xf0\x90\x7f\xe1\xd4\xe9\xbe\x87\
+s\xf3s\xf9\xdc\x17\xaaGM\xcf\xdd\x8f/\xdb\xf8\x1f\
+\xc7\xbd\x80\xdd2\x05\xc2o\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\x03\xa8\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x03ZIDATh\xde\xed\
+\x9a\xb1k\x14[\x14\xc6\x7f\xe72E\xd0\x14+\x9ah\
+\xf7\xeaW\x85\xd9\x0d\xa4\xc8\xbf\x10\x1b\xdf\xb3P\xd0&\
+O!\xd8(\xd9\x08\xda\xa8M\x04\xb3\xe1\xbd\xe6\x91\xe2\
+)\x08B,4U^\xfe\x84\x14\x81d\x874\xf6\xe9\
+4Q\x5c\x88\x81\x14\x97{,rF'\xebF7\x9b\
+\x1d\xdd\x859\xb0\xc5\xdc\x1d\xee9\xdf\xdcs\xef\xf9\xbe\
+3\x03}n\x92\xd7\xc4\xeb\xeb\xeb\xe7Dd\x02@D\
+V\xca\xe5\xf2N\xdf\x00H\x92\xa4\x14B\xb8'\x227\
+T\x15\xe0\xa9sn6\x8e\xe3F\xcf\x03\xb0\xe0\xff\x06\
+\xae\x03\xce\x86\x83\x88\xbc\x10\x91\xdb\xdd\x06\xe1\xba9Y\
+\xbd^\x1f\x0a!\xdco\x0a\x1e\xc0\xa9\xea\xb5\x10\xc2\xfd\
+\xcd\xcd\xcd\xe1\x9e\x04\x90$IIUg\x80\xa9#V\
+\xd6\x01S\xde\xfbj\x92$\xa5n\xf9\x8d\xba5Q\x08\
+\xe1\x090i\x81\xee\x02{\xc0\x05\x00U}\x07\x9c\x12\
+\x91A`:\x84P\x02n\xf6\xd4\x0a\x88\xc8\x9f6_\
+\x00\x16\x80\xa5\xcc\xdfK\x22\xb2\x00\xa8\xdds\xb9\xe7R\
+(\x84\xf0\x12h\x00\xcf\x9cs\x8f\x81\x9d\x0c\xb8m\x1b\
+{f\xf7,\xf6|\x1d\xd8\xd8\xd8x\x00<\xb4\xcb\x87\
+\x95J\xe5Q\x1e~\x1c}n\x05\x80\x02@\x01\xa0\x00\
+P\x00\xe8>\x172J\xfc\x04\xb8\xac\xaa\x8b\xa3\xa3\xa3\
+\xb7:\x98{KU\xdf\x8b\x08\xc0V\x87\xc5\xf0_\xe0\
+*\xf0\xca9w\xb7\x15\x15\xfff\x05VWW\x87\x8d\
+\x12O\x02%\x11\xb9\xda\x89s\xef\xfd\xb2\x88\xcc\x003\
+\xde\xfb\xe5\x0e\xf9\xd5\x15\xa0\x04L\x1eE\xc5\xa3\x16O\
+\xbej\x948%f\xaf:q>66\xf6\x01x~\
+\x92\xf4P\xd5\xd7\x19\x86;\xe5\xbd'I\x92C\xca\xce\
+\xb5PR\xd3\xc0i\xa3\xc45\xe7\xdc\xdd_\xb6A\x0f\
+|\xd7Tu\xd7b\x9aV\xd5\x7f\xb2zB2\x02|\
+\x06\xa8f@\xbd5J\xdc\xae\x18\xdf\xf2\xde/\xdb\x93\
+?\xd2\xd6\xd6\xd6\xceFQt\x11\xf8\xad\xcdy\x87\x80\
+?\x80\xf3\x16o\x00\xe6Ed\xae\x5c.\xefD\x96k\
+\x13&\xc0\xb3{\xe2\x02p\xeb\x18\xcb\xfd>\x8a\x22~\
+\x946\x16\xfc\x1cp\xb6C6\xec\x80\xbfT\xf5\x0d\xf0\
+\xdce\x02\xf8i\xa9\xd1M_\xe9\x0a\xac\xa8\xea\xef\xd9\
+\x142\x19\xb8$\x22\xdbm\x9e\x18[\xed\x9c6\xde\xfb\
+e[\xa9\x93\xa4\xd0S\x11Y9$hZ\xb4Cv\
+\x81\x05\xe7\xdc\xe3<\xfa9\xc7\xe9/\xa9\xea\x94\xe9i\
+mn\xcf|I\xa18\x8e\x1b\xce\xb9;\xc0<\xf0\x09\
+\x18\x04\xaaV\xd0~\x89\x99\xef\xaa\x05\xbfg\x9b\xf7P\
+oIZ\x15\xb2\x81\x81\x81\xaa\x1d\xa7\x0ehT*\x95\
+3\xc7u\x9e9mh\xe7t:\xa2\x12\x7f\xb4B\x16\
+\x80\xf9(\x8aj###\xdb\xdf\xad\xc4\xe3\xe3\xe3\xdb\
+\xce\xb9\xd9\x93\x0a\xf0\xf4\xb4Q\xd5\xb9\x14H\x07\xb6\x98\
+i\x14\xcc6\x07\xff3D\xfd\x03\xbb|\x94\x97\xa8\x8f\
+rNc\xc9{\x9f\x14z\xa0\x00P\x00(\x00\x14\x00\
+z\xa3\x0e4\x0b\xf0\x10B\x1e\x8d\x82\xfc\x00\x88\xc8\x15\
+UM\x05\xf8G\x93\x80)\xff\x1f\x0e!\xdcK\xf5\xad\
+5\x0az\x0b@\xb3\x007\xf6\x98\x82\xbb\xa4\xaa\xa7\xe5\
+\xa0\xc7\xd2q\xa3 W\x00\x966\x0d\x0b~\xd0~\xa9\
+\x9d\xb7\xfe\xd0\x9ei\x8c\xd9\x9e\xdb\xc4q\x1c7\xf6\xf7\
+\xf7k\x1c\xbc\x1f\xd3&\x1e$6\xb6\x10EQ\xad\x9b\
+\x02\xa9\xef_t\xe7\xfa\xa9\x01__\xa5\xfe\xd77\x9f\
+\x1a\xa4V\xaf\xd7\x87\xbc\xf7\x13&n\xfe\xcf\xebc\x8f\
+\xbe\xb7\xcfS\xfe\x928\x99e\x85\xff\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x03\xb8\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00(\x00\x00\x00(\x08\x06\x00\x00\x00\x8c\xfe\xb8m\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x03jIDATX\xc3\xcd\
+\x99OlTe\x14\xc5\xcf\xb9oZ\x99\xfe\x1bHD\
+\x04\xe3B)]CM$\xa5\x9b\xd7a#iR5\
+5M\xea\xaa[\xf6\xb0\x95X\x97\xb8b#;w\x1a\
+\x1b\x88\xd8\x85t5\xf36-\x81\xc4\xd6uG\xbb1\
+\x16\x81\x1a\xe9\xdfg\xeb\x9b{X\xf4\xa5b\x1d\xdaN\
+)\xd3\xf7[\xcd\xe2e\xbe\x93\xfb\x9d\xf7}\xf7\x9eG\
+\xec\x83\xc7a\xd8\xd6l\xf6\xbe\xcc.@\xea\x96Y\x17\
+\xa5\x93\x00:\xd2G\x96D>\xa4\xfb,\xc8i\xbaO\
+m\xb8?x#\x8aV\xea]\x8b{}P\x80-\x16\
+\x8bgA\x0e\x89\xfc\x18\xc0)\x00\xad w\xfe\x0fI\
+\x00V\x01\xccS\xfa\x1e\xd2X\xa1T\xfa\x99\x80\x1f\x88\
+@\x01\x5c\xbcx\xf1\x1d'\xaf\x92\x1c\x00\xf0&\x00\xc3\
+\xfep\x00\x7fP\x1a\x87\xfb\x97\x85Ri\x8e\x80\xf6-\
+Paxd)\x08\x06\x9d\xbc\x06\xa0s\xd7j\xd5G\
+E\xee\xa3\xc7\xaa\xd5[\x8c\xa2\xbf\xeb\x16\xa80l{\
+\x9a\xcb}\x01\xe02\xc8\xd7\xf0*\x90\xd6\x01|\x95\xc4\
+\xf1g\xc7''\x97\xf7,\xf0\xf70|\xbd%\x97\xfb\
+\x1a@\xff\x01W\xad\xa6G\x05\xfc\x18'\xc9\xc8[Q\
+\xb4\xb0\xab\xc0'\xbd\xbd\xed\xb9|\xfe\x1b\x90\x97\x00\x04\
+h\x0cUHw\x938\xfet{%m\xbb\xe7r\xf9\
+\xfc(\x80\xfe\x06\x8aC\xbaV\x7f.\x9f\x1fU\x18\x1e\
+\xa9)P\x00\x97\x82`0\xf5\x1c\xd1h6\xd7\xbc\xfc\
+W\x10|\xa2\xe7vv\xeb\xc7\xd3b\xf14\x82\xe0\xae\
+\x8038D\x08TP\xad^:Z*\xfd\xbaUA\
+\x01\x06\xb3+\x92:q\xc8H\xea\x84\xd9\x15\xa5\xda\x0c\
+\x00\x16\x8b\xc5\xb3\x22\x07\x0eekkl\xb5\x93\x1f.\
+\xf4\xf5\x9d\xfb\xd7\x83\xe4PzCd\x02\x02'\x02\xb3\
+!\x00\xe0\xe30lk\xca\xe5~\x02\xd9\x85,!\xcd\
+\x1eM\x92\xf7\xcc\xc8\xf3\xe9\xc5\x9f5N\xfdI\x9e\xb7\
+\xa6 \xe8\x01\xd0\x9aA\x81\xad\x81\xd9\x85\x9c\x93\xdd\xf5\
+\xb4]\x8d|Y\x04t\x1b\x80.d\x14\x92g,\xa3\
+\xfe\xdb\xf2\xa1Aj\xcf\xac<\xa9\xdd\x90q\x0c\xe42\
+\xb2k\xc2e\x030\x9f\xe1\x02\xce\x9b\xa4J\x86=X\
+1J\xd3\xe9h\x985q\x824mt\x9fJ\xe7\xd6\
+\xac\xb1J\xf7)+H\xf7\xb3\xe8C\x02\xf3\x05\xe9\xbe\
+1\x8aV$\xdd\xc1\x1e'\xfd\x06\xe1\x90\xee0\x8aV\
+6\xbbV\xf71\x01\x8f2c?\xe0\x11\xdc\xc7\xb6\x1a\
+\xd6B\xb9<\x03\xf7\xf1\xec\xd4\xcf\xc7\x0b\xe5\xf2\xcc\x96\
+@\x02n\xd2u\x02\x95\x0cx\xaf\x92j\xf1\xff\x8c\x9d\
+\x85Ri\xce\xddG\x01\xac\x1f\xa2\xbeuw\x1f-\x94\
+Js\xff\x9b\x8b\x09\xe8X\xb5z\x0b\xee7\x0f\xe5\x5c\
+\x94\x04\xf7\x9b\xabkk\xb7\x9fO\xbc^\x14}|\x0b\
+\xf2\x83\x06G\x1f\x13I\x1c\x0f\xef\x18}\x00\xc0\xf1\xc9\
+\xc9\xe5 IF$M4\xa4\x92\x9b7\xc6D\x90$\
+#\xb5\x12\xae\x9a\xedVG\x14-T\xe3x\x18\xd2\x8d\
+W\xec\xc9uH7\x928\x1e\xee\xa8\x91la\xb7Y\
+\xe4\xb7\x9e\x9e|kK\xcb \xcd\xaeA:}\xc0\x83\
+\xfd/r\xff|um\xed\xf6\xdb\xf7\xee\xc5;\xbc\xd5\
+\xbb\x1e\x9a\x5c,\x16\xdfu\xf2*\xcc\x06\x08\x9c\xc0K\
+D\xc0\xe9!<n\xd2\xf5\x97\x8e\x80\xb7\x09\xb5\xc5\xbe\
+\xbes0\x1b\x02\xf9\x91\xea\x0c\xd1\x09\xcc\xbb\xf4\x83\xb9\
+\x7fW(\x97g\x0e,D\xaf\xc5\x93\xde\xde\xf6\xa6\xe6\
+\xe6\xcd\xcf\x10d\xb7\x80.\x92'!u\xa4\x9d\xf0\x92\
+\xa4\x87\x04f!M\xd3}\xea\x9f\x8d\x8d\x07/\x8ay\
+w\xe2\x19t\xf2\x8ff\xe3\xe8\x08\xbd\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x05\x18\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x04\xcaIDATx\xda\xed\
+\xdbM\x8c\x95\xd5\x1d\x06\xf0\xdf\xff\x5cp>\xe2\xc5\x0e\
+\xd2\xd2\xa4$\xa2.4$\xa4\xa8\x09\x1d\x13K\x18\x8c\
+VY\xc8\x8a\xd9HcW\x04\x16u\xd9U\x93\xc9D\
+7n\xd9Ht\xd5J\xbb\x18V\xb0\x80\xd6DF\xb0\
+\x09S\x12D$!\xb8\xf0+q3\xa18\x95\xb1\xf3\
+\xd1\x99\xfb\x9e.\xee\xe5cd\x18\x87a>\xee\xdc\xb7\
+\xcf\xf6&\xf7}\xff\xcf\xf9\x7f\x9c\xf7\x9c\xe7\x09K\x80\
+\xdc'yF\xbbN\x1d\xa6ui\xb3\x0d\xdb\x84'\xf0\
+\x88\xb0Q\xb6^\xd6\x01\xc28F0,\xfb\x1aW\x14\
+.J.\xa8\x191f\xdcy\x13\xd1\xafX\xecw\x8d\
+E\x0d\xfc\xb8Nm6j\xf7\xa8\xc2\x0e\xa1G\xb6]\
+h_\xe0_N\xe0\x9c0\xa8\xe6#\x15_\xf8\xcep\
+\xbcb\xac\xa9\x08\xc8\xc7TUm\x11\xba\xf12\xba\x85\
+u\x8bHp\x96]\x97\x0c)\xfcMv\xd6\xa8\xcb\xb1\
+\xc7\xe8\x8a\x12\x90\xfb$;tK^\x14vc+\x0b\
+^\xed\xf9R1)|\xaapR\xf6wg\x0c\xddO\
+i,\x98\x80|\xc2&\x9d\xf6\xcaz\x85\xa7\xd0fy\
+1)\xbb \x0c\xc8\x8eF\x8fo\x96\x85\x80<\xa0b\
+\x83\x9d\x92\xfd\xb2\xe7\x85\x87\xad$\xb2k\xb2S\xc2;\
+\xae\x1a\x8c^\xb5%# \x1fS\xb5\xce\xab\xc2A<\
+\x89\xb5\x8b\xddH\x17D\x01S\xb8\xa2\xe6\xb0\xef\x1d\xb9\
+\x97\xde0\xef\x97\xcf\x836\x08\xaf\xe3 \xd6#i.\
+\x14\xf8Vv\xd8\xb8C\xb1\xdb\xd5E! \x13N\xdb\
+,\xfb#^CEs\xa3&{\xcf\xb47\xbc\xe0\xcb\
+\xa8g\xc8}\x10p\xda\xa3j\xfa%\xaf6\xe1\xaa\xdf\
+=\x1b\xb2\xbf\x9a\xd6\x17/\xf8b\xc1\x044\xd2\xfe-\
+\xfcn\x15\x05\x7f;\x09\x7f6\xee\x0fs\x95C\x9a#\
+\xf8\x07\x85\xdf\xcb^[\x85\xc1\xd7c\x0b\xbf\xd5\xe1\xf5\
+\xfc\x0f\xd5{\x22 \x0f\xa8`\x1f\x0e\x8a\xa6\xaf\xf9\xb9\
+P\x11\x0e\x98\xb6\xaf\x11\xd3<3`\x83\x9d\x8dQ\xf7\
+\xb0\xd5\x8f\xf58\xe0\xa7z\xe6E@\xfe\xc0/$\xfb\
+\x1bs>\xb5\x00\x01\x09O\x0a\xfb\xf3\xa0Ms\x12\x90\
+\xfb$k\xed\x95=\xdf\xd8\xe4\xb4\x0a\xd6b\x97\xb07\
+\xf7\xcd\x8cy\xe6\x0a\xef\xd0\xad\xd0\xdb\xd8\xdeF\x0b\x11\
+\x10\x8dr\xee\xb5K\xf7\xac\x04\xe4c\xaa\x92\x17eO\
+k]<%\xfb\xcd\xedS\xe1V\x06Tm\xc1n\xb1\
+\xec_u\xcb\x896\xd9n\xd9\x96\x19\x04\xe4\xe3:\x85\
+na\xab\xd6\xc7V\xd3\x9e\xcd\xc7u\xde\xca\x80\xaa\x9f\
+\x09/-\xf9aFst\x836\xe1e\x0f\xd9\x08)\
+\xf7I\x0a\x8f\xc9\x9eU\x16d\xbf\xf2_\x8f\xe7>\xa9\
+~z\x9b\xech\x9c\xe1\x95\x03a\x9d\xb5~\xed\x19\xed\
+I\xa7\x0e\xecl\xb1\xb17\x9f\xb1\xd8\xa3SG\x12~\
+\x22lW6d\xdbUt%a\x1b\x8d\x0b\x0a\xa5\xca\
+\x81\xb6Z\xf6\xf4\x0d\x02J\x89J\xf2\xcb\xd4\xb8\xae*\
+'\xb2'Rf\xb3\xf2bs\x0a\xf5\x0dA)\x116\
+&t\x95\xb8\x04\xbaR)\xb6\xbfw\xcf\x80\xf6\x94s\
+\xa96@w E]\x9cPVL$ueFY\
+1\x922\xc3%n\x82\xc3)\xf8\xaa\xc4\x19\xf0U\x92\
+}V\xe2)\xf0YR\xf1Ii\x09(\x5cL\xa6|\
+B\x09'A]k\xf4q\x92\xfd[8W\xc2\xf4?\
+\xa7f$\x193\xae\xf0\xa1\x1f\x11\x12\xb4\xdc\xfa3h\
+\xccxr\xde\x84\xe4\x8c\xecz\x89\xc2\xbfn\xcaG\xce\
+\x9bH\xd1\xaf0\xe1K\x0c\x95(\xfd\xff\xe9\x01\x9fG\
+\xbf\xa2~/0i\x18'\xd5\xa5\xa9\xad\xdf\xfc\xb2\x93\
+\xbe\xabo\x00\x13\xc4+\xc6dC\xb8T\x82\xf5\xbfd\
+\x8d\xb37\xf4\xc6\xb7\xee\x06G]\x96\x9d\xc0d\x0b\x07\
+?)\x9c\x10.\xdf\xfc\x1a\xbcY\x16{\x8c*\xbc\x8f\
+\x8f[\x98\x80\x0b\x0a\xef\xc7s\xb7\x84\x943\xf5\x01g\
+\x0c\xe1\xa8\xecZ\x8b\x8d\xc5\x8ck\x0aG\x9dvv\xc6\
+y\xc0\x8c\xe6\xd8\xaf\x90\x1d\x15>P\x97\x9f\xb6\x0a\xa6\
+pJ\x18\xf8\xa1\xb2\xfc\x0e\x0dP\xf4\xf8\xc6\x94wq\
+\x85\xc5wh\xac\xc8\x8e?\x5c\x91\xbd3\x9b\xa2|v\
+\x11\xd4\x88A5\x87\xf1m\x0b\x10P\xd7\x0f_58\
+\xdb\x8f\xb3\x12\x10\xbdj\xbew\x04oso\xf2\xf3&\
+CM8l\x8d#w\x93\xd1\xdfU\x06\x17{\x8c\xca\
+\x0e\xe1O\xab\xb4\x14\x0a\xd9{\xfe\xe3\xd0\xed]\x7f\xde\
+\x044\xfa\xc1\xbf\x847\x15\xfe\xb2\xcaH\xb8!\x96~\
+\xe3\xc7d\xf3\xff\x97\xcb\xcf{\x90\x96\xd501\x83\x84\
+c\xaa\x1e\xb4O\xc5\x01\xcdh\x99\xd1hx\xcf-\x81\
+e\xe6\xe6\xd3\x06Tt\xe9Q\xb1_\xd8\xb5\xe2\xa6)\
+\xae\xe1\x94\xbc\x0c\xa6\xa9\x1f\x94\xc4&QB\xdb\xdc\x0c\
+\x12V\xca8\xc9%\xe1\x84\xda\x0a\x1a'\xef\xe8\x0dU\
+[Tt+\x96\xc1:\xbb\xc6Y\xe1\xf2\xbd\xd4\xfa\x92\
+\x12p\xf3-g3O\xb3\xfd>\xb2bB8Wd\
+\x1f\xa6\xc2\x99\xa65O\xcfZ\x1a7\xec\xf3\x15]\xdc\
+f\x9f\x0f\x8f\xc8~\x8e\xae9\xed\xf3\xe1\xa2\xbc\xf4\xf6\
+\xf9\xff\x01S\x81\xb5(X\xb9\x19\xf3\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x036\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x02\xe8IDATX\xc3\xc5\
+\x97\xc1K\x5cW\x14\xc6\x7f\xe7\xdc\xf1\x85\x8c\xed\xbc\xc8\
+\xa0\xb5\x0b\x13\xdb\x8d\x10\x10\x12\xd4\xcc\x22X^v\xee\
+R\x10\xea\x1f\xd1\xd4\xb5\xdb\xee\x12\xe8\x22$\xfe\x13\x06\
+\x84d\xe7&\xe4\x99\xac4\x8a\x01W\xddM1\xa0\x8c\
+\xd8aF\x9c\x92q\xee=\xddL\xc2\xb4I\x8c\xd1q\
+\xde\xb7=\x8f{\xbe\xef\xbb\x87\xfb\xce'|\x01\x06\xb2\
+\x9f$\xfd\x91sC\xc0T\x80;*r\xc3`T`\
+\xa0\xfdMU\xa0\x1c\xcc\xde(\xbc\x00^7\xbd\xaf\x0c\
+\xa6\xe9\x91\x80\x9dt\xbe\x9cT<(\x95\x0a\xad|~\
+<\xca\xe5~\xc1\xecg`\x04\x119\x99\xb1\x19\xb0\x83\
+\xc8Sk\xb5\x9eX\xa3\xb1]\x5c[\xab\x7f\x15\x01\x03\
+9L\x92\xb1\x96\xea\xac\xa8\xfe\x8a\xc8\xf7\x9c\x01\x16\xc2\
+\x1ef\x8b\xb9\x10\x96\xbfM\xd3??\xe5\xc6G\x04l\
+b\xa2\xaf\x16\xc7\xd3\xa6:\x0f\xcc r\x89\xf3\xc0\xec\
+\x1d\xb0\x22!<\x8ak\xb5W\xb2\xb9y\xfcY\x026\
+1\xd1W\x8d\xe3\x19qnA`\xd2 \xa2\x0b\x10h\
+\x1al\x98\xf7\xf7\x07j\xb5\x95N\x12\xdai{-\x8e\
+\xa7qn\x01\xb3\xa9n5o\x9f\x1da6\x85s\x0b\
+\xb58\x9e\xb6\x0e\xe1\x1f\x08\x1c&\xc9\x98\xa9\xce+L\
+\x22\xd2G\xb7!\xd2\xa70i\xaa\xf3\x87I2\xf6\x1f\
+\x02\x07\xa5R\xa1\xa5:\x0b\xcctS\xf9'\x9d\x80\x99\
+\x96\xea\xecA\xa9T\x00P\x03\x91|~\x1c\x91{\xe7\
+\x1e\xb8\xd39q\x09\x91{\x92\xcf\x8f\x1b\x88\xee'I\
+?\xce\xcd\x89\xea0=\x82\xa8\x0e\xe3\xdc\xdc~\x92\xf4\
+k\xe4\xdc\x90\xc0]z\x0c\x81\xbb\x91sC\x1a\xe0\x16\
+0B\xef1\x12\xe0\x96\x02\xc9\x17\x9f\xd7\x8b\x99\x05\x01\
+\x12U\x91\x1bd\x04\x81\x9bj\xf0\x03\x991\x90Q\xa5\
+\xfdK\xcd\x08\x03J\xc6P\xa0\x9aa\xff\xaabV\xce\
+\xac\xbdYY\x0d\xb62\xeb\x0f[\x0a\xa4\xed5\xaa\xd7\
+\xea\x0dHUa\x1d\xd8\xc9\xc0\x80\x1d\x85umz_\
+1x\x96\x81\xfd\xcf\x9a\xdeWt0M\x8f\xf0~I\
+\xcc\xf6z\xf6\xfe\x98\xed\xe1\xfd\xd2`\x9a\x1e\xa9\x80Y\
+\xa3\xb1\x1dBXl/\x90\x17}\xf7\xefB\x08\x8b\xd6\
+hl\x0b\x98\x02\x14\xd7\xd6\xea\xb9\x10\x96\x81\x15\x81\xe6\
+\x05\xbe\xfdM`%\x17\xc2\xf2\xfb\xac\xe0\xde\x17\xa3r\
+\xf9\xef\xa9k\xd7*\xa2:\x86\xd90\x22\xae\xcb\xca\x8f\
+\x11\xd9\xf0\xde?x\x98\xa6\x9b\xab\xed\x8c\xf0\xa1\xc9*\
+\xd8\x83b\xf1\xed?Q\xb4'\xaa?\x0a|\xd7Y?\
+\xb7r\x91\x0d\xe7\xfd\xfd+\xf5\xfa\xf3;\xbb\xbb\xfe\xc4\
+`rP(\xfc\xe4\x9c\xfb\xad\x9b\xc1\xc4{\xff\xb8X\
+\xaf\xbf\xfc\x7f0\xf9H\xe1\xef\xbb\xbb\xe1r\xb9\xfc\xd7\
+\xed\xabW\xb7\x80}\x11\xb9\x8e\xc87g\x9dv\x09\xe1\
+\x0f\x7f|\xbc\xf8xuu\xa3S\xf9\xa9\xc3\xa9\xe4\xf3\
+\xe387\xd7\xde\x1bO\x15N\x0d\xde\x0a<5\xef\x97\
+\xce\x14N?\x17\xcf\xdb;\x5cbp\x13\x91\xd1\x8e]\
+\xa2\x8aYY`+@\xaa\xb0\x1e{_\xe1\x14\xf1\xfc\
+_\xbefE\xed\xa1l\x0a\x00\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x04]\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00 \x00ID\
-ATx\x9c\xec\xddy\x98\x1cu\xb9\xfe\xff\xfb\xa9\x9e\
--+\xc9$\x99^2\x01\x82\x0c\x0a\x11Q6\x11\xd9\
-\x12\x02\x88\xcb9*\x82\xbb\xb8 \xeaQq9\x90\x04\
-\x7f\xc7c\xf4\xb8$9\xfa\x15<.\x80\x80+. \
-\xee\x06\x90\x80\xb2+\x9b\x08\x04\x90\x00\x83\xccLUu\
-Of\x12\xb6d\x96\xeez~\x7fd@\x96\x84\x99I\
-W\xd7S\xcb\xfd\xba\xf4\xd2\x8b\x8bPo&\xe9\xfe<\
-\xfd\xa9\xea*\x80\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88(\xbe\xc4:\x80\x88\xa2s\xe55\xd7\xec+\
-5=\x05\xc0\xd1\x00v\x1f\xfb\xcb\x0fCu]\xcd\xc1\
-\xf9\xc7-^|\xb7]\x1d\x11E\x89\x03\x00Q\x06\xac\
-]\xbb\xb6\xb5\xb5m\xea\xd7\x15\xf8\x10\x00g\x07\x7f[\
-\x0d\xd0s\x067v|\xfa\xa4\x93\x16\x8dD\xd9GD\
-\xd1\xe3\x00@\x94rk\xd7\xaemm\x992\xf52(\
-\x16O\xf0\x97\x5c=\xb8q\xde\xf1\x1c\x02\x88\xd2mG\
-\x9f\x04\x88(%\x9a\xa7L;k\x12\x8b?\x00,\x99\
-=o\xe3\xd7\x1a\x16DD\xb1\xc0\x1d\x00\xa2\x14\x1b;\
-\xe7\x7f\x07&?\xec\xd7\x1c\x04\xfb-Y\xb2d}#\
-\xba\x88\xc8\x1ew\x00\x88Rl\xec\x82\xbf\x9dy\x9d\xe7\
-\x14\xce\x07\xc2\xee!\xa2\xf8\xe0\x00@\x94nK\xeb\xf8\
-\xb5\xc7\x84VAD\xb1\xc3\x01\x80(\xddv\xdd\xd9_\
-\xa8\xc0na\x86\x10Q\xbcp\x00 J\xb7\xe9u\xfc\
-\xda\x19\xa1U\x10Q\xecp\x00 \x22\x22\xca \x0e\x00\
-DDD\x19\xc4\x01\x80\x88\x88(\x838\x00\x10\x11\x11\
-e\x10\x07\x00\x22\x22\xa2\x0c\xe2\x00@DD\x94A\x1c\
-\x00\x88\x88\x882\x88\x03\x00\x11\x11Q\x06q\x00 \x22\
-\x22\xca \x0e\x00DDD\x19\xc4\x01\x80\x88\x88(\x83\
-8\x00\x10\x11\x11e\x10\x07\x00\x22\x22\xa2\x0c\xe2\x00@\
-\x94R\xaa\xdal\xdd@D\xf1\xd5d\x1d@D\xe3\xeb\
-\xed\xed\x9d\x93\xcb\xe5\x0a\x22\x92\x0f\x02)\x01:\x0f\xa2\
-\xf3\x01g.Dg\x8ab\xa6BfAu&\x043\
-\x01\xcc\xf4\xfc\xf2\x94z\x8f\xebz~\x0d\x90G\x01@\
-\xa0\x03\x01\xb0Q\x80\x01@\x07 2\x00`#\x02\xd9\
-\x08\xa0\x1f\xa8\x0d\x88\xc8\x80\x88\xf4\x17\x0a\x85J\xbd\xc7\
-&\xa2\xc6\xe2\x00@\x14\x03\x95J\xa50\xaa\xba\x87\xd4\
-\xb0P\x04{\x04\xc0\x1e\x02\xec\x01\xe8\xee\x00\x0a\x00Z\
-\x14\x80*\x00\xd1\xb1_%\x00\xf4\xa9\xffl\xfb\xff\x12\
-z\x9a\x03\xe8\xec\xb1\x7f\xfal\x01\xf6|\xfa\xd8Og\
-\xe8\xd3\x7f\xebS\x8d\xae\xe7o\x01\xd0\xad@\xb7\x03t\
-\xab\xca\xc3\x18\xfb\xdf\x91\x91\xe6\xee\x85\x0bgo\x0e\xbd\
-\x94\x88&\x85\x03\x00QDT5\xd7\xdb\xdf\xbf0W\
-\xd5\x97\xc2\xd1}D\xb1\xaf*\xf6\x86\xa0\xabZ\x0b\xa6\
-\x0a\xf0\xf4\xba\x1a\xfe:\x1e\xb9\xa9\x00\x16\x09\xb0H\x81\
-\xa7\x87\x04\x11Ek\xdb0\x5c\xdf\xdf\x0c\xd5n\xa8\xdc\
-\xab\xa2w:\xc0\x9d\xb5Z\xed\xae\xce\xce\xce^\xcbh\
-\xa2,I\xc1\xfb\x0cQ\xfc\xb8\xae;\x15h\xda\x1f\x08\
-\x0e\x82\xe8+\x00g\x11\xa0{\x03\xa8{[~2\xee\
-\xb9\xf7\xbe\xba~\xfd>{\xbf$\xa4\x92\x09\x1b\x04\xf0\
-w(\xee\x82\x83\xbbD\xf5\xef\xaa\xba\xbeT*m\x89\
-:\x84(\xed\xb8\x03@T'Umr\xdd\xfe}E\
-\xf4 @\x0f\x16\xc1A\x0a\xec\x03\x04c\xaf\xaf\xb1\xad\
-z\x9a\x88v\x00\x8b!X\xbc\xed\xd4\x86\x00\x225\xd7\
-\xf3\xef\x83\xe0\x06Q\xb9\xc1qpC>\x9f\x7f\xd0:\
-\x94(\xe9\xb8\x03@4I\xaa\xda\xe4y\xde~*\xb2\
-\x14\x90\xc3\x048\x02\xc0L\xeb\xae\xedI\xe0\x0e\xc0D\
-\x95\x15\xb8\x05\xd0\xebEs7<\xf9\xe4\xa3\xb7tu\
-u\x0d[G\x11%\x09\x07\x00\xa2ql\xd8\xb0\xa1u\
-\xfa\xf4\xe9\xaf\x0a\x80\xa3\x04r$\x80W\x22\xe2\xad\xfc\
-\x9d\x95\xe2\x01\xe0\xb9\xb6\x00\xb8Y\xa1\xd7\xe4D.\xcb\
-\xe7\xf3\xb7\x8aH\xcd:\x8a(\xce8\x00\x10mG\xa5\
-R)\xd4jz\xac\x02\xaf\x07\xf48\xc4\xf4\x13\xfex\
-24\x00<\xd7\x00 WC\xb1\xaeV\xcb\xfda\xc1\
-\x82\xb9}\xd6ADq\xc3\x01\x80\x08\xdb\xae\xd0\xf7\xbc\
-\xfeW\x89\xe8\xeb\x15X\x0a\xe8\xfeH\xc1\xeb#\xc3\x03\
-\xc0s\xdd#\x90\xdf\x05\x0e\xd6\x95::\xae\x11\x91Q\
-\xeb \x22k\x89\x7f\x83#\xdaY===Sr\xb9\
-\x96\xe3\xe0\xe8\x09P\xbc\x01\xc0.\xd6Ma\xe3\x00\xb0\
-]\x83\x10\xacU\xe0\xe2\xcd\x03\x03W,Z\xb4h\xc4\
-:\x88\xc8\x02\x07\x00\xca\x94\x9e\x9e\x9e)Ns\xf3R\
-Q=\x11\x90\x7fGB\xb7\xf6'\x8a\x03\xc08\x04\x9b\
-\xa1\xfa;\x15\xb9\x84\xc3\x00e\x0d\x07\x00J\xbd\xf5\xeb\
-\xd7\xb7\xcc\x9e=\xf7u\x90\xe0]\x80\x1c\x8f\x84\x5c\xc0\
-\x17\x06\x0e\x00\x932\x00\xc1/U\xe4\xe2RG\xc7\x9f\
-x\x11!\xa5\x1d\x07\x00J-\xdf\xf7_YSy\xb7\
-@\xdf\x06`\x8eu\x8f\x05\x0e\x00;\xad\x02\xe8\xa5\x8e\
-\xc8\x0f\x0a\x85\xc2_\xadc\x88\x1a\x81\x03\x00\xa5JO\
-\xcf\xc6\xf9\xb9\xe6\xea[\x10\xe0}\x10\xecg\xddc\x8d\
-\x03@(\xeeU\xe8\x0fD\xf5\x82R\xa9\xb4\xd1:\x86\
-(,\x1c\x00(\xf1T\xd5q+\x95%\x12\xe0T@\
-\xdf\x0c g\xdd\x14\x17\x1c\x00B5\x0c\xc8o\xd5\xc1\
-y\xa5\x8e\x8e\xabD\x84\xb7w\xa4D\xe3\x00@\x89U\
-.\x97\xf3\xd5 x\xaf@>\x0c`w\xeb\x9e8\xe2\
-\x00\xd0(z\xbf\x02\x17\xe6D\xbe\xc7G\x1fSRq\
-\x00\xa0\xc4\xf1<\xef\xa8\x00\xf2\x11\x01\xde\x08\xa0\xc5\xba\
-'\xce8\x004\xdc0\x14\x97\x02\xc1\xff+\x95J\xb7\
-Y\xc7\x10M\x86c\x1d@4\x11\xaa\xda\xecy\xde\x89\
-\xae\xe7\xffU!\x7f\x12\xe0$p\xf1'{\xad\x10\xbc\
-\x03\xe2\xdc\xea\xfa\xfe\xf5\x9e\xe7\x9d\xa8\xaa<\x05E\x89\
-\xc0\x1d\x00\x8a\xb5\xfe\xfe\xfe\x19\xa3\xb5\xda\xfb\xa1\xf84\
-\x80]\xad{\x92\x86;\x00\xd1\x13\xe0\x01\x15|\xb36\
-:z\xde\x82\x05\x0b\xb6Z\xf7\x10\xed\x08\x07\x00\x8a\xa5\
-J\xa5R\x18\xad\xd5>,pN\x03t\xb6uOR\
-q\x000UQ\xe8wD\xf5\x9b\xfc\xf6\x00\xc5\x11\x07\
-\x00\x8a\x15\xdf\xf7\x17\x06\x01>\x03\xc1\xc9\x00\x9a\xad{\
-\x92\x8e\x03@,l\x11\xe0\xc2Z\xad\xba\xba\xb3\xb3\xb3\
-\xd7:\x86\xe8)\xbc\x06\x80b\xc1u\xdd\xdd\x5c\xd7?\
-;P\xdc\x0b\xc1)\xe0\xe2O\xe91U\x81\x8f9\xb9\
-\xa6\x07]\xdf?\xb7\xbf\xbf\xbfh\x1dD\x04p\x00 \
-c\x9e\xe7\xed\xee\xba\xfe\xd9\x10\xe7\x1f\x10\x9c\x06\xa0\xd5\
-\xba\x89\xa8AZ\xa08u\xb4Z{\xc0u\xfd\xb3\xcb\
-\xe5r\xde:\x88\xb2\x8d\x03\x00\x99p]wW\xcf\xf3\
-/T\xc8\x06.\xfc\x941S!8\xad\x16\xe8\x06\xd7\
-\xf3\xbe\xd0\xdd\xbdi\x96u\x10e\x13\x07\x00\x8a\xd4?\
-\xff\xf9\xcf\xd9\x9eW^\x05q\xeeS\xe0}\x00\x9a\xac\
-\x9b\x88\x8c\xcc\x00\xe4\xb3\xadm\xc3\x8fx^y\xd5\xe0\
-\xe0`\xea\x1eGM\xf1\xc6\x01\x80\x22\xb1a\xc3\x86V\
-\xcf+\xffgsK\xeb\x03\x0a]\x8e\x0c=\x91\x8fh\
-\x1c3\x14\xba|hxd\x83\xeb\x96?\xcc\xfb\x08P\
-T8\x00PC\xa9\xaax\x9ew\xe2\xb4\xe93\xeeQ\
-\xe8W\x01\xb4[7\x11\xc5\xd4<\x88~\xc7\xf3\xcbw\
-\xbbn\xe55\xd61\x94~\x1c\x00\xa8az\xcb\xe5W\
-y~\xe5\x16\x85\x5c\x0c`\x0f\xeb\x1e\xa2\x84x\x09$\
-\xb8\xcc\xf5\xfd_\x96\xcbe\xben\xa8a8\x00P\xe8\
-z{{\xe7\xb8\xae\x7f\xb6\x13\xe8\xf5\x80\x1e`\xddC\
-\x94H\x8a7\xd5\x02\xbd\xcfu\xfd\xb3\x07\x06\x06fZ\
-\xe7P\xfap\x00\xa0\xd0\xa8j\x93\xeb\xfb\x9fprM\
-\x0f\x8e]\xd9\xcf?_D\xf5i\x86\xe0\xb4\xe1\x91\xd1\
-\x07]\xdf\xff\x04\xaf\x0f\xa00\xf1\x0d\x9aB\xe1\xfb\xfe\
-\x12\xcf/\xdf\x01\xc5Y\x00x53Q\xb8\xe6Bq\
-\x96\xe7\x97o\xec)\x97_f\x1dC\xe9\xc0\x01\x80\xea\
-\xd2\xdd\xbdi\x96\xeb\xfb\xe7\x06\x8au\x00\x16Y\xf7\x10\
-\xa5\xdc\xc1\xb9@o\xf3\xbc\xf2\xaa\xee\xee\xee6\xeb\x18\
-J6\x0e\x00\xb4\xd3\xfa|\xff\x0dmm\xc3\xeb\xa18\
-\x15|\xae\x04QT\x9a\x14\xba\xbc\xadm\xca]\xbe\xef\
-/\xb1\x8e\xa1\xe4\xe2\x00@\x93\xd6\xdf\xdf_t=\xef\
-RQ\xfcV\x81\x92u\x0fQ\x16)\xb0g\xa0X\xe7\
-z\xde\x0f{zz\xf8\xf5Z\x9a4\x0e\x004a\xaa\
-*\xae[>u\xb4Z\xbb\x0f\x907[\xf7\x10\x11\x04\
-\x90w\xe7\x9a\x9a\xefv\xdd\xf2\x09\xd61\x94,\x1c\x00\
-hB\x5c\xd7\xdd\xcd\xf3\xcbWC\xf4\x5c\x00\xfcJ\x12\
-Q\xbc\x14!\xfa\x8b>\xcf\xff\xb9\xeb\xbas\xadc(\
-\x198\x00\xd0\xb8<\xcf;\x11\x92\xfb\x1b\x80\xa3\xac[\
-\x88h\xc7\x048\x09\xe2\xac\xf7<\xefu\xd6-\x14\x7f\
-\x1c\x00h\x87\xba\xbb7\xcdr]\xff\xa2mw\xf2\xd3\
-\xd9\xd6=D4!\x1d\x0a\xf9\x9d\xeb\xfb\xe7\xba\xae;\
-\xd5:\x86\xe2\x8b\x03\x00m\x97\xeb\x96\x8fkk\x1b^\
-\x0f\xc1;\xac[\x88h\xd2\x04\x8aS!\xce\xcd\xbd\xe5\
-\xf2~\xd61\x14O\x1c\x00\xe8Y\xba\xbb\xbb\xdb\x5c\xcf\
-\xfb\x0eD/\xe3\x15\xfeD\x89\xb7\xc8\x09\xf4\xa6>\xcf\
-\xfb\x98\xaa\xf2\xab\xba\xf4,\x1c\x00\xe8i=\x95JW\
-\xeb\x94)7\x01\xf2a\xf0{\xfdDi1E \xff\
-\xe7y\xe5+\x1e\xe9\xef\xe7POO\xe3\x00@\x00\x80\
->\xdf\x7f[\xae\x16\xdc\x06\xc5\xcb\xad[\x88\xa8\x01\x04\
-\xc74Uk\x7f\xeb+\x97\x8f\xb1N\xa1x\xe0\x00\x90\
-q\x1b6lhu]\xfflQ\xfc\x14\xc0\x0c\xeb\x1e\
-\x22j\xa8\x0e\x09\xf4\x0a\xcf+\xafRU\xbe\xffg\x1c\
-\xff\x00dXO\xa5\xd25m\xc6\x8c\xbf\x8c=\xb9\x8f\
-\x88\xb2A\x14\xba\xdc+\x97/\xe5c\x86\xb3\x8d\x03@\
-Fy\x9ew|.\x08n\xe6\x96?QF)\xde8\
-<<z\xab\xef\xfb/\xb5N!\x1b\x1c\x002FU\
-\xa5\xcf\xf3\x96+\xe4\xf7P\xcc\xb2\xee!\x22C\x82\xae\
-@q\x93\xe7y'Y\xa7P\xf48\x00dH\xa5R\
-\x99\xee\xf9\x95\x8b\x05\xb2\x0a\xfc\xbd'\xa2m\xa6+\xe4\
-\xe7\xae\xef\x9f\xab\xaa\xcd\xd61\x14\x1d.\x02\x19Q.\
-\x97\xf7\xa8\xd5\x82\x1b\x00}\x8bu\x0b\x11\xc5\x90\xe2T\
-\xcf/_\xc1g\x09dG\x93u\x005^\xaf\xef\x1f\
-]\x0b\xf4\xe7\x00\xe6X\xb7P(\x14@\x05@\x05\x02\
-\x0f\xaae\x05\xca\xa2\xe2\xaa\xe8fQ\xe71\xcd\xe1Q\
-\xa9\xd56\x03\xb8\xa5\xbe#\x05\x07h.\xd7\x0e\xd5\xb9\
-P\x9d\xeb\xc0\x99\x03\xe8\x1cU\xcc\x81\x83\xb9\xa2((\
-d\x01o\x15\x9d\x1a\x8b\x01\xe7\xc6\x9eJ\xe5u\x0b:\
-:6X\xc7Pc\xf1f/)\xd7\xe7y\xef\x13\xc8\
-\xb9\x00\xb8\xb5\x97,\xa3\x00\xee\x87\xe0~\xa8>$\xc0\
-C\x00\xba\x83 xh\xcb\x96-\x0fwuu\x0dO\
-\xe4\x1f\xb2\xee\xea?k=\x11K\x97\x1c5\xa1\xf7\x88\
-\xee\xeeM\xb3\x9a\x9bGww\x1c]\x08\xe8\xee\x22X\
-\x18\x00\x0b\x05\xd8\x03@\x17\xf8\xe7/i6j o\
-\x9c??\x7f\x83u\x085\x0ew\x00RJU\xc5\xf5\
-\xfd\x95\x02\xf9o\xeb\x16\x1a\xd7C\x80\xfeM\x81\xf5\x0e\
-\xb0\x1e\xc0\xfaB\xa1p\xbf\x88\x8cZ\x87M\xd4\xc2\x85\
-\xb37\x03\xb8c\xec\xbf\xcf\xb2~\xfd\xfa\x96]v\x99\
-\xb7O.\xa7/\x0b\x10\xec+*\xfbA\xb0/\x80B\
-\xe4\xa14Qs\xc5\xd1u\x9e\xe7\x9d\x5c,\x16/\xb6\
-\x8e\xa1\xc6\xe0\x00\x90B\xeb\xd7\xafo\xf1|\xff\xbb\x02\
-y\x8fu\x0b=OY\x81[\x1c\xc8-\xaars\x10\
-\x8c\xdc\xd2\xd9\xd99`\x1d\xd5H\x8b\x16-\x1a\xc1v\
-\x86\x03\xdf\xf7;\x82@^\xae\x12\x1c**\x87Bp\
-\x08x3\xaa8iS\xc8\xcf\xfa<o\xe1\xfcbq\
-\xb5u\x0c\x85\x8f\x03@\xca\xf4\xf7\xf7\xcf\x18\xadV/\
-\x06\xe45\xd6-\x04\x00\xf0\x00\xb9\x1e\xa27 \x08\xae\
-/\x16\x8b\xb7\x8bH]\xdb\xf2iQ(\x14*\x00\xfe\
-8\xf6_\xa8j\xce\xf7\xfd\x97\xa8:\xaf\x86\x04\x87\x01\
-r\x00\x80}L#I\x04\xb2\xca\xf3\xfc\xbd\x0a\x85\xfc\
-\x87\x93\xb4+E\xe3\xe3\x00\x90\x22\xae\xeb\xee:Z\xad\
-\xad\x05d\x91uKf\x096C\xe5J\x15\xbd\xbcI\
-\xe4\xcf\xf9|\xfe!\xeb\xa4\xa4\x10\x91\x1a\xc6N\x81\x00\
-8\x0f\xd8\xf6\xed\x95 \x08^\x13@\x8e\x17`1\x80\
-i\x96\x8dY\xa5\xc0\xfb=\xdf/\xf5\xf7\xf7\x9f4o\
-\xde\xbc\xc7\xad{(\x1c\xbc\x080%\xfa\xfa\xfa^,\
-N\xeeJ\x00\x0b\xac[\xb2F\x80;U\xb1\x16\x08.\
-+\x16\x8b7\x8aH\xd5\xba\xe9)Q]\x04\x18\x85\x0d\
-\x1b6\xb4N\x9d9\xf3\x08\x09\x82\xd7\x00r<\x80\xbd\
-\xad\x9b\xb2G\xff&\xc0q\xc5b\xb1\xdf\xba\x84\xea\x17\
-\x9b\x177\xed\xbc\xbe\xbe\xca+\xc4\x09.\x07\xd0a\xdd\
-\x92\x11\x01\x047!\xc0\xa5@\xf0\xcbR\xa9\xf4O\xeb\
-\xa0\x1dI\xd3\x00\xf0\x5c\x9e\xe7\xed\xae*o\x82\xe0\xad\
-\x00\x0e\x06\xdf\xcf\xa2ro\xb5)\xb7t\xd7y\xf3\x5c\
-\xeb\x10\xaa\x0f_0\x09\xe7\xba\xee\xe1\x10\xe7w\x00v\
-\xb1nI\xb9\x00\xc0\xb5\x02\xfd\xc5hS\xd3\xaf\x92\xf2\
-\xe6\x97\xe6\x01\xe0\x99<\xcf\xdb\x1d\xc0\x89\x0a\xe7\xad\x80\
-\x1e`\xdd\x93\x01\x0f\x0ati\xb1X|\xd8:\x84v\
-^\x22^\xdc\xb4}\x9e\xe7\x1d\xaf\x90_\x00\x98j\xdd\
-\x92b\xf7B\xf0\xc3\xa0Z\xfdqggg\xafu\xcc\
-dee\x00x\xa6\x9eJe\xcf\x5c\x10\x9c\x04\xc5;\
-\x00\xf0z\x98\xc6\xe9\xd1\xa0v\xcc\xfc\xf9\xf3\xffa\x1d\
-B;'q/n\xda\xa6\xcf\xf7\xdf*\x8a\x1f\x02h\
-\xb1nI\xa1\x01\x01~\x02\xe8\x8f\x8a\xc5b}w\xd2\
-3\x96\xc5\x01\xe0\x99z\xcb\xe5W\xe5\x02=E\x81\xb7\
-\x82\x17\x106B\xd9\x11\x1cS(\x14\xee\xb2\x0e\xa1\xc9\
-\xe3\xb3\x00\x12\xc8\xf3\xbc\x93D\xf1cp\xf1\x0f\x99\xdc\
-\x06\x95\x0fA\x83]\x8b\xc5\xc2iI_\xfc\x09\xe8\xcc\
-\xe7o*\x16\x0b\x1fhmi.A\xe5C\x10\xf0\xce\
-v\xe1\xca\x07*\xd7\xf8\xbe\x7f\x88u\x08M^\xa2\xa7\
-\xfb,\xea\xf3\xfd\xb7\x8b\xe2G\x00r\xd6-)\xf18\
-\xa0?\xae9\xce9\x0b\xf2\xf9;\xadc\xc2\x96\xf5\x1d\
-\x80\xedq]w\x7f8\xce\xa9P\xbc\x1b<}\x16\x96\
-\xc7\xa0\xc1\xebK\xa5\xd2u\xd6!4q\xdc\x01H\x90\
-\xb1m\x7f.\xfe\xe1\xf8'\x14\x9fjn\xca\xcd/\x15\
-\x8b\xff\x91\xc6\xc5\x9f\xb6\xafT*\xdd^*\x14>\x1c\
-\xd4\xaa\xbbB\xf1Y\x00e\xeb\xa6\x14\x98\x09q.s\
-]\xf7p\xeb\x10\x9a8\x0e\x00\x09\xe1y\xde[\xc6\xb6\
-\xfd\xb9\xf8\xd7Cp\x87@N.\x16\xf2{\x96J\x85\
-\xb32pS\x93'\x8c~m\xecuvv\x0e\x94J\
-\x85/n\x1a\x1c\xd8U 'c\xdb\x0d\x88h\xe7M\
-\x838\xbf\xf7<\xef \xeb\x10\x9a\x18\x0e\x00\x09\xe0y\
-\xde[\x14\xf2S\xf0\xce\x8d;O\xf0G\x81.)\x15\
-\x0a\xaf(\x16\xf3?\x8c\xd3\xcdz\x1aI\x80z\xbe\xb9\
-\xf0Hh!1\xb6h\xd1\xa2\x91b1\xff\xc3b!\
-\xbf\xaf#x\x03\x80k\xac\x9b\x12l\xa6B.\xf7}\
-\x7f_\xeb\x10\x1a\x1f\x07\x80\x98\xeb\xf3\xfd\x7fW\xc8O\
-\xc0\xc5\x7f'\xe9\xe5\x81#\x87\x96\x0a\x85\xe3\x8a\xc5\xe2\
-\x9f\xack\xa2\x16\x88\xac\xdb\xe9_\xacze\x88)\xb1\
-'\x22Z(\x14~_*\x16\x8e\x82\x06G\x02\xca\xf3\
-\xd9;\xa7=P\x5c\xd9\xdb\xdb\xbf\x97u\x08\xbd0\x0e\
-\x001\xe6y\xdeQ\xa2\xf8\x19\xf8,\xf5\xc9S\xacs\
-\x04\xaf*\x15\x8b\xc7w\xe6\xf37Y\xe7XQ\x04\x17\
-`\xdbM\x8c&+\x80\xe6.\x0c\xbb')J\xa5\xd2\
-\xb5\xa5b\xf1\x08\xa8s8\xb8#\xb03\xf2N.\xb8\
-\xca\xf7\xfd\x85\xd6!\xb4c\xa9\xbb\xc27-\x5c\xd7\xdd\
-\x1f\xe2\xfc\x09\xc0L\xeb\x96d\xd1\xeb\x1c\x91e\x85B\
-\xe1/\xd6%q\xb1\xee\xaa?\x7f\x17\x82S&\xf7\xab\
-\xf4\xdc\xa5K\x16\x7f\xb81E\xc9\xe3\xfb\xfe\xeb\x03\x95\
-\xcf\x03\xba\xbfuK\xc2<Xm\xca\x1d\x91\x94;g\
-f\x0dw\x00b\xa8\xb7\xb7\x7f/\x88s\x19\xb8\xf8O\
-\xc6\xbd*\xf8\xf7R\xb1x\x04\x17\xffg\xcb9\xfaq\
-\x85L\xfc\xfb\xef\x82\xebF\x86\xb6~\xa2\x81I\x89S\
-(\x14~_,t\x1c\x08\x95\xb7\x08\xf0\x80uO\x82\
-\xbc\xa8\xa9Z[\xe7y\xde<\xeb\x10z>\x0e\x001\
-\xd3\xdb\xdb\xdb\xe9\xe4j\x7f\x04\x1f\xec3Q\x1e\x14\xa7\
-\x16\x0b\xf9\x97\xcd/\x14~k\x1d\x13G\x8b\x17/\x1e\
-j\x92`)\x80\x0b\x01\xbc\xd0}\x01\x14\x8a\xf3s\xd0\
-c_\xfb\xda\xd7\x0eG\x94\x97\x18\x22\xa2\xa5R\xfe\xd2\
-\xc1\xc1\x81E\x02]\x06\xe01\xeb\xa6\x84\xd8[\x81+\
-\xfa\xfb\xfbgX\x87\xd0\xb3\xf1\x14@\x8c\xf4\xf6\xf6\xce\
-qrM\xd7\x02\xd8\xc7\xba%\x01F\x04\xf2\xf5\x5cN\
-\xbe\xd8\xd1\xd1\x91\xea\xaf\xab\x85\xe9\xea\xab\xaf> \x80\
-|\x10\x90c\x01t\x8e\xfd\xe5\x1e@\xaf\x14\xcd\x9dw\
-\xf4\xd1G\xdcn\xd9\x97$\xe5r9_\xab\xe9\x17!\
-x?\xf8aj\x02\xf4\xf2b\xa1\xf0\x86\xac|\x03'\
-\x098\x00\xc4\xc4\xfa\xf5\xeb[f\xb7\xcf\xb9\x02\xc0Q\
-\xd6-q'\xc0U\x80\x9eV,\x16\xef\xb1nI2\
-U\x15`\xdb'[\xeb\x96$\x1b{\x1c\xf7\xd7\x01\x1c\
-i\xdd\x12{\x8a\x0bJ\xa5\xc2$\xafG\xa1F\xe1\x00\
-\x10\x03\xaa*\x9eW\xbe\x08\x82\xb7[\xb7\xc4\xdcC*\
-\xf8\x14\xb7\xfa)\x8e\xfa|\xffm\xa28\x0b@\xde\xba\
-%\xce\x14\xba|~\xb1\xb8\xc6\xba\x83\xb8m\x15\x0b\x9e\
-\xef\x7f\x9e\x8b\xff\x0b\xaaB\xf1\x0dG\xc0\xf3\xfc\x14[\
-\xf3\x0b\x85\x9f\x0d\x0f\xb5\xbe\x04\x82\xf3\xf0\xc2\xd7Zd\
-\x9a@V\xb9n\xf9\x9d\xd6\x1d\xc4\x1d\x00sc\x9f\x1a\
-~\x02\xfe^l\x97\x00w\x02z\x0a\x9f\xccGI\xe2\
-\xba\xee\x11\x90\xdcy\x80\xbe\xd8\xba%\xa6\x864\x90\xa5\
-\xf3\xe7\xe7\xf9tFC\xdc\x010\xe4\xba\xee\xe1\xa2\xf8\
->\xb8\xf8o\xcf\x90B??88p\x10\x17\x7fJ\
-\x9aR\xa9tm\xad:\xf2\x0a\x81\xac\x06\xc0\x8b\xde\x9e\
-\xafM\x1c\xfd\x0d\xef\x16h\x8b\x0b\x8f\x91\x9eJ\xa5+\
-W\x0b\xfe\x02\xa0\xdd\xba%\x86n\x81\x06\xef)\x95J\
-\xf7Y\x87\x10\xd5\xcbu\xdd\x03 \xce\x0f\x00,\xb2n\
-\x89\x1d\xc5\x86 \xa8\xbe\xaa\xb3\xb3s\xc0:%\x8b\xb8\
-\x03`\xa0R\xa9L\xcf\xd5\x82_\x81\x8b\xffsU\x05\
-\xb2z\xd3\xe0\xc0a\x5c\xfc)-J\xa5\xd2m\xc3C\
-[\x0f\x1c\xdb\x0d\xd8\x99\xdb2\xa7\x97\xa0\xcb\xc95]\
-\xa2\xaa|\xd6\x89\x01\xee\x00DLU\xc5\xf3+\x17\x03\
-\xfa\x16\xeb\x96\x98y\x08\xea\x9c\x5c*u\x5co\x1dB\
-\xd4(}\xe5\xf21\x12\xe8\x0f\x00\x14\xad[\xe2D!\
-\xff;\xbf\x98_f\xdd\x915\xdc\x01\x88\x98\xe7\x95?\
-\xc3\xc5\xff9\x04\xe7A\x83}\xb9\xf8S\xda\xcd\xcf\xe7\
-\xaf\xcc9\xf2\x0a\x00k\xad[\xe2D\xa0\xa7{\x9e\xc7\
-\xf7\xc5\x88q\x07 Bc\xd3\xffe\x00r\xd6-1\
-\xf18\x04\x1f.\x15\x0a?\xb1\x0e!\x8a\x9a\xe7\x95\xdf\
-\xa3\xd0o\x03\x98f\xdd\x12\x13O\x08\xf4\x90b\xb1\xb8\
-\xde:$+8\x00D\xc4\xf3\xbc\xdd\x15r+\x809\
-\xd6-1q\x8f@O\xe2\x8b\x9d\xb2\xac\xb7\x5c\xde\xcf\
-\x09\xf4R\x00/\xb2n\x89\x07\xbd\xbf\xad\xb5\xf5\xe0\xf6\
-\xf6\xf6G\xadK\xb2\x80\xa7\x00\x22\xe0\xfb\xfe4\x85\xfc\
-\x0e\x5c\xfc\xc7\xe89\xc3C[\x0f\xe0\xe2OY\xd7\x99\
-\xcf\xff}td\xf8 \xf0\x94\xc0\x18\xd9khx\xf8\
-\xc2\xa7nSM\x8d\xc5\x1fr\x04\x5c\xaf\xfc}@O\
-\xb6\xee\x88\x81a\x15\xfc\xc7\xfcB\xe1B\xeb\x10\xa28\
-QUq}\x7f\x99@\xbe\x0c~0\x03\x04g\x96\x0a\
-\x85U\xd6\x19i\xc7\x01\xa0\xc1\x5c\xb7\xfcn\x88\xfe\xd0\
-\xba\xc3\x9c\xa0OT\xdf\x5c,\x16o\xb6N!\x8a+\
-\xdf\xf7_\x1f\x00?\x82b\x96u\x8b\xb1\x9a:\xf2\x9a\
-\xf9\xf9\xfc:\xeb\x904\xe3\x00\xd0@\xbd\xbd\xfd{9\
-\xb9\xdam\x00\xa6[\xb7\x98R\xdc\xd8\xd4\xe4\x9c\xd0\xd1\
-\xd1\xe1[\xa7\x10\xc5]O\xa5\xb2g\xae\x16\xfc\x12\xc0\
-\xbe\xd6-\xc6\xca\x8e\xe0e\x85B\xa1b\x1d\x92V\xdc\
-jj\x90\x0d\x1b6\xb4:\xb9\xea\xcf\xc0\xc5\xff\x82M\
-\x9b\x06\x16s\xf1'\x9a\x98\x05\x1d\x1d\x0f\xb4\xb64\x1f\
-\x06\xe8\x15\xd6-\xc6\xf2\x81\x82\xd7\x034\x10\x7f\xb0\x0d\
-\xe2y\xfe\xff)\xf01\xeb\x0eC\xaa\xd0/\xcc/\x16\
-WZ\x87\x10%\x91\xaa\xe6\x5c\xbf\xf2\x0d\x81\xfe\x87u\
-\x8b%\x81~\xacX,~\xcb\xba#\x8d8\x004\x80\
-\xef\xfb\xaf\x0f\x14\xbfEv\x7f\xbe#Py\x7f\xa9\x94\
-\xbf\xc8:\x84(\xe9\x5c\xdf\xff\x04\x14\xff\x0f\xd9\xdd\xb1\
-\x1dr\x04\x07\x17\x0a\x85\xbb\xacC\xd2&\xab\x0bT\xc3\
-\xf4\xf7\xf7\x17G\xab\xb5\xbb\x90\xd9\xaf\xfc\xc9&A\xf0\
-\xa6b\xb1x\x8du\x09QZ\xb8n\xf9\x04\x88\xfe\x08\
-\xc0\x14\xeb\x16#w\x0f\x0fm=h\xe1\xc2\x85C\xd6\
-!i\x92\xd5\x89\xb2aF\xaa\xb5\xf3\x90\xd9\xc5\x1f\x8f\
-@k\xaf\xe6\xe2O\x14\xaeR)\x7f)\xd49\x16@\
-V\x9f\x9a\xf7\xd2\xd6\xb6\xb6/YG\xa4\x0dw\x00B\
-\xd4\xe7\xfb\x1f\x10\xc5\xf9\xd6\x1d6\xe4\x1f\xd0\xda\xb1\xa5\
-R\xe9\x11\xeb\x12\xa2\xb4r]wo8\xce\x95P\xcc\
-\xb7n1\xa0\x02}}\xb1X\xe4M\x93B\xc2\x01 \
-$\xae\xeb\xee\x06q\xee\x040\xd3\xba%zr\xbb#\
-z<\xbf\xaeC\xd4x\xbe\xef/\x0c\x14\xeb\x00\xeca\
-\xddb\xa0\x9csd\xbf|>_\xb6\x0eI\x03\x9e\x02\
-\x08\x81\xaa\x8a\x8as!2\xb9\xf8\xebum\xad\xcdK\
-\xb8\xf8\x13E\xa3P(tC\x83%\x02<`\xddb\
- \x1f\x04z\xb6uDZp\x00\x08\x81W.\x7f\x5c\
-\x80%\xd6\x1d\xd1\xd3+\xa0\xfa\x1a>\xb8\x83(Z\xa5\
-R\xe9\x9fMM\xb9#\x00d\xeey\x1a\x0a\xbc\xb5\xcf\
-\xf7\xdf`\xdd\x91\x06<\x05P\xa7\xb1\xbbv\xfd\x1d\xc0\
-T\xeb\x96H\x09\xfe8\xbcu\xeb\xbf\xf3\xaa\x5c\x22;\
-\xae\xeb\xce\x85\xe4\xae\x00t\x7f\xeb\x96hIokK\
-\xd3\xa29s\xe6<f]\x92d\xdc\x01\xa8S\xae\x1a\
-|\x07Y[\xfc\x15\xebj\xa3\xa3o\xe4\xe2Od\xab\
-T*m\x1c\x1ej9\x1a\x90\xdb\xad[\xa2\xa5\x9dC\
-#\xd5\xafXW$\x1dw\x00\xea\x90\xcd\x07\xfd\xe8u\
-\x8e\xc8\xf1\x85B\xe1I\xeb\x12\x22\xdaf\xdbN\x80\xf3\
-g\x00\x8b\xac[\x22\x14@\x9d#K\xa5\x8e\xeb\xadC\
-\x92\x8a\x03\xc0N\xea\xed\xed\x9d\xe3\xe4\x9a\xee\x050\xcf\
-\xba%B\x7f\x86\x06\xaf+\x95J[\xacC\x88\xe8\xd9\
-\xfa\xfb\xfb\x8b\xd5j\xedZ\x05\xf6\xb4n\x89\xd0\xbdO\
->\xf1\xf8+\xba\xba\xba\x86\xadC\x92\x88\xa7\x00vR\
-.\xd7\xf4\xbf\xc8\xd2\xe2\xaf\xf8\xfb\xf0P\xeb\x9b\xb8\xf8\
-\x13\xc5\xd3\xbcy\xf3\xbc \xa8-\x01\xf0\xb0uK\x84\
-\xf6\x9e:}\xfa\x99\xd6\x11I\xc5\x1d\x80\x9d\xe0\xba\xee\
-\x11c\xdbm\xd9\xf8\xf9)6\xe4rr8\xbf{K\
-\x14\x7fc\x17&_\x0b\xa0h\xdd\x12\x91\x11Gp@\
-\xa1P\xb8\xdb:$i\xb8\x030I\x1b6lh\x85\
-\xe4\xceCV\x16\x7f\xa0\x07\x08\x96r\xf1'J\x86\x05\
-\x1d\x1d\x0f8\x82,\xdd6\xb8E\x15\xe7\xf1\xb1\xc1\x93\
-\xc7\x01`\x92\xa6\xcd\x98\xf1\x9f\x80\xbe\xd8\xba#\x22\x1b\
-\xa1\xc1q\xbc\xbd/Q\xb2\x14\x0a\x85\xbb\xa1\xce\x1b\x01\
-d\xe2\x9b:\x0a\xbc\xca\xf7+\xef\xb6\xeeH\x1aNL\
-\x93P.\x97\xf3\xb5@\xefG6\xee\xf87\xa4\x8e\x1c\
-=?\x9f\xbf\xd1:\x84\x88v\x8e\xe7y')\xe4\xa7\
-\xc8\xc6\x87\xbdrkK\xf3^\xbc7\xc0\xc4e\xe1\x0f\
-EhjA\xb0\x06\xd9X\xfc\x15*\xa7p\xf1'J\
-\xb6b\xb1x1\x04\x9f\xb5\xee\x88H~xxt\xb9\
-uD\x92p\x07`\x82\x5c\xd7=\x00\xe2\xdc\x8c,\x0c\
-M\x8a\xff*\x95\x0a|\xf4&QJ\xb8\x9e\xf7m@\
->b\xdd\x11\x81\xe1Z\xcey\xe9\x82\x8e\x8e,>'\
-a\xd2\xd2\xbf\x98\x85@U\x05\x8es62\xf1\xf3\x92\
-\x1fp\xf1'J\x97b\xa1p\x1a\xa0WXwD\xa0\
-5W\xab\xad\xb2\x8eH\x8a\x0c,h\xf5\xf3\xbc\xca\xbb\
-\xa0x\xb5uG\xe3\xc9\xb5\x9b\x067\x9ej]AD\
-\xe1\x12\x91jkK\xcbI\x002\xf0U99\xc1\xf3\
-\xbc\xa3\xac+\x92\x80\xa7\x00\xc6\xe1\xfb\xfe4U\xdc\xaf\
-@\xc9\xba\xa5\xb1\xa47\xe7\xe0@~\xdd\x8f(\xbdz\
-*\x95=sAp\x0b\x14\xb3\xac[\x1aJpG1\
-\x9f?PDj\xd6)q\xc6\x1d\x80q\x04\x01>\x95\
-\xfe\xc5\x1fC\x82\xe0\x04.\xfeD\xe9\xb6\xa0\xa3\xe3\x01\
-\x07x7\x80\xc0\xba\xa5\xa1\x14/\xf7\xbc\xca\x07\xac3\
-\xe2\x8e;\x00/\xa0\xa7\xa7\xa7=\xd7\xdc\xfc`\xda\xa7\
-e\x15|`~\xa1p\xa1u\x07\x11E\xc3\xf5\xbc/\
-\x00\x92\xf6o\x07T\x9ar\xce\x8b:::\x9e\xb0\x0e\
-\x89+\xee\x00\xbc\x00\xa7\xa9eE\xea\x17\x7f\xc8\xb7\xb8\
-\xf8\x13eK\xb1PX\x09`\xaduG\x83uT\x83\
-\xe0\xe3\xd6\x11q\xc6\x01`\x07\x1e\xe9\xef/\x09\xf4c\
-\xd6\x1d\x0dv\xcb\xe6\xc1\x8d\x9f\xb6\x8e \xa2h\x89H\
-P\xab\x8e\xbe\x1b@\xb7uKC)N\x1f\x1c\x1c\xdc\
-\xc5:#\xae8\x00\xec@S\xb5\xfaY\x00S\xac;\
-\x1a\xe8\xd1\x9c#o_\xb4h\xd1\x88u\x08\x11Eo\
-\xc1\x82\x05\x83A\xcdy3\xd2}\xbb\xe0\xf6\xad\xc3\xc3\
-\x9f\xb2\x8e\x88+^\x03\xb0\x1d=\x95JW\xae\x16\xac\
-\x07\xd0l\xdd\xd20\x82w\x96\x0a\x85\x9fXg\x10\x91\
--\xd7\xf7O\x83\xe2l\xeb\x8e\x06z\xacV\x1d]\xb8\
-`\xc1\x82A\xeb\x90\xb8\xe1\x0e\xc0v\xe4\xaa\xc1J\xa4\
-y\xf1W\x9c\xcf\xc5\x9f\x88\x00\xa0\x98\xcf\xff\x1f \x97\
-Yw4\xd0\xcc\x5c\xae\xf9\x0c\xeb\x888\xe2\x0e\xc0s\
-\xf4\xf6\xf6\xef\xe5\xe4j\xf7\x00\xc8Y\xb74\xc8zh\
-pp\xa9T\xdab\x1dBD\xf10\xf6\xa0\xb3;\x01\
-tX\xb74\xc8\x13\x8e\xe0E\x85B\xa1b\x1d\x12'\
-\xdc\x01x\x0e\xc9\x05g\x22\xbd\x8b\x7f\x15\x1a\x9c\xcc\xc5\
-\x9f\x88\x9e)\x9f\xcf\x97\xa1\xce\xc9\x00\xd4\xba\xa5A\xa6\
-\x07\xaa\xcb\xac#\xe2\x86\x03\xc03\xf4\xf5\xf5-\x10\xe8\
-;\xac;\x1aF\xb1\xb2T*\xddf\x9dAD\xf1S\
-*u\x5c\xae\x90o[w4\x8e|\xb4\xa7g\xe3|\
-\xeb\x8a8\xe1\x00\xf0LN\xd3\x0a\x00-\xd6\x19\x0dr\
-s\xb1\x98_m\x1dAD\xf1\x15TG\xce\x00\xb0\xde\
-\xba\xa3A\xdar\xb9*\xaf\x05x\x06^\x030\xa6R\
-\xa9\x14\xaa\xb5\xe0!\xa4\xf3\xab\x7fC\x02=\xb0X,\
-\xa6\xf5\x85MD!\xe9\xed\xad\xbc\xdc\xc9\x05\xb7\x00h\
-\xb2ni\x80-A\xad\xbakgg\xe7\x80uH\x1c\
-p\x07`L\xb5V;\x1d\xe9\x5c\xfc\x01\xc5\x99\x5c\xfc\
-\x89h\x22:;;\xee\x004\xad_\x0b\x9c\xea45\
-\xf1\x89\xa7c\xb8\x03\x00\xa0\xb7\xb7w\x8e\x93kz\x18\
-\xc0t\xeb\x96\x06\xb8\xb9X\xc8\xbfJD\xd2\xfd\xf0\x0f\
-\x22\x0a\x8d\xeb\xbaS!\xce]\x00\xf6\xb0ni\x00\xef\
-\xc9'\x1e_\xd8\xd5\xd55l\x1db\x8d;\x00\x00\x9c\
-\xa6\xa6\x0f!\x9d\x8b\x7fU\x03\xe7\xc3\x5c\xfc\x89h2\
-J\xa5\xd2\x16\x81\x9e\x82t~+\xa08u\xfa\xf4\xf4\
-^\xec=\x09\x99\x1f\x00T\xb5\x19*\x1f\xb1\xeeh\x04\
-\x85|}\xfe\xfc\x8e\xbfYw\x10Q\xf2\x14\x8b\xc5?\
-\x01\xf2C\xeb\x8eF\x10\xc82U\xcd\xfc\x0ex\xe6\x7f\
-\x00}\xbe\xffvQ\xa4\xf1\xaex\x8f4\xe5\x9cE|\
-\x14\xe6\x8e)V:\x9b\xdb\x1e_PCs\x97S\xc3\
-\x9e\x0a\xed\x82\xc8\x1c@\xa7B1\x1b\x82\xa9\x00\xa6\x02\
-\x98\xa9\x80:\xc0f\x15<\x09\xd5-\x80<\x0e\xc1c\
-\xa2\xe2\x07\x8a\x07D\xf5\xfe\x96\xaa\xb3a\x06\xbe\xd2o\
-\xfd\xef\x95V\x8a\x95-\x1b[\xb7,\xccA\xbb\x14\xb9\
-.\x85v9\x8a\xa2*\xa6C\xb0\x0b\xf0\xf4\xef\xd7S\
-O\xf0|\x12\xc0\x16\x01\x1e\x87\xe2q\x15\xdd\x22\x90\x8d\
-\x01\xb0A \x1b\x02\xc5\x03\xceh\xdb\x869X\xf9\x98\
-\xd9\xbfT\xcc\xf5\xf4\xf4\xb4\xe7\x9a\x9a\xef\x01\x90\xb7n\
-\x09\x9b@_[,\x16\xd3|\x07\xc4qq\x00\xf0\xfc\
-\x9b\x048\xc4\xba#l\x02}]\xb1XL\xfb\xe3>\
-'L\x01\xd9\xd4\xf2\x99E\x81\xd4\x8e\x14\xc5a\x00\xf6\
-U`O\x01ZC>\xd4\xa3\x006@\xf4vQ\x5c\
-\xab9\x5c3g\xeb\x9a\xde\x90\x8f\x91z\x8a\x95\xce\xa6\
-\x96\xad\x8b\x02\xd1#E\xe5\x08\x00\x07\x00\xd8\x0d\x8d\xb8\
-I\x97\xa2\x0c\xe0n\x88^\x178\xb8vhh\xf4/\
-\x0b\xf0\xf5\xad\xa1\x1f'\xa1\x5c\xdf\x7f\x07\x14\x17Yw\
-\x84M\x80\xab\x8a\xc5\xc2R\xeb\x0eK\x99\x1e\x00\x5c\xd7\
-=\x10\xe2\xdcb\xdd\x11:\xc5oJ\xa5\xc2\x1b\xad3\
-\xac\x0d\xb4\x9c\xb9\x0fD\x8f\x13\xd5#\x158\x0c\xc0\x1c\
-\xa3\x94n@\xae\x85\x06\xd7T[\x9a\xd6\xe6\x9f\xfcr\
-\xd9\xa8#\xd6*\xad+\xf6\xccA\xffMT\x8eT\xe8\
-a\x00\xda\x8dRF z\x8b\xa8\x5c#A\xf0\xc7Y\
-\xd5i\xd7\x09Vf\xfa:\x1a\xd7+_\x03\xe8\x11\xd6\
-\x1d\xa1\xd3\xe0\x80R\xa9t\xbbu\x86\x95\x8c\x0f\x00\xfe\
-O x\xbbuG\xc8Fj9g\xd1\x82\x8e\x8e\x07\
-\xacC,\x0cLY\xd6\x89@N\x00\xf4D\xa8\xbc\xda\
-\xbag;\x02\x88\xde\x04\xc8%\xcd\xc3\xd5\x8bf\xe2k\
-\x1b\xad\x83,=\x863\xe7T\x9b\xf5\x04u\x82\xf7@\
-\xe5P\xc4\xf3=\xa9\x0f*\x97\x8a\xea%\xed\xd5\xd5\xd7\
-[\xc7Xp]\xf7\x00\x88s3\xd2v\xdd\x98\xe0\xc7\
-\xa5B\xe1\xdd\xd6\x19V\xe2\xf8b\x8bDO\xcf\xc6\xf9\
-\xb9\xa6j7R\xf6\xd4?\x81\xac)\x16\xf3\xcb\xad;\
-\xa2\xb4\x09\x9f\x9cUkm}\xa7@\xdf\x1e\xe3Ed\
-{\x86\x00\xac\x05\xe4'\xed#\x83\xbf\x15\x9c7j\x1d\
-\x14\x05\x17+\xa7\xb66oy+ \xef\x84\xe0($\
-\xeb\xd9\x1b\xf7\x01\xf8\xa9\xe4\xf0\xfd\xf6\xad\xab\x1f\xb1\x8e\
-\x89\x92\xe7\xf9\x17(\xf0~\xeb\x8e\x90\x0d\x05\xb5jg\
-Vo\x0c\x94\x947\xca\xd0y^\xf9s\x0a]i\xdd\
-\x11\xb2r[k\xcb\x8b\xdb\xdb\xdb\x1f\xb5\x0e\x89\xc2\xc6\
-\x96e{Cp\x9a\xa8\xbc\x1b\xc04\xeb\x9e:\xf5)\
-\xf0\xed\xd6\x11\xe7\xbbi\xbd\x90p`\xca\xff\xb7@k\
-\xa3\x1f\x15\xc8\x07a\xb7\xbd\x1f\x96*\x80_I\xe0\x9c\
-\xdd^\xfd\xca\x0d\xd61Q\xf0}\xbf#P\xdc\x0f`\
-\x17\xeb\x96P\x09>Y*\x14\xd2z\xe3\xa3\x17\x94\xc9\
-\x01@U\x1d\xcf/?\x84m\x17\x15\xa5\x86@\xdfW\
-,\x16\xbfo\xdd\xd1h\x83-\xcb\xf7\x05\xe4\x0c\x85\xbe\
-\x13)\xdb\x92T`XD\x7f\xa0N\xf3\x17\xe6n\xfd\
-R\x9fuO\x186\xb5\xfd\xe7nA\xad\xf9\xd3*\xfa\
-\xa1\x06\x5ctiO\xf4\x06\x81\xacn\x1f^\xfd;\xeb\
-\x94F\xeb\xf3\xbc\xe5\x02Ye\xdd\x11\xb2{K\xc5\xc2\
->\xd6\x11\x1629\x00x\x9ew\xbcB\xd2v\x85\xfc\
-]\xc5B\xfe\xe5i\xbe\xe9\xcf\xc6\x96e{;pV\
-)\xf4\x0dH\xff\x9f\xdd!(\xbe\xd34:\xf2\xc5]\
-\xf0\xf5A\xeb\x98\x9d\xd1?\xf53E\xa7V\xfd\x02T\
-\xde\x8bt\xdeW\xfe\xd9Do@-w\xc6\x9c\xeaW\
-n\xb2Ni\x94\xf5\xeb\xd7\xb7\xcc\x9e=\xe7n\x08\xba\
-\xac[\xc2\x148rhg>\x9f\xda\xdf\xb7\x1dI\xfb\
-\x9b\xe8v\xb9\x9ew) o\xb6\xee\x08\x93#xC\
-\xa1P\xf8\xbduG#\xf8\xd3O\xefh\x1au>/\
-*\xa7 \x0b\x0b\xc9\xb3m\x82\xe0\x8b\xed\xc3S\xbe)\
-X9b\x1d3\x11.VNmm\xd9z:\x80e\
-H\xfe\xa9\x99\xc9R\x00\x97\xe4\x9c\xda\x8aYC_\xed\
-\xb6\x8ei\x04\xcf\xf3\xde\xa2\x90K\xac;\xc2\xa4\x90\xef\
-\xcf/\xe6\xdfg\xdd\x11\xb5\xcc\x0d\x00\xe5r9_\x0b\
-\xb4\x07i\xba\xf8OpC\xa9P8\xcc:#l\x0a\
-\xc8@\xf3\xf2w\x8b\x83\xafA1\xd7\xba\xc7\xd8\x06u\
-\xf4#s\x87\xd6\x5ce\x1d\xf2B\xfa\xdbV\x1c\xe5\x04\
-z.\x80\xbd\xac[\x8cm\x05dM\xfbH\xdb\x97\x93\
-2\xb8M\x94\xaa\x8aW.\xdf\x0e\xc5\xcb\xad[B\xb4\
-ux\xa8\xb5\xb4p\xe1\xec\xcd\xd6!QJ\xd5\xf9\xd3\
-\x89\xa8\x06\xc1{\x91\xa6\xc5\x1f\x80\xa8\xfe\x97uC\xd8\
-\xfa[\xcf\xdck\xb0u\xf9\xb5\x22\xf8\x01\x17\x7f\x00@\
-\x97\x04r\xe5@\xeb\xf2\xf3\x07\xb0r\xa6u\xccs=\
-\x8aO\xb5olY~\x91\x13\xe8\x9f\xc0\xc5\x1f\x00\xa6\
-\x00\xfa\xb9\xc1\x96\xad\xb7\xf67/;\xd0:&L\x22\
-\xa2\x0a|\xce\xba#dS\xda\xdaF\xd2\xf6\x95\xf0q\
-ej\x07@U\xc5\xf3\xca\xffH\xd9\xf9\xab\xb5\xa5b\
-\xe1u\xd6\x11aQ@65\xaf\xf8\xa0\x8a~\x0d\xe9\
-|@S\x18\x1e\x09\x1c9y\xde\xd0\xaa?[\x87\x00\
-\xc0\xc6\xb6\x15K%\xd0\xef\x01\xe8\xb4n\x89\xa9\xaaB\
-\xbf6gd\xf3g\xd3\xf4UO\xd7\xf3\xff\x02\xe0\x95\
-\xd6\x1da\x11\xe0\xceb\xb1\xb0\x9fuG\x9425\x00\
-\xb8\xae{8\xc4\xb9\xd6\xba#D\x0a\x0d\x0e*\x95J\
-\xb7Y\x87\x84\xe11\x9c9g\xb4\xa5\xf6C@^k\
-\xdd\x92\x00\x81\x00\xabf\x8f<\xf4\xdf\x82Kj\x16\x01\
-\x8aS\x9b\x07\x9bg\xaf\x81\xe0\x13\xc8\xd8{\xc9N\xba\
-\x119}kZn\x0d\xed\xba\xe5\xe3 z\xb9uG\
-\xa8480-\xef\xa7\x13\x91\xadS\x00\x22){\x04\
-\xa4\x5c\xa7\xbc\x82P\x00\x00 \x00IDAT\x9e\x96\
-?\xac\xfd\xcdg\xec?\xda\x12\xdc\xc2\xc5\x7f\xc2\x1c\x05\
->3\xd0\xfa\xa2\xab*\xd3\xce(D}\xf0\xfe\xa9\xcb\
-J\x83\xad\xb3\xfe\x04\xc1'\xc1\xc5\x7f\xa2\x0eE \x7f\
-\x1bh]q\xacuH\x18J\xa5\xfc\x15\x80\xa6\xea\xce\
-\x88\x22\xce\xc9\xd6\x0dQ\xca\xcc\x00\xa0\xaa\xcd\x80\x9ch\
-\xdd\x11*\x95/['\x84ac\xf3\xb2\x93E\x9c\x1b\
-\x01,\xb4nI\x1aQ=27\xea\xdc\xda\xdf\xbc\xe2\
-\x80\xa8\x8e9\xd0\xbc\xec\x10gTn\x8f\xe9\xad\x96\xe3\
-M1\x17\xaak\x07Z\x97\x7f\xda:%\x14\x9a;\xd3\
-:!L\x0a\x9c\xa8\xaaI\xba3e]23\x00\xf8\
-\xbe\x7f,\xec\x1e\x06\xd3\x08\x7f.\x95:\x12=}+\
- \x03-+V\x8a\xc8\xf7Ry\x83\x98\xe8\xccwD\
-\xaf\xd9\xd8\xb2\xac\xe1\x0f\x80\xda\xd8\xb2\xec\xcd\x10\xb9\x0a\
-\x92\xbe\xc7\xc3F(\x07\xc5\xd7\x06Z\x97}Wqj\
-\xa2/H\xde\xf6\x1e$i:\xadZ\xf0}\xffp\xeb\
-\x88\xa8df\x00PM\xd7\xf6\xbf:\xf2%\xeb\x86z\
-(Nm\x1ehY\xf1#@?\x07n!\x87a\x9a\
-@.\xdd\xd8\xba\xfc\xa3\x8d:\xc0@\xeb\xb2O\xca\xb6\
-\xef\x7fOm\xd412E\xe5\x94\xc1\x96\xd9\xbf\xea\xc1\
-\xa7\xa6X\xa7\xd4c\xec\x82\xdd\xd4P\xe0\xad\xd6\x0dQ\
-\xc9\xc4\x1b\xaf\xeb\xbaS!N\x19\xe9\xb9\xaa\xfc\xe6R\
-\xb1\x90\xd8\xabo\x15+[\x06[\xb6\xfe\x14@\xaan\
-\xc6\x14\x17\x0a]=wd\xcd\x8a0\xff\x99\x83-+\
-\x96+4m\xb7\x80\x8d\x07\x91\xeb0\xdc\xf6\xfa9X\
-\xf9\x98u\xca\xce\x18\xbb\xb5\xfaz\x00/\xb1n\x09I\
-\xa5X\xc8\xcf\x17\x91\xaauH\xa3eb\x07@\x1d\xe7\
-\xdf\x90\x9e\xc5\x1f\x02\xfd\xaau\xc3\xce\xea\xc1\xa7\xa6\x0c\
-6o\xfd=\xb8\xf87\x8c@\x96\x0f\xb4,[\xa3X\
-Y\xf7\xeb[\xb1\xd2\x19hY\xfe\xbf\x5c\xfc\x1bH\xf5\
-p\xb4l\xfd\xe3 \x96'\xf2!;\x22\x12@\xe5\xeb\
-\xd6\x1d!\xeap+\x95\xa3\xac#\xa2\x90\x89\x01@\x02\
-\xbc\xcd\xba!D=\x85B\xe1W\xd6\x11;Cqj\
-\xf3\xd4\x96\x96K 8\xc6\xba%\xfd\xe4\x8cM\xcd[\
-\xd7\xf9\xd3O\xef\xd8\xd9\x7f\xc2c8s\xce`\xcb\x96\
-?\x008=\xc40\xda\xbeWj\x0b.\xaf`e\x22\
-?\xa8\x0c\x0fo\xf9!\x80\x8auGX\xa4\xa6\x998\
-\x0d\x90\xfa\x01\xc0\xf7\xfdi\x10\x1cg\xdd\x11\x16\x85~\
-+\x89[S\x8a\x95M\x83-\xb3\x7f\x06 57-\
-\x8a;\x15,n\x1eqn\xdd\xd8\xbc\xe2\xbd\x8a\x95\x13\
-~\x86\x82be\xd3@\xf3\x8a\xf7\x8f\xb6\x04w\x00\xf2\
-\x9aF6\xd2\xb3\x1c\x92k\xde\xfaK\xc5\xc7\x13wA\
-\xec\xc2\x85\x0b\x87\x04\xf2-\xeb\x8e\xd0\x88\x9c\xb0~\xfd\
-\xfa\x16\xeb\x8cFK\xfd\x00\x10\x04r\x1c\x806\xeb\x8e\
-\x90l\xd1Z\xed|\xeb\x88\x9d1\xd8\xba\xf5\x9b\xe0\xb6\
-\xbf\x01Y \xa2\xdf\xdb\xd4\xb2\xf5\xde\xc1\x96\x15\xcb7\
-5/\xdf\xee\x9d\xce\xb6\xdd\x81\xf1\x8c\x97\x0f\xb6,_\
-1\xd0\xb2\xf5>\x88^\x00\xde\xd9/z\x82c\x06[\
-\xa6|O\x13x}V\xb5:\xf2M\x00OZw\x84\
-Cg\xb7\xb7\xb7\x1fm]\xd1h\x89\xfbC6Y\xae\
-W\xfe>\xa0\xe9\xb8\xb9\x83\xe0\xdcR\xa1\xf0a\xeb\x8c\
-\xc9\x1ah]~:\x14\xffk\xddA\xdb\xa8\xa0_\x14\
-}\x80\xba\xdb\xfe\x8a\x94T0_\x14\xf3l\xcb\xe8\x19\
-\xbe0gdu\xe2\xee\xb7\xef\xfa\xfe\xb9P\x9cj\xdd\
-\x11\x86,<!0\xd5\x03\x80\xaa\xe6<\xbf\xec\x03\xe9\
-x\x98\x8c#\xd8\xb7P(\xdcm\xdd1\x19\xfd\xad\xcb\
-\xfe\xcdQ\xf9\x152\xb0\xdbD\x14\x22\x15\xe0]\xed#\
-\xab\x7fb\x1d2\x19\xae\xeb\x1e\x08qn\xb1\xee\x08I\
-\x7f\xb1\x90/\x88H`\x1d\xd2(\xa9~S\xf6}\xff\
-0\xa4d\xf1\x87\xe2\xc6\xa4-\xfe\x95\xd6\x15{:*\
-?D\xca\xff\x9c\x115\x80(p\xde@\xcb\xf2E\xd6\
-!\x93Q*\x95n\x05\xf4o\xd6\x1d!\x99\xe7\xfb~\
-dw\xd8\xb4\x90\xea7f\x05\xfe\xcd\xba!,\x22\xfa\
-]\xeb\x86\xc9p\xb1rjNq)\x80D~\xb5\x89\
-(\x06\xa6\x01\xf8E?\x96\xcd\xb0\x0e\x99\x0c\x01\x12y\
-\x9d\xd2\xf69\xc7[\x174R\xaa\x07\x00\xa8\xbc\xc1:\
-!$\x8f\x8a\xc8%\xd6\x11\x93\xd1\xd2\xba\xf5\xab\x80\xbe\
-\xcc\xba\x83(\xe1^\xe2\xb4\xc87\xac#&\xa3\xb5\xb5\
-\xf5\x22\x00[\xac;\xc2\x10@9\x00$Q__\xdf\
-\x8b!\xe8\xb2\xee\x08\x87\xfe\xb4P($\xe6\xea\xda\x81\
-\xd6\x15\xc7\x8a\x22q\x17+\x12\xc5\xd4{\x07ZV$\
-\xe6Af\xed\xed\xed\x8f*\xe4b\xeb\x8e0\x08pP\
-ooo\x9a\x9e!\xf3,\xa9\x1d\x00\xe08\xe9\xb9\xd9\
-\x8c&g\xfb\x7f3V\xcc\x86\xea\xf7\x91\xf2\x0bL\x89\
-\x22%\xfa\xed\xf2\xb4\xcf$\xe7\x01LAjN\x03\xe4\
-\xa4\xa9)\x15\x8fo\xde\x9e\xd4\x0e\x00\xa2\xb2\xd4\xba!\
-$w\x95J\xa5\xdb\xad#&\xaa\xd6\x1a\xac\x01P\xb4\
-\xee J\x15\xc5\xdc\xdch\x90\x98\x87\xee\xcc\x9f\x9f\xbf\
-\x01\xc0=\xd6\x1da\x10M\xefi\x80T\x0e\x00\xaa\xda\
-\x04\xc1Q\xd6\x1d\xa1\x10$\xe6k@\x83Mg\x1c\x0e\
-\x95\x0fXw\x10\xa5\x91@\xdf\xb9\xb1mEr>\xd8\
-(~j\x9d\x10\x0ey\x8d\xaa\xa6r\xadL\xe5\xbf\x94\
-[\xa9\x1c\x8ct\x5c}\xae\x0e\xf0s\xeb\x88\x89P\x9c\
-\x98SG\xbe\x0dn\xfd\x135\x8c\x04\xfaM\xc5\xa9\xcd\
-\xd6\x1d\x13\x91\xcbIJ\x06\x00\xcc\xf3<\xef\x15\xd6\x11\
-\x8d\x90\xca\x01\xc0\x09\x90\x8a[8\x0a\xf0\x97B\xa1\xd0\
-m\xdd1\x11\x9b\x9a\xf78\x05\x90\x97Zw\x10\xa5\xdc\
-\x8b\x07Zg}\xc8:b\x22\xf2\xf9\xfc\x83\xe9\xb9'\
-@:\xbf\x0e\x98\xca\x01@\x11\xa4\xe2\x02\xc0\x00\x9a\x88\
-\xed\xff~,\x9b\xa1\x82\x95\xd6\x1dDY \x90\xcf%\
-\xe6\xd1\xc1\x92\x8eo\x03\x008\xd2:\xa0\x11R7\x00\
-T*\x95\xe9\x80\xbc\xd2\xba#\x04\xb5&\xc7I\xc4w\
-\xff\xa5E>\x0e\xa0`\xddA\x94\x09\x8a\xb9\xda\xa2\x9f\
-\xb4\xce\x98\x88\xdc\xb6\x01@\xad;\xea&x\xa5\xaaN\
-\xf8\x89\x9aI\x91\xba\x01`T\xf5\x10\x00)x\x8c\xa3\
-\xdc\x90\xcf\xe7\xcb\xd6\x15\xe3\xf1q\xfa4\x08\x12\xf1f\
-D\x94\x1e\xf2\xa9M\xf8\xe4,\xeb\x8a\xf1\xe4\xf3\xf9\x87\
-\x00\xdcj\xdd\x11\x82\x19\x9e\xe7\xa5\xee\xc6f\xa9\x1b\x00\
-\x9c\x00\x87Z7\x84B\xf1\x1b\xeb\x84\x89hi\xc9}\
-\x94O\x91#\x8a\xdc.\xb5\x96\x96\x8fZGL\x84\xa4\
-\xe4\xa6@\xea8\xaf\xb6n\x08[\xea\x06\x00E\xf0*\
-\xeb\x860\xd4\x9a\xe4\xb7\xd6\x0d\xe3Q\x9c\xda\xac\xc0\xc7\
-\xad;\x88\xb2HTN\xeb\xc6\xca6\xeb\x8e\xf18\x0e\
-~e\xdd\x10\x06G\xc1\x01 \xce\xb6}WS\xd20\
-\x00\xac_\xd0\xd1\xf1\x80u\xc4x6\xb5\xb4\xbf\x05@\
-\xa7u\x07Q&\x09:f4o\x89\xfd-\x82\xf3\xf9\
-\xfc\x83Pl\xb0\xee\x08\xc1\xe1\xd6\x01aK\xd5\x00\xd0\
-[\xa9\xbc\x14i\xf8\xfe\x7fB\xb6\xffU\x82DlA\
-\x12\xa5\x95\x88$e\x07\xee2\xeb\x80z)Pr]\
-w7\xeb\x8e0\xa5j\x00\xc8\xd5\x90\x86O\xffp\x1c\
-\xfc\xce\xbaa<\x9b[\xcfx\x11T\xd2q\xbd\x05Q\
-r\x1d4\xd8rz\x02.Ns\x12?\x00l\x93;\
-\xcc\xba L\xa9\x1a\x00 A\xf2\xcf\xd1\x086\xe7\xf3\
-\xf9[\xac3\xc6SSy\x07x\xd7?\x22s\x8a\xdc\
-\xbb\xad\x1b\xc63<\xfc\xe4\x9f\x91\x86G\x04\xa7a\x8d\
-y\x86t\x0d\x00@\x1a\xbe\xff\xff'\x11\xa9YG\x8c\
-O\xdef]@D\x00\x80w)N\xccYG\xbc\x90\
-\x85\x0b\x17\x0e\x01r\x8duG\xbd\x04\xc2\x01 \x8e\xfa\
-\xfb\xfbg\x00\xb2\xa7uG\xbdDu\x9du\xc3x6\
-5\xafx\x05\x80}\xac;\x88\x08\x00P\xd8\xdc\xb4G\
-\xfc\x17&\xd1\xcb\xad\x13\xea\xa5\xc0\xa2\x9e\x9e\x9e)\xd6\
-\x1daI\xcd\x0002\x12\xbc\x0c)\xf8\xf7\xa9\xd5\x9a\
-b?\x00\x04\x12\xbc\xdd\xba\x81\x88\xfe%\x10\xbc\xd9\xba\
-a<5'\x15\xd7\x01\xe4r\xb9\xdc\xde\xd6\x11aI\
-\xfc\x82\xf9\xb4\x9c\xeeo\x9d\x10\x82G:;\xe7\xddo\
-\x1d1>9\xc1\xba\x80\x88\x9eA\xf0o\xd6\x09\xe3Y\
-\xd0\xd1\xb1\x01\x90^\xeb\x8ez\xa9\xc8~\xd6\x0daI\
-\xcd\x00 \x01\x12\xff\x9b\xa2\x90\xab\xad\x1b\xc630e\
-Y'\x80=\xac;\x88\xe8Y\x16\x0eNY\xbe\xabu\
-\xc4\x04\xdcd\x1dP/\x11\xd9\xd7\xba!,\xa9\x19\x00\
- \x92\xfc\xe75\x8b^o\x9d0\x1e\xa9\xc9Q\xd6\x0d\
-D\xb4\x1d5\x1ca\x9d0.\xd1\x1b\xac\x13\xea\x16\x80\
-\x03@\x9cl{J\x93&\xfe\xa24\x09\x82\x1b\xad\x1b\
-\xc6\xa3\x92\x807\x19\xa2\x0cR\xd1\xf8\xdf\xa9.\x08\x92\
-?\x00H\xf2w\x9b\x9f\x92\x8a\x01\xa0\x5c.\xef\x0d \
-\xf6\xf7\xc4\x1e\xc7`\xb1X\xbc\xcf:b\x5c\xca\x01\x80\
-(\x96Tb\xff\xcc\xfab\xb1x\x07\x80'\xad;\xea\
-4\xafR\xa9\xa4\xe2\xf1\xe7\xa9\x18\x00j\xc0\x22\xeb\x86\
-z)p\xa3\x88\xc4\xfa\xb9\xd9\xfe\xf4\xd3;\x00\xece\
-\xddAD\xdb\xf5\xe2\xfe\xa9\x9f)ZG\xbc\x10\x11\xa9\
-\x0a\xf0\x17\xeb\x8ezU\xab\x9a\x80\xbb/\x8e/\x15\x03\
-\x80\xa3\xf2b\xeb\x86z\x89 \xf6\xdb\xff\xb9Q\xe7\x10\
-\xf0\xee\x7fD\xb1%\xd5\xda\xc1\xd6\x0d\xe3\x09\x90\xfc\xeb\
-\x00D\xc0\x01 .T5\xf1\x9fJ\x03\xe0f\xeb\x86\
-\xf1\xe4\xe0$~\xd0\x22J3G$\xf6\xef\x85\xa2N\
-\xec?\xec\x8cG\x11p\x00\x88\x0dI\xc1\xb6t\xb5z\
-\x87u\xc2x\x14\xdae\xdd@D;\xa6\x08b\x7f7\
-\xd4\xa6&\xf9\xbbuC\xfd$\x157\x03J\xc7\x00\x90\
-\xfc\xf3\xd2\x8ftvv\x0eXG\x8cG\x02p\x00 \
-\x8a1\x09$\xf6\xaf\xd1\x8e\x8e\x0e\x1f@\xc5\xba\xa3N\
-\xbb[\x07\x84!\xf1\x03\xc0#\xfd\xfd%\x003\xad;\
-\xea\xa2\xf8\x9bu\xc2D\xa8p\x00 \x8a3\x15\x8d\xfd\
-\x0e\x00\x00@q\xa7uB\x9d\xe6n{\xfeL\xb2%\
-~\x00h\xaeV\x13\x7f^ZEc\xbf\xfd\xefb\xe5\
-T\x00%\xeb\x0e\x22z!\xd2\xd9\x83O\xc5\xffa5\
-\xa2I\x1f\x00P\xab\xd5v\xb7n\xa8W\xe2\x07\x00U\
-'\xf1\x9fJE\x9d\xd8\x9f\x13ki\x19\xde\x15\xfc\x06\
-\x00Q\xdcI[ks\xeco\x09,\xc0]\xd6\x0d\xf5\
-\xaa\x01\x0b\xad\x1b\xea\x95\xf8\x01\x00\xd0\xdd\xac\x0b\xeaU\
-k\x92\xbb\xad\x1b\xc6\xa5\xb5d\x9ff!\xca\x8a\x00\xb1\
-\xdf\x9aVM\xfe\x0e\x80\xa4\xe0:\x80\xe4\x0f\x00\xa2\x0b\
-\xac\x13\xea4\xda9o\xde\xc3\xd6\x11\xe3\xca9\xd3\xad\
-\x13\x88h\x02\x12\xf0Z}\xf2\xc9'\xd7\x03\xa8Zw\
-\xd4\x89;\x00\xf6\xa4\xd3\xba\xa0N\x0f\x8a\xc8\xa8u\xc4\
-xT\x83\xd8\xbf\xa9\x10\x11\x90\xd3Z\xec_\xab]]\
-]\xc3\x80<h\xddQ\x97\x80\x03@\x1c\xc4\xfe|\xd7\
-\x0bR\xfc\xc3:a\x22r*\xb1\x7fS!\x22\x00\x1a\
-\xff\x1d\x801\x0fY\x07\xd4C\x84\x03\x80)U\x15\x00\
-\xf3\xad;\xea!\x22\x89\x18\x00\xc0\x01\x80(\x11T\xe3\
-\x7f\x0d\xc06\xc1\xc3\xd6\x05\xf5P\x9e\x02\xb0U.\x97\
-\xe7!\xe1O\x01\x0cD\xef\xb7n\x98\x88\xc0\xd1V\xeb\
-\x06\x22\x1a\x9f&\xe4\xb5*@\xb7uC\x9df\xf4\xf4\
-\xf4\xb4[G\xd4#\xd1\x03@\x10\x04I\xbf\x00\x10\xb9\
-\x84\xbc\x08$\xd0-\xd6\x0dD4>\x09\x9c\xa4\xbcV\
-\x13\xf1\xde\xf7Br\xb9\x5c\x87uC=\x12=\x008\
-\x8e\x13\xebG_ND\xb5\x9a\xeb\xb5n\x98\x10q\x9e\
-\xb0N \xa2\x09\x10<n\x9d0\x11\xaa\x9a\xf8\x01\x00\
-h\x9ak]P\x8fD\x0f\x005\xd5y\xd6\x0d\xf5r\
-\x9c\xd1D\x0c\x00\x22\xca\x01\x80(\x01\x92\xf2Z\x0d\x82\
-d_\x03\xb0\x8dr\x00\xb0\xe2\x00\x89\xfe\xe1\x03\xd8X\
-*\x95\x12\xb1]'\xb5 \x11o*D\x99WK\xc6\
-\x0e\xc0\xd8\x03\xd0\x1e\xb3\xee\xa8\x87::\xc7\xba\xa1\x1e\
-\x89\x1e\x00T%\xd1\x17`@\x90\x88O\xff\x00P\x95\
-\x1c\x07\x00\xa2\x04\x10I\xd4\xb0\xfeO\xeb\x80\xba(w\
-\x00,%\xfa\x87\xaf\x9a\x9c\x01\xa0\xd9\xa9m\xb6n \
-\xa2\x09\xc8\xe5\x12\xf3Z\x95\xc4?\x16\xd8\xe1\x0e\x80\xa1\
-D_\x03 \x0a\xdf\xbaa\xa2v\x19~\xf4\x11\x00\xb1\
-\xbfc!Q\xc6\x8d\xcc\x1ajK\xcc\x07\x0b\x00\x1b\xad\
-\x03\xea\xe1\xf0\x1a\x00CN\xb2w\x00\x90\xa0?\xfc\x82\
-\xf3F\x15x\xc4\xba\x83\x88^P\xb7`eb\xee\xb1\
-\x1f@\x06\xac\x1b\xea\xc4\x1d\x003\x9a\xec\x1f\xbe\x88\x0e\
-Z7L\x86@7X7\x10\xd1\x8e)$a\xaf\xd1\
- 1\x1f\x82\xb6G5\xd9\x1fB\x93=\x00HRn\
-y\xb9C\xfd\xd6\x01\x93!\x9a\xb47\x17\xa2l\x11M\
-\xd6\x90.\x92\xf0\x1d\x00\xe1)\x00;*S\xad\x13\xea\
-\x11$\xec\x0f\x7f\xe0 Qo.DY#H\xdck\
-4\xd1;\x00\x80\xcc\xb2.\xa8G\xb2\x07\x00h\xa2\x07\
-\x00$l\x00\x80\xc8\xbd\xd6\x09D\xb4c\xb5\x9c\xdeg\
-\xdd0)A\xc2\xde\x03\x9f/\x11\xcf]\xd8\x91\xc4\x0e\
-\x00\xaa\x9aC\xc2\x7f\xf8\x01\x90\xa4\xef\xeb\x22\x18j\xfb\
-\x0b\x80\xc4\x5c`D\x941\xa3\xb5\xa1\xe0f\xeb\x88\xc9\
-\xa9%|\x07 \xd9k\x90D}\xc0+\xaf\xb9f_\
-\xa9\xe9)\x00\x8e\x06\xb0;\x80iQ7\xa4\xc0\x93P\
-<\xa2\x8e\x5c\xa5\x08.8v\xf1\xe2;\xa2:\xf0@\
-\xcb\xf2[\x00\x1c\x18\xd5\xf1\x88h\xa2\xf4\xa69#k\
-\x0e\x8d\xeahW^s\xcd+\xa4\x16|\x00*K \
-\xd8\x15|/\xdf\x19O\x02x\x18\xaa\xebj\x0e\xce?\
-n\xf1\xe2\xbb\xa3<xd\x03\xc0\xda\xb5k[[\xdb\
-\xa6~]\x81\x0f!\xc1;\x0f1\x14@qa\xce\xd1\
-\x8f/^\xbcx\xa8\xd1\x07\x1bh^\xf6U\x88\xfcg\
-\xa3\x8fCD\x93\xa3\xc0\xaa\xb9#\xab\xcfl\xf4qn\
-\xbc\xf1\xc6)O\x0e\x8d|K\x80\xf7\xc2\xe0Cd\x8a\
-\xd5\x00=gpc\xc7\xa7O:i\xd1H\x14\x07\x8c\
-d!^\xbbvmk\xcb\x94\xa9\x97)\xf0\x91\xa8\x8e\
-\x99!\x0e\x04\xa7T\xd5Yw\xe3\x8d7Ni\xf4\xc1\
-T\xe4\xbaF\x1f\x83\x88&\xcf\x11\x5c\xdb\xe8c\xdcx\
-\xe3\x8dS\xb6\x0c\x8d\xac\x13\xe0}\xe0\xe2\x1f\xb6\x1c \
-\x1fm\x9f\xdb\x7f\xd9\xc5\x17\xafo\x89\xe2\x80\x91,\xc6\
-\xcdS\xa6\x9d\x05\xc5\xe2(\x8e\x95U\x02}\xf5\x96\xa1\
-\x91o6\xfa8\xcd##\xd7\x01\x08\x1a}\x1c\x22\x9a\
-\x94\x1a\x86qc\xa3\x0f\xb2eh\xe4\x1c\x00\x91\x9df\
-\xc8\xa8%\xb3\xe7m\xfcZ\x14\x07j\xf8\x047v\xce\
-\xff\x0e\xf0\x93\x7f\x14\xd4Ap\xd0\x92%Knk\xe4\
-A\x06[\x96\xdf\xa6\xc0\xfe\x8d<\x06\x11M\xca_\xe7\
-\x8c\xac>\xa4\x91\x07X\xb7\xee\xcf\x07\xc1\xc1_\xc1O\
-\xfeQ\xa89\x08\xf6[\xb2d\xc9\xfaF\x1e\xa4\xe1\x8b\
-\xf2\xd8\x05\x7f\x5c\xfc\xa3!\x01\xe4\x83\x11\x1c\xe7\xe7\x11\
-\x1c\x83\x88&H \xbf\x8a\xe0 \xa7\x82\x8b\x7fTr\
-\x0a\xe7\x03\x8d>H\x14\x0b\xf3\xd2\x08\x8eAO\x93c\
-\x1a}\x04\xcd5\xfd\x14<\x0d@\x14\x1b5\x09~\xdd\
-\xf0\x83\x08\xdf\xcb#\xd6\xf0\xf7\xf2(\x06\x80]#8\
-\x06\xfd\xcb\x82\x95+\xb5\xa1\xbf\xafs\xb6~\xa9\x07\x82\
-\xeb\x1by\x0c\x22\x9a\xb0;\xe6\x0d\xaf\xf9G#\x0f0\
-\xf6\x9e\xd2\xd9\xc8c\xd0\xb3)\xb0[\xa3\x8f\x11\xc5\x00\
-\xa0\x11\x1c\x83\x22&\x01~f\xdd@D\x00D\x7f\x10\
-\xd1\x91\xf8^\x1e\xad\x86\xff\xbc\xa3\x18\x00z\x228\x06\
-\xfdK\xcf\xca\x95\xd2\xf0\xed\xf9\xdc\xe8\xc8\xcf\x01D\xf2\
-]U\x22\xda\xa1j\xb5\xa9\xe9\xa7\x8d>\xc8\xd8{J\
-_\xa3\x8fC\xff\x22\x11<~\xbd\xf1\x03\x80\xea\x95\x0d\
-?\x06=ME\xfe\x18\xc5qv\xc1\xd7\x07\x01\xfc!\
-\x8ac\x11\xd1\x0e\xfd:\xff\xe4\x97\xcbQ\x1cH\x00\xbe\
-\x97GH\x81\x86\xbf\x977|\x00\xa898\x1f@\xad\
-\xd1\xc7!\x00@\xe0\x04\xf2\xdd\xe8\x0e&\xdf\x88\xeaX\
-D\xf4|\x128gEu\xac\x9a\xe8y\xe0i\x80\xa8\
-\xd4\x108\x174\xfa \x0d\x1f\x00\xb6\xdd\xdbX\xcfi\
-\xf4q\x08\x80\xe2\xc2\xa3\x8f>\xe2\xf6\xa8\x0e7oh\
-\xd5\x9f\x01D\xf6\x1c\x02\x22\xfa\x17\x01nk\xaf~\xe5\
-\x86\xa8\x8ew\xec\xe2\xc5\xb7*\xf0\xfd\xa8\x8e\x97q\xdf\
-Z\xba\xf4\x88{\x1a}\x90H\xbe\x9f?\xb8\xb1\xe3\xd3\
-\x02\xb9*\x8ace\x96\xe0\xba\x9c\xa3\x1f\x8f\xfe\xb0\xfa\
-\xd5\xa8\x8fID\x80\x02k\xa2>\xe6\xb4\xb6\x96\x8f*\
-$\xb2\xa1#\xa3\xd6\xcd\x9a9\xfd\xf4(\x0e\x14\xc9\x00\
-p\xd2I\x8bF\x066\xce}\xad\x8a|\x13<\x1d\x10\
-\xb6@E\xce\x19\xd9\xba\xe5\x98(\x1e\x06\xf4\x5c\xb3G\
-\xba\x7f\x06\xa0\xa1_A\x22\xa2\xe7\xb9\xb7}d\xca/\
-\xa2>\xe8\xa1\x87\x1e\xba\xb5I\x82\xa5\x02|\x17\xbc\x17\
-H\xd8j\x00\xbe1k\xe6\xf4\xd7\x1ex\xe0\x81\xa3Q\
-\x1c0\xf2\xbb:]}\xf5\xd5\x8b\xc6\xeept\x8cn\
-{\x1c\xf0\xf4\xa8\x1bR`\xdb#$\x81\xab\x108\x17\
-,]z\xc4\x9d\x961\x1b\x9b\x97\xbfG\x04Q}\x15\
-\x89(\xf3\x04\xf2\x8e\xf6\x91U\x0d\xbf\xfa\xff\x85\x5c}\
-\xf5\xd5\xfb\x05p\xde\x8fm7{\xdb\x0d|\x1c\xf0\xce\
-xB\x80\x87\x15\xf8\xe3\xd8{y\xc3\xb7\xfd\x9f)\xb1\
-\xb7uT\xd5&\xcf/G2%5J\xcd\x91\xfd\x16\
-\xe4\xf3\xa6\x8bw\x18\x14'\xe6\x06[\xf6\xf8\x1b\x80}\
-\xad[\x882\xe0\x8e\xf6\x91)\x07\x08V&\xfe\x13\xb8\
-\xef\xfb\xaf\x0c\x14\x7f\xb1\xee\xa8G\xb1\x90o\x16\x91\xaa\
-u\xc7\xceH\xec=\xfa\xc7~\xe0\x89\xfc\xa1?\xa5)\
-\x08\xda\xad\x1b\xc2 \xb8\xa4\xa6\x8e|\xd2\xba\x83(\x0b\
-\xd4\x913\xd2\xb0\xf8\x03@\x10\xc8.\xd6\x0duz2\
-\xa9\x8b?\x90\xe0\x01`\xcc\x16\xeb\x80z\xa8:\xb3\xad\
-\x1b\xc22wh\xd5\xd5\x80\xae\xb5\xee J3\x01~\
-3wh\xd5:\xeb\x8e\xb0\x88\x043\xad\x1b\xea\xf4\x98\
-u@=\x92>\x00l\xb6\x0e\xa8\x87:\x9a\x9a\x01\x00\
-\x00\x1c\xc7\xf9(\xb6]\x9f@D\xe1\xdb\xe28\xb5O\
-YG\x84)\x90\xc4\xef\x00<j\x1dP\x8fd\x0f\x00\
-\x82A\xeb\x84z8*\xa98\x05\xf0\x94\xd9C\xab\x1e\
-V\xe8\x97\xac;\x88\xd2HDV\xce\x1a\xfaj\xb7u\
-G\x98\x1c\xd5\xa4\xbf\x07r\x07\xc0\x8aj\xb2\x07\x00\xd5\
-t\xed\x00\x00\xc0\x9c\x91\xcd_U\xe0o\xd6\x1dDi\
-\x22\xc0m\xb3\x87\xdb\xben\xdd\x116\x05\x0a\xd6\x0du\
-Q\xee\x00\x98\x11\xe8&\xeb\x86:uX\x07\x84Mp\
-\xde(\xa0\xef\x04\xb0\xd5\xba\x85(%\xb6\x04p\xde%\
-X\x99\xd8\x8b\xcdvH%\xd9\x03\x80(w\x00\xcc\x88\
-$z\x07\x00\x22\xf3\xad\x13\x1aa\xee\xc8\x9a{!8\
-\xd3\xba\x83(\x0dD\xf5\x8c\xb9#_\xb9\xcf\xba\xa3\x11\
-T\x92\xbd\x03 \x10\x0e\x00VD\x13>\x00@;\xad\
-\x0b\x1a\xa5}x\xf57\x00\x5cj\xddA\x94d\x02\xfc\
-f\xf6\xe8\x9a\xefXw4\x8a\x00E\xeb\x86z\xa8\x22\
-\x92'16J\xa2\x07\x80\x00A\xd2O\x01\xa4r\x07\
-\x00\x00\x04\xd0`D\xdf\x07 \x95\x9f\x5c\x88\x22\xb0\x01\
-#8YR\xfd\x04\xbe\x84\x9f\x02\x00\x07\x00;\x22\xfd\
-\xd6\x09uj\xef\xe9\xe9\x99b\x1d\xd1(\xf3\xb0\xe6q\
-\x01N\x02\xf0\xb8u\x0bQ\xc2<\x06\xe0M\xedX\x9d\
-\xe8\x8b\xcc^\x88\xeb\xbaS\x01\x9de\xddQ\x0fu\xe0\
-[7\xd4#\xd1\x03\x80\x04\xd2g\xddP\xb7\xd6\xd6\xd4\
-\xee\x02\x00@\xfb\xc8\xea\xbb r\x12\x12~\xd7F\xa2\
-\x08\xd5D\x82w\xce\x19Y\xbd\xde:\xa4\x91Dd!\
-\x12|;z\x00pT9\x00Xq\x1cM\xfc\x00\xe0\
-\xa8.\xb4nh\xb49\xc3\xab.\x17\xc5i\xd6\x1dD\
-I \x8a\x8f\xb6\x0f\xff\xef\xef\xad;\x1a-\x10\xd9\xc3\
-\xba\xa1^A\x10x\xd6\x0d\xf5H\xf4\x000<<\x9c\
-\xfc\x01 \xc0\x9e\xd6\x0dQh\x1f]\xfd\x1d@WZ\
-w\x10\xc5\x99\x02\x9fm\x1f]}\xaeuG\x14\x04H\
-\xfc\x87\x9f)S\xa6p\x07\xc0\xcan\xbb\xed\xb6\x09\x09\
-\xbf\xf5\xac\x22\xc8\xc4\x00\x00\x00sF\xd6|^\xa1\xab\
-\xad;\x88bIq\xf6\xdc\x91\xd5_\xb4\xce\x88P\xd2\
-\x07\x80\xa1\xf6\xf6\xf6D_\xa3\x91\xe8\x01\x00\x00\xa0p\
-\xad\x13\xea\xa1\x90\xbd\xac\x1b\xa24gd\xcd\x99\xa2\xf2\
-M\xeb\x0e\xa28\x11\x95o\xb6\x8f\xaeN\xd5}\xfe\xc7\
-\x15$~\x00H\xf4\xf6?\x90\x86\x01@\x90\xe8\xd3\x00\
-\x82l\x9c\x02x\x8a\x00:{t\xd5iP\xf9\x86u\
-\x0bQ,\x88\x9e7{t\xd5i\xe9\xfe\xba\xdfv\x08\
-\x92\xfe\xe1\xe7a\xeb\x80z\xa5a\x00\xe8\xb5N\xa8\xd3\
-BU\xcdYGDI\x00m\x1f]\xf5I\x0e\x01\x94\
-y\xa2\xe7\xb5\x0f\xaf\xf9p\xd6\x16\xff\x0d\x1b6\xb4\x02\
-\xe8\xb2\xee\xa8\x87\x00\x89\x7f0S\xf2\x07\x00\xd5\xa4\xff\
-&\xb4z\x9e\x97\xf4Ix\xd28\x04P\xe6et\xf1\
-\x07\x80)3g\xbe\x04@\x93uG=T\xf1\x90u\
-C\xbd\x12?\x00\x08\x9c\x07\xac\x1b\xea\xa5\x8e\xf32\xeb\
-\x06\x0b\x1c\x02(\xb32\xbc\xf8\x03\x80S\xc3K\xad\x1b\
-\xea\xa5\x0e\x07\x00s\x81\x83\xc4\x0f\x00\x12 \x93\x03\x00\
-\xc0!\x802(\xe3\x8b\xff6\xba\xc8\xba\xa0^9p\
-\x000\xe7\x04\xc1\x06\xeb\x86\xba\x09\xf6\xb3N\xb0\xc4!\
-\x802\x83\x8b?\x00@$\xf9;\x00\xe05\x00\xf6\x8a\
-\xc5b?\x80D\x7f\x17\x13\xc8\xee\x0e\xc0S8\x04P\
-\xeaq\xf1\x7f\x9a\x0a\xf6\xb7n\xa8\xd3\x13\x85B\xa1b\
-\x1dQ\xaf\xc4\x0f\x00c\x92\xbe\x0b\xb0\xa0\xb7\xb7w\x8e\
-u\x845\x0e\x01\x94Z\x5c\xfc\x9fV\xa9T\x0a\xd0\x84\
-?\x09U\xf1\xa0uB\x18R1\x00\x08\x92\x7f\x1d@\
-.\x97;\xd8\xba!\x0e8\x04P\xeap\xf1\x7f\x96\xd1\
- H\xfe{\x9d\x83\xbb\xad\x13\xc2\x90\x8a\x01 \x80\xfe\
-\xc3\xba\xa1^\x01\xf0J\xeb\x86\xb8\xe0\x10@\xa9\xc1\xc5\
-\xffyD\xf5@\xeb\x86\x10\xa4\xe2I\x8d\xa9\x18\x00D\
-\x9d\xbb\xac\x1b\xea%\xc0!\xd6\x0dq\xc2!\x80\x12\x8f\
-\x8b\xff\xf6\x89$\xfe\xc3\x8e\x82;\x00\xb1Qk\x92\xbf\
-[7\xd4\xcf9XU\x13\xfdl\xec\xb0q\x08\xa0\xc4\
-\xe2\xe2\xbf]\xaa*P\x1c`\xddQ\xaf&\x11\xee\x00\
-\xc4E\xe7\xbcy\x0f\x01x\xc2\xba\xa3>:\xdbu\xdd\
-\xcc\xdd\x11p<\x1c\x02(q\xb8\xf8\xef\x90\xef\xfb{\
-\x03H\xfa\x05\xcf[:::\x1e\xb6\x8e\x08C*\x06\
-\x00\x11\x09R\xb1%\x93\xcb\xbd\xda:!\x8e8\x04P\
-bp\xf1\x1f\x87s\xa4uA\x08\xee\x11\x91\xc0:\x22\
-\x0c\xa9\x18\x00\x00@\x04wZ7\xd4K\x80%\xd6\x0d\
-q\xc5!\x80b\x8f\x8b\xff\x04h\xe2\x07\x00\x85$\xff\
-\xc3\xe6\x98\xd4\x0c\x00\xaa\x9a\xf8\x0b\x01\xa1\x1c\x00^\x08\
-\x87\x00\x8a-.\xfe\x13u\xb8u@\xddDo\xb7N\
-\x08Kj\x06\x00QM\xc1\x85\x80(\xba\xae\xfb\x12\xeb\
-\x888\xe3\x10@\xb1\xc3\xc5\x7fB\x5c\xd7}\x89\x02%\
-\xeb\x8ez\xa9\xc8\xad\xd6\x0daI\xcd\x00\xd0\xd4\xd4\xf4\
-7\x005\xeb\x8ez\x89\xe4\x16[7\xc4\x1d\x87\x00\x8a\
-\x0d.\xfe\x93\x90;\xca\xba \x04\xa3:2r\x87u\
-DXR3\x00ttt<\x01M\xfe\x85\x80\xca\xeb\
-\x00&\x84C\x00\x99\xe3\xe2?I\xfa\x1a\xeb\x82\xfa\xc9\
-]\x0b\x16,\xd8j]\x11\x96\xd4\x0c\x00\x00\x00\x07\x7f\
-\xb5N\xa8\x9f\x1e\xa3\xaa\xcd\xd6\x15I\xc0!\x80\xccp\
-\xf1\x9f\x94\xf5\xeb\xd7\xb7@\xd2\xf0\xe1&\xb8\xd9\xba \
-L\xa9\x1a\x00\x14i\x18\x00\xb0\x8b\xef\xfb\x87ZG$\
-\x05\x87\x00\x8a\x1c\x17\xffI\x9b3g\xcea\x00fX\
-w\xd4KEn\xb1n\x08S\xaa\x06\x00G\xf5/\xd6\
-\x0da\x08\xe0\xbc\xce\xba!I8\x04Pd\xb8\xf8\xef\
-\x94\x9a\xea\xf1\xd6\x0da\xc8\x01\x1c\x00\xe2\xaaP(\xdc\
-\x07\xe0Q\xeb\x8ez\x09\x94\x03\xc0$q\x08\xa0\x86\xe3\
-\xe2\xbf\xd3\x04\x92\x86\x01\xe0\x89|>\x7f\x8fuD\x98\
-R5\x00\x88H\x00E\x1a\xce\xd1\xec\xe3\xfb\xfeB\xeb\
-\x88\xa4\xe1\x10@\x0d\xc3\xc5\x7f\xa7\x8d\xbd\x97-\xb2\xee\
-\xa8\x9f\xde \x22\x89\xff\xa6\xd93\xa5j\x00\x00\x00\x15\
-\xbd\xd1\xba!\x0c\x01\xf0\x06\xeb\x86$\xe2\x10@\xa1\xe3\
-\xe2_\x17U9\xc1\xba!\x14\x22\xd7X'\x84-u\
-\x03\x80\x03\xfc\xc9\xba!\x14\xaao\xb1NH*\x0e\x01\
-\x14\x1a.\xfeuS\xe8\x89\xd6\x0da\x08D\xfel\xdd\
-\x10\xb6\xd4\x0d\x00\x83\x83\x837\x01\xd8b\xddQ?9\
-\xac\xaf\xafo\x81uERq\x08\xa0\xbaq\xf1\xaf\xdb\
-\xd8{\xd8A\xd6\x1d!\xd8\xf2\xe8\xc6\x8d\xb7YG\x84\
--u\x03\xc0\xa2E\x8bF\xa0H\xc3i\x00\x91\x5c\xee\
-\xcd\xd6\x11I\xc6!\x80v\x1a\x17\xffP\x88\xe4\xde\x02\
-@\xac;\xea\xa6\xb8a\xd1\xa2E#\xd6\x19aK\xdd\
-\x00\x00\x00pp\xb5uB(\x02\x9cd\x9d\x90t\x1c\
-\x02h\xd2\xb8\xf8\x87\xc7A:\xce\xff\x03\xa9;\xff\x0f\
-\xa4t\x00H\xcdu\x00\x82W\xf14@\xfd8\x04\xd0\
-\x84q\xf1\x0f\x8d\xe7y\xbbC\x91\x92\x9b\x9a9\x1c\x00\
-\x92\x22\x9f\xcf\xdf\x0a\xe01\xeb\x8e\x10\x08\x1c\xe7\xed\xd6\
-\x11i\xc0!\x80\xc6\xc5\xc5?d\xce{\x90\x86\xed\x7f\
-\xe0\xf1M\x9b\xfa\xd3\xf0\xf5\xf2\xe7I\xe5\x00 \x22U\
-\x00\xd7Yw\x84A \xef\xb5nH\x0b\x0e\x01\xb4C\
-\x5c\xfcC\xa5\xaa\xa2\xaa\xef\xb2\xee\x08\x85`]\x1a\xcf\
-\xff\x03)\x1d\x00\x00@\xa0k\xad\x1bB\xb2\xb7\xef\xfb\
-\xaf\xb4\x8eH\x0b\x0e\x01\xf4<\x5c\xfcC\xe7V*\xaf\
-\x82\xa0\xcb\xba#$iYK\x9e'\xb5\x03\x80\xaa\xfe\
-\xde\xba!,\x81\xea\xc9\xd6\x0di\xc2!\x80\x9e\xc6\xc5\
-\xbf!D\xf5=\xd6\x0d\xa1\x09\x82?Z'4J\x1a\
-\xce\xcf\xec\x90\xeb\xf9w\x02\xd8\xd7\xba\xa3n\x82\xcd\xc3\
-[\xb7\x16\x17.\x5c8d\x9d\x92&\x0a\xc8`\xf3\x8a\
-\xb3 z\x9au\x0b\x19\xe0\xe2\xdf\x10===Sr\
-M-}\x80\xce\xb6n\x09\xc1]\xa5b\xe1e\xd6\x11\
-\x8d\x92\xda\x1d\x00\x00\x80\xe2\x0f\xd6\x09\xa1P\xccj\x9d\
-2\x85\xf7\x04\x08\x19w\x022\x8c\x8b\x7f\xc38MM\
-oK\xc9\xe2\x0f\x81\x5cf\xdd\xd0H\xe9\x1e\x00\xe0\xa4\
-c\x00\x00\x00\xd5\x8fX'\xa4\x11\x87\x80\x0c\xe2\xe2\xdf\
-P\x02\xf9\x0f\xeb\x86\xf0\x04\xa9=\xff\x0f\xa4\xfc\x14\x80\
-\xaa\xe6<\xbf\x5c\x060\xc7\xba%\x0c\x81#/\xef\xcc\
-\xe7\xffn\xdd\x91F<\x1d\x90\x11\x5c\xfc\x1b\xcau\xdd\
-\x03 \xce\xad\xd6\x1d\xa1\x10l.\xe6\xf3\x1d\x222j\
-\x9d\xd2(\xa9\xde\x01\x10\x91\x1a\x04\x97[w\x84\xc5Q\
-\xfd\xa8uCZq' \x03\xb8\xf8G\xc0I\xcfN\
-\xa5\xeao\xd3\xbc\xf8\x03)\x1f\x00\x00\x00\x81\xfc\xca:\
-!4\x8awtwo\x9ae\x9d\x91V\x1c\x02R\x8c\
-\x8b\x7f\xc3uwo\x9a\x05Ajn\x5c\xa6\x22\xbf\xb0\
-nh\xb4\xd4\x0f\x00\xb5\xda\xc8Z\x00OXw\x84d\
-Zk\xeb\xf0{\xad#\xd2\x8cC@\x0aq\xf1\x8fD\
-K\xdb\xd0\xa9\x00\xa6Zw\x84\xe4\xb1-\x8f?\x9e\xda\
-\xaf\xff=%\xf5\x03\xc0\x82\x05\x0b\xb6\x0a\x90\x9a{\x02\
-@\xf0\x09Um\xb2\xceH3\x0e\x01)\xc2\xc5?\x12\
-\xaa\xda,p>n\xdd\x11\x1a\xc1o\xbb\xba\xba\x86\xad\
-3\x1a-\xf5\x03\x00\x00\xa8\xca%\xd6\x0d!\xda\xdd-\
-\x97O\xb4\x8eH;\x0e\x01)\xc0\xc5?2\xbe\xef\xbf\
-\x03\xd0N\xeb\x8e\xd0\x04r\xa9uB\x1421\x00\x0c\
-\x0foY\x8bt<\x1c\x08\x00 \x01\x96\xabj\xaa\xbf\
-\xc1\x11\x07\x1c\x02\x12\x8c\x8b\x7f\xa4T\xe4\x93\xd6\x0d!\
-z\xa2V\x1b\xb9\xc2:\x22\x0a\x99\x18\x00\x16.\x5c8\
-\x94\x9a\x9b\x02\x01\x80`?\xb7RYj\x9d\x91\x05\x1c\
-\x02\x12\x88\x8b\x7f\xa4\x5c\xb7|,\x14/\xb7\xee\x08\x8b\
-\x00\x7fX\xb0`\xc1V\xeb\x8e(db\x00\xd8&U\
-\xa7\x01 5=\xc3\xba!+8\x04$\x08\x17\xff\xe8\
-\x89\xae\xb0N\x08\x93\x08~l\xdd\x10\x95\xcc\x0c\x00\xc3\
-\xc3[.\x03d\x93uGh\x04\xc7x\x9ew\x90u\
-FVp\x08H\x00.\xfe\x91s]\xf7\x08\x00\x8b\xad\
-;BT\xc9\xe7\xf3\x99\xd8\xfe\x0724\x00l{\x90\
-N\xf03\xeb\x8e0)d\xa5uC\x96p\x08\x881\
-.\xfe&T\x9c\xcfY7\x84J\xf0\x93\xb4\xdf\xfc\xe7\
-\x9923\x00\x00\x80#\xf2\x03\xeb\x86\x90\xbd\xd6u+\
-\x87YGd\x09\x87\x80\x18\xe2\xe2o\xa2\xaf\xaf\xfcj\
-\x01\x96Xw\x84*\x08~d\x9d\x10\xa5L\x0d\x00\x85\
-B\xe1\xaf\x00\xee\xb5\xee\x08\x95\x13|\xd6:!k8\
-\x04\xc4\x08\x17\x7f;\x8e~\xc1:!d\xf7\x94J\xa5\
-\xdb\xad#\xa2\x94\xa9\x01\x00\x00\x14\xfa}\xeb\x86P)\
-\x8eu]\xf7p\xeb\x8c\xac\xe1\x10\x10\x03\x5c\xfc\xcdx\
-\x9ewd\xda>\xfd+4m;\xc4\xe3\xca\xdc\x00\xd0\
-\xd2\xd4\xf4#\x00U\xeb\x8eP\x89\xf3?\xd6\x09Y\xc4\
-!\xc0\x10\x17\x7f3\xaa*\x0aYm\xdd\x11\xb2ZP\
-m\xbe\xc8:\x22j\x99\x1b\x00\xe6\xcd\x9b\xe7\x01H\xdb\
-=\x9e\x8f\xec\xf3\xfd7XGd\x11\x87\x00\x03\x5c\xfc\
-M\xf9\xbe\x7f\x22\x80WZw\x84i\xdbw\xff\xe7\xf6\
-YwD-s\x03\x00\x00@\xe5\x02\xeb\x84\xb0\x89b\
-5\x9f\x11`\x83C@\x84\xb8\xf8\x9bR\xd5fU\xf9\
-\xa2uG\xf8\xf4\x1c\xeb\x02\x0b\x99\x1c\x00\x8a\xc5\x8e\xdf\
-\x00\xf8\xa7uG\xc8\xf6\xf6\xfd\xca\x07\xad#\xb2\x8aC\
-@\x04\xb8\xf8\x9bs}\xffC\x10tYw\x84\xec\xa1\
-B\xa1\x90\x99\xef\xfe?S&\x07\x00\x11\xa9Aq\xbe\
-uG\xd8\x14\xfa\xb9\xfe\xfe\xfe\x19\xd6\x1dY\xc5!\xa0\
-\x81\xb8\xf8\x9b\x1b\x18\x18\x98)\x90\xd4}\xebH\xa1\xe7\
-\x89H`\xdda!\x93\x03\x00\x00\xe4r\xf2]\x00#\
-\xd6\x1d!\xcb\x8f\x8e\xd6Ru[\xce\xa4\xe1\x10\xd0\x00\
-\x5c\xfccaxd\xe4s\x00:\xac;B6\xec\x00\
-\x17ZGX\xc9\xec\x00\x90\xcf\xe7\xcbP\xa4\xef\x91\x8f\
-\x82\xff\xec\xeb\xeb{\xb1uF\x96q\x08\x08\x11\x17\xff\
-X\xf0<o\x1f@>n\xdd\x11:\xc1%\xc5b\xb1\
-\xdf:\xc3Jf\x07\x00\x00P\x95oY74@\xab\
-8\xceY\xd6\x11Y\xc7! \x04\x5c\xfccD\xbe\x01\
-\xa0\xd9\xba\x22t\x81s\xaeu\x82\xa5L\x0f\x00\xf3\xe7\
-\xe7o\x00$\x85w~\x92\xd7\xb8n\xf9M\xd6\x15Y\
-\xc7!\xa0\x0e\x5c\xfcc\xc3\xf3\xbc\x13\x158\xda\xba\xa3\
-\x01n-\x95:\xae\xb7\x8e\xb0\x94\xe9\x01\x00\x00T4\
-\x8d\xbb\x00\x80\xe8Y\xbe\xefO\xb3\xce\xc8:\x0e\x01;\
-\x81\x8b\x7fl\xf8\xbe?M!_\xb5\xeeh\x04\x15\xa4\
-\xf2\xdfk22?\x00ly\xfc\xf1\x8b\x04p\xad;\
-\x1a`\xd7 \xc0\x7fYG\x10\x87\x80I\xe1\xe2\x1f+\
-\x01\xf0E\x00\xbbZw4\xc0\xc3\xa5|>}\xd7\x80\
-MR\xe6\x07\x80\xae\xae\xae\xe1\x00z\xb6uGC\x08\
-Nw]\xf7\x00\xeb\x0c\xe2\x100!\x5c\xfcc\xc5\xf3\
-\xbc\x83\xa0H\xdf\x85\x7f\x00 8KD\xd2uK\xf8\
-\x9d\x90\xf9\x01\x00\x00\xdaZZ\xce\x81`\xb3uG\x03\
-4\x01\xce\x05\xaa\x9a\xbe\x8bw\x12\x88C\xc0\x0b\xe0\xe2\
-\x1f+\xaa\xda\xa4\xc0\xb9\x00r\xd6-\xe1\x93MM\x8e\
-\x93\xba\xbb\xc1\xee\x0c\x0e\x00\x00\xe6\xcc\x99\xf3\x98\xa8\x9c\
-g\xdd\xd1\x10\x82\xfd<\xaf\xbc\xcc:\x83\xb6\xe1\x10\xb0\
-\x1d\x5c\xfcc\xc7\xf3\xca+\x00y\x85uGC\xa8\x9e\
-\xd3\xd1\xd1\xf1\x84uF\x1c\x88u@\x5c<\xd2\xdf_\
-j\xaa\xd6\x1e\x02\xd0j\xdd\xd2\x00\xc3\x02\xdd\xbfX,\
-\xdec\x1dB\xdb( \x83\xcd+\xce\x82\xe8i\xd6-\
-\xa6\xb8\xf8\xc7\x8e\xeb\xba{C\x9c\xdb\x01\xb4Y\xb74\
-\xc0H\xb5)\xb7p\xd7y\xf3\xd2x\xdd\xd7\xa4q\x07\
-`\xcc\xae\xf3\xe6\xb9P\xfc\xd8\xba\xa3AZ\x03\xc8\x05\
-\xaa\x9a\xc2\xed\xbcd\xe2N\x00\xb8\xf8\xc7\x90\xaa6C\
-r?F:\x17\x7f\x00z!\x17\xff\x7f\xe1\x00\xf0\x0c\
-A\x90[\x03\xa0f\xdd\xd1\x08\x02\x1c\xe2\xfb\x95\xcfX\
-w\xd0\xbfdz\x08\xe0\xe2\x1fK\x9eW^\x09\xe8\xfe\
-\xd6\x1d\x0d2\x02\xd5\xafXG\xc4\x09\x07\x80g\xe8\xec\
-\x9cw?\xa0\x17Yw4\x8aB\xff\xdb\xf7\xfdC\xac\
-;\xe8_29\x04p\xf1\x8f\xa5\xber\xf9P\x08\x96\
-[w4\x8e^X*\x95\x1e\xb1\xae\x88\x13\x0e\x00\xcf\
-\x91s\x9c/\x00H\xeb\xd7C\x9a\x02\xc5E|b`\
-\xbcdj\x08\xe0\xe2\x1fK\xbe\xefO\x93\x9a~\x1f\xa9\
-\xbc\xea\x1f\x000*\xc0j\xeb\x88\xb8\xe1\x00\xf0\x1c\xf9\
-|\xfeA\x01~h\xdd\xd1@{T\xab\xb5t\xde\xf7\
- \xc121\x04p\xf1\x8f\xad\x9a\xca7!\xe8\xb2\xee\
-h\x18\xc1\xf7\x8a\xc5\xe2\xc3\xd6\x19q\xc3\x01`;D\
-\xf0E\x00\xa3\xd6\x1d\x8d\xa2\xc0\xfb<\xcf;\xd1\xba\x83\
-\x9e-\xd5C\x00\x17\xff\xd8\xf2<\xefd\x81\xbe\xd7\xba\
-\xa3\x81F\x84\xe7\xfe\xb7\x8b\x03\xc0v\x14\x0a\x85n\x08\
-\xbeg\xdd\xd1H\x0a9\xbf\xb7\xb7\x7f/\xeb\x0ez\xb6\
-T\x0e\x01\x5c\xfcc\xcb\xf3\xbc}\x14\xa9|*\xea\xbf\
-\x08\xbe\xcfO\xff\xdb\xc7\x01`G\x82\xe0K\x00\x86\xad\
-3\x1ah\xa6\x93\xab]\xea\xba\xeeT\xeb\x10z\xb6T\
-\x0d\x01\x5c\xfcc\xab\xbb\xbb\xbbMU~\x02 \xcd\x0f\
-\x0d\xdb\x1aT\xab\xffc\x1d\x11W\x1c\x00v\xa0T*\
-=\x02\xc59\xd6\x1d\x0d\xf6R\x95\x5c\xba\xa7\xff\x84J\
-\xc5\x10\xc0\xc5?\xd6\xda\xda\xa6|\x1b\x82\xfd\xac;\x1a\
-J\xf1\xf5\xce\xce\xce^\xeb\x8c\xb8\xe2\x00\xf0\x02FG\
-\x87?\x0f`\xd0\xba\xa3\x91\x04\xfa^\xd7\xf7O\xb1\xee\
-\xa0\xe7K\xf4\x10\xc0\xc5?\xd6\xfa<\xef}\x0a\xbc\xcf\
-\xba\xa3\xc16\xb6\xb5\xb5\xac\xb1\x8e\x883\x0e\x00/`\
-\xb7\xddv\xdb$\xd0U\xd6\x1d\x0d\xa7\xf8?\xd7\xfcY\
-kM\x00\x00\x182IDATu\x0f\xb4\xce\xa0\xe7\
-K\xe4\x10\xc0\xc5?\xd6\x5c\xb7r\x98@\xd2\xbe\xbb\x09\
-\x08\xfe\xa7\xbd\xbd\xfdQ\xeb\x8c8\xe3\x000\x8e\xc1\xc1\
-\xc1\xb3\x01<h\xdd\xd1`m\x10\xe7\xb7\xbd\xbd\xbd\x9d\
-\xd6!\xf4|\x89\x1a\x02\xb8\xf8\xc7\xda#\xfd\xfd%\x91\
-\xe0\xe7\x00Z\xac[\x1a\xac\xfb\xc9\xc7\x1f?\xd7:\x22\
-\xee8\x00\x8cc\xd1\xa2E#\x10\xfc\xb7uG\x04\x8a\
-N\xae\xf97\xbc(0\x9e\x121\x04p\xf1\x8f\xb5\xee\
-\xee\xee\xb6\xa6j\xed\xd7\x0a\x94\xac[\x1aM\x05gv\
-uu\xa5\xf9\x22\xeePp\x00\x98\x80b>\xffS\x00\
-\xb7Zw4\x9e\xee\x0f8\xe7\xab*\x9f\x12\x19C\xb1\
-\x1e\x02\xb8\xf8\xc7\x9a\xaaJ\xeb\x94)\xe7\x038\xc8\xba\
-%\x02\x7f-\xe5\xf3\x17[G$\x01\x07\x80\x09\x10\x11\
-\x15\xe8\xe9\xd6\x1d\x91\x10\xbc\xdd\xf3\xca|hPL\xc5\
-r\x08\xe0\xe2\x1f{\x9e\xef\x7f\x1e\x8awZwD \
-\x80\x06\x1f\x13\x11\xfeY\x9c\x00\x0e\x00\x13T,\x16\xaf\
-\x11\xe0\xe7\xd6\x1d\x91\x10\xfc\x8f\xe7\x95\xdfc\x9dA\xdb\
-\x17\xab!\x80\x8b\x7f\xec\xf5y\xde\xfb\x00\xf9\xacuG\
-$\x04\x17\x94J\xa5\x0c\xec\xd6\x86\x83[\xbd\x93P\xa9\
-T\x0a\xd5Zp\x1f\x80]\xac[\x220\x0a\x95\xd7\x97\
-J\xf9?Z\x87\xd0\xf6) \x83\xcd+\xce\x82\xe8i\
-&\x01\x5c\xfcc\xcf\xf3\xbc\xa3\x14r\x05\xd2\x7f\xd1\x1f\
-\x00\xd9$\x08^\x5c,\x16\xfb\xadK\x92\x82;\x00\x93\
-\xd0\xd1\xd1\xe1C\xe5\x0b\xd6\x1d\x11i\x86\xe8%\xbd\xe5\
-r\xbao\x14\x92`\xa6;\x01\x5c\xfcc\xcf\xf7\xfd}\
-\x15\xf2kdb\xf1\x07\x04\xc1g\xb9\xf8O\x0ew\x00\
-&IU\x9b<\xaf|k\xea\xef\xa0\xf5/\x9e@\x0f\
-\xe5\xbd\xb4\xe3+\xf2\x9d\x00.\xfe\xb1\xe7\xba\xee\xae\x10\
-\xe7:\x00\xbbZ\xb7D\xe4\xeeb!\xff\x0a\x11I\xeb\
-\xa3\xdc\x1b\x82;\x00\x93\xb4\xed\x0fXp\x1a\xb2\xf3\xe6\
-WT\xc8e\x9e\xe7\xcd\xb3\x0e\xa1\xed\x8bt'\x80\x8b\
-\x7f\xec\xf5\xf7\xf7\x17!\xce\xd5\xc8\xce\xe2\xaf\xd0\xe0?\
-\xb8\xf8O\x1e\x07\x80\x9dP*\x95\xae\x05\xf4\xc7\xd6\x1d\
-\x11z\x09 \xebzzz\xda\xadCh\xfb\x22\x19\x02\
-\xb8\xf8\xc7^w\xf7\xa6Y\xa3\xb5\xdaZ\x00/\xb2n\
-\x89\x8c\xe2\x82R\xa9t\x9duF\x12q\x00\xd8I9\
-\xc79\x03)\x7fN\xc03)\xf0\xb2\x5cS\xf3e\x03\
-\x03\x033\xad[h\xfb\x1a:\x04p\xf1\x8f\xbd\xfe\xfe\
-\xfe\x19\xadm\xc3W@\xf1r\xeb\x96\x08y\xa3\xa3\xc3\
-\xcb\xac#\x92\x8a\x03\xc0N\xca\xe7\xf3e\x81|\xca\xba\
-#b\x07\x0f\x8f\x8c\xfc\xc1\xf7\xfd4?>4\xd1\x1a\
-2\x04p\xf1\x8f=\xdf\xf7\xa7\x8dVk\xbf\x03p\xb0\
-uK\x94\x04z\xdan\xbb\xed\xb6\xc9\xba#\xa9x\x11\
-`\x9d\x5c\xaf\xbc\x16\xd0\xe3\xad;\xa2$\xc0U\xd5\xea\
-\xe8\x1b\x16,X\xb0\xd5\xba\x85\xb6/\xb4\x0b\x03\xb9\xf8\
-\xc7^\xa5R\x99^\xad\xe9\x1f\x00=\xc2\xba%R\x82\
-_\x97\x0a\x857Yg$\x19w\x00\xeaTmrN\
-\x81`\xb3uG\x94\x148:\xd7\xd4|Y\x7f\x7f\xff\
-\x0c\xeb\x16\xda\xbePv\x02\xb8\xf8\xc7\x9e\xef\xfb\xd3\xaa\
-\xb5\xe0\xb7\x99[\xfc\x81\xc7\x82j\xf5\xe3\xd6\x11I\xc7\
-\x01\xa0N\xbb\xce\x9b\xe7\x22\x903\xad;\x0c\x1c9Z\
-\xab\xf1\x9a\x80\x18\xabk\x08\xe0\xe2\x1f{\xbe\xefO\x0b\
-\x14\xbf\x07\xb0\xd8\xba%r*\xcb:;;{\xad3\
-\x92\x8e\xa7\x00B\xa0\xaa\xe2\xf9\xe5\xab\x90\xc5\x17\x22p\
-\xf3\xe8\xc8\xf0kx\x1e.\xbe\x14\x90\x81\x96e_\x11\
-\xc8\xf2\x89\xfd\xfd\xbaz\xce\xc8\x9a3\xb9\xf8\xc7Ww\
-\xf7\xa6Y\xadS\x86\x7f\x0f\xc5\xab\xad[\xa2\xa6\xc0\xd5\
-\xa5B~)\xef\xf7_?\xee\x00\x84@D4\xe7\xc8\
-\x07\x01l\xb1n1ppsk\xeb\xd5\xbcO@|\
-\x09\xa0sG\xd6\xac\x00\xf4D\x00\x0f\xbf\xc0\xdf\xda\x0d\
-\xc8[\xe6\x8e\xacY\xc1\xc5?\xbe\xfa\xfb\xfb\x8bmm\
-\xc3\xd7dq\xf1\x87`3\x82\xda{\xb9\xf8\x87\x83;\
-\x00!r\xdd\xf2\x87 z\x8eu\x87\x91\xfb\x04z<\
-\xef\x18\x18o\x8a\x95-\x9bZ\x87\x97j\x10,\x85`\
-\xc1\xd8_\xec\x11\xc7Y7{\xb8u\x9d`\xe5\x88q\
-\x22\xbd\x80r\xb9\xfc\xa2Z\xa0\x7f\x04\xb0\x87u\x8b\x09\
-\x95w\x95J\xf9\x8b\xac3\xd2\x82\x03@\xc8\x5c\xd7\xff\
-5\x04\xffn\xdda\xc4\x87\x06\xaf+\x95J\xb7[\x87\
-\x10\xa5\x8d\xe7y\x8bT\xe4\x0a(\xe6[\xb7\xd8\xd0_\
-\x96\x8a\xc5\x13\xac+\xd2\x84\xa7\x00B&\xa2\x1f\x04\xe0\
-Yw\x18)@\x9c?\xf5\xfa\xfe\xd1\xd6!Di\xe2\
-y\xdeQ*r}f\x17\x7fA_\xadZ\xfd\xa0u\
-F\xda\xfc\xff\xed\xdd{\x94\x1ce\x99\xc7\xf1\xdfS=\
-\x93\x09\xe6\x22\x990\xd3Uo\xcf\x80QB\x08\x83H\
-$\xe1\x12X !\x5c\x0d\x02. p Q\x90\xcb\
-.\xc7\xf5r\xd6\xe3eWW]\x8e\xab{\xc4\x03Y\
-]%F\x85 \xe2\x0a\x0a\xe2\x02\x1aB\x02\x0b\x89\x09\
-\x82(\x98@2B\x12&]U\xdd\x93I0\x091\
-3\xd3U\xcf\xfe\x91AE\x03$3\xdd\xfdVu\xfd\
->\xe7\xcc?p\xea\xf4\xf7\x9f\xeez\xf2V\xd5[\x1c\
-\x00\xaa\xcc\xf3\xbc^\xa8|\x00\xd9\xbd\x86:\xdeQ<\
-\xe0\x87\xe1e\xb6C\x88\x1aA\x10\x04\xf3\x15\xf2\x0b(\
-\x0e\xb4\xddb\x89\x8a\xea\xd5\x9d\x9d\x9d\x99\xd9y\xb5^\
-8\x00\xd4\x801\xf9%P\xd4\xff\x15\xad\xc91\x0a\x8a\
-\xef\xfb~\xf8/\xaa\xca\xcbLD\xc3\xa0\xaa\xe2\x07\xc1\
-\x17\x15\xf2=d\xe4\x95\xbe{\xa5X\xe0y\xde\x83\xb6\
-3\x1a\x11\x7f\x9ck\xa4\xbb\xbb\xbbe\xcc\x98q\xab3\
-\xf4\xda\xe0\xbdR\xe0G\xa2\xf1\x07\x8d1Y|B\x82\
-hX\xba\xbb\xbb[\xc6\x8c\x1b\xb7\x08\x8a\xcbm\xb7X\
-\xf6\xe4+;w\x9c4y\xf2\xe4~\xdb!\x8d\x88\x03\
-@\x0d\x05A\xd0\xa5\x90\xd5\x00\xb2\xbew\xfe\x93Q\xa5\
-\xe9\xfc\xce\xce\x83\x8a\xb6C\x88\x92\xae\xb7\xb7\xd7\x1b\x1c\
-\x8c\xee\x86`\xa6\xed\x16\xab\x04/\xe7D\x8e\xc9\xe7\xf3\
-/\xdaNiT\xbc\x04PC\x9e\xe7\xad\x81\xca\xb5\xb6\
-;\x12`zSS\xe5\x89 \x08f\xd8\x0e!J\xb2\
-b\xa94s\xb0\x12=\x95\xf9\x93?\x00\xc4r\x15O\
-\xfe\xb5\xc5\x01\xa0\xc6\xf6<\xb3\xaa\xdf\xb4\xdda\x9b\x02\
-F!\x8f\xf9a\xf8\x11\xdb-DI\xe4\xfb\xa5k$\
-\xd6\xe5\x00<\xdb-\xd6)\x16\x18\x93\xff\x89\xed\x8cF\
-\xc7K\x00u\xd0\xdd\xdd\xdd2f\xec\xb8\xc7\x01L\xb7\
-\xdd\x92\x0c\xba\x18\xaa\xff\xc0\xfb\x02\x88\x80\x0d\x1b6\x8c\
-\x1e=\xfa\x80o(p\xa5\xed\x96\x84\xe0u\xff:\xe1\
-\x00P'A\x10\xbcM!O\x01h\xb5\xdd\x92\x10\xcf\
-\xc6Q\xee\xc2\x8e\x8e\xb6\xf5\xb6C\x88l)\x16\x8bS\
-Dr\xff\x93\xf5\x9b\x85\xffL\xb6\xe5\x1cL\xe7\xd2\x7f\
-}\xf0\x12@\x9dx\x9e\xb7Q\xa0\xf3\x90\xdd\xfd\x01\xfe\
-\xda;\x9d\x5c\xf4\xab \x08.\xb6\x1dBdC\x10\x94\
-\xe6\x89\x93{\x92'\xff?\x89\xa0\xb8\x94'\xff\xfa\xe1\
-\x0a@\x9d\xf9A\xf0E@>k\xbb#I\x14r\xeb\
-\xa8&\xe7\x9f\xda\xda\xdav\xd8n!\xaa\xb5r\xb9<\
-\xb6\x12E\xdf\x00d\x9e\xed\x96$\x11\xc8'</\xff\
-U\xdb\x1dY\xc2\x01\xa0\xce\xf6\xbc:8\xbc\x1b\x90\xf7\
-\xd9nI\x98\x17\x1c\xc1\xe5\xae\xeb\xae\xb2\x1dBT+\
-A\x10\xccP8\xb7\x03:\xc5vK\xa2\x08\xee0\xae\
-\x9b\xf5=\x0f\xea\x8e\x97\x00\xeaLD4\xaaT.\x07\
-\xf0\xa4\xed\x96\x84yG\xacx,\x08J_V\xd5f\
-\xdb1D\xd5\xa4\xaaM\xc5 \xf8\xa4BV\xf0\xe4\xff\
-\xd7\xf4i\xc4\xf15\xb6+\xb2\x88+\x00\x96\xf8\xbe\x7f\
-0\xc4y\x02@\xdevK\x02=!\xd0+=\xcf[\
-c;\x84h\xa4\xc20|g\x0c,\x86\xe2h\xdb-\
-\x09T\xd28\x9aQ(\x14zl\x87d\x11W\x00,\
-1\xc6\xbc\xa4\x8e\xbc\x0f\x00\x1fu\xf9[\xc7*\xe4\xd7\
-AP\xfa,W\x03(\xadT\xb5\xc9\x0f\xc3O\xc5\x8a\
-_\xf1\xe4\xbfW\xfdP\xe7B\x9e\xfc\xed\xe1\x0a\x80e\
-\xbe_\xba\x02\xa2\x8bmw$\xd8\xb3\xd0\xf8Jc\x0c\
-/\x99Pj\x14\x8b\xe5i\xe2\xc4\xb7\x00\xe0\xee\x97{\
-\xa7P\x99oL\xfev\xdb!Y\xc6\x01 \x01|?\
-\xfc\x12\x04\x9f\xb6\xdd\x91`\x15\x81|MD\xbf\xe8\xba\
-\xee+\xb6c\x88^Ooo\xef\xb8\xc1\xc1\xe8\x06\x08\
-\xae\x07\x90\xb3\xdd\x93X\x82\xcf\x18\xd7\xfd\x0f\xdb\x19Y\
-\xc7\x01 \x01\x86\x9e\x0c\xb8\x0d\x90+l\xb7$\x5c\x0f\
-T>fL\xfe\xc7\xb6C\x88\xfeZ1\x0c\xcf\x13\xc5\
-\x7f\x01\xe8\xb4\xdd\x92h\x8aE\xc6\xb8W\xdb\xce \x0e\
-\x00\x89\xa1\xaa\xcdA\x18\xde\x07\xc8Y\xb6[R`9\
-4\xbe\xde\x18\xf3\x9c\xed\x904SU\x01\xf6<\x99b\
-\xbb%\xcd6o\xee=Lr\xd1\x8d\x02\xcc\xb5\xdd\x92\
-|\xfa\x0b\xcfu\xe7\x8aH\xc5v\x09q\x00H\x94\xde\
-\xde\xdeq\x83\x95x9\xa0\xc7\xd8nI\x81~(\xbe\
-\xd6\xd2\xd2\xfc\xe5\x89\x13'n\xb7\x1d\x93\x16K\x97>\
-2C\x1c\x5c\xad\xc0\x19\x00\xcc\xd0\x7f.\x0a\xf0P$\
-\xba\xf0\x8cY\xb3x\xaf\xc5>\xda\xb0a\xdb\x81-\x07\
-\xf4\xff\x1b\x14\xd7\x03\xe0\xcd\xaaoF\xf1\xdb\x96\x96\xe6\
-\x93\xf9}M\x0e\x0e\x00\x09S*\x95\xf2Q\xac+\x01\
-\xbc\xddvKJ\x94\x05\xfa\x05\xd7u\x17\xf2_\x15\xaf\
-o\xe5\xca\x95\x07\xec\xda=\xf0-\x00W\xe0\xf5\xbf\xf7\
-\xaa\xc0\xadcF\x8f\xba~\xe6\xcc\x99\x7f\xacc^\xaa\
-\xa8j.\x08\xca\x1f\x82\xe8\xbf\x03h\xb3\xdd\x93\x12\x1b\
-\xa3J\xd3I\x9d\x9d\x07\x15m\x87\xd0\x9fq\x00H\xa0\
-R\xa9\xf4\x8e(\xd6\x15\xe0\x1e\x01\xfbA\xd7\x0b\xf0\xaf\
-\x9e\xe7\xdde\xbb$i\x86N\xfeK\x81}{\xc7\xbc\
-BV4I<g\xd6\xacY\xbbk\x9c\x96:\xc5R\
-i\x8e\x13\xeb\x8d\x0a\x1ce\xbb%E\xca\x1aG'\x17\
-\x0a\x85u\xb6C\xe8\xb5\xb8\x0f@\x02\xe5\xf3\xf9\x17\xa0\
-\xf1\x5c\x00\x5c*\xdbgr\x98B~\xe4\x07\xa5G}\
-\xdf?\xd9vM\x92\xec\xda=\xf0u\xec\xe3\xc9\x1f\x00\
-\x04zb\xac\xb2\xa0\x86I\xa9\xb39\x0cO\xf3\x83p\
-\xb5\xc4\xfa\x10O\xfe\xfbe\xab#\x98\xc3\x93\x7f2q\
-\x05 \xc1\x8a\xc5\xd2\x89\xe2\xe8/\x00\x8c\xb1\xdd\x926\
-\x02<\x1c;\xf2\xb9B>\xbf\xd2v\x8bM\x0f=\xfa\
-\xe84\x89\xf4I\xec\xff\xb0\x1f;\x88\xdf={\xf6\xec\
-\xdf\xd6\xa2+-\xc20<.\x8eq\x03\x04sl\xb7\
-\xa4\xd0NG0\xc7u\xdd\xd5\xb6Ch\xef\xb8\x02\x90\
-`\x85B~\x85#x/\x00^\x8f\xddO\x0a\x9c&\
-\xb1\xae\xf0\x83\xe0\xe7a\x18\x1eg\xbb\xc7\x16\x89\xe2\xab\
-0\xbc\xef\xb9\x13\xc3\xb9\xb2\xda=i\x11\x04\xc1)\xbe\
-\x1f.\x89\x15\xabx\xf2\x1f\x96\xfeXp>O\xfe\xc9\
-\xc6\x01 \xe1\x5c\xd7]&\xd0\xbf\x070`\xbb%\x9d\
-\xe4\xccX\xb1\xaa\x18\x84\x0f\xfb~\xe9\xccW\x1f}\xcb\
-\x0a\x81\x9c6\x82\xc33w\xe2\x0b\x82\xe0l?\x08\x1e\
-S\xc8#\x10\x9cn\xbb'\xa5\x06\xa1rI\x87\xeb>\
-l;\x84\xde\x18\x07\x80\x14\xf0<\xefA\xa8\x5c\x02\x80\
-w\xb9\x0f\x93\x00\xb3!\xfa\xf3 (=\xed\x87\xe1e\
-\xaa\xdad\xbb\xa9\x1e\x14\xe8\x18\xc1\xe1\x07W-$\xc1\
-T\xb5\xd9\x0f\xc3\xcb\xfc\xa0\xf4\x94B\x1e\x00\xe4$\xdb\
-M)6\x08\x95K\x8d\xc9\xdfk;\x84\xde\x1c\x07\x80\
-\x940&\x7f\x8f\x0a\xae\x00\x10\xd9nI5\xc1\xbb\xa0\
-\xb8#\x08K\xdd\xbe_\xfa\xf8\xa6M\x9b&\xd8N\xaa\
-\xb1\xb1\x96\x8eM\xbc\xcd\x9b7O\xf4\xc3\xf0\xd3A\xa9\
-\xb4\x01\x8a;\x00}\xb7\xed\xa6\x94\x1b\x84\xca%\xdc\xa9\
-3=8\x00\xa4H\xc1u\x7f\xa8\x82\xcb\xc1\x95\x80j\
-x\x1bDol\x1e\xd5\xb2\xd9\xf7\xc3E\xc5by\x9a\
-\xed \xaa\x8f0\x0c\x8f\xf4\xc3\xf0\x16'\xd7\xd4\x03\xc5\
-\x97\xa0(\xd8nj\x00\x03Py\xbf1\xf9\x9f\xd8\x0e\
-\xa1}\x97\x89e\xd0FRp\xdd\x1f\xfa~\xa9\x1f\xa2\
-?\x040\xcavO\x03x\x0b\x04W\x89\xc4W\xf9~\
-\xb8\x12\x90oF\xd1\xc0\x8f;;;y\xe3e\x03)\
-\x97\xcbc\x07\xe3\xf8bG\xf1\xa1Xq\x82\xed\x9e\x06\
-3\xa0\x82\x8b\x0b^\xfe\xa7\xb6Ch\xffp\x05 \x85\
-\x8c\xc9\xdf\x03u\xce\x03\x9f\x0e\xa8.\xc1L\x88\xde\x9e\
-kj\x0e\xfd X\x5c,\x95\xe6d\xed\xa6\xc1F\xe3\
-\xfb\xfe1\xbe\x1f\xde\x5c\x89\xf4%Q|G\xc1\x93\x7f\
-\x95\x0d@\xe5\xfd\x05\xd7\xe5\xc9?\x85\xf8\xe3\x96ba\
-\x18\xce\x8e\x15\xf7\x81\xfb\x04\xd4\x90\xac\x83\xe8m\x88\xe3\
-\x1f\x18c6\xd9\xae\xd9_K\x97=2\xa2\x17\xfd\xcc\
-\x99}j\xea~#z\xca\xe5\xc9M\x91^\xaa\xd0K\
-\x00L\xb5\xdd\xd3\xc0v\x09\xf4B\xcf\xf3\x1e\xb4\x1dB\
-\xc3\x93\xba/7\xbd\xd6\xd0fA\xf7\x03x\xab\xed\x96\
-\x0cX\xab\xd0\xbb\xe2\x5c\xee\xfb\x9d\xed\xed\xbf\xb7\x1d\xb3\
-/\xb22\x00\xbc\xd4\xdbk\x9a\xa2\xe8\x22\x00\x17A1\
-\x13\xfcm\xab-\xc1\xcb\x88\x9ds\x8di\x7f\xdcv\x0a\
-\x0d\x1f\xbf$\x0d\xc0\xf7\xfd\xe9\x10\xe7\x01\xf0\xc5$\xf5\
-\xa2\x02\xacR\x95\xbb\xa3&\xf9Yg{{\xb7\xed\xa0\
-\xd7\xd3\xc8\x03\x80\xef\xfbS\xe18\xe7\x89\xe2\xbd\x0a\x1c\
-\x07^\xd2\xac\x97\xc0\x11\x9c\xe9\xba\xee\xb3\xb6Chd\
-\x12\xfb\xe5\xa6\xfd\xd3S.O\xceE\xf1\xcf\xc1\xb7\x08\
-Z\xa0\xeb!r\x7f\x0c\xdc_\xc8\xe7\xffOD\x06m\
-\x17\xbd\xaa\x91\x06\x00Um\x0e\xc3pf\x0c\xcc\x15\x95\
-\xf3 \x98l\xbb)\x83^\xc89rF>\x9f\x7f\xd1\
-v\x08\x8d\x5cb\xbe\xdc4r{^%\x8c\xfb\x01=\
-\xc6vK\x86m\x87`\x99\x02\xcb\x1c\xd5e\xae\xeb\xae\
-\x15\x91\x11\x9d\x84G\x22\xed\x03@\x10\x04G\xa8\xc8\xe9\
-\xaa\x98#\xc0\xa9h\xf0\xbd\x09\x92L\x80gr9\xe7\
-\xcc\xf6\xf6\xf6\xd0v\x0bU\x07\x07\x80\x06S.\x97\xc7\
-V\xa2\xe8n@\xce\xb4\xddB\x00\x80\x92\x00\xcbUe\
-\xb9H\xbc\xc2u\xdd\xe7D$\xae\xd7\x87\xa7i\x00P\
-\xd5\xdc\xe6r\xb9\xab)\xc6\x89\x8a\xf8\x04\x81\x9c\xa6\x80\
-\xa9\xd7\xe7\xd3\x1bZ\xde\xbf\xbb\xe5}\x93&Mx\xd9\
-v\x08U\x0f\x07\x80\x06\xa4\xaa\xcdA\x18.\x02d\x9e\
-\xed\x16\xfa\x1b\xdb\xa1X\x0d\xd1U\x02\xacV\xd5\xd5\xc6\
-\x98-\xb5\xfa\xb0$\x0f\x00\xe5r\xd9\x8d\xa2h\x1a\xe0\
-\x1c\xab\xa23\xa18\x1e\xc0\xf8Z}\x1e\x0d\x97\xdc\xb6\
-m\xeb\x96k\xba\xba\xba\xf8>\x92\x06\xc3\x8d\x80\x1a\x90\
-\x88\x0c\xaa\xea\x07\x82\xa0T\x84\xe0\xd3\xb6{\xe85\xc6\
-\xefy\xc9\x8c\x9c\xae\x00 \x02?\x0c\x8bPyF\x80\
-gT\xf4\x19\x07x6\x9f\xcf?\x9f\xa4{\x09F\xa2\
-\xbb\xbb\xbbe\xec\xd8\xb1\x87\x02\xe8R\x95i\x10=\x1a\
-\x90\xa3+Q\xec\xee\xf97\x88\x02\xd6.\x92\xd0\x1bP\
-(>gL\xfe\x06\xdb!T\x1b\x1c\x00\x1a\xd4\xd0u\
-\xe7\xcf\x04A\xe9y\x85.\x04\xd0b\xbb\x89^\x87\xa2\
-\x00hA\x81\xb3\xa1@\x0c \x08K\x95 \x087*\
-\xf4\xf7\x02\xf9\xbd\x0a\xbaE\xb5[U7677o\
-nkk\xdba;\xfb/\xf5\xf5\xf5\x8d\x1f\x18\x18\xe8\
-\x04p\x08\xe0\x1c\xa2\xaaS :\x05\x90\xc3\x00\x1c\xa2\
-@\x0e\xc0\xd0\x9a#\x17\x1eS\xa0_\x05\x1f,x\xee\
-\x9d\xb6C\xa8v\xf8M\xcc\x80\xcd\xa5\xd2\x09N\xac?\
-\x01\xe0\xdan\xa1\xaa\xd9\x09\xa0G\x00_\xa1E\x00\xbd\
-\x10\xd9\x8aX\xb6\x8a\xc4[c\xc7\xd9*Q\xb4m\xed\
-\xf3\xeb\x9f\x1c\xc9\x87\x1cq\xf8a\xd3Ed\xbc\xaa3\
-\x01\xc0Ap\xf4 \xa8N\x04\x9c\x89\x80\xb6\x018\x04\
-@'\xb8t\xdfH\xb6@\x9d\x0b\xf8\x8c\x7f\xe3\xe3\x00\
-\x90\x11\xc5b\xb1S\x1c\xe7\xa7\x80\xf0\xa57\x19\xb2\xf6\
-\xb9\xe7Gt\xfc\x11S\x0f\xafR\x09\xa5\xc4\x9a(\xe7\
-\x9c\x9f\x96\x8d\xaehd\xb8qFF\x14\x0a\x85\x9e\xfe\
-\xdd\xbbgB\xf1\x03\xdb-D\x94<\x02\xdc\xd72\xaa\
-y&O\xfe\xd9\xc1\x01 C&M\x9a\xb4\xdb\xf3\xf2\
-\x97+\xf4\x0b\xe0mWD\xb4G\xa4\xd0O\xban\xfe\
-\xfc\x89\x13'n\xb7\x1dC\xf5\xc3\x01 cDD\x0b\
-\x9e\xf7y\x81\xce\x05\xb0\xd5v\x0f\x11Y\xd5\x07\x95s\
-\x0a\x9e\xf7\x9f67\xac\x22;8\x00d\x94\xe7y\x0f\
-h\x1c\x1d\xad\xc0*\xdb-Dd\x81\xe07\x8e`\x86\
-1\xf9%\xb6S\xc8\x0e\x0e\x00\x19V(\x14zv\xed\
-\xdcq\xaaB\xfe\xdbv\x0b\x11\xd5\x91`a488\
-\xd3u\xdd\x0d\xb6S\xc8\x1e\xee\x03\x90q\x93'O\xee\
-\x07p\xbd\x1f\x86+\xa0\xb8\x05\xdck\x9d\xa8\x91mW\
-\xc1u\x05\x97\xcf\xf7\x13W\x00h\x88q\xdd\x1f\x08\xf4\
-8\x01\x9e\xb1\xddBD5\xf1D\xce\x91i<\xf9\xd3\
-\xab8\x00\xd0\x9fx\x9e\xb7v\xe7\xce\x1d\xc7\x0a\xe4+\
-\xd8\xb3!\x1d\x11\xa5\x9fB\xb1`\xdb\xd6\xbe\xbf\xe3k\
-|\xe9/\xf1\x12\x00\xbd\xc6\xd0%\x81O\xf9~i\x19\
-Do\x05\xe0YN\x22\xa2\xe1+\x0b\xf4\x83\x9e\xf1\x1e\
-\xb0\x1dB\xc9\xc3\x15\x00\xda+c\xf2K\xa0\xf1Q\x10\
-\xdck\xbb\x85\x88\x86\xe5\xfe\xe6\xa6\xdc\xd1\x9e\xc7\x93?\
-\xed\x1d\x07\x00z]\xc6\x98-\xc6u/\x80\xe2\x1a\x00\
-\xaf\xd8\xee!\xa2}!\xdb\xa0r\xb9\xf1\xdc\xb9mm\
-m\x81\xed\x1aJ.\x0e\x00\xf4\xa6\x8cq\xbf-\xd0#\
-\xa1Xj\xbb\x85\x88\xde\x80`I\x1c\x0d\x1eeL\xfe\
-\x0e\xdb)\x94|\x1c\x00h\x9fx\x9e\xb7\xd1\xf3\xf2g\
-\x08d>\xb8\x83 Q\xd2\xec\x82\xe0\xa3^>\x7fV\
-GG\xc7f\xdb1\x94\x0e\x1c\x00h\x9f\x89\x88z^\
-~qsS\xeeH\xde\x1b@\x94\x18\x0f@\xe3#\x8c\
-\xeb\xde\xcc\xed|i\x7fp\x00\xa0\xfd\xd6\xd6\xd6\x16\x18\
-\xd7\xbd@\xa0\x17\x03\xd8b\xbb\x87(\xa3B\x81\xcc7\
-\x9e\xfb\x1ec\xcc&\xdb1\x94>\x1c\x00h\xd8<\xcf\
-\xbb\xcb\x11t\x01r\x1b\xf8vA\xa2z\x89!\xb8\xa5\
-\x7fw\xcbT\xcf\xcb/\xb6\x1dC\xe9\xc5\x01\x80F\xc4\
-u\xdd\xb2\xf1\xf2\x1f\x80:'s\x17A\xa2\x1aSt\
-\x0bt\x8eq\xdd\xeb&M\x9a\xf0\xb2\xed\x1cJ7\x0e\
-\x00T\x15\xc6\xb4?\xee\xba\xf9c\xa0\xf8\x18\x00\xbeS\
-\x9c\xa8\xba\xb6\x0b\xe4\x13\xdb\xb6\xf5\x1d\xe9y\xder\xdb\
-1\xd4\x188\x00P\xd5\x88H\xc5\x18\xf7\xa6\xa6\x9c3\
-\x05\xd0\xdb\xc1\xcb\x02D#\x15\x03z{S\xce\x99\xe2\
-y\xf9\xafvuu\x0d\xd8\x0e\xa2\xc6\xc1\x01\x80\xaa\xae\
-\xbd\xbd=4\x9e7\x0f\xea\x9c\x0c\xe0\x09\xdb=D\xe9\
-\xa4\x8fA\xe3\x19\xc6\xf3\xe6\xb5\xb7\xb7\x87\xb6k\xa8\xf1\
-p\x00\xa0\x9a1\xa6\xfdq\xcf\xcd\x1f?\xf4\xb4\xc0\x0b\
-\xb6{\x88\xd2A6\x0bd\xbe\xe7\xba\xa7\x18c~m\
-\xbb\x86\x1a\x17\x07\x00\xaa\xa9={\x07xwyn~\
-*T\xae\x05\xd0k\xbb\x89(\xa1\xb6*\xf4SQe\
-\xe00\xcf\xcb/\xe63\xfdTk\x1c\x00\xa8.Dd\
-\xd0\x98\xfc\xc28\xaaL\x85\xe0&\x00\xfd\xb6\x9b\x88\x12\
-b'\x047\x8cn\x19\xf5\xf6\x82\xe7}\xa5\xb3\xb3\xf3\
-\x8f\xb6\x83(\x1b8\x00P]utt\xf4\x19\xd7\xfd\
-\x98\xc6\xd1d(\x16\x00\xd8m\xbb\x89\xc8\x92A\x08\x16\
-67\xe5\x0e3\xae\xfb\xd9\xd6\xd6\xd6?\xd8\x0e\xa2l\
-\xe1\x00@V\x14\x0a\x85\x1ec\xdc\x8f\x08t*\x14\x8b\
-\x00\x0c\xdan\x22\xaa\x93\x0a\xa0\x8b\x1d\xc1\x14\xe3\xba\xd7\
-\xf2\x8d}d\x0b\x07\x00\xb2\xca\xf3\xbc\x8d\xc6\xb8WC\
-\xe3\xc9\x10,\x04P\xb1\xddDT#\x03\x80\xde\x1eG\
-\xb9.\xe3y\xf3]\xd7\xdd`;\x88\xb2\x8d\x03\x00%\
-\x821f\x93q\xddk\xa3\x9c3uh\x10\xe0=\x02\
-\xd4(vA\xb1 \x8e*\xef0\x9e7\xaf\xa3\xa3m\
-\xbd\xed \x22\x00\x10\xdb\x01D{\x13\x86a{\xa4\xfa\
-\x8f\x02\xf90\x80V\xdb=i\xb5\xf6\xb9\xe7Gt\xfc\
-\x11S\x0f\xafRI&\xed\x84\xe2\xbb\xcd\xcd\xb9/s\
-\x99\x9f\x92\x88\x03\x00%Zoo\xef\xb8J%\xbeF\
-\x81\x8f\x02\xdaa\xbb'm8\x00X\xf1\x92@\xbf\xbe\
-{\xf7\xe8os\xbf~J2\x0e\x00\x94\x0ak\xd6\xac\
-\x19\xd5\xda\xdaz\x99\xc2\xf90\xa0\xef\xb6\xdd\x93\x16\x1c\
-\x00\xeaH\xb1RDor]\xf7\x1e\x11\xe1\xbd,\x94\
-x\x1c\x00(u|\xdf?\x06\x8es\x0d\x14W\x008\
-\xc0vO\x92q\x00\xa8\xb9A@\xeeU\x077\x15\xf2\
-\xf9\x95\xb6c\x88\xf6\x07\x07\x00J\xad0\x0c\xdbc\xe0\
-*(\xae\x03p\xb0\xed\x9e$\xe2\x00P3\x9b\x04\xf2\
-\xbd\xc1&\xe7\xdb\x07\xb7\xb5\xf9\xb6c\x88\x86\x83\x03\x00\
-\xa5\x9e\xaa\xe6\x82\xa0|\xae\x88^\xa9\xc0\xd9\x00\x9al\
-7%\x05\x07\x80\xaa\x1a\x00\xe4>(\x16y^\xfbC\
-\x22\x12\xdb\x0e\x22\x1a\x09\xfePR\xea\x89H\x04\xe0^\
-\x00\xf7\xf6\xf4\xf4\xb4\xe6r\xa3.\x84\xc4\xd7\x012\xcd\
-v\x1b5\x02]\xaf\xc0ws\x22\xdfs\xdd|\xd9v\
-\x0dQ\xb5p\x05\x80\x1aV\x10\x043b8\xf3\x05z\
-)2\xfa(!W\x00\x86\xad,\xc0\x8fbG\xee\xe4\
-\xb5}jT\x1c\x00\xa8\xe1uww\xb7\xbce\xdc\xb8\
-\xb3\x04\xb8\x08\x8as\x01\x8c\xb7\xddT/\x1c\x00\xf6\xcb\
-v@\xee\x81\xe2N\xcfk_:\xb4\xb2D\xd4\xb08\
-\x00P\xa6l\xd8\xb0atK\xcb[\xce\x02\xf4\x22\x08\
-\xce\x050\xcevS-q\x00xS\xbb\x00}\x10\xea\
-\xdc\xd9\xdf\xbf\xeb\xfeI\x93&\xf1\xe5T\x94\x19\x1c\x00\
-(\xb3\x86\x86\x81\xb3!\xf1\x05\x80\x9c\x0d\xe0 \xdbM\
-\xd5\xc6\x01`\xafJP\xfcL\x1d\xdc\x17\x0f\x0e.\xe5\
-\xebw)\xab8\x00\x10\x01PU'\x08\x82i*r\
-\xae\xc0\x99;\xb4\xd9P\xea\xbf\x1f\x1c\x00\xfe\xe4E(\
-\xfeWs\xf23\xd3\xde\xfe\x087\xea!\xe2S\x00D\
-\x00\x80\xa1G\xba\x9e\x1a\xfa\xfb|\xb1X\xec\x14iz\
-\x8f\x88\x9e\xa3\xc0)\xc8\xd0}\x03\x0db+ \xcb\xa0\
-X\x9a\xcb\xe1\xa1|>\xff\xa2\xed \xa2\xa4I\xfd\xbf\
-p\x88jm\xcf>\x03\xc1\xd1p\x9c\x93\xa0r\x22\xa0\
-g\x00x\xab\xed\xae}\x91\xa1\x15\x80\x0a \xbf\x15`\
-i\xec`\xa9io\x7fTD\x06mG\x11%\x19W\
-\x00\x88\xde\xc4\xd0\xdd\xe0\xaf\xae\x0e\xdc\xbcf\xcd\x9aQ\
-\x13&\xb4\x1d+\xa2\xb3\x15\xf1\x09\x109\x1e\x8a\x03-\
-gfM\x9f\x02\xbf\x14\xc1/Eu\x85\xaa\xfe\xca\x18\
-\xb3\xcbv\x14Q\x9ap\x05\x80h\x84TU\x82 \x98\
-\x22\x22\xc7+p\x1cTN\x80\xa0\x0b\x09\x18\xb0\x1bd\
-\x05\xa0\x02`\x1d\x14\xabTt\x85\xa8\xfe\xd2\xf3\xbcu\
-\x22\xa2\xb6\xc3\x88\xd2\xcc\xfa\x0f\x14Q\xda\x0d\x9d\x88\x9e\
-\x1f\xfa\xbb\x15\x00\xc20\x1c\x13\xc7\xce4\x91\xe8(\x15\
-9J\x14G)p$\x1a\xfc\xb1\xc3*\xd8\xa5\xc03\
-\x02\xfd\x0d\xd4yZ$~\xbaR\xa9\xfc\x8ew\xea\x13\
-U\x1f\x07\x00\xa2\x1ap]\xf7\x15\x00\x8f\x0f\xfd\x01\xd8\
-\xb3RP.\x97'E\x11\xde%\x82#U\xf5p\x08\
-\x0e\x05p(\xb2\xb7S\xe1V\x05\xd6\x0bd\x1dD\xd7\
-!\x96\xf5@\xb4\xd6\xf3\xbc\xf5\xdc\x80\x87\xa8>8\x00\
-\x10\xd5\xc9\xd0J\xc1\x8bC\x7f\xf7\xfc\xe5\xff\xeb\xe9\xe9\
-imnn\x9e\x1c\xc7r\xa8J<Y\x80I\x02)\
-(`\x00t\x02\x18k!y$v\x01\xd8\x04A\x8f\
-(6\x03\xf2\x12\x10o\x8ac\xa7[$Zg\x8c\xd9\
-b;\x90(\xeb8\x00\x10%@gg\xe7V\x00\xab\
-\x87\xfe\xfeFoo\xef\xb8J\xa5\xd2\x19;\x8eqb\
-\x18\x00m\xaa\xda\x0a\xd1\x09\x02iUE+D&\x02\
-\xda\x0a\xc8[\x01=\x00\xc0\xe8*\xe5\xed\x000\x00\xe0\
-\x0f\xd8sb\xef\x03t\x0b\x80^\x88\xf4!F\x1f \
-[D\xe2\xbe(\xca\xf9\xc0@OGGG_\x95>\
-\x9b\x88j\x847\x01\x125\xb0\xa5\xcb\x1e\x19\xd1\x8dr\
-sf\x9f\xca\xdf\x08\xa2\x06\xe5\xd8\x0e \x22\x22\xa2\xfa\
-\xe3\x00@DD\x94A\x1c\x00\x88\x88\x882\x88\x03\x00\
-\x11\x11Q\x06q\x00 \x22\x22\xca \x0e\x00DDD\
-\x19\xc4\x01\x80\x88\x88(\x838\x00\x10\x11\x11e\x10\x07\
-\x00\x22\x22\xa2\x0c\xe2\x00@DD\x94A\x1c\x00\x88\x88\
-\x882\x88\x03\x00\x11\x11Q\x06q\x00 \x22\x22\xca \
-\x0e\x00DDD\x19\xc4\x01\x80\xa8\xb1\xed\x18\xc1\xb1\xdb\
-\xabVAD\x89\xc3\x01\x80\xa8\xb1\xf5\x0c\xf7@\x01^\
-\xaaf\x08\x11%\x0b\x07\x00\xa2F\xa6\xfa\xd0\xb0\x0f\x05\
-\x96T3\x85\x88\x92\x85\x03\x00Q\x03\x8b\x1c,\x02\x10\
-\x0d\xe7P\xc4\xcew\xaa\xddCD\xc9\xc1\x01\x80\xa8\x81\
-\x9d9k\xd6\xef\x00\xfd\xd60\x0e\xfd\xc6\x9c9'\xaf\
-\xadz\x10\x11%\x06\x07\x00\xa2\x06\xb7uK\xfb\xc7\x05\
-\xf2\xf0~\x1c\xb2\xf4\xc0\xf1c\xff\xb9fAD\x94\x08\
-\x1c\x00\x88\x1a\xdc\xc5\x17w\x0d\xf4m9\xe8\x1c\x15\xf9\
-:\xde\xf8r@\x04`\xc1\x81\xe3\xc7\x9e3}\xfa\xf4\
-\xc1:\xe5\x11\x91%b;\x80\x88\xeag\xd9\xb2e]\
-\x0a\xe7*\x00\xa7+\xf06\x00\x10`\xa3\x02K\x10;\
-\xdf\xe1\xb2?\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\
-\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\
-\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\
-\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\
-\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\
-\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\
-\x11\x11\x11\x11%\xc1\xff\x03\x89\xdc\xd6\x1d\x9b\x82rD\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x04\x0fIDATH\xc7\xb5\
+\x96KL\x94W\x18\x86\x9f\xf7\x9c\x1f\x81R\x8b\x5c\x06\
+\xb9\x8c\xb0h\xd0\xda\xa1Q\x17\xba\xc14)5i\xf7\
+\x15t\xe7\xb6\xa9\x0b\x5c`\xaa+W\x0d!\xba\xd0M\
+m\xec\xca];\xd0\x8d\xc6\x85E\xc1\xd4\xb2\xae\x0b\xc7\
+\xb6N\x14\xe52\x83\x8c\x8cR\xa4\x0a\xc3\xff\x7f]\x08\
+\x0a*E\x9a\xf4\xacNN\xbe\xdb\xfb]\xde\xef\xc0:\
+N2\x99,M&\x93\xa5\xeb\xd1\x09\xd6#\x5c\x11\x8b\
+\xb5.^\xaf\xbc\xad\x8e\xd6\x12\x18\xcb\xe5\xb6\xba\xd0\xda\
+\xb1p\xd7\xd4T>!\xc9\xaa*\xabR&\xbb\x11y\
+\xdf\x1b\x8f\xc5n\xaf\xdb\x81\x99\xf9\xf1\x89\x89\x8f\x9d\xa9\
+\x13\xf1\x19P\x02\xd8\xe3\xc7\xd3\x00l\xdaT\xbe\xa4\xfb\
+\xcc\x8c\xcbN\xfe\xf4\xf5\xeb\xd5\xd7;:\x14\xae\xe9 \
+\x9dN\x17\x97\x95\xbd\xb7\xdf\x88\xba%m1\xb3y'\
+\xfd\x0a\xa4&\x1eL\xc6A\xd4n\x8e\x8d\x01\x89\xc8l\
+\xaf\xa4\x0d\xc0\x08\xe2\xf8\xec\xcc\xccO\xcd\xcd\xcds\xab\
+\xd6\xc0\xcc|6;\xb9\x1fY\xb7P\x1c\xb8\x85q\xca\
+\x88\x06\xc20\x9c\x9c\xc8?l\x04\xa8\xae\xda4\xe2\xbd\
+\xafqR\x9baGA\x1f`t\x97m\xdcH2i\
+?.G\xb2\x02A6\x9b\xfd\xc4\x8c\xf3Hq\x83>\
+Yt\xb4\xbe\xbe\xfe\xfe\xbf\xe58\x93\xc94!\x9d\x02\
+}\x01\x8c\x0a;TWWw\xed\x8d\x08\x228\x22i\
+\x0bpk\xc9\xf8$_\xbd\xbb\x81wb\xf3\xfc\x9d\xab\
+\xe1\xdb'\x00Ko\xe5\x94\xe5T_\x7f?\x93\xc9t\
+!%\x80\xed&u\x02\xd7^C0>>\xbeM\xce\
+\xdf03\x87\xf1e}\xc3w\xe7\xf3\xc1\x93O\xc1\x1f\
+\x91T\x1f\x99\x8d\xb9\x05\xf5\x00D\x81}-i\x0bf\
+\xe3\xc0\xe9\xca\x85\xd2\xab\x13\xd9\xc3\x87\x8c\xe8,`Q\
+\xb8\xb0#\x1e\x8f\xdf^\x81@\xf2\xed@\x89\x93\x06\x8c\
+h\xe0\x013{\x8a\x14|\x8f\xd4d\x80\xa4\x9d\x14\xf1\
+\xf9sY\x05\x8bJ;d\x96\xc83s\xf0\xa9-\x0c\
+\x14\xcb\x0d\x09\xda\x5c\x10\xb4\x03\xdf\x00\xb8\x97\xfdd;\
+\x01\x03Ra\x18N\x06\xce\xef\x06\x1aW4\x81\x08L\
+\xaf4\x064\x9a\xf3\xbb\x8b\xc2p\xd2A\x0a0\x99v\
+\xbe\xa8A2\x99,\xad\x88\xd5\xb5NM\xe5\x13\xde\x07\
+\xcc\xcd\xcd\xc5'\xf2\x0f\x1b\xf7xy$\xad=\xaa\x92\
+<\xfef:\xddX[Y\x1d/))\xb10\x5cH\
+\xf4\x0f\x0e\xee{\x94\xcb\x0d\xb9U\xf5\x0a\x85\xab\x98\xa5\
+0\xa2U\x8d\x1b\x11FJ\x85\xc2\xd5\xe5\x8ff\xf6\x22\
+\xb0\xa0\xa3\xa3\xe3)p%\x93\xcd\xa6@\xdb\x04c\xd5\
+U\x15#\x15\xcc.\xe4\xa3\xf2\x13\xe6\xe8\x11z\xff\xcd\
+\xf6mX\x91\x9d\xa8`\xf6\x8f\x96\xe6\xe6 \x08\x8a\xc6\
+\x0c\x04\x96\xfa\xa8%q\xe5\x95\x1a\xf8\xdf\x16\xbb*\xe1\
+\xbd\xaf\x11\xe7\x0a\xd9\xf0\xdeE\x17\xa9\x13\xb3\xd97\xf0\
+\xc9\xac\x8b\xd4\x99\x0d\xef]\x14\xe7\x0a\x05\xefk\x22H\
+\x00Z\xb4\xc5\x0a\x07\x16\x16\xfa\x80g\x91\xd9^3\xb5\
+\x01\xb4\xd0;_\x19\xf6\x5cR\xa4\x03fvg1%\
+\x91\x99\xddQ\xa4\x03\x95a\xcf\xa5\x16z\xe7\x01\x8aM\
+m\x82V\xe0Y\xe4\xd5\xfb\x9a\x83\x86\x86\x86?-\xb2\
+\x9f%m\x90SW&\x93iz1\xad\xe1\xdd~E\
+\x1c3l\xf8yZ8\x96\x09\xef\xf6/\x9ff9u\
+\x01\xc5\x18\x97\x973\xec\x8a\x22\x9b\xe3\xb4\x99\x8d>\x9f\
+Hwr\xc9I\x0b\xbd\xf3\xd9p\xf8\x82,<,\xd3\
+\xe1l8|a)\xf2L&\xd3dr'\x81\xedf\
+6\x1a\xc9\xce\xac\xca\xa6\x8bdw\x10Y7\x10\x07~\
+\xb7\xc8N\xcd\xc9\x06\x8a\xc2p\xf2f:\xdd\x08\xd0\xd2\
+\xdc<R\xf0\xbe\xa6\xd8\xacM\xcew\x01\xdb\x811L\
+\xc7\xeb\xeaj~\x90^\x92]\xf0JK\x87\xe9t\xba\
+\xaf\xac\xec=\x16\xe9\xfaC9\x9d-FC.p\xa9\
+\xda\xca\xea8@\x10\x14\x8d9HH\xb4\x02\xc5f6\
+*\xdc\xf1\xd9\xd9\xbf\xfa\xa4\xcd\xe1\x7f^8\xd3\xd3\xd3\
+\x06P^^\xae\xa5\x85\x83q9\x92\x9di\xa8\xad\xfd\
+ey\xe4o\xbd2s\xb9\xdc\xd6B\x18\xb6c\xb6k\
+j*\x9f\x00\xa8\xaa\xaaLa\xbaQT\xe4\x93\xb15\
+V\xe6\xbaN\xff\xe0\xe0\xbe\xfe\xc1\xc1}\xff\xdb\xaf\xe2\
+Q.7\xb4\xde\xa0\xfe\x01Bh\xf3\xd3\xfc@\xb0=\
 \x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x939\
-\x00\
-\x02\xb9\x08x\xda\xec\x1d\x07`\x13U\xfb\xd2\xcd,{\
-\xc8(S\x90)\x82\x80\x02\xb2\x1c\xe0\x00d\xc9\x90!\
-.\x1cl(e\xd92\x7f\x15\x10T\x10\x9c\x80\x88\x80\
-\x08\xa2\xb2\xbbR\xb6\x80\xec2;\xd26\xc9]\x92.\
-v\x99\xf9\xdfw\xf7]\xf2r\xb9$\x974)-\xf6\
-\xc1\xd7\x5c.wo|\xef{\xdf{\xef{\xdf`\x18\
-\x15S\x82)W\x8e!\x9fu\x98\xd1\x01\x0c\xf3\x0d\xc3\
-0\xd5\xaa\x09\xdf?-\xc10\x0f\xc8\xbd:u\x84\xef\
-\x1b\xc8s\x0b\xca2\xcc\x93O\xe2\xf7\x86\x0c\xd3\x22\x8c\
-a\xbat\x11\xbe7\xee\xc60\xe7\x9eg\x98\x1e=\xf0\
-\xfd\xfe\xe4\xfd\x05\x0c3r$>\xbf\x8c\xbc\x7f\x99a\
-\xa2\xa2\xf0\xf9\x10\x15\xd3b\xbc\x8a\x81\x04\xdf\xff\x22\xf9\
-\x0c\x8c\xf0c\x1a\x93\xef\xa4(rG\xb8\xcf'R\x8f\
-}e\x05\x90&N\xa7c8Vo\x81\xb4\xd4\x14f\
-\xf7\x8em\xe5\x00\xe0\x9a\xfe\x8d5\xe8m\xdf\xa5~\xe3\
-X\x16>\x1b\x1a\x0d\xdc\xb0\x0b\xe7\x12W\x01\xc05\xdc\
-\xb3}N\xc8C\xafg\xe9{\xe5\x09\xcc&\xa05p\
-\xec\xb5\xa4\xcb\x97\xb2\x01\xe0\x1a\xee\xe1o\xe5\xc5\xe7\x8d\
-\xb6\xf9\xc1\xfd_\x09\xdc\x22\xb0\xc6hd\xbb\x9e>s\
-\xf49\x00\xb8\x86{\xf8\xdb\xaft\x1e\x14\xcc\xc6\xdf'\
-\xdc2\xeb\x02\xae\xde\xd31STY\x83\x00\xae\xdd\xd7\
-1p\x0f~\xc3gfK\xdem\x88\xf5[\x03\xcf]\
-:\xca2S\x83\xb2F\x12\xc8A\x18\x99t\x9c\x15\xf3\
-X\x83\xcf6\x14\xf1\x0c\xf8\x816\x1a\x0dl\xd7\x07f\
-\x9d\xf8n6\x013\x02\x5c\x8f4\x93\xdf\xe0\x19\xe1Y\
-n\x18\xdfG;\xb7\x95\x03\x1c\x03\x9e\xce\x9c;\xd2i\
-\xb2*\xeb\x15\xc9\xbb\x96<\xe07x\x06\x9e\x85w\xf8\
-\xfe\xa5\xde?y\xe2X\x97p\xff\xac\xefe\xde\xe5\x01\
-~\x83g\xf0\xfd\x9fD\xda\x10\xeb\x9f}\x85\xed<\x89\
-\xc9\x1aG\xbds\x0d\x81\xff\x0e\xbf\xc13t\xfdi\xfc\
-\x198\xfd\xea\xaf:\x98*\x85\x07d\x8d'\xcf\xaf$\
-\xf0*\xc2\xb7\xe4\xde\x84\xaf:\x9a*\x91gl\xf0'\
-\xed?\x83A?\xdelN\xf6;\xbd\x87eV\x0d\xe2\
-x8\x13\xcb2fs\x8a\x1f\xf9M\xec\xbf(\x99\xfe\
-\xb7\xa1\x1f\x03\xc1\xf3\x89\xe3\xc7\xba\x00\xc0\xb5#\xfaa\
-9\xb7\xe87\xca\xe6]\x1c\x03.\xc6\xcfO\xd6\xf1\xc3\
-\xda\x8d\x1f\xcb\x18\xd4\xeb\xed\xc7\xefN\xf9\xf1k\xa4\xde\
-U\xfb\x13^\xa2b\xdcN\xf0\x0e\xbc\x0b|\x86\xb0:\
-\xe6I\x9a\xcf\x94p\xccg\xe4\x12]\xb7\xb3\xa7O1\
-\xb1\xd1\xbb\x03\x00\xe0\xdaQ{\xdd\xcdW\x84\xe7;?\
-\xc3\xecU\xc7\xf5\x02\xe8\xd6\xa9\xbd\xec3\xae\xd2\x94)\
-\x93\xa5\xef\x04\x13x\x86\xc0t\xd2\xd7\xeb\x13\xcf\x9e>\
-\x0f\x00\xd7p\x0f\x7f\x0b\xa6\xdf\x99<i\x92l\xde\xe1\
-\xe1S\xa4y\xb7#\xb0\x91@\x0e\x013\xc9\xd3|\xf1\
-\xfc9\x1e\xe0\x1a\xee\xe1o\x1b\xf1Y\xcb\xbb\xe3\xc6\x8d\
-u\x86\x13?\x02#\x91.!\x8f\xbb\x04\xfe%y~\
-s\xea\xe4\xf1\xad\x00p\x0d\xf7\xf073>;\x12\xdf\
-\xb5\xa7A\xdbz\xc3sW\xf0\xbd\x93\x04\xde$P\xe9\
-@\xecaf\xdf\xe1\x1d\x0d\x01\xe0\x9a\xdc\xab\x88\xbf\x9d\
-\xc4g\xaf\xe0\xbbv\xfd!\xc1\x89X\xef]\x04\x1a\xc0\
-\xfd\xd31,3\xbdd.3\xc5/\xfbE\x80\x19%\
-r\xf9{\x1c\xc7\xbf\xd3\x00\x9f\x15\xdb\xd1\x8e\xce_\xd2\
-\x97\x1b\xa9z7\x80\xf7'3Y\xc0\x97\x01^'\xc0\
-!\xc05C\xf8\x1a]\x86\xd8\x8e\x8d\xd2>G\x00Z\
-\xc8%p\x87\xc0Pxo\x92m\xdez\x8a\x7f\xb22\
-e\xbc\x89\xfd\x91\x83yI\xf3\x9f\x8e\xe5C\xbfU<\
-\x1b\xcf:\xca\xdb\xb6\x8c\xc0,\x06\x9e\xc5\xfe\xf8\x17\xf3\
-\x98n\x1d\x97'\x99\xce\xcf>\xcd\x00M\x03\xdd\x01m\
-\x1c\xde{\x98\x99NpL\xde\xef\xe3 o\xba\x8c>\
-\xf0\xec!\xf2\x0e\xbc\x8by\xac\xefN\xc6\xa08\xe6a\
-L\xc2\xb8\x01\xda\x06\xfa\x03\x1a\x99\xcc\xe44#\xef\xa6\
-:\xc9[\x84Tx\x16\xde\x81w!\x0f\xc8\x0b\xf2\x14\
-\xf9\x894\xff\x83'\xb75\x08\xf7\xcf\x1e\xaf o\x9c\
-\xff\xb2\xc7\xc3;\xe4\xdd?\xa5\xf9C\x1b\x9ei\xd3\xc2\
-\x06?+\xfb\xa7\x00n&*\xcd\x1f\x9e]\xd9/\x85\
-\xc6\xcf\xaf\xaf\xbf\xd6\x839Cp/\xd7\xbfw\xcc\xba\
-\xf2\x84.[\x90\xf7\xd2$\xf9\x88\xeb\x0e\xfa^:y\
-\xb6%\xbcC\xf5\xef4W\xf4\x99\x91\xac\x876\xbcL\
- \x86\xc0e\x02;\x08\xbc\x88\xb0\x03\xef\xc5\xc23\xda\
-\x14E\xf4i3\xbe\xc8|\xde \xfa\x0b\x03\x94Q\x8a\
-@u\x02%\x90^\x01J\xe2\xbdR1K\x0c\x0c<\
-K\xde9\x85\xefn\xa0\xc7\x97+\xfep~?\xcbl\
-\x1akdf\x94\xba\xc2\xa8\xe3cx\x98I\xae7\x8d\
-12\xe7\xf6\xb1\xe2\x1ad7\xc5\x1f\xda:\xe1?\x22\
-\x7f\xbb*\xe1o\x15\x8f\x1c>\xc4\xc4\xc5\xeci\x0cp\
-\xe4\xf0Ax\xae\x92\x0c\x7f\x1b\xe1p\x1ew\xcc\x9f\xef\
-(\xe4\xcf\x90\xb7\xca\xd1\x5c6-bZ~\xe6\x97\xb6\
-\xf4\xbbo\xbe9Tv\x0e\x9b<yR\xbe\xe7GG\
-y\xbb\x9a\xdf\x9f{\xa6\xb5e~\x7f\xb5Gw\x8f\xe6\
-wi28X\x9f\xd0\xe3\xd2\xe0\x22\xdf\x07L$\x93\
-\xc7\x841\x1a&\x98Q3\xfe<D\x91\x15\x13\x80\xe2\
-5\x17>/\xbe\x0fyA\x9e\x90wc\xdc\xebu\xa1\
-\xd7a\xe5\xdc[\x879J\xea\xb8\x18Y\xf0Uz\xe7\
-\x9d\xb7\xed\xfa\xec\xec\x99SL|lt\x1b\x00\xb8\x96\
-\xfe>p\xc0\x80|\x97k\xb4\xf4%+\xcd\xbftV\
-V\xe6c\x07\xf6%,\x07\x80k\xb8\xc7R\xcf\x18\x84\
-\xb9\x99\xecg\xf5\x1e\x95-C\xa7\x15\x08\xf4&\xf05\
-\x81\xfdd\xac$\x9f>u\xe2\x1a\x00\x5c\xc3=\x02\xcb\
-\xf0\x99\x0a\xf9\xa1q\xc9\xbb%\x09\x0c'p\x90@\x1e\
-\x8e\x7f\x9e\x17\x10\xda\xe7\x81\xe2\x0bf|\xe6 \xbeS\
-\xd2\xdd:\x08\xb8\xe3\xc4w\xea\xe3\xfe\xea6\x95?\xc0\
-mR\xa6\xfe\xf4\xc9\x13\xd9\x00p-\xf7\x0c\xbe[\x9f\
-\xeeC\xa7e\xdb\xee\x99Z\x108$\xc93\x89\xc0\x12\
-\x02\xaff\x9a\x8c\x0d\xf6\xefU/\x04\x80k\xb8\x87\xbf\
-%I\xde9\x84y9\xc5\x03kKc\xf5%e\xc3\
-~q)\xbd\xc7\xbdt\xfe\x02s\xe0\xdf\x9da\x00\x17\
-\xc95\x7f_o\xd9;/\xc5w\xe8:\xd4\x17\xdf\x95\
-\xa3II\x7f\xffJ\xbdk\x22\xf0\x16\x01\x7f\xf8=\xeb\
-\x8a\x9e\x99@\xd6\x9edm\x05\xd0\x06`\x0a\xb9\x86{\
-YW-y\xf8\xe3;&*\x9f_iz\xa0\xd3\x07\
-\xa3G\x93\xba[\xe4M\xc3\xa9\xbe\xbc\x86\xf9\xf0\xbf%\
-\xee\xb5\xac]\x01\xba\x13HA\x80k&\x9c@b\x82\
-\x0d\x1e\xdf\xa2\xf0p\x1b\xf3\xe6y\xf3\x88\x11#\xe4\xda\
-^\x01iW\xac\xf3R\xb1\xdd\x87\xd7s\xd2\xb2\x93\xa9\
-\xb5T2]\x87C\xeb9\x1a\x0fK\xa9\xfc\x0eZ\xc6\
-&\xc7\xca\x95\xdf\x9b\x1acI\xe2>F\xa6\xdd\xc92\
-k\xc5d\x07xhH\xd1d\x1e\x96\xe1h\x1d\xb3\x8c\
-\xaa\xeb\x12\xb1\xbf\x15\x94-[\x07x\x17\xf3]B\xe5\
-\xbb\x8c.\x1f\xe6\x0d\xfc^\x06y\x98\xd8W0\x9e\x98\
-1L\xb6\xd2\xb2\xed\xea\x00\xefb\xde\xafR4\x05e\
-\x94\x86\xfb\xe2\xbc\x05\xf3\x07\xf0p\xe0\xa3\xb8\xce\xd6\xc3\
-\x98\xbe|\xe9\x023E\xc5\x97\xdfYa\xd9t\x1d:\
-\xc3\xbb\x90\x07\xe4\x05yb\xde\xc9P\x16\x94)\x96\x0f\
-s\x18\xcc#\xc0\xcb\x81\x9f\x02O\x03\xbe\xb2w\xff\xee\
-:\xe3\x98\xab\x15H^\xfb\xdd([\x84\xfd\xf0.\xe4\
-\x01yA\x9e|\xde\xa4\x0c(\x0b\xcatU\xfe\xe1\xb3\
-\xdbj\x936<O\xf2\xba\xe5A\xf9\xb7\xe0\xdd\xc3g\
-\xb7\xd7vU\xbe#\xfc\xaf\x1b\x9d\x01\xb8\x1fD\xe0\xbe\
-\x07\xe5\xc3;\x83 \x0fW\xf8\x97\xa1?\x18'\xaf\xee\
-\x98\xcb\xefC\xda\x13\xc8\xf5\xa0|x\xa7=\xe4\xe1\x8c\
-\xfe\x9c\x8d\xbf\xeds\x0c\xcc\x14\xff\xac\x10\x92\xcf\xcf\x0e\
-\xca0!\xc8\xfd\xf63\xbc\xfb\xf7,\x83t\xfc}\xed\
-d\xfc\xdb\xf1\x9f\xdd\x9f\xf18\xa8I`5\xca\x91\xef\
-\x11\xb8N \x9a@'\x84h\xbcw\x0f\x9fY\x03\xef\
-\xc0\xbb\xc8\x7f\x92)\xbc\xf6rR\xbe\x1d\xff\xd5g\xe8\
-\xfd\xbf\xe9nb\xa6\x06g\x05\x93<[\xa3\xdc\xe29\
-\x02\xa1\x14_*\x87c\xb4/\x816\x04B\xbey\xc1\
-\xc4\xc0\xbb$\x8f/\xa9\xfc\x0e\xd0k#1\x0d\x1b6\
-\x8c\xcc\xbf\x9c\xa3\xf9g\xa4\xd1\xa4g\xa0/\xc2\x03\xb2\
-h^(\x0b\xf0\x0c<\x0b\xef\x90wG\x11\xb8N\xf1\
-\xb4a\xe2\xda\xf0\xb5\xd7^sg\xfe\x1d)\xceC\x22\
-H\xd7\xde\x925\x9b?\x96M\xcf\xbf\xeb\x1c\xcd\xbf\xc2\
-\xfaC/]\x7f\x1c\x96Y\x7f4\x10\x9f\xb9|\xf1\x02\
-\xf0\x8d\xba\x00p-9\xfb\xf8\x92j\xb78\xef\xd5\xb3\
-\xac\x8d\x0dZ%\xeb\xce\x96\x92:(]\x7f%K\xde\
-\x81\xb2\x9b+]\x87\xf2\xeb#\xeb\xd9\x97\xa3\xf5g\x9e\
-\xc2\xf5\xe7:\xb1\xddY\xc9\xa9n\xad\x81\xf3\xb9\xfe>\
-\x80\xb4V\xd2K{\x00z\xff\xb1\xcc\xc9\xfe\xe3ko\
-\xec?,\xfblN+\xbc\xcf\xe9\xa4u)#\xb7\xff\
-\xb2}Fx\xc7`4\xe4{\x1f\xf8\xee;\xef\xd8\xed\
-\x01\x9d\xed?a}\xd9\xb7\xef\xeb>\xdb\x0f{s\xff\
-m\xce\x0b3\x9b\xa3T\xe6\x07\x0c\x13y\x8fa:\xe7\
-1LX.\xc3\x84j\x18&X\xcd0\xfe\x00p\xb4\
-L\x83cy\x84\xeds\xe2\xfb\x90\x17\xe4\x09yC\x19\
-P\x16\x94\x09e7\xc6\xb3\xa2\x91\xb4\x9c\xa2\x81w\xe4\
-\x14\xae\xd2\xae\xfd\xf1v8\x8c\xdb\xb3\x8b)*\xc9Z\
-\xefX\x95\x00\xbe\x95\xc3x#\xc1\x99\xe5\x8ff3?\
-N\x12\xe2ca\x0cA\xbd\xc7\x00\xc05\xdc\x83\xdf\xee\
-\xdd\xd71\xac\x87\xb2\x13\xef\xd7Y/\x0b\xda\x8ctf\
-\xe3\xafk\x03H\xdd\xa3\x016\xfe\xfaK\x00\xdc\x93{\
-\x96e\x0b\xb6-\xda\xf449\xbe)\xaesa>\xec\
-G`\xb2^\xa7]|\xe8\xc0\xbet\x00\xb8\x86{\xf8\
-[s|\xd6\xf6}\x1d\xafs\xe0[|\xe3\x5cIA\
- \x816\x04\x22\x09$\x08KyA\xc6\xcd\xeau\xe6\
-\xa3\xff\x1c\xe6\x01\xae\xa9\xb3Kxf/\xbe\xd3\x06\xf3\
-\xb0\xf6\xdd\x15\xef\xf7\xc7\x80\x01\x03\xa4\xf5\x06\x99}G\
-\x02?\x130J\xd6\x07fk\xfd\x0f\xf1@\xd5_\x0a\
-F\xcc\xa3#}\xd6\x0a0\xc0\x0brNA\xef&C\
-Z\xf7\x1a\x04\x16J\xd6\x90\x0e\xeao\x87\x7fG`\xc2\
-<k\xd8\xcc\x97F}>\xeb\xae\x95\xd6\xfdYj/\
-\xe7\x08\xee\x11\xc8\x22uN9r\xf8\xe0u\x00\xb8\x86\
-{\xf8\x9b\xb3w\xf7c\x19\xd4\xb80x\x8bf`\xfd\
-\x94\xea\xa4\xce\xe7\x08,'0\x98@\xab4Mj}\
-\xc23\xf7\x02\xc05\xdc\xc3\xdf`\x9d\x96\xe8\xa4-\xa9\
-\xb4,\xc8\xd35\x9aL\xdd\xf5\x0e\xca;F\xe0}\xe8\
-\xfb\x1cs\x22\xff\xbcN\x9b\xc14\xae_\x0b\xe6\xacE\
-\x00\x0d\xc3\xaa\xf3\xf7\xe0\xb7\x8c\xcb\x16\x1a|\x1f\xdf\x95\
-\xcbS\x9f\x9f6$\xa5\x19\xa54#\x87w8\xfb\x5c\
-@\xe01)/\xfcu\xd6\xbf\xcc\xbe\xfd{\x98cI\
-\xdbJ\x00\xec%\xd7\xbf~rL\x8e\xe7>\x86y\xe4\
-:\xe8\x07\x0b-]a\x95\xf1V\x93\xc9(\x1d\xabr\
-\xf4\x9eN\xe0\x0d\x91g\xec\xc4y\x17\xd6\xb2p\xbe?\
-\x9e\xc9%\xfb\xd5lf\x0a\x93S\x15\x00\xae\xdf\x0b\xce\
-\xe1ew\x06\xd4c:v)\x85\xe6eo`\x9er\
-\xe3\xc12\xa6\xc9~L\xd1:\x80\xcaw\xa1\x83\xba\xf7\
-\xb0\xdfG\x04\xf0u\x1f\xc3\x5c\x15\xf7\xdcM\x09\xecE\
-\x80kfx9\xd2\x86\xe0,\xfeY\x99\xbe\xe8\xe1\xa0\
-\x0d\x0bE<\xe9\x15\xd0\x11\x95\x1f\xf0\xe4L\x19\x9ay\
-\xc3\xbe\xeee\xe4\xea~\x90\x92\xd9\x1c\xb2iCP\x16\
-\xff\x8eT\x17\x13\xf3\xce\x95\xe1\xad\x1d\x95\xeeq\xa9y\
-u\xad\x0c.\x16\xd0\xf3\x0c\xe1\x8b\x16\xbcObr\x1c\
-\xd5\xdd\xae\x0d\xa3Kgc\x1b\x02\x08\xcd\xe9\xa4\xf3\xe2\
-\x02\x99r\x7f\xb6\xce\xd3:%\xf5o#3?\x1d\xa3\
-\xc7\xaa\xc11\xcd\x1ct\x22\xbb;$OK:\xe9\x98\
->&3O\xb7q\xd5\x07T\x1e\x912\xfc\xfd}^\
-\xe6\x7f\xf4\x8cR\x9aQ\xd6\x06\x91\x96\xf8s\x96\x5c\xb1\
-\xfc\xf7e\xe6\x87H\xe7\xe7T6\xeb\xc8\xbd\x92w\x13\
-i>\xe0\x06\xcd\xb8l\x03MK\x12\xbe\x97(\xa9C\
-\x82e\xdd\xca\xd9\xd3\xd0\xa9\xbcd\xf1\xdd\xe6\xb8F\xa4\
-\xdf]\x96K\x9d\xdfz\x88w\x97\xb4\xc4!oeY\
-\x8dT\xe6k\xc6:\xf1\xf2*\xb3y\x893\xda\xe9G\
-\xe9y\x88\xb43H\xfc\x1d\xca\x8b\x08\xc9\xcco\xdd\xed\
-\xda03@\xc8\x93\xaa\xc7`\x09\x0d\xdd\xc5\xba\xd9\xd0\
-\x90\xb8\xd7\x86\xfd\x1d\xee\x91&K\xda\x0d\xeb\xaeV0\
-\xff\xc3sS\x83-2\xd5&\xf9\xac;\xdd\x86&|\
-\x9e$ou\x5c\xb4\xb8\xd6h\x85e\xd3u\x99\x0cu\
-\x84\xba\x8a2\x01\xea\xacD\x05\xfb<\xd8+\xc1z\x97\
-\x82\x944MJ\xfd\xc6\xf5j\x92\xf7b\x98p\x7f\xfe\
-\xdc\xa8\x0a\xca\xc6\xcd^\x02\xc8\xab\x0a\xe4\x0de4 \
-\xeb%X\xf3A\xd9t]\xa0n\x1b\xc8\xbe\x14\xf7\xd6\
-\xb4|C\xdckG\xc3~OX\xb7\x1f\xe2\xd7\xee\xb0\
-\xfe\x855$\xbf\x16\x8b\x8f)\xf5\xe9\x93\xe9P\xff\x09\
-^\xac\xbb\x08\x13 o(\x03\xca\x822\xa1l\xba.\
-P7\xdcS\x8f\xa1\xe5\x1aJ\xeb\x7f\xe0\xe8\xee\x92\x13\
-\x99+%Q\x0f\xcd\xdb\xf5\x8f\x85\xbc\xa1\x0c\x0f\xea/\
-\xd0\xcfz\x9e~\xbe\x90\xa3\x9f\x96\x8d\xeb\xa9\xe65\xd2\
-\x8ag.I>\xa8?\xe4Y\x13\xcahP\xbb\x9a#\
-\xfaY\xb4~\xdd\xcf\x84~\xf6X\xea\xbe?!N\xf1\
-\xf8\xc5q\xeb\xd3\xfaC\x198~\x9f\x92\x19\xbf\x93\xe8\
-\xf1\xbbg\xbf\xda-\xfe\x89\xe7<\xa5\x09\xa8}P\x7f\
-\xc8\xb34\x94\xe1\x84\x7f\xf6u4\x07\xdf0j\x9c\xce\
-_z]\x06st\x8bEW!\xdc\x07\xf5\x87<\x99\
-\xa3\x9b92?\xf1\xfb\x89\xe52\xf3W3\xa8c\x0e\
-\xc79\xd3\x9ds\xba~\xc0\xfaW\xc7u\xbd\xab:\xa5\
-\xc9\xe8\xbc\xca\x01\xe4\xf5\x185\x7f\xd5\xc4\xfd\xb4\xec\xfa\
-\x81u\xb0\x06u\xb1~{\x0f~\x9bV\xd22\x7f\xb5\
-pBGp^\xba\x19\xe7\xd6\xa6x}\xcf\xc1\xb3\x09\
-\x04ZB\x9e\xe3\x99,z\xfdv_R\x87O\xdcX\
-\x7f\xb6\x91\x91KY\xd6\xcf\xb9\xb7,\xfdP\x8d\x00\xd8\
-\xf1\xec\x22\x90H\xe0\x0c\x81?\x09\x8c\x92\x9c\xc3\x86\xe2\
-\xbd\xbf\x08\x9c%p\x8e\xc0\x1e\x9cG \x0fB3\x19\
-\xf4\xfa\xf9_\x99\xf5skW\xf5g\xf5\xca\xf7/_\
-\xb4\xc9\xa4\xcfgK\xe0\x9c\x5c\x99@\x90\x93s\xdc`\
-|\xae*\xad\x7f\xbc\xb4\xbd\x89\xde\xbf\xfcO\xa6\xdc5\
-\xb4\x9c\xd1\x8d\xfd\xa3If\xff8P|\xe6\xc4v\x8e\
-^\x0f\xd9C`\x96\xf3\xdf\x09\x1c\xff\x9b\xa3\xcb\x1cD\
-\xd9b\xd0\xfb\xc7\x0eJ\xe5(F\x9d\xd6\xc3\xfd\xbb\xe7\
-\xba\xb6\x08=\x09d\xc8\x94\xf7\x99#;\x14y]?\
-\x9d\xdb\xf2\x136\xf92\xee\x0dX\x87\xe7p\xf1R\x9d\
-\x8e\x8c\x1c\x1aO\x83\x1c\xd4}/\xbdg\xd5\x93yM\
-I\xba\x9cs\x8dnC\x07w\xe5Wdm\x22\xd6\xbb\
-\x14\x02\x93`\xafK \x8e\xd5\xff\xc9\xd0\x0c@\x0a\xad\
-\xd7\xafg\xd9\xfc\xca\x0fY'\xf2C\xe0\xad5L(\
-\x0f\x81\xf9\xbf\xd9\xe3a\x16\xf9a\xedj\x15\xad\xf2\xc3\
-KZZ~\xf8\xaf\x83<u\x04^\xcb\x0f}z \
-\xbfM\xc4=\xdf '\xf2\xdbA\xf8\xcc9'\xf2\xdb\
-\x94\xfc\xd6\xdd\xc2O3\xec\xf4\x9b;\xf8X~\xbeO\
-j\x0b\xa2\xcf\xe7\x19@\x96\xae\xc0\xce/>\x97\x8e%\
-\x93QWT\xce\x8f:H\xcf\x8f|\x91X\xad\xce[\
-\xe7w\x09\xf8Nk\xe9\xf9]6\xa7c|\x992\x8d\
-\x06z\x9d\xe1\xce\xf9\xe9$\x5c\xbf\xcb\x9f\x9f\x1aX\xc2\
-\xdf\xb5\x85\xe8\xfc\xfa\x17\xcb\xf9\xf5\x86uk\x0b\xcd\xf9\
-\xb53\x1d\xfd\xab\xe9\xacK\xfd\x01m\x16\xeb3\xfa\xf6\
-\x81\x1e\x0fiCt\x91\xd0\xdf\xa0\x93(\x13\xa0\x81\xde\
-k{3\xf1\xcaBf\xfaS\xed\xcf\x7f\xf2\xcaD\xe4\
-\x13\x14\x8c\xe0\x13\x94\x8d\xe0\x13\x14\x90\xe0\x93\x7f\x19\xec\
-\xadH\x8ad\x98{\xf4gg\x86\xc9\x83\xcf0\x86\xc9\
-\x85\xcfP\xfbO\x0d|\x06\xdb\x7f\xf2\xad\xf4\xb7\xfft\
-\x9b\x06\x1c\xe4\xe3\xa8\x5ck\xfd:\xdf\x13>C\xca\xc1\
-\xa7\xd8\x0e\xb1]b;\xc5v\x8bx\x00\xbc\xf8\xd3x\
-\x12\xf1&\xe2Q\xc4\xab\x04\xdf\x8d\xd1\x96,\x8a\xd6\xd3\
-\xeaR0zZ\xc5\xc9yJ\x88\x8df\xf6\xa8\xd5V\
-\x1d\xb6\x98h~m\xff_I\xb1\xea8\xb2\xef\xe2\xf7\
-2\xa1\x08L\x1c\xc1\xc9\x7f%a\xbfC\xbb7\x22\x84\
-\x16\xa5yDI\xd2Qg\xe0\xa2m\xa5\xc5.\xec\xec\
-i&v\xcf\xaeZ\xa4\xcd\x19\x00p\x0d\xf7\xa4:\xb9\
-\xe2\xa7\xc1`(2\xed\x16\xeb\xaf\xe34r\xeb\xb2\x10\
-\x02\x95\x8d\x06C\xbd\xf3\x89g{\x90\xb5\x0f\x0b\x00\xd7\
-p\x0f~\xc3gl\xde\xcb2\x1a\x15\xd9(?\xd4\xbe\
-\x96_{\x83Mxc\x94\x99/\x22\xb0\x1d\xed\xff\xd3\
-3\xd25Y\xfb\xf7&\xdc\x07\x80k\x94\xdd\x9c\xc2g\
-`]>\x04\xdf\xb5\xf7\xc1\xc1\xb1\x8c\xc9d*\xcc\xba\
-\xa65\xd1\x96q\x0b\xca\x8f\xeeJ\xf7x\x19\xe9i\xe6\
-\x03\xfb\x12x\x80k\x07\xfbu-\xe6\xf1\x16\x9f\xa7d\
-\x1c=Lz0\x198\xb9v\xd7!0\x83\xc0\x19W\
-2\x05\x05\xed\x97\xe2\xe2,\xe6]WZ\xae\xd1\xc0\x15\
-h\xdbe\xf6\x99e\x09|\x80u4+\x017\xdbO\
-\xc3Y,\xab\xac\xed\x98(\x18Z`\xed\xfb\x1c\xe4_\
-[\xe5h\xdcG\xed\x17\xe5\x0d[\xb1\xec\x02\xdb\xf3\x1a\
-l}\xdd\x89\xfau\x97\xdd\xa8\xf7\x03\xb4\xcd\x22M\xd6\
-\x5c\xde\xbfW}\x07\x00\xae\x91O\x5c\xc3g\x94\xe6\x97\
-D\xcb\xbb}*#\xb2\xed\xf3 \xf4\xa5\x97\xa3\xa0\x8e\
-\xe0\xf7\xe4<\x81\x9fP\xb6\xfb\x1c\x99\xeb\xea\x9f<\xfe\
-\xef\xd3d\xee\xd7\x02\xc05\xdc\x83\xdf\xf0\x99\x9f\xf0\x9d\
-;\x0a\xf2\xcf\xc1\xba\x04\xf9\x8a\x0ed\xda\x0e|\xe8\xa6\
-\x8bz\x81=\xdd6\xdeG\x94\xc0\xbb-}t.\xf1\
-,\xf8\x98\xa9A\xda\xae!\x90\x0a\xd7\xe7\x12\xcfHi\
-\xab&\xbe\xbbMb\x9b'\x077\xd1\x0f\x8b\xd7q`\
-\xe48i\xbd&\xb8h;\x9co\xc6\x13\xe8C\xa0\x94\
-\xcd\xf8\xd4ji[\xc8 \x02\x1f \x04\x896\x91\xac\
-\xbd\xeed)\x94\xd1\xc7\xcb\x9c\x9dJq0\x81\x1e\x0b\
-F\x8e\xf3\xf6\xfc\xfe\x86\x0b\x9a\x07\xbd\xd2Y\xe83\xc8\
-\xd2\x0f\xb6\xe3\xb2;\x13\x1f\x1b\xc3$$D3\x7f\xff\
-\xb8\x9f\xc0\x01\xfe:>&\x96\xff\xcdR&\xa7\x97\xce\
-3\x950\xefL\x17c\xe1\x0do\xf1\x02\xd6\x9e\xcf'\
-9)\xfb\x12\xf6\x93\xca\xf1\x19bw&<\x90\xb6\xbd\
-\xcd\x0e\x98\x0a\x80\xdf'\xf3z\x9b\xdd\xad\xb8\xe7\xeda\
-tV\xddc=\x9fwo,\xcbQ=.\xd3\xf3\x82\
-\xa0\x0b\xeb~\xd2\xdb\xe2>\x14\xe7\x1bGe\x9e\x96\xda\
-\x17\xd8\x97k\xdbv\xd4\x95X\x89P\x9d\xd7\xff\x93\xc1\
-\x81\x835\xe6\xb3X\xa6\xa3\xfal\xa5\xd7\x07Z\x0f\xe4\
-\xd7\x92\xf2>p2\xbf_\xb2\xb3\xad\xb0\xa3;\xbb\xb6\
-\x83n\xc1o\x94\xae\xc4\xa6pW8\xd0\xcb\xe2\xe0\x92\
-\x93\xf5\xc1\x07^\xf2=YWFg\x95\x1e\xef6\xf6\
-\x0c\x99&\xce\xdd\xb6+\xc6\x81\xd6~\xcd\xdd\xdb\x09?\
-8\x8b\xeb\xf1\xfc\xda\x12\xcfp\xc2\xe7g\xd1\xe3\xddd\
-\xf0\xb8\xed\x8aq\xc0f\x1a\xacu\x13\xf8\xc1,'\xf3\
-\xc2\x0cOh@\xb2\x8fs\xb4\xa6\x8f\xa7\xf9\xbc\x074\
-\xef1\x0e$z\xed\x95\xb0.ru<\x83m\xe0y\
-\xa8R\xbe\xa7\xb7\x9e\x07\x8er\xb0\x8f\xbbN\xd3\xbd\x02\
-^\xa7\xb4\xed\xca\xe9@\xaf\xa3\xf1\xd0\xc7\xc1\x1a\xe9\x9e\
-\xe8\x8f\xc8d\xcaV\xe4\xdbK\x22\xbb\xf8\xc3\x01^\xb7\
-\xd1k\x1b/\xb7\xdd\x0d:\xb0Y#msP\xd7-\
-R?\x8b\x0a\xdb\xdf\xd8\x81\xee\xcb\x1d\x5c\x97\xf2\xeb\x03\
-\xd6\xc9\xfc\x9e\x8f\xb6+\xc2\x01\xd04k\xa5\x81\xa1\x0e\
-\xf6\x0b\x19\xd8\x16E\xed\xa7d\x95C\x1c\xd0\xfe9\xeb\
-\x98\xf2i\xdb\x15\xe2\xc0\x86W\x9dw0\x06\x86\xf0\xf2\
-\x22\x05k!*\xbf\xc5\x0e\xe8\xe9'\x8b~\x15\xb5\xa6\
-\xf5Q\xdb]\xe2\x80\x92\x89\xf9a\xdd\xe4\xea\xbcX\x5c\
-?(l?\xc8`w8\xd8\xbf\xbf'\xf8d\xb3\xe2\
-2<\xc8\xa7m\xb7\xc3\x81\x08\x16\x9a5\xeah\xfdR\
-9\xf9\xc1\x0eQ\xae\xac\xb0\xfd\x95)?\xad4\x80\xbf\
-\xd4N4\xedG\x04e\x16D\xdb-8\x10\xf5R\x05\
-\x9fe\x99R\x9a}N\xe2GO\x84S\xd8&\x87\xe7\
-q1j\xc1\xde\x05\xce!\x8c\x06\xae\x9e\x03\x9b\xc3t\
-\xf8\x0d\xf6\xea\xe2\xd9\x9d\xc4\xa7\xd1:\x1f\xb6]\x84u\
-X\x16_\xaeX\x0f\xa8\x13\xa9[}\x07<;\x1d\xce\
-\x17\xa0m\xe2Y\x1b}\xde\x18\x9d\x10o9\x8f\x83\xb3\
-\x98\xf3\x89g{f\xa4k\xb2A.G\x03\xc8\xa9@\
-V\x83\xb2\x0b~\xcf\x0e6\xa8\xd3\x84\xbaL\xf5\xd0\xef\
-\x97'~\xc2\xa6\x86\x07\x9a\xf8\xb2EY\x02\xd4\x09\xea\
-\x06u\x94\xd6\x1b\xce\x17\xce%\x9e\xed\x81gN\xa1\xe2\
-\x99\xab\x83\xf3\xb8\x0c8\x93\x81s\x09Q>)\x02\xc8\
-\xeaPf\x95\x8ar\x0b&\xa2$O\xff\xf5\x08\x5c*\
-\x80\xb6\x8b\x00e\xd5\x87\xb2\xb1\xee\x1f`\x9d\xb4PG\
-\xfbz'\xdc\x876\xe1y\x9b\xddy\xa3\x1b\xed\xbfm\
-\xd7~\xc1fmd\x01\xf5=M\x03#\xa1l\xaa\xfd\
-\x1a\x8f\xdb\x1fc\xf1+\x13\x1a\xe3\x06\xfdo\xfbi\xbf\
-8\xf6\x97\x16`\xdbE\x802\x99m\xab\xf6[\xe9\xff\
-\x842\xfa\x87\xb1\x1e\xa3\xdek\xd3\xff\x09\xb1\xb1\x14\xff\
-38\xe1\x7f\x06\x0b\xff\x1b\xcb\x5c\x83\xb6\xfb\x11X\xfb\
-\x10\xda\x0fe\xfaA\x1d\x04\xfew\xd6\x19\xffK#\xf5\
-\xaek\xe1\x7f\x84\xd7'8\xd07\xa0\xe6\xbf\xd3\xae\xe6\
-?a=\x92\xa9\x22\x9f\xdf?\x84\xf6\x7f?%\xc8\xce\
-\xb6\xd3\xa3\xf9\xcf\x93\xf5\x0f\xe8\xe3S6\x0cS\x1fB\
-\xfb\xa7\x8as\xa0^gp\xb5\xfe\xd9.\xee\x81\xbc\xb1\
-\xfe5\xe0\xfaw\xaau\xcd\xdbA\xc6_\xbf/!\x07\
-\xcb\xe4\xd7\xdd\xd4\xfaw\x95\x83:/R\xba\xffau\
-\xca\xf7?\xa6l\x8b\xbd\x11\xf8\xbc\x5c_\x80\xed\xdf\x80\
-e2\xa6,\x97\xfb\x9f\xbb\xa8\x7f\xc0\xd3\xac\x9b\xfb_\
-\xad\xb3\xfd/\xec)\xa8\xf5_+\x02\x17\xdd\x9c\xc3.\
- \xdcws\xeeo%\x96K\xd5\xf7M'\xfb\xdfF\
-\x1e\xec\xff\x15\xc9?\xce\xc4\xda\xf8Y~\x81\xc0y\x05\
-m\xc8#\xf0\x15\x81Z\x08_\xe1=W\xef\x01~_\
-\x12\xcb;\x13\xc7\xd2\xf2\x8f\xed\xde\x90\x7f\x80.\x8b\xd6\
-`\xa2\xfdQ\xbb\x94\x7fIl\xb7Z\xa0?U\xa3\x83\
-v\x1fC\x9b\xbb\x12\x12;\xb7\xb7\x09\xfc\xeb\x00\x0f&\
-\x9c\xefZZ\xf6>\x816}\xff:\x81\x1b\x0e\xf6\xfe\
-|,\x1e]\xe6M\xc5\xe7\x00\x9e\xc8?\x85zY\xf6\
-\x82A\xe8\xfb\xf5#\x02\x8b\x09,#\xf0\x09\x81\xdeh\
-\xa3\xe7\xc8\xee\xad\x1a\xc6\xa2\x89\x22\xf0\x0d\xaeq\xc6\x10\
-x\x1am\xfc,s\x0eUG\x98\xd7\xd4\xae\xe5\x9fz\
-\x9f\xcb\xbf\xc3\x833]\xfa\x9b\xa5!\x82\xfe\x1e\xac\xf4\
-\xbdlZ\xffG\x85\xf6\x16\x8e\xe4\xdf\xd3\xbd\xe0O\xd4\
-\xd5\xf9G/\xba\x8c\xe4\xe3Z\xa7\xed\x05\x7f\x1a\xe1\x94\
-\xecBLS\x03\xb3\x1d\xd8JfZ\xda\x0dz\xcd\x12\
-\xfb\xc2\xd7el\xc9\xe9\xbe\x0f\xf3\xf4\xfc\x87\xe5<?\
-\xffbY\xef\xdb\xbaHu\xbf\xd0\xce\xe8\xb2\x13\x9d\x8b\
-\xf7\xf3s\xfee2\xa5\xe7\xeb\xfc\xd3\x9b\xfaH\x9c}\
-<\x8f\x8e.t\xad\xb6\xd0\xb6<\xd9\xd9\xd9\xde(\xf7\
-)E\xe7\xdf\x9c\xf4\xfc\xdb\xfe\xdceo\xecn[;\
-\x8c\xf8\x18&V\xbdGI\xbbUx\xd6q\xd9E=\
-ZzK\x0f$\xdf\xfa\x0fz\xf1\xfc\x9e\x95\xca\x1b\x1c\
-\xfa\xc3u\xa0SY\x19m\xe5\xb3\x9c\x94\x9fM\xa0\xbf\
-H\x7f\xde\xd0\x85\x22\xfbF\xa9\xfe\xcbD\x85\xfa/\xbd\
-\xa5\xfa/\xe2\xb9\x9a3\xfd\x17\x83^V\xff\xa5\x0f\xce\
-q\xce\xf4_`\xfe\x1f\x8bg\xa2^\xd5\x012\xd8\xfa\
-%\xf5L\xff\x89\xa5\xf5\x9f\xce\x88\xfaO\xa9\x0a\xf4\x9f\
-\xb6+\xd0\x7f\x82\xb6O\x95\xda\x1czU\xf7\xcf^\x07\
-l\xa2\x1b\xfao\xe7\xf0l\x02\xf6\xce\x9d\xe4\xf5\xdf8\
-Q\xff\xed=7\xf5\xdf\xb2\xf9~\xa7\xda\xee\xa9\xce\x8b\
-k\xbdW\x96\xd6\xb5\x14\xf5\x1f\x93\xdc\xd4\x7f\x04\x19J\
-\xba\x97\xf4\x1f\x81\xd7\x0d\xa0\xd7`\x06\xce\xc7\xben\xed\
-\xc7\xe7\xc3\xd0\x7f\xbd\x83s\xdc\x93\xceu\x8e|\xa5\xf3\
-\xce>L\xfdgX\xd7\x8d\xb6\xd3\x7ffY\xa6 \x93\
-\x81c\xe5\xe6\xa8\xba>\xd4\x7f?\x83\xeb\xf9:\xf6\xb6\
-\xbe:\xe6a%\x89.\x8a\xd4\xfe\xe1\x0f\x1c\xd7\xf7<\
-\xb4\x7f\xc8\xb0\xb1\x7f\x90\xd8\x06\x15\x16{a\xbd\xbc\xed\
-\x0bm\xff2\x04\xe5\x89;\x14\xda\xbf,rj\xffB\
-\xca\xcbIM-\xd4\xf6Ol\xba\xc4\xbf\x03\xe7\xd8\xfe\
-\xe9\x9c\xad\xfd\x93]{\x8d\x94\xef\xdc\xa2\x92\x8cF#\
-\xc5\x97\xdd\xb7\x7f\x13y,\xd0zfF\x06\xf3(\xa5\
-\xff\x82\xfd\xa3\xd3\xf6\xc7\xc4\xd18\xe0\xcf\xe3b\xd5\xea\
-\xffN\xfb\xe1\xbc1\xc6\xe2\xcb\x88\x89MHpx\x1e\
-W\x9c|\x9b\xcc\xd6\x04\x8e\x03d>!\x02\x0c|\xf2\
-\x8e\x07H\x8a\x02G\x0d\xe0JPx[p`@\x9e\
-\x86\xcf0\xfe1\xfeA\x0d|\x06\x9b\xcd<Y\xfb\xf3\
-\xaf\xf1/\x8a\xc52L\xb9\x10\xc1\x8d\xc1\xc8 >\x96\
-\x8dJ\xed\x1f\x05N\x12\xfc\xa3Tj\xf8\xe4\x9d(t\
-\xcec\xca2\xccx&,\x8f\xa9\xc90\xed!\xd6M\
-{\x86\x5c\x86\xe6\x92\x9b\xe4'\xf29\x92a\x82\xe0S\
-\x0d~\x18\xc8'\xd4\x8f|\x0aQm\xc8'\x14\x17\x15\
-\x1a%\x94\xabR\xfa\x99+|\x86\xba\xfb\x99'|\x86\
-\x89\x9f\xf7\x84\x98:\xd0.\xc0\x05\xf9T\x01. \xa6\
-NDm\xc1\x85C\xb5j\x02>\x04\xbc\x88x\x12\xf1\
-&\xe2Q\xc4\xab\x88g\x11\xefb?X\xfaE\xec'\
-\xb1\xdf\x1c\xf5\xab\x90\xc0OD\x0f\x02K\x19\xcaO\xc4\
-\xeb\xc5~\x22\x8ab\xdaKxh\x82\x10_\xc8\x0a\xf1\
-\xb1\xc5\x88!)\xde\x81\xcc\xb1\xa8\xf9\xf0\xf1\x1d~\xa2\
-E\x5c\x80\x9f\xe4\xb1\x08%\xff\xcb\xf8\xc9\xc8\xc8\xb0\xac\
-\xdf\xc1\xcf\x16\xe2\xa29\x81L\x04\xb8\x16\xfc+\x83l\
-L\xefy\xfc\xf0\xa2\x90\xa0}b\x5c=6\xc7d\xb7\
-\xdf%{:&6z\xf7\x93\x04'9\x00p\x0d\xf7\
-\xa4\xcf]\xb9\xa0e\x94\xc6\xf8.\xf48\xe1\x1c\xee\xfd\
-\x01\x02\xf0,\xa4\x09\x81nF\x03\xd7\xff\xc2\xf9ss\
-\xc8\x9e\xf7&\x00\x5c\x1b8\x0e\xce+\xba\xe13\x95\xf0\
-\x1d\xd9\xfc\x0c\x5c\xd1\xc1\x15\xbf\xe7\x95\xc7M9<+\
-\x04\xf9\xf9z\x02\xc7\xd1\x87\xe8u\x03\xc7\xde\xd5\xa4\xa6\
-<\xd8\x97\x10o\x06\x80k\x8e\xdcC\xf9?\x8b\xcf\xae\
-G\x9f}\x1d0/\xbb}\xb3\xc1\xc0\x16Z\xbc\x00\xcd\
-\xb3\xf6x\xf1\xc7\x98\xf3\xd3\xd1\xd7\xa6\xfc\xb9\x02\xc7\x02\
-N\xcc\x14~\xf8{Nl\x81\xf7a\x9e-\xa4\xf1h\
-\x0d\xc8\xd7\x0a\xa3\xecH\x82\x17\xf0;\xfa\xad\x03]\xac\
-\xfc\xe0G\xeaW\xf6[,\xcb\x16O\x5c\xe1\xa0%N\
-g\x173\x0dt\xba\xbe\x92\xf1)\xef\x0b\xfc\xd0\xbe\xe2\
-\xbf\xa2\xf5\xc9\x1e\x86\xec\xdd\x86\xcf\xd8\xcb\x84K\xa0\xdd\
-\xe2y7\xcfT\xbc\x81\x1f\x11\xcec\x1dJ\x88\xeb\x07\
-\xc3C\xf0\xd7\xe3@.\xff\x1d\x81[\x1e\xb4\x89\x80\x0c\
-~X\x8f\xf0c\xc6:@]jY\xd7\x02\x05\xb7\x1e\
-\xe0\xe4\xfd\xd8\xc4{p\x0e\x97\x81g\xf3?\x90\xc11\
-\xeb\xe2\x85\xf3\x0b\xc9\xdc~\x03\x80\x5c\x7f\x0e\xf7\xe07\
-|&C\xe1\x99\xaeT\xcf\xaeUA\xfa\xfa\x91\xf1\xf1\
-\xd3\xc9\x85\xbf\x01\xe9\x19/\xf8\x95\xfe\x11\xfdb7\xe2\
-c=s\xac\xea\xcc\xa9\x93L\x1c\xb5>\x84k\xb8\xc7\
-\x0a:\x0b\xa5\xf1\xd9A\xf8n\x8a\x1bg\xc1\xa7i\xbd\
-|_\xfb\x02\x92\xc1\xcd\x057\xea9\x05c\xae\xfbK\
-i\x10\xe3\x9f<A@\x87\xba\x01O\x88\xfeqe\xe6\
-\xc5\x86\x98\x97\xd2~\xb9`\xc1\x91\xdewg)z\xce\
-nL\x9dV8\xff\x82\x1ecm\xbb5\xafQ\xc7\xaf\
-\xe7@G\x0a\xf7_\x81\x04z#\x04\x0a>\xfcc\xc9\
-<\xcd\xf1qIe\xfcD\xd4\xc6\xbcu\x0a\xfb\xa7\x95\
-e}\xe4e\x1cI\xeaVK!\xbf\x89\x86\xb5n\xa6\
-\xdev\xbf\x05g\xfd\x06j\xfd&\xe2\x07|\xc9\xc4\xee\
-\x8c\xe3!A-\xc68\x88\xa5\xf6+66\xd3\x82\x7f\
-A!\x1ek\x07,K\x09?\xaa\xe9m=\x1b\xa3\xad\
-NA\x09\x9c\x1b\x9c\xd5\xe36\xc6\xb2\xa9\xeaz-\x12\
-\xce|\xe8o\x89i\xc7L\xf6\xcbb&\xf9[uL\
-\xdf\x0f\xc9\xe1\x9fQ0GTE?\xff\xb7]\xd4\xed\
-;q\xee\x17\xf8u\xfe\xfd\x10I\xf4\x8fF\xb9\x98\xc3\
-\xe1\xb7(\x02%\xe9\xfa\xe7f\xc9\xe9A\x061\xc3\xad\
-1\xf3\x00*\x10\x88\x04\x08\x17\xae\xf9\xfbCK\x5c\xe1\
-\x9f\x95\xa6\xacl;9@I,\xdbU\xfdF\x89|\
-:\xbf\xfbZ\xd6~]|\xde\x05\xddD\xd9\xf8\xcar\
-\xb8_\x9c\x0b\xb2u\x1a7\xe5%\xb6^?\x84\x0b\xf7\
-\xf8\xdfK\x94\xbf\x8b\xef\xc8\xc9\x09\xect\xe8\xa2\x5c\xd0\
-\xd1yz\x9d\x9d\x1f\x1d\x0f1\x96'+\xcc\x1b_\xb9\
-\xa0\xdde4\xdd\xc0\xfe'4\xb4\xac,\xdd8\xc0\xcd\
-\x03\x0a?\x0f\x10G\x15lqdOGe\xcb\x96%\
-\xfbbVJG\xcb\x5c\xd4\xf5Kq\x1ee=\x8c/\
- \xd1ez\xc6\xc5~*\x9a\xe67\x8e\xf7\x86\xe1\xd2\
-1%\x87\x1b)\x8e\xca\xdb\x8e\xb5pyZ\xb7\xc5Q\
-U\x17<\xdb@\xc7\xed\xf0\x84\x86$k\x8e\xef\x5c\xcc\
-\xe1\x1dl\xe9&T&\xc7\xc66\xbc\xd8\x05n\x1c\xd2\
-\x91\xc0\xb3\x1b\xcb\xd2\x11\xc7r\xd2\xd8(\xce\xe6\xfeo\
-\xe9\xb5X>\xf0\xd3\xc2E9\x91\xba\x14\xd6\xc5~\xb9\
-?\xf3\x81*\xd7]\xdc8\xa4\xa3wy\x1c\xf5wZ\
-o\xad)\x93A^\xe4\xa8\xdeZl\x9b\xdb\xfb|\xc9\
-\xbc0\xddI\x19\xa7\xe8\xb5_\xb6)S\x167\xe3\x02\
-\xb2\xa5\xb8\xf9A!n\x1c\xd2\xd1\x98\xe0lY\x1ce\
-\x19M\xd25\xa4\xb3u\xect\x11?\xee\xac\x19\xf5V\
-\xdeS\x0eeu\x8e\xf6SS\xacr;VvL\xe5\
-\x83n\x5c\xe2\xe8]\x07cM\x90\xefZ\xe6\xb5)N\
-\xf6k\xfbDY\xad\xc1\x0d\x1abm\xc7p\x8e\x93\xb8\
-J\x0d\x1d\x8f\xdfp9~\xf3\x83\x87\xb8q\xc1\x8f\x9c\
-\xae!\x1f\xc7\xba:\x92\xd5vp\x97\x07\x99\xcdw\xc4\
-\xbc'9\xa1\xcd\x1fY\x91\xbf\xd9\xe9\x07\x07\xb93O\
-\xe5\x1bGrkHJ\x9f\xda\x1f\xf7\xfd\x8e\xda\x01m\
-d\xae\xa6_UH;,}\x06\xb3\xc1\x89\xfcf\x90\
-u\x9d\xaes\xb5\xf6\xfb\xc1K\xb8q\xc8\xb3\xa5kH\
-\x89\xee\xe0 '\xf2\xa3\xf5\x96\xb3#\x05\xfb\x0d\xeal\
-\xa6\x12\x9e\xab\x98\x1d\xc4\xd3k$\xbf\xd61\xfb\x8an\
-\x5c\xd2Q\xd5\xc7li\x80\x8a5\xd0\xc8\x81\xff\x073\
-\xb6\xb1\x92\xd2y\x8c\xc2OS'1\xee\xd4(\xb7b\
-\x0c\x94\xefC\x89-\xa7/q\xe3\x90\x8e\xc2\x83\xad{\
-=\xbdu\x8c\x95vb+\xcb\xe2\x19\xa4S\xfc\x88z\
-%T\xdc\xa9nN\xecs~\x10m3\x12\xc0\xe7-\
-\x01\x89\xaf\xacr\x05\x80\x1b\x1b\x1cM\xa5p\x14Ap\
-\x04\xb2\x11\x00\xca\xbe\xee\x07'\xf6L\xdd\xc48\x5cr\
-z\x11\xd0>Z\xa7\x04\xce\xbe\x09]\xf4\xe7\xcf0\xe1\
-\x1c\x81\x06\x965\x83l\x18\xe4\x9fb\xdcc\xde\x9f\x92\
-\xd5\xa7\x04\xd8P/* \xdc\xd08\x22ef\x0b\xb1\
-V\x03-\xfe\x95\xf8:B]\x05y\xb6\xa4-\x02\xdc\
-\x85\xb3lh\xb3\xadmc,E;1\xb4\x8eIs\
-\xd0\x0f\x803p8\xe7\x85\xb3\x04)\x5c\xbcp\xees\
-\x94\x17?!\xca\xfa\xdeid\xb1\xb7\x7f\x9d\xc0\xb5\x87\
-\xe0w\xe4\x1a\xda\xa83\xa3\x994Z&\xf9\x04\xd4\x15\
-\xe4\xffrm\x816B[Q?\xa2\xb9U\xb7F\x16\
-?cQ\xbf$\x07\xf4\x04\xc4\xf3\x16)\xc0\x19\x03\xca\
-\xd2AV\xdcK\xf4\xc7\x85\xb1\xb0w<\x04\xdc\x88\xb0\
-C\x88\x99m\xa1\x9f\xdeXGh\xcf\x0d'\xed\xb9\x89\
-\xed\xc9D\x1cx\x0b?:\xac\x83\xe8\xb3\xa5-\x81\xac\
-\x87\x88\x9f,\xbe\x0e\x81Y4~t^\xc4\x0f=\xbe\
-\xe6:\xa0G\xbb\xf1\xb5w\xff\x1eql\xbd]\xc0|\
-G\x8e\x0f\x81\x8f\x0c\x06\xeaD\x8d\xafV\xce\xc7W\xe2\
-l\xe9\xf8J\xb0\xf7sf\xcb\x9f9n\x80k\xfe,\
-<\x9fn^'\xe2g\xe6C\xc4\x8d\x08P\x07&\xc9\
-\xbc\x81\xe2\xcf'\x80?\x7f\x22\xc7\x9fA\xb7\xc6h\xe0\
-\xfaI\xf9\xb3T\xef\x9e?G\x88\x8f\x91\xce\xef7\x1c\
-\xcd\xef\xe8\x83\x82\xbc\xb3\x87\xf6\x059\xab\x10\xe0g\x96\
-\xb0\x0e\xca\xe4\xdb\x83\xe7\xf0*'{\x0c\x98\xdf\xbb\x8a\
-\xf3;\xe8C\xc6;\xd1{\xa4\xd6\xe4\xce\xd6\x87\xf1\x96\
-\xf5!g\xe3'\xe7\xbdB\x80\x9fw-\xfeD\xac\xeb\
-\xe72N\xd6\x87z\xcb\xfaP\x81~\x95\xc4?\xf5\x09\
-'\xfb\x8b\xc7\x85<\x0d\xf4\xba\xf9\xd9\x02\xf6\xa7%\xe7\
-_\xebY\x19\x1fK\xca\xf6\x17\x0at\x86(\xff\x1a\xae\
-\xf6\xa7o\xc8\xf8\x19*K \xf6!\xe2\x07\xca\x0e\x95\
-\xc1\xcf 'v\xd0\xbf\x8a\xfbS\xa5\xb1\xbb\xc0\xb8A\
-\x89|\xc3*\xbf\xd5\xd1\xfb\x8b\xc1\x04n>\x04\xdc\xdc\
-\x220D\x88oa\xa2\xfdI\xbb\x92oL\xe4}D\
-\xb8a\xeb\xc7y \x1f\x93\xf8\x9cZ\xe1A\xfb\xee\x12\
-8\x83p\xd7\x83\xf7\xbf\xa5}_\xb9!\x1f{\xd6]\
-\xf9\x98\xce\xba\xefU,_=\x7f\xd0\x86OW!\xf0\
-\xb3\x1b\xfe\xd9\xae\x13\x98\x8b~\xac\xaa\xe1\xf5u7\xfc\
-\xc1\xfdB\xfb\xc7\xbap\xc8\xe6\xac'\xdc\x09\xed\xec\x15\
-\xe5\xab\xac\x1bg\xa9\x06\x0f\xe5\xf3\x11AW\xa4{\xf8\
-\x08\x02\xa9.\xdav\x82\xc0\x9b\x04\x02\xa9w\xe1z\x18\
-\xfe\xe6\x0c\xc7\x1a\x023\xe8\xbd{xH&]\xf70\
-\x17\xf2\xf9iV\x9bZ\x9d\xcf\xcew\xaeQ1\xeda\
-^\x15\xeb:\xa5\xb4\x09>\x9f 0\x89\xc0\x16\xf4\x01\
-\x07\xe3\xe70\xf69\xac\xb7k:\xf1\xfb\x05\xbf\xbdC\
-\xe0W\x02\xff\x10H$p\x9c\xc0\x9f\x04\xc2\x094%\
-\xe5\xa9\xe8w\x0c\xb6\xf1\x87f\xbb8\xdfi\xee\x85\xf3\
-/%\xe7\x83\xcf\xd2\xba\xec\x12\x9f\xf1\xb4\xdc\xa3\x02\x8e\
-\x03\xa0-\x7f\xda\xf7\x99\xe0+-\xd3\xbaV\xb0\xf5\xb9\
-\x16\x804\x02c\xaf\xa2\xc5g\x9c\x04\xf4:\x96>[\
-\xe8\x88k\x1bG\xf5^i\x99_<\xd0S0\xda\xca\
-o]\x9d/\xef\xa1\xcf\x97\xe1\xacW\x91O\xb9`{\
-\x9f\xf0\x16Y\xa4\x9c\xaf9\x0ahy\x5c\x04\xe9\x0f\x89\
-_\x8bj\x04b\x9d\xd4\x97,u\xf4\xed\xf2\xabs'\
-\x99#\x95\xe8'\x94\xa0\xf5\xa0\xe0\xcc\xd7\xd7\xa9B\x85\
-\x0arz.+\x5c\xd4u\x09\xa1\x19\x81vt\x9e\xeb\
-oHtG\x1a\xb9\xd07\xbc\x8d\xfan\x16\xfd\x16\x83\
-\xc1\xb7\xfa\xa2\xb7o\xdf&c\xca\xce\xef\xc5\x1c\x17\xba\
-\xae\x89\xf4\xba$\xbfz\xf6\x92\xbey\xdb\x85\xfe\xd1M\
-\xc4\x91\x8d~TZ\xba\xc6'6S2t3GA\
-\xfdFX\xfd}\xe4_\xbf^\xa2\xf3\xa7T\xbfn\x99\
-T\xbf\xce\x99\x0e;\xef[;z\x97`k\x19\x1b\xc3\
-\xc4\xc6\xec\xe2?\xdd\xd03\x06~\xf3\x8d\x02\x1d\xe9\x15\
-t\x9cd\x83\x97\xec\x0f$\xf6Jn\xe9gfh9\
-;\xfdL\xfa<Q\x1d\x1f\xed\xd8\xfe\x94\xc2\x91\x0cN\
-\xc8\x1c\xa2\x15\xe7\xa9\x18\x05\xf5\x81gj\xf8,\x16\xa6\
-\xc1f\xeel\x85~\x89<\xd6\xef\x85\xbd2\x9cWR\
-\xf8\x11\xf5{{\x892\x7fuL\x0cO\xbf\xac\xbc]\
-\x5c\x18\xaeo\xf4\x0a\xeaqR\xd4e\xe1c\x17\xe9}\
-c\xb7\x22\xeeE)\x9f\xecJ\xf5\xc3OyE?\x5c\
-\x98s\x1e\xc7=\x83R\xfd\xf0sR\x1f\x9e\xbe\xb3#\
-e\xa5|\xf19\x85tD\xdb\x17\xfc\x80\xb2\x11\xde\xbe\
-\x80u`_p\x9a\xdc\xe3\xf4:G\xf6\x05Jm0\
-N\xda\xf9x\xf5\xb1\x0d\x86\x97\xedS\xe2\xad\xf6)\xe7\
->\xa7\xecS\x16J\xecS\xd2=\xb0O\x89\xb1\xea\x87\
-\x15l\x5cr\x19~P+_\xf6M\x9cW\xed\x9bn\
-\xe2<U\x83\xf6G\xca\x16\xb8\x0d\x98\x9d\x9f\xba\xc2`\
-\x1fw\x0e\xfd\x92\x87\xd0\xf6(\xecC\xb4o\xe6t\xac\
-\x9c}\xe5\x97\x0f\xc1\xber\xa9E&nY\xffqL\
-aH\x06\xfdC\xb3\xcf\xd5b\x19\xed\x0d2\xf3b\xa1\
-\xb2\xef&\xeb#\xbd=-\xf9\xda\xbe\xbb\xb9\xddz\x01\
-lN\x0b\xb1\x1d<K\xd9{:\xf0\x0f0\x09\xcfE\
-N\xe0\xf9\xda\x0do\xf8\x07\xe0mqu:\xa6\xa8$\
-\x96\xd5;\xf31!\xfa\x97h*\xef_\x22q\x0e\x9c\
-\xf9\xe2\xb9\xa6K\xff\x12lQ\xf7\xc5\x81r\x04\xfe3\
-\x8d\xf5\xd8?I\xd6\x95\xebB<c\xad\xdemyq\
-QJ\xe0\xa3\x12doF\x02:\x17\xfem\x8cd\xcc\
-\x00\x14V\xbf\xa3\xbeN\x94\xfd\xa9\x8c\x7f\xa4b\x1f[\
-\x14~d\xa0\x18?\x90\xe2c\xedq\x93\x10[\xec{\
-\xac($\x8b\xc3D\xbc\x9eM]3\xf2\xd7y\xe0\xa6\
-\x11\xaf\xa3x\xdf\x8c\xfc58n\xec\x8c\xd7\xe0\xd41\
-\x14\xaf\xd5\x0c\xef\xef\x91\x11\x9d@\xaa\xf0\x1a\x8b\x87?\
-\xbc\xcfG\xf22\x5c\x0b\x0e&\xc3\xf8k\xc1\xf9d(\
-\x7f-\x88\xb0\x83\xed\xae\xd5\xfc\xb5?\x7f\x1d\xc5\xf83\
-jR\x00\xaf\xc5\xcf\xd4f\x22\xf8O\x80\x8e\xe4\x1f\x7f\
-\xfd\x80aH\xfd\x19&R\xb8\xceeB\x85\xeb{\x8c\
-\xbf\x86\x09V3\x9d\x85k5\xfc\x17\xaeC\xa3\xc0k\
-&\x5c\xe7\xc1\xc3\xe4\x950\xfe\xba6\xf9\x1b\x81\xd7$\
-s\x02\xc2u{\x06\x1cy\x86\xf1O>I\xfe\x96\xc6\
-\xb7\xc63\xbccO\xfez$\xc3;\xf7\x04\xfe\x82\xfd\
-\xe0O \x0a\xafU\xf9\xbc\xa6\xf3D\xff\x9dX\xae\xfc\
-5\xfa\xf4\xc4\xfa\xbb\xbe\xbe\x87\xd7\x9de\xae;\xe2\xf5\
-\x03A\xcdE\xc4\xb3\x19\x1c\xa2F\x0a}\xd1\x19\xfa\x1b\
-\xfb%lv\x1e^\xd3}G\xf7\xa9\xa3~\xa7i\x83\
-\xa6\x19\x9a\x96h\x1a\xb3\xa1=\x9a&iZ\xa5i\x98\
-\xa6m\x1b\x9aw4.l\xc6\x8e8\xa6\xc0\xbal$\
-\xf6\x89\xc5\x0f\xe9\xd2b?\xa4\xc5\xa98\x15\xe5\xb4/\
-&\x9a\xd9\x1b\x07~i\xa3)\x9f\xb4\x82\x8eqB\xb1\
-oZ\x9f'1\xae\xb3,\xc4\x17\xaf=}\x8e\xff8\
-\x0b\xfe\xcb\x12\x18\x89P\xb6\x18\xff\x05\xb4/\xb5\xd2\xfb\
-\x08\x02y\x08#\x8a\xfd>\xfb&]JJ\xa2\xf5\x0e\
-\xc9\x9e\xd7r\xae\x1fE\xc0\x8c\x10\xc5\xfb\xa5\x22\xbfY\
-|\xb6\x12\xc8x\x84}'\xfb*\x998N\xd0\xa1\xa0\
-\xf5)$z( \xe3$\xb8\xfeD\xc4?\x5c\xc3=\
-V\xafs\xe6\xbb\xb8\xc8\xfbf\xf6E\xd2\xf3\xba8:\
-;\x1fj2r\xf9P\xf4\x93\xd6\xd4h\xe0\x9e>|\
-p\xffO\x22\xfe\xe1\x1a\xee\xa1\xdc\xbe\x16>\xeb\xd8\xef\
-3\x82\x91\xe3\xfe\x938OLL\x14\xcem\x8c\xf2\xf1\
-\x94P\xb7\xe3\x09\x02\xfdP\xcfh\x1d\x9e\x8d]@\xdd\
-\xa3\xac3\xa7O\xe6\x89\xf8\x87k\x8c#\xaa\xc3g\xf6\
-\xe1;\x9f`\x1eM\x09\xbe\xcb\xb0\x12}\x0f\xe1Z\xcb\
-\xf3+\xb3\x18\xb1\xe3\x11OwnfX\xfc\x87\xc9\x9c\
-\xd3=\x878\xdb\x83\xba#\x0e\xfd\x99\x9d=sJ\xe4\
-\xfd\xfc\xb5\x0b\xbdC-\xea\xd5Eb\x19v\xe7x\x19\
-\xa4\x1f\xcc\x07O>\xb2x7\xc2x\xb7?\x1f\xf5\xc3\
-\x98p\x93P\xa7'G\xa9n\x81\x1b\xf8\x97;g\x8e\
-\xc72\xc9\x18c\xfd\xa4zP\x8fR\xcc\x03Y\x1e\xac\
-\xe7\xcf\xd6\xdb\xa0nF\xb2\x9b1J\xf3\x8b\x7fZ\xef\
--\x19\xeb\xf0\xb4E\xaf\xfc!\xe8]\xf9*\x09<\xd6\
-\xea\x9fT\xcff\x88\xf6\xb5K\x14\xfao\xf5%\xfe\xa5\
-\xfa\xac\xd0\x0fMM\x1c\xc6\xb2\x10\xe3\x1d\x14\xc19\x9a\
-_\x07\xda\xaf\x05+\xe1\x98\xbf\x9cO\x5c\xf9\x02\xff\x22\
-\x5c\xc6:V\x92\xd1\x81-\x12\xb8\xbf\xac\xbfd\xbb\x0e\
-\xd7s*\xd4\xf5\xde\xe9nLa\xa7\xf8?M\xe1\xff\
-\xb4\xd7\xf0o\xc6:B];\xeau\xac\x8a\xdew\x98\
-\xf4l\xa1\xc6\xbd\xa0+\xc2\xd2\xba\xda`\x9b1\xc6\x89\
-\x8dwa\xa3\x7f\x1a\xa0\xce\x1f\xdb\xd8\xb4\x80\x8fh\xb6\
-p\xf6\x81\x8c]\x8ch\xfbq\xcbK\xf8\xb8\x83\xb1\xd1\
-SI\x1f\x9f<}\xf2\xb8V\xc4?\x5c\xc3=\xe17\
-\xfe\x99;^*\xf3\x16\xb6\xa1za\x9e\x97\x85\xb9J\
-G\xd3=\xe8\x9b\xfe\xe5\xc9\xbaF\xc2\x074\x18\xbfx\
-\x1e\x81\xc1\xa8\x1b\xda +\xd3Ty_B\xfcg\x22\
-\xfe\xe1\x1a\xee\xc1o\xf8\xcc`|g;\xe6\x91_\xbe\
-\xf7\x97\xa8Ck\xb0\xcc\xcdl!\xe29z\xa9]\xf1\
-\xde|\xaeE6\xa2>uca\xfc\xebl\xe4?'\
-\x8f\xff\x0b\xf2\xb7HJ\xfe\x16\x09\xf7l\xe7\x1d\x0b\xff\
-k\x8c\xb6g\x1b\xf2\xb9\xe6\xdakg\x17\xf0\x90\xf7\x09\
-\xa9\xd9:\xe4\xf7,\x8d\xfb\x83\x1e\xb6\xef\x02\xd2l+\
-i\xccj\x03k\xf5\xf3K\xc9?#(\xfcO\xb5\x95\
-\x7f\xea\xe5\xe8\x22\x18\xf3\x862.zX\xc7\x83\x96>\
-\xe0X~,\xa4\x98t\x0fi\x8d\x896q\xb6<\xc7\
-\x13\xbaOG\x9c<n\xb4Y\xef\x09\xf9\xea\xd2tL\
-f\xa6\xc1Rn\xbc\xda\x22\xffoI`\x17BK\xde\
-V\x91\xd2K3e\x9a\x18\xbd6\x03\xede\xad\xe3B\
-\xc7\x19\xc5\xba\xce\xc3\xb2=\x19\x07\x8f?l\xb9\xaa\xc4\
-V\xa6:\xf2Hw\xda\x91\x87|\xa6-\xc7r*\xa9\
-\x8c\xd9\x91\xee\xb0:^\x8cE\x1a-\x9e\x81\x95\x8d\x8f\
-\x8de\x12\xe2\xa3\x1d\xea\x05\xf2\xf2U\xbd\xad\xbd\x9fQ\
-\xb0\xe1j\x8bu\xc8\xf3`>\xa8\xf6\xb0\xf4\x9c%z\
-\xee%q\x8d\xf0\xc0\xcd\xb5\xdd\x18\xf4\xcfd\xcb\xb3]\
-\xcck\x87\x0e\x1f\xe2\xfd\x97\xf1\xa0\x16!\x9a\x87C\x87\
-\x0e)\xa8\xb7N\x1a_\xab\x8c\x07k\xe4\x07\x18\xab\xc3\
-\xb26\xd5\x15\x90\x0e\xbex\xb6\xc4\xf7{:OCc\
-\xdc\x5cc\x1e\x01\xddz6\xd3d\x13cD\x19\x0d\xc5\
-;\xf4\xbb`\xf5\xd7\x10\xefZ\x16\xa8\xd7Z\xe2\xd1@\
-\xf9\xd7\xef\xa7\x89~\xd9\x8e\xb8\xb96\xfdX\xa7\xb7\xee\
-\x0d\x0ab\x8f\xcc\xe3Jo\x13+\xc9\x1d\xba\xd9\x85r\
-}\x9byR\x99\xec=^\xf4\xf5(\xfa\xb9\x00\xdf \
-O\x03\xe05\xfa\xc9U\xd6\x07\x94/*\x1a\x9e\xc0:\
-\xba3\x8e;\xd2\xe7t\x05\xc8\xf3+\xe1>]i]\
-\xff$P\xc7B+\xc8oLZ\xad\x82\x92\xcd\xbc/\
-\x11\x0b\x9d\x07\xf2\xf8\xfe\x98\x00\x8b0fJpV@\
-8\xe5\xbfD\xd0nt\x9e\x80gXh\xc9\xba^\xaa\
-\x83uU\xda\xae\x9d\xb4\xbc\xc8\x9710\xb5:a\xbd\
-\xa9c\xd3D\x1ffw\xdd\xa0{\x1e\xf7&6C\x88\
-\x91\xa3\x98V\xe2\xe5p?\x86@.\xe5O\xe9\x0a\x81\
-\xb1b\x1f\x84[\xfa ^\x19]\xf16\xfb\xa4]\xa9\
-\xc9t\x1f\xecrc\x9f8\x91\x15\xe3Y\xfah_\xb6\
-\xfb\x7f\xa3\xe85u37\xe4\x98G,~\x0e\xf5\xc2\
-Y\x1f\x9c\xf9*\xc5\xfdT\xd7\xb8\x97\xed\x03wx\x91\
-\xb0\x87\x17d;zm*\xcd\x8b\x94\xce\x07\x97P\xae\
-.\xc4\xdb\xd0%zW\xa6y\xf92\xa3M\xd7\xd1g\
-\xe1K\xdd\xe0\x8f\xddll\x82\xf5J\xd7\x09f%t\
-/\x85\x5ci\x1f(\xe5Eb\x1f\xf0k$\xab}^\
-77\xe6\xb7%\xa2\xcd\xa6N\xcfy\xf5<\x99\xb3=\
-\xaf}Z\xe1>\x1e\xd6\xd4c2LZ\xab\xfd\xa8b\
-\xf9m\xbc'\xb8\xf7\x12/\xb2\xfa]\xb9u\x93\xf7\xa9\
-9F\xe1\xfe@\x87gz^\x8f\xad\xcd\xb1F\xf1\x0c\
-\xc2\xcf\x0d\xda\xdfH\xaf\xef\x0d\x8a\xe9\xde-\x9e\xa3\xa8\
-\x0f\xdc\xe5E\x12Yn\x19l\x8b\xa21`\x10pD\
-\xf8\x98\xd6;\xb8\xd7\xe9\xa4\xeb\xb3\x14\x852\x85\xb6\xa2\
-\xdf\x16\xe0\xab\xf9X\xe7\xb8\x8b\xfb|\xf3\x22\x96\x15d\
-;T?\xb4U(\xabHFy\x9f\xb0\xc76\x1a\xbd\
-#\xd7\xb7\xce\xbb\x93\x14\xees\xe7\x11>j\x91)(\
-]\xdf{\x11\xf7\xf9\xe6E\xc2\xfe\x80\x15\xe3=\xaaP\
-^\xa4d_<\x89^kx\xf1\x5c\xa5\x9c\x13_\xce\
-R9\xa6E>\xa5L\x97\xc3+<\xc7\xeb\xbcH\x22\
-gy\x5c\xa1\xdc4\xde\xa2_\xe4\x85\xb5(U~g\
-\x85\xfa9\xf32\xdd\x92\x0b\x9a}A\xf7^\xe3E\xb4\
-\x8cD\xe1\x18\xc8A\x1d\xaf|\x9f\x93\x198\x1b\x1fl\
-\x91\x0a\xd7\x00\xad\x94\xcbe\xe3\x0b\x02\xf7\xf9\xe2E\x12\
-]\x8e\xa7\x14\xae\xfd\x22\xc5w\x8cF\xbd7h\xbf4\
-\xea\x04\xba*w\xbdxv\xc2\xba\x94\x07\xfa\x94\xe7x\
-\x95\x17\x09\xbc\xdcr\x86\xb3A\x01\x1e\xf6\x88q\x02\xf2\
-\xc3\x83(9[\x13\x05\xfb\x90;\xa2\x8fI\x16\xf71\
-\x0f\x99\xe7x\x8d\x17\x09~\x8a,s\xc1\x08\x05r\x97\
-\x0ck\xec+\x9d7\xe8\xbf\x9f\x82\x18\xd1\x1a:\xbeo\
-!\xe19^\xe3E\x12?Z\x1a\x05\xbeF\xfb\xe5\xe7\
-lL\xab\xe7h?\xb9Jx\xff6\xd1\x8f\xb0N\x9b\
-^\x98x\x8eWxQ\x96\xd1@\x9f7mS4\x07\
-\xf0\xfb`8\x170\xe6\x87\xf6\x03P\x97\xdeUys\
-\x0d\x18\xb7\xd9Q<\x08\x9b\xb3\x93\x87\x8b{\x87\xbc(\
-B\xc6\xe76O\x8fd\xff\xc8\xf1\xeb\x11\x9d\xd2u\xd0\
-:\x8e\x13m@<\x88\xd3l\x95A\x85:\x89u \
-\x1b\xf7R.M-|\xb8\xb7\x1b\x07\xb4_x\x174\
-9X\x81\x8e\xd7>\xc4]~\xfd\xe0\xd7R\xe0\xef5\
-\x9b\x8e\xcb-M\xd3\x83\x0d\xf4\xb9\x95?\x9e\x9d\x14\x06\
-\xdc\xd3}0\x86\xf6\xcd\x1f\x1ebr\x86\x93g\xb0\xcd\
-\xae\xf6\xa1\xb5\x94\xe2_jW\x0e\xba4\xa8\xcf\xd4T\
-\xc1\x9a\x17\xf4\xfe\xea\xc3\xf3\xf0^B\x8c\xa0#\x12\x17\
-\xa7f&\x07\xe5\xf0\xb1%(\x9f\xf9C\x09d\x17\x22\
-\xdc\x8b\x00u\x1a\x1a\x11\xcc\xc7\x96`f\x96\xc8\xe4\xc7\
-\x01\x9c\xe9\x03>\xe2lq\xd2\x00\xdb\xecj/\xd4T\
-\xc4\x89h\x9f\xec\xc8N_\xce\xae\xfc\xfc\xb9\xb3\x8c\xd1\
-\xc0\xb5E\xdb*\x87e\x19X\xf6$\xe8\xff\x9d<~\
-\xcc\xc6\x076\x80\xe4|\xbc%\x81K\x85\x10\xf7\x22\x5c\
-\xc2:Z\xf8\x90\x10\x8b\xcd\xea\xeb\x1b\xf4\xec\x04]G\
-^\xdf\xd4\x19\xfe\xb3\xc0&\xd0.~\xa6\x03;q\x89\
-]9\xd83G\x81]\xe7\xe1\x83\xfbW\x81}\x1b\xe8\
-\x18\xdb\xc1i\xe1\x13\xf4_\xf7%\xc4\x7f\x8a:\x81S\
-E}(\x80\xc9\x819t\x1c\x8e\xef\x0a1\xeeE\xf8\
-\x0e\xeb\xca\x84\xfb_\x11hV\xa0\xcd\x96\xa8s\x17\x09\
-\xfa\xa6\xa7O\x9e\xd0\xd28\x90\x02\xe0\x0c\xec2\xd1N\
-6\x0aq\xea\xd0N\x9f\xea\x9f\x91hSn\xce\x07\xec\
-\x12\xcb\xa2h\xbf\x0d\x9e\x95\x17v\xfc\xb3XW\xbe\xde\
-\x14M\xee\xca'N\xf2\x10\xb7\xb2zb\xbe\xc2\xff\x94\
-\x00\x0b\xfe#\x8a\x00\xeeE\x88\x10c\xb9\x14\x18\xfe\xad\
-\xbe\xecB\xf19\x91\xff\xfc\xa4\x80\xffdP\xfc'\x82\
-\x1f\xabd\xce\x89'\xf3\x0c\xe2\x1e\xe2\xf6\xfcQ\x84\xf0\
-\xff\x87\x18k\x88\xd2u\xf4\x1a\xff\x815\x8e\x13\xfa\x97\
-\x9b\x7f]\xac\xb5\xd8\x13\xd2\xf9\x17\xe6\xf8\x9d\x1b\xf7\xd2\
-q\xcfN\x14!\xfc\x9f\xc0:3\xbb7\xed\xc5>\xb0\
-\x99\x7f\xabp\x1c{\xca\xc5\xfc\x9bIp\xd7Fn\xfe\
-\x95\xc3?\x1f\x1f\x14\xd7,\xa2.\xb7\xa7\xebOu\xfc\
-n\xbe\x0c\x8a\xf7\xd7%\x90T\x84\xf0\x0fu\xadC\xcf\
-\x01\xf1\xf1\xd1\xd2\xf5\xa7+\x19\x10\xd8|7\xa1\xd7\x9f\
-\x09\xb8.\xdc\x1b\xb3\xc7\x17\xfb\xaf\xf6\xd2\xbd\x86\x04\xff\
-\xc9E\x08\xff\xc9Xg\x9b\x18`n\xee\xbf\xce\xa3\xbf\
-\x8a\xfc\xee\x7f=\x96?D\x04\x99D\xfcC\xec\xb7S\
-E\x08\xff\xa7\xc4\xb8\x8d\xe1A&O\xe5\x0f`'P\
-\xd6S\xdbU\xd6\xeas>\x00c\xad\xba\x94\xbf\x89\xfa\
-\xdd\xa2\xfcm\xaa5~3\xc4\xe7\xfc\xbb\x08\xe1\x7f\x9b\
-\x18S\x14\xe2\xe5\xf1\xf8\xd0ji\xfd?%\xf2\xb7_\
-\xac>X\xdc\x97\xbfe\xe7\xa4\xd0:\xf2n\xc9\x9fY\
-\x9d \x7f\x9e\x11`\xa4c\xf9}R\x84\xf0\x1f)\x9e\
-\xcbL\x09\x14lo8\x13G\xcb\x9f\xb7+\xc0\xc7,\
-\xd16\xe3\xda\xb5[\xf9=\x7f\xe9\xef\xe9\xf9\x0b5\x07\
-@\xfcgS\x11\xc0}&\x81\x8eNx\x7fc\x05s\
-/\xe8\xcb\xf5\xcd\xafm\x12%\x83v\xeb\xfcQ\xd0\x17\
-\xd2!\xfe\xb3i\x1e\xb4\xae\x08\xe0\xffW\x0b\xef\x09\xc8\
-D=\x04\x9b\xf3\xc7\x91\x0a\xce\x1f\xd3\xadv\x0e\xac7\
-\xce\x1f\xcb\xa0\xff\x1c\xe5\xe7\xef\xa8\xe3,\x89'\xfa\x0c\
-\x81\xf4B\x8c\xfb\x0c1N{\x04\xcc]\x81\x99R\x1b\
-[\xa5\xe7\xef\xbb-\xe7\xef\xf9\xa2\x7f\x9dE\x97\xd4\x13\
-\xfd\x13\x98? &nx\x80 \x83\x9b\x16l\x82\x98\
-\xbe\x1f\xba\x11C\xda\x95\xcc~\x1f\xc2\x15/\xe4w\x83\
-\xc0G\x04\xef|\xdc\xe1)\xc0\xfb\x03\xb2\xa4\xba\xa0O\
-)\x8c\xcb7\xcbj\x17\x96?=P\xd6\x03\xfd\xab\x1c\
-\xa3m\xfc)\x11\xff\x94,\x02bO_\xcb\xe7\xfa\x1c\
-\xe2\xd1\x87\x22\x0c\xce\xe7\xfe\x02\xe8a\x16\x1d\xdfx\x1a\
-\x9e\xbf\x88<8S\xd8w\xcdW\xd0\xfel\xb4\xcb\xf2\
-\x8a\x9f\x02\xab\xed\xb3g\xfa\x87\x06\x8c\x99\x19a\x1f\x13\
-\xfa=\x02)n\xe2\xe9\x01\xd2{\xe7\x08*\x1e7B\
-g\xfc\xcd]\xdcC,\xf2\x0fh\xdc\x87\xe3\xbc+\xf1\
-K\xd7H\xa1\xfea\x5c~\xce\x1de\xed\xed\xacuP\
-\xaa\x7f;\xd7 \xe8\xac\xf24\x00\xba\xacS\x83m\xf1\
-5\x81\xb9\x01\x9f\xad\x09|O@\x87\xb8u\x84\xa3;\
-\x18\xa3|\xa6\x82\xb8\xe6@\xc7\xe7\x08\xdcu\x81w=\
-\x81\x9f\xc0~o\x0a\xf2\x1c\x11&\x93\xbe\xcd\xc8\xc8\xa0\
-c<\xa9\x14\xd2>\xe0f\x82\xc5\x7f\x93\x17\xf4o\x0d\
-\x06\x83T\xff<Y\xa1\xfe\xf9\xd3\xb4\xdfT\xc8\xc7\x01\
-\xce\x02\x09<\x09g\xe0\x04\xd6\x12H\xc0X\xf0\x10S\
->\x9a\xc07\x04\x86\x81<&<P\xd8OG\x04\x8b\
-t\x9a\xc9\x83M\xdc\xef\x12FQ\xde1\x9c\xc0J\x02\
-\xb1\x98\xdfI\x02\xfbq}3\x11\xfb>H\x1a;|\
-\x0a\xa1\x13#\xec\xb5x\xbdyK\xbb\xdb)\xb4\x83I\
-\xa2\xf5\xcf\xa1\xcd^\xb1\x01\xd0\xea\xf3m\x7fA\x8f\xc5\
-\x0f\x19Bc\xad\xf7[p'\x897_\x96@e\x02\
-\x95\x08\x94\x0a\x0f\xceVI\xfb\x0c\xf0\x0fg\xca\x169\
-\x07\xe1\xd56zEV\xf0#P\x1a\xf3\xab\xc2\xcf\x15\
-\x81\xb4\x9e\x83\x003\xfc\xb3\xc9^\xf1\xaa#\xfb\x0b\x90\
-!lR\xd8\xe6/X\xc1\xa7 \xaf\xb3\xe8=\x1f'\
-6\xf6\xe2\xee\xd8\x1f}ldi\x1d^\xeb>\x1c\xf6\
-\xf5\xe1H\xc3\xc2z#\xd7\xa9]\xb5\xa8\x1f\x15\x11\x90\
-\xed\xb0\x9e\x11\x90\xa7\x7f\x8e\xcb|&\x04s(\x1b\x11\
-x\x22\xe8\xe3\xd9\x8cw\x9csMZ~\xce\x1d\xaf`\
-\xef)\xea\x1c\xb6\xa6\xf5\xa5\xbd\x95\x04[\x04Q\x07U\
-\xe7\xae\xfd]W\xd1\xe6\x97\xb7;\xd5y\x8f.\xbco\
-[n\xe7;\xe5y7|\xd6,\x16\xed\xef\xc0\xcff\
-\xff\xfe\xfd\xbdZ7\xf3\xe1DzL\xbak\x7f\xca\xef\
-\x053!\xd66\xd8y\x1a\xb8B\x88{\x961\x12\xda\
-\xc8KK\xa5\xdbxLa\x1b/\x8am\xe4\xe7;m\
-\x9ao\xec\xdfQ\xa7\xdd\xa4\xd7\xbbk\x7f\xbd\x13\xe3\x8a\
-3F\x03\xda\xc5\x14\xa28\x80&\xa4\xf7\xdb\x97\x92D\
-\xdc\xd7S\xa8o/\xca]\xc6\xb1\xe8S\xc2\xe4C\xbf\
-X2\xfe\x07\xdc\xf1\x95\xb0U\xec\x03V'\xd8\xb6\xf1\
-1\xdb\x1f\xa2?;\x83Ak\xf1-i\xb0\xca\xba\xea\
-)\xd4\xaf\xa5\xe5\xbe\x15\xack\x1e\x9d\xefy\xa4\x9e\xf5\
-\xd4\xff\xc6N\xa9\xff\x0d\x00\xf0\xc7]\xd0)55U\
-\xce\xffFS7\xe8^\x94\xf9>C\xfb\xb4\xf09\x9f\
-\xd4S\xb1\xbf\x05\xdf\x9e\x1e\xf9\x9f\xb9\x9a\xceYdD\
-\xbc/-7\xc6\x01\xd8\xe3c\x08.\x0b\xc0=\xc5t\
-okSK\xf6J\x19\xe2\x5c{\xcc\x8dv\xdc 0\
-\xfa\x96\xe6\x98\xd5>L_0<U\xe2[M\xf4\xbf\
-\xe4\xaeoM\xca\xff\x12k\x1dW\x9c\xf36\xa8\x13\xe2\
-\x84\xf3pJ'A\xd4u\x8c\x8fse\xcb%\xeb\x17\
-\x0e\xd6\xf7\xe3\x14\xc5\xdb\xb6\xdd\xe7~)\x9e7\x15\xa4\
-\xff%\x19\xd9\xb4\xe8\x7f\xecoO\xfd\x8f\x89\xb2\x0a\xeb\
-\xb8\x02\xbf0\xf2\xe3A\x1dO\xe9\x12\xa0\xff1\xba\x0f\
-\x1c\xee_\xa4x\xd7\xf3\xf6\xc9\xedpou\xdb\xcd\xba\
-o!P\xc5\x17k}w\xf0/\x89Y\xd1(\x1f\xfe\
-\xf7\xe6\x82\xcc\xcep\x8d\xa3bG\xa3\xcfn\xb2&\xa4\
-\xed\xc8\x13\x12\xf68\xf4\xbf\xa7\x8e\xb6\xe2_Ox\x8a\
-\xc9\xe27\x81\xf2\xbf\xc7\x1a\xc4\xba\xce\xf7\xd0//\xc8\
-\xd7\xea\xdb\xfa\x86~8k\x08\xf0\xa7a\xf5\x83\xc8\xd7\
-\xa5%\x81C\xde\xf6?I\x83R\xff\x932\xb1\xd8\x83\
-Q~??\x1f\xfe'\xf7\x89vuFN\xb0K\xd5\
-=d?\xac21o\xbc\xe1\x7fu=\x9ee6\xa2\
-y\xac\xd5\xff\xea1\xd7\xfeW\x05(\x81\xf2\xb0\x91^\
-\xf0\xbf\x1ag\xb5iDyL!\xf1\x81\xcbJ\xc68\
-\xe2\xedo.\xff\xfe\x9e5\xb8\xbe\x9e\x8b\xfaE\xa0\xe3\
-U_\xa1\xff\xe1\xb9\xf8n~\xfd\x0f?@~\xdf@\
-\xdc\xdf\xc2\x98/l\xbe\xd0\xf5\xb0v\xb1\xe5E\xd5}\
-\xe7\x7f[_P\xfe\xb7o\x12\xf8\xca2\xd7\x8a>a\
-\x0bi|\x12q\xde4\xd8\xaeM\x8b\xaa\xff\xf94\x02\
-\x1f\xd0\xfc\x8f-D<\xc7Q\xbab\xca\xb59\xb7c\
-\x05?\xb3E-\xfe\x02\xf0\xadg3\xcd\xbf\xd8\xcc'\
-zc\xe1\xc6\xbdToB\x02\x15\xc1O`!\x8f?\
-r\x11\xe5\xfd\x15l\xeb\xce2\x06C\xd1\xc0=\x9d\x8c\
-\x19Z\x9b\xd8\x8d8.\x9a\xe2\xf9Aa\x8a\xbf\x03{\
-\xdf/x}qQ6\x81:d,W\xc4c \xc9\
-\xc7d\x14\xe3O-)\x04\xf1\xa7\xa0\x0e\xad\x0d\xac\x18\
-\x7f\x8a\xb5\xd9?<*\x09\xf4PX\xa9\xdc\x8b\xe3c\
-\x9f=Q\xc0\xf1\xd7\xb2\xb1\xac\x89\xfc\xde\x80\xb3\xc6_\
-\x83qj2\x18\x0a\xe5\xf9\x90\xd7\xce\xd1r\x0cR\x9f\
-~\x22\x7f*\x87:^b\xfc\xc1\x0c/\xc6\x1f\xcc\xc0\
-<\x1d\xc4\x1f\x14|\x8a\xa7$\x9dg\xfe\x0b\x89?O\
-\xe68^O]\xe2\x0b\x9e?\x17C\xdd\xc9&\x1e\xc4\
-\xdf\xd4\xa2\xdd\xc9^\xd4\xbf\xff\x04\xf5\x90!\xaf\xd2\xac\
-}\x9f\xf3\xf2%\xe0\xf5\xf7\xef\xdfg\xfe\x8b\x09\xec\x1a\
-\xf8yY/\x8d5\x22\x1b\x7f\xb6\x96\x93\xf8\xb3m\x10\
-\xcf`\xf3\x13\xca\xca\xc4\x9f5P\xb1\xd4\x00\x8cF\x96\
-)N\xb6I\xa7\xd3\xda\xf8\xdb5Hp\xe8N\xfce\
-\x96\xd2{\x11df\xc5\xf8v\xfbl<3\x1b}c\
-+\x8f?\x0e\xcf\x83\x1f\xe1\xbc\xb3g\x8b\x11\xe8\xe5$\
-c\xa7\x9f\x87\xb6\xcd\x0e\xe3\xbf\x14'\x9f\xe0_\xb4\xd3\
-\x1f\xe9\xcc\xae\xbc8\xf9\x0c\xff\x8a\xec\xca\x8b\x93w\x93\
-h\xa7\x1f\x1fK\xe3]\xb9]yq*N\xc5\xa9P\
-\xedE\x1d\xa7\xdcP\xf7\xae\xa9\xecr\x19&\xd4z\xdb\
-\xf2C\x1e\x5c\x87Y\x1e\xb1<\xa4\x86k\x7f\xeb\xe3\xf8\
-\xc2\x03\xe1:\xd2\xf2*\xbe\x9c+\x5c\xf3/k\x84\xeb\
-`K6\x98Q\x94p\xad2S\xee\xef\xadY\xf2\x99\
-\xde#\x1fO\x96&\x7f:\xf3\xd7\xaa\xdc\xd0(\xfe\x9a\
-\x14\x15\x9c\x1b\xaa\xe1\x0b#E\x85i\x82\xf3\xf8\xc2\xc8\
-ug\xb5\xff=\xfe\x9a\xfc\x1a\x19\xa5z\xc0\x17\xac!\
-\xa5\x90\xcc\xa3\xe0Z\xcd\xf8\x93\x9b\x91j\xa8\x04\xb9A\
-\x1e\xee\x0c?\x93\xebP\x92IX\xaep\x1d\x06\xf8\xc9\
-\x83k\xc8\x9ed\x92\x07\x95\x83\xecI\xed\xef\x09\xd7\x91\
-\xa42P\x00\x8fW\xbe\xf6\xe4?\xf9\xce\xb7 \x92\xfc\
-\x7f\xc0\xa8\xa0\x05L\xe7(\xfeZ\xc0-\x7f\xed/\xe0\
-V\xcdD\xdec\xfcy\x04\x05\xab\x99\xce\xb6\xd7\xc1\x02\
-\xce5\xfc5\x8f,\x95\x86/_L\xfe\xbe\xb8\xbe\xc7\
-\x04\x09W#\xa1\x5c\xfa\xdaO\xb8\xeeb{M\xda\x82\
-\x13?\xdfF\xe1:Jz\xcdX;\x15\xee@[\x04\
-\xbcu\x81k?\xe1\xdaJ\x04\xf4u\x14S\x8dQ\xf1\
-\x7f\xe0\xba4\x13\xaca\x9e\x14\xae\x83\x05\xeaR\xf1}\
-*P\x97?\xde\xc0\x9f5<\x15\x094\x90+R\x91\
-@'aya\x02\xcd\xd0\xb4D\xd3\x18M{4M\
-\xd2\xb4jC\xc34m\xd34O\x8f\x05z\x8c\xd0c\
-\x87\x1eS6c\x8d\x1e\x83\xf4\xd8\xa4\xc7\xac\xcdX\xa6\
-\xc7\xb8\xdb\xfcA&5f\xac\x1d\xa6b\xea`\xdbU\
-\xcc\xbe\xb2\x0c\x0f\xc5\xa98\x15\xa7\xe2T\x9c\x8a\xd3\x7f\
-)\xc5\xc5\xc5\xf1:\xee\xf1qq\x16\xff{\x09\xb1\x02\
-\xec\x8d\x89)F\xd0\xa3,c\x89\xdf\xcd\xfc}8\x81\
-|Z\xf4\xecm f\xd7\x8eb\x1ax\xd4el\xbc\
-\x8d\x0b\xdf\xff~\xa4\xcf\xab\x02$\xc4\xc5\xfaYdn\
-\xb1\xc5\xfd\xff(\xf7\xbf`S\x13\x0d\xfd=\x88\xc0?\
-\x08o\x884P\xdc\xff\x8fn\xa2x}U\xecw\xf1\
-\x9c\xf50\xde\xe3\x7f/N\x8f|\xff\xd7#\x90L\xf5\
-\x7f2\xde+\xee\xffG$]JJ\xe2u\x8eh\x9d\
-\xf9\x8b\xe7\xcf\x89z\x16\xb2\xfd\x0f\xbf\xc13V[J\
-\xc1\xdfR\x86^_\x8c\xd0B\x9c\xb4\x1a\x0dc\xb4\xc6\
-\x11C\x1bOY}3\xe6\x02\xe9\xdf\x98=;\xc3H\
-\x7f'Q\xfd\x9f\x04\xf7.\xd0}/\xd51\xe3\xe8k\
-\x1do\x97T\x9c\x1eN\xe2\xf5l\xf5z\x8b\xde\xb3A\
-k\x94\xe93\x1d\xd8\xb1\x82\xeew)\x02U\xd1\xce\xad\
-\xb5\x91\xe3\x9e\xbbt\xf1\xfc\xa8\xbd\xea8V\xec\x7f\xb8\
-&\xf7\xde2p\x5cg\xf4u\xd4\x00\xdf)e\xd5\x1f\
-\xb7\xd57\xbcj\xcc\xb4\xb1'f\x0b\x91\xdf\x95G1\
-\x81\xdf<\xd0CLOM\x93\xb3\x11g\x0c\xc2\xf8/\
-\x83>\x1a_F\xdf\x03\xcb\x08\xfc\x85\xbe)\xc0\x87\x1b\
-\x0bz\xea\xe9i\x9a\x1b\x07\xf6%<\x10\xfb\x1f\xae\xe1\
-\x1e\xea\xb0\xb3\xf8\xec\x11|w\x19\xe6\xd5\x13\xf3.\x9b\
-m4\xa8l\xfdL\x88~9\xd1\xa7!\xc7\x15w\x98\
-\x97RNV\x96\x85\x97K\xed\x1c\x08\x0f\x08$\x9f\xb5\
-\x09\xbc\x8av\xb1\xdb\xb1\xef\xae\x12\xb8\xefHw>#\
-Mc>\xb0\x7f\xafE\xcf\x1e\xae\xe1\x9e\x13]\xfb\xfb\
-\x98g\x12\xda\xdb\x81\xad\xf9k\xe8\xf7'\xd0\xc6\x96M\
-g\xd5uNOK+\xee@\x0f\xd3\xed\x1b\x19\x94\x9f\
-n\x96\x1ak\xbc\x7f\x8b\x1a\xe8;}%\x81S\xd87\
-\x8amU<\xe8\x7f9\xb8\x86e\xafD{\x82\x9ad\
-^P\xd9\xf0\x04\xbd`\x9bf>p\xa2\xb8C\x95\xf2\
-\xf94\x8du\x1d\xa7\xb3\xf39\xd0\x16}I\x1c%p\
-\xddS\xbb</\xf5?\x0d\xd7\xb1N\xf3\xd0\xf7J\x08\
-\xed\xc3C\xbc6\x1a\x8a\xd7\x8c\x8e\x92\xc03\x05H\xd1\
-^\x92\xc6h\xefA`\xb5\x9b\xbe\x84\x0a\xb2\xff\xa56\
-\x9fk\xb0\xce\x16_\xedF\xa3\x86\xf6\xfb[\xdc\xe1t\
-\xdf\x1b9\xde\x86D\xc2\xeba\xbc\xbf\x84\xfeE\xb2\xbc\
-\xe9\x03\xc0\xc7\xfdo\x89\x93\x89~\xa0^\x92\xfaZ\x01\
-;\x8e\x82\xf2)V\xa8\xf7q\xf4\x9e\x1a\xfb\xdd\xc0r\
-~\xc8\xe7\x7f `\xf2\x81\xff\x87\x82\xea\x7f\x11\xa0\x0d\
-?\xf2m\xd2\xe3^\x92\xb3\xfa\x835\xfcGm\xa7t\
-l:c\xc8\xb0\xb3!\x7f\x8c\xc0L\x02)>\xea\x8b\
-\x87\xd1\xff\x22\xa4`\xdb\x1e\xa3eJ\xdat-\xa3\xd5\
-\xa7\xfeg\xfa\x1d4\x1d\x85\xbd\xbb\x8e9\xbbe\x22m\
-\x07\xfa\x12\xc6\x82\xb9\xeb\xe3~xX\xfd/\xfa@\x89\
-\x15\xda\xca\xf2v\xac\xe9YZ\x0b?0\xd3\x1a\xb4\x8f\
-\xe8\x1a\xcf@\xd9\x9bR\xfevg(\x8c\xbfR\xd4\xfb\
-_\x04=\xf2\x82J\xf4|\xc0\xaf}\xb8Gs]\x00\
-\xf3\x1c\xab\xd3J\xe5\xe9\xcdp\x8dt\xbb\x00qo\xce\
-H\x97\xe9\xff\xf4\x02\xed\x7f\xd1\x7f\xc3F\x01\x07:\x1b\
-\x1f\xf1\x06\xf6\xd1Z\x13\xf0\xbe\xcdu\x99\xd6}\xb0 \
-'y\x11e\xac\xbe\xc6\xf3\x03\xf4\xb7f@\xf9\xdd\xd1\
-4M\xea?\xfb\xf7\xaao\x8a\xfd\x0f\xd7p\x0f\xf7\xf0\
-\x97\xf1\xd9\x9b\x9e\xf8\xaf\xf1\x00\xa0\xcc\x97\x0cz\xadU\
-\xa6\xacM\x7fd|\xd4\x00?3\x9f\xe5\xe8q\x0f\xf3\
-\xdep\xf4\xa9\xe7\x0b|\x82\xac\x96l'\xf5\xd0\x9f\xab\
-\x08\x84\xa3\xaf\x0e\x90\xcb4\xc84\x19\xab\x1c;\xfa\xcf\
-S\xa4\xdfS\xa9\xf3\xbf\xd4cG\xfei\x05\xbf\xe1\xd9\
-O;|'\x1c\xf3\xf8\x07\xf3\xbc\xef\xa3:\x03.\x86\
-\xd1\xb2d\x93A\xc3\xcb\x10\x8b\xfa\xb8\xe7\x92s\xa4\xbe\
-Z\xc7\x22.\xbd\xdd\xe7\xe0\x0b\xe7\x0f\xf4s\xd6\x01\xcf\
-\xef\x02\xa5gw\xa7N\x1e\x07\x1d\x80\xba\xd2\xf3\x7f\xb8\
-\x07\xbfI\xcf\x10\xc9\xdc\x1c\x84yu\xc0\x18L[\xd0\
-\xb7\xb0\xb7i\xc1\x88\xb8\xb1\xc8\x0e\xb35\xfa\x22\xcb\x07\
-`\x1e\xcbd3\xa4\xf2[\x18O\xb9^\xc4\x19\xc8\xe0\
-\x130\xdf\xa7\xa4\xbexD\x10\xe2\xcc\xe8\x99\xb3gN\
-\x8b\xfa?\xf5e\xf4?\xe0\x1e\xff\x8c\xf0\xce\x0ey\x1d\
-\x02\x8e?O\x86\xb2\xa6`\xd9\xd7\xbd\xd8\x1e\xc0\xcdT\
-Z^\x94\xc5i\x8b\x1c\x1f0\xf0g\xf3Z\xe9\xb8\x0f\
-w\xf7\x9c\xc6\x05\x9e`\xac\x0f\xe4}\xa8\x1aY\x89/\
-\x1bQ\xa6\xc4\x09{\x0e\x8c\xd7E\xe9\x7f\xd5\x22p\x96\
-\xea\x7f\xb8\xaeI\xeb\x7f\x99L\x10\xf3\x82\xf0a\xa3x\
-\xd6\xa8\xb3\xf3\x97\x83\xfe[\x07b\x0c\x10o\xd1\xf5\x15\
-\xa4\x81`\xba\xac\xa2B\x03\xe2X\xa3\xd6\xb3\x01\xc8\xd7\
-\xbc\x81\x9f\x9bx\xc6\xdb\xc7\x12\x83\x1c\xf5\xb4\x04?S\
-B,\xa8+W\x93d\xeb\xa6\x8e\xc7\xfe\x8f\x8f\x09\x22\
-\x9f\xb3\x08\x98\x10\xc8ul\x90\x18\xff@\xbe]{l\
-|LI\xf8B(\xd6i\x1b\xd6\xd1\x1b\xf4=\x16\xcf\
-\xb7\x19o\xc5\xbc,\x88D\xf3_\xa3\x10\xdfp\xb8\x97\
-\xe6\xfb\x13\x04\xdeE\x7f\xabV\x1fV\xa4\xdf\xb50>\
-\x14\xc4\x89\x80\xfe\xa7\xfc,\x95\x22\xd0\x01\xa1\x94\x1a\xed\
-\x02\x94\xe8\x7f\xc2\x99\x9e\x9e\xac\xd1Y\xc9\xf9\x1e\xd6\xed\
-]\xac\xab7\xd6\x03\xc3\x10\x87\x8c\xb7\xe2n\xfat\xbd\
-\x97\x9e\x81\xb1\x8f,\xfe\xc5^\xf4\xc2:\xff\x0a\xfa\xfb\
-n\xcc\x8aq4h}\x00c\xb6\xe2\xfaA\xff'\xc4\
-\xc7\x0915\xec\xec\x7f\xa2\xc9o\xb1\x0e\xc7\xbf\xac\x0c\
-\x9b\xe3\xac\xfe\xedl\xeb\xd6\x18\xeb\x9c\xeb\x85}\xc1\x8b\
-4\x9fcS\xd2\x0bg\xdfC\xdd\xd2\xb5\xcc\xc9\xc4\x0b\
-t\x9c\xb5\xa3\xf9l?\xf8\x5c\x1cA\xe6\xf0\x92\xb6\xe7\
-gZ\xc6\x94\x99\xe9Q=\xe3\xa2w3\xa2O/\xc1\
-\xdf\x8e\x85\x1f0q1\xbb<\xca3\xcb`b\xf4\x9c\
-\xdd:\xb1$\xc6Z8\x9fO\x1c\x1cA\x5c2\x97\x8e\
-k\x18]:\xe8\x9e\xea\x0be\xffKb\xa8\xfd\x96O\
-\x99\x0d\x9c\x05\xb4gqm\xc7\xaf\x81P6\xe6\xb9~\
-\x9d\x99\x8f[\x0e\xf11\xe98\xcb\xd3\xf8\xebl\x8c\x8f\
-\xec\x99\x0c\xded2\x09kMJ\xce\x99\x99\xc5\xaf\x11\
-\xdb\xa3\x8f\xd6\xfc\xc8\x926Z\xe6=\xae\xf0\xcd\x03F\
-\x83\x8e\xd6\xc9\x0b@\xd9\xb6\xa72\xdd;\xa8?QG\
-\xba\xa6\xd7ed\xe4ge*\xc4\xb2\x15\x01\xe2\xa3\x06\
-e\xfb\x01\x84c\x5c\xf8p\x8c\xc5\xea)\x0d@\xd2\x82\
-\xec\xce\xde7v\x1dl\xd3\x9d|\xc8\x8ag\xd0\xbeO\
-\xf5\x85D\x7f\x00b\x92\xb2\xb6q\x06{\xe4\xe3,'\
-\x0f\xe3\x7fU\x92\xee\xbbMZ\xadW\xfa\x1e\xc6?\xc6\
-\x99nE`1B\xab\xe9\x81H\x03\xc1\xf9\xa7\x01\x1d\
-\xea\xa7s\xf6q%\xbf\xc46zzf\xf4\x92\xb8\x17\
-\xd5\x81\x0f\xfcB\xa0gL\x9f\xe9\xa1^fL>\xfa\
-~\x91\xe8\xc3\xda\x80\xb1 \x0d\xf9\xa6s\xdbq\x8f}\
-\xff\x0c\x81#T\xcc\xf6\xa3d\xec?;-\xc8{4\
- \xc8?Ya=hH\xa3\xf7\x89\x8b\xf2A\x031\
-\xa2\xfe\x80\x10\xf7\xed\xe1\x9e\x13e\x929\x8f\xd2\xdf\xf1\
-C\xbe\x7f\xd7C\x9e\xff\xa5\xa5\xef\xc5xD\xc6t_\
-\xf5\xfdQ\xaa\xefE8\xe6\x0b\x1a`\xb9L^\x0eE\
-\xd9+\x94\xc3\xb6\xde\xf1P\x7f`\x06\xc7Z}\xebg\
-e\x1a\x1f\xaa|\xdfx\xd1\x22\xe3m\xe7\xa1\xde\xce\x03\
-\x9c\x1b+\xd3~\xebM\xf9\xf6\xe1\xedV\xdf\xfb\x94\x06\
-\xb4\x99\x06\xc1\x16\x91\xb5\xd1yX\xe3\xe1\x9a0\x05\xf5\
-\xe3\x98\x5cC\xe6C\xd3\x1f\xdb\xbbr\x1a\xed\x0f\xbc\x04\
-\xea\xb8y\xc2\xd3`m\x5c\x97\xcf\xc7\x90\xc1\xc7\xc74\
-\x19\xb9\x87\xd1\xf7>\xa5\x01\x9d\xc9 \xc4\xeb\xb4\xae\x0b\
-\xea\xba\x19\x13\x98\x86\x1fl\xce\x08\xf4\xe7\x1e\xce~\xcf\
-*\xfb\x825_\xa6\x87\xfb\xfb\xf66{{\xedC\xed\
-{\x9f\xd2@\x86\x8e\x93\xc6\x1ao\x8f\xb1'<\xd1)\
-}I\xb09\x13\xe6\xca\x82L9Y6\xf6\x96ep\
-\x7f\xea\x89\x5co\x84\xdehc\xcfU\x18\xfa\xde\xa74\
-@\xc7\x10\xcb4\xf2r\x82\x91\x88\x0bw\xf1\xb7\x81\xb6\
-/\xc8H\xd7\x14\xe0\x9a\x1f\xe4\xae6c\xdf\x13\xfd\xfc\
-o0\x8e\xa0\x97d\xdb^\xed{\xdf\xd2\x80\xde\xc6\x96\
-\xd8\x938\xdf\xa2}A\x0f!\xfe\x86p\xf6U\x10\xc9\
-D\xad\xf9q\x0eZ\xe3\xe1YNc\xcb9*\x01o\
-\xed\xef\xbd\xd8\xf7>\xa3\x01\x16\xfdRP\xeb\xc1\xc6\x1e\
-\x9e\x19\xad\xb6\xe8\x8b\x10\x1a\xc8\xcc\x97|L)\xff\x82\
-u\xac\x96^\xf3\xeb<8\xc3}\x97\xd6y\x85XI\
-\x85\xb4\xef}F\x03\xda\x8ct\xab\xcd\x8b /|\xd7\
-\x83\xb3c-\xf6\x01\x9e\x85\xfa\x9e\x07p\x06V<\xd7\
-W\xa1\xbd\xa3\xbb4\xbbM\x94e\x1b\xf2\xcd\xf7\x0b\xa4\
-\xef}F\x03\x12=\x82\x8a\xa8\xdb\xe0.>\xe7r\x82\
-M4c\xd2k}\xdb\xf7\xb62M\x88\xc7u\xcc\x03\
-\xbd\x86>\x22\xbf\xe2\xe9>\x1fg9\x05\xd8\xf7>\xa1\
-\x01!V]\x06\xea\x99\xf1<\xe0u\x0f\xce\x8c\x8fa\
-_\xf0y\xe8}H\x03|\x19V\x1f\x0c\xfd=\xd0}\
-\xfb\x83\xd6\xdb\xc9\xce\xcc*J}\xef\x13\x1a\xc8\xcc4\
-J\xf5\x88\xfe\xf0\xc0\xf6\xbc\xbf\xa8\xef\xe6K?4T\
-=\x03\xd1\xef\x81\xbb\xba\x9a\x03D\xbe\xef\xb9>\xd3C\
-\xed{\x9f\xd0\x80\x81\xd73\xb6\xec\xa7\x06z0\xaeV\
-\x8a\xba\xcezV[\x10\xfd\x0f~ON\xbbY\xc7\x04\
-K\xbc{\xd8\xaf\xb2\xc6\xa2\xda\xf7^\xa7\x81t\x1dK\
-\x9f\x19W\xc18\xa3\xee\xe0\xf6\x14\xf6\x89\xcft\x03\xd2\
-\xd2\xd2\x19\xbd\xc1\xb2\xf7{\xcdM]^\xd0\x95\x9fb\
-\xd4\x09\xfe\x91\xf4i\xfa\xa2\xde\xf7^\xa7\x01\x83>\x0d\
-m\xa3x>\x10\xee\xa6}\xc15\xec\x13Fk\xcc`\
-\xd2\xd3S|\xa0\xe3\xc1\xa1\xbe\x1dO\x03\xee\xae\xfb\xc1\
-^\xa2\x95\xc5/\x9bA\xf7(\xf4\xbdWi\x80\xd5\xeb\
-i_\x95O!\xce\xdc\xc1\xf1<\xd0\x0d\x845:\xf8\
-B\xf4v\xa2\xea\x06\xeb\xb7\x1dn\xd6m\x0b\xfa\xe1\xf3\
-@V]\xa8\xfb\xde\xab4@\xcd\xaf\xa5\x10g\xee\xe0\
-x\x87um\xad\xf3\xe5\xdc\xdf\x08\xed(\x95\xd6\xeb\x1e\
-\xdady \xe7-\x12}\xef5\x1a\x90\xe8\x0b\x8dw\
-s\x0eH\xc2\xbe\xf1\xc9\x1a\xc0d\xad\xd7\xcbn\xce\xfd\
-\xa0\xc7\xfe\xac(\xeb\xbd\x90\x94\xf6(\xf6\xbdWh\xe0\
-|\x92\x86\x8e\x93\xde\xc1M\xbb\x89\xab\xe8\xa3\x92\xec\xd1\
-\xbd\xab\x13\xa2\xd5s\xb4\xac\xca]\xba<\x8c\xf6\x93n\
-\xd0e\x91\xec{\xaf\xd0\x00esX\x15\xed\x8e\xddY\
-c\x8f\xb7\xda(y\x8f\x06(\xddN\x7f\xf4\x87\xea\xce\
-\xbc\xb4\xca\xba7\xd5=\xea}\xef\x98\x06\x14\xea\x96\x1b\
-8N\xb4\x1f\x08D\xdc\xb9\x83\xeb\xaf\xc9{\xfe\xde\x9e\
-\x03\xa8\xb1_\x0a}\xe2\xba\xa3\xdb5\xc5@\xf9\xe5v\
-\x95\xc2Q'?\xbc\xe8\xf6\xbd-\x0d\x04fY\xdb\x14\
-\x94\xa5|\xfc\x0b\xeb\xedp7u\xc4\xfe\x12\xd7\xd9\x9c\
-\x17\xf5\xc2\xa85IU7}v\xdcD?\x0a\x8c>\
-5\xc3\xa5\xdd\x8a\x88'A7\xbfH\xf7\xbd\x85\x06\xa0\
-\x0d\x11\xc1Y6t\xed\xeaL \xeb\xcc)\x11\xdf}\
-\xdd<\x13<\xe2\xfe\x5c\xebV\xff7ps\xedo\x10\
-\xcf']\xd5gz\xb0\xc1\xa6\xff\x09\xb4\x91\xe8h\x17\
-U8\x82m!\xed\xcb&sZ6\x13\x1ebR\x8a\
-\xefv\x88Cw\xf6\x00\x0d\xf2\xd3\xffr\xf1\xf1.^\
-\xb0\xc4Eh\x8d\xfe\xd1\x95\xd6\x07|\xe9\xd4\x17|/\
-\x9c\xb2\xc4\xd7\x92\x8b\xb3D\x8dy\x80\xba\x04b\x1e\x81\
-\xbe\x17!\x16\xdb\x84s\x9a\xad\xcdj<\xe2Y\xfc<\
-k\x1d\xff\x0d\x10\x87\xee\xd8\x88\xb4\x16c\x9d\xd01\xcd\
-\x94\xc47t\x14\x1f\x0fl$!6\x86\xc1\xc0vF\
-\x1f\xf9\x8a}\x1b\x81O\x9dS'\x8e\xdb\xd8\xda&\xc4\
-\x92v\xc6G\x93\xcfh\xbe\xdc\xf1\x81W\xe9\xb1_\x82\
-\xc02\x02\x0f\x1e\xa1\xfe\x87\xb6|M\xfa\xbd\x84\xd0\xc6\
-l&\x220G\x18o1\xbb\xd0\xee\xd8\xd6\x1e\x19|\
-\xd1\xa0?\x22wlh\xb3\xc9\xfa\xf1\xb9\x0b\xd687\
-n\xc57t\x10\x1f\x0fb\xe5\xd4\x83\xf8(\x107\x03\
-\xe2$\x80\xaf<\x97\x90\xae1\xa7iR\x0f\x83_%\
-\xf4\xb7S\x1f}l\x04\xd1u\x824-8\x93\xee\xff\
-\xde\x04\xb2\x1f\xa1\xbe\x17!\x1b\xdbf\xe1s\x90\xd4|\
-L:\xb1\xafx\x1f\x14\xe0\x9b\xa4>\xe0\x0c\xfcT\x81\
-_2\xc0\xa5\x12\x9cC\xdf@\x1c\x13\x8coS\x0fA\
-q|C\x99\xf8x\x87\xd17\x0e@\x12\xc4I\x81X\
-\x19\xe0/O\x09\xa0\x8f\xb5T*\x0f\xf0\xb32S\xf4\
-\xb7\x00u\x99\xc0\x5c\xa1\xe7\xfcr\x04\xfe~\x04\xfb^\
-\x84\xbf\xb0\x8dB{\x99lz|\x96B\x9f$g)\
-|\xa5\x02\x0e\x95\xe2\x1b\xfa\x06\xe3\xda$Qy\x1cV\
-\x1a\xdf\xd0I|<o\x82\x09}n\x90y&\x96\x99\
-\x12\x00\xfb\xfc\x5c\xb1\xff_\x22\x90\xf3\x08\xf7?\xb4\xad\
-\x07\xbf\x16,a\xe2\xe5\x1b\x80\x03\xc4y\x07\xc4\x8d/\
-p\xfe\x8f\x92\xf8\x86T\xffW+\xa8\xfe\x9f\xa0\xca\xc1\
-\xbe\xcf\xf6C[\x5c\xf3#\x0e_\x10\xf0\xe3\xe7\x01\xff\
-\x9c\x87\xd0\xff\x8e\xfd\x9b$X\xfc#\xd9\xc4G\xf56\
-\xff\x9f%\xf2\x7f\x00\x8a\xf7W&\xb0\xff?\xd0\xff\xd0\
-\xc6Jb\xbb\x0b\x80\xffC\x1f\x0e\xc2\xf5\x1c\xbf\xafs\
-8\xfey\xff81\xa2\x9f,?\xe4\x03\xde\x5c\xff\x91\
-\xb5M\xb4\xcd\xfa\x8f\xea\xff'\x09h\xff\x03\xfd\x9fA\
-\xa0\xa5\xa5\xffa?l\xf5G\xe4\xf9\xfa/\x1d\xd7\x7f\
-\x17\xec\xd7\x7f\xf1\xc2z\x8e\xe75\xce\xfc\x1b%$D\
-3\x87\xf6\xc6\xdb\xed\x1b\xc4\xb8\x98\x06\x8e\xdf\xff\xe5\xb8\
-#\x8f\x92\xdb\xff\xc1:\x13\xf6\x97\xe0\x8b'\x22(S\
-\xec\xff\x9e\x04\xae\xfd\x07\xfa\xff\x1a\xb6\x95\xb4\xd9\xc4\xe3\
-\x80\xdf\xffI\xf6k\xb8\xff\xab\xea\xa6\x8eu\x16\xd9\xff\
-u\xb4\xdf\xff\x09\xfb\xba\xed\x87\xf7\xf3\xf2\x1dg\x09h\
-\x80\xe7\x03j\xeb\xfbTL\xd46\xf9\x95\xffX\xf6;\
-\xf1\xc2\xde?<\xd0\xe2\x87g\x08\x81\xdb\xff\x81\xfe\xbf\
-\x8dm%\xeb\xbf\x1c\x0b\xdf\xa5\xfb^\xf4A\xea\x81\xbc\
-U'\xeaY]8\x9fh3\xdex\x88\xdf\x9d_\xf9\
-oC\x0f\xe4\xbfm\x9d\xc9#)\xfe?\x92\xc0\x9d\xff\
-@\xffC\x1bGL\xa5d\x00N\xf0\xdd\xdeM\x1d\x00\
-\xcbx\xf3\x91\xfc\xbf\x9a\x9b\xf2\xa8\x1bh\xd3\xc0\x5cN\
-\xe1x\xbb7i\x8a\x086\x8a\xfd?\x88@\xde\x7f\xa0\
-\xff\xf3\xb0\xad\xcc\xe4\x10{==\xf0U\x9b\x98b\xc1\
-w?7\xcf\x7f\x0e\xd3:\xd6>\xe8\x7f8[\xfc\xdb\
-\xdd\xf3_\xda\x8f\xb2\xfd\x99\x9f\x85\xff\xbf@\xe0\xca\x7f\
-\xa0\xff\xaf`[\xed\xce\x01D\xfbJ\x0a\xdf\xee\x9e\xff\
-\xfei\xb1\xa9\xf6b\xacAV\xf4\xc5$\xe8\x7f,w\
-S'\xe1'\x8e\xd5\x05\x8a\xbe\x0a\x9c\xf0\xff&\x04R\
-\xff\x03\xfd\x9f\x8am\x95\xe5\xff\x06\x83%VB\x90\x07\
-\xfa\x1f_Y|\x03q\xde\x1b\xff\xd9\xb9\xc9\x16\x9fL\
-\xde\xd6\xff\x9a\x1al#\xfb\x8d\xfe\x0f\xf4\x7f\x8cE\x06\
-\x1c\x9c%\xeb[\x81\x9ak\xdd\xd5\xff\x1a#\xe2\xf9\xda\
-\xb5[^\xd5\x01\xd4[\xf9\xd2\xcbho\xe0\xb6\xfe'\
-\xe8%\x7f\x1f\xf9\x9a\xed\xfc\x1f \xec\xff\xa6\x082\xe0\
-\xa8\xff@\xff\xcf\x09\xf7\xcfU\xf12\xe0\x00[=\x80\
-\xac\xac\xab4\xff\xf7X\xff\xd3\xe8\x03\x9fP\xf9\xd4\xff\
-\x1e\xc7:\xb0\xf7\x0e\x0f\xc9\xa6e\x00\x1d\x08\xb0\x8fp\
-\xdfs\x04:B[g\x06\x91uoH\xb6,\x8e\xd1\
-/\xc4\x047\xf9\xec%\xdc\x9f\xf9D\xff\x9b\xd2\x01,\
-\x8b1\xd0=\xb2\xff\x90\x9d\x03\xack\xc0\x92\x04\xd6<\
-\xc2\xfd\xff\xf3\xd4@\xbe\x8d\xb2z`\x92\x98\xc7\xee\xda\
-\x01oG_L^\xd5\xfd\xb3\xac\x011\x16\xb7\xc9d\
-\xc8\x97\xfd\x97A\xa6~\xbc\xef\xe5\x00\x0b\x0f\xe8\x842\
-\xd2G\xad\xefA\xb6\xfd\x1c\xbf\xef\xe3\xe9=S\xe2\x13\
-\xc6\xc6\xaf\xfdS\x18\xcf\xc8\x1d\x1c\xcf\xd1\xa7\x19\x04\xdf\
-\xc0:\xef\xdb\x00\x1b\x8d,\xa3\xb3\xc6t\xe9\xe5\xe6\x1a\
-\x80\xb7\xff4p\xc2\xfb\x10;\x81N\xd3J^\xb5\xec\
-\x03\xc2\x83\xb2\x02\xc8\xe7\x8cGL\x16\x04m\x99\x15\x11\
-\x9c\x19 \xb63\xaa\xb4\xad\xdf\x8bL#\x8713x\
-\x1cMu\x93\xf7_\xc5u\x19c&\xff\xb2\xb2\xb2\x19\
-_$o\xda\x7fgi\xf5v\xfb@J\x07\xa8\x22\x81\
-\xb5>\xee\x93d\x02\x7f $\xfb\xb8\xacu\x963\xbf\
-`\xd0\x01\xb4\x1d\xfb\xb9Z\xbdT\xc7\xda\x13\xfb\xef\xda\
-\xbe\x8e\x11b\xb0\xf5\xff\xf0\xad\xa7\xfe\x1f\xe4|\xd8C\
-\xdfO\x03Y\xa0\x9f\x85\x06\xea\x10\xd8\xe2\x03=\xc0\xfb\
-\x04~'\xf0\x14\xe8\x1a\x86\x0b\xfa\x86p\xbd\x09\x7f\xf3\
-v\xdf\xffI\xa0\x1e\xb4in\x08\xcbL\x0d\x80\xfe7\
-\xd9\x8d+\x0a\xb7ox\xe0\xff\xe1\x1b\x8c\xa1\xec\x13\xde\
-o\xdb\xff\xac\xd7\xfc\xbfpF[<\x84\x07g\xf0\xe3\
-\x83:\x13\x0a#\xb0\xca\x8br\xe1\x1b\x04V\x10xl\
-\xaa\xad\xae9\x83\xf7\xe0\xb7\x9b^<\xe7\x01\x1eV\x97\
-\xe7k\x81\xa8\xff\x1d\x90c\xeb\xfb!C#\xf5\xff\xb2\
-\xd5\x03\xff/}\x05\x99\x1f\xc7\xdbX\xfa\xac\xffmm\
-\xd4\xf3\xe9\xff\x89\xe5\xe5\x8aF\xa3\xd1\xde\x06\x04|\xf1\
-\x07X\xfa\xa5<\x81I\x04\x92\xf2\xd9\x1f\x17\x08|L\
-\xa0,\xe4;)\xc8$\xea\x1d1\xe1*\x8b\xfe\x19\xfc\
-6\x86\xc0E/\xc8\xf8\xa6\x12\xa8\xc0\xeb\xf9\x04\x0a\x00\
-tM\xa7\x8c\x8c\x0c\xc6d4\xd0>a\xfbz\xe0\x0b\
-\xf4\x08\xfa\xdd\xe7\xf3\xd0\xe9|\xeb\x03\xce`\x14\xd6\x98\
-l\xfe\xfc\xbfUp\x16\xd7\x0c\xceE\xc3\xc9\xfa8\x22\
-X\xd0\x0d\x0b\x0f\xce\xf4C\x1b\x8a\xaf\x09\xa4\x10\xb8\xab\
-\xb0\x1f\xe0\xb9\xcb\xa8s\xd52\x22$K%\xf69\xac\
-\xbf\xa7Xh\x00\xe6\xe5l\xb4A0\xa9P\x17e)\
-\xd2\xdc]7\xe6\x15\x0d\x81\x95\x04\xda\x912\xfc!\xbf\
-\x19\x81\x99\xc2\x9c\x1f\x94\xe5\xca\xde\xbb\x92\x07~\x15\x00\
-fg\xb2\x19*\xc0\xe3\xf5\xb4\x02\xf0\xff\x074f\xf5\
-a\xdb\x0e}\x10\xba\xeb\xff\xf1\x1d*n\x80l\x5c\x97\
-/J\xe61\x93\x99\x5c)\x8f\x0e\x22\xd0\x1c\xc7\xf1\x06\
-\x02'\x09\xe8P\xb7\xfa\x0a~\xc2>\xeb8\xae\xb9>\
-DY{ \x9d\xcf\xa4\xa0\x5cf\x9a_\xae\x95\xde\xc8\
-\xb5\x18\x13\xc6\x0a\x99\xf0N3\x02\x1faY\xa7\x08\xe8\
-Q\x87\x13t8rQVu\x06\xd7\x13\x13\x91n\x82\
-i\x1b\xb6\x09\xfe&B\xcb7\xec\xed\xe99=\xe5O\
-\x8f\x9fS\xdf'p\xcbM\x5cf\x88\xe7\xeb\x06!\xde\
-\x9e\xcf\xfb\x1f\xce'\x0d\xde\xf1\xff\xda\xc8\x12c\x17\xea\
-o\xb0?\x0b\x9d\x12\x98\xc9\xf3\x01\xc0\xe5\x84\x10\x9d\xb5\
-o\x84\xbe\x0a!P\x03q\xde\x05\xcf\xd4:\xa3n\xd5\
-c\xf8\xbb\xd5\x9e08\xd3\xba\xc7\x0c\xb1\x8f\x1d\x16\x11\
-b\xe2y\x02\x8c\xd5i~&)\xddA^5q\x9d\
-\xd8\x0dux\xbb\x13hM\xa0\x16\x99\xb3J\xd2\xf9O\
-,k\xd1i\xe5cK\xd9\xed\xa5\xb5Z\xde\xdf\x13e\
-W\xdd\x04\xd7\xf0\xee\xe2\xf1G:^pNj*S\
-\x10\x89\x8f\xb3\xc9\xe5\xdb\xff\xf3r\xa5\xfe\x9f\xc3\x83\x05\
-:\x08\x17q\x1cl\xb7vs\x08\xbcl\x19\xd6\x93\xbc\
-=\xb9\xeb}\xf1T,C\xb0\xd1\xc8T\x5c\x0e\xbf\x8e\
-\x08\x16\xe6yq\xcew\x88?\xdb\xf8P\xa5<\xd8K\
-\x99\xd1\xdf>\x1f\x1bP\xa7\xcf(\xd0\x98`i\x9ad\
-\xa9\xac\xd2\x13\xff\xef\xb0\x16\x1cn\x90\xc4yr\x95\xe6\
-\x91\xbdS\x84\x82\xfe\x08\xb7\xf8^\xf0\x5c\x16\x02\xfa\x19\
-.\xfb\x9d_\xd7\x0bt\xf2I\x85\xbb\x0a\xf8\xa7\xb5\xad\
-\xe7o\xdf\x86\xcf\xb7=\x8c\x8b\xbc\x8e\x96\xa9\x17tL\
-@!6\xba\xce\x1b\xf1\x1f\xda\xd9\xc4\x7f\xc8\xcc`\x1e\
-\xd5\xa4\xe7\x0c\xe8\x9b\x83\x15\xe7\xfe\x0exn\xe3Il\
-\xd8\xe7\xe9X\xd7\x05\x9d\xcc\x07\x13\xe9q[2\x1f\xf1\
-_v\x8b\xb1\xfet\x10s[\xa7g2L\x86G\xae\
-\xef\xaff\x99\xf8\xf1\x92b6\x888\x03=\xbdX\x0f\
-q\xf6-\x1d\xff\x85\xd3\xa6=\x946\x09\xf2&\x8b\xfc\
-\xa2\xad\x87\xb1~\x1f\xa0\x1f\xfbJ\xa2l\x10d\x18z\
-\x1f\xfb\xb2.\xc8t%\xd3\xc0\x18uZ\xb2\xcf\xe7h\
-\x1f\x9f\xeb<\x8c\xff\x94$\xdax\x1b\xb5l\x81\xf8|\
-W\xb8\x8e\xf1\xcfg\xfc\xb7\xa5(\xff\x12\xe2G\x13\x1e\
-\x99\xae/\xfa|\x80\xd3\xe9\xa5q\xc2\xcb\xe3\xda\xd7S\
-<M5\xb0\x9c\x1f\xbfg\xe4\xe0,\xed\xe1\xce\x97\x12\
-\xd9u\x8d|\xf04\x88\x89\xb8P\xa4\x01=E[E\
-5\x19\x09\xbf\x07\xdc\xa4&j\xe9\xbe_\x9a\x8f\xd8\xb8\
-\xbbP/\x0c\xe3n\xb2\x0f\xbd\x8d,+\xc4\xa3\xa6\xf4\
-C^\xcaG\xfc\xd7[\x88\x9fJ\xf49\x91x6^\
-T\x92\xc1\xa0\xc5\xf5\xb1\x0d^\xaa\xe0\xb8\xf7\xb4\xefA\
-\xd6\xd3\x9d\xc5X\xf3ZV[(\xfa_8\x17\xd2\xd2\
-q\xcf}\x12\xff\x19\xc6Q\x96\xd1X\xe8\xfb\x1eb\x17\
-\x1aX\x9bx\xd8\xf0Y\x8f\xc0/\x1e\xf2|\x917\x86\
-\xb3\xac\xd5\xb7\x9b\xd1P\xb8\xc6\x83$\x96\x897\xe2\xbf\
-Cl\xc4v\x99\xb8\xbf1r\x1c\xc6\x8a\xd2\x17\x8a\xb8\
-\xc7\xd2\x04\xb27\xbe\xdf\xf5\xd6X\xd8\xfc~O\xd0}\
-\x8d\xcdg\xfc\xf7_\xe83\x13\xb6\x10\xce\x89\xd0f\xc2\
-\xf5\x19\x13k\x89g\xd1\xccM[!G\xf2\x81\x11R\
-9!\xa7\xcf \xbc\xc0\xe4Q=\xa5v\xad\xb4\x9d\xa4\
-\xe8\x8f\xc8\xdd\x94\x9e\x91\xc1\x18\x8c\x9c\xf4<\x07d3\
-\xa3\x08\x5c\xcc'\x0e\x0e\x8a\xb1\xd2\xf4i\x19\x0c{%\
-\xaf\xd0\xc4~\xb7\xe3\x01\xe9Z\x86\x8e\xdf\x8ck\x81\xd4\
-|\xb6\xff\x0a\xea74\xa6\xe6\x18\x0b\x9e\xb3\xb2\x94\xcb\
-\xbc\x05\x9fS1v\xf6\xcdj\xc1\xdf\x11\x13\x17'\xd8\
-b+\xeew\x1b\xbd\x1d\x16\xc7\xa6A\x94\xe7\xaf\xf4P\
-\xae'\xb5\xe7\xebf\xf5\xe9\xaag\xae\xdf\xd5\x14\xee\xfd\
-\x0e5\x06\xf4\xac\x0e\xce\x88\x87c\xbcRs>\xe1\x04\
-\xc6H\xabh\xa5\x03\x01\xe7\xba\x0c\xd8\x0bi\x15\xf4\x7f\
-\x0cmk[\x0a}nt\xa0\xfd\x11)\xe9\x7f\xa0m\
-\x93\xc5N\x87\x95\xce{\xef{x\x96#\x05\xd2<\xfd\
-\xa0\x9c\x0b)64V\xd8\x93\xd9l\xb6\xc1\x09\x99\xb3\
-AWl\x9c\x07q\xad\x1c\x9d\x1doC\x1d\x92\xb2\xb6\
-\xfcV\x87\xe3\x8f%uHp8\xfe)?\x0b\xb3\xd0\
-\xdf\x8a\x09}R\x09~)\x1c\xf4\x7f\x06k\x90\xf2w\
-\xa9\xdeN_<\xbf\xbf\xe5\x85v\xc2y\xdah\x96c\
-\xfd\x9d\xe9I\x14Z\x1e\x00\xfb^\x83\xcd\xb8\x803\xca\
-\x08/\xf0C\xfa\xec\xe8\x0f\xd4'\xac\xa2\xb7\xb5\x99\xb4\
-\xa1\x05\x8e\xda;R\xfc\xbe\x16\xfaY\x11\xfd\xe3\x9cE\
-\xdft\x16\xffH\xc297K\xd6\x9d\x06\x8b\x9e\x82\x0d\
-o\x13t\xa1\xab\xa0\xbe\xdeV/\xd1\xb7\xd8\xb6\xf1\x06\
-\xc1\xfe\xcfR\xb6A\xa7c\x8aR\xe2e\xb8\x99\x9c4\
-Vl\x84\x17\xf1$\xea\x94&\x086\xc6\xbc}A)\
-\xb9\xf1y\xe7\xf4a\xc6\xd6\x07\x05\xef\x8b&\x99\xea\xff\
-d\xbc\xc7$\xa2\xefM\xf6\xccEGc\xbd4\xea\xe7\
-\x87\xa3\x9e\xeeu/\xb6\x07\xc6\xfdx2\xbf\x04[\xf8\
-\xa7\x8e\xf3\x89=GA\xad\x054\xba\x5c)\x1f\x18\xe7\
-\xa5\xf5\x80\xd4\xbe \x1d\xed\x8c\xc6\xe1\x9e\xab\xaa\xe8w\
-\x9e\x06\xf0\xab\x82\xfe\x88l\xfa\x1f\xee\xc1o2\xfd\x1d\
-\x88y=\x8b\xb6\xaf\x7f\xa0,\xe6\xbe\x97\xdb\x00\xf3\xfd\
-h\x8e\x1a\xf7F\xad\xa6H\xf1}Gs\x81\x9e\x9a\x0b\
-X\x01\x9f\xc3\xbd\xb0/pfohD\xdb\xd9\x9f\x90\
-7\xbc\x8e\xe7\xcc\xf5\xc1\x1f\x11\xf8\xa4B\xbfdb\xff\
-\xa7\x82\xaf%\xf4\xb7\xd3\x00\xfdn\xf4\xc51\xbe\x0am\
-\x98\x8d>\xe8sz\x9d\xff\x06G\xcd\xf7i\x9a\xa4B\
-\xb9\xcf\xf7LFL\xfa\x9d\x8as\xa9g3T\xb87\
-<\xea#|JeI7\xd0\x17\x0d\xe0\xf9(\xf8%\
-C\xdft|\xff\xc35\xf8\xd9\x22\xeb\xd6c\xf8\x8c\x01\
-\xd7\x9a\x0f\x0a\xa0~\xb0\xbf\xeffH\xbdL\xad-\xb8\
-G\xa6\xefm\xce\x89l\xd6i:QF\xb41\x1f\xb2\
-b\x8f\x00|\xa5\x81\xbf<\xb1\xff\xe1\x1a\xee\x15d\x1d\
-P\xa6\xbb\x8e\x97kPg]\xfc:\xb3\x88\xce\xf7J\
-\xce\x8a8V'\xa7\xf7<\xc3\x838\xf2\x9e\xf7\x7f\x9a\
-L\xff\xa7\x15h\xffkqn\xa9@\xcb1\xf8\xb8\xb8\
-El\x9d\xef\x89|@\xa4\x83\xb4\xd4\x8b\xe2\x19I\x00\
-\xea2\xc6\xe4\xe3\x8c\xa4(\xf4\xff\x1d\xd4wz^\x8c\
-\xd3\x93\x96\x92*\xf0\xc5Gt\xcc;J:}:o\
-\xab\x22\xd1\xff|\x0cyA\xca#\xd8\xff\xc9\xb8\xff\xad\
-f#G\xb8q\x89\xb9v?\x9d\xf9/&\xe0u\x06\
-\xbd\xdeV\x87\x84\xe3\xfd\x17\xb5E}B\xd3#\xd0\xff\
-\xd0\x86\xef\xc0w\xa6\x81\xd3\x0b\xbe\x99h\xbd)N\xcf\
-\xfc\xd7\x13\xf0?\xa3\xbd,\xbd\x04\xea\x15o\xf0\xd0\xbe\
-\xe0a\xf7?\xe8C\xff\x0a\xf3\x9a\x81\xd6\xd5\xe4e:\
-\x19\xbc/\x85\xe2D\xeb\xcc\xb0\x96s=\xcd%\xa3T\
-\xde\xd6\x03uD\xb5E\xa0\xff\xb5(3x\x09\xeb\x8e\
-{:\x9de\x9e7\x18\xd8\xe2\x0ew\x902\x8dFJ\
-VD\xf3\x036\x04e8sQnp\xbd\x10\xf5\xff\
-u\xac\xd3\x5ca\xeebCl\xf5\x7fX\x1e\x1e\xb6\xae\
-f\x91\xda'd[\xcf\x0e\xc0\xf7\x8c\xe5\x9a\xe3\xcf\x94\
-k\xa2\xff\x81\x95x\xd6z\xf5!\xf4\xff5,{\x05\
-\xfai\xadi\x10\xea&\x9e}[\xea\x9c\x92|\xa1\xb8\
-C=L\x1aM\xaaU\x7fZ\xaf\x93\x93\xcd\x83/\x9a\
-W\xd1\x16}\x07\xea\xc7_u&\xab\xf5\xa0\xff\xefc\
-\x9e\x97\xb1\x8c\xb9Xf\x18\xd9\xcb\x06\xd8\xe8)\xa2.\
-,\xd4Y\xabM/\xee@o\xcd\x0b\xa0cE\xfa\xdf\
-\x98\x9e.\xea\x15\xd8\xd0\x82V\xf8^\x06\xed\x8a_F\
-\xffy\xcb\xd0_\xf1\x11\xa4\x0b\xf0]\x9f\x0dq\x12 \
-V\x86\xa5\xff\xc95\xdc\xc3u\xa6\x1e\xfb\xf90\xc6S\
-\xfd\x9a\xc0X\xf4\xad\xf88\xafw`\x90\x9c7s:\
-A\xc6\xcdi-\xfa\xd0\xc5\xc9\x87\xb2d\xbd\xed\x19]\
-6\x9bewn\xc7Z\xfd\x15\x97\xc2\xf3;8\xd7i\
-m\xe4\xb8\xce\x10#\x0d\xe3\xa4\xf0\xfd\x0f\xd7\x107\xc3\
-`\xe0:\xe19r\x03<\xdb/E\xc8\xc1_\xee\x1c\
-\xf8\xb6F\xe4\xf3b\x9f\x17\xcf\xed\x0f+\x81\xbf3\xbd\
-.\xc3\xda\xf7\x06\xbdT\xaed\x01\x88e\x81\xf1Q\x92\
-\xa8\xf3\xbf$\xb8w\xc1\x1a\xe7\xc2\x0e,:\xddzA\
-\xb7E\x97V\xcc\xdb\x0bs2ef\xf3}\x06{.\
-\x03\xd5\xf7\xa8\xef[OF\xff\xa3\x9e\x18\xe7\xd4\xb2\xd6\
-\xd4\xe9\xf8u{\xde\xd9\xb3\xc5\x08}\x04\x12\xa5\xff%\
-\xdb\xff\xae\xe2\xe3\x15\xa7G\xa6\xff\xa5\xf1\x0d\x0f+\x89\
-\x8fW\x9c\x8av\xb2\xc4\xb4\xb2\x8do\xa88>^q\
-*\xe2\xe3_>\xbea5\xa5\xf1\xf1\x8aS\x11\x1f\xff\
-\x0e\xe2\x1b\xba\x13\x1f\xaf8\x15}\x1a\xb0\xf0\x01/\xc5\
-\xc7+N\xc5\xa98\x15\xa7\xe2T\x9c\x8aZ2{\x96\
-rCm\xbfk\x82\xbd\xfa\xfd\x1e\xc3t\xa6\xbfG1\
-\x8c\x8a\xfa\x9a\x075\x0f\xb3~W\xc3w\x7f\xebwI\
-\xd3\xee\x09\xdf-9\xa2\xe7\xdfP\x9b\xd7\xa9\x0c\xa2\x84\
-\xefb\x89\x0fD\x5cE\xdadg\xc9\xd0\xe2H\x183\
-\xd4\x88\xdf\x83m\xb2\xb7\x14\x10%~W\xd1\xb5\xb5\xd4\
-\xf8\x81\xf5{\xa4MqX \xdf\xf8:\x01\x16\x14@\
-\xf1\xfe\x9a`5\xfd=L\x13\x9c'V\x08\xaa\x13\xa9\
-\x09~ VH\x0d\x05\x93\xfe\x8b\xc2\x0a\xa9\xe1\x93\xe0\
-_\x8d\xdf\xa3\xe0=\xb5?\xe4\xa3\xc2\xea\x85\x99\xa3T\
-|\xb9\xf8=\x92\xfc\xe1\xeb\x89\xd5\x85?\x91\xc2\x0fp\
-\xa9\x12\xfa/\x8a\xff~\x0f\xb2\xcd\x83<\xd4|\x03\xee\
-A5r\xa1\x0c\x0d\xff=\x0f/\xf9\x9baf\xcb\xa3\
-\xf8\x92p\x97\xef\x7f\xfeI\xf8\xde\x99G\x19\xe4$|\
-\x8f\xe4Q\x06\x7fC\xf9\xe6F\xf2(\xeb\xfc\x80o0\
-\xf9.\xd2\x0b~W\x09=\x06\x18\xc0\xef\x1a\xa1\xb7\xf8\
-\xefjR2\xd2\x13\x5c\xf2\x7f\xa2\x84\xde\xc2\xef\xc1\x22\
-}i\xf0;\xf6X\xa4\xf8]\xa47\xfe{\x14\x13\x9a\
-'|\x0f\xcb\x05\x84\x92\xef\x22\xfd9\xfa\x8e\x04\x14\x8c\
-\xdf\xc3D\xfa\xcc\x13\xaa\xae\x12\xbfCO\xc1\xb3\x22\xbd\
-\xc2;r\xdf\xa9\xe4\xf5\xef\xb9B9|\x8a\x12\x90\x1a\
-&~\xcf\xc3\xf6\x88\xdfs=\xf9N\xf0)~\x17\xf1\
-+\xfd.\xb6\x17\xbf\xfb\x8b\xdf\xd5r\xdf54\xfe\x82\
-\xe5\xbe3\x22\xfeE\xfa\x19/|/\xcb\x7f'\x0d\x8e\
-\x10\xbe\xd7\x16\xe9\xaf#\xc9;\x8a\xff\x10\xbe\x93\x1f\xfc\
-\xd5\xfcc\xa1\x02=\xf3}\xac\xca\x13\xe9\x9b|!\xc4\
-\x1a*\xd0\xfb=\x0b\x9f\xd0\x88\xe3\xc3\xdf\xc27:\xe3\
-x\x12\xf9F\xa4Y\x1cv\xe2@\xb4|X~\x10\xf9\
-\x808^\xa3\x90\x0f\x88\xe3YM\x8f{\x19~ \xe5\
-\x17R~\x22\xe57R~$\xe5WR~&\xe5w\
-v\xfcP\xca/\xa5\xfc\xd4\xc2o\xc3\xe4\xf9\xb1\x94_\
-K\xf9\xb9\x1d\xbf\x97\xce\x07\xd2\xf9B:\x9f\xd8\xcd7\
-\xd2\xf9H:_\xd9\xcdg\xde\x9e/\xed\xe6c\xc5\xe9\
-\xb3>\xbd^*S\xf2\xb1\x92\xa4\x01ez\xf6x\xbe\
-\xaf0\x9cULH\x10\xf9xs\xe2\x86\xf7\xe0\xdb\xb8\
-\x89\xbd\xfa\xabN\xfc<\xf5;\x86\xe9\xf2q\xcf\xe7\xbb\
-\xf6\x8f\xb8\x94\xf5\xe3\xb4\x99\xef\xbe;\xcb\x9c\x9a\xca\xfe\
-\x10\xdd\xe0\xef\xc7\xffn\xd0\xee\xdb\xea\x0b^\x1b<\xa0\
-R\x9f\xf1o\x0d\x18rv\xe0G\xc9\x9b\x9a\x0f\xda\xf4\
-\xe0\xec\x87\x9b\xa2\x12\x7f\xbbp.\xf0\x83\xca\xdb+\xbf\
-\xd2\xfc\xd3sCn\xd5\xda\xa4)\xdd\xbf\xfa\xe0\xe7+\
-\xbdP.\xe8\xbdW\xb2\xbf:\xf6\xeaS\x83s&\x1e\
-\xbfv\xff\xfe\x95\xa4\xd2\xfe\xefu{\xef\xabI\xd9\xb1\
-\xffL\xbb\xbb\xa7\xe5A\xad\xbe\xe3\x89\xc1?\x9d\x98\xf6\
-S\xce\xb5au\xea*Jk\xa6|\xf9\xe2\xd4:u\
-\x87\x8f\x8d\xd1U9[\xf5\xd5\xc49{V=\xf1r\
-b\xbf\x99M\xdf\x1c\x7f\xfc\x99\xc5\xd9\xa3\xba-j\xe0\
-\xb7\xf5\xd3]\x13\xce\xbc\xd7\xa5U\x93\x0d_6;\xf2\
-23\xa0V\xdb\x1e\xbb\xdf\xeb\xb4\xa8\xf1\x89\x0ef\xf2\
-\xc8\x87\xdd^]\x09Y\xd4\x86,\xba|0n\xe8\xe2\
-\xcf\x7f\x98=\xb1\xcc\xd6\xea\x17\x9a\xd53o\xd9\xdbz\
-\xcf\xf9\x1b\xb3K~\xdfv\xcc\x87\x93\xa7V\x1c\xb5w\
-\xdc\xe4\xe0\x0a\xe9]g%\x04,\xf8\xecjJ\xeb\x80\
--\x81_t\xd0\x9c?\xa4Z\x1fZez\x8b\x0a'\
-R\x1e\x9f\xb78{l\xb7W\x1b\xb4\x8eza\xce\xc6\
-!O\xbe\xf3\xc2\xb4\x8aKj\xdf\xebW\xb3\x11\xf7}\
-\xc7\x8f\x0f~\xc5\xe7Q\xaf|\xd4\x819\xddf\xfd\x1b\
-y\xa9t\xea\xb3\xc3\xbe,;f\xf2\x88\x8a\xa3\xea\x93\
-\x9b\xf3C\x9b\xfd\x98v\xeb\x95\xa7\x07Wi\xd1\xa4\x82\
-\xaaG\x8fA\xfb\x1b\xf8-]\xba\xf5\xd3\x9e\x01u\xea\
-\xbeU\xfe\xeb\x90.\xdd\xf6\xd6{\xbc|\xd4\xbcy/\
-\xbc:\xea\xca\x98\xb7\x82\x82\x82r\x17\xf7)\xdb\xfc\xc2\
-\xc6U\xbd\xe2?k\xd7\xb6\xed\xc1\xb9C\xc3J>\xf5\
-\xed\xb1E\x87\x9a\xbd\xd1$\xa1\xe2\x17\xcf,\x98\xb9&\
-\x22\xb7\xe5\xc6\x91\x9b\xdfz\xe7\x9d\x12c\xc6T\xfe\xa2\
-\xe3_kO\xad\xa8\x97\xf6d\xcfQ\xaa!Q3\x9f\
-\x0b\x9d\xcc\xd4\xaf\x13\xdfY\xddoS\x87\x0dY)\xe7\
-\x83.\x05}\x17\xf8\x8d\xff\xa6\xa8^#\x1bn}~\
-i\xc3\xafu\xff$}Q\xab\xc3\x88\xb0!\xd13\xf7\
-\x84/jU\xbf\xc6\x92\x0b\xb99c\xc6\x8ci8\xa0\
-V\xe0M\xd5\xdd>\x0b\xca/0\x99#+,\xbfz\
-uK\xc2\xd5\xc3\x9a&'_\xea\xdcm\xceW\x86\xec\
-_\xdfl|\xf2\xcc\x993\xdc++r\xdb7\xf0;\
-9o\xd9\xcb\x0d\xfb\xc6\x9dxg\xfb\xe75\xc7/\xdc\
-;\x22<\xad\xd3\xeem\x95\xea\x1f\xed3q\xf5K\xaa\
-\x1a\xb3\xa7t\xe9}\xffL\x99f\xaa\xd3\xc13;\xaa\
-7\x05\xaa.\xef\x1c\xb7~`\xa9_\xc7\xb4[~\xf5\
-\xe2\xae\x09\xf5\x9fH\x0d\x0e\x99=\xe4~\xbf\xcd\xe6\xa9\
-a}6D^\xbda\x1e\x1b<+\xe4\x17f\xd1\x80\
-};\xaelk\xb7\xdb\xbc\xb2\xe4\xbc\xa7\x17\xb6Z0\
-\xc5\xb4\xa7\xc6\xac\x0f*\xd6\xee^\x8fyM\xadV3\
-\xaf\x5c\xeetsq\xd0\xe8Y%\xff\xf8\xad\xcewU\
-bz-\xab_\xbe\x93\xaa\xbd\x8a=8\xa3\xd2\xd6\xc7\
-\xda\x9d\xbc\xfc\xde\xe5^\xcdC.\xc4\x8d\xe9\xb0]S\
-\xc7Os\xf7\xe3\x8e\x13\xe3\x99c\xdf\x94\x18Y\xba\x1a\
-\xb3\xe3\x5c\xe7[\xa5\x92\xd6n\xdd\xd7d\xdfO\x8d\x06\
-l/\x19\xf2\xdb^\xed\xa0\x1a\xdf\xee(i:\xff\xc7\
-\xd8\xeb\xebF\x5co\xd06*\xe8\xcb\x13U_\xdf\xf4\
-i\xa3\x805\xefF\x9cM\xff\x8c\x9d\xdf\xf6\xcd\xb9\xdc\
-\x95z\x13K\x1e\xfe\xba\xeb\xaa9[\xcb\xb6\xdb<\xee\
-\xe0\xdd\xc4\xe1\xe6\xdf\x03{\xfdfn\xd6\xa7Z\xd0\x9d\
-E\xb95\xb6Oo7~E\xc8\xad\x8fF\xdf\xdc\xd6\
-\xb2Fh\xb9\xba#\x9a\xf5\xdd\x9c\x98\xdbq\xc9\x8d\x7f\
-&\xae\xa9Kh\xa6\x9a\xc1\xd4\xb4\xdc\x82\xba\x1b\xb7\xd5\
-8Tou\x8f\x0eG\xca\xab?X\xfd>s\x82\xf9\
-\x22`\xe0\xb1\xa9w\xcb\xff\xcb\xbcw\xf4\xc9\xadev\
-U\xcc\xab^oj\x9d=\xc9#\x1f\xff}{\x1d\xcd\
-\xba3\x17\xea\xd4\xd9\x19>\xa6RV\xa3WI\xe3\xcb\
-\xff\xfd\xd1\xf9\xb1/\xde\x0c?\xfdgx\xb9>\x8bZ\
-]x\xf2\xcd9\x87O\xa9'E]\x8b\xea7a\xdc\
-\xc9\xc9\xcbf}\xb0\x95\xe9\xf8[\xd3.%\x1a\x05u\
-\x1ex\xbd\xca\xf3\xb5\xebm\xfbzT\xe9\xcfG\x9d\xc9\
-\x8aX~e\xff\xd2j\xad>c\x9e\x7f>\xaeO\x97\
-\xe7\xfb\xec\xbc\xfe\xc2\xe6\xbcz\xd3\x1b\x8cU\x9b\xeb\xb6\
-h2\xae\xf9\xf1.UK\xbd\xd6\x80!\xf4\xbf\xe8\xb3\
-\x9d\xaav\xaa\xef+\xdf\xdd:r\x8e\xff\xce63&\
-\xeen\x7fw\xdb\xe8\x1e\x01#k\xbf>`\xc7\x98\xd4\
-^3\x86\xd6\x18\xd8u@\xb9\xb5?n\xf8Au\xe7\
-\x90\xfa\x99\xf6\x9bfu?w\xf5\xb5&\xe4]\xa6\xc3\
-\xec0\xff\xd4n\xd7\xdb\xfe~qa\xe3z}6%\
-\x0e\x8a\x1f[\xab\xde?ow\x18\xd1\xe0\x8d\x89\xb5\xab\
-U\xab\xa6I\x196c\xda\xa8\x9c\x97\xfb\xd7\xcd\xf8l\
-\xe3\x82\xe9\xcdrgj\x96\xcc\xee\x17\xf5\xee\xe2\xec\xf7\
-K\x85\xa8g/\xf2\x8bg\xe2\x02g\x9e\xb85\xad}\
-H\xd2\xf09\xd3\x9fx\xb5\xcfk\xdf\x04_\xeb\xd2/\
-\xc90\xb0\xe1\xaa\x13\xad'\xde\x1aZ\xc2\xefh\xc5I\
-MU\xa7\xebu\xdc\xfd\x98\xf1\xe8x\x7f\xf3\xe8\x0aS\
-M\xfb\xde\xad>\xbeJ\xee\xc7\x9a\xd7\xba\xaawv\x8d\
-\xfb\xf9\xc3\xc8w\xf7\xae^\xd0\xea\xde\xd5\xb8`nX\
-r\xc2wO\x7f\xf4X\xf2\xf9o\x1a~\xab\xaa\x19t\
-{\xe6O;\xbe\xa8\xa9K\xfbj\xe8\xba&\x83\xe7\xb5\
-\x8e\xea\xbcos\xce\xf7\x13\x13.\x8dj\x1de8\xec\
-\xdf\x8e1\xcf\x1f\x1f=\xa4\xf9\xc2\x90\xacW\x1e\xafv\
-\xe9\xcc\x97\xbb\x1a\x84\x05}\xc6\xd4\xf4\x0b}.\xafN\
-\xd3\x81\xe1\x15\xce~X\xa7\xce\xe8\x81_\xbe\xcfD\xaa\
-b\x18\xf6\x93\xcb\xdb\x9a1\xaa\x95\xa3Bs;i\x86\
-,\xbb\xbc\xbf\xcf\x0b\xf3\xeb\x94\x1e|\xfe\xfbW>\x0e\
-\xf8_\x97\x89\xeb\xde\xeb\x19\xc7\xa5\xdc\x0c\xda\xba\xe6\xc6\
-\x81\xc3gf\xb7c\xaa\x9e\xd6\xfaG~\x1e\xd8\x80\xe9\
-W\x9aI\xad\xa2\x9d\xf4\xe2\xb1\xac5\x0b\xd6\xb4\x9a\xf3\
-\xdbW\xa6^I_\xbc\xdf\xfdh\x92\xe1\xc5\xd7\x1b/\
-\xcf\x9d\xb9d\xf5c}\x86\xef\xee{i\xc1\xffzW\
-\xaa\x1fY\x22\xa6&;u\xd5\xc9\xf6\xe7\xfc\xfex\xe3\
-z\xe0\x9a\x05\xe62W/~x1%g\xfd\xfc\xd3\
-\xd9]?\x1e\xfd\xcf\x94)O\xefY\xf2\xdakO\xf9\
-\xb7\x0f\xb9\xbc\xa3\xcc\x9f3u\x8d\x97O\x0c\xaa\xb1\xa0\
-\xda\x89\xc9\xfe\x7f$\xc4\xdeX2v\xb2\xb9\xec\xff\x02\
-\xdb\xfbG4\x8b\x0f|\xd0\xfd\xf9\xb8J\x0bv\xbc\xb3\
-hd\xc7U\xff\x5cy\xfd\x8b\x8eW\x0f\xbfxk\xf3\
-\x13=\x9b\x9d=\xd3\xa7q\x95\x7fv\x0c\xd88\xb0/\
-3\xe6`\xeb\xc8\x923+\xe7\x95k\xfel^\xd5\x12\
-\x8d\x987~3\xbe\xb1\xe8\xcb\xce\x03\x1b\xacm[g\
-y\xaf\xf3\xdd\x7f\xabX\xfb\x95\xa3/\xcf\xaa\xa4\xbd6\
--\xf7R\x9f\xa1k\xaa4~b\xc4\x17\xc1\xf7kh\
-*\xb7Ix\xee\x93\xbd\xbf\xe7Nhq\xaew\x85\xeb\
-\x0b\x1b\xaf\xba~?\xd3\x7f\xcd\xe6S#j>\xffq\
-\xf3+a\xed\xa3\xde\x09\xea\xb3>>~\xde\xf6\xe7.\
-4Q\xff\xb5\xec\x84i\xf6\x1f\xaa?\x1aU\xbf\xb7\xf9\
-\xf0\xcb\x9a\x7fK\x8e\xf8{\xc7\xcd!\xab\x87\xb5\x09\xc8\
-\xf8\xb9\x5c\xc5\x9a\x0b\x873;\xc6\x5c~\xf1\xcf6Q\
-\x9f~u\xfc\x1c\xd3\xa9|^\xe9\xdc\x9eI\xcb\x9eZ\
-\xb3\xfd\x99\xeay\xdb\xd4\xf1~\x87\xde\x1a6\xf3\xc5\x11\
-q\x9a\x89-\x9aM\xac\xb2\x9d\xb9^ua\xc4\xc5\xd2\
-\x03+\x9f\xfc\xb8\xcf\xb5\x07\xa5\xf3\xc24\x03\xba\xec8\
-u\xff\x95\x95\xed\xbea\xaa\xaa\xccss+T\xee[\
-\xaf\x9b\xf9B\xb9\xfb\xeb\xfa\xae\xbd{\xaeO\x95\xcd\xf0\
-\xc6\x86\xa8%]OM\xf9\xf4\xcd\x12o\xfe[\xbfg\
-\xf3\x0aUj\xf7\x0ez\xb0\xaf\xb19\xaa\xc7\xcevC\
-\x0e|\xdag\xd0\xfez[\xb9\x80.\x03\x0c'\xaav\
-Y\x9e\xd2\xd5?\xf7\xd5\xd7\x9f\x0b\x8d\x99\xff\xadI\xdf\
-\xb0Y\xe9g\xa3^y\xe1\xc6\xa4&\x13\xa7\x8f\xf9+\
-\xe8\xb7J%\x17\x9ei\xb1uC\xc0\xea\xfeM\xfe|\
-{\xc5\xc23U{T\x1dxy\xe1l\xf3\xde\xf9\x86\
-\xc7\x9b\xd5.=^\xc5\xdd\xf8\xe4\xd2\x8c\x8d\x1b\xee\x84\
-Tz\xd9\x7f\xe1\xd8\xe8\xf1\xa7B\xbaD\xae\xe9\xb2\xe1\
-\x9b\xfeG\xea\xd4\xfb\xb1\xce\x8a\xb5o\xce_xbD\
-\xc7\xc3o=\x18\xfb\xd6\xc4\x9a\xb9\xd5\x17\xc6\x94\xfa\xb2\
-\xf2o\x9fo\xaev\xe7n\xd5\x13_\x8d|=Ou\
-\x9d\xbd\xb6a\xc8\xfe\x86\xa9\xcf\xbc8\xc0\x5c\x22\xe2\x1f\
-\xbfN\xe6\x89\xf7[\x7fvt\xdf\xce\xe0\x0b\xa52\xff\
-~\xab\xf19\xe3\xc2\xf6\x87\xfb\x1e\x1aR\xeb\xef\xb7\xf2\
-\x9a\xf7\x8d\xeb:\xf8\xb3\xa3\xaf\xec*\xb9s\xdd\xb9\x05\
-\xad\x17\xbd7h\xd0d\xbf\x9c~\x9b^z\x22\xe6\xc4\
-\xb6\x0fVm\xcf\x9e\x7f*:\xe4\xafr\xcd#\xfe\x9d\
-Zyl\xa5\xb7g\xfe^\xa6\x97\xff\xed\xaao.\x9a\
-\xb6\xe9\xed\x09=[\xdfdB\xc3r/\x96\xf8\xee\xa5\
-\x7f\xea?5g\xf4\x80\xe6\x89\xcb\x9bv\xf8m\xea\x83\
-{l\xa7\xae\xe5\xeeUz\xe3\xa5\x91\xcf\xde\x99\x99\x1a\
-y\xae_\xefN\xeb\x9e\x8c\x1b\xd7f\xedR\xbf\x9e\x9b\
-N\xd7\x1d]\xb6n\xf0\xef\x87\xa6u\xaf=\xf7\xfbN\
-S4OUi9\xef}C\x90\xa6B\xd7O:\x0c\
-\x88zwMp\xe5\xe6\xf3\xbe\x0f\xefs\xf5v\xbd\x90\
-\xcc\xa6\xe7\x07}yc\xd5\x1ba\xf76\x7f\xa8\xdb\xa9\
-.\xb7\xd5\x7fWp^\xe0\xe1\xd8\xd5C\xbb\xfeo1\
-\x171\xb2a\x9b3\xf3\xf669r\xfc\xc7\xe8j5\
-j\xe4T\xfe\xf2\xf2\xca\xaeL\xff\x1b\xd5_Y\xd1<\
-+u\xd7'\xb3:\xd5_\xb5\xeb\xec\xcc\x1b\xaa\xb7\x16\
-\x95\x0b\xca\xab\xb7\xa7\xd2[\x0d{\x95\xee\xb5e\xc4\xf9\
-\xaf'<]j\xe0\xa9='\xcee\xf9\xe5\xfc\xde\x7f\
-\xee\xaa_\xff~\xa2\xcf\xba\xf7U\x0b\xbblJ\xf9\xe5\
-P\xc3\x11\x8d\xa3\xbaU\xfb\xf4J\xdf\x98\xd2\xbb\xfc.\
-\x9c\xe4>\xa9U\xef\xdd\xd5\xa1+:M-5>x\
-k\x99\xb7\x06-\xbfT\xbf]\xef\xf2\xab7o^<\
-ds\xdb1\x0b~\xf8\xbemr\xe9\xb1\x1a\xf3\xa2\xea\
-\x01L{\x7f\xae\x839\xe9\xef\xc8\x9c\x15\x1d\xa6V\x09\
-\xf9Puq\xc7\xf5\xb5//\xdb\xd8$\xe8Jb\x89\
-\xbd\xadv\x9d\xd5\xbf\xcf\xf4\xf6\x9f\xfeA\xa7U\x9f\x07\
-GM\xd5\xd7N\xb9\x9d\xbc\xf7u\xd3\xec\xf9\xdf/\x9b\
-\x5cw\xcb\xec[\xbd\xef\x06\x9af<\x91sbB\xd7\
-\x8e\x9b\xbf\xfa8\xaed\xc7\x80{\x01\x17J'\xb5\xf8\
-mZ\xa9\xe5\xf7?kQ)fz\x995o.\x0a\
-\xd5/(\x13\x9f:pc\xffz\xcb_~}\xcbY\
-\xbf\x91\xed\xb6\x0e}~\xec\xdf\x17N|\xfar\xd9F\
-Al\xc67\xc3^*7\xc1xmZz\x09u|\
-\xe5/.-]\xd7\xf6\xca\xd3=\xb7\x7f\xb4\xa6O\xbd\
-\x15C#\xd6\x1c(\xd5\x8b\xb9\x13v\xe5Z\xaf\xa6)\
-5f\x1f\x9d`:\xfb^\xa3\xd0{a\xe3\xfd9s\
-\xdd\xd3-_^\xdd\xfe\x89\xa3\xbft\x9aS\xe7\x97\xe8\
-\x7f~];l\xc9g;s\x9a\x9e]\xb8\xaa\xda\x1f\
-\x8b\x9a\x06\xfc\xf5\xef\xea\x11\x7f\x8f:\xb7\xe6N3\xcd\
-\xfc\xf6\xadFo\xa9x{\xd69\xffUu\x12\x7f\xba\
-\xd1\xe9\xda\x81:\xdb\xda\x8eh\xdcl\xd7\xb7\xea9\x15\
-\xa2\xba\xad\x89j2\xa8\xfb\xa5A\xd3Z\x8f\xcdm\xb9\
-*\xe3\xad\xb5\xbf\xf8\xdd{lE\x8a1z\xce\x83\x81\
-_^={\xe4\xf7m{\xe6\x1eO+\xdfv[\x9f\
-\xd3G\xa7\x04\x97^J\x9e\x1f\xf9z\xccc\xbf]\x0e\
-\xd8Q\xf7\xea\xd3\x03z1?\x1eY9\xb3\xc2\xbf\x1d\
-\x9a\x1eV\x85m\x9a\xdfvn\x99-\xfb\x22\xdeZ\xd3\
-\xa7\xc1\x8a\x8f\xc2\xb3\xbe\xebT\xeaE\xe6\xea\xfcz\x9f\
-\x8f\xda\xfa\xc4\xef\xb7#\xd5\xc1\xa3S\x1a\xc7\xbd\x9e4\
-\xe4\xdeB\xf5\xe2\xac\xca\xfdV\x1e\x1e\xd4\xe5\xc9A\x95\
-\xea\x9e\xaf\xf5\xcf\xf7/N\x98\xdf\xbe\xec\x8b\x87g'\
-\xb6\xd7\x1f\x9e}\xf4\xeb\xb8\xbe\x9f\x9d\x0c\xd9x\xb2\x97\
-\xdf\xd4\xaew\x87=ye\xb0&t|\xda\xb9\xf7\xd3\
-g\xde\xfc~q\xa2\xbar\xb5\xb0\x11\x99\xdb\xd7|\xfe\
-o\xd5\x97\xaf7[\xaaS\xcf)\x1753\xee\xb9\xac\
-\xaa37\xe9_k\x93\xa3\x09K\xa8\x1c\x9b\xf7C\xc8\
-\xceyk\x92\xdf_\xf4V\xb3\x8f\xca\x7f\xba\xefRG\
-\xd5\xf5\x8cs\xe9gN\xfd\xef\xa9\xf2\xf3?\x88HV\
-\xbd2\x7f\xe6\x1af\x91\xffWU\xeb\x9f\x1fu\xa3\x86\
-1\xa6\x95\xb9f\xfb\x15\xfa\xe8\xa9?\xaa\xff\xe7\xf7t\
-\xe5\xcd\xdb\xcd+~y\xfc\xe9\x11\xcdZ|\x9a<\xfb\
-\x9b[\x01\x99'\xaa2\x07\xce\xed_}\xb5\xea\xae\x84\
-\xd4\x8f\xcf<\x98\xa0\xb9\xac\xdeT~\xd6f\xf5\xd4J\
-7\xdf=3\xb8\xe3\xdb\x83\xce'\xbf6n\x7f\xe8\xd7\
-\x95#F\xc6\x96U\x8d84@3\xad\x99*w\xca\
-mm\xbf\x05[O\x8d-{C;\xf1\xbav\xe2\x86\
-\x01s^.\xf3F\xcfAq%\xee<\xf6\xe6\xa5\xed\
-5\xc6\x8fJ|\xf5w\xd5sM6~\xb6B\xbfc\
-E\x97y{\xfd\x0e7=y\xfar\xd4\xfd\xfb\x81\xe5\
-\xb8\x7f\xa6\xf4k\xfc\xcdp\xd5\xcc9\xfa\xbfn\x9e\x8f\
-\x1a:\xfbD\x9d\xe9\xfeM\xd62\x89\xcb\x96\x84-X\
-2\xbd\xe9\x8b\xff.\xfe~\x5cP\xe0\x84\xe1\xb3r\x0e\
-\xc5\x8eY\xbfhmw\xf5\x8d\xd5aL\xf5\x17\xd3\xee\
-];\xfe\xc5\xe6q\xb7g\xd6&\xbcvm\x93j_\
-V\xfe|xHL\xf5\x9d\x0b\xcb\x0d\xbd\xbf\x7f\xf0\xd6\
-R\x11\x93\xb6W\xf9\xa4\xdd\xd77\xb7\xfe\xd6<\xab\xd5\
-\x85\xbf\xfcN\x8eh\xf6\xf3\x9a\x03\xbdo_8\xf9@\
-5\xbe\xcc\xf1\x89\x97\x9b\xdd+\x9b\xb7\xa8\xce\x88\xd2O\
-\xd7l3\xeapD\xb7\x7f?\xdc\xd7\xecv\xbb\x07y\
-U\x9e\xaf\xd4\xf5r\xa5\xe3\x01\xcfl\x7f\xb0i\xd5\xda\
-\xbf\x02O\xf5\x0c\xfc\xa9\xc3\xe2\xd0.5+-|a\
-Q\xe3\xd9\x95\x17]\xe9SC\x7f\xb6\xf2\xd0i\x9d\xc6\
-\x7f\xdc\xfd\xd9\xa7;\x852\x7fT\xd4\xae_3\xe4\xf9\
-2\xb1\xb1\x9b?\xa88\xba\xa7\xea\xc2\xd3Oj\x8c\xff\
-\x9co\x16\xb2^u^\xd5\xa8\xed\x9e\x11Sn\xaa\xcc\
-e\xee\x99\xe6\xfd\x12yy\xcb\x80\xbe?\xf5.\xb7\xa0\
-L\xeaK)1\xd3Z\xcf>\xf2\xe0\xfb\xe7\x96\x97\x7f\
-i\xff\xb4\xbbO\xcc\x19\xd7\x8c\xfd\xe1\xcc\x05\xcd\xe1\x99\
-\xcf\xf5\xae\x16\x14\xf1\xc9w\xc7\x8e\xd4m\xb2\xafV#\
-\xd5\xb8}\xebF\x8d\xabrW\x9d\xa56E\xcd\xf8\xe8\
-\xeb*-\xc7\x0c\xde96\xf9\xcd%\xd5;4o\xc4\
-\xfcv$\xe5\x7fS_\x1f\xf3\xca\xda\xbd\xa7\xd4\x91\xe9\
-\x1f\x1e~\xfa\xb1\x03\xd3\x8c\xc3\x9e8r\xab\xff\x86W\
-\x87%\xbd\x97\xd4v\xfa\xc7\xcf\xfe\xfe\xde\xef\xbf~}\
-bE\x9f\xc0\x8c\xc1\xbf\xbf<P\xb3$\xea\x95\xa8~\
-\xec\xf4\xcci\xe9A\x03\xa6\xcd\x0d\x99u\xf0\x1a7<\
-z\xcf\xa9\xfb\xcf\xbc\xf3]\xce\x96\xcee\xefO\xabz\
-b\xc9\xe1&\xfd;\x97\x89\xf9\xfd\xd4\xac\xbd\x83o\xfd\
-\xe1\x7f\x7f\xd7\xfb\xf7j\xbdU\xed\xe7\xa8\xf7G?{\
-\xe8\xc7\x81o_\xdeQ\xf7\x9b\xcd\xd5\xd6\x0c\xf9g\xd7\
-\xfa\x01\xcf\x94\x8c\xe8\xb0\xa5\xe6\xd0\xd6\xc7\x82\xb6t\xd7\
-fm\xf8\x22\xea\xef\x97\xb6Wh\xde\x90\xb9}\x7f\xf0\
-\xd0\x06e\xa6?3\xfe\x89\xc5\xed\xca%\xfb\xcf\x0cY\
->\xee\xb35}7\x0e\xcc\x9d\xb5jJO\xa3a\xda\
-\xba>\x8d\x7f\x1eX\xfe\xc4\xea\x97\x83\xae\xbf\xab\x8e\x9e\
-\xd0\xea\xfe\xe2_J\xceT\x8f\xfc\xa3\xcf\xab\x9fn\x1b\
-\x18\xf0\xd6\xd1\x8f\xfd\xf5\xd7Z\xf4\xdc\xb7\xb2\x85\xeaz\
-\xe2\xaeJ\xc3\x17\xd7\xbc\xa7\x1a\xfbJV\xe2\x86\x99\xd5\
-O}\xce\xde^\xb4\xe4\x8b\xc7\xe7v\xf6\x9b\xb8{l\
-\x93\xc4\xa7Fu\xec\xd2t\xcd\xd5\xc0\x1f^\xd3\x0c=\
-\x96\x99T\xe9\xe9\x0f4\xe3\x9a\xeb\x0fl?Y\xaf^\
-\xf3\xe5\xa3\xb75|\x8f\x81u\xcf\x98\x8b\xefVcw\
-\x5c\xaf\xa9\xb9V3\xe9\xdb\x86e\x17\xcc\xde\xd4\xe7~\
-\x83z\xdd[<\xd5\xab\xca\xbc\xb7{4\xed\xd3x\xd7\
-\xbc-\xa3\x12>\xdfR^[Km^\xfb\xe7+s\
-\xee\x96\x1b^\x7f`\xceo\xcd\x8f\xfe\xf5\x89\xe1\xc8\xaf\
-\xdb6u\xfc\xe6\x9b\x95\xaa\xdf\x07\xfdY\xe1D\xd5\xfe\
-\x83C\xef\xf9/\xaeu/\xd4\x7f\xdc\xebi\xdd?-\
-\xbd|\xf3\xffF7\x1b>\xb3\xc4\x14R\x9f\xdfC\xc6\
-\xf8\xdf-W\xad\xd2\xa9[u\xef\x95\xd9\xfa\xf7\xec\xe4\
-gk\xebV\xf5\xff\xe5h\xd8\xa6m\xaf~u\xea\xd7\
-\x15\x1bf\xfe\x19\xf0[\xc8w\x03\xb4k\xd5Ck\x5c\
-\xf8\xb1\xc3\xeb)]/\xdd\x9b\xf7]\xe0\x90\x13\xdc\xdf\
-K\xfb\x0c <dT@\xe4\xdd\x16s\xea\x9f\xeb\x5c\
-uW\x85\x15\x0f\xa2\xcb\x0f\xd2\x94\xac\x7f\xe7\x93\x01\x1f\
-\x0e\x5c\x9e\xf2\xf8\x88\xb2mo\x94\xae\xb3\xeaD\xfd\xa8\
-2\xdd+M\x0b\xdc\xb2\xab\xfb\xda\xbc\x11\x9az]?\
-\xe9\xd6<\xe0\xb5\xa0\xc8\xb5\xe5\xcbO\x9f11\xaa\xcf\
-\xe5\x88\x80\xd1\x11\xf5\xb3\xab_LZ\xdd\xa2\xbaf\xf1\
-@\xdd\xfc)C\x03\xd7=\xbe3\xb8\xcdvft\x13\
-S\xbd{\x1dsz\xaa\xdfm\xf3\xf8\xb8\xf8\x03\x03J\
-\xddi:\x7f\xc6\xe6]\xcd\xe3~\xfa\xe9\x9d\xdcv\xa5\
-:%\x0f\x1b\xdb\xe4\xa3\xd3u\x92\xca\x5c]\xa1n\xf7\
-\xed\xa1\xc3\x07\xbb\xaf\xf6\xcf\x9b\xf1QV\xc5\x17J/\
-\x1fR?\xeb\xeb%\xbd\xcf\x94$\xb3~\xc8\xec\xa6g\
-K\xc4,<\xf8\xf1\xad\x00\xf5\x9491e\xdeY\xb1\
-^\x15\xf4\xc1\x07\xa99\xf3_\xee}k\xc8\xd6\xf0\x0f\
-;k\xdeJjq\xca|\xb2Z\xf9\xf6\x81\xbb^}\
-\xfeR\xbf\x9f\xea\x8e\xa89\xfa\xba\xee\x99\xc6\xaf=\xc1\
-\xcc\x9a5\xabq\xb7\xb6\xbf\xcf\xbe\xfa\xbeza\x8d\x93\
-\x8b\x99]A\xd7+l\x0a\x1f\xf9s\xc9*\x15?*\
-\xb9e^\xf7\xb5\xeb\xd7\x97\xda\xff\xf3\xd7\xf5?]Z\
-\xf5\xfdj\xf7:\x8e\xadR\xb5]\xcb~\xcb;\xffy\
-n\xfe\xf4\xcey\x9a\xb9\x8b\xe3:\x9e9\xbd\xcco\xe9\
-\xcb\xef\xb7\xear\xe0\x97^\x07\xa7\xcd:\xf0c\xff\xa7\
-\x02\x9e+u\xe7\xd6\x9c\xd2\x1b\x9b\xfcx\xb4o\xcfa\
-\xb7\xab\xac^\xbf>\xf8\x9f\x16u\x13\xcf\xcd\xfemY\
-\xff\x7f;\xccnY\xce\xfc\xea\xc8\x12\x5c\x87\xfd\x11\x87\
-\x1a\x1f\xb9\xba\xbc)\xd9\x8b\xfd\xba\xce\x10\xb0:\xbeO\
-\x9d\xd2\x1f}z\xa9\xed\xbc\x9d\x19\x15\xda\x1c\xfc\xcco\
-\x95\x7f\x8a\xffS\xf3Z\x9d\xfd\xad\xf2\xb3\x1d:\x90\x87\
-*\xbc\xd7\xb3w\xef\xd0\xc4+\x9d6\xbcS\xfeTr\
-z\xe6K#\xc6vy\xe3'\xbf;\x03\x13\x9f\xac\x15\
-\xa0\x9a\xdf\xedZ\xf5\x80\xef{1\xbfo\xafv\xa5\xcf\
-\x97U\x99\x96c\xbaT\x8d[t\xb5v\xf9d\xd3\xfa\
-\x0f?\x1d\xc2/NG|3\xaf\xfb/\xa46\x7ff\
-\xbc\xb3\xe2\xf7./\xbc\xdc$\xa6\x22\xfbt\xb5v\x7f\
-\xb4ZY*\xe0\xc9_\x0d\x0b\x86N*\xd1%n\xd0\
-\xfe\xd6\xb5\x07\x8e\x09\x1dk\x0c\xdb\xf9\xfe\xf92\xeau\
-\x9f.\xbbt\xb9\xfb\xc1\x97V<\x9e\xd0\xb1\xf9\xab\xa4\
-\x02_\xaf\x9d\xd1#\xf8\xeb\xd5\xd7\xfds\x02\xc6~\xb1\
-\xbbF\xad\x92\x91\xf5W>\xbd\xa6L\xe8\xb1!\xc9\x95\
-\xda,f\x08{\xea\xb3n\xcf\xa6Ro\x0e\xd9\xb0\xfe\
-P\xd2\xfc\x0eQ\xaf\xbc\x1e>xD\xf5\xb0\xd65\xa7\
-\xbd\xd3\xf4\x9d\x8a\xbdW~\x96\x922\xdc\xaf\xf3\xc2\x96\
-U\x96\xfeo|\xbd\xf1\xbd\x8f%G|\xf3\xf3\x1f\xc7\
-\xfaW~\xfe\x93\x96\x95\xa2\xbf$9\x04\x9c\xbb}f\
-\xfd\xf9\x15\xbd\x82\x1e|\x15\xe1?\xab\xb6_\x8b\xae\xda\
-\xe1\xec\xdb->K\x18\xa7:\x95\x9c\xbcx@B\xb5\
-\x03CbK\xad\xe87\xf2\x8dE\xc3z\xa8\x22\x07\xf4\
-<Zq\xff\x90;w\xbe[\x1f0\xad_\x88\xfax\
-B\xd7E!\x1b~\x8dj\xa79\xf2\xca\x81\x03O\xe6\
->\xf7\xf61\xf3\x9a\xcf\x1b_?\xb8rS\xcb\xff7\
-\xf2\xd5QQ~Q\xbb3C\x0d=C\x87\x84 \xd2\
-\x0d\x82R\x03\x0c\xa0\x80\x84\xa4tHH#\xdd3\xe4\
-P\x82H\x09Hw\x09\xd2=4\x824(\xcdHH\
-7H\xc3\xe5\xf7\xado\xad\xbb\xd6\xfd\xeb\xbe\x7f\x9f\xe7\
-\x9c\xbd\xcf~\xd6>\xfbY\xfb\x9c\xf71\xe3\x87&#\
-\xa9&\xd4\xe3\x1a\xcb\xeb8\x884 \xa6w&\x8c\x1c\
-\xd9!r\x91yp\xbd\xbb\xd8\xd20\x9e\x82mK\x06\
-\xd4\x17\xde\xe4\x0b\x8f\x92d\xb8\x98\xa4I\xaf\x042)\
-\x9d\x96\xe5T\x5c\xffcg\x0c$L.\x11\xbf\xdd\xee\
-\x8b\x05_\x99\xa2\xa7{\xe8\x95o\xec\xb8\xff\x94P\x0d\
-e\xfe\x09\x88m\x7f\x04#\x07\xc3L\x97\x99\xfd$\xf4\
-\xb2\xc3\xcb\x1bK\x822\xbe-;\x17o\xb3k\x96\xe0\
-G:\xdf[d\x17\xb5\x10\xda\xf3\xda\x95\x14\x7f`;\
-\xbc\x15OWj\x02\xbf\xe4}o\xef\xe6\xf9\x0dw\xd2\
-\x05X\x1c\xc3\xa3\xa4\x0d\x1d\xd2^ll|\xa8\xde\x94\
-\xe2\xff\x1c)\xa7\x12\xdd)\xc0\xd5\xf9\x94\xe6\xd3*h\
-\xba\x99+\xfd\x17\x0e,\x1c\xee\x14r?\xbc \xf8\x5c\
-\xa7h\x1a\x89K\xf8\x9fn\x9f\xfdh^\x9e\xf6\xcc\x88\
-B\xcfh\xe9Y7Z\xc6\xa2\xf17`h\x9e\x0a\x8e\
-\xcc\x0f}\xcb\xc2\x12\x93\x92\x09\xb6\x03w\x1d:\x19\x9d\
-m6\xee\x02\x8d\xc1\xd4\xac\xef\x84\xda\xdd\xfc\x9c\x9f\x10\
-S\x22n\xf6\x1fk\xf4\xa2\xa4\x19\x1a\x99\xfb\x0a\xbfQ\
-\xaeK\xe8o\xfc\xfb\x9dDsK\xc5\xb0\xf3\xab\x02G\
-\xd3\x7fTI\xa7\x1dd\xc4dy\xc2\x0f_|\xe6e\
-=\x1b\x15n\x12\x11\x8e\x8f(\x9d\x98\xae\x06=H\xeb\
-o8\xba\xbdS\xa7T\x18r\xaa\x0a\x5c\xd9\xf8\x07\x98\
-`\xd3>\x1f\x9c\x88%Q\xf3\x0e\xa7\x91\xbb\xb0\xf07\
-s\xabAu\xc9\x5c\x8f\xbe\xfc-\x88\xee\xd9y\x80\xed\
-5\xc9\x9c\x10-|\x8d\x02\xd3\x95\x9a\xc6\x80+]\xba\
-9\x92\x98\x12\x15\xb0\xf8\x0d\xbd\xff\x13O\x90/\xe44\
-\xe76\x07\x90\x8bR\x89}m\xb3\x9eW\xfd/\xe0\xef\
-\xbe\xb1\x1a\xa7\x84\xe2\x9co\x04\xa3\xab\xd6=\x96=O\
-Y\x0a\x7f\x81\xb3K\xea\x99\xbfd};^\x9dP\xe6\
-\x01\xf2b\x1e}'\x5c\xd9\xa5\xfd\x88\xb1\x98:8\x03\
-\xfb\x83W\x8e\x06j\xcf\x9fI\xa5\xfbM\xf0\xba\x0a\xdb\
-\x94\xb0\xa2\xdd\x9f$\xf4r\xdf\xd4\xeet\xd4%\xbd,\
-7\xa8Z{{v\xd2\x93\xf3\x1d\x8f*\x9d\x06\x10[\
-'\x1a\xc5\x83\x93\xccZ.\xfb6B\xe5Iu\xa8\x12\
-\x0b\x13\xfbv\x96\x14G\x00\xb8\x05\xca0>\xa6\x8ar\
-U\xb8\x83'1\x19\x9fR\xf0\xdd\x9c\xb7\xe8\x8ft\xf4\
-\xb8\xe33\xb0\xde0\x18\x9a\xcc\x8cn\xdd\xa7\xbb\x15\xe1\
-\x8c\xcc*\xba\xd3V\x8a\xdbSw\xf9&\xea\x9c\x9d\xd8\
-uK9\x7f>;\xa1\x03m\xc9s\x22\x16\xc5\xc6\xea\
-\x9dM\xf5|\x0a&\xb1(ct\xb4\xb3\x85\x1bY\x8e\
-\xdd\x5c\xa7\xa3\xc2|\x99d\xc2\xca.\xc8\xf1\x98\x9c\xc8\
-\xaf3\xbf\xd39j\x1f\xa5\x86\x83a\xd22\x987\xcd\
-\xcd\xbe\xce\xcb\xac\x99\xa8\x8ekDJ\xf6\x025W\xf9\
-A\xec\xbf\xe0\x83\x11#\x02\x0c\x19.+\xa6$.\x89\
-\x98C\xbd\x97-\xc6\x9b`\xe4O\x09\xd69\xa6\xc0E\
-X(EepO=\xa2\xb1\xf5D\x0dl\xf4\xba\xd9\
-\x14\xd4\x01\xbbH2;\x89\xc2\xd7\x10\xc8\xc9V\xdc*\
-W\x900\xf3\xb4\xe1\xc3\x82\xf64\xeb5\xd8\xf4>d\
-S\xc4q\xed\x95\xcf\xd7\xe0\x96o\xdc;\x1bI\x95Y\
-\xbf\xef\xa2\xde\xe1e\xfc~\x22\x10\xa5\x829R\xc18\
-i\x06Vr\xcd\x1f\xd5\xc6\x04\x17g\xa3K\xe7\x94X\
-\xa4\xbeM`L\xba\xaapK\xd9W'\xda\xfa5\xa3\
-\x0f\x03\x17F~\xebj\xf8\xd2\xc5\xdb\xe7>\x06\x8d-\
-\xcb\xa0R\xb8,\xbb\xa7\x96W\x12\xc4\x15\x1d\xa3\x8b\x81\
-)\xef\x1c.\x22\xbfo|\x16\xea\x9a\xab\x1b\xa7\x80.\
-}nw\xb8\xef\xa8\x91\x0d\xffn:\xf2\xf8\xd8!q\
-\x034\x8a\xfb\x0c\x83\xdbgD\xd3\xdf\xf4})\x98\xd0\
-l\x8e\xec\xaay\x9e\x10\x9b\x5c\x7f\x0a\xfc\xb5\xf3\x86\x0f\
-\xfa\xef\x1d\xbf[I\xa3|<\xdaBj\x92\xed\x90'\
-\xf4\x04\xe9\xf6w\xab\xb5\x14\x06\xbc\xa0=\xc4\xc2\xfc-\
-\x98f\xf5\xfcX\xe0\xd58\xfb\x99\xa3\xact\x1c\xbcP\
-i\xdcr(\xc9\xd4a\x89\xdfy\xd8S\xd0\xf8\x15Y\
-\xbc8\xce{\xd8\xc0\xf2\x97\xfc\x17.\xf1+f\xba\x16\
-@\xa22[\xf9\xc9\xb5i\xc1f\x03\xc2\xa6wl\xd7\
-\x1a\xea\x83S\x8aE\xb5\x19k\xd6\x5c'\xe1\x81O\xa6\
-k\xcc(O\xbe\x12v\xf7)\xea\x8e\xb3\xd2\xbb7\x12\
-\x9e2\xf5\xeeQ#\xfd\x05\xc1\xe1\xeb\xf4\xe3+U\xde\
-'/\xf1\xbc\x91\xfd\xdb\xc7\x0b\xa1f\x02\xd7|v\xef\
-\xe5\x9b\x1f\xad\xe8P\xa6[K\x0dD#\xf5@\xea\xa0\
-9\xd6\x17\xdf\xb8\xf6\x89/\x89C\xbf\xcd(_\x07<\
-\x95B~c\xcc\xe1\xf8:M:\xea\x17\x12\xa7\x9d\xc9\
-\x82\xe7O\xe9m\x0d\xdf\xf0dN\x87\x9a\x04\x0bis\
-\xdaX\x90\xc2\xa2\x8d\x01&\xae\x97b\x173\xf4#\xd8\
-\xde\xc0C\xb6\x5c\xf5\xd3\xe7$F\xf9\x87\xd3\x89x\xf6\
-\xbfG\x0e0zf\xeaW\x07\xd0\x0a\xa4\x8d\x06q\x8b\
-\xc2\xba\x0e\xba\x17}\xd4\xd30I\xb6\x12\x8aY\xc6i\
-\xff8\x18/Z\x19RV\x16!\x16\xf0\xb0\xb7?\xa5\
-\x1eSi\xe7k\x8d\xa5\xac*{\xc8Dz\x87\xd41\
-bK\xb3\x1f^\xc2\xba\xa4\xd5\x89\x91\x17\xe5\x15\xbb\x8a\
-\x8d\xd6&\xf4s\xd5\xf6\xec\xb3\xee\xf4\xe64\xedd\x7f\
-j\xe0\xec.Z1\x1c\xc7B\xd0[\xf3\xf3\xb96\x1a\
-7\xb9\x9ea\xa9\xb4\x19\x1ctIy!L:\xd6\xed\
-66\xed\x00uHg\x06O]\xb6\xf8\x1aR\xa2\xa2\
-\xdf\xb6\xeb\xf0\xef\xe3-\xb6\xa6?e\x1b\x80\xda\xe9\xca\
-\x81N\xaf\xbe\x1c\xb4\x80\xed_\xfb\xf4KV~q\xb1\
-\xa9\xa8\xf6\x1c\xd6\xaf\x8f\xa6\xcf[N\xec:\x12\xa7\xf2\
-!\x85\x14\xd0\x98RI<jY/i\xa7\xd7\xcb`\
-\x9e\xb3\xed\xa1\xd2\x7f\xd74\xdf\x12tU^\x13\x95q\
-\x9d\xd80m\x0em\x14\x91y\x95\xc3.\xc9\x0e#\x04\
-3\xe6\xa7-\xda\x1aJg\xaa\x8a\xd8M\xb2\x12\xf5q\
-\x1e\xa4>\xd4\x00\xe74\x92Y\x06\x90\xabVWC\xea\
--z\x18\x90\xf7xQ\xaa\xed\xc4\x13#\xb55\x04\x93\
-\x87Kj\x18\xe7\xb18c-\xbd\xf4\xbf#\x8aS\x92\
-q\xa1\xcc\xfdmf\xf5\xe4P\xbeu\xac\xaa\xf9\xc5I\
-\x82\x99\xd7\xd5\x9b\xf2\x22o\xa4lO\xa5\xc6Ozd\
-\x07n\x1a\x9b\xb4/\x93\x0boWR1U\x0c\x07\x81\
-\xbb\xae5\xbbSM\xce7\xed\x1e75\x8b\xa0`7\
-H\x94or\xb3\xce\x82\xeeEH\xdf\xcb\xf2\x8f\xef\xab\
-_\x80\x0a\xfc\x99\xecy\x99\xb5\x14\xf3\x8ag\xb1?\x10\
-\x82\xb9N\xbcJ\xe5K\x86\x04\x08\xb88y2\x8aY\
-\xb2p\xee>\xfe\xa5\xbd\x01\xb4\xa1\xf14/\x13\x09\xe8\
-o\xc7\x1c\xf9v\xd5L}\xc7df\xd2\x03\xa9\x831\
-\x11\xb8\xa1\xac\x94'\xdf\xd02\x13\x92!Lf8\x87\
-\x9e\x89;\x90\xe7lc\x22\xa5\x8c-\x93\x07i\x0d\xb8\
-\xf0\x9d}\xfc\xc1Xt\x9c\xa5xQ,\x81\x8d\xa1\x8e\
-$\xbf\xc9r\xab\xbe!\xb7\x9e\xbd\xb7\xc5\x9c\xabS\x87\
-\xa6\xfa\xa7~\xc4N\xe7G\xf3[\x1f\x95\x8d6v\x0f\
-N3Nz\xd9\xaaQ\xaa\x14\xd8i\x9cm0\xba\xf4\
-\xfdK\xaco\x94\x17\xe5]\x9f\x89\x19\x07\xf2\xbc\xb8\x0a\
-g\xd2\x9b\x894{o\xe3\xd8\xb1\x1e,#j\x90\x9a\
-u\x00\xbb\x00\x077\x88:}\xda\xf5\x80aR%\x97\
-P\xe4\xd2\xbe\x13x\x929f\xc5\x1a\xb0\x0a\xcd\x8a#\
-\x95\xfcM3gW\xc7\xbcR\xc8\xf8\xdaA\xe5A\xbe\
-\x89\xd4q\xdeQ,\xfc\xd2\x99J\xcf\xbc\x8f>$H\
-\x0c(\xce)\xb2\xd9\x9f\x0f\xf4\x13N\xc9)E\xbd\xca\
-3\xdfk\x02g\xe5\x1f\x9dm\xd9\x0c\x8d\x22\x1b\xccg\
-Y\x0a\xef\x92\xc95\x92\xcd\xdc\xb1\xb9\x19s\xd8\xbds\
-2\x81F8\x19K\x9b$\xa3\x09\x11\x88\x86/\x0eg\
-\xd7/\xbe\x80\xaa\xddu\xef}F\xf0\x02z\xf4\x14^\
-\xc0:\x082\xa8\x8f|v\xe5\xd6H5n+\xe6\xe2\
-\x97\x96.\x0d+G\xe0\x0e\xce\x15X\x89\x7f\x1d\x98\xed\
-\x1a\x8a\xb8\x0e\xad\xe8\xb7\xdbU\x07\xd3S:eR\x9b\
-(z\xdf\xe6N\xfd\x1a\x91\xbd\xa0\xa8\x10\xbe\x00\xaa\xe1\
-HG\xfc\xb1\x88\xd7\xb1R\xdf1i\x5cU\xbd\x1a\x02\
-\xe8\xfa\xe5\x98\xc4\xa4\x8f\xd7\x0eb\xf0\xc4\xe9.\xf2\xbf\
-\xaa\xca|\xb3\xfeN\x13\xd66\xf9\xd3\x85$)3\xb3\
-n\x06\x06\xed\x8685\x94\xd2\x1d\xf9\x9cf\xfb&\xd3\
-\xc4\x09\xc48SA\x96\x89\xb25@\xf9\x0c\xbb\xd4H\
-j\x85\x85\x05\xe3\xec \xec\x84\xf3\xbf\x9d\xc5\x09\x1b\x1f\
-D\xa4^\xd1\x07GIS\xae\x1b\xd0\xe9!=+U\
-W\xac\xb1d\xd6?}\x98\xa3w\xb9\xa3)\x12\xf2\xb2\
-\xc9Tt\xe5\xdfT\x88Z\xd8z\x0b\x06Y\x11\xbb\x9d\
- 7\x0f\xf8\xdf\x881\x9c\x01\x96q2\xe9\x8e\x9e\xfb\
-c\xa5@\xbcX*\xc5\x93\xf4\x83\x91W\xd7\xd7@\x85\
-1V\x8aL*\xf9\xcf\xcb\x95\xc9?l\xe6\xfe\xb2O\
-5T8\x12\xd9K\x95\x7fWK\xe4\xb6]\xec$u\
-B\xc8\xb4\xdc}Q\x8e\x98.\xe6\x1d\xba\x5c\x83\xc7s\
-c\xdfu\xf9\xee\x9e\xbe\xe9{\xb5\xf8hso\xef\xa9\
-)\x07s\xf3\x93oB\xd0\x08@\x06W\x95\xc9\x1f\xaf\
-\x87\xca\xb4\xdc\xb0\x81\xef8\x9aj\x88\x0cV\xe17B\
-1\xc2|\xb5\x15\x04\xbc\x08|!!\xf39]jK\
-\x05_\x9eT\xe1{p;a\x03u\xbb\xc6\xa1>M\
-HP\x94\x1b\xa2\xa3{\xa22G(\xf5\x0bS^\xf6\
- \xf6\x8a\x85n\xee\xc8\x9f\xe9\x02'\xaa\xbe\xa5\xeb\x83\
-\xb8FN%\x1e\x10\xb3\x09\x81}7\x85\xcb\xd3q\xc3\
-$g\xe0\xb5\xe1\xd8\xed+fR\xea\xf5\x82\x11\xa7-\
-\x96\x83;\x8a\x8b\x13\xf1J\xbd\xae\x0co\xe2\xf0\x94\x82\
-.\xf4:f\xe3\xdb_\xf7\xaaL#\x12\x85\xaaT?\
-d\x16|\xe1\x9c\xc8%<i\xcc\xd0c%\xb2\xda\xa8\
-\xdc\x1b\x1b\x86my\xa335\xcd+\xc7\x85>\xefL\
-\xacvS\xff\xd7,q\x0b\xd7\xc6\xd6\x94\xc2\xdd\xf8C\
-]'\xff\xb2k\xe1m\xf0\xf1\xc7\xb4\x03\x19YmN\
-\xab\xdf?/\x11t\x08\xd4\xd7\x9eaP\xee3\x5c\xe9\
-\xee\xe2\x06e\x0b\xa1Q\x05>\xc0\xe5\x84\xb6,\x5c\x8a\
-D\x9ce\xe5o}\xb4\xb0S\xe7#\x86\xa0\xa8Vr\
-\xf5\xb2T\x0d\xa9x\xb1\xb1\xb9\x9d\xbb\xde\xbeW\x1c\xce\
-\x109\x19+{\xa2\xa3\x7f\xcf\x19T\xb7\x05)\x1bi\
-\xd1\x1fQ\xd7\x81\x14\xdb\x9e)\xca\x05\x9b\xd1\x91\x8a|\
-\x80\x15\x82@@Fx44.\xc1\x90b\x0f\xeb\xaf\
-\xd1\xac\xcd\x8f\x04\x0a.\xb9\xcd\x1f\x93\x08=\x85\x80\xaf\
-d\x7f\xbf\xea\xe5\xfe\xd5\x86s\xf0g\x19V\xce.-\
-\xf15\x10\x89\x9c\x0a\x9e\x05G~L\x02\xab\xeb\xe8\xf8\
-\xf3\xfb\x9e\xa8\xae\x81\xb2u\xa1\x96B\xe2x\xd9\x1c\x9c\
-!\x0e\xb8\xf8\x1f\x16\xdd\xce\x07*\xa6y\xfaJ\xf9\x9d\
-\x16\x97U+\xab\xf0kX\xf1n\xc2\x88\x1d\xb9D\x9f\
-\x9f\x87v8\xb6\xc7\x19\xd85\xc2\xca\x94Co\xa90\
-?,^\xeaX\x1c\x12\xc4,\xe1b\x16T\xf4@\xec\
-J\x0bo\xb2r\xbd\x00DD?+v'\x96j\xdd\
-\xae4Y\xd9!\xce\x15\xc1\xa1\x97\xeb\x97,\x7f\xe1P\
-\xf3Q\x22AHM\x0e\xdd\x8b\xf4\x04\xb4\xe3\xc3$\x1c\
->\x09\xc5\xe51\xdd\x04\x90\x12\x00\x11\x09Is\x10\x87\
-\xd2\x9f`\xad\xdc5\x12\xac\xdb\xae\x85\xf3;\x85DX\
-\xc0\xd4:\x8f>\x93k\x07y\xae\xe5W0?Q\x1d\
-\xc3\xf3S\xf7\x82\xb8\xdc\xb22B\x8a)e\xe4f\x0d\
-\x9e\xb3\x86\xb8\x9c\xeb\x97\xa8\xdc'o\x80\xfam\xbe\xa2\
-#\xbe\xb9\xec\xabd\x0a\x8aa\x0a\x8d\xbc\xda\x15\xef\x84\
-\xdc\x96\xadj\xed\x0e\xd96\x99\x97\x0cp\xf0\xc7]r\
-\xf8W\xcb<\x18\x19=\xec)\x8fR{\x0ax\xa2\x85\
-R\xce\x09\x8c&(\x7f\xc1w\x89(J\x00\x14QX\
-1\xea\xeeX\xc7\xf0\xdc\xb3\x17\x8f\xe4\x9a&Q\x10l\
-\xb7\xf9\xbb\xf9\xf4\xd9\x03\xa5;\x8am\xb1\xc79\x05\xcf\
-eu2Aq\xcd\x0d\x11a\xa8\xc6Gw]\x8e\xb0\
-\xc4\xf5\x00-\xb4k\xc9O\xa1\x7f\xf0\x0c!I\x0bz\
-\xc4\xc4\x92\x89\x81\xf2\xe9\xdb &\xddw\xdc\x02\xe7\xef\
-\xb2r\x8b)]*\xbfs\xb3\xee{\xc9\x9d\xf2(\x89\
-k\xf1\xba}\xf4\xdf\xda\xdb\xf3\xc4\xd3\x9cU>\x9dG\
-\xf6Oq\xb1\xee\x09\xc5\xf9\xf0\x14\xb2Z\x00!1\x03\
-\x1f\x8c\xaev8.\x93\xa2HF\xfb3Tu\x042\
-\xeb\xc9\xdb\x96\xbd\xe4\xfc%\xa7\xbd\xe7\xa4e(\xbd)\
-\xe0\x11\xae\xbdVyk\xb6\xf1\x03\x0c\xa3,Y\xc0b\
-;~\x01/\xaf\xf2\x10K\xa4\x1f\x1c\xff\x8d\x10\xa9\x98\
-~g\xf3]&\xc5^\xdd+\xd4\xa7\xcf\x14ok:\
-\x82\x7f<\x1a\xc8\xf7\x9f\xb2#f\x07h\xce\x01\x9be\
-YH\xf1cT\x01\x9ej{\x00\xb4b\xeep\xf9\x0b\
-\x82\x1bE\x84K\xa6S\x04Z\x13\xbd\x0d\xbe\xce\x80\xf0\
-\x97\xedHh\xba=\x05\xcbo,\xfc\xc5\xc6@\xec[\
-\x19\xc8Td\xe3\x90X\x9e\x93,\xccB@\xf0\xcd\xad\
-\x89\xea\x89\xa6\x80\xc5\xd3\x7f\x18\xae\xa1\x9f\xcf\xf7~#\
-\xee\x19\xcfIc[G\xf1\x8f&\x14\xa5\xf0\xac8=\
-~d\x90\xb8\xa3\xa9N\xe4\xd1\x1a\xa1\x01NE\xfb/\
-\x96\x93?\xf2A\xdd\xde\x81\xe2+\xb4\xab\xdb\xa1\xb9\xea\
-w\x97\x02\x83c\xfe\xaa}\xda\xc4+\xca\xc9\x15E\xae\
-[\xdf\xc8\xfff\x89T\x8d0\xcf\x5c\x96\xf6\x94\xbdP\
-=\x0dGg*O\x0b\xe9\xf2)\xfd\x82\xb9?\x03\x10\
-\x16Z\xcf#\x8ak\xe8\x1c\xea\xfa\xe8\xf5\xbe\x5c_\x8d\
-\x9c\xd8\xa9\x86\xd3>6HW\x90\xb3\xd4\x97\xe0\xa0<\
-\x1a\xf6\x97<\x8e2\xebGT@\xcf\x9f\xa7\xfcH\xfb\
-\xd9\x1a\xf9K\x04\xce\x0e\xa8\x848Q\xa1^\xfc\xb8$\
-\xc1\xb77\xf7\x9c\x95L\xa5\x85\xbf\xba\x16%\xd5\x1b~\
-fn>\xbe\xc4\xc99\xfa3$\xc8Q\xa3\x22\xf8\x15\
-N\xa3\x15,\xf1\xd4\xec}\xf4\xc4\x14\x8d\x07\x0f\x8c\x0a\
-UHP\x94G\xb4\x0b\xb1,\xd6\xb1w\x93N-.\
-\xf3T\xf9~g\x8a\xaa\xa5\x8d\x16c\x92\x00\xf6\x9dh\
-\xd4\x01\x02\xe0\xe9L\xccJ\xee\xa2l\x8bMp\x1f\x97\
-\x0c\xd6\xd7\x89|\xe8\xcf\x8d\x5cM\xee^#\xbckn\
-\x04zI\x81\xb2\x05?\x94]\xbc\x93}\xf4\xd9\xbb\x80\
-MW\x22\xa3\x19\xc2\xa4#\x03\xca\xdazp\x1f\xcd\x5c\
-*\x84\x0e\xdc^\x95\x1b\xeb$Y\xb4\xb3\xc2\xa0\x0a\xee\
-\xa7EN\xd7\x9d\xef\xda;\xbcq\x92\x8a\x93\x1b\xa0\xfb\
-\x06U\x1es\x9c\xdb#\x88\x85\x12\xc2\xc3\x08\x8c\x90\x9a\
-\x05j(\xc8\xd1\xc7\x83\xd1r\xef&H\xbb5\x16\xa6\
-\x022\xe3\xdb\x1a\x0d\xc24?\xbd\xa1\xa6\xa1\xa0\x1d'\
-@<d\x81\x90\x17q?hc\xf4KM\x06WB\
-\xd9\xcc\xcd\x05\x8d\x9eY\x0c\xb7\xee\x82v\xb3xu]\
-\x0394?%\xa0V5s)\x01\xe68\xd0Q@\
-\x8c\x9dG{y\xfe\xf2~\x13d\xb4`\xf0\xa0\x9f\x17\
-\x87\x8c\x0a\x97j\xf3\x04~\xb1\x18u\xf9c\xd7q\xb1\
-H\xb1G\x18\xc0\x92\x09|\xf4\x01\xb5\x1f\xdb\xb0\x10|\
-\x15\x5c2G+\x95\xd3\xdf\xd7\xf7\xb6\xde\xe1}K\xa9\
-\xe2S!\x16\x22\xaf\xca\xed\xe2\x9b\x95}\xbf\xc6\xf7\x93\
-\xc3\x93\x81\xfdQZ;\x1b\x99n\xffV\x19\x0f\xea\xe6\
-\xef#\xda\xb6H\x5c\xc2{_%\xec\xa1\xc3\xba\xb0=\
-,\x8f\xb6\xb0\xe8m\xce\xf0\xc4\x1c\xdbi\x93|}\xd0\
-\xefg\xea\xec\xa9\xd93\xbd\xfd\xad\xdc\xdd\x1d\xc4\xbb\x1c\
-_\x98\x86Z\xe5\xe5Y\xe2\x05\xb4\x03)\x0a\xb69\xdb\
-)\xf9\xc472\xe4\xed1\x1a\xed\xfe\xab\x85\xc3\x90p\
-od\xb6\xe2\xf7\xc6\xad\x1f\xb5\xfd\xde.;\xbf0\x17\
-\xab\x99\x8d\xbfN\xf2T\xb0\xcc\xba5\x9cog\xbfJ\
-\x99CBY:l\xfe\xe8\x84EF\xfc\xde\x19\x13\x94\
- \x96i}/<4'\x9c\xe1\xf3\xf7\x0b\x9eT\xa6\
-\x0b\xb1_#\x91\x02#\x95{(\x1c@E\x90G0\
-\xbfP{{L\xdb\xd1h5D\xd5\xf7t\xa1\xf4\xfb\
-w\xe0\xf7\xf9-t\xd3\xba\xf4\xf6%\x1d\x03\xc3d\xcb\
-\xfeUAPO\xf8\xd9/xj\xab08\xb8\x12\xaf\
-^z\xea\xeb\xf0;\x92g\xf1\xa0\xc4?\x0ef\x83\xa2\
-;Gy\xe9wq\x1b_\xef3\xde2\x05\xfd\xca;\
-\xe93tB\x0a\xe4\xb79\x8a~\xfe\xec7\x0a\xf3!\
-\xe7\x9b<\xa8}\x1c\xfdE5|O\xc2\x93\xef\x5c\x92\
-\xfc\xf5\xcfDD\xdd\x15\x19}\xf8\xc6\x8f\xd3\x16\x09\xdd\
-\xec\x83\xd4\xaf\xc7\x1e\x18\x03V\xa2\xb8\x8f\xa3#\xf5\xec\
-\xa5\xb7`Rh\x00\xcej\xa8\xb7\xb7\xc6\xd8\xdd\xec.\
- &&\xe5(F6\xfe\xe3\xaeg\x1b\xcd\x05y\x86\
-\xd8N\x9e\xf5w\x169\x08\xb6\xc3r\xb5[\x81 \xd9\
-\xac0c\xf8\xbf\xd8YU\xeb\xc2\xf2)K\x96\x0f\x11\
-]\xd3\x8b;WN\xf4\x9b\x86\xfd\x85\xaf\xd3\xc5\xcf\x17\
-\xdcl\xa6{\xcaq`\xff\xf7\xfa\x81\x15U\x92kE\
-\x9d>\xfd\xd6\x1b_Na\xea\x9d\x19@\x06Is'\
-\xea\xe6\xebQk\xbf\x1e@\x07\x1c\x12pQ\xd2\xe2\x8a\
-#Ln\x90\xd5\x12;(-\x11\xcd\x00[\x16\x068\
-\x96^\x05b\x86%Gh\xf0\xbb\xe3]\xf6Em\xad\
--\x9e\xc7\x1d\xa8\xb8=r\xb92\xcb\xd9`9\xdau\
-\xec\xda\x95\x10\xd99k\xfa\xef\x02Co\xdb\xa5a\x09\
-O=i\xab\xee\xb80e\xe3\xcd\xf1\x97\x82\xe6\x9az\
-\xca\x9b\xc4\x0a\x9b\xa0X\xa1[79Im\xc4|E\
-\xf6\xd7\xb8\xd5\x9a\x86\xfbY\x8d\xccH\x15<&\x95\xa3\
-\x05\x9f\x15q\xd9\xe55s\xe1\x7f\x90\xdd\xfd\x1a\xb11\
-N\xady\xdf\x22\xd1+U\xd2\x10\x92x\xadX\x9f\x9b\
-\xd9\x81\x97m\xde\x9f\xa2\x16\x08\x1c\xec\xdd\xfb\xc9\xff\xfe\
-T\xc3x\xa6\x1a\xefV\x0aR\x85\x16\x8d\xa7ma\xd4\
-\xf4\xf2W5tY\xab\xa7p\x1d\xd8t\x0f]\xe1\x94\
-\xe4\xe1\x01\xe8\xe1\xd8}\xf5\xae\x8c\xd9\xf2\xcc}x\xf6\
-gn\xba\xc5\x94\x81\xe7\xdaZ\xffm\x86\xb1\xef7s\
-\xccG\xc5\xac5s\x01\xecc7{\x1b\xaf\xe6\xde\xd5\
-\xb8~_\x13\xb0\x7f\xca\xe5\xa9\x88**\x1d\x8a1|\
-\x1a\x8f)=7\x15)\x93)\x96a\x95)\x12\xfd\xda\
-\xe9\xa4\xb4\x1e\x9f\x90\xf8\xd3\x00P\x9ai\x11/\xe4\x22\
-\x0aQ?:\xbe|\x0c\xa8\xa4\x9e\xe6\xe50\x0a\xbc\x5c\
-5\x0c\xf6=h\xb2)\xcd\xfcS\x81NV\xcc\x82u\
-\x99\xd7(\x98\x11\x82\x9c/1\x1bL\xe7C)\xa6\xfb\
-\x83\x11\xc5U8\x8d\x8c\xe7\xbb\xb5\x04\xe7@=\xcb\xda\
-\xdc\xba\xd9y\x80\xb5\xe3\xdaa\x05D?+\xa9\x8dt\
-\xf9\xd9\x1b\xc9\x15\x16\xd9e\xec\x8c\x11\x22]o\xcb\x9f\
-\x1fF\x85\x87X\x17p\x1f\x11v\xbb\x5c0/\x83]\
-\xff\xa4\x99\xea\xfdy\x11\xf6c6<\xb8\x12\xb3\xba;\
-\xd9\xa0\x95T\x1f\x80\xeb'u\xf8(\x01\xf2G\xd7\x12\
-\xd4hb\x9e%\xbbIw?V~\xc7\x01\xe6m\xff\
-\xf4\xaa\xc7\x88\xa4\x99\xbc\x81\xb813\xa4\x95Gj\xd4\
-\xf0}\x0cO\xac\x0b\xbdK\x8f\x81\x84\xd6~\xa7`F\
-\xec\xea\xf6x\xf5\x8fy=\x1e\xc3\xe03\xeb\x0eB\x01\
-{`#&\xc3\xad\xf1\xa80K`\x22\x88\xc2\xfb\x8f\
-#n[\x8b\x93K\xea?\x9a$e6\xf1\xbbFv\
-\x93\x95\xcb\xbbeE\x97\xf7\x80*\xf3\x8b\xd8\x07*\xb7\
-\x8b\x89\xa3X!\x02\xe3\x9eC\x9f#\x9e\x8e^Q\x12\
-\x5c\xd4\x08\x80\xf6e\xea/hx\xb2e\x00\xb3\xd8\x92\
-2\xa5'/Q\xa1\xaf\x99e\x8a\xf9Mln\x95\xb8\
-\x93\xdf\xd1\xa6\x173\xe7v\xf7\x1f\xce\xc79\xae\x87\xee\
-\xa4\xf6A_\xea\x88&)_*9\xe8\xdf\xcb\xae\xfa\
-|\xfb\xb8\xfd\xa4\x8b\xb9\xf1o\xfbu\xd09\xff\x17Z\
-\x06\xe4;p^\x12\xe5Pr6\xc7FV\xd0\xaf\xf2\
-\xb8\xa0\x81\xeaO\xe9\xcf\x1c\xe5\xc0\xd5\xf9\xd6\xad\xe5\xf4\
-\xbf\xbeY\xce~\xb7J)\xb5\x0bM\xa6\xbe\xec\x1a\xfc\
-\x98\xf4\xedz\xfa\xdb~Il\x5c\x9c\xfa}\xd2\x95\xe1\
-\xfd\xcd\x89u\x90f!\x8d\xfe\x15c\xab21\x9c\x0f\
-\xd0\x8e\x22tV\xb3\x0d\xfc\x07n%XW\x92\x9d\xab\
-\xf2\xbc\xe9\x8e\xf0G09\xcf\x115\xae\x99NV\xbf\
-{%\xa1\x1e8\xf1\xaa$\xe0Z\xb1Rg}4\xf7\
-\x05\x14\xea\xd3\xbf\xb9\xb9\xd9\xef\xb9\xbf\x9d~\xe4g\xa0\
-\xf2\xd8d\xe02\x02\x83\x03\x8e\xa8\x1e}nH\x9a\xe7\
-\x9f\x83*\xfd\xb8\xb2\xf2\x94e\xceql\xbd\xdb/b\
-\xe2\xc1\x0b\xd3\x9d\x1f\xc3A\x04\x1e\xe4\x8d\x87\xae\x9dN\
-o~\x9e\xc1\xde\xd5|\x09\xf5Yw\xeb\xab\x9a-5\
-#\x11\xd6\xbb\xf1\xd9\x18\xd9\xd5\xca\xe2\xa7\xa0a\x5cJ\
-\x01F\x0a\xe9\xb3kO\x1f\x15\xa8\xa4|\xb8k\xb2Q\
-\x9a\x80M\xcd#X\x1bQ%\xc5\x9b\xd8\x91<\x7f\x06\
-\xb6\x8f\x95\xc01q\xbdS\x08uLL0\xfe\xf0\xb0\
-:R=<\xd9\x80#yz=\x0e>\x15\x93\xbd?\
-\x1b\xfdA\x97\x06\xb0\xea&=H\x04\xe7\x05\xe4\xc1\xed\
-_\x19\x87\xd8>\x1d$\xd77\x5c\x8a\xe5\xb7\xd2\x1eV\
-\xc3\x04L\xe5\x0d\x92\xa5%H#\xcfY\x97\xd4d2\
-\xdey<\x1f\xf4\x15a\xe6\x9b\xd7I\x04i\xb0\xae\xec\
-\x0d\x14\xe3\x98\xa1l??\xad\xd4\xd0\xa7Z\xc7\x07\xff\
-\x86$(>\xe9\xd1\xf6 ?$\x85\x1bB\x9f\xfe9\
-\xa4\x01JCt\xdb^\xcf \xc6\xf2\x99\xc4\x8e\x9d\x19\
-\xf5ek\x9f\xf3\xe7\xa9\x89\x935\x01\x88\xc8*d\x02\
-t-P3\x86:Md\x10\x07\x03\xc8\xda\x09Z\xe9\
-\xd5D\xb8(\xb9\x15\x86 $pI%\x8cY\xcef\
-/+\xcfYg\x00\xba\xf7\xcf%\x9a\x10\xf1=\xceV\
-jk\xae\x84\x9a\x913\xe9/\xaf\xd8fmy\xa9\x89\
-\xa6\x0c\x9b\xa1\xcen?2\xee\x136\xa1(\x16%f\
-\xb5\xd47)\x8c\xebx\xa0-*\xea\xebe\xebu\xc4\
-\x84|-H@\xb1'\xb3X\xb3\x08\xbb\x0cc\x0d\xd4\
-\xfc\x04\xfcU\xc6\x15\x18\xfa\x8a\xb6P_\xa7\x0d\xd4\xab\
-t\xf8\x14~\xd6-\x0eEU:iu\xadj\x02\xdb\
-\x94\xc12\x1c\x16O)\xb2FPx2\x88\xbak\xc2\
-P'\xb4T\x88\xa6\xe6\x93\x95\x0dn;`*\xf6\xf1\
-\xa7z\xa0\x12\x8bw\x92\x81\xa4IzY)\x93\xdc\xab\
-\x9cT\xd7\xa9@\xc8\x85x$X$\x98`S\xe7\xe5\
-\x85z\x94\x18\x89tYi\xcd\xc9\xbftnN\xfe\xd7\
-\xb6G\xe6\x81\x5c$\xa3\xb0\xccdJ\x00\xd4}\xfa\xfb\
-\xab\x0c\x09\xa7\xc4G\xdc\x03\x13ML\xd6\xc9E8\xe5\
-\xa5w\xac\x5c\x9ch\x15x\xb6\xe0.\xd3\x0d&\xb6$\
-\x7f\xb3\xfcn\xf2\xc6\xfa&\x0b({\x04O\x01()\
--hK\xff\x1e^\xbbI\x14\xfe\x929\x80\x8d\x9e\x01\
-\xccJ\x11\x8c;\xa73\xbc\xfaY=\xff\xb0f\xa2\x12\
-i\xe0Dyi\x8f\xd8\x05\x10\xa2\x91\x83u\xbe\xab\xf0\
-*(\x87fOD\xea\xbbe\xd9\xae\xcc\xa9v\xf8\xe2\
-\x03\x13\xa4p\x99\xb3\xe2|\xeb\x8e\xc0\x0f\x80\xd0p\xd2\
-;\x8bj\xf1\xa4G\x1b4\xb9g\x0f\x0e\xd5\xcb\x8bl\
-\xe1\x16\xa1T\x01\x1f\x9an[\xdcH\xc9+\xc4&?\
-\xc4\x93\xb3J}\x09\x89G\xc1\xcaE\xfc\x0f\xb1R\x95\
-\x06\x09\xb3`\xb5\xd2\x1c\x96`R,w\xaf\xd1\x8e\xf4\
-\xeb\xbb\x93\xc8C\xecGr2\x02\x90\xf7\x84.\xdf)\
-\xcf\xba9\xa8U\x84E2Q\xb05\x91^\x0c\x1eX\
-\xbe\x97\x99\x13\xf3\xea\xa7[Ng\x7f\x15^\x01\xe4\xec\
-\x12\xce\x05p*\xcc\xb7l|\x0bK\xcc\xb0\xd0~\x91\
-\xff8\x0e\xce\x02\x82N\x8a\x84\x04\x11(\xe8\x81\x8a\xe0\
-\x0b?\xe5\xb9\x84J\xa1Y\xef\xf3A\xcc\x1c%\x83\xf5\
-\x82\x18\xe4\xcbQ\xd0\xb37\x0d\x03$D\xf0\xe7\xb3\xa9\
-[F\xe4P\x14\xa2\x90\xee\xe6\xd2\x7f\xa9m*1/\
-'S\xea\xd9\x8b\xfd\x9d\xcb\x8a\x8f%\xf0\xf7@\x94>\
-\xe0\xc3\xe2\x22\xf6V\x1e`\x9fm\xae\x18M\x82\x11\xb1\
-OJdj\x93\x1f\xeb|\x0973y_\xdaI\x0a\
-\x09\x07\xb2\xe0\x86\x16\xadf6\x15\x17\x03;x\x1f\x91\
-nM\x97\xb1J\x15\xbd\xc41sq\xe9 \xc7\xb4\xc1\
-\xe9a\x96\x08\xe1X\xc1\xd9\x1f\xca\x89/N.\x9e\xb0\
-\x08\xf0\x8b,b\xf0\x0eo(J\xcd\xa9\xc4Cl\xfb\
-G\xc0|\xfdLIr\xb5\xd6\x88\x07\xcc\xde\x5c\x9d\xd6\
-\xfd\x82\xec)#\xb2\x08\xf9\x17\xf0\xa0WY\x9d\xec\xac\
-\xc9\xa0\xa9\xe4\xaf\x9f_,\x0a\xb3!\xd6\x10E\x0a\x0b\
-F&=\x8e\xc0J\xd3\x0e\xe9\x89p\x8b\x99\xe7Z\xda\
-{\x90\xc3\x1d\x14\xfdv/\x1b'[\xf93i\x0d~\
-(\xb2;\x97\x13OFUJ\x0btHd\x940\xf6\
-P\x9d\x87\xb5\xd5\xfc4\x97`g\xa1Fd\xeb\xf6\xd2\
-t\x04\x0f\xd51\x16(\xb0\x12f\x90n_\xcf\xceH\
-\x86\xd8<\x81\x22\xe5s\xdf?\xd02\xeb-\x81]\x00\
-\xc6(\x97\x18\xf0\x06C\xcd\xf8\xa6b*\xd7t\xe4\xa1\
-\x5c\xcb\xdc\xc8\xb3\x03\xee\x83\xfe=h\xf3\x1aMjF\
-#\x1e\xaa<\xe9\xba\xb7\x9fP\xe8r\xdb\xed\xce,&\
-\x9a\xe2\xd1;+\x86\xc3]T\xfa|\xc41!\xbdV\
-\xa8\xfd\x1ahl~\x9e\x10\x81\x92D\x94MR\xb1\xd1\
-C}\x92A\x85@5Y<V(\x92\xf6\xfdv'\
-)\xb3uP\xe4u\x0dj\xe9>(\x82\xa0\x03kf\
-l\x92\xfc\xb2\xa9wE\x8a\x9bc\xc6E\xec\x8c%\x16\
-\x9a\x004a\xb6}\x86\xaa\xe7\xb947\x0a\x81c\x17\
-\xe6l=\x18\x87\x0b\xa4\xf9\x01\xa2^9\x06(\xfe\xd8\
-\xb3p\xf72\xa2~L\x05\xac2GD\xe1\xbb\xbc\xf5\
-\xc8\xfb\x09\x05\x1f:\xc4\xaf\xc26\x9d\x13\xac\xd0\x14\x91\
-`\xc9\xa8d\x9a\x87\xa0\xe6\xecO\x94\xb2\x03F\xa3\x1a\
-\x9b\xe8\xaap\xb8\x81\xd3\xc5\x11\x91\xac\x99\xb4\x88/\x06\
-C\x03{\xb0\xda\xa6\x96l<osOS\xe24[\
-\xda\xaa{\x83x\x14\x80W\xe8\xa2\x08\x9c\xc2\x87\xe7\xfd\
-x\x7f6*!\x01\xec\xc5\x8c\x08\x1a`\x93 \x89\xd6\
-\xc7\xce\xb6\xb1\xe3e\xdd\xc5\x0e\x84\xca\x7f\x0e\x92l\x92\
-\xfcJ^FA\xb7F'I\x1em\x84m`}\xd8\
-\x22\xf99\x98\x96a\x0bx\xc7\x11\xfe\xf4@{C\xf8\
-d 52u\x86\xc5VT\x1b\xfb+\xe0\xd9\x9fR\
-\x1c\x85\x1f\xafX\xae\x8c\xea\xa26z\x19\x9eHJP\
-\x95\x80k\x7f>\xf0@*N\x83\x12\x9a\x89\x97A\xe1\
-\xeaF5\xf3N\x80\xbc\x8e\xb9=\xb7\xa7:\x96Dp\
-\x85\xcb\x89[l5\x81A\xf1\x15\xaew\x12M\x0dK\
-1.\x05\x8bg\x91\xe4\xae}W.\x192\xf9?\xbe\
-f*\xf3\xa2O\xde\xb1\x1d*\xe7\x8a\xddQ\x22\xefk\
-\xec\x8eT\xfd\xf9+f\x0c\xb6\xb7\xb62\xa3H\x97\x08\
-\x16h\xe5?\x8fbK\x0d}]\xdb\x1db\xeb\x1ff\
-\x81\xfe\x07\x03\xe4>\xe6;\xa7\xb6\xc1\xb2\xe9\x1b[c\
-\xc0\xad'\xa8\xe2+\xdc\x92\xe9\xc9\x80\xf7\x1bD{\x0b\
-\x01o ,LI*H\x19\xbc\xe4\xf0\x8b\xeaBB\
-\x09m\xaaFp\xed\x02\x86\x9f\x82@\xff\xb3\x9cN\x0a\
-(\x08\xe9\x97\x9c\xfb\x04\x10\xa8Q\xe3\xc9\x92\x1e\xe9\x9b\
-{dk\xf1\x90{BJA7\xa9\xcd\xd5\xac\x16#\
-x#\xb2\xd8\x0e\xfe;\xa5\xdd\xcd\xcfx^Bm\x9b\
-\x1e\x02\xedA\x9e\x04\xde\xc0\x18\x05\xe5Y\xe3U\xcd\x0a\
-\x87\x8b\xff\xbe\x87\xd4\x00N\xffy\xfe6\xe6\x9a\x0d\x17\
-\xc6U\x1c\xfe\x80\xf1(6\x0eO)\xd4whg@\
-b\xbd5c\x19K\x08\xe9\xd0\xe02?\x12\xd8\x9f\xf5\
-\x91\x82\xfe\xce,\xaf\x99\xe5\x9a\xd7a\xa2\x94\xa5'\xac\
-N\x1fp36..\xc0\xf5\x8fC\xa90\xfd~\xce\
-\xb4\xd65f\xe0\xcf\x9f\xd96\xddT\x05\x83g\xb3=\
-\x90d\x83V\xa4\x96C\x92I\x9c?\xfci?\xe2\xc0\
-[\xd1^\xfe\xd6\xb8:\xcby\x17T\xe5w\xee\x04\x87\
-\xc5g\x91\xc5\xa9\xa3\xc90\xaf\xdb\x8f~\xe9\x86\xd8i\
-\xcd\x83\x0am]\xa1\xb6\xb3\x9d\xa6\x1c\x14\xf8v\x8fW\
-\xd2\xeb\xd0\xf4\xaeu\xecy\x7f\xa9\xd1\x15\xa5]Q\xfb\
-/w\x10j*\x0f`\xeba:l\xb0\xce9`\xf9\
-\x89o\x16\x00!L\x19P\xb0\xd12kT\x03'\x18\
-\x81GG\xc1\x86H\xeeJl,\xc8\xb0\x06\xcb\x22\xfb\
-\x8f\x9d\x91\xce\x04\xd6\xfc\x1c;\xbf\x95\xd2\xef\xec_\xd0\
-\xfde\xb3\xc4\xd6\xb8\x94\x1e\xb7!\xc2}\x09t&\x0a\
-\x19'\x87\xc8\xcf\x18\xb9\xca\xe1\x15\xf4\xc2\xb3\xad\xf0d\
-`\xc5N)\xcd\x0c~,\xfb{L\xfd\xbeG\x8f1\
-\xb8\xbd\x8ai\x1c\x96O\xe9X\x00MFb\x04\xd8\x8a\
-L]\xb3\xa0\x15\x8c8\x86\xb7\xd8\x1a\x9e\xad\x1f\xf3\xe2\
-\x89y\xa0-\x14j\xbb\xf5`q\xa2\xd1\x0c*^\xd3\
-\x9b\xf0045\xed\xee\x19g\x0d%\xd4\x97\x893\x9f\
-\x9c\x9b8\x1d\x98/L\xfb\xe6%\xf8\x86t\xdc\x0fW\
-\xedH\x19\xceG\xe4\x88:\xb8\xd42Lx\xad\xfe9\
-\x1a\xa6B\x1a\xa8\xd3{\x1eP^\x97-\xc9\xb4qF\
-\x8d\x87\x83\xe16\xa8\xa9\x7fS\x22\xb2{C\xff\x14\xd0\
-\xed\xe7\x99\x87\xa0q\x13;\x0cIM3\xc67\xfaK\
-{\x80\xb2\xabP\x0cj\x7fn\x1cZ\x94\xf7J!\xbb\
-\x00O\x06=b|\xabm\xaf\x13\x93\xca\x8aPAP\
-\x0a\x8a\xdevD\xdd(C\x9e9\xa1^\xf4b:\xdf\
-\xa7\x02\x1e\xf9\xedV\xaf\xed\xfb\x03\xe4\x0c\x15.Y\xaa\
-\xc4\x0a\x0b\xd5\xf1\xee\xe6\x84\x9f\xee\xd1\xc6\xc9\xe5\x5c\x12\
-\x07k\x89|\x01\xd7\xde`\x0e\xf8\x13_\x16\xbc\xa1\xb1\
-\x14B/c\xc8\x02\xfb:\x191\x84\x8a\x8e\xa2^g\
-\x15/\xb1\xba\x7f\xd1\xd3q5\xec\xd0\xf6\xe78\xed\xd5\
-\xe1\x5c,\xa7\xa6Qb<r\xe6\xa8\xf1\xec\xa0D\x01\
-\x01!n\xd2\xb6F\x22\x91\xff\xcd\xf1@\xcd\x11\xf6\xd7\
-\xbc\xa5W,\x98\x5c\x9a\xf4\x0e\xe0\xa9\x0dW\xd5N\x85\
-f\x11M\xc6\x97p\x02t\xb8\xa8\xfd\x80\x87\x17@\x95\
-\xe0\x86]\x8dv\xd5\x0c\xe7\x90Q}\x0d\x9e\x14\xffs\
-\xa2Z\xd1$\x5c\xbe\xb0\x93e\xec8\x84)\x9b.\x1f\
-\xa0\xa0\xa0\x86\xbb\x14rr\x13\x1d\x22\x85\xf6`^\xcf\
-\x10\x1by\x80\xd2\xf92\xd01\xf2\xc8\x08\x08\xec\x06W\
-.\xf0`\xc2i\xd2\xa5i\x1b\x17J\xb7\xca_\xd7\x7f\
-r\xce)\x00\x88\xa8bS\xf5`F\xa9\xa3\xf2[\x01\
-\xda\x12\x88\xf3\xd5\xcc\xb0\xc6\x0b\xc6\xcdQ\x18g\xb8\x0a\
-]\x00'\x1d?\xc0\xd8\xd8\xf8\xc2\xd88;Q\xb3\xf2\
-\xf1U\xa29\xde1\x8b\xec=\x9d&\x13s\x96:\xdc\
-\x0c\xf7\x01z\xc0O\xb1\xa3\xb9\x95\x0f\xf1\xa1?\xec\x17\
-|f\x0a\xa8\x84\x0a\xae\x8f\xec;} \x9e\xbb\x92\x88\
-\x0f'\x04\xc048\x10\x06\xda!\xf3\x08\xfe\xfe\x99Z\
-\xd2V\xe2$\xbd\xfc\x09Nf(2\xa4\x8a\x197\xa8\
-]\x03\x80d\xa3\x82{??|\xb6\xe2z\xf1e\x85\
-\xdb\xa2Q^gv\x11s\xec\xa1%2,\xf5h\xa1\
--\x82\x19\xac1\xfd\xd9\x95\xafK\xa9\x7f\xe6\xc63\x03\
-\xbai\xad)\x8b\xcc\xcc\xbc\xc0\x12\xfe\x1b\x0c\xf2\x9b8\
-P\xa8\xc5\x0dU\x81\x9c0fXIH\xf4\xcb\xf3\xa3\
-:M\x8bI\x03\xcb\x82\xd1\xb3\xe8:x\xd6\xea=\xac\
-\x1e\xc4O\xf5i\xf9\xa2\x84\xc2^\xd7\xe3\xd9U\x02\xe0\
-\xb5\x10\x16\x80\x86\x83R\xb3.\xff\xf5\x05\xfd\xc2p\xe4\
-\xa4\xb9\x17\xeb\xa1&\xe6\x89h\x14\xc7\xebt\xc5]3\
-\xb8\x08\xb9>$D&k\x94\x95.\x97\x0b\xec+\xe4\
-\xc2vDr\x07\xb9\x88[\x97o\x09\xcc\xfb%\xd4*\
-v\x97\x9d\x152\xae}.d\xca\xf1K\xe2\x89TT\
-\xe0\x97\xcd\x93*\x99d&`\x10\xce\xee\x00\xcf\xd6;\
-\x0bS\xce\xe3\xed\xf2\x93\x07\x15\xf7\xdf\xb6.\xd7;\xa2\
-F\x16\xc4W\xbb9\xe1\x1e!]\xa2h\x1cA\xafU\
-v\xf4P\xb1_\xeb\xbf\xb5f\xfa\x80\xb7\xff&E\x84\
-\x01.\xd4}\xc2\x9cr\xf4k\xc82\xc4xj\xcb\xa1\
-$\x86\x00Y7\x1d\xd9\x96/4\x9b\x8cz$\x19\xef\
-\x93\x86\xcf\xf3\xe0\x16\x0f\xd5\xdb\xef\x0e\x19\x91\xe6\xa4H\
->\x8f\x9a\xd6F\xbc{\x8e\xc3\xc81;\xc1\xbd\xf4\x87\
-c\x7f\xec\x1d\x08\x00\x99\x83XJ\xa2\x97\x00\xfe\x15@\
-c\xef\x92.%\x84\xce3\xa2\x12\x9c\xe4\xce\xce_\xae\
-\x14\xc1\xcf\xa3\xd1\xc1\xb479\x94\xc1iq\xa5[\xda\
-\xd3\xa4\xabK]\xae'Vu\xbe!\xec\x10\x11s\x1a\
-\xbbI|\x18_C\xb2\x1d\x04`M\xb6\xb6\x8a\xbe%\
-n|\xfaMg=\x04\xc4\x90i\x03\xd6\x9e\xa9f\xfd\
-H\x11~\xd2o\x1e\x85\x0e\xa6\xb9\x99\xaf'6\x7f#\
-\x0a\xa7\x90}!+C\xd4\x9a|\x91\xd2z\x0ed\x12\
-\xcbT-\x9c\xa0mnI\xdf\xd9#}\xcd\x01\x008\
-nQ\xd8\x11\x95T]\xd9c,{\x0ev\xf6\x81\xdf\
-\xb4.P\xe0\xb2\xaa\xc7C\xbf\xfe\xf1\xb9wc\x1e\xa6\
-)x\x13\xb9^v\x85o/\x0d+\xcae\x02\x99D\
-\xb4\x14\xb9\xbe\xc1\xad\x14Z\xb9\xffe0\xd4\xe3\xbdP\
-6;;^{\xde\xd0\xa1/G\x81\x9d\xcc\xe9K|\
-\x18\x85\xeb\xce\x8a-M\xdaJH\x03\x8ee\xe1*\xb7\
-\x97c\xcb\x8a|O\x14\xe2\xdc\xc9\xd6\x96\xfa\xe2\x13\xcb\
-!-\xf8\x9e\xf2\xa8/I[\x85\xe4N.\x07\xc1\xaf\
-\xa1%\x1b_y\x85\xb9w[a\xba\x01\x98j{\x93\
-\x0bpqH\xbd\xc6\x9c\x0a3\xbc\x0e\x88;\x98\x9f\x1b\
-=\xf6$\x85f\x12\xf9\xe3\x8b\xb7\x03\x17\xab\xd0z\xb2\
-\xfc\xe4\xef\x22X\xb2\xb7\x09\xbe\xd6B\xd4\xb0\x97bm\
-\x11@\xf5^I\xcd\xc5d\x9a\xe0\x1b\x83\xa9\x9b\x11e\
-\x08\x17\xe3C5\xeb\xb4\x8fgIw\x1c\x06b\xc9\xe6\
-bv\x805\x91ys\xc6\xfa\xf4\x05\x11\xb6>Z\x13\
-[\xb1\x19\xa8x;\xbb9\xe4\xa6\x91v%\x9d\xa2\xcc\
-V\xaeS\x0e\xce\xbd\xa2\xc3L\xc2M\xf3\xff\x98\xdd@\
-\xbc#\xba\xda\xc4m\x12\x92\xdd\xa8@3\x9f\xdbw\x99\
-;\x5c\xe3\xbaJ\xb7\x95\xe8\x16{\xe5\x9ff\xf1\xff\xc2\
-\x93a\xf6%\x1bHB3\x89\x14KX\xa2\xef\x85M\
-\xb6\x09\xcd\x87+j}\xfd\xfc\xe8\x03\x22I\x94\xb5\x08\
-\x01\x92+ie\xca\xbaDL8Ks\xe8\xfd\x05|\
-\xa3\xb4\x1f\xbaN\x95\x89\xc20\xb7\xbd->\xc5\xe30\
-\xb2b\x0b\xad`\xfcS\x1eL\x16R\x8b~\x8a\x01G\
-:lz\x082\x98]\xads)e\x94f\x02\x00(\
-\x17,\xea\xd3\xe7\x96\xd2C*\xfb\x9b><\x8b\xdaC\
-\xfbA\xdbc\xde\xa84\xc4j1\x1a\x8e4{\xc4\x12\
-\xef\x189\x9c\x9e\x9f\x7f\x1e\xe4a-V\xcb\xb6x\x13\
-\x1c\xf0\xfc\x10\x88)\xc6\xf5\xb4'\xef\xb2\xc7\xd9\x12\xeb\
-\x1b\xab\xab\xbf\xcc\x8a,\x5c\xc0\xf1\xe6ae\x95\x0fE\
-\x06o\xaa\x8du\xe0\xd5\x8bVI\xd0#\xd5sZ\xa9\
-7\xcb\x93\xe7\x053\x9b\xc54\xe5x\xd6\x08qb\x04\
-C\xeb^\xc1$\xb0\xaf\x191Z\x22\x9e\x87\xce\xf2>\
-\xfc\xa5\xb7\xb2oig\xc5\x166\x87D\xb8\x0d,p\
-\x01\xf1\xa3)\x80\xde\xd1z\xa8\xf6S~\x5ci\xd9\xd5\
-] \x86\xe0E a\xe3\xa3\xba\xf3\xa8\xa3\xe2i\xbb\
-r\xd3\xdf\xf3c\x14\xea\x84\xb4:Vz\xa62\xed\x07\
-\x12\x1d\x81\xe3\x9f]\x8en\xf8Y\x96\x8a\xdb\xfb\x85\x08\
-\x8e\xeb5R\x8c6\x86hJ'\x84\xfe\xe5$\xfb\xbe\
-9\xf1\xa1\x1eg\x8b\xd7\x5c\xc3BK\xd8\xee\xc6\xe2]\
-\x88\x1e\xca\xaa\xffl\x90\xa3\xd7\xfd\xfe\x85g\xda v\
-\x7f\xdf\xdb\xbe\x95\xd7\x9d\xa0\x80,p\xb0\xc8\xa0\x84E\
-\x8e.\x89\x1a\x18\xa4\xde\xfaC\xb2\x90\x15P\x09I\x0a\
-\xd2\x18\xe7\xaaM~8\x94\xb1\x01\xd92\x07\xf5~\x08\
-\x92\xf8 \xd6v\x91\x11aA\x90\x11\xb7\x8b\x8eY7\
-C\xbb+g\x7fl\x0eg[\x87Adg\xa7\xec\xd3\
-!Q\xffe\xb3\x8a\xde\x93\x9f\xd0\xd2Vb\xea\xf6\xb6\
-\xef\xe3\xb7X\xed\xd8W\xd6\xf1\x8f!\xbe\x1f*\x8e\xfe\
-f\xe5\xaec\xc3t~P\xe3\xb9h^?\xc21\xc2\
-\x93,\x1a\xbf\xedz\x8b8\x00Hs\x1d\x06xdz\
-\x00^oa\x1f\xcf\xa4\x81\x87\x1b\x1d\xb6FS\x5c\xb4\
-\xa4\xa3\x8b\xdfAn\xe51B+CK\xd7\xde\x0b\xa0\
-\x0f\x82\x87U\xde\xe1F\x844\xb7\x8c*'\x8bgo\
-\xe3G7:\xe9\x0e)\xb5\xd5\xfa\xd9(\xa4J\xc6o\
-KkH/\x9c1\xcb\x02\x8e\xe7Q_\x9f\xac\xd3\x07\
-\x8f=\xf3\x7fVe5D\xa5\xd87t\x91Ys\xab\
-\x16\x89@}\x9ed\xae-\xd7OX\xff)\xbc\xca\x11\
-\xed\xe5B\x10\x06\x94\x5c\x85\xce T\xeb\xe5\x0a2\xa4\
-\x81\x17\xf6\x19b\xb6F>\xd7Lq~\x88h\xe8\xfe\
-\x04 \xbe\xaa\xe4\xfc\x9aTQ\x85\x00 \x9e\x97}\x14\
-j \x8a>\x19vsu]\xa2\xa7_\xfc\x86\xe5\x0d\
-\xb8\xa8E\xa7\xc8\x95a\xf5\x81Cu\x04\x02\xbb\xff\x85\
-\x07\xb9OZ\xc3\xb1\xa1s\x08\x1b\x90z\xd9\xfd6\x1f\
-\xa5S\xefv>\x97\xe4\xc1\x8d\x1b\xddDG\xbb\xc5'\
-\x0df+\xd9i\x90I\x0a\xaa\x9d\xcc\x1b\xab\xb2\xd6\xb0\
-\xa6\x0a\xcb\xbbM\xc7/\x8f_Z\xb7\xce*&0\xae\
-\xc0\x0a\x07\x90\xad\xc1\xc3\x02&Or\xfd\xbe\xf5/\x05\
-tO \xf2\xf9\xac\x02\xd7\x01(\x8d\xb5\x80\x18\x00\xdb\
-\xbd\xa2\x97\xcf\xa6\xdb\x89\xc1\x14\x0e\x8ba1\xbf\x8c(\
-mg\xda`\xed\xf8~\xb7c\x8e\xf1\x8d\x1f\x92\x8d\xc0\
-You[%\x07\xa6\xe4\x99V\xd3\xc0;\xe9\x92\xa3\
-\x8f%\x8d\xbe\xb6\xdbLx\xcb\x1f \x89\x00A\x15*\
-\x04\xa6\xc9\xd5&\xf0D\xa3\xe8\x8ak\xd2|\xb6\x1b\x00\
-\x89b\xe5<%\xad\xa3J\xc3\xea\xab\x0b\x0f\xccb\x8f\
-\x9e\xb9\xed\xb3|D\x0db\x14d\x0a;\x0b\x03\xabp\
-\xebV\x13\x84\xf8yi=\xa2A\x15\xb0r\x09\xd4\x93\
-h\x9fY`\x86%\xe7\x10\xf5\x13\xb7\xaa\xfc\xd2i\xd7\
-\x16-\xe2\xbdH\xa0\xe7\xc1b\x08\x8b\xd3a\xf7\x1bJ\
-\x13\x8e\xc1 `V\x99i\x8b5\xdd\x8d\x1f\xd2\x8b\x96\
-\xb8\xdd\xae\xcf\x0dfO\x1ah{D\x8b\xa6\xb8\xd6\x8a\
-,\xf1\xe6\xba\xc2\xc5\xc8\x8b\x8c\x1a\x1c\xc1\x14\x11L\xab\
-K\xf5\x0d3c$\xf4\xacgR{\xb6\x96\x84Ns\
-\xee\xc2 \x86\xedRA&\x87OA\xdc\x87rf\x9b\
-7n\xa3\x1f\xcb\xf9\xc3V\x02\xcf\x9d\xca\xebhV+\
-\x00~|\x03\xf6H\xb7\xc8o/\xfbs\x04@\xad\xf4\
-\xdd6U\xa1\x22\xae\xa1\xcb9c\xaa\xdb\xbe3\xa7k\
-\xcd\xc6\xe6\xa4\xe3\x1a\x89\xf7\x1a\x8f\x89o\xb0\xaa\xca\xc7\
-\x03\xfc\x88\x86\x90\xd4X\xa38\x8b\x16\x92\x97\xce:N\
-\xaa\xdfh\x86\x7f+\xa64\xbb\xbd\xbc4\xe3\x95\xb2\xdf\
-\x08b\xcb\x1b#\xf9\xf9\xae\xc4 \xe2zd\xcc\xbf\xe1\
-\xeb\xe8\x86\xac|<E\xa9F\x99\x1c\xd7\xeb\xb8\xa3\x9f\
-8\xc5\xed\x8f\xd6\xbe\x88\xfc\xaa\xb6\x7f\xaa\x8887\x1f\
-\x165\x93\xb7\x1d\xf9\xfa\xb5\xdb\x5c\x16\x0c\x90d\x01q\
-M\x95\xff\x99\xec\xb32m\xce\xf8\x9b\x81\xcf\xd3\xbb\xce\
-$\xa9\x12\xeag\x9f\xa7\xd2\x11{l\x1c\xb3\xa4^\xf7\
-,\x12|\x1b\xc6\x92TOTb\x17{v\xc2\x8e\xdb\
-\xf5\xb3\xfa\x88\xf1D\x9c{\xe1\xb9\xf8@\xe6\xfa\xd0[\
-\x09\xed\xdf\xe4g0Q\xc2\x8cx\xe5\x13\x7f\x8c\x02\x07\
-;p\xeb\xb2\xa3\xe7\xa4Oz\x01\xd3A7N\xc7\xbb\
-\xb6.FO\x15\x03@\x90#\xef,\xa0\x96%\x16\xc3\
-\x1d\xe6\x0e8\x17\xec\xd9\xcf\x13\xaa\xee\xa5i1%h\
--\xe8\x12j\x90*\xf4\x00 \xa3\x99\xd3\xe1\x98\xfbF\
-\x07\xe9_\x8d\xcaR#\xc7\x056\x81\xadqO~\xa0\
-\xd1\x00\xcee\x9b\xefo\x90\xcc\xf9~\x07\x90_\xe4L\
-C\xbec6\xac7\x8fG\x9c\xf3\x9a\xba\xd7\x1e\xc9\xa3\
-\xaf).\xbd\x04\x0d\xe4\x0d\x85\xb1\xfd\x9fR%\x02\x00\
-\xa7\x9e^-\xe8G\xe3i\xc5FZ^\xa37\x90\xe1\
-:\x09\x01\x86\xe7\x18\xb6F\xd1\x0b\xb5\xbc\x1b\xed0&\
-\xce\x85\x8f\xf1\xdf^'\x0fY\xfc\x0c\xf4S\xe2Z\x87\
-\x86'WV\xf6I\xc7_v\xca\xaa\x0e\xf6'\x97\xa1\
-\xb8dmK~q\xd1\xc8Sm\xeax7\x87\xfa>\
-s\x1acz\xe5\xd6\xb1G\x9a\x8f\xddj\xa8-\x1dg\
-\x0b\xa85\x22K\x9d\xad\xc2<\xe4\x14\xf6\xdf\xeb\xc9X\
-\x90p\xc5o'\xe51 \xbd1\xa3@\x10\x1e+\xf1\
-#\xad\xfbV9\xe6\xb8\xf5\x0d\x1a7\xeeC7dE\
-\xf1n\x85v7,\xd4WSK\x16\xfe~\xc8\xba\xe4\
-!\x0bF\x16\xaf8\x04\x05\xc9\x98\xd3$(\x17lK\
-\x7f\x04\xc9\xa2*p\xccT\x09\x1a\xd2]\xca\x05?\xd0\
-\xb9\xe0\xba\xd0\x8d\xfc\x8d\x7f\x7f\xaa \x05\xf7\x04\xa4\xbc\
-\xf3\xbf4\x10uYzS\xb1\xb6\x1c\xc4\xc1\x832F\
-\x84\x08\xea\x1c5<J\xfcq5\xbb\xb1B\x16\xf3,\
-\xba\x1f\x93c\xe1z}6\x8flA.O\xc9\x90\x06\
-\x13\xd1w{CB\x91\x82\x93\x07\xbb\xfb3M\xd1\xd5\
-\xd5\xd5&\xd0&b\x9b\xdd\xf4\x8f\xd2:\x01}\x13\x05\
-*\xd7q3\x02\x01\xb2\x14PY\x87\xcd\xb7\x9f\x0a\x82\
-\xdd\x01Je\x84\x03\xcfi\xbd\x85\xf6y\x97ew\xa4\
-\x0d;\x80Ko_\x1f\x5c\x9a\x176\xd3\xc1\x7f\xf0b\
-\xbc?\xea\xb6\xbd\xaa)\xd4pw\xbd\x92\xe5\xed9\x19\
-\xdej\xfc\xae1\x0c\x91\x10\xd0\xa3\xd0s\xb7 U\xa3\
-\xa8_9~\xb2\x0b\xbarI\xb2U\xc2\xe6\xe5\x9e\xd2\
-\xe51\xd5l:\xa94=\xc5\x96=\xd4\xb2\x86\x00\x96\
-O2}\xaeJ\x8a\xa8\xc3\x95\xc2\x85\xc4e\xc2c\xd0\
-\x04\x1e\xf8\xf0\xdfX\xf4\x08V\x84\xa5\xcf\xbb*~\x1b\
-sI\x95\x06\xc0\x81H\xdf\xcd\x82\x81B\xf6\xfa\xf9%\
-S\x5c\x98\xcb$c\x8a\x5c5\x0a*o&\x8f\xfd\x9c\
-\xc0\x86\xc6\x9f\x93\xd0\x0d_\x1b\xf8\xd4\xf5}\x89\x12B\
-\xd6\xece|\xc0\xba\xf2\xdb\x86\x83\x99\xcb\x5c\x01\xa2\xa2\
-E\xa7\x13Ig\x87U(}\xfb\x97\xe1w\x0a\xe3I\
-\x8d\x9c\xb7t\x0bj\xcaT\xb6yg\x85'5\x8f\xb1\
-\xdbI\x8e\x9d\xb4\x99\xbes\x04\x8f\xb5\x00~\xdf\xc4Y\
-i\x82\x01\xb0\x9cL\x095\x05\x98#\x1eK\x0a\xe6\x98\
-\xf0\xd9\xce\xd2I\xab\x16!\xa8\xdeyY\xad\x82J\xf5\
-\xfaZ{\xd0f\xb5/6\xff&\xac8\x1a\xcf\x0a\xfb\
-\xa2\x16u#\xac{\x8e\xcd\xd9\x19\xaa|\x00\xca\xfc\xc7\
-\xf4R\xa5\x05\xc4D\xd0dD\xad+\xbf\x9d&\x86}\
-\x054\x0a\x9d\xed\x8e\xdd7,\xdf\xfc\xef\xb9\xc8w\x06\
-\xef\x16\xae\x03\xbdi\xa9-eJm\xaaaL\x84\xc2\
-\x13\x00fBx\xa3\xf9w6B\xae\xa0\xcdq\xcbc\
-[Yqqa\xb3\x9d\xad'\x0a\x94\x0e5\xd1\xe2\xb4\
-\xf9F\x9eSZ\xea\xeed$\x93\xa5\xa6\xc7\xdb\x99K\
-\x06p\xd1\xdd]\xca|\xc4\x11\xa3\x1e\xc32X!\x0e\
-\xbdxr\xa4\xc7\xaa\x86\xca\x124\x02\x8d\xffF\x1dO\
-\xaa\x1a\xd2b\xfb\xfa}x\xfd\x85\x82\xcd\x8e\xea+@\
-u|\xfe\xb3|\x0c$J\x01\xee\x99\xf3\x81\x93O\x99\
-\xaf\xdd\xa51\xb4\xb1\x89\xc9\x9bP\x97\x9f\xfc\xd3]T\
-8\xc7X\x0d\xaa\xf0\xc1\xf3q\x02@#\xbd)#\xbd\
-\xd7\xfa\x80\x02\xb7\xfe\x09\x8e\xd1\xaf/\xfc\x7fx\xb6\xf0\
-\x09C\x84\x0e\x150\x05u\x06\xdeR,V\xa3\xde1\
-\xa4\xc4\xfc\xa5gw\xee<\x5cn\x07\xee\xff\xe9%\xc4\
-IC?\xa1\xec:\xa3\xe6%7\xe5\xad \xdf\x8e\x0b\
-\xeb6\xf4\xe9O\xa6s\xac,\xd8\x05\xcb\x80\xed\xd3\xbd\
-\x1c\xb0\xfd\xefJ'\xf7\x8e\xb4`\x05),\xf1\xf8\xcc\
-}\xa7\x94\xd8\xbeB\x8d\xf1\xeal\xba;\xf6\x11=\x8c\
-\x01\xd9<\x8c[(J\xa5\xe7\xf8M\xcc=m\xa2\xa6\
-\xcc\xe7\xc7`\xd0\x87E\xc2\xf9\xa6\x0d\x0d\xfdSa\x04\
-\xd6\x8fi\xcbV\xc2\x02\xb2\xad\xf2\xb8:_\xfe\xd4\x06\
-\xf0?\xdc\xb0\x86\xd5\x9byzM\xbb\x17\xe6\xffB\xd1\
-\x8e\x1c\x0f+U\xa2\x92\x1di\x98A\xf6\x12\xba\xcf\x9a\
-\x9d_+\x09a\xa5\x86\x1b\xe9Q\x17\x93\x19`m\xe6\
-\xeb\x5c{ S\x80\x07\xbdM\x0bOE\xd8IA\x07\
-P\xef/Gke\xb0\xe7I%\x9a\x15\xef\xa8\x1c\x04\
-F\x8d\xde\xfa_3F\xbc\xcc\xd1\x98\xcb\xca5\x08\xa6\
-\x0c\xee8\x80\x87E\xbb\xf6u%+\x13\xfeO\xe4\xe7\
-\xd5x\xc5Q\xec\xd9\x075G\x03\xc9\xa7\xd8< S\
-\xac\xca\x12\xab\x96\xc0\xaf\x5c)\xe0\x10\xc8\xa8\xf0\xe9i\
-\xed\x14o\xd4W8\xc0:\x92\xfb\x8e\xb38\x9cF\xd2\
-\xb4W\x1a\xebB\x05s\x09S\xd1O\xa4\xca\x06\xec\xe2\
-\xb4\x87\x1c2e{e\x93eS\xc1\xa9T\x07+\x8b\
-\xdf\x7f\x91X\xb4\xf5\xfd`\x5c\xcc5\xef\xb5\xcb\x92.\
-\x08<\xd4\xd2>\x80\xaf\xa9.\xc4`H\x91:\xb1\xfb\
-\x1b,\xe6\xa4\x87\xf2\x18\x03\xc1\x0fe\x06\xbc!f\x92\
-q\x06\x05}Wg;\x1b\xbe7\x0a\xf2,\x80\x08t\
-b\x91\xfeC\x8e0\x96\x92\x22\xa2P\xa64\xab!\x90\
-!\x17'_\xd7A\x87\xd5\xceLd\x87q\x00\xc5\x00\
-\xbf\xcb\xb6\x19,R\xe1\xe6\x07\x9b4\xc6\x0c\xdc,*\
-\xa1\xdf\xe3_%\x03\xdc\x98\xb3F\x85\xd3\x86\xaa\xcb\xb5\
-?,\xad\xe7rNe\x80\xae\x0808\x8dsa\xaf\
-k\xec\xc7rU\x00\xd1\xc2\xad\x81x\x17t\x5c\x1d\xda\
-\x0e\x0ap\x1a&\x03\x95\xf9c\xa9r\xc3\x14\xa2\x9bn\
-6(\xc2'[\x9fG\xc8\xa0\x86\xe7\x08\x07\x1a\x12\x8e\
-\x8c8\xfa\xd83\x8c{G!\x1e\xf6\x14,\xe1$\x08\
-\xa4\xc1\x0a\xc4\xf7'\xbcpR\x9e1\xa8\xb3S 2\
-l\xd8[\xbf\xb0\xd4cw\xbe\xf1a~\x80\xae-\xf9\
-\x1d\xb0\xa5\xec\x14\x18ebC\xb5;i\xde\x16\x94\x8e\
-\xf6\xcc\x82G\xfa\xd7\xd9\x1c\x06\xc0\xf6@ \x18\xf1\x15\
-\x1d'\xdb\xce\xeb\x92\x1e\xda\xc9\xb8\xe3\x03\xd6(\xd1\x16\
-_A\x11G\x0b\xd9\xb2s%p\xd3B/s\x87\x96\
-\xca\x08\x82\xcd\xe4w\x22\xd9\x95\x80\x1b@j@\xd1\xea\
-\x84C\xef\xdf\xe8\xf1|\x90\x99\xeb\xbcw\xc3\x1f\x22?\
-1n\xcft3;\xe6b(<)\xb3\xc7\x8f\x9f,\
-\xcd\xa2\xb2\x01\xf2%J`\xbe\xce\x9e\xba\xac\xe5\xb7\xa0\
-\x88>\x01\x12/6\x15O\xbek4:\xc9\x122\xd2\
-\x95\xd4\xe5\xcb\xa5Fd\xc0f\xf5\xcf\x08\xdf\xe59\xe1\
-A\xcf\xfa\x9f\x16\xda\xa4\x8a\xa8\xaf\x10(\xf6\x1f\xafn\
-\xf9G\xcb\xe3\xb2^!\x93\x99\xfc\xee\x09\xb4\xb0\x98\xd3\
-\xf5\x13}\xfb\xa3\x00\xa6\xa9=\xaeb;\x09\xbe\xd9\xbf\
-\xef\xd15\xc8\xa2U2\xe7J\xb3L\x1b<\xe2L\xe0\
-n7\x1bo\x1by#\xc3\xa7\xac\x9cf\xe3x|\x0f\
-*\xed7\x99\xea\xb6\xf2\xcd-\xd4zo>*&\x80\
-a!\x9b\x07\xfc\xb9\xbf,n\xb0\xfa\x1a{\xa9\xbb\xb9\
-<D\x81\x99Q\xe4!\x9f]\x9b\xceRV\xbf\x9f2\
->\x13$\x80!\xe8\x0f\x03\x1aE\xe6\xcf\x11\x0bl]\
-m\xfa\xb3\x15\x16\xe7^h\x0bc\xd0H\x8fk\xd1\xe3\
-'\xa01\xec\xc6`zJ\xff\x0e\x06hC\x9emL\
-\xf6cZ\xd1f\xb2iV\x98\x1aH\x0d\x90\x09x\x14\
-[\xe6^\x8b\x9dR\xe2\xa5\x0b\x7f\x02 ?\x1be\x1e\
-\xa1\xbe\x07\x1a\x81\xf7\x9d\x11{\xe0\xeeb\xed\xed\xeb|\
-p\xbc\x9a,d\xe2\xb0T\x11?\x928\x9bss/\
-\xc0\xbds\xa9\xbd\x1d4\xad\x0c{\xf1\xb94;\x11\xa6\
-\x8cfh\x8ah\xe6`\xd42\x88\xfa\xaem\xec\xd8\x96\
-\xe72\x14q\xd6ht/\xd5(\xb24\xe4\xba\xd5\xa2\
-u\x167\x9a(\xd3\xa5\x9ap\xbf\xb9\xfc6\xdb\x13]\
-\x14<\x94mX\x1at\xe5Bu\xfd\xb5Q\xf9\xc5-\
-\xfae\xeap\x8c\xdf\xfa`\x1ei\xd9cT\xbc\x0a\xe8\
-C\xdaG8 -\xdec\x87Q\x8a\x81\x8f*\xfa\xf4\
-\xcc\xeaS\x1e.\x8cV\xabA\xc9\x04;\x10\xe8\xa2\xe4\
-E]D\xa9\xe2\x18l-\xfb]\x1c\xa8?\xcc\xaa \
-\x91\x1c=\xf0]\x00\xdc\xdc5\xd6\xde~W\xb3\xccJ\
-\xb4\xf7\x92\x06\xfbw\xbeVIB\xa9\x1ab\x1fk\x16\
-\x8f(oW\x96\x86*'\xe6M%\xc9\xdc\x8f\xa9\xb4\
-e1M\xef\xcfV/$Zh\x1f\xed\xaa\x18}0\
-D\xbc\xc3\x1f\xeb\xda\x9d\xab\x8b6\xa8\x903\x9c';\
-uuZ\x9f\x99\x11'uX\x9cK\x1a~\x178B\
-\x94\x84\x1cL\x1a|\xaf.\xfewse\xa2\x00\xef\xdc\
-0mn\xc9]%@^]\x9d\x9b\xe2\xeau\xea\x83\
-\xadT\xf8b\x8e\xcd\xb4\x0b\xe8{Za0\x80o\xeb\
-\xd5\xf2\xe5F\xe6\xe2&\x1f{\x0f,\x01\xf2\xe4\xff}\
-\xf7\xcd\x02\xc0\xc7\x8fN\x85\x03\xc8\xc8\xa8\x04#\x01<\
-|\xa0\x0c\xd2\xceN\x9a\xb2 v\xf3O\xf1`4\x8b\
-\xac\xa6\xb6\x07M\xa3e\xf8\xb7\xc5\x8f\x83\x1ay\xd7i\
-\x10\xa6\x87Ad\xff\xdb\xe3\x1c\xd1\xbb\xaf^\xc03\x8a\
-\x1d\x8f\xfa\xf5\x97\xc2-qL\xee\x09\xa8\xea\xe5\xff4\
-,\xad\x16%\x9c\xb5\xd6X0'\xe2\x8f\x1b\x99\x1a\x19\
-\x1bm\xdd\x1d\x8e=Cd[\xab\xc6\x17_\xa3\x22{\
-\xc8]\xa0\xae\xab\xafe\x80\x94\x87r\x92\x0e\x8a\x9fH\
-p4h\xbbl{\xcd4\x12OF\x9e\x97\x8d\x1b?\
-\x0cy\xf0\x82\xf6\x7f\xdbycX\x81\x95u\x14+a\
-\x19Awn\x0f\xb23\xf4\xff\xf7{{t\x0f\x5c\x97\
-\xce\x18\xe1\x1a\xc8}\xfe\xdf\xff\x15^)\xa8\xc1+\xe5\
-\xcc\x82\xff\x0f/(\xd9\xe4\
-\x00\x00n\xde\
+\x00\x00\x06\x8c\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x06>IDATx\xda\xe5\
+[MlT\xe7\x15=\xe7~\xe3\x99\xb1\xad\xa9m\x8c\
+kB\x90\xa0l\x02\x91\xa05#j\xd0\xc8f\xc6\x96\
+(\xc9\xba\xb0q\x95]\x897\xc92\xea\x22RS\x89\
+E\xd5%\xdd\xb8dG\x9b,\xcc\xbe@%\x8f][\
+\x16\x98j\xea$H\x146\x84H\x01\xea\x1ac\xc3\xc8\
+xf<\xef;]08\x8ek\x5cb\xfc7~g\
+;3o\xde=\xdf\xfd\xee\xf7\xee}\xe7\x10\xeb\x80\xdf\
+\x02v6\x99\x8c'\x1a\x1bk\x15\x04Me\xe0g\xe6\
+\xdca\x01\x07\xccl\xaf\xa4]\x00\x9a\x00\xc4+?)\
+\x00\x98&\xf9o\xef\xfd7\x04n\xfb \xf8*\x02|\
+A\xe7\xa6\xf333s\x17r\xb9\xc2\xef\x00\xbf\xd6\xf7\
+\xca\xb5\xbc\xd8\xfdd\xb2\xae.\x91\xf81\xcd\xf6\xcb\xac\
+\x03@\x06\xc0\xcfA\xd6\xae\xea\x82\xd2\x1c\x80\x1b\x00\x06\
+\xe9\xfd\x88\xbc\xbf\xfb,\x9f\xff\xcf\x9b\xb9\xdc\xb3-E\
+\xc0d*\x95\x88\xc6b\x07=y\x9c\xc0)\x91\xc7\x00\
+4\x80\x5c\x1b\x82%\x01xB\xe0\xba\xa4+\x81\xf7\xd7\
+U*\xddj\x19\x1d\xcdo*\x01\x02,\xdf\xdd\xdd\x1e\
+\x90\xbf\x00\xf9\x8e\xa4\xc3$\xe3XGH*\x10\xb8\x09\
+\xe0\xaf\xde\xfb\xbf\x0dd\xb3cg\x80`\xc3\x09\x98J\
+\xa7\xf7\x98\xd9/ev\x86\xc0\x11\x901l$\xa4\x22\
+\x81\x7f\x06\xc0%\x94\xcb\x97\x9a\x87\x86\xbe\xdd\x10\x02\x06\
+\x81H[&s\xc2;w\x96@\x17\xc8\x9d\xd8LH\
+\x8f\x04d-\x08.\x8c\x0f\x0e\xfe=\x03\x94\xd7\x8d\x80\
+\xc9T*\xe1b\xb1\x1e\x92\xbd0;\x08\xa9f\xcd\xf6\
+\xf9\xeb\xd4\x07r\x1e\xde\xffKR_P,~\xf6C\
+j\xc3+\xdf\xfc\xd3tzg\xe0\xdc\x870\xeb\x05\xd0\
+\x0c\xc0\xb0\xb5\xe0\x01L\xc1\xfb\xbeB\xa9\xf4\xc77F\
+F&\xd7\x84\x00\x01|\xd2\xd9\xb9O\xd1\xe8\xc7 \xdf\
+\x03\x10\xc1\xd6F\x19\xd2E\x96J\xe7\x1a\x86\x87\xef\x11\
+\xd0k\x110\xd3\xd9\xf9\x13E\xa3\x9f\x80\xec\x01\xe0P\
+\x1d\x08 }\xc6R\xe9\x93\xc6\xe1\xe1\xafW\xfa\xe2\x8a\
+i\xfc\xb0\xa3\xa3\xa5\xb2\xf2\xd5\x14<\x008\x90=\x8a\
+F?~\xd8\xd1\xd1\xb2*\x02&S\xa9D<\x1a\xfd\
+\xa0\x92\xf6\xd5\x14\xfcb\x12\xde\x8bG\xa3\x1fL\xa6R\
+\x89\x1fD\xc0 \x10q\xb1XO\xa5\xe0EP\xbd\x88\
+\xc0\xac\xd7\xc5b=\x83/\x89cY\x02\xda2\x99\x13\
+$_T\xfbjG3\xc9\xde\xb6L\xe6\xc4+\x110\
+\x95N\xef\xf1\xce\x9d\x85\xd9\xc1-x\xd4\xad\x06\x06\xb3\
+\x83\xde\xb9\xb3S\xe9\xf4\x9e\x15\x09\xe8\x07\x9cE\x22\xa7\
+\x0d\xe8\x82T\x83\xed\x02\xa9\xc6\x80.\x8bDN\xf7/\
+\xa9g\xdf#\xa0\xbb\xab\xab\x9d\xc0i\x91;7\xfd\x09\
+oM\x9b~R\xe4N\x02\xa7\xbb\xbb\xba\xda\x97%`\
+2\x95J\x98\xd9I\x01G\xb0M!\xe0\x88\x99\x9d\x5c\
+|*,\x10\xc0h\xf4m\x00\xefnxW\xb7\xb1\x99\
+\x10\x03\xf0n%\xd6\xef\x08\xb8\x9fL\xd69\xb3c\x02\
+\x0ea\x9b\x83\xc0!\x92\xc7\xef'\x93u\x0b\x04\xb8\xfa\
+\xfaV\x91\xef\xac\xf70cKl\x032N\xb3S\xf5\
+\xf5\xf5\xad\x00`\x02,\xe2\xdc~\x02\xed\x08\x09\x08\xb4\
+\x97\x9d\xdb/\xc0\xecA2\x19w\xceu\x00h@x\
+\xd0\xe0\x9c\xebx\x90L\xc6-\xd1\xd8X+)\xb3\xad\
+\x8e\xbdW9\x16\xa5L\xa2\xb1\xb1\xd6\x14\x04M$\x8f\
+\x22d yTA\xd0de\xb3\xb6U\xcf\xed\xab\x9b\
+\x81\xda\xb2Y\x9b\x99\xd9a\x84\x144\xfb\xa9A:\x10\
+Z\x02\xa4\xb7\x8c\xe4\xde\xd0\x12@\xee5\x01\xbb\xc2J\
+\x80\x80]\x86\xe7oi\xc3\x8a&\xc3w\xaf\xa8\xc3\x88\
+\xb8!\xe40<\x17'\x84\x15\x05\x030\x1db\x02\xa6\
+\x0d\xc0D\x88\x09\x980H\xf7B\x1b\xbet\xcfD\xde\
+\x09m\xfc\xe4\x1d\x93\xf7_\x86\x96\x00\xef\xbf\xb4\x88\xf7\
+\xe3\x92\x0a\xe1\xcb~\x15\x82r\xf9\x0b\xa3s\xd3\x94n\
+\x84\xb0\x11\xba\x11\xaf\xa9yl\xf9\x99\x999\x90\x83\x15\
+)Zh\x96\x1f\xe4`~ff\xcev\xe7r\x85\x80\
+\x1c\x01\xf0$DM\xd0\xd3\x80\x1c\xd9\x9d\xcb\x15\x8c\x80\
+\x8f\x14\x8bw\x05\x8c\x85\xe8\xf1\xf7z\xa4X\xbcK\xc0\
+\x1b\x00\xcc\xce\xceN\xc8\xfb+\x0cA1\xa4T\x90\xf7\
+Wfgg'^\xf4\x02x3\x97{\x16\x91\xae\xe9\
+\xb9\x02s\xbb\xa7\xffM\x93\xae\xbd\xd0\x1b/t\x83\xa5\
+R\xe9\x16\xa4\xcb\x90\x8a\xdb\xb8\xf8\x15!].\x95J\
+\xb7\x16w\x83\x00\x80\x96\xd1\xd1\xbc\x97\xae\x0a\x18\xdf\xc6\
+\xab?\xee\xa5\xab\x8b\x85\x94\xdf\x9b\x07\x0cd\xb3c\x04\
+\xfa)=\xdaV\xc7\xa2$J\x8f\x08\xf4\x0fd\xb3c\
+K\xe7\x01\x0b8\x03\x04\xbe\x5c\xbe\x04 \x0br~\xfb\
+T>\xce\x03\xc8\xfar\xf9\xd2Re\xf9\xffL\x84\x9a\
+\x87\x86\xbe\x85\xf4)\xa4\xdbX\x07\x87\xc6&\xc0C\xba\
+\x0d\xe9\xd3\xe5\x14\xe5\xcb\x8e\xc4\xc6\x83`H@\x1f\x81\
+\xa9\xaa_|`J@\xdfx\x10\x0c\xbd\xe4\xf3\xe51\
+\x99J%\x22\xb5\xb5\x1f\x91\xfc\x8d\xaaT+H\xa0,\
+\xe9\xf7\xe5\xb9\xb9?\xbcLA\xfe\xd2\xa1h\xcb\xe8h\
+\xbeP,\x9e\x87t\x91\xaf\xe1\xc8\xd8\xc4\xe0\x03H\x17\
+\x0b\xc5\xe2\xf9\x95\xe4\xf3+N\x85\xdf\x18\x19\x99\x84\xd9\
+9/}\x8e*\x22\x81@ \xe9s\x98\x9d\xfb\x7f\xb2\
+\xf9W\x93\xcb\x9f<\xb9O\xdeW\x85\x5c\xbe\x92\xf6\x7f\
+.J\xe7Z\x07\x06\xbe~m\xb9\xfc\x0b<\xec\xe8h\
+\x89\xc7b\x1f\x92|_[\xd40A`J\xd2\x9f\x22\
+\xc5\xe2\xf9\xc4Z\x19&\x96\x16FW[\xfb+\x02\xbd\
+ \x0fl)\xcb\x8ct[@_07\xf7\x97u\xb1\
+\xcc,\xfc_:\x1dy\xe2\x5c\x1a\xe4\xaf\x05t\x83l\
+\xded\x02\xa6$e\x0d\xb8\xd0\x10\x04C\x1c\x1aZ?\
+\xd3\xd4bL\xa5\xd3{,\x129-\xe0\x0c\x81\xb6\xcd\
+\xb0\xcd\x09\x18'\xd0\xef7\xd26\xb7\xa4@\xba\xc7]\
+]\xedV1N\x128\xa4u\xd6\x1aVf\x167%\
+]\xf6\xd2\xd5\x1d\xcf\xfb\x97\x8d7N.\xad\x0d\xd1h\
+\xf4mO\x1e\xa7\xd9)\x01\xc7\x00\xfch\x8d\xad\xb3O\
+\x05\x8c\xd1\xfb\xcb&]+m\x05\xeb\xecR\xdcO&\
+\xeb\xea\xeb\xeb[\x11\x8b\xed\x0f\xbc\xef$\x901\xf2\xe8\
+j\xb3\x82R\xc1K\xff\x100\xe8\xcc\x86Q,\xde\x9d\
+\x9d\x9d\x9d\xd8r\xe6\xe9e\xb6\x86=\xa8\xd8\xe7\x0b\xf3\
+\xf3;\x9csm\xce\xb9\xc3\x92\xde\x02\xb9\x0f@\xab\x80\
+\x1d\xach\x13\x04\x14\x08<\x060\x01\xe9\x1e\xc9;A\
+\x10|\x15\x04\xc1x\xbc\xa6\xe6q~ffnw.\
+W\xe0:4g\xff\x05\xe3\xc4\xc9\xef\xa7\xce\xd9\x08\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03\x98\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x03JIDATh\xde\xd5\
+\xda\xbfO\x9dU\x18\x07\xf0\xcf9\x5cC\x80\x84\xa1\x1d\
+d\x806)\x8d\x0b\xb1bM\x88qQL\x13\x9bn\
+`\xa3\x0e\xc6\xa48X\x071\xf1\x1f@\xfc\x07Lp\
+\x91\xa1\x0c\x1a\x13m\xb0u\x22\x9a\x98\xdcN&6!\
+\xde\x92\xb04B\x82%i\x1d\xda\xa1\xa6`\x03\xbc\xc7\
+\x81\x8b@\xb9\xd0K/\x17\xee\xfbl\xef\xcf\xf3\xfd\x9e\
+\xe7<?\xcey\x9e\xa0FI\xbf9fI\xb7\xa0G\
+\x93\x17\x05\xbd\x92NtH\xda@\xf0\x08\x7fcQ\xa6\
+$\x98\xb1fV\xab\xb9\xf0\x9a\x07\xb5\x8c\x1f\x9e\x19x\
+Q\x87`\x10\x03\x92\xd3\xe8\x124U\xf9\xf9\x1a\xeeH\
+\xe6p\xddc\xd7\xc2yw\xebN %AQ\x9f\xe8\
+\x1d|Dy\x86k\x97%\x99q\xfc\xa0\xdf\xcd\x10\xa4\
+\x03'\x90\xa6\xb4ksI\xf2)NP\xf5lW+\
+\x19\x16$c\x96M\x84\x0b\x1e\x1e\x08\x81TT\xd0\xe4\
+\xac\xcc\xd7\xe8\xade\xd9U;W\x92[\x92\xcb\x82\xe9\
+\xd0ou\xaf\x97c\x15?\xbc(\xf3-^>\x04\xf0\
+\xeb\x93\x1a\xf4\x8a\xbe\xc1\xc5g\xd6@\xfaE\x9bfC\
+\xf8\xb2\x0e\xcbE\xd5\xc6\x9e\xf9\xcc\x8a+\xe1-\x8f\xf6\
+\xa7\x81\x82!\x8c\x1c!xh\x12\x8dx\xce\x87Uk\
+ \x15\x15\xf06\xbe\xdb\x87[\xac\xbf&\x92\xf71\xf9\
+\xa4M\xc4\x0a\x9c\xcf\x0a\xbeh \xf0\xeb\xa8\x82Q\xc9\
++{j Mi\xd7\xeaF\xd9`\x1bO\x92\x92\x16\
+\xaf\x87W7]l\xdc\x16\xa4\xda\x5c*\xbb\xca\xc6\x94\
+\xe0%\xcb\x86R\xda\x9c\xf8\xcd%T\xd4'\x19>$\
+WY\x8b\x8b\x1dV\xd4\xb7\x93\xc0zzpR\xe3\xcb\
+I\xd1\xbb\xdbl \x15u\xe0O\xe1\xc0r\x9bz\xcb\
+\x92\x7f\x9d\x0e\xe7\xdd\x8de\x1a\x839\x02\x0f\xad\x9a\x0d\
+BL?;\x86\x01\xf9\x93\x81\xf4\xab\xe3Q\xb3S\xe8\
+\xce\x1d\xfc\xa0[\xc1\xa9\x88\x1e\xc9\x89\x1cj\xa0K\xd2\
+S\x10\x9c9\xe2|\xa7\x96\xe8|&6t\xe0z\xba\
+\xf4Ft\xe6\x98@g\xc4\xf39&\xd0\x11\xd1\x9a[\
+\xf8Ik\xdc\x9a\x18\xe5\xd0\x95\x8a!T\xde\xaa\xe5%\
+\xa5\x88\xd6O\xcc\xf2*\xf7\x22\x16sL`1\xa2\x94\
+c\x02\xa5(\x99\x91\xac\xe5\x10\xfc\x9ad&bV\xf0\
+W\x0e\x09\xdc\x11\xccF\xcd\xe61\x97\xc3\x180g\xd5\
+|,\x9f\xcf_\xcf\x1b\xfe,\xf3S8\xe7~,\xb3\
+\xb9F\xae\xe2\xc1R\x5c\xf1\xe3\xff\x9b\xfa\xd0\xef\x1e\xc6\
+\xc9\x851g\x18\xdf(\x88\xc4-\xb7\xaf\x0a\x16r@\
+`Aru\xe3b\x93@\xbf\x9b2_Q}u\xe4\
+HL7\x19\xf3\x86\xdfw\x10\x08A\xb2l\xa2\xc1\x03\
+\xdb--&\xb6\x96\xa0\xb6\x1d\xee\x86\x0b\x1e\xca|\x8c\
+\xdb\x0d\x08\xfe\xb6\xcc\xe5\xad\xe7\xa2;\x08\x94S\xd4i\
+\xc9H\x83\x19\xf4\x1a>\x17LW\xc8\xa8wYl7\
+|b\xbd\xc0q\xfc\x88\xc1?\x90\x19\x0do\x1a\xab\xf4\
+\xb0\xb0\xebg\x8fMh\xc6\xd1\x97\x98F\xad\xb8\xb2\xc7\
+\x9e\xe6)f_\xf4\x9e`\x14/\x1c\xfa\x9aOFB\
+\xbf\xef\xf7z\xa9\x9a*\xe5\xa4\xcc\x07\xf8\xe3\x90\x5cl\
+\x92\x94\xcacNV\xb1\xab\xac\xf2\xafS\xda\xb5\x18\x12\
+\x0c\xabw\xa1\xbb\xc5\xc4\x93\xde\xa6f\x02\xd4\xb9\xd5\x80\
+qY\x1d[\x0d*\xd8\xc6\xf6f\x8f\xa0k\x1fZ9\
+\x9af\x8f\x8aD6\xdam\x9a\xf4\x08\xe5v\x1b:\xa5\
+]\xdam(If\x04\xb3\xff\xac\x9ao?\xe7~-\
+\xe3\xff\x07\x10\xda\xfd\xe3!\xdb\x8f\xb9\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x01\xaa\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x01\x5cIDAT8\xcb\xa5\
+\x93;N\x02a\x14\x85\xcf\xb93\xc8\xe0\x83jX\x80\
+\x8fBcE\x5c\x02\x1b\xb0p,I\xa8\xdc\x80\xb5\x05\
+\x0b\xb0\xa1\xb2%\xb1\x01\xb6@i+\x85\x9d\x09\x12;\
+\x13'\x16$c \xff\xcc\x7f,|\xc4BQ\xf1k\
+o\xbe\x93\x9c\xe4\x5c\xe2\x1d\x81\xe8\xd7\xd6\xa2jX\x0f\
+\x88#\x82\x0d\x00[o\xd7;A\xc3B\x18\xcc\xa6\xf9\
+\x08\xc9c\x06B\x00@\x00@\x0fAy-\xde\x0e\xad\
+tB\xb2I2\xc6\x17HJ\x05u\xf3\xc2]\xcc\xb3\
+t\x8cc\x14\x01\x04\x96\xef\xe3\x9dRX:#\xadE\
+r\x03\xdf@r\x15\xe4A`Vc\x18\xdd\x14\x97\xcf\
+O\x01\xf6k\xebQ\xa5tJZ\x8b\xc0\x0a~\x80@\
+\x00p\xd7h\xde\x8d*W\x16U\xc3:\xc1\xe6o\xe4\
+O!+\x04\x9bQ5\xac\x9bI\xc9w\x9d\x17\x86\x90\
+\xb1I\x89\x19\xad\x81%1Z\xc3`\xd8\xc4\xd2\x09\xd8\
+4\xfc\x13\x83\xc7di\xdbcb^~\xb8\xb4/?\
+4O\xf6%\xa5\x7f\x95%\xa5\x9e\xec\xdbl\x9a\x8f\x04\
+u\x05\xb8_\xcb\x80\x13\xd4\x9dM\xf3Q\x80\xde\xb3\xb3\
+\xdbh\x12\x98\xc5\x00\xf7^\x97\xb6X\x06|//\xdc\
+yq\x98>\x18\x08\xcd\xb3t\xecr\xd7\x96|gQ\
+\x1dI\xa9\xe4;.w\xedy\x96\x8eA\x88_\xbd\xb3\
+I\x89\xd1\x1a\x1f\x1b\xf1\x98x\xf9\xa1\xf7\x1c\xcc\xb2\xfc\
+\xfa\xf3;\xbf\x00d\x0e\x9eD\xc4\xbe\xe5(\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x01\xdf\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x01\x91IDATX\xc3\xed\
+\x97\xd1j\xc20\x14\x86\xffS\x12\xcc\x0b\xcc\xa7P\xc4\
+\xa5\xb0I/\x1d\xac\xf3\x85\xe7`^\x8a\x0e\x8c\x22\xf6\
+%\xe6\x13\xa4\xb3xv\x93\x96N\xb6\x91\xdaNa\xf4\
+\x5c\x06r\xce\xd7\x9e\x93\xffO\x80+\x07\x9d\xbbq>\
+\x9fw\x95R\xcf\x00X\x081\x19\x0c\x06\xfb\x8b\x01\xb8\
+\xe23\x00=\xb7\x94\x08!\xc6\xe7@P\x03\xc5Q\x07\
+\x22\xa8\x0a\xd0\xe9t\xa6\xae\xf8\xae\xb4\xbc\x03\xd0\xcb\xb2\
+lZ5_e\x00\x22\xfa`\xe6\x8d\xb5\xf6\xa1\xb46\
+f\xe6\x0d3\x1f.:\xc1\xc6\x186\xc6p\x9d\x1c\xc1\
+\xb5\x8fa\x0b\xd0\x02\x88S\x91q\xe7\xfc\x10\x86\xe1\x9d\
+\xc7\xfe\xa5o\xa1\xd5j\xf5\x06@J)\xe3\xb2X\x05\
+\xa7\x0aGDC\x00\xd2'\xa9\xd6z\xa4\xb5\x1ey2\
+H\x22\x1afY6\xdbn\xb7\xdd/\x00'\xf2\xbaK\
+\xd34n\xbc\xd7A\xf0\xc8\xcc\xb9b\x16\x10\xe4\x04\xc5\
+\x00\xb8\xf5\xcc\xb5\xfc\xe9\xab\x8d1\x0b\x00\xf7\xbe:\xa6\
+\xb5\x0e\xf3\x16x\xab\x1937?\x84\xd6\xdaI\xb9\x05\
+\xd6\xda\x87(\x8a*[\xebo\xf3\xb0^\xafo\x98y\
+\x06\xa0\xef\x9csR\xcc@\x14E{k\xed\x18@\x02\
+\xa0\xaf\x94\x9a6=\x03\xc7\xe3\xf1\xa5T\xbc\xb0\xed\xe2\
+\x14\xe4\x10U\x5c\xcd\x18\xb3p}\xf7\x89\x03\x80\xcd\xb9\
+\x17\x97\xd6\x0d[\x80\xff\x0bP\xf9Z\x9e\xbbZ\x9a\xa6\
+\xb1R\xea\xdd]J\xbb\xee\x9c\xfb\xbah\xad? \x89\
+h\xa8\x94z-\xc9s%\x17\xad\x05\xe0\x9c2q\xaa\
+\x96G\x1f@\x22\xa5\x8c\xff\xbc\x05W\x7f\x9a}\xf38\
+\x85\x10\xe2\xa91y\xbdt|\x02\x88\xd4\xc4\xc3\xdd\xa9\
+\xe8Z\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x05\x18\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x04\xcaIDATX\xc3\xd5\
+\x97]l\x14U\x14\xc7\xff\xff;\xb3\xbb\xf5\x81\xb0[\
+\xbbt?\x0ad\x1f,\xc4\xc6`\x13\x9eL\x09\x01R\
+\x1eL\xb0\xa6\xa5$F\x0d5\xf1\x09\x12\x13\x88!1\
+\x0a\x89\x82F$\xd1\x10\x8cO\xc6\x08\xc6\x18-_\x85\
+\xc4\x87\x02\x9a\xc6F|\xe0#\xc5\x10\xcb\x9aXb\xbb\
+\x9d\xae\xbb\xdb-\xf2@\xb7;{\x8f\x0f\x9d\xd9\x0e\xcb\
+\x16\xb6-&:O3sg\xce\xef\xdcs\xfe\xf7\x9e\
+s\x81\xff\xf3ua`\xa0\xf5\xc2\xc0@\xebRl\xa8\
+\xc5\xfe(\x22dI\xba\x0d\xe1v\x11\xe1b\xedp!\
+\xc0\xf1tz\x0b\x84\x9d\x84l\x10\x91\xe6l6\xe7\x07\
+\x80p\xb8\xa1@ \xa9\xc1APN\xc7\x1a\x1b/\x91\
+\x94\xc7\xe6\x80eY\xdd\x02\xbe\x07`\xad\xf7}&\x93\
+\x85\xe3@\xe5/\xc3\x1ar\xa0)\x1a\xed]\x92\x03\xa3\
+\xa3\xa3\xf5\xca\xf4}I`[\xb5\xa0\xfc\x95\xc9\xd8\x04\
+\x11\x0e7\x98Um\x91}\xc5B\xe0\xb5\xd5\xab\x83\xf9\
+\x05k \x95J\xadR\x86y\xd9\x0b\x17\xc1\x14\x88\xa3\
+\x84\xb1\xc9g\x1a\xcb\xb3\xd9\xdc\xa1L6{\xc8g\x1a\
+\xcbuI6\x83\xea(\xc8)O\xde:|\xfe\xe9\x9f\
+s\xb9\x5c\xd3\x82\x220::Z\xaf\x0c\xf32\xc9\xe6\
+\xd9\x89Pk\xd1\x9f\xcdLO\xefO$\x12e@\x7f\
+\xff`\x0c\x00\xb6nm\x1bw\xdf\xe5\xf3\xf9\xe0t\xa1\
+pP\x04\xbb=\xf6\x87\x8b3u\xcfU\x8b\x04\xab\xe7\
+|\xe2\x9c83\x17\x91\x02\xa1^\x8e\xc5\x1aO-D\
+\xddc\x96\xd5\xad\xc0\xaf\x00\x04\x1cR_,\x12y\xf1\
+\x91)\x18\xb3\xac\x1d2\x17v\xbd\x188\x004E\xa3\
+\xbd\x1a\xf2*\x80\xd9\xd5 \xe8\xb0,k\xfbC# \
+\x22\xb4\xac\x89\xdf@\xae\x99\x0d=\x8eE#\x917\xdc\
+\xf1)\xbc\x99\xd0\x86\xb1\x96%m\x85pd\xc85.\
+\x00\xa7\xb0\xf7Y1\x8c\xa8*\x19\xc3A|\xf8GY\
+KV\xfaSBv;\x80\xe1h4\xf2\xb4w\x89\xb2\
+Bx\xedTF\xbf+\xb8\x99\xc2\xbdD\x22\x91\x98\xca\
+`\xdf2e\xe2\x0b\x10] \xe9\x8c_\x97\xa2\xbc\x04\
+\x00\x86\x8f\xdf\x08\xd1\xea\xce\x02\x823\xdaFO\x18\x1f\
+\xdd\xcd\xe7\xf3\xc1{\x85\x99\x11\x88\x04\x01@t\xa9=\
+\x1e\x8f_\xac\x9a\x02Ru\x96\xef\x15\x8e\xbb\x82\xa3\x89\
+\x13P\xdc\xee\xc2\x9d\xe8\xb4\x1a>\xde0|\xbcQ\x86\
+;\x8a\x85b\xa7a\xe2\x04\x00\x84B\xa1)\xd1rb\
+.\xe9s\x8c\x075@\xb6\x95o\xc58\x0b\x00\x19\xec\
+[C\xa2\xa3\xea\xeeH\xf8\x85\xf0\xcf3\xd6\xf17\xf6\
+\xad\x99\xbd\x97\xb3\x1eH[U\x07D\x84\x22\xd2\xec>\
+\xde1q\x15\x00h\xa0\xc5;\xf3\xda7yr\xc6@\
+\x0b\x00\x04L\xf3\x8a\xab\x17\x02\xcd\xde\xdaA\xb7\xaa\xb1\
+\xc4\xeepC\xfd[\xb3\xa2\x92b6\x9b;\xa4m\xf3\
+\xf3\xf5\xcf\xf7%D\xa9\xc1E\x15\x1a\xad\xdb\xae|\xdf\
+1\xa2L\xfb\xf5pC\xc3;\x00|\x00\x90\x9b\x9c\xfc\
+\xa0D9\xd9\xbeq\xe3\xf5GV\xc3\x90}\xfb\x17\x11\
+$\x17^-\x91\x0c\xd9\xb7\x7f)?\xa3\xa26\xcdT\
+\xac\x02\x11\xe1\xb851M\xd2\x0f@|\xa6\xb1<\x1c\
+\x0e\xdf\x05\x80<\xf6\xae\xd3>\xf3\x07\x90\xf55\xd2'\
+U\x91\x9bC8<4[\xb42\xcb\x8av\xe9\x0e\x00\
+\x8a\xc8L,\x1a\xa9s\x97\xa2\xf2\xa4LH\xba3e\
+\xa1`\xaf/G\x01\x1f\x0fiH;D&k\x81\x1b\
+\x90v\x17\x0e\x00\x8e-:\x9c\xa4w\x1f\xb8/\x05\x02\
+\xfeT\x1e0y\x9f\xf2\xc3\xc5#\xd7\x1e\xe9\x84\x03\x0f\
+\x16\x8f\x5c\xbbO\xe9\x1e[^\xc6\x83\xcbP\xdbg\xca\
+\x1fj\xec\x1c\x19\x19\x09\xd6\xec\xc4<p\xc7\xc6\xce9\
+e\xca\xe9y\x1d\x88\xc5b\x17!r\xcb\xd9h\x82\xfe\
+\xba\xba\x83\x95\x9c\xaaN\xcc\x03\x07\x00\x7f\xdd\x13\x07!\
+p'2\x1ckl\xbc4\xaf\x03$Ek\x1c(\x0f\
+R\xed\x1aO\xa7\xbb\x1e\xea\xc4C\xe0\xe3\xe9t\x97\x22\
+w\xcd\xady9P\xd9\xaaU\xdd`R\xd6\xc49z\
+\xca\xb1h\xbc\xd2\xd4\x14=Y\xf9]\x0e{Z\x00?\
+\x9e\xc4\xe1\x9b\xd5\xe0R\xd2_\x93\x0c8\x05\xeb|<\
+\x1ay\xa1\xa6\x8eH\xdb\xc5\x1e\x11I:Q\x09\x18\xa6\
+\xfa6eM\x1c\xab\xd4\xc4\xd5\xfe\xae\xfc\xd5\xfem\xf9\
+\xca\x9c\xa7,\xeb\x18\x05\xdf\x95\xe1\x22Im\x17{\x16\
+\xd4\x13\xa6R\xa9U\xa0\xba\xe0vEn\x85\xa4R\xc7\
+\xb5\x94\xfa\x02\xa6ye\xe8\xd7\x9b{\x00`\xdd3-\
+\x9f\x14l{\xbd\x22;\x00\xec\xf4\xe4\x1c\x22\x92\x84\xe8\
+\xf6x<\xfe\xe7\xbf\xd2\x94\x02\xc0\x8ap\xb8jS*\
+\xc0ym\x17{V\xae\x5c9\xb9\xa4\xb6|l\xcc\xda\
+\xa1\x0c\xbe[k[.\x22\xb7\x14\x8d\xfd\xd1\xe8\x8a\xa5\
+\xb5\xe5\x95\xddR:\x9d\xdeR\x12\xe9$\xb8\x01\xc0S\
+\x99L6\xe0\x1eL\x00\xfc\x0e\x91A\xa5x\xaa\xf1q\
+\x1fL\xe6s\xe8\xd2\x8f\x03\xef\x03\xc0\x96M\x1b\xdf\xae\
+\x15\xf8\xd8\xce\x86$E\x0c\xf6J\x89\xbd\x8b\x85\xff'\
+\xae\x7f\x00\x94\xedX\xe9\x81\x9aX}\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x01x\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x01*IDAT8\xcb\xa5\
+\x93\xbdN\x02Q\x10\x85\xcf\xb9w\xf9I\xb4\x5cj\x82\
+\xc6\xc4\x96~\x8bM\xf6\x15\xa4%\xb1\xb2\xb0\xb5\xb6\xf0\
+-h)\x81W\xd8d\x8b\xb5\x95\x070\xca\x03\xb8\x9d\
+!a\xe5^\x8e\x05Kb\x81\x88\xcb\xd7\xce|\x93\xcc\
+d\x0eQ!\x80\x1fq|\x16X\xdb'p\x03 \x01\
+y\xb1-\xea\x1d@*`\xe6\xbc\x9fw\xb2lI@\
+\x00\xc0J\xb6E\x14]\x06\xad\xd6\x1d\xc8!\xc8\x10\xfb\
+\x90\x0aHcW\x96\xa30\xcf\xdf\x08x\x0a`\x11E\
+WA\xbb\xfdHr \xa0\x89\x03\x10\xf8\x924u\xab\
+\xd5S\x98\xe7\xaf\xf6>\x8e\xcf\x1b\x8d\xc6\x03\x8d\xb9\xfd\
+K\xae\xb0$\xaf\x8d\xb5\x9b\xcfn\xf7\xd9\x04\xd6\xf6A\
+\x0e\x8f\x94w\xf7j\x82\x1c\x06\xd6\xf6\x0d\xa4\xc1\xaf;\
+\x1f\xdc\x85!\xa4\x81\x01\x99\xa0.dbH\xf6\xea\xfb\
+\xec\x19\x9c\x88\x91\xb4\xa8+KZ\x18H)\xeaOH\
+\x0d\xc8)\xa4\xa2\x86\x5c\x80\x9c\x1a\xe7\xfd\x1c\xd2\x18\xd2\
+\xfa\x1f\xf2\x1a\xd2\xd8y?7\x9d,[\xba\xb2\x1c\x01\
+\x98\x1c5d\xdb3qe9\xaaBub\x98\xf6\xc5\
+\xb9\xfa\xced\xf7#\x92\x16\x90R\x07\xcc\xb0\xd9\xbc\xfc\
+\x8c\xf37\xef\xf0\x9c\x90\xd8Fo:\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x01C\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x00\xf5IDAT8\xcb\xa5\
+\xd3\xbdM\x82a\x14\x86\xe1\xeb=\x80\x0d\x1dq\x01a\
+\x02\x9c\x80\x84\x15\xc0\x92\x96\x8a\x154\xba\x02\x15-%\
+\xb0\x02\x09\x13\xc8\x04\xe0\x02\x84\x8eF\xe0{m(U\
+\xfe\xee\xf6\xc9}r\x9e\xe4\x9c\xe4D\xce\x92\x85\xaa\xa3\
+\xa6\xd0\x15\xdax:\xc5_\x0as\x85\xa9\x92\xa5\x96]\
+J2$\xc8\x13%5\x0de}\xf4\xf0\xe8w6\x18\
+;\x18\xd9Z\xa5\x17\xc7\xc8YR\xd3P\xf2\x8a\xc1?\
+\xb2S6\x10\xde\xd44r\x96\xc2BUY_\xe8\xa2\
+\xe2<\x15\xa1\xab\xaco\xa1\x1a\x8e\x9a\xe8\xc9\x1e\x5cN\
+\x05=\xdf\x9eCY\xe7\xcc\xda\x7f\xd7\xa9\xe8\x04\xdan\
+%\xb4\x03u\xb7S\x0fw\x12X\xdf\xe1\xaf\x03\xf3\x9b\
+\xf5\xc2<\x1c\xccN\x17v-\x1b{\xb3P\xb2\xc4\x18\
+\xfb+\xe4=\xc6\x1e|\x86\x96\x9d\x83\x91lr\xe1\x90\
+\xbd\xc2\xd4\xc1H\xcb.R\x92m\xad\x1c}`x\xa6\
+\xce\x06C\x85w[\xab\x94\xe4t\xef;\xff\x00Ta\
+U\x1eY\xa4\x86\xf6\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x01$\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x00\xd6IDAT8\xcb\xb5\
+S;\x0e\xc20\x0c}n8\x08\x1b\x8c\xad\xda\x01\xc1\
+\xd0\x85\x0d\x89cp\x0d\xce\x01\xc7\xa8\xc4\xd6\x95Nv\
+\xf0\xda\x8d{TmX\x82\x84\x80\x94\xf2{\x93\x95\x97\
+D\xef=\xdb@\x0fDd&\x22\xb3\xbe;Q\x88\xb0\
+\xd6\xe6\x00J\x00\xa5\xaf\x9fb\x14\x22\x9cs;\x00G\
+\x00\xe8\xban\x0f`\xf2\x96\x824M\xa7\x00*\x00U\
+\x96e\x93\xb7-\x0c\xc5o>\xb0\xd6\xe6\xcc\x5c\xdf\x93\
+\xc6\x98\xc2\x18S\xdc\x9f3s}\x0d\x96|\x9bJ\x1f\
+Xu\xfb8\x8e\xe3\x13\x00\xa8j\xd2\xb6\xed\xfa&\xe0\
+9\x11-\x00,\x83\x16\x9a\xa6\x09\xca&\xa2\xc7\x9e?\
+\xb3\xa0\xaa\x89\xaa&}\x16\xf0b\x12\xb7\x22\xb2\xfd\x7f\
+\x17\xbe\x01\x85\x08f\xae\x89\xe8\xecS\x1f\x87\xa61\xb8\
+\x0bQ\x14m\x9cs\x07_\xaf>\x927d\x9d/\x9a\
+k`\xa5\xb1\xb0\xc3\xb9\x00\x00\x00\x00IEND\xae\
+B`\x82\
+\x00\x00\x06J\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x05\xfcIDATx\xda\xed\
+]Mo\xd4V\x14=\xf7yf\xdfE`WUA\
+\xec#\xc5\xa3\xf0+B\xa0+\x04\x95hW\x04\x94\x05\
+_\x22\xe1\x0f4\x80\x08\xa4%\x02\xba*\x95J\xca.\
+\xca\xf0+\x18eF\x9a=-\xaa\xba\x83\xa0\xaeX\x8d\
+\x9fO\x17x\x90\xe3\xfas\xe2\x99\xb1\x93{\x96\x8eg\
+b\xdf\xf3\xeey\xef\xdd9\xd7\x06\x14\x0a\x85bj\x90\
+:^\xf4\x9b7of\x1d\xc7Y1\xc6\x5c \x09\x92\
+\xaf\xac\xb5[g\xce\x9cy\xa7\x04\x8c\x19\xbd^\xef\x04\
+\xc9\xe7\x00\xce\x02h\x04\x87=\x00\xafE\xe4\xca\xfc\xfc\
+\xfc\x87:\xdd\x8f\xa9[\xf0\x01\xac\x93\x5c\x0a\x05\x1f\x00\
+\x1a$\xcf\x92\xbc\x17\x9c\xa3\x19P6\xba\xdd\xeei\x00\
+\xf7I.\x89\x88\x13w\x0eI+\x22m\x00w\x5c\xd7\
+}\xab\x04\x8cWv\x92P+92u\x08~\x82\xec\
+$\xa1VrT\xe9\x0c\xc8#;I\xa8\x8b\x1cI\x95\
+G~\x01\xd9\xa9\xad\x1c\x99\xaa\x06\xbf\xa0\xec\xd4V\x8e\
+*G@\xbf\xdf\x9f%\xf9\xdc\xf7\xfd\xef\x13d\xc7\x03\
+\xc0\x94\x11\x7f0\xc5E\x1c\x92\x97I\xfe\xd2\xe9tN\
+)\x01\x19\xb0\xd6^\x07p6.\xf8$=\x00;)\
+\x1f\xdf\x010\x88#\x01\xc0\xa21\xe6\xba\x12\x90=y\
+^\x8c\x93\x9d`R\xdd\xb5\xd6\xae\xa5\x90\xb7Fr7\
+.\x13\x004D\xe4\xa2\x120\x1a)\x16\xc0\x0b\x92\xcb\
+\x0b\x0b\x0b\x7f%\x9d\x17\xfc\xed\xaa\x88\xbc\x08>\xa3\xa5\
+\x88\xc2\xcb2\x91\xed\xc8\x08\xf6\x00\xb4\x8d1w[\xad\
+\xd6~\xd6\xe7[\xad\xd6\xbe\xef\xfbwE$\x9a\x09\x1e\
+\xc9m% \x1b\x8fH>\x05\xb0\x0f`\x9f\xe4\xd3f\
+\xb3y\xab\xc82\xb2\xd5j\xed7\x1a\x8d\xdb$\x9f\x01\
+\xf8\x08\xe0#\xc9g\xc6\x98\x0d\xdd\x07\x94\xb3A\xf3\xe3\
+\xae\xddu\xdd\xda\xdd\x8f\x81B\x09P\x02\x14J\x80\x12\
+\xa0P\x02\x94\x00\x85\x12\xa0\x04(\x94\x00%@\xa1\x04\
+(\x01\x0a%@\x09P(\x01J\x80b\xac(lz\
+\xea\xf7\xfb\xb3\xd6\xda\xeb\x81{\x01$\xb7\x8d1\x8f\xe6\
+\xe7\xe7\xff\x9e\xe0u\x7f\x00p2r\xec\xfd$\x03\xd7\
+\xeb\xf5\xbe\x01p3\x14\x87?|\xdf\xdfL3\x0d\x1c\
+:\x03z\xbd\xde\x89\xc1`\xb0A\xf2\x1a\x80\x19\x003\
+\x22r\x0d\xc0\xcd\x09\x0f\x9c\x978\xe8\xff\x19\x88\xc8\xef\
+\x13\xbe\x86\x9b\x918\x5cu\x1c\xe7aQ\x07\x9e)\x12\
+|\x92\xf7\xf0\x7f\xaffc8\x0a&\x05k\xedc\x11\
+\xf99\x18\xf5\xefI>\xf1<os\x92\xd7\x10\xe3_\
+\x1a\xc9\x06\x99\xebG\xecn\xb7{\x9a\xe4\x03$8\xd6\
+\x00\xec\xbb\xae[\xab\xce\x94\xc3\xa2\xdb\xed~\x08F\x7f\
+\x94\x98B\xael\x93g\xe4\x03x \x22\x8bI^\xcd\
+*\xfam\xc6\x8d\x18\xff\xd2\xf0\xb8\x03`\x11\xc0\x83<\
+\x99`\xf2\xc8\x0e\xc9X\x8bx\xe0>{\xed\xfb\xfeO\
+\xc7\x8d\x00\xc7q6\x01\xb4\x13\x1cx\xb9\xe5\xc8d\xc8\
+\xces\x92\x97\x13\x8c\xb2\x16\xc0\x0b\x11\xb9Rt\xe6?\
+\x0a\x98\x9b\x9b{\xf7\xe9\xd3\xa7ec\xcc\xaf\xc8pe\
+\x07\x8d&\xf9\xe7\x80\xac\xe6\x08\x92\x9e\x88\xec\x92\x5c\xce\
+c\x17<\xca\xd8\xdb\xdb\x9b\x01\xf0LD\x96\x004\xe3\
+$\x1a)M\x22&A\xf3\xd3\x9a#<\x11\xd9!\xb9\
+z\xdc\x83\x0f|\xf1\xa2\xae\xe2\xb35\xde+*G\x07\
+2 \xe8@\xdfHY\xed\x00\xc9\xcd\x11en\xb2^\
+Zk\x1f/,,\xfcS\xc6\x17v:\x9d\xaf\x1d\xc7\
+\xb9\x01\xe0\x12\x80q\xaf\xd6$a\xd9jE\xa4\xedy\
+\xde\xadpG\x7f#2\xb1\xac\x88\xc8\x22\x00\xe7\xb0K\
+\xd7C\xe0$\x80\x15c\x0c\x01\xdc*i\xc2\xbc\x01`\
+%A\x22&\xb5jr\x00,:\x8e\xf3.|_\x07\
+$\xc8\x18s\x01\x87\xeb\xc9*\x0bM\x11\xf9\xae\xc4\xef\
+\xbb4\xcd\xe0\x87\xe5HD.$\xce\x01$\xa1\x98,\
+\xa2\x04\xbcJ\x98H&\x8d\x01\xc92k;\xd1\xda\xd1\
+\xb4\xe0\x051\x8e'\xc0Z\xbbE\xf2\xf5\x94\xdb{\xde\
+\x93|\xe2\xfb~i\xb5\x9dH\xedh*i>\xdc\xb4\
+Zk\xb7R'\xd4\xe124\xa3Mt\x87\xe4\xddV\
+\xab\xf5\xa7\x8a\x08\xd0\xe9tN9\x8e\xb3\x0e\xe0[$\
+7\x18\xfe&\x22k\xd1\xbd\xc0H\x1b\xb1 \x9d\xdb\xba\
+\x11\x1b\xc3F\x0c\x00\x82\x13WSj\x1dM\x92\xe7\x8c\
+1\xebu{>O\xd9\xc17\xc6\xac\x8b\xc8\xb9\xb8\xe0\
+\x0fe\x07\xc0\x9d\xa4\x1e\xb7\xd45}\xa8\x18\x97X\x0f\
+\x12\x91\xb6\xb5\xf6\xf6q\xab\x07\xf5\xfb\xfdY\xcf\xf3\x1e\
+\x06\x0f\x121\xd1X\xa6\xc9Nf\x06\x843AD\xd6\
+\x82\xfavb\xe9\xb5\x8a\x1d\xe8c_\xa6\x0d\x067B\
+\x15\x03\x89)\xd7\xb4\xb3\x82\x9fI@H\x8e\xee\xa4\xac\
+\x8e*\xd9\x81>\x01\x5cBJ\x89>Mv\x0e\x04/\
+\xcf\x7fr]\xf7m\xaf\xd7\xbbB\xf2\xdf$9\x9a\xf0\
+\xaa#\x5c\xdbA\xd9\xb5\xa3\x9c\xa5\x05\x16Y\xed\x8c\x9c\
+\x01Q9\x02\x10\x95\xa3\x89\xff\x22\x16\xaa\xed\x9c\x0c\xd5\
+\x8e&*\x83\xc1={\xa3\xc8\xceH\x04\x0cI\xf0}\
+\xbf\x0a\x1d\xe8\xd1\xdaN\xd9\xb5\xa3\xec\xc0\x19\xb3\x11\x8d\
+\x83\xb5\xf6v\xd1\x07C\x1d\xa5Ny\xba\xae[;\xa3\
+\xd9Qr\xc6\xd5r0\xa95Q\x09P\x02\x14J\x80\
+\x12\xa0P\x02\x94\x00\x85\x12\xa0\x04(\x94\x00%@\xa1\
+\x04(\x01\x0a%@\x09P(\x01G\x1f\x8d\xaa]P\
+L\x07\xfav\xb3\xd9\xdc\x9c\x9b\x9b+\xf4\x9a\xc2\x8at\
+\xf4\xd72\x03\xa2\x1d\xe8\xd7\x06\x83\xc1F\x11\x07\xde\xde\
+\xde\xdeL`\x9a\x9avG\x7f\xfd\x08\x88\xeb@\xc7g\
+\x8f\xea\x8f\x81\x0f33\xf8\xc6\x98\xa4\xd7\x1d^T\x09\
+\x1a\x01\x22\xe2\xf8\xbe\xff\x831\xe6\xabN\xa7\xb3\x9at\
+^\xf0\x92\x9e\xfb$\xcf\x05vA\x9d\x03F\x08\xf6v\
+ \x1d\x8d(\x09$\x97\x82\xde\xb1\xf8t6\xe6^\xe0\
+R\x8e\xed\xee\xd47h\xe4@F\x07zSD\xce\xa7\
+\x90w\x1e).\xe5*v\xf4W\xd2\xca\x91\xa3I\xa4\
+\xc8\x9cR\xd8.x\xec\x09\x18\x92\xa0\xaf2\x9c\x22r\
+4\x89d\x8e|\x14p)k\x06\x94(GU\x97\x9d\
+Z\x110\x82\x1c\xe9\x0b\x9d\xa7%Gu\x91\x9d\xdae\
+@\x1e9\xaa\x93\xec\xd4\x96\x80\x149\xaa\x95\xec\xd4\x9a\
+\x00\xe0\xcbcuVp\xb0Ei+\xfc\x18\x18\x85B\
+\xa1Pd\xe2?\xab\xdf\xca\x90m\x1d\xa29\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x04\x5c\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x04\x0eIDATh\xde\xd5\
+ZMOUW\x14]k\x1f\x82\xde\xf7\x84&\xd8\xe4\
+\xd2D4\x11\xda\x89T!\xa6\x8e\xdb\x89\xbe\xd2I\xa1\
+\xc6vR\x13\x1d\xb4q\x80\x83\xfe\x01\xe0\x0f\xb4\x09\x0e\
+\x9a: 1\x1d4\xb6\x06\x9dH\xa0\x13;&1\xa2\
+\xd5\x89\x01\x93B\x13\xbcI%\xcd\xc3w\xaf\x1a\xceY\
+\x0e0\x08\xbe\x0a\xaf\x02\xf2\xee\x9a\xde\x8f\xb3\xf6^\xfb\
+\xec{\xf7\xde\x87\xd8,\xc6\x9b[\x0aV<H\xafN\
+8v\x22\xb0\x8b@\x1b\xc8\x18@\xe1\xc5])\xa4D\
+\x869@S\xf0\xba+\xc7\xbbi\xa8<@\xa9\xbc\xb0\
+\x99\xe5\xf9\xc6O^/\xb6\x16\xac\xa9\x8f\xb4^#\xda\
+%\xec'\xe9jyT\x92'1\x1b\x84\x19)\x5cM\
+\xc3\xe2(>\xab<\xdc~\x03\x04F\x13\xad\x1f\x19x\
+\xca\xc8o\x01\xee\xc1V@\xaa\x04\xe8\xa7\xe0\xc3\xafY\
+O2\x09B[o\xc0XKsd\xbb\xce8\xday\
+@\x07\x88\xda\xbc]\xbbo\xe4\x01\xfe\xe5}\xb8\x90\xe1\
+\xe9\x08z\x16\xca[c\xc0\x0d4D\xcf\xe2\xa3N\xee\
+G\x10]\x04\x89m\x84 A\x98\xf2\xf4\xe7\xb2\xc6\xe4\
+&>\xc1\xd2z\xf7\xdbF/\x8c\x9e\xc5_8\xb8K\
+$\xbb\xb7\x9b\xfc\xb2GI\x92\xdd\x0e\xeeR\xf4$>\
+\xf9\xe6\x0aL\xc4\xc5H<\xe3h?\x10l\xc0\x0e@\
+\xd0\x92\xf7\xfe\xbb\xcca\x04'\x92\xca\xffR\xe0\x05\xf9\
+\xc1\x9d\x22\xffB\x8d\x06\xe7\xdc@$\x9e\xa9]\x81\x1b\
+h\x88\x9e\xc4'\x9d\xb9\x9fw\x92|\x95\x12\xc1\x7f\x9d\
+\xedN\xae\xbc\xba'\xaa\x14\x88\xd2\xf8\xa837X/\
+\xe4W\x9407\x18\xa5\xf1\xd1\xf5\x15\x18ki\xdec\
+\xbb\xff \xd9\x8d:\x84\xa4[\x8f\xc3\x93\x8fW\xa7X\
+[\xf3\x91\xc2\xae\xb3 \xbaP\xaf \xba\x22\xec:\x0b\
+\xbdt\xfc\x8a\x01\xd1X|\xcc9\xeb\x7f\x1b\xa9r3\
+)\xd69\xeb\x8f\xc6\xe2cU\x06\x98\xb3S\x80\x0e\xa0\
+\xee\xa1\x03\xcb\x5cW\xef\x81\xeb\xc5\xd6&\xf7\xce4\xc8\
+\x22\xf2\x00\xa9\xb2\x88\x7f\xdfG)\x9d7\x00(44\
+\xf5\xe5\x86<\x00\x90\xc5\x02\x9b{\x97Ch\xbc\xb9\x85\
+\xb2^\xe4\x0c\x84\xf5b\xbc\xb9\xc5\x0a*\xb4\x1b\xd0\x91\
+7\x03L\xe8(\xa8\xd0n\x04\x0e\x09h\xcb\x9b\x01\x02\
+\xda\x08\x1c2\x80\x87k\xad\xa4\xeak\x1b\xd0\x01<l\
+0\x1eA^a<b$\xf6\xe5\x95?\x89}\x86\x80\
+\xd6\xdc*\x10\xd0j\xe0J\xeb#\x87\x12\xa0`\xc89\
+\x0c@\x9ac\xfe\xa9\x01Hrl@b\x02\xe6\xf2\xca\
+^\xc0\x9c!\xe8v~\xb3\x90n\x1b\x9c\xee,w\xc5\
+\xf2\xe6}y8\xdd1y\xdc\xa3\xf2\x17F\x14\xe6\xe4\
+q\xcfR\xa63\x81\x98\xce]\xf4\x10\xd3)\xd3\x19C\
+\xa9\xbc \x84\xab\xb9\x0b!\x85k(\x95\x17\x0c\x00R\
+\x95\xafB\xaa\xe4\x88~%\xc5\xd2\xe8\xcb\xa2\xbe\x94\xce\
+\x07\xe9b\x1e6\xb3 \x1f\x82.\xa2\xf4\xcf\xfc\x9a\xae\
+D\xb0pY\xc0l\x0er\xffl\xb0p\xb9\xaa\xad\x92\
+\x1dO&\x834,Hu\xec}\x05i8;\x9eL\
+V\x19\x00BYx:\x02a\xaa\x8e\xdd?\x95\x85\xa7\
+#\xabGPk\xffF{\x16\xca\x9e\xfe\x9c\xa4\xfb\xf5\
+\x97ut\xdf\xd3\x9f{u\xf4T\xf5;\x9d5&7\
+=\xfd\x80\xa0\xa5:\x0a\x9d%O?\x905&7\xab\
+K\x82\xd7 \x9a\x88\xfb\x1d\xdc\x00\xc1\xbd;L\xfe\x91\
+\x87\x1f\xcaN$\x17\xfe\xeb\xfakg\x00\x190\x12\xc1\
+\xc3\xc1}\xbf\xa3#&\xf8\xa1\x0c\x18y}Q\xb6\x01\
+\xf6L\xc4_An\x88\xe4\x07o;\xe6%?X\xf9\
+4\xf9e\xa3\x8al]<nL\xaex\xfa\xd3\x92n\
+\xbd\x8d\x14+H\x92\xa6<\xfd\xe9\xca\xee\xe4\xb7\x8d\xcb\
+\xe2Z\xb1<\xe8>k\xe4y\x02\xfb\xb7c\xd0-`\
+6H\xc3Y\xd8\xcaA\xf7\xdaU\x18\xfd\x1e\x1f3\xd8\
+\x97\x06~\x03lUG[\x95\x00]\x0c\x08\x97\xb3\xe3\
+\xdbu\xd4\xe0U\x8c\xbf\xfb^\x01\x0d}\xa4}n@\
+\xc7r\xaf\xb2\xc6\xc3\x1e\x90'0\x17\x80i1\x5cK\
+Cy\x14\xa5t\xfe\xcd:+\x9b\xc5h\xd3\xdeBT\
+<H\xa2\x13\xe4\x87\x10\xbaH\xee\x83\xd0\xba\xd2s\x12\
+R\x10\x0f%\xfd\x0db\x0a\xd2\x9f\x12\xee\xa6Y\xe5\x01\
+\xfa\x16\x1fmf\xf9\xe7\xe4\xc9\xc4\xbf\x12\x98\x05\xf0\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x09s\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x09%IDATx\xda\xed\
+\x9dMlT\xd7\x15\xc7\xff\xe7\xbe\xf9\xf0\xcc\xf3\xd88\
+\xf2\x8c\x8d\x22a\x12SX@\x83\x84\xc8\x06\x99\x04\x1a\
+\x02\xc4\xa4%\xa1\x12\x8bd\xc3\x82\x08\xd4T\x09\xad\x14\
+Q\x16\x09\x90\x0dI\x91ZZ\xa4\x86\xaaTbQ\xba\
+@\xa2\xc8-\x18\x0c\x14\xd3\x80\xd84\x80\x88\xc2\x22\x14\
+\x83A\x8a\xb0\xc7#0\x1e\xbf\xb1g\xde\xbc\xfb\xef\xc2\
+\x0e\xad1\xfe\x9e/\xdb\xf7\xec\xfc\xf1\xde\x9b\xf9\xfd\xef\
+9\xf7\x9e\xfbq\x9e\xa0\xd4l7\x14\x96F\xaa\xc2e\
+e\xf3\xc4\xf2W\x93\xac\x17\x91:\x01\x17\x80\xa8\x85\x92\
+\x184\xaa (\x07\xc47p\x11\xb3 z\xa1\xf0\x08\
+\x9aq\x08:\x08\xb9M\xf2\x9e\x88\xb4\xd1s\x13\xa9\xfe\
+\xfe\xfb\xb8\x91|\x84\xbd\xd0\xa5\xf4u\xa5d>IK\
+y,\xa4#\x0d\x96\xc2ZP\x16\x00\xa8\x83H5\xc0\
+J\x81L\xeas\x12\xa4@\x1e\x93L\x00\xb8\x07\xe1m\
+O\xe3l\x9fJ^\xc6\xba\xde\xf8\xec\x16\xa0\x05v\xd8\
+\x8b.\xa4\xe5[\xa5 o\x08\xe5U\x11\x04\x0a\xf1h\
+\x12\x19\x0a\xff\xa5\xc1\xd3\xe2e/\xa6\xac\xae[X\x07\
+gv\x08\xd0\x8a\xb2`:\xd6\xe0\x17\xdfV\x00\xcb\x00\
+\xbc(\x10\xab\x18_\x9e\xa0\x07\xe0\x0e\x88\xeb.\xb2\x7f\
+J\x07\xe3\x97\xb1\x1a\xfd3R\x80\xe0\xc9\xd8\x8b\x96\xcf\
+zMAv@\xb0\xa8X\xd0G\xf6\x0aj\x08\xbe\xd5\
+\xe0\x01Oy\xe7\xd3\xaf\xc7\xef\xcc\x0c\x01Z\xa3\xe5v\
+\xbf\xef-\x08>\x10\x91%\x02\x09\xa1\x84\x8d`\x1f\xc9\
+o@\xfc\xde\xc9\xb8M\xd8\x98HNO\x01\x8eUU\
+\x86#\x81W\x95\xb2>\x05\xf1C\x11Q\x98FFR\
+\x03\xf8F{\xde')'s\x11\x9b\x1f=\x9e>\x02\
+\x9c\x8a\xd6\xda\x96\x7f\x9f\x086\x08$\x8ail$\x13\
+\x04N:Aw\x17Vwu\x94\xb6\x00W\x10\x0a'\
+k\xb7\x08\xe4#\x05\xf5\x02f\x90i\xe8\xbb\x04\xf7\xa7\
+\x22\x1dG\xb0\x02}\xa5'@Ky\xccF\xe4\x17\x0a\
+\xf23@*0#\x8d=\x1a\xfc\x83\x83\xe4os\x95\
+GL]\x00B\xf9OG\x97\x06\x94\xef\x8f\x22\xb2|\
+\xb2I\xd3\xb4\x91\x00$\xc9\xaf2:\xbb\xcd\xed\xed\xfa\
+\x1a\x9b\xe1M\xe5~S\x1e\x0a\xda+bk,\xcb\x7f\
+@A\xbd<\xd3\xe1\x0f\xb4X\x11\x11y^)\xb5<\
+\xe0\x0f\xddu\x8f:m\xc5\xf1\x80V\x94\xd9\xe9\x9aM\
+J\xacC\x80D0+\x8dIMo\xbb\x13\xec\xfc\xdb\
+d\x13\xb8I\x0f\x0d\xc3\x99\x9awD\xac\xcfg/|\
+\x00\x90\x88\x88\xf5\xebp\x7f\xcd\xbb\x85\xf3\x80V\x94\x85\
+35\xef(\xf8\x0e\x09\xe0\x871\x10p5\xb2\xdbS\
+\x81\xce\xbfN\xd4\x13&\xec\x01v\xbaf\x93\x82\xb5\xd7\
+\xc0\x1f\xd2\x8a\xfd\x0a\xd6^;]\xb3)\x7f\x1ep\x0c\
+\x96]\x19\xfb\x91\x82\xef\xf8\xec\x0e;c\xf4\x09\xc8\xfe\
+\xd4y\x1c\xbf0\xde\xd1\xd1\xb8=\xc0_\x1e}\x09\xf0\
+\xed3\xf0G\xef\x13\x00\xdf>\x7fE\xf5\xd2\xdcz@\
+Ky\xccf\xe4\xa4\x12\xf5\xb2\x81<\x8e\xac\x99\xfa\xdf\
+\x8e$\xdf\x1cO\xb26\xb6\x07\x1cC(\x8c\xc8\x0e\x11\
+Yn\xd0\x8e\xb3U\x8b,\x0f#\xb2\x03\xc7\x10\x9a\xb2\
+\x00\xe1\xca\xda-\x16\xe5\xfd\xd9\x90d\xe52Y\xb3(\
+\xef\x87+k\xb7L-\x04\xb5Fk\xed\x8c\xef\xcaL\
+\x9bX+X(\x82\xbe\xeb\x04\xb2+F\x9bE\x1d\xd9\
+\x03\xceUU\xda\xfd\xbe\xcf\x0c\xfc\xc9\x9b\x82z\xc1\xee\
+\xf7}\x86sU\x95\x13\x16 \xec\x05V\x89\xc8\x06\x83\
+q\xca\xfd\xc1\x86\xb0\x17X5\xb1\x10\xd4T\x1d)\x0f\
+\x06.\x8b\xc8K\x06a\x0e\xb2\x03\xf2\xeb\xdet\xa6\xe1\
+Y\xcb\x9b\xcf\xf4\x80\xb2\xa0\xff-\x00K\x0c\xba\x9c\xd9\
+\x92A\xa6c\x87\xa0`s\xac\xde\x1aX@W\x86[\
+\xce\xc2\x90\xb2\x04\x1f\x04\x9bc\xf5c\x0a`Y\xd6k\
+\x02Yl\xb0\xe5\x5c\x84\xc5\x96XkF\x17\xa0\x15e\
+\x0a\xb2\xa3\xd4\xb7\x8eLK\x01(!\xa5\xe4\xc3\xa7\x93\
+\xb3!\x02\x043\xb1\x95 \x16\x19\x5c\xf9\xea\x8d\xb1(\
+X\x19kx\xb6\x00-\xb0\xfd\xf4m5\xb1?\xbf}\
+\x81\x9f\xbe\xadh\x81=L\x80\xb0\x8a.\x84`\x99\xc1\
+\x94\xf7y\x8aea\x15]8L\x00f}\xab\x01\x98\
+\xac7\xff\xf6\xc2 \xeb\xa1\x02(\x91\xc6R\xdb0;\
+3\x1d@,%\xd28T\x80&\xbbFD^1x\
+\x0a\xd6\x17\xbc\x82&\xbb\xe6\x89\x00\xa1`E\x83Y\xe3\
+-\xa4\x17\xc0\x1f\x0aV4\x0c\x08\xb0\x1b\xca\x12\xac5\
+X\x0ak\x96`-vC)\xac\x8cT\x81Ro\x90\
+\x14:'\x90z\xac\x8cT\xa90\xcb\xe6APg\x88\
+\x14<\x0e\xd5\x85Y6O\x89\xeb\x8bb\x9a\xef\xe1\x9f\
+\xa6\x0aD\xc5\xf5E\x15-\xd6\x03\xac0@\x0a\x1e\x83\
+*h\xb1^\x89\xa8:\xb3\xe0^\x94|@\x84j\xbe\
+\x12\xcd\x1f\x18\x1c\xc5\x12\x81\x0b\x14 \xb5\x06E\xd1$\
+\xa8U\x00b\x06D\xd1\x5c \xa6\x00\xcc1$\x8a\xd5\
+\x0fc\x8e\x1a\xa8:b\xacH\x1eP\xae@3\x07T\
+D\x0f\xf0\x9b\xd5\xaf\x22\x9b\x82\xc05\x18\x8a\x16\x82\x5c\
+\x05\xa2\xd7\x90(Z\x08\xeaU\x10t\x1b\x12E\xf3\x80\
+n\x05\x22nH\x14\xcd\x03\xe2\x0a`\x87!Q4\x05\
+:\x14!\xb7\x0d\x88b9\x80\xdcV\x14\xddN\x90\x06\
+G\xa1\xe1\x93\x14\xdd\xaeD\xcb\x1d\x81\xf4\x18$\x85\xee\
+\x7f\xa5G\xb4\xdcQ\x14\xb7k\xb0\xae\xa6\xb1Bz\x00\
+\x99\xa0\xb8]*\xe5K\xdf\x83\xe0\x9eARp\x17\xb8\
+\x97\xca\xa4\xef+\x5cJ>\x02\xd8f\x88\x14\xdc\x07\xda\
+p5\xf9Pa/\xb4\xe7\xf1\xac\x01RX\xf3<\x9e\
+\xc5^h\x05\x00}\x81\xe4%\xc2\xcc\x09\x15n\x04\x04\
+\xb7/\x90\xbc\x04|\xbf7t\x8d\xd3\x09\xf2K\x83\xa6\
+`=\xf0\x97X\xe3t\xfeO\x00\x00\x1e\xf4\xe9\xc1Z\
+\xca\xc6\xf2;\xfe\xf7<\xe8\xd3\xdf\xff\xfcD\x00\xb1\xbc\
+\x0b\x00\xee\x1aDy\xb7\xbb\x83\xac\x87\x0a\x90\xd2]\xb7\
+ \xb8f\xf8\xe4=\xfc\x5cOiuk\x98\x00X\x07\
+\xc7e\xf6\xf0`\xcddc\xf9I\xbe\xb4K\xfc\x19\xeb\
+:\x9d\xe1\x02\x00H?\x8e_\x86\xe0[\x83*o\xc9\
+\xd7\xadt\xf2\xc1\x90\xc1\xce\xd05\xe1\xcd\xe8\xd3\x9a\xbf\
+\xa3\xb0\xcf\xd0\xcaq\xeb\x17\xf6i\xcd\x03\xd8<\xb4\xee\
+\xf4\xb0Ey\x8f\xdey\x927\x0d\xb2\x9c\x87\x9f\x9b\x1e\
+\xbd\xf3O\xff~\x98\x00\xe9\xc6x\x9bG\x1e4}A\
+nc\xbfG\x1eL7\xc6\xdb\xc6\x14\x00\x00\xfa\xd3\xd9\
+\x13\x10\xe3\x05\xb9\x8b\xfd\xbc\xd9\x9f\xce\x9ex\xd6\x9f\x9e\
+\xbd/hc\x22\xa9\xa9?6\xd3\xd49i\xfd\x09M\
+\xfd\xf1H\xafB\x19qcV\xca\xca\x5c\xa4\xf0\x94A\
+8\xe5\xce\xf7T\xca\xca\x5c\x1cy`4\x9a\x9d\xa9\x9e\
+k\xc3\x7fE\x89\x9aoPN\xdc4u\xbb\x03w\x05\
+\xd6'\x1e\x8c\xf4?\xa3oM\x5c\x9fx@r?@\
+\xb3d9\xf1\xb6\xdfCr\xffh\xf0\xc7\x16\x00@\xca\
+\xed8\xa2\xa9\xbf0\x0b\xf7\x13@\x0fRS\x7f\x91r\
+;\x8e\x8c\x9d\x9b\x8d\xc7\x9a\xec\x1a\xbb\xac\xe2\xa4\x822\
+\xd5s\xc7\x13z\xa0\xbfr\xfa{\xde\xc4\xc6\x81)\xe7\
+)y\xc0\xc0\xa8\xc8\xe9\xcc\xd0\xdd\xa6I3Y7&\
+|^\xcb\xd0\xdd6\x1e\xf8\xe3\x17\x00\x80\xdb\x93\xb8\x01\
+\x95\xdd\x05\xd0l\xe6\x1d9\xf8\xf4B\xb2\xbb\xdc\x9e\xc4\
+\x8dq\xa7\x08\x13}\x84\xdd\x1c{W,\xdf\xe7\x02y\
+\xde\x00\x1f\x12\xf7\xbf\xa3\x97\xdd\xe94\xc6\x8fN\xe4\xba\
+\x09\x1f\xd0pB\xf1\xe3\x9a\xde\x1e\xb3\x86\xfc\xff\xf0\xe1\
+jz{\x9cP\xfc\xf8\x84\x93\xe4\xc9>4|\xa6f\
+\xab\x12k\xcfl\xf7\x04\x82\xdfiz{R\xeb;\x0f\
+O\xe6\xfaI\x1fQJ\x05;\xffB/\xbbsv\xf7\
+\x09\xec%\xb2;S=\x9dG'{\x87)\x97(\xb0\
+\xcf\xc6\xd6\x0a}\xfb\x042\xab\x0a\xfe\x91\xbcNfw\
+9o\xc4[\xa6r\x9f)\x1f\xd2s\xba\xe3\xff\xd4\xcc\
+\xbc\xa7\xa9\xaf\xce\x86d\x8d 5\xf4U\x9d\xcd\xbc\xe7\
+$\xe3\xe7\xa7z\xbf\xdc\x15\xe9h\xb2k\xec`\xe4\x97\
+J\xd4\xf6\x19\xfd2O\xeaCN:\xf9\x9b\xf1\x8e\xf3\
+\x0b'\x00\x00\xfc\x1d\xe1p\xb0v\x8bP>\x9ai\x13\
+x\x9a\xba\x9d\xc2\xfd\xa9t\xc7\x11\xfc\x04\xa9\x5c\xdd7\
+?ej\xceT\xcf\xb5\xc5\xbfOD6\x08\xa5zZ\
+\xb7ya\x82\x9a\xcd\x0e\xdc_\x8d5\xb1V:\x02\x00\
+\xc0\xb9\xaa\xca\xb0\xeb_\xad,\xebS@\x16\x0b\xa6\xd9\
++\xcdA\x0d\xf0\xa6\x86\xf7I*\x95\xb9\x88\xb7\xbb\xf3\
+r\x9a4\xff\x85\x9a\x9a\x9f\xab\xb0%\xf06\x94\xfa\xb9\
+\x00K\x04RV\xe2\xe0\xfb\x09\xdc\x84\xd6\x07\x1dfN\
+\xa0\xf1a^\xa7\xe2\x0bV)+\xd8\x1c\xab\xb7\x94\xf5\
+\xba\x12\xf9\x10\xc4\xc2R+\x12>\xb8\x09\xe1?\x1a<\
+\xe0!{>\xbd\xbe\xab \x87\x17\x0b_\xaa\xec\x18B\
+\xc19sW\xfa5\xb6\x02\xb2\x0c\x82\xf9\xc5*\x99L\
+\xd0\x03\xd1\x0e\xf0\x9a\xab\xbc\xc3\xe9\xee\xf8\xa5\xa7\xf7\xed\
+\xcc<\x01\x9e\x08\x11-\x0fWp!\xe1[m\x89j\
+\x04de\xa1\xaa\xf7\x0e\xccc\xf1\x12\xa1O\x93\xd9\x0b\
+\xa9\x1e\xb9\x85\xcd]E\xc9\xe8K\xa7X\xdf\xa9hm\
+\xc8g5X\x90\xb5\x80\xd4\x83\xa8\x13 JAd\xb2\
+E\x05\x09R\x88$\x81\xae\x81spl\xf3\xc0\xb3}\
+Y\xef26t\x95\xc4\x01\xf5\xd2\xab\x96H(\xfc#\
+\xf2\x5c8\x10\x9c'\xf4G\x09\xd6\x8bR\xf3\x05\x5c\x00\
+J-\x041\x00s@D\x00\xf8\x06\xaf\xcaB\x90\x04\
+\xd0\x0d\x22\x0ea\x07!\xb7\xa9u\xbb@\xda(nW\
+*\x93\xbe\x8f\x1f'\x1fBPR\x1b\xce\xfe\x0b\xe1l\
+\xb0T\x01c\xdc\x8a\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x01\x83\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x015IDAT8\xcb\xad\
+\xd5\xb1N\x9aQ\x18\xc6\xf1\xdf{R\x8a\xca\xd28\xda\
+\x84\xc9K`0\xdd\x9a0\x08\x0b\x8b\xbd\x86\xb2x\x07\
+5J\xbc\x09\xee\xc1\x89\x0e\xe8\xe6l\xc2%8\x91\xd4\
+M\xd3I\xdb`8\x1d\xf8bR *\x1f\xfc\xd7s\
+\xde'\xe7\xc99\xcfs\xc2\x12\xf2\x95][:\xb26\
+\x1a\xc2\xdel\xc1\x1dF\xc2\xd0G\x83\xf8\xe2a~6\
+\xfe\x13\x1a\xaa\xaa92u&\xd4Q\x99\xdf\x83\x8c\x89\
+l\x8c\x9e'\x17\xd1\xf6wA0_\xfb$\x9c\xe0;\
+j\xde\xc7#\xfa\xb2\xf3\xf8\xea7\xa4\x97\x93%?p\
+\xbc\x82\x18\xec\xe0X8\xc9C\xd5\x17A5G\xb2n\
+aqU*\xe8\xda\xf6\x0d\x22_\xd9Uu#\xec[\
+\x8f[\xcf\x0e>\xd8\xd2A\xdd\xfa\xd4%\x9d\x84VI\
+\xab\x8b\xd6C+\xa1\xb1\xe4i\x94!\xd0H\xf8lS\
+${\xc9\x86I\xf8\xb51\xb5\xa9\xbb\x84Q\x11\xa7u\
+\xc9\x18%\x5cb\xb2\x01\xc1\x89\xec2\xf9cP\x04}\
+]\xc6\xa6\x06)\x0e=\xa0W\x04\xbd,\x8f\xb2^4\
+\xdd\xcfn\xf9\xc9\x05\xfa%\xadO\xd0/4\x96\xd6W\
+\xb7h\x91R\xf5\xb5X\xb0\xb3\xd68}\xb3`\x19\xcb\
+\xaf\x14\xec\xca_\xc0\xb3\x9f\xd1t??\xfb\x0f\xae\xac\
+b\xaaH\xd8]'\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x03\x96\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x03HIDAT8\xcb\xa5\
+UML\x5cU\x18=\xe7\xbd\xf9c\x98a\xc8\xf0&\
+\x0e\xb8B\xbb\xc0\xd6\x0d\xa9h\x5c\x10\xc5\x95.tQ\
+\x1b\xba\xb2I7$\x95n1&\xbaqe\x93\xc6\x9d\
+.t\xa3\xc1\x95\xe1\xa761\xd1\xb7 5\xa9\xc6\x04\
+CY4\xd2\xd1P^B\x84y\xcc\xc0\xc4a\xa6\xa5\
+0\xef\xde\xe3\x82\x1f!B\xdb\xe8\xdd\xdd{\xbf\xef\xdc\
+\xf3\xfd\x9d\x0b<\xc1\xf2}\xbf\xdd\xf7\xfd\xf6'\xb1\x8d\
+\x9dt!\x89\xeb\xeb\xeb\x19\x00\xd9\xc5 \x18\x02\x80j\
+\xb5z\x13@\xc3\xf3\xbc&I\x1d\xe7\xc7\xe3\x0ek\xb5\
+Znkg\xe7mJ\xe7\x01\x9em4\x9a\x1e\x00d\
+\xb3\x99u@s\x22'\xdb\x12\x89\xa9|>_\x7f$\
+\xa0$\x86ax\xda\x8a_\x00\xea\x07\xb8M*\xa8\xd7\
+7]\x00\xc8ut\x18\x81\xbd\x80\x92tx\x9b\x8a\x8f\
+\x14\x8b\xf9\xbb\x87\xd9\x1e\x099\x0c\xc3\xd3\x12\xc6I\xf4\
+K\xb8\xe5:\xb8\x06df\xff\x5c\xfb\xa3\x0b\x00\x92\x89\
+\xceZ:\xed\x0cXEc\x10\x06\x85\xd6x\x18\xd6.\
+\x02X\xf8W\x98A\x10t\xae\xac\x86?\xaf\x96C\xbb\
+\xba\x1a~\x5c\xa9T2'\xe5\xb7T\xadf\xcb\xe5\xf0\
+\xea\x9e\xedO\xb5Z-w$dI\x5c[[\xbbd\
+\xad>\x059\x1b\xaf\xbbo\xee\xf4]M\xa6c\xf1\xe7\
+\x9d\xc8>\xd8Fs\xa1\x00`\x03\xe93n\xccI\xbb\
+\x91\xb9\xb3]}\x7f\xbb\x15\xd9\xef$;\x00\xf1JO\
+\xcfS_\x92\x14\xf7\xaa\x97mE\xd17\x12_v\x1d\
+\xbc\xc3\xe2'wc1~\x0e\xe25\x82;\x10~\xd8\
+{\xfeuA\x09I7M\x84\x11\x85\xef=g\xac\xf9\
+\x9a\xd0/\xf1x\xecB\xa1Ph\xec\xe70+\xe1\x05\
+R\x01\x90\x99\x8d\xc7xI\xc4\xab\xd8\xcdv\x12\xd0[\
+\xbb\x80$@\x10x%\x1e\xc3\xf9\xbfh\xbfJQ\x01\
+\xc0\xb3\x00\xb2\x00\x1a\x8e\xef\xfb\xed\x8b\xc1\xf2P\xb3y\
+\xbf\xab^\xdft\xef\xfc~\xbb\x0b`\x1e\xa4\xfbO/\
+\x90\xbb`\x07{\x17`\xfe^\xa9\x94\xaf\xd77\xddF\
+\xa3\xe9-\x06\xc1\x90\xef\xfb\xed\xce\xb1M\x1d\xe1\x06\xa4\
+e\x9c\xdc\xf5\xcb\x8ap\xe3\xc8\x999T\x94j\xb5\xda\
+\xd3\x8a\xcc<\xa4\x95\x87\x0f\x9d7z\x9f\xb9\xb0Qs\
+_:\x07G\x9f\x01\xe8:`'\x09\xc0\x06,G\xf3\
+&5\x1d,\xbd\xdb\x95J\xd9\xefA>\x1d\x8f\xb9\xfd\
+\x85Bau\x9fa\x03\xd0\x9c\xc0\xdetZ\x03\xc4\x8f\
+\xd1\x8cY\x9a\x82\xc5e\x00\x1b\x87xl\xc0\xe2\xf2\x8c\
+Y\x9a\x22>\x8a\xd2i\x0d\xec5\xfa\xdc.\x06\xe0\x00\
+\x80\xe7yM\x87\x9c$\x944Vc\x95J%3\x8c\
+\x093c\x82\xeb\xb0\x1c\x05\xb0\x02`\xc5\xb5\x1c\x9d1\
+\xc1\xf5aL\x98J\xa5\x92\xb1Vc\x80\x92\x22'=\
+\xcfk\x1e\x00\x92\xd4\xd6\xd6\xd6\xb4\xc0y\x92\x83\xad\x96\
+\xf9\xb0T*e\x871a\xf2&5-cFe\xcc\
+h\xce\xa4\xa6\xf7\xc1\x22k?\x009\x08p\xbe-\x91\
+\x98\xda\x1f\xbf#\xb3\x5c.\x97\xcfH\x18\x07\xd9/\xe9\
+\x96\xeb\xf0\xda\x03\xf2\xd7{\xa5R\x1e\x00\x9e\xed\xeb\xab\
+\xa5\xa5\x01k5\x06r\x10\xd2<\x89\x8b\xdd\xdd\xdd\xbf\
+\xfd7q\xc8u\x18iW\x1c\x00\xce;\xd4H\xb1X\
+\x5c8,\x0e\xc7\xcaW\x10\x04\x9d\x89\xb6\xb6s\xff[\
+\xbe\x1e)\xb0\x068u\xaa\xf7\xb1\x02{\xa2b\xef9\
+4\x004|\xdf\xff\x16\x00\x0a\x85\x17\xef?\xee\x0b\xf8\
+\x1bU\x90\xc3\xa3k\xf9!}\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x01\xd2\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x01\x84IDAT8\xcb\xd5\
+T\xbd\x8aSA\x18=g2}`k\xc1\x17X\x8b\
+d\x87@\xdaT\xc2\x16\xa9\x85\x80/`*{\x07\xd3\
+o'X.\x0b\x82u\x12\x84\xad\xb4\x5cFf\xee,\
+\xec\x0bXX\x07\xb6O\xe6\xd8\x5c%.\xb9\xf7\x06]\
+\x0b\xbfj\x98\xef\x873\xdf9s\x80\x8e\xf0\xde\x9b\x94\
+\xd2Y\x8cq\xe8\xbd7]\xf5lKJb\xceyR\
+JyGR$\xe7\x83\xc1\xe03I\xfd\xd1\xc0\x10\xc2\
+\xd8Z{\x05\xe0I}\xf5\x9d\xe4\xcb\xe1px\xd3\xd4\
+c\xdb\x06\xf6z\xbd\x13I\x1fI>\xab\x11\xdfI:\
+\xc1\xdfFJ\xe92\xa5tyL\xad\xc1#\xc7\xbf\x19\
+(\x89!\x84q\x8c\xf1\xfc s\xe4\x86\xe4\xe6P.\
+\xc6x\x1eB\x18K\x22\x00\x18\xef\xbd\xc99Oj6\
+G\x87\x9aJ)\x8bR\xca\xa2\x01\xd4\xc8Z{\x95s\
+\x9ex\xef\x0dSJg\x92>\x90|\x0a\xe0\x1a\xc0\xfd\
+>\xb2R\xca\xc29w_\xa3\xe9\x1bc\xde\xec3-\
+\xa9O\xf29\x80o\x92fF\x92\x9a\x84ZJ\xe9\xdc\
+\x19\xf9\xbb\x94\xedz\xbd\xbe\x9dN\xa7sI\xef%\xdd\
+9\xe7\xfc\x81=\xf5\x01\xa0F\xfa\xfaA\xee-\xc9S\
+\x92\xf3\xd5ju\x8bcH\xa9\xaa\xea\xa2\xaa\xaa\x8b&\
+R\xaa\xaa\xfaE\x8a\xada\x0b\xc0M\xcb\x9fn\xfc\x1d\
+\xce\xb9O\xff\x97\xb0[\xdd\xa6\xde\xe9h\xdf\x1c\x00|\
+}\xf8\xcc\xa3\xddf\xb7\xdbm\xac\xb5/~\xda\x17\xc9\
+\xd3\xedv{\xfdX\x06\x0b\x92\xaf\xba\x0c\xd6t\x88V\
+\xcb\xe5\xf2\x0b\xc9\x19\x80Y}V[\xcf\x0f\xc1O\xcd\
+(\xf5\xfb\xf0d\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x02.\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x04\x83\x00\x00\x04\x83\x08\x06\x00\x00\x00\xea\x0b\xff\xf7\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x002\xc0\x00\x002\xc0\x01(d\
-Z\xdb\x00\x00nsIDATx^\xec\xddy\xdc\
-\xed\xfb\x5c\xff\xffg\xa8\x08iR\xfa\x92\xa1\xf8\x85f\
-\xa5\x222\xa6\x1427Q\xa49M4\x91R2\x95\
-\xa1N\x11Q\x94T\x1cR(\x9c\xce\xd9\xd7\xfb\xbd\xf6\
->\xe7PN\xc6hP\x19\xa3A\x09EQ\xaf\xf5\xbb\
-]\xdb1\xbd\xf6>\xce\x1e\xaea\xadu\xdd\x1f\xb7\xdb\
-\xfd\x9f\xb3\xd6^\xd7\x1a>\xeb\xb3>\xef\xd7\xf9\x5c\xeb\
-J$I\x92\xf6\xa1\xe5\xc8\xa7,G\xae\xbe\x1c\xb9\xe9\
-\x85n\xbf\x1c\xb9\xc7\xb6\x1a\xf9\x9e\xe5\xc8\xcf\xbe_\xcd\
-<\xf9C<\xb7f\xc6\x85^\x5c3\xaf=\x01\xff\xba\
-\x9cY^\x9c\x9ay\xdbq\xfe\xed\xf1l\xff\xdc\xf7\xdf\
-\x87\xe7\x7f\xe8\xfd\xfb\xb0\xfb\xfd\xbe\xc7\xf1\xfe\xc7t\xe7\
-\xf7?\xd6\x1a\xb9\xe6r\xe4J\xfd9\x91$I\x92$\
-IZ\xf9\xea\xe9\xb9L\x9d\x93+\xd7\xcc\xe7\xd5\xe1\xdc\
-\xa4f\xeeP\x8b\xdc\xabf~|9\xf2\xf0\x9ayB\
-\xcd<\xb3F\xb6j\xe4\xe55\xf3\xc6\x1a\xf9\xaf>\x88\
-9\x88j\xe4]5\xf3\xa6\x1ay\xc5rd\xd6\xc8\xb3\
-j\xe6\x895\xf2\x0b5\xf3\x135\xf2\x9d\xb5\x95;\xd5\
-\xcc\xcd\xeaP\xbe\xa0F\xae\xb2\xbc \x1f\xd7_\x03I\
-\x92$I\x92\xa4S\xaa\xce\xcfe\xea\xfc\xf7\x0dv\x8e\
-\x9e\xc12s\xc7\x1a\xf9\x8e\xa3\x83\x9dE\x1e^[G\
-\x07\x15\x7fp\xf4\x8c\x98\xf7\x0fv\xa6\xc1\xce^\xaa\x99\
-w\xd7\xc8?\xd6\xcc+kdQ[\xf9\xc3\x9a\xf9\x8d\
-\x9a\xf9\xc5\xe5\xc8O.g\xbek\xfb,\xa4Z\xe4\xe6\
-\xcb\x91/\xacE>\xa3^\x96\xcb\xf6\xd7Z\x92$I\
-\x92$\x1d\x80\xea\xdc\x5c\xbe\xce\xc9uk\x91[\xd5\xd6\
-\xd1\xb3w\x1ex\xe1\x99(/\xa8\x99\xbf\xac\x91\xb7\xf7\
-\xe1\x03\xeb\xaff\xfe\xb3f\xfe\xbaf\xce>\xfa\xebl\
-[\xf9\xf9\xa3C\xa3C\xf9\xda\xa3\x83\xbf#\xf9\xc4\xbe\
-\xadH\x92$I\x92\xa45h9r\xb9\x9a\xb9N\xcd\
-|U\x1d\xca\xb7\xd7\xcc\xcf\x5c\xf8kZ\xdb\xdfk\xf3\
-\xca\xe5\xcc\x7f\xf4A\x01\xd4\xcc;k\xe6\xafj\xe4O\
-k\xe6I5\xf3\xa0\xa3\xbf\xa26s\xeb\x1a\xf9\xdc\xe5\
-\xc8'\xf4mM\x92$I\x92$\xedA\xdb\xbf\xee\xb3\
-\x1c\xb9\xf6r\xe4\x965r\xcf\x1a\xf9\xe9Z\xe4\xd7k\
-\xe4y\xdb\xdf;\xb3\xfd\x05\xc8}\xa1\x0f\xa7\xabF\xde\
-Q#\xaf\xae\x99\xb3j\xe47k\xe4\xe7\x8e\xfe\xfa\xe0\
-\xc8\xd7\xd4\x91|\xce\xf2\xec\x5c\xa1o\xab\x92$I\x92\
-$\xe9\x04[\x8e\x5cj\xfbl\x8c\x1a\xf9\xc6\x1ay\xc0\
-\xd1_\xe3z\xdf\xaf\xf7\xbc\xa6f\xde\xdb\x17\xea\xb0\x0a\
-.\xfc+k\xdb\x7f]\xed\xe8_T\xab\x91\xbbm\x7f\
-g\xd1r\xe4\xd2}\x1b\x97$I\x92$\xe9\xc0V\x87\
-\xf2\xd95s\xbb\x1a\xf9\xb1\x1aG\xbf\x04\xf8H\x8d\xfc\
-K_h\xc3\xba\xda>[\xadF^T#\xbf]3\
-\xf7?\xfa\xd7\xd1\xb6\x7f\xf5\xec\x82|t\x7f?H\x92\
-$I\x92\xb41\xd5Y\xf9\xd4\x9a\xb9\xf1\x85\x7fr\xfd\
-\x17k\xe4\xd9\xdb_\xe8\xdb\x17\xcepP\xd4\xc8\xdf\x1f\
-\xfd\xf5\xc6\x99_\xaaE\xbe\xa7fnV\xe7\xe6\xff\xf5\
-\xf7\x8e$I\x92$I+\xdd\xd1_\xf1:\x94\xcf\xb9\
-\xf0O\xb2\xdfo9\xf2[5\xf3\xc2\x1a\xf9\xf7\xbe\x18\
-\x06>\x5c\xcd\xbcc9rA\x8d\xfc\xee\xd1/?\xdf\
-\xca7l\xff\xaaY\x9d\x9f\xcb\xf4\xf7\x9a$I\x92$\
-I{^-\xf2\xe9\xcb\x91\x9b\xd6\x22\xdf]3\x8f\xae\
-\x91?\xa9\x99\xbf\xeb\x0b\x5c\xe0\xf4\xd4\xc8\xeb/\xfcK\
-g\xbfZ#\xf7\xde\xfeky\xcb#\xb9j\x7fOJ\
-\x92$I\x92\xb4c-G\xae\xb4\x1c\xb9\xfd\x85_\xe8\
-\xfc\x8c\xed?\xc3\xdd\x17\xac\xc0\xde\xba\xf0K\xab\xff\xb0\
-f~\xbeF\xee\xbc\x1c\xb9z\x7f\xefJ\x92$I\x92\
-t\xb1-G.\xb7\x1c\xb9Q-\xf2\xfdG\xff\x92\xd7\
-V^\x5c#\xef\xe9\x0bQ`\xf5\xd4\xcc\xcb\x8e~Y\
-\xf5\xc8\x8fl\x7f\x0f\xd1\xf2H>\xb1\xbf\xc7%I\x92\
-$I\x07\xbcZ\xe43j\xe46G\xcf\xfa\x19y\xe6\
-\xf6\x9fp\xef\x0bL`=]\xf8+f\xcf\xae\x91\x9f\
-\xab\x99;,\xcf\xceg\xf6}\x80$I\x92$i\xc3\
-\xab\x99\xcf\xab\x91\xbb\xd7\xc8\xa3j\xe6\x9c\x9ayk_\
-@\x02\x9b\xa9F\xde^#\x8b\x1a9\xa3\x0e\xe5\xdbk\
-\x91\xeb-\x97\xb9D\xdfOH\x92$I\x92\xd6\xb4z\
-Q>\xbe\x16\xf9\xca\xda\xca\x0f\xd6\xc8o\xd6\xc8_\xd4\
-\xc8\xff\xf5\x05\x22pp\xd5\xcc\xcbk\xe6)5s\x9f\
-Z\xe4\xe6u~>\xa9\xefK$I\x92$I+Z\
-\x1d\xca\xd5j+_\x7f\xf4\xcfR\x8f<\xabF\xfe\xa1\
-/\xfc\x00>\x92\x1ayC\x8d<\xa7f\x1eT3w\
-\xacC\xf9\xac\xbe\xaf\x91$I\x92$\xedS\xcb\x91/\
-\xacE\xbe\xadf~\xa9\xb62j\xe4\xdf\xfb\xc2\x0e\xe0\
-t\xd4\xc8;j\xe4p\xcd\xfcJm\xe5^\xcb\xad|\
-\xf1\xf2\xcc\x5c\xb2\xef\x8f$I\x92$I\xbb\xd0r\xe4\
-\x13j\xe4\x1bk\xe6\xc95\xf3\xc6\xbeh\x03\xd8\x0b5\
-\xf3\x96\x9a\xf9\x9d\x1a\xb9\xdbr\xe4S\xfa\xbeJ\x92$\
-I\x92t\x8a]\xf8g\xdeoY#?]#\x7fR\
-3\xff\xd6\x17e\x00\xfb\xa9\xe6\xd1/\xa5>\xeb\xc2\xbf\
-Xv\xeb\xed\xa1u\xdf\x97I\x92$I\x92>Bu\
-8\xd7\xad\x99o\xaf\xad<\xb1f^\xd9\x17^\x00\xab\
-\xacf\xfe\xea\xe8\xd9\x8b[\xf9\xee:\x94/\xe8\xfb8\
-I\x92$I:\xf0]\xf8\xab__\xb3\x5c\xe4g/\
-\xfc\xbf\xebo\xef\x8b+\x80uT#\xef\xaa\x99C5\
-\xf2\x90\x9a\xb9m\x1d\xce\x15\xfb>P\x92$I\x92\x0e\
-DuN>\x7f9\xf3]5\xf3\xa4\x1ayu_@\
-\x01l\xa2\x1a\xf9\xbb\x1ayj-\xf2\xfd\xcb#\xf9\xe2\
-\xbeo\x94$I\x92\xa4\x8d\xa9\xfe,\x9f\x5c#\xb7\xa9\
-\x91\x07\xd7\xcc95\xf3\x9f}\x91\x04p\x90\xd4\xc8{\
-.\xfc+e\xbfX\x87r\xc7Z\xe4\xd3\xfb\xbeS\x92\
-$I\x92\xd6\xaa\x9a\xf9\xa2\xda\xca\xf7\xd5\xccSj\xe4\
-o\xfbB\x08\x80\x0f\xaa\x99\xd7\xd5\xcc\xd3j\xe4\x87k\
-\xe4\xcb\xfb>U\x92$I\x92V\xae\xe5\xc8\xa5\x97#\
-7\xad\x99\x87\xf9\xe2g\x80\xd3S3\xaf\xa9\x99_=\
-\xfa\x9dj#\x97\xee\xfb\x5cI\x92$I\xda\x97\x96#\
-\x9f\xb2\x9c\xb9K\xcd\xfc\x9a\xef\xfe\x01\xd8\x1d5\xf2\x0f\
-\x17~\xc7\xda\xddk\xe4*}_,I\x92$I\xbb\
-\xda\xd1\xbf\xfe5s\x87\x9a\xf9\x95\x1ayE_\xb4\x00\
-\xb0{\xb6\x7f\xed\xb6f\x9eP#\xdf\xb4\x1c\xb9R\xdf\
-GK\x92$I\xd2\x8e\xb4\x1c\xb9\xdc\xd1?\x8b<\xf3\
-\xe8\x1ayI_\x9c\x00\xb0\xf7\xb6\xcf\xc8\xdc>3s\
-\xfb\x0c\xcd\xed35\xfb\xbe[\x92$I\x92N\xaa\xed\
-\xef\xa8\xa8\x99[\x1f\xfdK7#\x7f\xde\x17!\x00\xac\
-\x8e\xed35\x8f\x9e\xb19s\x87\xed38\xfb>]\
-\x92$I\x92\x8e\xdbr\xe4R5\xf3U5\xf3\xd0\x1a\
-9\xbf/6\x00X}\xdbgp\x1e=\x93s\xe6\xb6\
-\xdbgv\xf6}\xbd$I\x92$m\xff\x19\xf8\x9b\xd5\
-\xcc\x83j\xe4p_T\x00\xb0\xbe\xb6\xcf\xec<z\x86\
-\xe7\xcc\xad\xfdU2I\x92$\xe9\x80W37\xae\x99\
-\x9f\xa9\x91\xad\xbex\x00`\xf3l\x9f\xf1y\xf4\xcc\xcf\
-\x99\xaf\xda>\x13\xb4\x7f.H\x92$I\xda\xc0j\xe6\
-\x065s\xff\x1a\xf9\xd3\x9ayo_(\x00p0l\
-\x9f\x09z\xf4\x8c\xd0\x99\x9b\xf5\xcf\x0aI\x92$Ik\
-^\xcd\x5c\xbff~\xbcF\x9eW3\xef\xee\x0b\x02\x00\
-\x0e\xb6\xed3D\x8f\x9e):s\xe3\xfe\x19\x22I\x92\
-$iM\xaa\x91\xab\xd4\xc8w\xd4\xc83k\xe4?\xfb\
-\x81?\x00t5\xf2\x7f5\xf2'5\xf2\x035s\xad\
-\xfe\xd9\x22I\x92$i\x05\xab\xad\xdc\xa2f\x1eQ3\
-\xaf\xec\x07\xf9\x00p\xa2j\xe6\xefj\xe415r\x1b\
-\xdf/$I\x92$\xadX\xcb#\xf9\xcc\x9a\xf9\xbe\x1a\
-yN\x8d\xbc\xa7\x1f\xd0\x03\xc0\xe9\xa8\x99\xb3k\xe6\xbe\
-u$\x9f\xd3?\x83$I\x92$\xedQ\xcb\x07\xe6\x12\
-u(_[\x8b\x9cQ3\x7f\xd3\x0f\xdc\x01`\xa7\xd5\
-\xc8\x1bj+O\xac\xad\xdc\xa9\xce\xcae\xfbg\x93$\
-I\x92\xa4]\xa8f\xaeS#?R#g\xf5\x83t\
-\x00\xd8+\x17\xfe5\xb2\xfb\xd7\x22\xd7\xeb\x9fU\x92$\
-I\x92N\xb3\xe5\xc8\xa5\x97#\xb7\xaf\x91\xc7\xd7\xcc\xeb\
-\xfa\x019\x00\xec\x97\x1a\xf9\xe7\x1a\xf9\xed\x1a\xf9\xa6\xe5\
-\x91|b\xff\x0c\x93$I\x92t\x12\xd5\x91|A\xcd\
-\xfcD\xcd\x8c~\xf0\x0d\x00\xab\xa6f^\xb4\x5c\xe4g\
-k\xe4\xcb\xfbg\x9a$I\x92\xa4\x8bhyv\xaeP\
-[\xf9\x86\xda\xca\x93k\xe6-\xfd@\x1b\x00V\xde\xc8\
-\x7f\xd4\xc8\xd3\x96#\xf7X\x8e\x5c\xa9\x7f\xd6I\x92$\
-I\xda>\x0bh\x91/\xad\x99\x9f\xa9\x91\xf3\x8f9\xa8\
-\x06\x805U3/\xad\x99\x87\xd5Vn\xd2?\xfb$\
-I\x92\xa4\x03W\x1d\xce\x15k\xe4\xee5\xf2\xbb5\xf3\
-o\xfd\x00\x1a\x006E\x8d\xbc\xabF\x9e\xb5\x9c\xf9\xae\
-\xe5\x91\x5c\xb5\x7f&J\x92$I\x1b\xdd\xf6)\xf35\
-\xf3\xf3~\x0d\x0c\x80\x83\xa8f\xdeV3\xbfT#\xd7\
-\xec\x9f\x91\x92$I\xd2FU[\xb9E\xcd\xfcJ\x8d\
-\xbc\xa1\x1f\x18\x03\xc0AS#o\xad\x99\xdf\xa8\x99\xdb\
-\xf6\xcfLI\x92$im[\x8e\x5c\xaaF\xee\x5c3\
-\xbfS3\xef\xe8\x07\xc2\x00p\xd0\xd5\xcc\xff\xd6\xc8\x1f\
-\xd4\xa1|k\xbd(\x1f\xdf?K%I\x92\xa4\xb5\xe8\
-\xe8\xf7\x01-\xf2\x1d5\xf2\xc7\xfd\xa0\x17\x008\xbe\x1a\
-\xd9\xaa\x99\x1f\xacC\xb9Z\xffl\x95$I\x92V\xb2\
-:;\xff_\x8d\xfcX\x8d\x9c\xd7\x0fp\x01\x80\x13S\
-#/\xa9\x99\x07.G\xbe\xb0\x7f\xd6J\x92$I+\
-\xd1\x85\x7f\x1a\xfe\xa15\xf3\xaa~@\x0b\x00\x9c\x9a\x9a\
-ym\x8d\xfc\xf2r\xe4\xa6\xfd\xb3W\x92$I\xda\x97\
-j\x91\xaf\xae\xad<\xaeF\xde\xdc\x0f`\x01\x80\x1d\xf3\
-\x1f5\xf2\xdb5s\x87\xe5\x03s\x89\xfey,I\x92\
-$\xedj\xf5\xf4\x5c\xa6F\xbe\xb1f~\xbff\xde}\
-\x9c\x03V\x00`\x97\xd4\x22\xcf\xae\x99o\xaf\xf3\xf3I\
-\xfd3Z\x92$I\xda\xd1j\x91O\xaf\x91\xef\xad\x99\
-\x17\xf4\x03S\x00`o\xd5\xc8\xe1\xda\xca}\xeb\xdc|\
-V\xff\xcc\x96$I\x92N\xab:\x9c\xeb\xd6\xc8\xfdj\
-\xe4\xcf\xfa\x81(\x00\xb0\xbfj\xe6\x955\xf3\xf35\xf2\
-%\xfd3\x5c\x92$I:\xa9j+_Q3\xbfX\
-#\x7f\xdb\x0f<\x01\x80\xd5R#o\xaa\x99\xc7\xd4\xcc\
-W\xf5\xcftI\x92$\xe9#\xb6\xfd\x7f\x16/\xfc>\
-\xa0\xf7\xf6\x03M\x00`\xf5\xd5\xccs\xfd\x052I\x92\
-$]l5s\xdb\x9a\xf9\x9d\x9a\xf9\x9f~P\x09\x00\
-\xac\x9f\x1ayV-\xf2\x0d\xcbe>\xaa\x7f\xeeK\x92\
-$\xe9\x00W3\xb7\xae\x99'\xd7\xcc\x7f\xf5\x83H\x00\
-`#\x9cY\x8b\xdc\xa9\x1f\x03H\x92$\xe9\x80\xb5\xfd\
-\x9d\x025\xf3\xc4\x1ay\xc7q\x0e\x1a\x01\x80\x0dR3\
-\xff[#\xbf[[\xf9\xfa~L I\x92\xa4\x0d\xaf\
-fnV#\x8f\xaf\x91\x7f\xef\x07\x8a\x00\xc0f\xab\x99\
-w\xd7\xc8o\xd7V\xbe\xae\x1f#H\x92$i\xc3\xaa\
-C\xf9\xca\x1ayL\x8d\xfcK?0\x04\x00\x0e\x96\x9a\
-yg\x8d\xfcf-r\xab~\xcc I\x92\xa45\xaf\
-\x0e\xe5\x865\xf2\xcb5\xf2\xe6~ \x08\x00\x1cl5\
-\xf3\xb6\x1a\xf9\xf5Z\xe4\xe6\xfd\x18B\x92$IkV\
--\xf2\xa5\xb5\xc8#k\xe6\x8d\xfd\xc0\x0f\x00\xe0C\xd5\
-\xcc\xbf\xd6\xcccj\x91\xaf\xec\xc7\x14\x92$IZ\xf1\
-j\x91\xeb-\x17yx\xcd\xbc\xb6\x1f\xe8\x01\x00|$\
-5\xf3\xe6\xa3g\x14\x1f\xca\x0d\xfb1\x86$I\x92V\
-\xac:\x9c\xcf\xaf\x91\x87\xd4\xcck\xfa\x81\x1d\x00\xc0\xc9\
-\xa8\x917\xd48z\x86\xf1\xf5\xfb1\x87$I\x92\xf6\
-\xb9:\x9c\xeb\xd6\xc8\xcf\xd5\xcc_\xf5\x039\x00\x80\xd3\
-Q#\xff\xb0\x1cG\xcf8\xfe\xa2~\x0c\x22I\x92\xa4\
-=\xae\x0e\xe5\xb3k\xe4\xa7k\xe6\x95\xfd\xc0\x0d\x00`\
-'\xd5\xc8\xdf\xd6\xcc\xcf\xd7\xcc\xe7\xf5c\x12I\x92$\
-\xedru(\x9fU#\xf7\xab\x91\x97\xf5\x035\x00\x80\
-\xddT#\xaf\xae\x99\x07\xd6\xccu\xfa1\x8a$I\x92\
-v\xb8\xe5\xc8\xa5j\xe4\x87k\xe6-\xfd\xc0\x0c\x00`\
-/]\xf8'\xe9\x1f\xb0\x1c\xb9t?f\x91$I\xd2\
-i\xb6<3\x97\x5c\x8e\xdc\xa3F\x0e\xf5\x031\x00\x80\
-\xfdT3G\x963\xdfUO\xcfe\xfa1\x8c$I\
-\x92N\xa1Z\xe4\xabk\xe6\xa9\xfd\xc0\x0b\x00`\xc5\x9c\
-Y3\xb7\xed\xc72\x92$I:\xc1.\xfc3\xf1\x8f\
-\xac\x91\x7f>\xce\xc1\x16\x00\xc0\xca9\xfa\xabc\x8b\x9c\
-Q#_\xd2\x8fm$I\x92t\x11\xd5Y\xf9\xd4\x9a\
-\xb9oM_\x0e\x0d\x00\xac\xa7\xa3_2\xfd\xbe?v\
-q\x95~\xac#I\x92\xa4\x0f\xa9f\xbe\xb9f\x9e\xdf\
-\x0f\xa8\x00\x00\xd6Q\xcd\x1c\xda\xfe\xde\xc3\xed\xef?\xec\
-\xc7=\x92$I\x07\xba:\x94\x9b\xd7\xcc\x93k\xe6\x7f\
-\xfbA\x14\x00\xc0\xba\xab\x91\xdf\xad\x91\xaf\xe9\xc7@\x92\
-$I\x07\xae\x9a\xb9N\xcd<\xb4f\xde\xd8\x0f\x9a\x00\
-\x006I\xcd\xfcs-\xf2\xc8:\x94/\xe8\xc7D\x92\
-$I\x1b\xdfr\xe4\x13j\xe4\x07j\xe6\xc5\xfd@\x09\
-\x00`\x93\xd5\xc8\xcb\x8f~?\xe2y\xf9\xd4~\x8c$\
-I\x92\xb4\x91-g\xeeR#\xcf\xe9\x07F\x00\x00\x07\
-I\xcd\xbc\xa0\xb6\xf2-\xfdXI\x92$icZ\x8e\
-\xdc\xa8\x16\xf9\xf5\x9ayw?\x18\x02\x008\x88j\xe4\
-\xff\x8e~o\xe2\x227\xef\xc7N\x92$Ik[\x8d\
-\x5c\xb3F~\xaeF\xfe\xa1\x1f\x00\x01\x00p\xf4,\xa1\
-7\xd5V\x1e\xb6\xfd}\x8a\xfdXJ\x92$im\xaa\
-\xb3r\xd9\x1a\xf9\x9e\x9a9\xaf\x1f\xf0\x00\x00p\xac\xed\
-\xefS\xac\x99\x1f\x5c\x1e\xc9'\xf6c+I\x92\xa4\x95\
-\xae\x16\xf9\xfa\x1a\xf9\x83~\x80\x03\x00\xc0\xc5\xab\xad<\
-w\xfb{\x16\xfb1\x96$I\xd2\xca\xb5\x1c\xf9\x94\xed\
-\xdf{\xef\x074\x00\x00\x9c\xbc\x9a\xf9\xfd\x1a\xb9J?\
-\xe6\x92$I\xda\xf7\xea\xe9\xb9L\x8d\xdc\xbbF^\xd6\
-\x0fb\x00\x008u5\xf2\xea\x9a\xb9\xcf\xf2\xec\x5c\xa1\
-\x1f\x83I\x92$\xedK5s\xb3\x9ayj?p\x01\
-\x00`G\x9dY[\xf9\xea~,&I\x92\xb4g\xd5\
-\xe1\x5c\xb1F\xeeW3\x7fw\x9c\x83\x15\x00\x00vX\
-\x8d\xbc\xa1\xb6\xf2\xc0:'W\xee\xc7f\x92$I\xbb\
-Z\xcd\xdc\xb6f\xfe\xa8\x1f\xa0\x00\x00\xb0\xfbj\xe6\xf9\
-\xb5\xc8\x9d\xfa1\x9a$I\xd2\x8eW\x8b\x5c\xa3F\x1e\
-R3\xff\xd4\x0fJ\x00\x00\xd8;5\xf3\xb6\x9ay\xc4\
-r\xe4\xda\xfd\x98M\x92$iG\xaa\x91o\xaa\x91C\
-\xfd@\x04\x00\x80\xfdS3G\x96#\xf7\xe8\xc7n\x92\
-$I\xa7\x5c\x1d\xce\xe7\xd7\xc8\x195\xf2_\xfd\xe0\x03\
-\x00\x80\xfdW3\xef\xad\x91\xc7\xd7\xc8\x97\xf4c9I\
-\x92\xa4\x13n\xb9\xcc%\x963\xdfU3\x7f\xd6\x0f8\
-\x00\x00X=5\xf2\xb2\x1a\xb9w==\x97\xe9\xc7v\
-\x92$I\x1f\xb1Z\xe4\x865\xf3\xa4~\x80\x01\x00\xc0\
-\xea\xab\x99\xa7\xd6\xcc\xcd\xfa1\x9e$I\xd21-\xcf\
-\xce\x15j\xe6>5\xf2\xea~P\x01\x00\xc0\xfa\xa8\x99\
-\xbf\xab\x91\xfb\xd5\xe1\x5c\xb1\x1f\xf3I\x92$\x1d\xad\xb6\
-\xf2\xd5\xcb\x993\xfb\x81\x04\x00\x00\xeb\xabf\xfe\xa8f\
-n\xdb\x8f\xfd$I\xd2\x01\xae\xce\xc9\x95k+\x0f\xac\
-\x917\xf4\x83\x07\x00\x00\xd6_\xcd\xfcS\x8d<\xa4\x16\
-\xb9F?\x16\x94$I\x07\xacZ\xe4N5\xf3\xfc~\
-\xc0\x00\x00\xc0\xe6\xa9\x91C5\xf2M\xfd\x98P\x92$\
-\x1d\x80\x96#\xd7\xae\x99G\xd4\xcc\xdb\xfaA\x02\x00\x00\
-\x9b\xabF\xfe\xabF\xce\xa8\xc3\xf9\xfc~\x8c(I\x92\
-6\xb4\x1a\xb9M\xcd\xbc\xb1\x1f\x18\x00\x00pp\xd4\xcc\
-[j\xe4\xce\xfdXQ\x92$mP\xcb\x91\xab\xd7V\
-\x1e\xb1\xfd\x7f\x83\xfa\xc1\x00\x00\x00\x07O\xcd\xbc\xf7\xe8\
-YB\x87\xf2\xd9\xfd\xd8Q\x92$\xady\xb5\xc8\xd7\xd5\
-\x22\x7f\xd2\x0f\x00\x00\x00\xa0F\xce\xa9\x99;\xf6cH\
-I\x92\xb4\x86-G.W3?^3\xaf\xeb\x1f\xfa\
-\x00\x00\xf0~\x17\xfe\xda\xd8O\xd7\xf9\xf9\xa4~L)\
-I\x92\xd6\xa4\xda\xca\x97\xd5\xc8o\xf7\x0fz\x00\x00\xb8\
-(5\xf3\xfb5s\xe3~l)I\x92V\xbc\x1a\xb9\
-\xe7r\xe4\x82\xfe\xe1\x0e\x00\x00\x17\xa7F^Q#\xdf\
-\xd3\x8f1%I\xd2\x0a\xb6<\x92\xcf\xacE\x1eY#\
-\xef\xea\x1f\xea\x00\x00p\xa2j\xe4\xffj+\xbfZ3\
-\xd7\xe9\xc7\x9c\x92$iE\xaa\x99\xdb\xd6\xcc\xf3\xfb\x07\
-9\x00\x00\x9c\xaa\x9a9T\x8b\xdc\xa9\x1f{J\x92\xa4\
-}\xac\xce\xcd\xe5\x97#?Y#o\xe8\x1f\xde\x00\x00\
-p\xbaj\xe6\x9fj\xe6g\x96#\x9f\xd2\x8fE%I\
-\xd2\x1eW#_^3O\xe9\x1f\xd8\x00\x00\xb0\xd3j\
-\xe4\xe9\xb5\x95\x9b\xf4cRI\x92\xb4G\xd5\x22\xf7\xaa\
-\x91\xbf\xe8\x1f\xd2\x00\x00\xb0[j\xe4/k+\xdf\xd7\
-\x8fM%I\xd2.V#\xd7\xac\x99G\xd7\xcc\x7f\xf7\
-\x0fg\x00\x00\xd8m5S5\xf3\x98:\x9c\xeb\xf6c\
-UI\x92\xb4\xc3\xd5\xcc\xedj\xe6\x05\xfd\x03\x19\x00\x00\
-\xf6Z\xcd\x8c\xe5\xcc]\xfa1\xab$I\xda\x81\x96g\
-\xe7\x0a5r\xbf\x9ayc\xff\x10\x06\x00\x80\xfdR#\
-\xff\xb2\x1c\xf9\xd9:+\x9f\xda\x8fa%I\xd2)V\
-\x8b\xdc\xb0F\x9e\xda?x\x01\x00`\x85\x9c\xb9<\x92\
-\x9b\xf6cYI\x92t\x92\xd5\xc8w\xd6\xccK\x8f\xf3\
-a\x0b\x00\x00+\xa5f^U\x8b|\xffr\x99\x8f\xea\
-\xc7\xb5\x92$\xe9bZ\x8e\x5c\xaef\x1e\xd7?`\x01\
-\x00`\xd5\xd5\xcc\xefo\x1f\xcf\xf6c\x5cI\x92t\x11\
-\xd5\x227\xaf\xad<\xb7\x7f\xa8\x02\x00\xc0\xba\xa8\x91?\
-\xad\x99[\xf7c]I\x92\xd4\xaa\x91{\xd6\xcc\xcb\xfb\
-\x87)\x00\x00\xac\x9b\x9a\xf9\xeb\x1a\xf9\x9e~\xcc+I\
-\x92\xde\xf7ka\x9f\xb0\xfdW\x18\x963\xff\xd1?D\
-\x01\x00`]\xd5\xcc\xbbk\xe6auN>\xad\x1f\x03\
-K\x92t`\xab\xc3\xf9\xfc\xda\xca\x93\xfb\x07'\x00\x00\
-l\x8a\x9a\xf9\xbd\x9a\xb9~?\x16\x96$\xe9\xc0U3\
-\xb7\xad\x91C\xfd\xc3\x12\x00\x006M\xcd\x9c[#w\
-\xee\xc7\xc4\x92$\x1d\x98j\xe4\xde5\xf3w\xfdC\x12\
-\x00\x006U\xcd\xbc\xb1\xb6r\xdf\xe5\x99\xb9d?>\
-\x96$ic\xabs\xf3\xffj\xe6\x17k\xe6\xbd\xfd\xc3\
-\x11\x00\x00\x0e\x82Z\xe4\x8cZ\xe4\x1a\xfdXY\x92\xa4\
-\x8d\xabfnP#O\xef\x1f\x86\x00\x00p\xd0\xd4\xcc\
-\x1f-Gn\xda\x8f\x99%I\xda\x98j\xe4\x1bk\xe4\
-E\xfdC\x10\x00\x00\x0e\xaa\x9ayim\xe5\xdb\xfa\xb1\
-\xb3$Ik\xdd\xf2/\xf315\xf3\xe35\xf3\x96\xfe\
-\xe1\x07\x00\x00\x07]\x8d\xfc{\x8d\xfct\x9d\x9b\xcb\xf7\
-ciI\x92\xd6\xae\x9a\xb9V\x8d<\xb6\x7f\xe0\x01\x00\
-\x00\x1f\xaef~\xa3F>\xb7\x1fSK\x92\xb46-\
-GnY#\x7f\xdc?\xe4\x00\x00\x80\xe3\xab\x99\xb3k\
-+_\xd7\x8f\xad%IZ\xf9j\xe6\xdbk\xe4\x15\xfd\
-\xc3\x0d\x00\x00\xf8\xc8j\xe6oj\xe4{\xfb1\xb6$\
-I+\xd9\xf2H>\xb1F~\xaef\xde\xde?\xd4\x00\
-\x00\x80\x13S3\xff\xbd\x1cy\xf8r\xe4J\xfd\x98[\
-\x92\xa4\x95i9\xf2\x85\xcb\x91\xdf\xea\x1fd\x00\x00\xc0\
-\xa9\xa9\x99\xdf\xaf\xad|Y?\xf6\x96$i\xdf\xab\x99\
-\xdb\xd5\xc8V\xff\xf0\x02\x00\x00NO\xcd\x9c\xb7\x9c\xb9\
-K?\x06\x97$i\xdfZ\x8e\xdc\xa3f\xde\xd9?\xb4\
-\x00\x00\x80\x9dQ3\xef\xad\x91{\xf7cqI\x92\xf6\
-\xb4:7\x97\xaf\x91\x07\xd7\xc8{\xfa\x87\x15\x00\x00\xb0\
-\xf3j\xe6\x11u8W\xec\xc7\xe6\x92$\xedz\xcb\x91\
-\xab\xd7\xcc\xaf\xf5\x0f'\x00\x00`w\xd5\xcc\x93\x96#\
-\xd7\xee\xc7\xe8\x92$\xedZ\xb5\xc8\xf5j\xe6i\xfdC\
-\x09\x00\x00\xd8\x1b5\xf2\xec\xda\xcaW\xf4cuI\x92\
-v\xbc\xe5\xc8-k\xe6\xec\xfea\x04\x00\x00\xec\xad\x9a\
-9R3\xb7\xed\xc7\xec\x92$\xedX\xb5\x95o\xa8\x91\
-\xbf\xe8\x1fB\x00\x00\xc0\xfe\xa8\x91Wo\xffA\x97~\
-\xec.I\xd2iW#\xdf[#\xaf\xeb\x1f>\x00\x00\
-\xc0\xfe\xaa\x91\x7f\xae\xad\xdc\xb7\x1f\xc3K\x92tJ-\
-/\xc8G\xd7\xccO\xd5\xc8;\xfa\x87\x0e\x00\x00\xb0\x1a\
-j\xe4\x7fk\xe4!\xcb\x0br\x85~L/I\xd2\x09\
-W/\xcc\xa7\xd5\xcc\xa3\xfb\x07\x0d\x00\x00\xb0\x9aj\xe6\
-\xf1\xcb#\xf9\xcc~l/I\xd2\xc5V\xe7\xe4\xba\xcb\
-\x99\xdf\xea\x1f.\x00\x00\xc0j\xab\x99g\xd4\xcc\xf5\xfb\
-1\xbe$I\x17\xd9r\xe4F\xb5\x95\xe7\xf6\x0f\x15\x00\
-\x00`=\xd4\xc8V\x8d|M?\xd6\x97$\xe9\x98j\
-\xe6v5r^\xff0\x01\x00\x00\xd6K\xcd\xbc\xacf\
-\xbe\xb9\x1f\xf3K\x92\xf4\x81j\xe4\x9e5\xf3W\xfdC\
-\x04\x00\x00XO5\xf3\xc6\x1a\xf9\x81~\xec/I\xd2\
-\xf6\x19A\xf7\xad\x91\x7f\xe9\x1f\x1e\x00\x00\xc0z\xab\x91\
-w-G~v\xf9\x9c|\x5c_\x07H\x92\x0e`\xcb\
-\xb3s\x85\x9ayh\xcd\xfco\xff\xd0\x00\x00\x006G\
-m\xe5Wk\xe4*}M I:@-\xcf\xceg\
-\xd6\xc8\xe3\xfb\x87\x04\x00\x00\xb0\x99j\xe4w\xebH\xbe\
-\xa0\xaf\x0d$I\x07\xa0\x1a\xf9\x92\xe5\xcc\x99\xfd\xc3\x01\
-\x00\x00\xd8l5\xf3\x82Z\xe4\xe6}\x8d I\xda\xe0\
-j\x91[\xd5\xc8\xa1\xfe\xa1\x00\x00\x00\x1c\x0c5\xf3\xe2\
-\xe5\xcc]\xfaZA\x92\xb4\x81\xd5\xc87\xd5\xccK\xfb\
-\x87\x01\x00\x00p\xb0\xd4\xcc\xdf\xd7\x22\xdf\xdd\xd7\x0c\x92\
-\xa4\x0d\xaaF\xbe\xa3f^\xd7?\x04\x00\x00\x80\x83\xa9\
-f\xdeV[\xb9o_;H\x926\xa0\x9a\xf9\xbe\x1a\
-ys\xdf\xf9\x03\x00\x00\x07[\xcd\xfcW\x8d\xdc\xaf\xaf\
-!$Ik\x5c\x8d\xfcp\xcd\xbc\xb5\xef\xf4\x01\x00\x00\
-\xb6\xd5\xcc{k\xe6\x81\xcb3s\xc9\xbe\x9e\x90$\xad\
-Y5\xf3\xe35\xf3\x8e\xbe\xb3\x07\x00\x00\xe8j\xe4!\
-u~.\xd3\xd7\x15\x92\xa45\xa9F\x1eP3\xff\xdd\
-w\xf0\x00\x00\x00\x17\xa5f\x1e\xb1<;W\xe8\xeb\x0b\
-I\xd2\x0a\xb7<3\x1fS3\x0f\xea;u\x00\x00\x80\
-\x13Q#g\xd4\xe1\x5c\xb1\xaf5$I+\xd8r\xe4\
-r\xcbE\x1e\xdew\xe6\x00\x00\x00'\xa3F\x1e_\xe7\
-\xe4\xca}\xcd!IZ\xa1\xea\x05\xf9\xa4\x9ayt\xdf\
-\x89\x03\x00\x00\x9c\x8a\x9ayR-r\x8d\xbe\xf6\x90$\
-\xad@\xcb\x91+\xd5\xccc\xfa\xce\x1b\x00\x00\xe0t\xd4\
-\xc8S\xeb\xdc|v_\x83H\x92\xf6\xb1\xe5\x91\x5c\xb5\
-\xb6\xf2\xc4\xbe\xd3\x06\x00\x00\xd8!g\xd6\xcc\xe7\xf5\xb5\
-\x88$i\x1f\xaa\x91k\xd6\xc8o\x1fgg\x0d\x00\x00\
-\xb0cj\xe4\x8f\x96G\xf2\xc5}M\x22I\xda\xc3\xea\
-p\xae[3\xbf\xdfw\xd2\x00\x00\x00\xbb\xa1F\x9eW\
-\x87r\xc3\xbe6\x91$\xedA\xcb\x91/\xac\x91?\xe8\
-;g\x00\x00\x80\xddT3\xe7,Gn\xda\xd7(\x92\
-\xa4]\xac\xb6\xf2e5\xf3\xdc\xbeS\x06\x00\x00\xd8\x0b\
-5r\xb8\x16\xb9U_\xabH\x92v\xa1\x9a\xb9q\x8d\
-\x9c\xd5w\xc6\x00\x00\x00{\xa9f^T#\xb7\xe9k\
-\x16I\xd2\x0eV[\xb9E\xcd\x8c\xbe\x13\x06\x00\x00\xd8\
-\x0f\xb5\x95\x97\xd6\xcc\x1d\xfb\xdaE\x92\xb4\x03\xd5\xcc\xad\
-k\xe4\xbc\xbe\xf3\x05\x00\x00\xd8O5\xf2\xaa\x1a\xf9\xc6\
-\xbe\x86\x91$\x9dF\xb5\x95\xaf\xaf\x99\x17\xf7\x9d.\x00\
-\x00\xc0*\xa8\x99\xd7\xd4\xcc\xb7\xf6\xb5\x8c$\xe9\x14Z\
-\xce\xdc\xa5f^\xdew\xb6\x00\x00\x00\xab\xa4F^_\
-#\xdf\xd1\xd74\x92\xa4\x93h9r\xa3\x9ayg\xdf\
-\xc9\x02\x00\x00\xac\xa2\x9ayo\x8d\xdc\xb9\xafm$I\
-'P\xcd\xdc\xae\x863\x82\x00\x00\x80\xf5R3\xaf\xaf\
-\xad|[_\xe3H\x92>B5\xf25\xbe#\x08\x00\
-\x00XWG\xbfCh\xe4\x9b\xfaZG\x92t\x9cj\
-\x91\x9b\xfb\xaba\x00\x00\xc0\xba;\xfaW\xc6\xfc\xd9y\
-I\xfa\xc8]\xf8\x1dA\xa3\xefD\x01\x00\x00\xd6Q\xcd\
-\xbc\xb4\x0e\xe76}\xed#Iz\xdf\x19A_Z#\
-g\xf5\x9d'\x00\x00\xc0:\xab\x91?\xabEn\xd5\xd7\
-@\x92t\xa0[\x8e|am\xe5\xb9}\xa7\x09\x00\x00\
-\xb0\x09j\xe6\xc8r\xe4\xa6}-$I\x07\xb2:\x9c\
-\xeb\xd6\xcc3\xfb\xce\x12\x00\x00`\x93\xd4\xc8\xa1Z\xe4\
-\x86}M$I\x07\xaa\x1a\xb9f\xcd\xfc^\xdfI\x02\
-\x00\x00l\xa2\x1ay^\x8d|I_\x1bI\xd2\x81h\
-yv\xae\xba\x9c\xf9\xad\xbes\x04\x00\x00\xd8d5\xf3\
-Gu8\x9f\xdf\xd7H\x92\xb4\xd1-G\xaeT3O\
-\xe8;E\x00\x00\x80\x03\xe2\xcc\xe5\xc8\xb5\xfbZI\x92\
-6\xb2\xe5\x91|b\x8d<\xe68;C\x00\x00\x80\x03\
-\xa3f\x9e\xba<;\x9f\xd9\xd7L\x92\xb4Q\xd5\xcbr\
-\xd9\x9ayt\xdf\x09\x02\x00\x00\x1cD5\xf3\xa4\x1a\xb9\
-J_;I\xd2F\xb4\xbc \x1f\xbd\x1cyx\xdf\xf9\
-\x01\x00\x00\x1cd5\xf2\xf8:+\x9f\xda\xd7P\x92\xb4\
-\xf6\xd5\xcc\x83\xfaN\x0f\x00\x00\x80\xa3g\x08\xfd\xcar\
-\xe4\x13\xfa:J\x92\xd6\xb6\x1ay@\x8dT\xdf\xe1\x01\
-\x00\x00\xf0>5\xf2\xc8:?\x97\xe9\xeb)IZ\xbb\
-j\xe4\xc7j\xe6\xbf\xfb\x8e\x0e\x00\x00\x80\x0fW3\x0f\
-].s\xc9\xbe\xae\x92\xa4\xb5\xa9f~\xa8F\xde\xd1\
-wp\x00\x00\x00\x5c\x84\x91\x9f\xedk+IZ\x8bj\
-\xe4{k\xe4\xad\xc7\xec\xd8\x00\x00\x00\xb8H5\xf3\xbf\
-5r\xbf\xbe\xc6\x92\xa4\x95\xae\x16\xb9W\xcd\xfcc\xdf\
-\xa9\x01\x00\x00p\xf1j\xe4]5s\xdf\xbe\xd6\x92\xa4\
-\x95l9r\xa3\x9ayo\xdf\x99\x01\x00\x00prj\
-\xe4\xce}\xcd%I+U\xcd|U\x8d\xbc\xa4\xef\xc0\
-\x00\x00\x008y5\xf3\xda\x9a\xb9k_{I\xd2J\
-T\x8b\x5c\xaff\xce\xee;/\x00\x00\x00N\xcb\x05u\
-8\xb7\xe8k0I\xda\xd7\xea\xbc\x5c\xadf\x9ev\x9c\
-\x9d\x16\x00\x00\x00\xa7\xa9F\xceZ\x8e|a_\x8bI\
-\xd2\xbeT\x7f\x94\xcb\xd7\x22\x8f\xed;+\x00\x00\x00v\
-Nm\xe5\xf7\x97g\xe7\xaa}M&I{^m\xe5\
-\xe7\xfbN\x0a\x00\x00\x80\x9dW#\x8f\xa9\xb3r\xd9\xbe\
-.\x93\xa4=\xabF~\xb8F\xfe\xa7\xef\xa0\x00\x00\x00\
-\xd8\x1d5\xf2s}m&I{R\x8d\xdc\xbdF\xde\
-\xdcwL\x00\x00\x00\xec\x9e\x9ayw\xcd\xfc`_\xa3\
-I\xd2\xaeV3_[3\xaf\xec;%\x00\x00\x00v\
-_\xcd\xbc\xa9F\xee\xd6\xd7j\x92\xb4+\xd5\xc8\x97\xd7\
-\xc8\xa2\xef\x8c\x00\x00\x00\xd8;5\xf2\x8a\x9a\xb9u_\
-\xb3I\xd2\x8eV3\xd7\xaa\x91g\xf5\x9d\x10\x00\x00\x00\
-{\xaffF-\xf2\xa5}\xed&I;R\x9d\x9fO\
-\xaa\x99'\xf6\x9d\x0f\x00\x00\x00\xfb\xa7f\x9eY\xe7\xe6\
-\xb3\xfa\x1aN\x92N\xbb\xe5\x22\x0f\xef;\x1d\x00\x00\x00\
-\xf6_-\xf2\xeb\xcb#\xf9\xc4\xbe\x8e\x93\xa4S\xaef\
-~\xbcf\xaa\xefp\x00\x00\x00X\x0d\xb5\x95\x87\xf5\xb5\
-\x9c$\x9dR\xb5\x95{\xd5\xcc[\xfb\x8e\x06\x00\x00\x80\
-\xd5Q#\xffW#?\xda\xd7t\x92tR-Gn\
-_#\x7f\xd3w2\x00\x00\x00\xac\x9e\x1a\xf9\x97\x1a\xb9\
-g_\xdbI\xd2\x09U37\xae\x91\xf3\xfb\xce\x05\x00\
-\x00\x80\xd5U3\x7fU[\xf9\xfa\xbe\xc6\x93\xa4\x8fX\
-\x1d\xca\xe7\xd4\xc8\x1f\xf7\x9d\x0a\x00\x00\x00\xab\xafF\xce\
-[\x8e\xdc\xa8\xaf\xf5$\xe9\xb8-G\xaeT#\xbf\xdd\
-w&\x00\x00\x00\xac\x8f\x1ayN\xcd\x5c\xa7\xaf\xf9$\
-\xe9\xc3Z^\x90\x8f\xae\x99G\xf7\x9d\x08\x00\x00\x00\xeb\
-\xa7f\x9e\x5c\xe7\xe5S\xfb\xdaO\x92>P\xcd\xfcT\
-\xdfy\x00\x00\x00\xb0\xbej\x91G.G.\xd5\xd7\x7f\
-\x92t\xf4/\x87\xf5\x9d\x06\x00\x00\x00\xeb\xafF\xee\xdd\
-\xd7\x80\x92\x0ex\xb5\xc8\xadj\xe4U}\x87\x01\x00\x00\
-\xc0\xfa\xab\x917\xd7\x22\xdf\xd0\xd7\x82\x92\x0eh\xcb\x91\
-k\xd7\xc8\xf3\xfa\xce\x02\x00\x00\x80\xcdQ3/\xac\x91\
-/\xefkBI\x07\xac:?\x97\xa9\x99\xc7\xf7\x9d\x04\
-\x00\x00\x00\x9b\xa7f\x9eV\x7f\x9a\xff\xd7\xd7\x86\x92\x0e\
-P5s\xff\xbes\x00\x00\x00`s\xd5\xcc/\xf6\xb5\
-\xa1\xa4\x03R\x8d\xdc\xadF\xfe\xa5\xef\x18\x00\x00\x00\xd8\
-\x5c5\xf2\x9eZ\xe4\xfb\xfb\x1aQ\xd2\x86W37^\
-\xce\x5c\xd0w\x0a\x00\x00\x00l\xbe\x9ayM\x1d\xcem\
-\xfaZQ\xd2\x86V\x87r\xb5\x1ayV\xdf\x19\x00\x00\
-\x00pp\xd4\xc8\xa1:'\x9f\xdf\xd7\x8c\x926\xac\xe5\
-2\x1fU#\xbf\xdcw\x02\x00\x00\x00\x1c<5\xf3\xa4\
-\xe5\xd9\xb9B_;J\xda\xa0j\xe4G\xfa\x9b\x1f\x00\
-\x00\x80\x83\xabf\x1e\xd8\xd7\x8e\x926\xa4\xda\xca\x9dj\
-\xe4\x0d\xfd\x8d\x0f\x00\x00\xc0\xc1U3o[.r\x8f\
-\xbe\x86\x94\xb4\xe6\xd5\xcc\xf5k\xe4\xdc\xfe\xa6\x07\x00\x00\
-\x80\x1ayy-r\xf3\xbe\x96\x94\xb4\xa6\xd5y\xf9\xd4\
-\x1a\xf9\xdd\xfef\x07\x00\x00\x80\xf7\xab\x91\xe7\xd4\xa1|\
-V_SJZ\xc3j\xe6a\xfdM\x0e\x00\x00\x00]\
-\xcd\xfc\xear\xe4R}])i\x8d\xaa\x91\xef\xad\x99\
-w\xf778\x00\x00\x00\x1cO\x8d\xfcX_[JZ\
-\x93j\xe6kk\xe6o\xfa\x1b\x1b\x00\x00\x00.J\x8d\
-\xfcc\xcd\xdc\xb5\xaf1%\xadx5\xf2\xb95sv\
-\x7fS\x03\x00\x00\xc0\xc5\xa9\x91\xf3\xebp\xbe\xac\xaf5\
-%\xadh\xf5\xbc||\x8d\xfcf\x7f3\x03\x00\x00\xc0\
-\x89\xaa\x99\xdf\xaf\xe7\xe7\xd3\xfb\x9aS\xd2\x0aV3?\
-\xd3\xdf\xc4\x00\x00\x00p\xb2j\xe4\x17\xfa\x9aS\xd2\x8a\
-\xb5\x1c\xb9G\xcd\xbc\xad\xbf\x81\x01\x00\x00\xe0d\xd5\xc8\
-\xff\xd4\xcc\xf7\xf5\xb5\xa7\xa4\x15\xa9\x0e\xe5\xe65\xf2\xf2\
-\xfe\xe6\x05\x00\x00\x80SU#\x7f[\x8b|]_\x83\
-J\xda\xe7\xea\xdc|V\x8d<\xa7\xbfi\x01\x00\x00\xe0\
-tm\xff\x81\xa2\x9a\xf9\xbc\xbe\x16\x95\xb4\x8f\xd5\xcc/\
-\xf57+\x00\x00\x00\xec\x94\x1a\xf9\xf5\xe5\xc8\xa5\xfaz\
-T\xd2>T#\xdfQ3\xff\xd3\xdf\xa8\x00\x00\x00\xb0\
-\x93j\xe6\x07\xfb\x9aT\xd2\x1eW37\xa8\x91\x97\xf4\
-7(\x00\x00\x00\xec\xb4\x9a\xf9\xeb:\x9c[\xf4\xb5\xa9\
-\xa4=\xaa\xce\xcd\xe5k\xe6w\xfa\x9b\x13\x00\x00\x00v\
-K\x8d\xfcA=?\x9f\xde\xd7\xa8\x92\xf6\xa0\x9a\xf9\x89\
-\xfe\xa6\x04\x00\x00\x80\xddV3\x0f\xeakTI\xbb\x5c\
-\x8d\xdc\xa6f^\xdf\xdf\x90\x00\x00\x00\xb0\xdbj\xe6\xad\
-5\xf2\x8d}\xad*i\x97\xaaE\xaeQ#\xcf\xebo\
-F\x00\x00\x00\xd8+5r\xd8\x9f\x9b\x97\xf6\xa8\x9ay\
-D\x7f\x13\x02\x00\x00\xc0^\xab\x99\xc7-\x97\xb9D_\
-\xb7J\xda\xc1\x96#\xf7\xa8\x91\xff\xeao@\x00\x00\x00\
-\xd8\x0f\xb5\xc8\xbd\xfb\xdaU\xd2\x0eU#_R3\x7f\
-\xd6\xdfx\x00\x00\x00\xb0_j\xe4\xd5u(7\xefk\
-XI\xa7Y\x9d\x9f\xcb\xd4\xcc\x93\xfa\x9b\x0e\x00\x00\x00\
-\xf6[\x8d<\xb3\xce\xc9\xa7\xf5\xb5\xac\xa4\xd3\xa8f\xee\
-\xdb\xdfl\x00\x00\x00\xb0*j\xe4\xe7\xfaZV\xd2)\
-V#_S#\x7f\xdf\xdfh\x00\x00\x00\xb0*j\xe6\
-_k\xe6\xae}M+\xe9$\xab\x91\xab\xd4\xc8s\xfa\
-\x9b\x0c\x00\x00\x00V\xd0\xac#\xf9\x9c\xbe\xb6\x95t\x12\
-\xd5\xccC\x8f\xf3\xe6\x02\x00\x00\x80\x95T#\x8f].\
-\xf3Q}}+\xe9\x04\xaaE\xbee9\xf3\x1f\xfd\x8d\
-\x05\x00\x00\x00\xab\xac\xb6\xf2\xfd}\x8d+\xe9bZ\x8e\
-|a\x8d\x9c\xd7\xdfP\x00\x00\x00\xb0\xeaj\xe4U\xcb\
-\x91\x9b\xf6\xb5\xae\xa4\x8bh9r\xa9\x9ayB\x7f3\
-\x01\x00\x00\xc0\x1a9\xb3\x0e\xe7\x8a}\xcd+\xe98\xd5\
-\xcc\x0f\x1e\xe7M\x04\x00\x00\x00k\xa5f\x1e\xd8\xd7\xbc\
-\x92Zu8\xb7\xa8\x99\xbf\xeeo \x00\x00\x00X7\
-5\xf3\xcfu8w\xeek_I\x17\xb6\x1c\xb9R\x8d\
-\xfcA\x7f\xf3\x00\x00\x00\xc0\xba\xaa\x91\xad:'\xd7\xed\
-k`I\xef\xfb\xf5\xb0\x07\xf57\x0d\x00\x00\x00\xac\xbb\
-\x1ayL_\x03K\x07\xbe\x1a\xf9\xf2\x9ayo\x7f\xc3\
-\x00\x00\x00\xc0&\xa8\xe1\xd7\xc5\xa4\x0f\xb4<\x92\xab\xd6\
-\xc8\x9f\xf67\x0a\x00\x00\x00l\x8a\x1a\xf9\x8b:'\xd7\
-\xebkb\xe9@\xe6\xd7\xc3\x00\x00\x008\x08j\xe4\xb1\
-}M,\x1d\xb8j+_W#o\xeeo\x10\x00\x00\
-\x00\xd845\xf2?5r\xf7\xbe6\x96\x0eLuv\
->\xb9\xb6\xf2\x87\xfd\xcd\x01\x00\x00\x00\x9b\xaaF\x165\
-s\xad\xbeF\x96\x0eD5\xf3\x13\xfdM\x01\x00\x00\x00\
-\x9b\xaeF~\xa1\xaf\x91\xa5\x8d\xaf\x0e\xe7&5\xf3\x9a\
-\xfe\x86\x00\x00\x00\x80MW3o\xad\x99;\xf4\xb5\xb2\
-\xb4\xb1-G.]3\xbf\xd3\xdf\x0c\x00\x00\x00pP\
-\xd4\xcc\x1f\xd7\x22\x9f\xde\xd7\xcc\xd2FV#\xf7\xeeo\
-\x02\x00\x00\x008hj\xe4\x01}\xcd,m\x5c5\xf2\
-%5\xf2\xb2\xfe\x06\x00\x00\x00\x80\x83\xa6F^\xb7\x1c\
-\xb9e_;K\x1bU\xcd<\xbeo\xfc\x00\x00\x00p\
-P\xd5\xc8\xd3\x96#\x97\xeb\xebgi#\xaa\x91{\xd6\
-\xcc\xff\xf6\x0d\x1f\x00\x00\x00\x0e\xb2\x1a\xf9\xe1\xbe\x86\x96\
-\xd6\xbe\x9a\xb9N\x8d\x9c\xd77x\x00\x00\x008\xe8j\
-\xe6\x955\xf2\xe5}--\xadu5\xf2\xa8\xbe\xb1\x03\
-\x00\x00\x00\xefS3O\xeckiim[\xce\xdc\xa5\
-F\xde\xde7t\x00\x00\x00\xe0\x83j\x91{\xf55\xb5\
-\xb4v-\x8f\xe4\xaa5sV\xdf\xc0\x01\x00\x00\x80\x0f\
-W3/\xac#\xf9\x9c\xbe\xb6\x96\xd6\xaa\x9ayP\xdf\
-\xb8\x01\x00\x00\x80\xe3\xab\xad\xfcR_[KkS\xcd\
-|m\x8d\xbc\xb9o\xd8\x00\x00\x00\xc0\xf1\xd5\xc8;j\
-+\xdf\xd0\xd7\xd8\xd2\xcaWg\xe7\x93k\xe4Y}\xa3\
-\x06\x00\x00\x00>\xb2\x1a\xf9\xd3:\x94\xab\xf5\xb5\xb6\xb4\
-\xd2\xd5V~\xa2o\xcc\x00\x00\x00\xc0\x89\xd9\xfe\xda\x95\
-\xbe\xd6\x96V\xb6\xda\xcaMj\xe65}C\x06\x00\x00\
-\x00N\xcc\xf6\xd7\xael\x7f\xfdJ_sK+\xd7r\
-\xe4\xd25\xf3;}#\x06\x00\x00\x00N\xce\xf6\xd7\xaf\
-\xd4\xf9\xf9\xa4\xbe\xf6\x96V\xaaZ\xe4\xfb\xfb\xc6\x0b\x00\
-\x00\x00\x9c\x9a\x9a\xf9\xf1\xbe\xf6\x96V\xa6\x1a\xf9\x92\x9a\
-yi\xdfp\x01\x00\x00\x80SS3\x7fS\x8b|e\
-_\x83K+Q\x8d<\xa6o\xb4\x00\x00\x00\xc0\xe9\xa9\
-\x99'\xf55\xb8\xb4\xef\xd5V\xbe\xbef\xde\xde7X\
-\x00\x00\x00\xe0\xf4\xd4\xcc{k\xe6\x9b\xfbZ\x5c\xda\xb7\
-\x96\xcf\xc9\xc7\xd5\xc83\xfb\xc6\x0a\x00\x00\x00\xec\x8c\x9a\
-y~\x1d\xce\x15\xfb\x9a\x5c\xda\x97j+\xdf\xdd7R\
-\x00\x00\x00`g\xd5\xcc}\xfa\x9a\x5c\xda\xf3j\x91k\
-\xd4\xc8\xb9}\x03\x05\x00\x00\x00v\xd6\xf6\x1fm\xaa\xc3\
-\xf9\xfc\xbe6\x97\xf6\xb4\xda\xca\x03\xfb\xc6\x09\x00\x00\x00\
-\xec\x8e\x9ayD_\x9bK{V\xcd\xdc\xa0F\xfe\xae\
-o\x98\x00\x00\x00\xc0\xee\xa8\x99\x7f\xaa\xad|u_\xa3\
-K{Rm\xe5q}\xa3\x04\x00\x00\x00vW\x8d<\
-u\xf9\xc0\x5c\xa2\xaf\xd3\xa5]\xadf\xeeP#\xff\xd9\
-7H\x00\x00\x00`\xf7\xd5\x22\xdf\xd6\xd7\xea\xd2\xae\xb5\
-\x1c\xb9\x5c\x8d<\xabo\x88\x00\x00\x00\xc0\xde\xa8\x99s\
-\xea\x9c\x5c\xb9\xaf\xd9\xa5]\xa9F\xbe\xb7o\x84\x00\x00\
-\x00\xc0\x1e\x1b\xf9\xc9\xbef\x97v\xbc\x1a\xb9f\x8d\x9c\
-\x7f\xcc\x06\x08\x00\x00\x00\xec\xa9\x1ay\xd5\xf2H\xbe\xb8\
-\xaf\xdd\xa5\x1d\xadF~\xaeo|\x00\x00\x00\xc0\xfe\xa8\
-\x913\xfa\xda]\xda\xb1\x96#7\xaa\x91\x7f\xe8\x1b\x1e\
-\x00\x00\x00\xb0?j\xe4\xdfk\xe46}\x0d/\xedH\
-5\xf2\xeb}\xa3\x03\x00\x00\x00\xf6W\x8d<\xbd\x9e\x97\
-\x8f\xed\xebx\xe9\xb4\xaa\x91;\xd7\xc8\xbb\xfa\x06\x07\x00\
-\x00\x00\xec\xbf\x1a\xf9\xce\xbe\x96\x97N\xb9\xe5\xd9\xb9B\
-\x8d<\xbboh\x00\x00\x00\xc0j\xa8\x91\xc3\xcb\x91\xab\
-\xf75\xbdtJ\xd5\xc8\xbd\xfbF\x06\x00\x00\x00\xac\x96\
-\x1a\xf9\xe9\xbe\xa6\x97N\xba:\x94\xcf\xae\x91?\xeb\x1b\
-\x18\x00\x00\x00\xb0Zj\xe655s\x83\xbe\xb6\x97N\
-\xaa\x1ayp\xdf\xb8\x00\x00\x00\x80\xd5T3\xbf\xd6\xd7\
-\xf6\xd2\x09W[\xb9I\x8d\xbc\xbeoX\x00\x00\x00\xc0\
-j\xaa\x99w\xd6\xcc\x1d\xfa\x1a_:\xa1j\xe6\x89}\
-\xa3\x02\x00\x00\x00V[\xcd\xfca\x9d\x9b\xcb\xf7u\xbe\
-\xf4\x11\xab\x99\xbb\xd6\xcc\x7f\xf7\x0d\x0a\x00\x00\x00X}\
-5\xf3}}\xad/]d\xcb#\xf9\xc4\x9ayn\xdf\
-\x90\x00\x00\x00\x80\xf5P3/\xac\x99k\xf55\xbft\
-\xdc\x96#\xf7\xe8\x1b\x11\x00\x00\x00\xb0fF~\xb6\xaf\
-\xf9\xa5c\xaaE>\xbdf\x16\xc7l@\x00\x00\x00\xc0\
-Z\xa9\x91W\xd79\xf9\xfc\xbe\xf6\x97>\xac\x9a\xf9\xa1\
-\xbe\xf1\x00\x00\x00\x00\xeb\xa9\x16yp_\xfbK\x1f\xa8\
-\x16\xf9\x8c\x1a9\xbfo8\x00\x00\x00\xc0z\xaa\x99\xd7\
-\xd4\x22\xd7\xeb3\x00\xe9h5s\xdf\xbe\xd1\x00\x00\x00\
-\x00kn\x91\x87\xf7\x19\x80\xb4}V\xd05j\xe4\xcf\
-\x8f\xd9`\x00\x00\x00\x80\xb5V3\xaf\xadE\xbe\xb4\xcf\
-\x02t\xc0[\x8e\xfcd\xdfX\x00\x00\x00\x80\xcdP#\
-\x8f\xea\xb3\x00\x1d\xe0j\xe6Z5\xf2\x92\xbe\xa1\x00\x00\
-\x00\x00\x9b\xa1f\xdeX\x8b\xdc\xb0\xcf\x04t@\xab\x91\
-\x07\xf4\x8d\x04\x00\x00\x00\xd8,5rF\x9f\x09\xe8\x00\
-V\xe7\xe4\xba5\xf2\x8a\xbe\x81\x00\x00\x00\x00\x9b\xa5f\
-\xdeR[\xb9I\x9f\x0d\xe8\x80\xb5\x1c\xf9\xd9\xbeq\x00\
-\x00\x00\x00\x9b\xa9F\x1e\xdbg\x03:@\xd59\xf9\xfc\
-\x1ayu\xdf0\x00\x00\x00\x80\xcdT#o\xad\xad\xdc\
-\xa2\xcf\x08t@\xaaE\x1e\xdc7\x0a\x00\x00\x00`\xb3\
-\xd5\xc8\xaf\xf7\x19\x81\x0e@\xb5\xc8\xf5j\xe65}\x83\
-\x00\x00\x00\x006\xde\x7f\xd4\x22_\xddg\x05\xda\xf0\x96\
-\x8b<\xfc8\x1b\x03\x00\x00\x00p\x00\xd4\xcc\x93\xfa\xac\
-@\x1b\x5c-\xf2\xa55\xf3\xda\xbe!\x00\x00\x00\x00\x07\
-C\xcd\xfcg-\xf2u}f\xa0\x0d\xadF\x1e\xd57\
-\x02\x00\x00\x00\xe0`\xa9\x99\xa7\xf4\x99\x816\xb0Z\xe4\
-\x865\xf3\xc6\xbe\x01\x00\x00\x00\x00\x07K\xcd\xfc\xf7r\
-\xe4\xf6}v\xa0\x0d\xabF\xce\xe8/>\x00\x00\x00p\
-0\xd5\xcc\xef\xf5\xd9\x816\xa8\xda\xcaMj\xe6-\xfd\
-\x85\x07\x00\x00\x00\x0e\xa6\x9a\xf9\xdf\x1a\xb9s\x9f!h\
-C\xaa\x91\xc7\xf6\x17\x1d\x00\x00\x008\xf0\xce\x5c>0\
-\x97\xe8s\x04\xady\xb5\x95[\xd4\xc8[\x8f\xf3\x82\x03\
-\x00\x00\x00\x07\x5c\x8d|c\x9f%h\xcd\xab\x91_\xef\
-/4\x00\x00\x00\xc0\xb6\x1ay\xd6\xf2\xcc|L\x9f'\
-hM\xabE\xbez9\xf3\x1f\xfd\x85\x06\x00\x00\x00x\
-\xbf\x1a\xb9[\x9f)hM\xab\x99'\xf5\x17\x18\x00\x00\
-\x00\xe0C\xd5\xccs\x97\x17\xe4\xe3\xfa\x5cAkV\x8d\
-|n\x7fq\x01\x00\x00\x00\x8e\xa7Fn\xd3g\x0bZ\
-\xb3\xfc\x051\x00\x00\x00\xe0D\xd5\xcc3\xfalAk\
-T\xcd\x5c\xbfF\xfe\xb1\xbf\xb0\x00\x00\x00\x00\xc7S3\
-\xef\xa9\xad|]\x9f1hM\xaaE\x1e\xdc_T\x00\
-\x00\x00\x80\x8f\xa4f\x9e\xd0g\x0cZ\x83j\xe4\x9a5\
-\xf2\x97\xfd\x05\x05\x00\x00\x00\xf8Hj\xe4_\xeaPn\
-\xd8g\x0dZ\xf1j\xe6\xbe\xfd\xc5\x04\x00\x00\x008\x11\
-5\xf2\x0b}\xd6\xa0\x15\xae\xce\xce'\xd7\xcc\x91\xfeB\
-\x02\x00\x00\x00\x9c\x88\x1a\xf9\x9b\x9a\xb9N\x9f9hE\
-\xab\xad\xdc\xab\xbf\x88\x00\x00\x00\x00'\xa3F\xee\xd7g\
-\x0eZ\xc1\x96\xcb\x5c\xa2F\x9e\xd3_@\x00\x00\x00\x80\
-\x93Q3/Z\x8e\x5c\xa9\xcf\x1e\xb4b\xd5\xcc\x1d\xfb\
-\x8b\x07\x00\x00\x00p*j\xe4{\xfa\xecA+V\xcd\
-<\xa5\xbfp\x00\x00\x00\x00\xa7\xa2f\x9e\xbf\x1c\xb9t\
-\x9f?hE\xaa\x99\x9b\xd5\xc8\xdb\xfb\x0b\x07\x00\x00\x00\
-p\xaaj\x91o\xe83\x08\xadH5rF\x7f\xc1\x00\
-\x00\x00\x00NGm\xe5\xf7\xfb\x0cB+P\xcd|Q\
-\xcd\xbc\xae\xbf`\x00\x00\x00\x00\xa7\xa3F\xdeU\x8b\xdc\
-\xaa\xcf\x22\xb4\xcf-G~\xb6\xbfX\x00\x00\x00\x00;\
-\xa1f~\xad\xcf\x22\xb4\x8f-G\xae^#/\xeb/\
-\x14\x00\x00\x00\xc0N\xa8\x99\x7f\xacs\xf2\xa5}&\xa1\
-}\xaaf~\xa8\xbfH\x00\x00\x00\x00;\xa9F\x1e\xd2\
-g\x12\xda\x87\x96g\xe7\x0a53\xfa\x0b\x04\x00\x00\x00\
-\xb0\x93j\xe4U5s\xad>\x9b\xd0\x1eW[\xf9\xb6\
-\xfe\xe2\x00\x00\x00\x00\xec\x86Z\xe4G\xfblB{\x5c\
-\x8d<\xab\xbf0\x00\x00\x00\x00\xbb\xa1F\xce]\x8e|\
-J\x9fOh\x8f\xaa\x99\xdb\xd5\xcc\xff\xf5\x17\x06\x00\x00\
-\x00`\xb7\xd4\xc8w\xf4\x19\x85\xf6\xa8\x1a\xf9\xcd\xfe\x82\
-\x00\x00\x00\x00\xec\xa6\x9ay\xeer\xe4R}N\xa1]\
-\xaefn\x5c#\xff\xd6_\x10\x00\x00\x00\x80\xddV\x8b\
-\xdc\xa9\xcf*\xb4\xcb\xd5\xc8\xa3\xfa\x0b\x01\x00\x00\x00\xb0\
-\x17j\xe6)}V\xa1]\xacF>\xb7f\xfe\xae\xbf\
-\x10\x00\x00\x00\x00{\xa1F\xdeQ\x8b\xdc\xbc\xcf,\xb4\
-K\xd5\xc8\x03\xfa\x8b\x00\x00\x00\x00\xb0\x97j\xe6q}\
-f\xa1]\xa8^\x94\x8f\xaf\x91\xf3\xfa\x0b\x00\x00\x00\x00\
-\xb0\x97\xb6\x7fk\xa9f\xae\xd5g\x17\xda\xe1j\xe6\xae\
-\xfd\xc9\x07\x00\x00\x00\xd8\x0f5\xf2\x03}v\xa1\x1d\xae\
-f\x9e\xd4\x9fx\x00\x00\x00\x80\xfdP#\x7f\xd2g\x17\
-\xda\xc1\xeaP\xbe\xa0F\xde\xdc\x9fx\x00\x00\x00\x80\xfd\
-P#\xffW\x8b\xdc\xaa\xcf0\xb4C\xd5V~\xa2?\
-\xe9\x00\x00\x00\x00\xfb\xa9f\x1e\xddg\x18\xda\x81\x96#\
-\x97\xae\xad\x8c\xfe\x84\x03\x00\x00\x00\xec\xa7\x1ayu\x1d\
-\xca\xd5\xfa,C\xa7\xd9r\xe4\xf6\xfd\xc9\x06\x00\x00\x00\
-X\x05\xb5\x95\xef\xee\xb3\x0c\x9df5\xf3\xb8\xfeD\x03\
-\x00\x00\x00\xac\x82\x1ayV\x9fe\xe84Z\x8e\x5c\xbb\
-f^\xdb\x9fh\x00\x00\x00\x80UP#\xef\xaa\xc3\xb9\
-I\x9fi\xe8\x14\xab\x91\x1f\xeeO2\x00\x00\x00\xc0*\
-\xa9\x99\x87\xf5\x99\x86N\xa1\xe52\x1fU3/\xe8O\
-0\x00\x00\x00\xc0*\xa9\x99\x97.G\xae\xd4g\x1b:\
-\xc9j\xe6\xd6\xfd\xc9\x05\x00\x00\x00XI#\xf7\xe8\xb3\
-\x0d\x9dd5r\xc61O,\x00\x00\x00\xc0\x0a\xaa\x99\
-\xa7\xf5\xd9\x86N\xa2\xe5\xd9\xf9\xcc\x1a\xf9\x9b\xfe\xc4\x02\
-\x00\x00\x00\xac\xa8\xff\xa8\x99\x1b\xf4\x19\x87N\xb0\x9a\xf9\
-\xbe\xe3<\xa9\x00\x00\x00\x00+\xabF~\xae\xcf8t\
-\x82\xd5\xc8s\xfa\x13\x0a\x00\x00\x00\xb0\xcaj\xe4\xcf\x96\
-G\xf2\x89}\xce\xa1\x8b\xa9\x16\xb9y\x8d\xbc\xa7?\xa1\
-\x00\x00\x00\x00\xab\xae\x0e\xe5\x9b\xfb\xacC\x17S\xcd\xfc\
-b\x7f\x22\x01\x00\x00\x00\xd6A\xcd<\xa5\xcf:\xf4\x11\
-\xaasr\xe5\x1ayE\x7f\x22\x01\x00\x00\x00\xd6A\xcd\
-\xfcs-r\xbd>\xf3\xd0ET\x8b\xdc\xab?\x89\x00\
-\x00\x00\x00\xeb\xa4f\xee\xdfg\x1e\xba\x88j\xe6\x19\xfd\
-\x09\x04\x00\x00\x00X'5r\xb8\xce\xcae\xfb\xdcC\
-\xad\xe5\xc8\x8dj\xe6\x9d\xfd\x09\x04\x00\x00\x00X7\xb5\
-\x95;\xf5\xd9\x87Z5\xf2\xe0\xfe\xc4\x01\x00\x00\x00\xac\
-\xa3\x9ayb\x9f}\xe8C\xaa\xc3\xb9\xe2r\xe6\x82\xfe\
-\xc4\x01\x00\x00\x00\xac\xa3\x9ayc\x8d|n\x9f\x81\xe8\
-\xc2j\xe4\xee\xfdI\x03\x00\x00\x00Xg5\xf2\xa3}\
-\x06\xa2\x0b\xab\x99\xe7\xf6'\x0c\x00\x00\x00`\x9d\xd5\xcc\
-+\xfb\x0cD\xef\x1b\x04}^\xcd\xfck\x7f\xc2\x00\x00\
-\x00\x00\xd6\xde\x91\xdc\xb2\xcfB\x0e|5\xf2\x03\xc7<\
-Q\x00\x00\x00\x00\x1b\xa0F\x1e\xd2g!\x07\xbe\x1ay\
-V\x7f\xa2\x00\x00\x00\x006A\x8d\x9c\xbf\x1c\xb9t\x9f\
-\x87\x1c\xd8j\xe6\x8bj\xe6m\xfd\x89\x02\x00\x00\x00\xd8\
-\x145s\xeb>\x139\xb0\xd5\xcc}\xfa\x13\x04\x00\x00\
-\x00\xb0Ij\xe4\x17\xfaL\xe4\xc0V#\xcf\xe9O\x10\
-\x00\x00\x00\xc0&\xa9\x91?_\x8e\x5c\xae\xcfE\x0e\x5c\
-5s\xfd\x9ayg\x7f\x82\x00\x00\x00\x006M\xcd\xdc\
-\xb6\xcfF\x0e\x5c5\xf3\xe3\xfd\x89\x01\x00\x00\x00\xd8D\
-5\xf2\xa8>\x1b9p\xd5\xc8\xf3\xfa\x13\x03\x00\x00\x00\
-\xb0\x89j\xe4%\xcb\x91O\xe8\xf3\x91\x03S\xcd\xdc\xa0\
-f\xde\xdd\x9f\x18\x00\x00\x00\x80MU3w\xe83\x92\
-\x03S\xcd\xdc\xbf?!\x00\x00\x00\x00\x9b\xac\x169\xa3\
-\xcfH\x0eL5\xf2\xa7\xfd\x09\x01\x00\x00\x00\xd8d5\
-\xf2\x8a\xe5\xc8\xa7\xf49\xc9\xc6W37\xae\x99\xf7\xf6\
-'\x04\x00\x00\x00\xe0\x00\xb8K\x9f\x95l|5\xf33\
-\xc7y\x22\x00\x00\x00\x006^\xcd\xfcZ\x9f\x95l|\
-\xb5\x95\xd1\x9f\x08\x00\x00\x00\x80\x83\xa0F^\xbd\x1c\xb9\
-R\x9f\x97ll5s\xb3\xfe$\x00\x00\x00\x00\x1c$\
-5\xf2M}f\xb2\xb1\xd5\xcc\x83\xfa\x13\x00\x00\x00\x00\
-p\x90\xd4\xcc\x13\xfa\xccd#[\x8e\x5c\xaaf\x8e\xf4\
-'\x00\x00\x00\x00\xe0 \xa9\x91\xbf\xad\x91\xab\xf4\xd9\xc9\
-\xc6U3_\xd5\x1f<\x00\x00\x00\xc0AT#w\xef\
-\xb3\x93\x8d\xabf\x1e\xda\x1f8\x00\x00\x00\xc0AT3\
-O\xea\xb3\x93\x8dj9r\xe9\x9aya\x7f\xe0\x00\x00\
-\x00\x00\x07Q\x8d\xfc\xc3r\xe4\xea}\x86\xb21\xd5\xcc\
-\xad\xfb\x83\x06\x00\x00\x008\xc8j\xe4\x9e}\x86\xb21\
-\xd5\xcc/\xf6\x07\x0c\x00\x00\x00p\x90\xd5\xccS\xfa\x0c\
-e#Z\x8e\x5c\xaef^\xdc\x1f0\x00\x00\x00\xc0A\
-V3o\xac\x91k\xf6Y\xca\xdaW3\xb7\xed\x0f\x16\
-\x00\x00\x00\x80\xa3\xbf*\xf6\x9d}\x96\xb2\xf6\xd5\xcc\xa3\
-\xfb\x03\x05\x00\x00\x00\xe0\xe8\xd9A\xbf\xd7g)k\xdf\
-\xf6)O\xfd\x81\x02\x00\x00\x00pt\x18\xf4\xee\xed\xaf\
-\xd8\xe9\xf3\x94\xb5\xad\x16\xb9U\x7f\x90\x00\x00\x00\x00|\
-P-\xf2m}\xa6\xb2\xb6\xd5\xcc\xcf\xf4\x07\x08\x00\x00\
-\x00\xc0\x07\xd5\xcc\xe3\xfaLem\xab\x91\xe7\xf5\x07\x08\
-\x00\x00\x00\xc0\x07\xd5\xccK\xeb\xfc\x5c\xa6\xcfU\xd6\xae\
-\xe5\xc8\xb5k\xe4\xdf\xfb\x03\x04\x00\x00\x00\xe0\xc3\xd5\xcc\
-\xcd\xfale\xedZ\x8e\xdc\xa3?0\x00\x00\x00\x00\x8e\
-U#\xf7\xeb\xb3\x95\xb5\xabF\x1e\xdf\x1f\x18\x00\x00\x00\
-\x00\xc7\xaa\x91g\xf7\xd9\xcaZ\xb5|N>\xaef^\
-\xd6\x1f\x18\x00\x00\x00\x00\xc7\xaa\x91\x7f\xaeC\xf9\xac>\
-cY\x9b\xeaPn\xde\x1f\x14\x00\x00\x00\x00\x17\xad\xb6\
-\xf2-}\xc6\xb26\xd5\xcc\xfd\xfb\x03\x02\x00\x00\x00\xe0\
-\xa2\xd5V~\xb5\xcfX\xd6\xa6\x1ayN\x7f@\x00\x00\
-\x00\x00\x5c\xb4\x9ay\xf1r\xe4R}\xce\xb2\xf2\xd5\xb9\
-\xf9\xac\x1a\xf9\x97\xfe\x80\x00\x00\x00\x00\xb8\x18#7\xea\
-\xb3\x96\x95\xaf\x16\xf9\x96c\x1e\x08\x00\x00\x00\x00\x17\xab\
-F~\xac\xcfZV\xbe\x9a\xf9\xd5\xfe@\x00\x00\x00\x00\
-\xb8x5\xf2\x07}\xd6\xb2\xd2-/\xc8G/G.\
-\xe8\x0f\x04\x00\x00\x00\x80\x8bW#\xff\xb8<\x92\xab\xf6\
-\x99\xcb\xcaV37\xee\x0f\x02\x00\x00\x00\x80\x13W3\
-w\xed3\x97\x95m\xfb\xf7\xda\xfa\x03\x00\x00\x00\x00\xe0\
-\xc4\xd5\xcc\xa3\xfb\xccee\xabE\xfe\xa0?\x00\x00\x00\
-\x00\x00N\x5c\x8d\x9c\xdfg.+Y\x1d\xca\xd5j\xe4\
-\xcd\xfd\x01\x00\x00\x00\x00p\xe2j\xa6j\xe4\xcb\xfb\xec\
-e\xe5\xaa\xad|C\xbf\xf3\x00\x00\x00\x00\x9c\xbc\x1a\xf9\
-\xe1>{Y\xb9j\xe6\x97\xfa\x1d\x07\x00\x00\x00\xe0\xe4\
-\xd5\xcc\xd3\xfa\xece\xe5\xaa\x99\x17\xf6;\x0e\x00\x00\x00\
-\xc0\xc9\xab\x99\xd7\xd5\x22\x9f\xde\xe7/+S\x1d\xc9\x97\
-\xf7;\x0d\x00\x00\x00\xc0\xa9\xabC\xb9c\x9f\xc1\xacL\
-5\xf2#\xfd\x0e\x03\x00\x00\x00p\xeaj\xe6\x17\xfb\x0c\
-fe\xaa\x91\xa7\xf7;\x0c\x00\x00\x00\xc0\xa9\xab\x91\xc3\
-}\x06\xb3\x12\xd5\xb9\xf9\x7f5\xf3\xfa~\x87\x01\x00\x00\
-\x008u5\xf2\x9e\xe5V\xbe\xb8\xcfb\xf6\xbd\x9a\xb9\
-c\xbf\xb3\x00\x00\x00\x00\x9c\xbeZ\xe4\xfb\xfb,f\xdf\
-\xab\xad<\xa2\xdfQ\x00\x00\x00\x00N_\x8d<\xb5\xcf\
-b\xf6\xbd\x9ayi\xbf\xa3\x00\x00\x00\x00\x9c\xbe\x9ay\
-[\x9f\xc5\xecku(\x9fU#\xef\xe8w\x14\x00\x00\
-\x00\x80\x9dQ37\xee3\x99}\xcb\xf7\x05\x01\x00\x00\
-\x00\xec\xaeZ\xe4\xde}&\xb3o\xd5\xcc\x83\xfa\x1d\x04\
-\x00\x00\x00`\xe7\xd4\xcco\xf4\x99\xcc\xbeU#\xcf\xe9\
-w\x10\x00\x00\x00\x80\x1d4rA\x9f\xc9\xecKu~\
->\xa9F\xdep\xcc\x1d\x04\x00\x00\x00`\xc7\xd4\xc8\xff\
-\xd6\xc8\xe7\xf6\xd9\xcc\x9eW\x8b\xdc\xbc\xdf9\x00\x00\x00\
-\x00v^\x8d\xdc\xad\xcff\xf6\xbc\x9a\xb9O\xbfc\x00\
-\x00\x00\x00\xec\xbc\x1ayd\x9f\xcd\xecy5\xf3\x94~\
-\xc7\x00\x00\x00\x00\xd8y5rN\x9f\xcd\xeci\xcbe\
-.Q#\xaf\xe8w\x0c\x00\x00\x00\x80\x9dW3\xffZ\
-#W\xe93\x9a=\xab\x16\xb9^\xbfS\x00\x00\x00\x00\
-\xec\x9e\x1a\xb9M\x9f\xd1\xecY5\xf3\xed\xfd\x0e\x01\x00\
-\x00\x00\xb0{j\xe4\x01}F\xb3g\xd5\xcc\xaf\xf4;\
-\x04\x00\x00\x00\xc0\xee\xa9\x99g\xf4\x19\xcd\x9eU3\x8b\
-~\x87\x00\x00\x00\x00\xd8=5\xf3\x9a\xe5\xc8\xe5\xfa\x9c\
-f\xd7[\x9e\x9d\xcf\xac\x99\xb7\xf7;\x04\x00\x00\x00\xc0\
-.\x1b\xb9Q\x9f\xd5\xeczu(w<\xe6\x8e\x00\x00\
-\x00\x00\xb0\xebj\xe4\xde}V\xb3\xeb\xd5\xc8\xcf\xf5;\
-\x02\x00\x00\x00\xc0\xee\xab\x99'\xf6Y\xcd\xaeW#\xcf\
-\xeew\x04\x00\x00\x00\x80\xddW3/\xee\xb3\x9a]\xad\
-^\x90O\xaa\x91\xd7\xf7;\x02\x00\x00\x00\xc0\xee\xab\x99\
-\xf7\xd6\xc8\xe7\xf6\x99\xcd\xaeU37\xebw\x02\x00\x00\
-\x00\x80\xbdS\x8b|K\x9f\xd9\xecZ5\xf2#\xfd\x0e\
-\x00\x00\x00\x00\xb0wj\xe6\x11}f\xb3k\xd5\xc8o\
-\xf7;\x00\x00\x00\x00\xc0\xde\xa9\x99\xb3\xfb\xccfWZ\
-.\xf3Q5\xf2\xf2~\x07\x00\x00\x00\x00\xd8;5\xf3\
-\xafu~\xae\xdcg7;^\xcd|Q\xff\xe1\x00\x00\
-\x00\x00\xec\xbdZ\xe4\xeb\xfa\xecf\xc7\xab\x91{\xf6\x1f\
-\x0c\x00\x00\x00\xc0\xde\xab\x99\x9f\xea\xb3\x9b\x1d\xafF\xce\
-\xe8?\x18\x00\x00\x00\x80\xbdW[yF\x9f\xdd\xecx\
-5\xb2\xe8?\x18\x00\x00\x00\x80\xbdW#\x7f[g\xe5\
-\xb2}~\xb3c\xd5\x22\xd7X\xce\xfcG\xff\xc1\x00\x00\
-\x00\x00\xec\x8f\xda\xcaW\xf4\x19\xce\x8e\xb5\x1c\xb9i\xff\
-\x81\x00\x00\x00\x00\xec\xa3\x91{\xf4\x19\xce\x8eU#?\
-r\xcc\x0f\x04\x00\x00\x00`\xdf\xd4\x22\x8f\xec3\x9c\x1d\
-\xabf\x1e\xdf\x7f \x00\x00\x00\x00\xfb\xa7f\x9e\xdbg\
-8;V\xcd\x8c\xfe\x03\x01\x00\x00\x00\xd8?\xdb_\x22\
-\xbd\x5c\xe6\x12}\x8es\xda\xd5\x8b\xf2\xf15\xf2\xe6\xfe\
-\x03\x01\x00\x00\x00\xd8_5s\x9d>\xcb9\xedj\xe6\
-\xfa\xfd\x07\x01\x00\x00\x00\xb0\x02Fn\xdfg9\xa7]\
-\x8d\xdc\xed\x98\x1f\x04\x00\x00\x00\xc0\xbe\xab\x99\x9f\xe8\xb3\
-\x9c\xd3\xaef~\xbe\xff \x00\x00\x00\x00\xf6_\xcd<\
-\xa9\xcfrN\xbb\xe5\xcc\x99\xfd\x07\x01\x00\x00\x00\xb0\xff\
-j\xe4\xbc>\xcb9\xedj\xe4\xe5\xfd\x07\x01\x00\x00\x00\
-\xb0\xffj\xe6\xad\xcb\x91O\xe9\xf3\x9cSn9r\xf5\
-\x9a\xf9\xef\xfe\x83\x00\x00\x00\x00X\x0d\xb5\x95\xaf\xe83\
-\x9dS\xae\xb6\xf2\xd5\xfd\x07\x00\x00\x00\x00\xb0:j\xe6\
-\xdb\xfbL\xe7\x94\xab\x99\x1f\xec?\x00\x00\x00\x00\x80\xd5\
-Q#\xbf\xd0g:\xa7\x5c\x8d<\xb6\xff\x00\x00\x00\x00\
-\x00VG\x8d\xfcQ\x9f\xe9\x9cr5rN\xff\x01\x00\
-\x00\x00\x00\xac\x8e\x9a\xf9\xab>\xd39\xa5\x96\x17\xe4\xe3\
-j\xe6\x8d\xfd\x07\x00\x00\x00\x00\xb0:j\xa4j\xe6Z\
-}\xb6s\xd2\xd5\xcc\x17\xf5\x1b\x07\x00\x00\x00`\xf5\xd4\
-\xc8m\xfal\xe7\xa4\xab\x91o\xec7\x0c\x00\x00\x00\xc0\
-\xea\xa9\x99\xfb\xf6\xd9\xceIW3\x0f\xec7\x0c\x00\x00\
-\x00\xc0\xea\xa9\x99'\xf4\xd9\xceIW3\xbf\xd7o\x18\
-\x00\x00\x00\x80\xd5S#\x8b>\xdb9\xe9j\xe4/\xfa\
-\x0d\x03\x00\x00\x00\xb0zj\xe6\x9f\x96#\x9f\xd0\xe7;\
-'\x5c\x8d\x5c\xa5f\xfe\xb3\xdf0\x00\x00\x00\x00\xab\xa9\
-\xb6\xf2e}\xc6s\xc2\xd5Vn\xd1o\x10\x00\x00\x00\
-\x80\xd5U3\xdf\xdag<'\x5c\xcd|_\xbfA\x00\
-\x00\x00\x00VW\x8d<\xa4\xcfxN\xb8\x1a9\xa3\xdf\
- \x00\x00\x00\x00\xab\xabF\x9e\xd9g<'\x5c\x8d\xbc\
-\xa0\xdf \x00\x00\x00\x00\xab\xabf^\xd9g<'T\
-=/\x1f[3\xaf\xed7\x08\x00\x00\x00\xc0\xea\xaa\x91\
-\xf7,\xcf\xceg\xf6Y\xcf\xc5V\xe7\xe4\xf3\xfb\x8d\x01\
-\x00\x00\x00\xb0\xfaj\xe6\xd6}\xd6s\xb1-Gn\xdf\
-o\x08\x00\x00\x00\x80\xd5W#\xf7\xee\xb3\x9e\x8b\xadF\
-~\xb8\xdf\x10\x00\x00\x00\x00\xab\xafF\x1e\xd9g=\x17\
-\xdb\xf6?\xea7\x04\x00\x00\x00\xc0\xea\xab\x99\xa7\xf5Y\
-\xcf\xc5V#O\xef7\x04\x00\x00\x00\xc0\xea\xab\x91\xf3\
-\xfa\xac\xe7b\xdb\xfeG\xfd\x86\x00\x00\x00\x00X}5\
-\xf3\xfa>\xeb\xb9\xd8\xb6\xffQ\xbf!\x00\x00\x00\x00V\
-_\x8dT\x9d\x93+\xf7y\xcfEV\xe7\xe7\xca\xdb\xff\
-\xa8\xdf\x10\x00\x00\x00\x00\xeb\xa1F\xbe\xbc\xcf|.\xb2\
-\xed+\xf7\x1b\x00\x00\x00\x00`}\xd4\xc8\x9d\xfb\xcc\xe7\
-\x22\xdb\xber\xbf\x01\x00\x00\x00\x00\xd6G\x8d\xfcH\x9f\
-\xf9\x5cd\xdbW\xee7\x00\x00\x00\x00\xc0\xfa\xa8\x91G\
-\xf5\x99\xcfE\xb6}\xe5~\x03\x00\x00\x00\x00\xac\x8fZ\
-\xe4\xe9}\xe6s\x91-g\xce\xec7\x00\x00\x00\x00\xc0\
-\xfa\xa8\x91\xf3\xfb\xcc\xe7\x22\xdb\xber\xbf\x01\x00\x00\x00\
-\x00\xd6G\x8d\xbc\xa1\xcf|.\xb2\x9ayC\xbf\x01\x00\
-\x00\x00\x00\xd6K\x8d\x5c\xa5\xcf}\x8ei\xfbJ\xfd\x1f\
-\x02\x00\x00\x00\xb0~j\xe6\x06}\xf6sL\xdbW\xea\
-\xff\x10\x00\x00\x00\x80\xb5t\x97>\xfb9\xa6\xed+\x1d\
-\xe7\x1f\x02\x00\x00\x00\xb0fj+\xf7\xe9\xb3\x9fc\xaa\
-\x99\xfb\xf4\x7f\x08\x00\x00\x00\xc0\xfa\xa9\x99G\xf7\xd9\xcf\
-1m_\xa9\xffC\x00\x00\x00\x00\xd6\xd2\x99}\xf6s\
-L\xb5\x95g\x1c\xe7\x1f\x02\x00\x00\x00\xb0fj\xe6\x85\
-}\xf6sL\xdbW\xea\xff\x10\x00\x00\x00\x80\xf5S3\
-o\x5c.\xf3Q}\xfe\xf3\x81\xb6/<z\xa5\xe3\xfc\
-c\x00\x00\x00\x00\xd6O-\xf2\x19}\x06\xf4\x81\xb6/\
-\xec\xff\x00\x00\x00\x00\x80\xf5U\x87r\xc3>\x03\xfa@\
-\xdb\x17\xf6\x7f\x00\x00\x00\x00\xc0\xfa\xaa\x99\xbb\xf6\x19\xd0\
-\x07\xda\xbe\xb0\xff\x03\x00\x00\x00\x00\xd6Wm\xe5\xbe}\
-\x06\xf4\x81\xb6/\xec\xff\x00\x00\x00\x00\x80\xf5U3\xbf\
-\xd4g@\x1fh\xfb\xc2\xfe\x0f\x00\x00\x00\x00X_5\
-\xf3\x8c>\x03\xfa@5\xf2\xcc\xfe\x0f\x00\x00\x00\x00X\
-_5\xf3\xa2>\x03\xfa@\xdb\x17\xf6\x7f\x00\x00\x00\x00\
-\xc0\xfa\xaa\x997-\x1f\x98K\xf49\xd0\xd1j\xe6\x9d\
-\xfd\x1f\x00\x00\x00\x00\xb0\xe6F>\xa1\xcf\x81R\xe7\xe6\
-\xf25\xf2\x9ec\xae\x0c\x00\x00\x00\xc0Z\xabC\xf9\x9c\
->\x0b\xcar\xe4\xea\xfd\x8a\x00\x00\x00\x00\xac\xbf\x9a\xb9\
-q\x9f\x05\xa5\xce\xc9\xf5\xfa\x15\x01\x00\x00\x00X\x7f\xb5\
-\xc8\xd7\xf7Y\xd0\xf6\x99A\xb7\xecW\x04\x00\x00\x00`\
-\xfd\xd5\xc8=\xfb,h\xfb\xcb\xa3\xef\xda\xaf\x08\x00\x00\
-\x00\xc0\xfa\xab\x99\xfb\xf6YPj\xe4{\xfa\x15\x01\x00\
-\x00\x00X\x7f5\xf3\xd0>\x0b\xda>3\xe8\xfe\xfd\x8a\
-\x00\x00\x00\x00\xac\xbf\x1ay|\x9f\x05\xa5\x16yd\xbf\
-\x22\x00\x00\x00\x00\x1b\xe1\xcc>\x0b\xda>3\xe8I\xc7\
-\xb9\x22\x00\x00\x00\x00k\xaef\xce\xe9\xb3\xa0\xed\xef\x0c\
-zv\xbf\x22\x00\x00\x00\x00\xeb\xafF^\xd2gA\xdb\
-g\x06\x1d\xe9W\x04\x00\x00\x00`\xfd\xd5\xcc\xeb\xfa,\
-h\xfb\xcc\xa0W\xf5+\x02\x00\x00\x00\xb0\xfej\xe4\x1d\
-\xcb3\xf31\x1f>\x0c\x9ayK\xbf\x22\x00\x00\x00\x00\
-\x1bb\xe4J\x1f\x18\x04-G.W#\xffs\xcc\x95\
-\x00\x00\x00\x00\xd8\x08u8\xd7\xfd\xe0YA\x87r\xb5\
-~\x05\x00\x00\x00\x006\xc8\xc8\x8d>8\x0c\x9a\xf9\xa2\
-c\xae\x00\x00\x00\x00\xc0\xc6\xa8\x99\xdb}p\x18\xb4\x95\
-[\xf4+\x00\x00\x00\x00\xb0A\x16\xb9\xc7\x07\x86A\xcb\
-\x99\xbb\x1cs\x05\x00\x00\x00\x006F\xcd\xdc\xe7\x83g\
-\x06-\xf2\xdd\xfd\x0a\x00\x00\x00\x00l\x8e\x1ay\xc8\x07\
-\x87A#\xf7\xebW\x00\x00\x00\x00`s\xd4V\x1e\xf7\
-\xc1a\xd0\xcc#\xfa\x15\x00\x00\x00\x00\xd8\x1c5\xf2\xf4\
-\x0f=3\xe87\xfb\x15\x00\x00\x00\x00\xd8\x1c5s\xf6\
-\x87\x9e\x19\xf4\x87\xfd\x0a\x00\x00\x00\x00l\x8e\x1a\xf9\x8b\
-\x0f=3\xe8p\xbf\x02\x00\x00\x00\x00\x9b\xa3f^\xfb\
-\xa1\xc3\xa0\xbf\xecW\x00\x00\x00\x00`s\xd4\xcc\xdb\x97\
-\x17\xe4\xa3\xdf?\x0czs\xbf\x02\x00\x00\x00\x00\x9b\xa5\
-\xce\xc9\xa7\xa5^\x96\xcb\xd6\xcc\x7f\xf7\x0b\x01\x00\x00\x00\
-\xd8,5s\x9d,\xcf\xceU\xfb\x05\x00\x00\x00\x00l\
-\x9e:\x9c\xaf\xc8r\xe4\xda\xfd\x02\x00\x00\x00\x006\xd0\
-\xc8-\xb7\xff\xac\xfc\x0d\x8e\xb9\x00\x00\x00\x00\x80\x8dS\
-#\xdf\x98Z\xe4\xe6\xfd\x02\x00\x00\x00\x006O\x8d\xdc\
-s\xfb/\x89\xdd\xa6_\x00\x00\x00\x00\xc0\xe6\xa9\xad|\
-\x7f\x963w\xe9\x17\x00\x00\x00\x00\xb0yj\xe4G\xb7\
-\xbf3\xe8[\xfb\x05\x00\x00\x00\x00l\x9e\x1a\xf9\xe9\xed\
-_\x13\xfb\x9e~\x01\x00\x00\x00\x00\x9b\xa7\xb6\xf2\xb0\xed\
-a\xd0\x8f\xf4\x0b\x00\x00\x00\x00\xd8<5\xf2\xcb\xdb\xbf\
-&v\xff~\x01\x00\x00\x00\x00\x9b\xa7F~}\xfb\xcc\
-\xa0\x07\xf7\x0b\x00\x00\x00\x00\xd8<\xb5\x95\xdf\xd9\x1e\x06\
-=\xaa_\x00\x00\x00\x00\xc0\xe6\xa9\x91gn\xff\x9a\xd8\
-\xaf\xf5\x0b\x00\x00\x00\x00\xd8<5\xf2'Y\x8e\xfcV\
-\xbf\x00\x00\x00\x00\x80\xcdS3c\xfb\xd7\xc4\x9e\xde/\
-\x00\x00\x00\x00`\xf3\xd4\xcc\x8bR[yn\xbf\x00\x00\
-\x00\x00\x80\xcdS3/\xdf\xfe\xce\xa0\xd1/\x00\x00\x00\
-\x00`\xf3\xd4\xcck\xb7\x87A\x8b~\x01\x00\x00\x00\x00\
-\x9b\xa7F^\xbf\xfd\x9dA\xe7\xf5\x0b\x00\x00\x00\x00\xd8\
-<5\xf3\xa6\xeda\xd0\x8b\xfa\x05\x00\x00\x00\x00l\x9e\
-\x9ay\xcb\xf6\xaf\x89\xbd\xb8_\x00\x00\x00\x00\xc0\xe6\xa9\
-\x91\x7f\xd9>3\xe8%\xfd\x02\x00\x00\x00\x006O\x8d\
-\xfc\xfb\xf6\x99A/\xef\x17\x00\x00\x00\x00\xb0yj\xe4\
-\xed\xdb\xc3\xa0\xbf\xec\x17\x00\x00\x00\x00\xb0yj\xe6?\
-\xb7\x7fM\xec\xaf\xfb\x05\x00\x00\x00\x00l\x9e\x9ay\xf7\
-\xf6\x99A\xaf\xe9\x17\x00\x00\x00\x00\xb0yj\xe4=\xdb\
-g\x06\xfdC\xbf\x00\x00\x00\x00\x80\xcdS3\xff\xb7=\
-\x0cz}\xbf\x00\x00\x00\x00\x80\xcd\xb4\xfdkbo\xea\
-\xff\x11\x00\x00\x00\x80\xcd\xb4=\x0czK\xff\x8f\x00\x00\
-\x00\x00l\xa6\xeda\xd0\xbf\xf6\xff\x08\x00\x00\x00\xc0f\
-\xda\x1e\x06\xbd\xb6\xffG\x00\x00\x00\x006\x933\x83\x00\
-\x00\x00\x00\x0e\x90\xed\xbf&\xf6O\xfd?\x02\x00\x00\x00\
-\xb0\x99\xb6\x87A\xff\xd8\xff#\x00\x00\x00\x00\x9bi\xfb\
-\xd7\xc4^\xdf\xff#\x00\x00\x00\x00\x9bi\xfb\xcc\xa0\x7f\
-\xe8\xff\x11\x00\x00\x00\x80\xcdS#\xb5}f\xd0k\xfa\
-\x05\x00\x00\x00\x00l\x9e\x9ay\xef\xf60\xe8\xaf\xfb\x05\
-\x00\x00\x00\x00l\x9e\x9ay\xf7\xf6\xaf\x89\xbd\xaa_\x00\
-\x00\x00\x00\xc0\xe6\xa9\x99\xff\xdc\x1e\x06\xbd\xa2_\x00\x00\
-\x00\x00\xc0\xe6\xa9\x99\xb7o\x0f\x83^\xd2/\x00\x00\x00\
-\x00`\xf3\xd4\xc8\xbfo\x7fg\xd0\x8b\xfb\x05\x00\x00\x00\
-\x00l\x9e\x9a\xf9\xd7\xeda\xd0\x8b\xfa\x05\x00\x00\x00\x00\
-l\x9e\x1a\xf9\xa7\xed_\x13;\xaf_\x00\x00\x00\x00\xc0\
-\xe6\xa9\x997m\x0f\x83\x0e\xf7\x0b\x00\x00\x00\x00\xd8<\
-5\xf3\xfa\xed_\x13\x1b\xfd\x02\x00\x00\x00\x006O\xcd\
-\xbcv{\x18\xf4\xdc~\x01\x00\x00\x00\x00\x9b\xa7F^\
-\x91\xe5\xcc\x99\xfd\x02\x00\x00\x00\x006\xcf\xf6\x1f\x12\xdb\
-\x1e\x06\xfdV\xbf\x00\x00\x00\x00\x80\xcd\xb3\xfduA\xdb\
-\xbf&\xf6\xb8~\x01\x00\x00\x00\x00\x9b\xa7F\x9e\xb7=\
-\x0czt\xbf\x00\x00\x00\x00\x80\xcdS3\xcfL-\xf2\
-\xe0~\x01\x00\x00\x00\x00\x9b\xa7f~g\xfb\xcc\xa0\x9f\
-\xea\x17\x00\x00\x00\x00\xb0yj\xe6\x09\xdb\xc3\xa0\xfb\xf4\
-\x0b\x00\x00\x00\x00\xd8<5rFj\xe4{\xfb\x05\x00\
-\x00\x00\x00l\x9e\x9ay\xd8\xf6w\x06}[\xbf\x00\x00\
-\x00\x00\x80\xcdS3?\xb3\xfdkbw\xed\x17\x00\x00\
-\x00\x00\xb0yj\xe4\xc7\xb6\x87A\xb7\xed\x17\x00\x00\x00\
-\x00\xb0yj\x91\xefO\x1d\xce-\xfa\x05\x00\x00\x00\x00\
-l\x9e\x9a\xf9\xf6\xed\xef\x0c\xbaa\xbf\x00\x00\x00\x00\x80\
-\xcdS#\xdf\x94\xe5\xc8\xb5\xfb\x05\x00\x00\x00\x00l\x9e\
-\x1a\xf9\x9a\xd4\xa1\x5c\xad_\x00\x00\x00\x00\xc0\x06\x1a\xb9\
-Q\xea\xdc\x5c\xbef\xfe\xe7\x98\x0b\x01\x00\x00\x00\xd8(\
-u8\xd7\xcdv5\xf3\x96~!\x00\x00\x00\x00\x1bf\
-\xe4J\xef\x1b\x06\x8d\xbc\xea\x98\x0b\x01\x00\x00\x00\xd8\x18\
-5\xf3\xce\xe5_\xe6c\xde\x7ff\xd0\x91~\x05\x00\x00\
-\x00\x006G\xcd\xbc\xee\xe8 \xe8\xc23\x83\x9e\xdd\xaf\
-\x00\x00\x00\x00\xc0\xe6\xa8\x91\x97|p\x184\xf3\xa4~\
-\x05\x00\x00\x00\x006G\xcd\x9c\xf3\xc1a\xd0\x22\x8f\xec\
-W\x00\x00\x00\x00`\xa3\x9c\xf9\xa1g\x06\xdd\xff8W\
-\x00\x00\x00\x00`C\xd4\xc8\xe3?8\x0c\x1a\xf9\x9e~\
-\x05\x00\x00\x00\x006G\xcd<\xf4C\xcf\x0c\xbak\xbf\
-\x02\x00\x00\x00\x00\x9b\xa3f\xee\xfb\x81a\xd0r\xe4\x96\
-\xfd\x0a\x00\x00\x00\x00l\x8e\x1a\xb9\xe7\x07\xcf\x0c:'\
-\xd7\xebW\x00\x00\x00\x00`s\xd4\x22_\xff\xc1a\xd0\
-y\xb9Z\xbf\x02\x00\x00\x00\x00\x9b\xa3fn\xfc\xc1a\
-\xd0\xb9\xb9|\x8d\xbc\xa7_\x09\x00\x00\x00\x80\xcdP\x87\
-\xf29\x1f\x18\x06\x1d\x1d\x08\x8d\xfcS\xbf\x12\x00\x00\x00\
-\x00\x9b\xa1\x16\xf9\xf4>\x0czu\xbf\x12\x00\x00\x00\x00\
-\xeb\xaff\xdeY\xcf\xcb\xc7~\xf80h\xe6H\xbf\x22\
-\x00\x00\x00\x00\xeb\xafF^\xffa\x83\xa0\xa3\xc3\xa0\x91\
-g\xf7+\x02\x00\x00\x00\xb0\xfej\xe6\xa5}\x16\xb4}\
-f\xd0\x93\xfb\x15\x01\x00\x00\x00X\x7f5r\xa8\xcf\x82\
-\xb6\xcf\x0czT\xbf\x22\x00\x00\x00\x00\xeb\xaf\xb6\xf2\x8c\
->\x0bJm\xe5\xa7\xfa\x15\x01\x00\x00\x00X\x7f5\xf3\
-\xf8>\x0b\xda>3\xe8{\xfb\x15\x01\x00\x00\x00X\x7f\
-5\xf3\xd0>\x0b\xda\xfe\xce\xa0\xbb\xf6+\x02\x00\x00\x00\
-\xb0\xfej\xe4G\xfb,(\xcb\x91[\xf6+\x02\x00\x00\
-\x00\xb0\xfej\xe6\xdb\xfb,(\xb5\xc8\xf5\xfa\x15\x01\x00\
-\x00\x00\xd8\x00#\xb7\xef\xb3\xa0\xed3\x83\xae~\xcc\x15\
-\x01\x00\x00\x00X{u(_\xd9gA\xa9\xe7\xe5\xe3\
-k\xe6=\xfd\xca\x00\x00\x00\x00\xac\xb7:\x92\xcf\xe9\xb3\
-\xa0\xa3\xd5\xcc;\xfb\x95\x01\x00\x00\x00Xs#\x9f\xd0\
-\xe7@G\xab\x99\x17\x1dse\x00\x00\x00\x00\xd6V\xcd\
-\xbci\xf9\xc0\x5c\xa2\xcf\x81\x8eV#\xcf\xec\xff\x00\x00\
-\x00\x00\x80\xf5\xb5}\xf2O\x9f\x01}\xa0\x9a\xf9\xa5\xfe\
-\x0f\x00\x00\x00\x00X_5\xf3\x8c>\x03\xfa@\xb5\x95\
-\xfb\xf6\x7f\x00\x00\x00\x00\xc0\xfa\xda>\xf9\xa7\xcf\x80>\
-P\xcd\xdc\xb5\xff\x03\x00\x00\x00\x00\xd6\xd7\xf6\xc9?}\
-\x06\xf4\x81\xeaPn\xd8\xff\x01\x00\x00\x00\x00\xebk\xfb\
-\xe4\x9f>\x03\xfa@\xb5\xc8g\xf4\x7f\x00\x00\x00\x00\xc0\
-\xfa\xda>\xf9\xa7\xcf\x80>\xd0r\x99\x8f\xaa\x997\xf6\
-\x7f\x04\x00\x00\x00\xc0z\xda>\xf9\xa7\xcf\x80>\xac\x9a\
-ya\xffG\x00\x00\x00\x00\xac\x9f\xa3'\xfd,\xf3Q\
-}\xfe\xf3a\xd5V\x9e\xd1\xff!\x00\x00\x00\x00\xebg\
-\xfb\xa4\x9f>\xfb9\xa6\x9ayt\xff\x87\x00\x00\x00\x00\
-\xac\xa53\xfb\xec\xe7\x98j\xe6>\xc7\xf9\x87\x00\x00\x00\
-\x00\xac\x99\xed\x93~\xfa\xec\xe7\x98\x963w\xe9\xff\x10\
-\x00\x00\x00\x80\xf5S[\xb9O\x9f\xfd\x1cS\xcd\xdc\xa0\
-\xffC\x00\x00\x00\x00\xd6\xd2]\xfa\xec\xe7\x98j\xe4*\
-\xc7\xf9\x87\x00\x00\x00\x00\xac\x99\xed\x93~\xfa\xec\xe7\xb8\
-\xd5\xcc\x1b\xfa?\x06\x00\x00\x00`\xbdl\x9f\xf4\xd3\xe7\
->\xc7\xadF\xce\xef\xff\x18\x00\x00\x00\x80\xf5Q#o\
-\xe83\x9f\x8bl\xfb\xcf\x8e\xf5\x1b\x00\x00\x00\x00`}\
-l\x9f\xec\xd3g>\x17Y\x8d<\xaa\xdf\x00\x00\x00\x00\
-\x00\xeb\xa3\x16yz\x9f\xf9\x5cd5\xf2#\xfd\x06\x00\
-\x00\x00\x00X\x1f\xdb'\xfb\xf4\x99\xcfEV#w\xee\
-7\x00\x00\x00\x00\xc0\xfa\xd8>\xd9\xa7\xcf|.\xb2\x1a\
-\xf9\xf2~\x03\x00\x00\x00\x00\xac\x8f\xed\x93}\xfa\xcc\xe7\
-\x22\xab\xf3s\xe5\x1a\xa9~#\x00\x00\x00\x00\xac\x87\xed\
-\x93}\xfa\xcc\xe7#V3\xaf\xef7\x02\x00\x00\x00\xc0\
-\xea\xdb>\xc9\xa7\xce\xc9\x95\xfb\xbc\xe7#V#\xe7\xf5\
-\x1b\x02\x00\x00\x00`\xf5m\x9f\xe4\xd3g=\x17[\x8d\
-<\xbd\xdf\x10\x00\x00\x00\x00\xabo\xfb$\x9f>\xeb\xb9\
-\xd8j\xe4\x91\xfd\x86\x00\x00\x00\x00X}5\xf3\xb4>\
-\xeb\xb9\xd8j\xe4\x87\xfb\x0d\x01\x00\x00\x00\xb0\xfa\xb6O\
-\xf2\xe9\xb3\x9e\x8bm9r\xfb~C\x00\x00\x00\x00\xac\
-\xbe\x1a\xb9w\x9f\xf5\x5cl5\xf3y\xfd\x86\x00\x00\x00\
-\x00X}u8_\xd3g=\x17[=/\x1f[3\
-\xaf\xed7\x06\x00\x00\x00\xc0\xea\xaa\x91\xf7\xd4\x22\xd7\xe8\
-\xb3\x9e\x13\xaaF^\xd0o\x10\x00\x00\x00\x80\xd5U3\
-\xaf\xec3\x9e\x13\xaeF\xce\xe87\x08\x00\x00\x00\xc0\xea\
-\xaa\x91g\xf6\x19\xcf\x09W3\xdf\xd7o\x10\x00\x00\x00\
-\x80\xd5U#\x0f\xe93\x9e\x13\xae\xb6r\x8b~\x83\x00\
-\x00\x00\x00\xac\xae\x9a\xf9\xd6>\xe39\xe1j\xe4*5\
-\xf3\x9f\xfdF\x01\x00\x00\x00XM\xb5\x95/\xeb3\x9e\
-\x93\xaaF\xfe\xa2\xdf(\x00\x00\x00\x00\xab\xa7f\xfei\
-9\xf2\x09}\xbesR\xd5\xcc\xef\xf5\x1b\x06\x00\x00\x00\
-`\xf5\xd4\xc8\xa2\xcfvN\xba\x9ay`\xbfa\x00\x00\
-\x00\x00VO\xcd<\xa1\xcfvN\xba:\x9co\xec7\
-\x0c\x00\x00\x00\xc0\xea\xa9\x99\xfb\xf6\xd9\xceIW3_\
-\xd4o\x18\x00\x00\x00\x80\xd5S#\xb7\xe9\xb3\x9d\x93\xae\
-\xce\xcaek\xe4\x0d\xfd\xc6\x01\x00\x00\x00X\x1d5\xf3\
-\x7f5s\xad>\xdb9\xa5j\xe4\x9c\xfe\x03\x00\x00\x00\
-\x00X\x1d5\xf2\xea>\xd39\xe5j\xe4\xb1\xfd\x07\x00\
-\x00\x00\x00\xb0:j\xe6\x0f\xfbL\xe7\x94\xab\x99\x1f\xec\
-?\x00\x00\x00\x00\x80\x15\xb2\xc8\xc3\xfbL\xe7\x94\xab\xad\
-|\xf51?\x00\x00\x00\x00\x80\x95Q3\xdf\xdeg:\
-\xa7\xdcr\xe4\xea5\xf2\xdf\xfd\x87\x00\x00\x00\x00\xb0\x1a\
-j+_\xd1g:\xa7U\x8d\xbc\xbc\xff\x10\x00\x00\x00\
-\x00\xf6_\x8d\xbcu9\xf2)}\x9esZ-g\xce\
-\xec?\x08\x00\x00\x00\x80\xfdW#\xe7\xf5Y\xceiW\
-3?\xdf\x7f\x10\x00\x00\x00\x00\xfb\xaff\x9e\xd4g9\
-\xa7]\x1d\xce\xdd\xfa\x0f\x02\x00\x00\x00`\xff\xd5\xccO\
-\xf4Y\xceiW3\xd7\xef?\x08\x00\x00\x00\x80\x150\
-r\xfb>\xcb9\xed\x96g\xe7\x0a5\xf2\xe6c~\x18\
-\x00\x00\x00\x00\xfb\xaaf\xae\xd3g9;R\xcd\x8c\xfe\
-\xc3\x00\x00\x00\x00\xd8?5\xf2\xb7\xcb3s\xc9>\xc7\
-\xd9\x91j\xe6\xf1\xfd\x07\x02\x00\x00\x00\xb0\x7fj\xe6\xb9\
-}\x86\xb3c\xd5\xcc}\xfa\x0f\x04\x00\x00\x00`\xff\xd4\
-\x22\x8f\xec3\x9c\x1dk9r\xd3\xfe\x03\x01\x00\x00\x00\
-\xd8G#\xf7\xe83\x9c\x1d\xab\x16\xb9F\x8d\xbc\xfd\x98\
-\x1f\x0a\x00\x00\x00\xc0\xbe\xa8\xad|E\x9f\xe1\xech5\
-\xb2\xe8?\x14\x00\x00\x00\x80\xbdW3\xaf\xa9\xb3r\xd9\
->\xbf\xd9\xd1j\xe4\x8c\xfe\x83\x01\x00\x00\x00\xd8{5\
-\xf3\x8c>\xbb\xd9\xf1j\xe4\x9e\xfd\x07\x03\x00\x00\x00\xb0\
-\xf7j\xe6\xa7\xfa\xecf\xc7\xab\x99/\xea?\x18\x00\x00\
-\x00\x80\xbdW\x8b|]\x9f\xdd\xecx\xcb\x07\xe6\x125\
-\xf3\xf2\xfe\xc3\x01\x00\x00\x00\xd8;5\xf3\xaf5r\x95\
->\xbb\xd9\x95j\xe6)\xfd\x0e\x00\x00\x00\x00\xb0wj\
-\xe4\x9c>\xb3\xd9\xb5j\xe6>\xfd\x0e\x00\x00\x00\x00\xb0\
-wj\xe4\x91}f\xb3k\xd5\x227\xefw\x00\x00\x00\
-\x00\x80\xbdS#w\xeb3\x9b]\xab\xce\xcf'\xd5\xc8\
-\x1b\xfa\x9d\x00\x00\x00\x00`\xf7\xd5\xcc\xff\xd6\xc8\xe7\xf6\
-\x99\xcd\xaeV#\xcf\xe9w\x04\x00\x00\x00\x80=qA\
-\x9f\xd5\xecz\xb5\x95\x9f?\xce\x1d\x01\x00\x00\x00`\x97\
-\xd5\xcco\xf4Y\xcd\xaeW[\xb9S\xbf#\x00\x00\x00\
-\x00\xec\xbe\x1a\xf9\x81>\xab\xd9\xf5\xeaP>\xabf\xde\
-\xd9\xef\x0c\x00\x00\x00\x00\xbb\xabfn\xdcg5{R\
-\xcd\x1c\xe9w\x06\x00\x00\x00\x80\xddS#\x7f_\xe7\xe6\
-\xf2}N\xb3'\xd5\xcc\xaf\xf6;\x04\x00\x00\x00\xc0\xee\
-\xa9\x91?\xe83\x9a=\xabF\xbe\xa3\xdf!\x00\x00\x00\
-\x00vO\x8d\xfct\x9f\xd1\xecY5\xf2%\xfd\x0e\x01\
-\x00\x00\x00\xb0{\xeaPn\xd7g4{\xd6r\xe4R\
-5\xf3\xca~\xa7\x00\x00\x00\x00\xd8y5\xf3o\xcb#\
-\xb9j\x9f\xd1\xeci5\xf2\xd4~\xc7\x00\x00\x00\x00\xd8\
-y5s\xa8\xcff\xf6\xbc\x1a\xf9\xd1~\xc7\x00\x00\x00\
-\x00\xd8y5\xf3\xe8>\x9b\xd9\xf3\x96Gr\xcb~\xc7\
-\x00\x00\x00\x00\xd8y5\xf3\xad}6\xb3\xe7\xd5\xe1\x5c\
-\xb1f\xde\xd4\xef\x1c\x00\x00\x00\x00;\xa7F\xaa\x0e\xe5\
-\x0b\xfalf_\xaa\x99?\xeew\x10\x00\x00\x00\x80\x9d\
-S#/\xe93\x99}\xabF\x1e\xd2\xef \x00\x00\x00\
-\x00;\xa7\xb6\xf2\xe4>\x93\xd9\xb7\x963w\xe9w\x10\
-\x00\x00\x00\x80\x9dS[\xf9\xa1>\x93\xd9\xb7j\xe6Z\
-5\xf2_\xfdN\x02\x00\x00\x00\xb03\xeapn\xd2g\
-2\xfbZ\xcd\xbc\xb2\xdfI\x00\x00\x00\x00N_\xcd\xbc\
-\xb3\xcfb\xf6\xbd\xed\xbfs\xdf\xef(\x00\x00\x00\x00\xa7\
-\xaff~\xbf\xcfb\xf6\xbd\x9a\xb9k\xbf\xa3\x00\x00\x00\
-\x00\x9c\xbe\x95\xfa\xbe\xa0\xf7\xb7<;W\xad\x997\xf5\
-;\x0b\x00\x00\x00\xc0\xa9\xab\x91\xff\xab\xad|Y\x9f\xc5\
-\xacD5\xf2\xcc~\x87\x01\x00\x00\x008u5r^\
-\x9f\xc1\xacL5\xf2\xa3\xfd\x0e\x03\x00\x00\x00p\xeaj\
-\xe4Q}\x06\xb32-Gn\xd4\xef0\x00\x00\x00\x00\
-\xa7\xae\x0e\xe7\xce}\x06\xb32-\x97\xb9d\x8d\xfcy\
-\xbf\xd3\x00\x00\x00\x00\x9c\xbc\x9ayc\x8d\x5c\xa5\xcf`\
-V\xaa\x9a\xf9\x95~\xc7\x01\x00\x00\x008%g\xf6\xd9\
-\xcb\xcaU#\xdft\x9c;\x0e\x00\x00\x00\xc0I\xaa\x99\
-\xfb\xf4\xd9\xcb\xcaU\x8b\x5c\xa3F\xfe\xa9\xdfy\x00\x00\
-\x00\x00NN-r\xc3>{Y\xc9j\xe4\x8f\xfa\x9d\
-\x07\x00\x00\x00\xe0\xc4\xd5\xcc\x8b\x96\x0f\xcc%\xfa\xdce\
-%\xab\x99\x9f\xe8\x0f\x00\x00\x00\x00\x80\x13W\x8b\xfcr\
-\x9f\xb9\xaclu87\xe9\x0f\x00\x00\x00\x00\x80\x13W\
-#\xdf\xd8g.+[=/\x1f[3\x7f\xd1\x1f\x04\
-\x00\x00\x00\x00\x17\xafF\xde\xbc\x1c\xb9z\x9f\xb9\xact\
-5\xf2\xd8\xfe@\x00\x00\x00\x00\xb8x5\xf2\xac>k\
-Y\xf9j\xe4\xee\xfd\x81\x00\x00\x00\x00p\xf1j\xe6\xc7\
-\xfb\xace\xe5\xab\x99k\xd5\xcc\xbf\xf6\x07\x03\x00\x00\x00\
-\xc0GV\x87\xf2\x95}\xd6\xb2\x16\xd5\xccs\xfb\x83\x01\
-\x00\x00\x00\xe0#\xba`yf>\xa6\xcfY\xd6\xa2\x9a\
-\xf9\xa9\xe3< \x00\x00\x00\x00.B\x8d<\xa6\xcfX\
-\xd6\xa6\xda\xca-\xfa\x03\x02\x00\x00\x00\xe0\xa2\xd5\xc8\xdd\
-\xfa\x8cem\xaa\xb3r\xd9\x1ayy\x7fP\x00\x00\x00\
-\x00\x1c\xabF\xfe\xa5\xce\xcdg\xf5\x19\xcbZU#\xbf\
-\xde\x1f\x18\x00\x00\x00\x00\xc7\xaa\x91\xe7\xf4\xd9\xca\xdaU\
-#\xf7\xec\x0f\x0c\x00\x00\x00\x80c\xd5\xc8\xfd\xfale\
-\xedZ\x8e\x5c\xbbf\xde\xd6\x1f\x1c\x00\x00\x00\x00\x1f\xae\
-fn\xd6g+kY\xcd<\xbf?8\x00\x00\x00\x00\
->\xa8F^V\xe7\xe72}\xae\xb2\x96\xd5V\x1e\xd8\
-\x1f \x00\x00\x00\x00\x1fT3\x8f\xeb3\x95\xb5\xad\x16\
-\xb9U\x7f\x80\x00\x00\x00\x00|P-\xf2m}\xa6\xb2\
-\xd6\xd5\xcc\x1b\xfb\x83\x04\x00\x00\x00\xe0\xe8YA\xef^\
-\x8e\x5c\xae\xcfS\xd6\xba\x9ayt\x7f\xa0\x00\x00\x00\x00\
-\x1c\x1d\x06\xfd^\x9f\xa5\xac}5s\xdb\xfe@\x01\x00\
-\x00\x008\xfa\xe5\xd1\xdf\xd9g)k\xdf\xf6\xa9N5\
-\xf3\xe2\xfe`\x01\x00\x00\x00\x0e\xb2\x1ayC\x8d\x5c\xb3\
-\xcfR6\xa2\x9a\xf9\xc5\xfe\x80\x01\x00\x00\x00\x0e\xb2\x9a\
-yJ\x9f\xa1lL5s\xeb\xfe\x80\x01\x00\x00\x00\x0e\
-\xb2\x1a\xb9g\x9f\xa1lL\xcb\x91K\xd7\xcc\x0b\xfb\x83\
-\x06\x00\x00\x008\x88j\xe4\x1f\x96#W\xef3\x94\x8d\
-\xaaf\x1e\xda\x1f8\x00\x00\x00\xc0AT3O\xea\xb3\
-\x93\x8d\xabf\xbe\xaa?p\x00\x00\x00\x80\x83\xa8F\xee\
-\xdeg'\x1b\xd7r\xe4R5s\xa4?x\x00\x00\x00\
-\x80\x83\xa4F\xfe\xb6F\xae\xd2g'\x1bY\xcd<\xa8\
-?\x01\x00\x00\x00\x00\x07I\xcd<\xa1\xcfL6\xb6\x9a\
-\xb9Y\x7f\x02\x00\x00\x00\x00\x0e\x92\x1a\xf9\xa6>3\xd9\
-\xe8jf\xf4'\x01\x00\x00\x00\xe0 \xa8\x91W/G\
-\xae\xd4\xe7%\x1b]\xcd\xfcL\x7f\x22\x00\x00\x00\x00\x0e\
-\x82Z\xe4\xb1}V\xb2\xf1\xd5\xcc\x8dk\xe6\xbd\xfd\xc9\
-\x00\x00\x00\x008\x00\xee\xd2g%\x07\xa2\xda\xca\xd9\xc7\
-y2\x00\x00\x00\x006V\x8d\xbcb9\xf2)}N\
-r \xaa\x99\xfb\xf7'\x04\x00\x00\x00`\x93\xd5\xc8\x19\
-}Fr`\xaa\x99\x1b\xd4\xcc\xbb\xfb\x93\x02\x00\x00\x00\
-\xb0\xa9j\xe6\x0e}Fr\xa0\xaa\xad<\xbf?)\x00\
-\x00\x00\x00\x9b\xa8F^\xb2\x1c\xf9\x84>\x1f9P\xd5\
-\xcc\x8f\xf7'\x06\x00\x00\x00`\x13\xd5\xc8\xa3\xfal\xe4\
-\xc0U3\xd7\xaf\x99w\xf6'\x07\x00\x00\x00`\xd3\xd4\
-\xccm\xfbl\xe4@V#\xcf\xe9O\x0e\x00\x00\x00\xc0\
-&\xa9\x91?_\x8e\x5c\xae\xcfE\x0ed5s\x9f\xfe\
-\x04\x01\x00\x00\x00l\x92Z\xe4\x17\xfaL\xe4\xc0V3\
-_T3o\xebO\x12\x00\x00\x00\xc0\xa6\xa8\x99[\xf7\
-\x99\xc8\x81\xaeF\x9e\xd5\x9f$\x00\x00\x00\x80MP#\
-\xe7/G.\xdd\xe7!\x07\xba\x9a\xf9\xc1\xfeD\x01\x00\
-\x00\x00l\x82\x9ayh\x9f\x85\x1c\xf8j\xe6\xf3j\xe6\
-_\xfb\x93\x05\x00\x00\x00\xb0\xeej\xe6\xab\xfa,D\xef\
-\xfbU\xb1\xdf\xedO\x16\x00\x00\x00\xc0:\xab\x91s\x96\
-#\x97\xeas\x10\xbdo\x18t\xf7\xfe\x84\x01\x00\x00\x00\
-\xac\xb3\x1a\xf9\xd1>\x03\xd1\x85\xd5\xe1\x5cq9sA\
-\x7f\xd2\x00\x00\x00\x00\xd6Q\xcd\xbc\xb1F>\xb7\xcf@\
-\xf4!\xd5\xc8\x83\xfb\x13\x07\x00\x00\x00\xb0\x8ej\xe6\x89\
-}\xf6\xa1\xd6r\xe4F5\xf3\xce\xfe\xe4\x01\x00\x00\x00\
-\xac\x9b\xda\xca\x9d\xfa\xecC\xc7\xa9f\x9e\xd1\x9f<\x00\
-\x00\x00\x80uR#\x87\xeb\xac\x5c\xb6\xcf=t\x9cj\
-\x91{\xf5'\x10\x00\x00\x00`\x9d\xd4\xcc\xfd\xfb\xccC\
-\x17Q\x9d\x93+\xd7\xcc+\xfb\x93\x08\x00\x00\x00\xb0\x0e\
-j\xe6\x9fk\x91\xeb\xf5\x99\x87>B\xb5\x95G\xf4'\
-\x12\x00\x00\x00`\x1d\xd4\x22\xbf\xddg\x1d\xba\x98j\x91\
-\x9b\xd7\xc8{\xfa\x93\x09\x00\x00\x00\xb0\xeaj\xe4\x9b\xfa\
-\xacC'P\x8d<\xa7?\x99\x00\x00\x00\x00\xab\xacF\
-\xfely$\x9f\xd8\xe7\x1c:\x81j\xe6\xfb\xfa\x13\x0a\
-\x00\x00\x00\xb0\xcaj\xe4\xe7\xfa\x8cC'\xd8\xf2\xec|\
-f\x8d\xfcM\x7fR\x01\x00\x00\x00V\xd4\x7f\xd4\xcc\x0d\
-\xfa\x8cC'Q\x8d\x9cq\x9c'\x16\x00\x00\x00`\xe5\
-\xd4\xc8\xd3\xfalC'Y\xcd\xdc\xba?\xb1\x00\x00\x00\
-\x00+i\xe4\x1e}\xb6\xa1\x93l\xb9\xccG\xd5\xcc\x0b\
-\x8eyr\x01\x00\x00\x00VH\xcd\xbct9r\xa5>\
-\xdb\xd0)T\x8b\xfcp\x7f\x82\x01\x00\x00\x00VI\xcd\
-<\xac\xcf4t\x8a-G\xae]#\xaf\xebO2\x00\
-\x00\x00\xc0*\xa8\x99w\xd7\xe1\xdc\xa4\xcf4t\x1a\xd5\
-\xc8\xe3\xfb\x13\x0d\x00\x00\x00\xb0\x0aj\xe4Y}\x96\xa1\
-\xd3l9r\xfb\xfeD\x03\x00\x00\x00\xac\x88\xef\xea\xb3\
-\x0c\x9df\xf5\xb7\xf9\xd8\x9a\x19\xc7y\xb2\x01\x00\x00\x00\
-\xf6M\x8d\xbczy$W\xed\xb3\x0c\xed@\xb5\x95\x9f\
-\xe8O8\x00\x00\x00\xc0~\xaa\x99G\xf7\x19\x86v\xa8\
-:\x94/\xa8\x917\xf7'\x1d\x00\x00\x00`?\xd4\xcc\
-\xff\xd5\xa1\xdc\xaa\xcf0\xb4\x83\xd5\xcc\x93\xfa\x13\x0f\x00\
-\x00\x00\xb0\x1fj\xe4O\xfa\xecB;\x5c\xcd\xdc\xb5?\
-\xf1\x00\x00\x00\x00\xfb\xa1F~\xa0\xcf.\xb4\xc3\xd5\x8b\
-\xf2\xf15s^\x7f\xf2\x01\x00\x00\x00\xf6R\xcd\xfc]\
-\xcd\x5c\xab\xcf.\xb4\x0b\xd5\xc8\x03\xfa\x0b\x00\x00\x00\x00\
-\xb0\x97j\xe6q}f\xa1]\xaaF>\xb7F\xfe\xae\
-\xbf\x08\x00\x00\x00\x00{\xa1F\xdeQ\x8b\xdc\xbc\xcf,\
-\xb4\x8b\xd5\x22\x8f\xec/\x04\x00\x00\x00\xc0^\xa8\x99\xa7\
-\xf4Y\x85v\xb9\x9a\xb9q\xcd\xbc\xb5\xbf\x18\x00\x00\x00\
-\x00\xbb\xad\xb6r\xa7>\xab\xd0\x1eT#\xbf\xd9_\x0c\
-\x00\x00\x00\x80\xddT3\xcf].s\xc9>\xa7\xd0\x1e\
-T\x87r\xbb\x9a\xf9\xbf\xfe\xa2\x00\x00\x00\x00\xec\x96\x1a\
-\xf9\x8e>\xa3\xd0\x1eV#\xcf\xea/\x0a\x00\x00\x00\xc0\
-n\xa8\x91s\x97#\x9f\xd2\xe7\x13\xda\xc3j\xe6[\xfb\
-\x0b\x03\x00\x00\x00\xb0\x1bj\x91\x1f\xed\xb3\x09\xedq\xcb\
-\xb3s\x85\x1a\xd9\xea/\x0e\x00\x00\x00\xc0N\xaa\x99\xbf\
-\xac\x99k\xf5\xd9\x84\xf6\xa1\x9a\xf9\xa1\xfe\x02\x01\x00\x00\
-\x00\xec\xa4\x1ayH\x9fIh\x9fZ\x8e\x5c\xbdf^\
-\xda_$\x00\x00\x00\x80\x9dP#\xffX\xe7\xe4K\xfb\
-LB\xfb\xd8r\xe4g\xfb\x0b\x05\x00\x00\x00\xb0\x13j\
-\xe6\xd7\xfa,B\xfb\xdcr\xe4\x0bk\xe6u\xfd\xc5\x02\
-\x00\x00\x008\x1d5\xf2\xaeZ\xe4V}\x16\xa1\x15\xa8\
-F\xce\xe8/\x18\x00\x00\x00\xc0\xe9\xa8\x99\xdf\xeb3\x08\
-\xadH5s\xb3\x1ay{\x7f\xd1\x00\x00\x00\x00NU\
--\xf2\x0d}\x06\xa1\x15\xaaF~\xbb\xbfh\x00\x00\x00\
-\x00\xa7\xa2f\x9e\xbf\x1c\xb9t\x9f?h\x85\xaa\x99;\
-\xf6\x17\x0e\x00\x00\x00\xe0T\xd4\xc8\xf7\xf4\xd9\x83V\xac\
-\xe5\x99\xb9d\x8d<\xa7\xbfx\x00\x00\x00\x00'\xa3f\
-^\xb4\x1c\xb9R\x9f=h\x05\xab\xad\xdc\xab\xbf\x80\x00\
-\x00\x00\x00'\xa3F\xee\xd7g\x0eZ\xd1\xea\xec|r\
-\xcd\x1c\xe9/\x22\x00\x00\x00\xc0\x89\xa8\x91\xbf\xa9\x99\xeb\
-\xf4\x99\x83V\xb8\x9a\xb9o\x7f!\x01\x00\x00\x00ND\
-\x8d\xfcB\x9f5h\xc5\xab\x91k\xd6\xcc+\xfb\x8b\x09\
-\x00\x00\x00\xf0\x91\xd4\xcc?\xd7\x227\xec\xb3\x06\xadA\
-5\xf2\xe0\xfe\x82\x02\x00\x00\x00|$5\xf3\x84>c\
-\xd0\x9aT3\xd7\xaf\x997\xf5\x17\x15\x00\x00\x00\xe0x\
-j\xe4=\xb5\x95\xaf\xeb3\x06\xadQ5\xf2\xd8\xfe\xc2\
-\x02\x00\x00\x00\x1cO\xcd<\xa3\xcf\x16\xb4f\xd5\xc8\xe7\
-\xf6\x17\x16\x00\x00\x00\xe0xj\xe46}\xb6\xa05\xac\
-f\x9e\xd4_\x5c\x00\x00\x00\x80\x0fU3\xcf]^\x90\
-\x8f\xebs\x05\xada5\xf25\xcb\x99\xff\xe8/2\x00\
-\x00\x00\xc0\xfb\xd5\xc8\xdd\xfbLAk\xdc\xf67\x81\xf7\
-\x17\x19\x00\x00\x00`[\xcd\xfca=/\x1f\xdb\xe7\x09\
-Z\xe3\x96#\xb7\xac\x91\x7f\xeb/6\x00\x00\x00@\x8d\
-|S\x9f%h\x03\xaa\x99_\xeb/6\x00\x00\x00p\
-\xb0m\xff\x05\xb1\xe5\x99\xb9d\x9f#h\x03Z\x8e\xdc\
-\xb4F\xfe\xb9\xbf\xe8\x00\x00\x00\xc0\xc1T#\xb5\x9c\xb9\
-K\x9f!h\x83\xaa\xad\xfcj\x7f\xe1\x01\x00\x00\x80\x83\
-\xa9F\x9e\xd6g\x07\xda\xb0\x96#7\xaa\x91\x7f\xec/\
->\x00\x00\x00p\xb0\xd4\xc8{j\xe6\x0e}v\xa0\x0d\
-\xacf~\xa9o\x00\x00\x00\x00\xc0\xc1R#O\xed3\
-\x03mh5s\x83\x9ay}\xdf\x08\x00\x00\x00\x80\x83\
-\xa1F\xdeU\x87r\xbb>3\xd0\x06W3\x8f\xe8\x1b\
-\x02\x00\x00\x00p`\xfcV\x9f\x15h\xc3\xab\x99\xeb\xd7\
-\xcc\xdf\x1fgc\x00\x00\x00\x006X\xcd\xbc\xb3f\xbe\
-\xb6\xcf\x0at\x00\xaa\x99\x87\xf5\x0d\x02\x00\x00\x00\xd8l\
-5\xf3\x1b}F\xa0\x03R\xcd|Q\x8d\xfcm\xdf(\
-\x00\x00\x00\x80\xcdT3o\xabEn\xd5g\x04:@\
-\xd5\xcc\xcf\xf7\x0d\x03\x00\x00\x00\xd8L5\xf2\xeb}6\
-\xa0\x03V\xcd|^\x8d\xbc\xbao\x1c\x00\x00\x00\xc0f\
-\xa9\x99\x7f\xadEn\xdeg\x03:\x80-G~\xb6o\
- \x00\x00\x00\xc0f\xa9\x91\xc7\xf6\x99\x80\x0eh5s\
-\x9d\x1ayE\xdfH\x00\x00\x00\x80\xcdP3o\xa9\xad\
-\xdc\xa4\xcf\x04t\x80\xab\x91\x07\xf4\x0d\x05\x00\x00\x00\xd8\
-\x0c5rF\x9f\x05\xe8\x80Wg\xe7\xff\xab\x91\x97\xf4\
-\x8d\x05\x00\x00\x00Xo5\xf3\xc6\xda\xcaW\xf4Y\x80\
-\xb4\xfd\xddA?\xd97\x18\x00\x00\x00`\xbd\xd5\xc8\xa3\
-\xfa\x0c@:\xda\xf2\xec|fm\xe5\xc5}\xa3\x01\x00\
-\x00\x00\xd6S\x8d\xbc\xae\xb6\xf2e}\x06 }\xa0Z\
-\xe4G\xfb\x86\x03\x00\x00\x00\xac\xa7\x1a\xf9\x85\xbe\xf6\x97\
->\xac\xe5\x91\x5c\xb5f^\xd87\x1e\x00\x00\x00`\xbd\
-\xd4\xcc\xdf-\x8f\xe4\x8b\xfb\xda_:\xa6\x1a\xb9w\xdf\
-\x80\x00\x00\x00\x80\xf5R3\x8f\xe8k~\xe9\xb8\xd5\x0b\
-\xf3i5rV\xdf\x88\x00\x00\x00\x80\xf5P#\x7fQ\
-G\xf29}\xcd/]d5r\xb7\x1a\xa9\xbe1\x01\
-\x00\x00\x00\xab\xafF~\xb8\xaf\xf5\xa5\x8b\xadF~\xbb\
-oL\x00\x00\x00\xc0j\xab\x99?\xae\xb3\xf3\xc9}\x9d\
-/]l\xcb#\xb9e\x8d\xbc\xb9oT\x00\x00\x00\xc0\
-j\xaa\x91\xff\xa9E\xbe\xa1\xaf\xf1\xa5\x13n\xfbO\xd0\
-\xf5\x0d\x0b\x00\x00\x00XM5\xf2\x1b}m/\x9dT\
-5\xf3y\xb5\x95\x97\xf6\x8d\x0b\x00\x00\x00X-5\xf3\
-\xbaZ\xe4+\xfb\xda^:\xe9j\xe6>}\x03\x03\x00\
-\x00\x00VK\xcd\xfc|_\xd3K\xa7T\x1d\xce\x15k\
-+\xcf\xef\x1b\x19\x00\x00\x00\xb0\x1aj\xe6\x85uv\xfe\
-\xbf\xbe\xa6\x97N\xb9\x9a\xf9\xe6\x1a\xf9\xdf\xbe\xb1\x01\x00\
-\x00\x00\xfb\xaff\xbe\xaf\xaf\xe5\xa5\xd3\xaef\x9e\xdc7\
-6\x00\x00\x00`\x7f\xd5\xcc\x1f\xd6\xb9\xb9|_\xc7K\
-\xa7]-r\xf3\x9ayS\xdf\xe8\x00\x00\x00\x80\xfdQ\
-3\xef\xac\x99;\xf65\xbc\xb4c\xd5\xcc\xc3\xfa\x86\x07\
-\x00\x00\x00\xec\x8f\x9a\xf9\xb5\xbev\x97v\xb4:\x9c\xeb\
-.g.\xe8\x1b\x1f\x00\x00\x00\xb0\xb7j\xe655s\
-\x83\xbev\x97v\xbc\x9a\xf9\xa1\xbe\x01\x02\x00\x00\x00{\
-\xabf~\xa6\xaf\xd9\xa5]\xa9\xce\xcf'\xd5\xcc\x1f\xf7\
-\x8d\x10\x00\x00\x00\xd8\x1b5rx9r\xf5\xbef\x97\
-v\xadZ\xe4\x1bj\xe6\x7f\xfa\xc6\x08\x00\x00\x00\xec\xbe\
-\x1a\xf9\xce\xbeV\x97v\xbd\x9a\xf9\x8d\xbe1\x02\x00\x00\
-\x00\xbb\xab\x16y\xfar\xe4\xd2}\x9d.\xedzu8\
-7\xa9\x99\xd7\xf7\x8d\x12\x00\x00\x00\xd8\x1d5\xf2\xef5\
-r\x9b\xbeF\x97\xf6\xacZ\xe4\xc1}\xc3\x04\x00\x00\x00\
-vG\x8d\x9c\xd1\xd7\xe6\xd2\x9eV\xe7\xe6\xb3k\xe6\xcf\
-\xfa\xc6\x09\x00\x00\x00\xec\xac\x9ayU\x8d|I_\x9b\
-K{^-r\xef\xbe\x81\x02\x00\x00\x00;l\x91\x9f\
-\xeckri_Z^\x90+\xd4\x22\xcf>f#\x05\
-\x00\x00\x00vD\x8d\x1c\xaasr\xe5\xbe&\x97\xf6\xad\
-:\x9c;\xd7\xcc\xbb\xfa\xc6\x0a\x00\x00\x00\xec\x80\x91{\
-\xf4\xb5\xb8\xb4\xef\xd5\xcc\x13\x8e\xd9X\x01\x00\x00\x80\xd3\
-R3O]\x9e\x99K\xf6u\xb8\xb4\xef\xd5\x227\xdc\
-\xfe2\xab\xbe\xd1\x02\x00\x00\x00\xa7\xa6F^\xb7\x1c\xb9\
-e_\x83K+S\xcd\xdc\xa7o\xb8\x00\x00\x00\xc0\xa9\
-\xa9\x91\x07\xf4\xb5\xb7\xb4R\xd5\xf3\xf2\xf15\xf2\xf4\xbe\
-\xf1\x02\x00\x00\x00'\xa7f\xfe\xb8\x16\xf9\xf4\xbe\xf6\x96\
-V\xae\x9a\xf9\xaa\x9ay]\xdf\x88\x01\x00\x00\x80\x13S\
-3o\xad\x99;\xf45\xb7\xb4\xb2\xd5\xc8O\xf7\x0d\x19\
-\x00\x00\x00815\xf2\x0b}\xad-\xadt\xdb\xa7\xb1\
-m\x9f\xce\xd67f\x00\x00\x00\xe0#\xab\x91E\xcd\x5c\
-\xab\xaf\xb5\xa5\x95oy8\xb7\xaf\x91\xb7\xf6\x8d\x1a\x00\
-\x00\x008\xbe\x1a\xf9\x9f\x1a\xb9{_cKk\xd3r\
-\xe4\xe1}\xc3\x06\x00\x00\x00\x8e\xafF\x1e\xdb\xd7\xd6\xd2\
-ZU#\xd7\xac\x99\xd17n\x00\x00\x00\xe0\xc3\xd5\xc8\
-_\xd49\xb9^_[KkW\x8d\xdc\xadf\xde\xdd\
-7r\x00\x00\x00\xe0\x83j+\xdf\xd7\xd7\xd4\xd2\xdaV\
-3\xbf\xda7r\x00\x00\x00\xe0}j\xe6)\xcb3\xf3\
-1}=-\xadmu$_P#\x7f\xde7v\x00\
-\x00\x008\xe8j\xe6oj\x91\xaf\xeckii\xed\xab\
-\xad|w\xdf\xe0\x01\x00\x00\xe0\xa0\xab\x99\x1f\xefkh\
-i#Z\x9e\x99K\xd6\xcc\x93\xfaF\x0f\x00\x00\x00\x07\
-U\x8d<\xab\xce\xcf'\xf55\xb4\xb41\xd5V\xbe\xa2\
-F^\xdd7~\x00\x00\x008hj\xe4\xcd5\xf3\xb5\
-}\xed,m\x5c5s\x9f\xfe\x06\x00\x00\x00\x80\x83\xa6\
-f\x1e\xd4\xd7\xcc\xd2FV/\xca\xc7\xd7\x22O\xefo\
-\x02\x00\x00\x008(j\xe4O\xebP\xae\xd6\xd7\xcc\xd2\
-\xc6V\x8b\xdc\xaaF^\xdf\xdf\x0c\x00\x00\x00\xb0\xe9j\
-\xe6\x1d\xb5\x95o\xe8kei\xe3\xab\x91\x9f\xeeo\x08\
-\x00\x00\x00\xd8t5\xf3K}\x8d,\x1d\x88\xeaO\xf3\
-\xffj\xe4O\xfa\x9b\x02\x00\x00\x006U\xcd\xbc\xb0\x0e\
-\xe5s\xfa\x1aY:0\xd5\xcc\x1dj\xe6\xad\xfd\xcd\x01\
-\x00\x00\x00\x9b\xa8\x16\xb9W_\x1bK\x07\xae\xe5\x22\x0f\
-\xefo\x0e\x00\x00\x00\xd845\xf3\xc4\xbe&\x96\x0ed\
-5s\xad\xe5\xc8\xeco\x12\x00\x00\x00\xd8\x145\xf3\xca\
-:\x9c/\xebkb\xe9\xc0\xb6\x1c\xb9e\x7f\xa3\x00\x00\
-\x00\xc0\xc6\x18\xb9G_\x0bK\x07>\xbf.\x06\x00\x00\
-\xc0&\xaa\x99',/\xc8G\xf7u\xb0t\xe0[\x1e\
-\xc9Uk\xe4\x8f\xfb\x9b\x06\x00\x00\x00\xd6U\x8d\x9c\xb7\
-\x1c\xf9\xc2\xbe\x06\x96tau(_[3\xaf\xedo\
-\x1e\x00\x00\x00XC\xffQ[\xf9\x96\xbe\xf6\x95\xd4\xaa\
-\x91\x1f;\xce\x1b\x08\x00\x00\x00\xd6J\xcd<\xb4\xafy\
-%\x1d\xa7:+\x97]\xce\xfcV\x7f\x13\x01\x00\x00\xc0\
-\xba\xa8\x91g\xd7\xc8U\xfa\x9aW\xd2ET\x8b|\xe9\
-r\xe4\x82\xfef\x02\x00\x00\x80UW3\xaf\xa9En\
-\xd5\xd7\xba\x92.\xa6:\x94o\xaf\x99w\xf77\x15\x00\
-\x00\x00\xac\xb2\x1a\xf9\x91\xbe\xc6\x95t\x82\xd5\xc8\xa3\xfa\
-\x9b\x0a\x00\x00\x00VU\x8d\xfcF=/\x1f\xdb\xd7\xb7\
-\x92N\xb0:\x94\xcf\xaa\x99\x17\xf47\x17\x00\x00\x00\xac\
-\x9a\x9aya\x9d\x93\xeb\xf5\xb5\xad\xa4\x93\xacfnW\
-3o\xeco2\x00\x00\x00X\x155\xf2\x8e\x1a\xb9{\
-_\xd3J:\xc5j+\xf7\xefo4\x00\x00\x00X\x15\
-5\xf3\xb0\xbe\x96\x95t\x1a-/\xc8\x15j\xe4w\xfb\
-\x9b\x0d\x00\x00\x00\xf6[\x8d<\xa7\x16\xf9\x8c\xbe\x96\x95\
-t\x9a\xd5V\xbe\xa2f^\xd6\xdft\x00\x00\x00\xb0_\
-j\xe4\xefk\xe4k\xfa\x1aV\xd2\x0e\xb5\x9c\xf9\xae\x9a\
-yo\x7f\xf3\x01\x00\x00\xc0~\xa8\xad\xdc\xb7\xaf]%\
-\xedp5rF\x7f\xf3\x01\x00\x00\xc0^\xab\x99'\xd5\
-\xd3s\x99\xben\x95\xb4\xc3\xd5\xb9\xf9\xec\x1a9\xd4\xdf\
-\x84\x00\x00\x00\xb0Wj\xe6E\xcb#\xf9\xe2\xbef\x95\
-\xb4K\xd5V\xeeT3\xff\xd4\xdf\x8c\x00\x00\x00\xb0\xdb\
-j\xe6\x9d5\xf3\xad}\xad*i\x97\xab\x99\x9f\xe9o\
-H\x00\x00\x00\xd8m5\xf2\x0b}\x8d*i\x0fZ\x8e\
-|J\x8d<\xbd\xbf)\x01\x00\x00`\xb7\xd4\xc8\x1f\xd7\
-\xa1\x5c\xad\xafQ%\xedQu87\xa9\x99\xbf\xeco\
-N\x00\x00\x00\xd8i5\xf3\xda:\x94\xaf\xedkSI\
-{\x5cm\xe5\xfb\xfb\x1b\x14\x00\x00\x00vZ-\xf2\xa3\
-}M*i\x1fZ.\xf3Q5\xf3k\xfdM\x0a\x00\
-\x00\x00;\xa5f\x9e\xbc\xbc \x1f\xd7\xd7\xa4\x92\xf6\xa9\
-:\x94\xcf\xa9\x91\xb3\xfa\x9b\x15\x00\x00\x00NW\xcd\x1c\
-\xf1g\xe4\xa5\x15\xacfn]3\x7f\xd5\xdf\xb4\x00\x00\
-\x00p\xaaj\xe6\xf55s\xc7\xbe\x06\x95\xb4\x22\xd5\x22\
-\xdf]#\xef\xeao^\x00\x00\x008\x155\xf2#}\
-\xed)i\xc5\xaa\x91\x87\xf47/\x00\x00\x00\x9c\xac\x1a\
-\xf9\xe5\xed\xef\xa9\xed\xebNI+V\x1d\xce\x15k\xe4\
-\xa9\xfdM\x0c\x00\x00\x00'\xaa\xb6\xf2\x87u^\xae\xd6\
-\xd7\x9c\x92V\xb4\xed/\xf6\xaa\x91\xc3\xfd\xcd\x0c\x00\x00\
-\x00\x17\xa7f\xfe\xa2\x16\xf9\xca\xbe\xd6\x94\xb4\xe2\xd5\xa1\
-\xdc\xb1f^\xd7\xdf\xd4\x00\x00\x00pQj\xe6\xad5\
-r\xf7\xbe\xc6\x94\xb4&\xd5\xc8\x0f\xd7H\xf577\x00\
-\x00\x00\x1cO\x8d<\xa0\xaf-%\xadY5\xf3\xe8\xfe\
-\xe6\x06\x00\x00\x80\xaef\x9eP/\xcbe\xfb\xbaR\xd2\
-\x9a\xb5<;W\xad\x99g\xf679\x00\x00\x00\xbc_\
-\x8d\x9cU\x87s\xdd\xbe\xa6\x94\xb4\xa6-GnT#\
-\x7f\xde\xdf\xec\x00\x00\x00P3\x7f]3\xb7\xeekI\
-Ik^\xcd|s\x8d\xfcs\x7f\xd3\x03\x00\x00pp\
-\xd5\xcc\xbbk\xe4{\xfa\x1aR\xd2\x86\xb4\x5c\xe4'\xfb\
-\x1b\x1f\x00\x00\x80\x83\xabf\x1e\xda\xd7\x8e\x926\xa8\xe5\
-\xc8\xa5k+\x8f\xebo~\x00\x00\x00\x0e\x9e\x1a\xf9\xdd\
-:/\x9f\xda\xd7\x8e\x926\xac:\x9c\xff\xafF\xfe\xa4\
-\xef\x04\x00\x00\x0088j\xe4\xdc\x9a\xb9~_3J\
-\xda\xd0j\xe6\xabj\xe6\x95}g\x00\x00\x00\xc0\xe6\xab\
-\x997\xd6\xc8\x9d\xfbZQ\xd2\x86W[\xb9W\xcd\xbc\
-\xbd\xef\x14\x00\x00\x00\xd8l5s\x9f\xbeF\x94t@\
-\xaa\x91\x9f\xeb;\x05\x00\x00\x006W\x8d\x9c\xb1\x5c\xe6\
-\x12}}(\xe9\x80\xb4<\x92O\xac\x99'\xf7\x9d\x03\
-\x00\x00\x00\x9b\xa7F\xfe\xa8\x16\xb9F_\x1bJ:`\
-\xd5\xa1|A\xcd\x1c\xea;\x09\x00\x00\x006G\x8d\xbc\
-d9r\xd3\xbe&\x94t@\xab\x99\xdb\xd6\xc8\xdf\xf5\
-\x9d\x05\x00\x00\x00\xeb\xaff\xfe\xadf\xbe\xb5\xaf\x05%\
-\x1d\xf0j\xe4n}\x87\x01\x00\x00\xc0\xfa\xab\x91\x07\xf4\
-5\xa0$\x1d\xadf\x1e\xd4w\x1a\x00\x00\x00\xac\xaf\x1a\
-yL\x9d\x95\xcb\xf6\xf5\x9f$\x1dm9r\xb9\x1ay\
-l\xdfy\x00\x00\x00\xb0~j\xe6\xf7j\x91\xcf\xe8k\
-?I\xfa\xb0\x96Gr\xd5\x9a\xf9\xfd\xbe\x13\x01\x00\x00\
-`}\xd4\xcc\x0b\xeaH\xbe\xa0\xaf\xf9$\xe9\xb8\xd5\xcc\
-\x17\xd5\xc8\x9f\xf6\x9d\x09\x00\x00\x00\xab\xaff^\x5c\x8b\
-\xdc\xbc\xaf\xf5$\xe9#V\x87s\x8b\xe5\xcc\x05}\xa7\
-\x02\x00\x00\xc0\xea\xaa\x91\xbf\xaf\x91;\xf75\x9e$\x9d\
-Pu(w\xad\x91\x7f\xe8;\x17\x00\x00\x00VO\xcd\
-\xbc\xad\xb6\xf2\xdd}m'I'U\x8d|O\x8d\xbc\
-\xbd\xefd\x00\x00\x00X-5r\xbf\xbe\xa6\x93\xa4S\
-\xaaf\xee\xdfw2\x00\x00\x00\xac\x8e\x9ay\xc4\xf2\xcc\
-\x5c\xb2\xaf\xe7$\xe9\x94Z\x8e\x5c\xaaF\x1e\xd5w6\
-\x00\x00\x00\xec\xbf\x9ayR\x1d\xce\x15\xfbZN\x92N\
-\xab:/\x9fZ3O\xee;\x1d\x00\x00\x00\xf6O\x8d\
-\xfcQ\x9d\x9b\xcf\xeek8I\xda\x91j\xe6:\xb5\xc8\
-\xb3\xfb\xce\x07\x00\x00\x80\xbdW#\x87\xebPn\xd8\xd7\
-n\x92\xb4\xa3\xd5V\xbe\xa2F\xce\xed;!\x00\x00\x00\
-\xf6N\x8d\xbc\xaaFn\xd3\xd7l\x92\xb4+\xd5\xccm\
-k\xe4\xd5}g\x04\x00\x00\xc0\xee\xab\x99\xb7\xd4\xcc\xb7\
-\xf6\xb5\x9a$\xedj\xcb\x91{\xd4\xcc?\xf5\x9d\x12\x00\
-\x00\x00\xbb\xa7f\xfe\xa7F~\xa4\xaf\xd1$iO\xaa\
-\x99\xfb\xd4\xcc{\xfb\xce\x09\x00\x00\x80\xddQ3?\xdf\
-\xd7f\x92\xb4\xa7\xd5\x22\x0f\xee;'\x00\x00\x00v^\
-\x8d<\xb6\xce\xcd\xe5\xfb\xbaL\x92\xf6\xb4zQ>\xbe\
-f\x1e\xd7wR\x00\x00\x00\xec\x9c\x1ayZ\x1d\xca\xd5\
-\xfa\x9aL\x92\xf6\xa5:+\xd7\xa8\x91\xa7\xf7\x9d\x15\x00\
-\x00\x00\xa7\xafF\xfe\xb4\xce\xc9\xf5\xfaZL\x92\xf6\xb5\
-\xe5V\xbe\xb8f\xce\xee;-\x00\x00\x00N\xcb\x05\xcb\
-\x91[\xf65\x98$\xadD5\xf3U5\xf2\x92\xe3\xec\
-\xbc\x00\x00\x008I5\xf3\xda\x9a\xb9k_{I\xd2\
-J\xb5\x1c\xb9\x91\xbf0\x06\x00\x00p\xfaj\xe4\xce}\
-\xcd%I+Y-r\xaf\x1ays\xdf\x91\x01\x00\x00\
-p\xf1j\xe4]5s\xdf\xbe\xd6\x92\xa4\x95\xaeF\xbe\
-\xb7F\xde\xdawj\x00\x00\x00\x5c\xb4\x9a\xf9\xdf\x1a\xb9\
-__cI\xd2ZT3?T#\xef\xe8;7\x00\
-\x00\x00.\xc2\xc8\xcf\xf6\xb5\x95$\xadU5\xf2c5\
-\xf3\xdf\xc7\xec\xe0\x00\x00\x00\xf805\xf3\xd0\xe5\x99\xb9\
-d_WI\xd2\xdaU3?U#\xd5wt\x00\x00\
-\x00\xbcO\x8d<\xb2\xce\xcfe\xfazJ\x92\xd6\xb6\x9a\
-yP\xdf\xd9\x01\x00\x00p\xf4\x8c\xa0_Y^\x90+\
-\xf4u\x94$\xadu\xcb\x0b\xf2\xd1\xcb\x91\x87\xf7\x9d\x1e\
-\x00\x00\xc0AV#\x8f\xaf\xc3\xb9b_CI\xd2F\
-Tg\xe5\xb25\xf3\xe8\xbe\xf3\x03\x00\x008\x88j\xe6\
-Iu~\xae\xdc\xd7N\x92\xb4Q-\x8f\xe4\x13k\xe4\
-1}'\x08\x00\x00p\x90\xd4\xccS\x97g\xe73\xfb\
-\x9aI\x926\xb2za>\xadf\x9e\xd0w\x86\x00\x00\
-\x00\x07\xc4\x99\xcb\x91k\xf7\xb5\x92$mt\xb5\xc8g\
-,G~\xeb8;E\x00\x00\x80\x8dU3\x7fT\xe7\
-\xe4\xf3\xfb\x1aI\x92\x0eD5r\xcd\x9a\xf9\xbd\xbes\
-\x04\x00\x00\xd8D5\xf2\xbc\x1a\xf9\x92\xbe6\x92\xa4\x03\
-U\x9d\x93\xeb\xd6\xcc3\xfbN\x12\x00\x00`\x93\xd4\xcc\
-9\xb5\xc8\x0d\xfb\x9aH\x92\x0ed\xcb\x91/\xac\x91\xe7\
-\xf4\x9d%\x00\x00\xc0&\xa8\x99#\xcb\x91\x9b\xf6\xb5\x90\
-$\x1d\xe8j\x91/\xad\x99\x17\xf4\x9d&\x00\x00\xc0:\
-\xab\x91?\xabEn\xd5\xd7@\x92\xa4\xf7\x9d!t\xa3\
-\x1a\xd9\xea;O\x00\x00\x80uT3/\xad\x91\xdb\xf4\
-\xb5\x8f$\xe9C\xaaEn^#\xe7\xf5\x9d(\x00\x00\
-\xc0:\xa9\x91W\xd5\xcc\x1d\xfb\x9aG\x92t\x9cj\xe4\
-kj\xe6\xc5}g\x0a\x00\x00\xb0\x0ej\xe65u8\
-\xdf\xd8\xd7:\x92\xa4\x8fP\xcd\xdc\xaeF^\xdew\xaa\
-\x00\x00\x00\xab\xacF^_3\xdf\xda\xd78\x92\xa4\x13\
-\xe8\xe8w\x08\xcd\xbc\xb3\xef\x5c\x01\x00\x00VQ\xcd\xbc\
-\xb7F\xee\xdc\xd76\x92\xa4\x93h9s\x17g\x08\x01\
-\x00\x00\xab\xee\xe8\x19A\x8b|G_\xd3H\x92N\xa1\
-\xda\xca\xd7\xfb\x0e!\x00\x00`U\x1d\xfd\x8e \xbf\x1a\
-&I;[\xcd\xdc\xda_\x19\x03\x00\x00VM\xcd\xff\
-\xbf\xbd;\x0f\xd7\xfd\x9c\xef=\xfe1\xb5(ENT\
-\xa8\xa9\xb8\x8a\x18b>\xb4j\x8c\x1c\xa9D\x0cQ\x14\
-\xc7P\xb3\xb6\x87:\xe2D\x11\x91\x1a\x8a\x13S.r\
-\xa8\xb9fI\x0f9\xd2\xc4\xde\xeb\xb9\xefg\xaft\x97\
-JC\x05)Us\xa3D\x0d1\x16\xfd\xfe\xce\xf5,\
-\x9b\xb6\xb7D\x92=\xac\xbd\x86\xd7\xeb\xba\xde\x7f\xe6\xca\
-\xde\xc9Z\xbf\xfb{?\xbf\xe7\xf7\xbb\xf3\xd1j^\x16\
-\x0d\xb0G\xd4,w\xad\x9e6^|%I\x92$i\
-oT-g8>\x1e`\x0f[y\xa9t\xcb\xa9\xe3\
-EX\x92$I\x92V\xb3\xeay\x7f\xb5\x1c2\xeeY\
-\x00\xd8\x03j\x9e\xdbT\xcfI\xe3\xc5X\x92$I\x92\
-V\xa3j\xd9V\xf3\x1c4\xeeU\x00\xd8\x83\xa6\x96\x9b\
-U\xcb\x09\xe3EY\x92$I\x92\xf6d\xd5\xb3uj\
-\xb9\xd3\xb8G\x01`\x15\xd4\xb6\xec_\xb3\xbcu\xbc8\
-K\x92$I\xd2\x9e\xa8ZN\xae\xa5\xfc\xc6\xb87\x01\
-`\x15U\xcb\xf5\xa6\x9e\xd7\x8f\x17iI\x92$I\xda\
-\x9dU\xcb\xff\xad\x96[\x8d{\x12\x00\xf6\x82i9\xd7\
-\xac\x9eW\x8d\x17kI\x92$I\xdaM\xbd\xa3zn\
-2\xeeE\x00\xd8\x8b\xa6\x96\xfd\xaa\xe7\xb8\xf3\xb8hK\
-\x92$I\xd2NW-\x7f^\xa7\xe5\xfa\xe3\x1e\x04\x80\
-5\xa0N\xc9>\xd5s\xecx\xf1\x96$I\x92\xa4\x9d\
-\xa9z^[\xf3\xfc\xda\xb8\xf7\x00`\x0d\x99Z.7\
-\xb5<\x7f\xbc\x88K\x92$I\xd2E\xa9Z\x8e\xaf\xad\
-\xf9\xd5q\xcf\x01\xc0\x1a4\xbd#\xbfP=\xcf\xae\x9e\
-\x1a/\xe8\x92$I\x92tA\xd5</\xadm\xb9\xf2\
-\xb8\xd7\x00`\x8d\xab\x96\xa7W\xcf\xf7\xc7\x0b\xbb$I\
-\x92$\x9d_\xd5\xf3\xc2iK\xae0\xee/\x00X'\
-\xaa\xe7\x88j9w\xbc\xc0K\x92$I\xd2X\xb5<\
-\xa7\xb6\xe72\xe3\xbe\x02\x80u\xa6Z\x9eX=_\x1d\
-/\xf4\x92$I\x92\xb4\xa8Z~T=GM\xef\xc8\
-%\xc6\xfd\x04\x00\xebT\xf5<\xbeZ\xce\x1e/\xfa\x92\
-$I\x926w\xd5\xf2\xddj9r\xdcC\x00\xb0\x01\
-T\xcb#\xab\xe7\xb3\xe3\xc5_\x92$I\xd2\xe6\xacz\
-\xbe^=O\x1e\xf7\x0e\x00l \xd5\xf2\xc0\xea\xf9\xd0\
-\xb8\x08H\x92$I\xda\x5cU\xcf?\xd6<\x8f\x19\xf7\
-\x0c\x00l@5\xcfA\xd5\xb24.\x06\x92$I\x92\
-6G\xd5\xf3\xc1\xa9\xe7~\xe3^\x01\x80\x0d\xacZn\
-5\xf5\xbcc\x5c\x14$I\x92$m\xec\xaa\xe7\x94\x9a\
-\xe7.\xe3\x1e\x01\x80M`\xda\x92\xebT\xcb\xf1\xe3\xe2\
- I\x92$icV-o\xae\xe5\x1c0\xee\x0d\x00\
-\xd8D\xa6-\xb9B\xf5<\xb7z~4.\x14\x92$\
-I\x926N5\xcb\xcb\xab\xe5\xea\xe3\x9e\x00\x80Mj\
-q\x82@\xb5|e\x5c0$I\x92$\xad\xef\x16G\
-\xc7O-\xcf\x9a\xde\x93\xcb\x8e\xfb\x00\x006\xb9jy\
-x\xf5\x9c5.\x1e\x92$I\x92\xd6g\xd5\xf3\x85j\
-\xf9\x83q\xf6\x07\x80\x9f\xaa\x9e{V\xcb_\x8d\x8b\x88\
-$I\x92\xa4\xf5U\xf5|\xb8z~w\x9c\xf9\x01\xe0\
-gL-\xb7\xafYN\x1a\x17\x13I\x92$I\xeb\xa3\
-j\x99U\xcb\xdd\xc7Y\x1f\x00\xceWm\xcd\xfeS\xcf\
-\xeb\xc7EE\x92$I\xd2\xda\xaez\xdeY=\xb7\x1e\
-g|\x00\xb8@\xf5\xd7\xb9J\xf5\x1c;..\x92$\
-I\x92\xd6f\xd5s\xfc\xb4\x9c\xeb\x8c\xb3=\x00\x5ch\
-\xd3\xe9\xb9T\xf5\xfcq\xb5\x9c;.4\x92$I\x92\
-\xd6F\xd5\xf2\xa3\x9a\xe79\xd3\xe9\xb9\xc28\xd3\x03\xc0\
-N\xa9\x96\xc7U\xcbg\xc7EG\x92$I\xd2\xde\xad\
-Z\xbe\x5c\xb3<y\x9c\xe1\x01`\x97\xd5,\xf7\xaf\x96\
-\xbf\x1d\x17\x1fI\x92$I{\xa7j\xf9\xf8\xd4\xf2\xb0\
-qv\x07\x80\xddfj9\xb0z\xb6\x8c\x8b\x90$I\
-\x92\xa4\xd5\xadz\x96\xab\xe7\xd0qf\x07\x80\xdd\xae\xe6\
-\xb9E\xf5\xbcm\x5c\x8c$I\x92$\xadN\xd5\xf2\xee\
-\x9a\xe57\xc7Y\x1d\x00\xf6\x98\xa9\xe5\xda\xd5\xf3\x8aq\
-Q\x92$I\x92\xb4g\xab\x9e\xd7N-7\x18gt\
-\x00\xd8\xe3\xea\xb4\x5c\xbeZ\xfe\xa4Z~0.P\x92\
-$I\x92v\x7f\xd5\xf3\xc2\xda\x96+\x8f\xb39\x00\xac\
-\xaa\xc5\x0b\xeb\xaa\xe7{\xe3B%I\x92$i\xf7T\
-=?\xac\x96\xdf\x1fgq\x00\xd8kj\x96\xc3\xaa\xa7\
-\x8d\x8b\x96$I\x92\xa4]\xabZ\xb6W\xcf\xef\x8c3\
-8\x00\xecu\xd5s\xf3jy\xc3\xb8xI\x92$I\
-\xda\xb9\x16\x07\xb7T\xcbm\xc7\xd9\x1b\x00\xd6\x8c\xda\x9e\
-}\xaa\xe7\x98\xea\xf9\xd6\xb8\x90I\x92$I\xbap-\
-\xde\xcbY=/\xa8\xf7\xe5j\xe3\xcc\x0d\x00kR\xb5\
-<\xaaZ>6.j\x92$I\x92~~\xd5\xf3)\
-\xef\x07\x02`]\xaay\x0e\xaa\x9e\xbf\x1c\x177I\x92\
-$I\xe7]\xb5\xcc\xaa\xe7\xd0q\xb6\x06\x80ucj\
-\xb9A\xb5\xfc\x9fq\x91\x93$I\x924\xd4\xf2\xfaZ\
-\xce\x01\xe3L\x0d\x00\xeb\xce\xf4\x9e\x5c\xb6z\x9eV=\
-\xe7\xfc\xcc\x82'I\x92$m\xf2\xaa\xe5\xdcj9z\
-Z\xce\x95\xc6Y\x1a\x00\xd6\xb5jy\xf0\xd4s\xfa\xb8\
-\xf8I\x92$I\x9b\xb5\xea9\xb3\xe6\xf9\xbdqv\x06\
-\x80\x0d\xa3\xe6\xb9C\xb5\x9c8.\x82\x92$I\xd2f\
-\xabZ\xde[=w\x1bgf\x00\xd8p\xa6\x96kW\
-\xcbK\xc6\xc5P\x92$I\xda,U\xcf+k)\xd7\
-\x1fge\x00\xd8\xb0\xa6)\x17\xab\x9e?\xaa\x96\xcf\x8f\
-\x0b\xa3$I\x92\xb4Q\xab\x9e/W\xcb\x91S\xcb\xa5\
-\xc7\x19\x19\x006\x85\x9a\xe7\xbe\xd5r\xda\xb8HJ\x92\
-$I\x1b\xad\xea\xf9`\xcd\xf2\xa0q&\x06\x80M\xa7\
-zn]=o\x19\x17KI\x92$i\xa3T-'\
-L-\xb7\x1fga\x00\xd8\xb4jk\xaeR=\xcf\xab\
-\x9e\xef\x8f\x0b\xa7$I\x92\xb4\x9e\xab\x9ec\xa7\xe5\x5c\
-s\x9c\x81\x01\x80\x1f\x1f?\xff\xb8j\xf9\xe4\xb8\x80J\
-\x92$I\xeb\xadj\xf9\x5c\xb5<q\x9cy\x01\x80A\
-\xcdr\x8f\xea\xd92.\xa6\x92$I\xd2z\xa9Z\xb6\
-U\xcf}\xc6Y\x17\x008\x1fS\xcb\x15\xab\xe7\x9d\xe3\
-\xa2*I\x92$\xad\xf5\xaa\xe7\xa4\xa9e\xdfq\xc6\x05\
-\x00.\xc04\xe5\x12\xd5\xf2\x07\xd5s\xd6\xb8\xc0J\x92\
-$Ik\xadj\xf9t\xb5\xfc\xcf\xe9\xf4\x5cv\x9cm\
-\x01\x80\x8b\xa0\xe6\xb9K\xb5\xbck\x5cl%I\x92\xa4\
-\xb5R\xb5\xbc\xa7z\x0e\x1egY\x00`'\xad\x9c6\
-\xd6rt\xb5|e\x5cx%I\x92\xa4\xbdU\xb5|\
-s\xe5T\xdcy\xae1\xce\xb0\x00\xc0n0\xf5\xdc\xaf\
-z\xda\xb8\x08K\x92$I\xab]\xb5l\xaf\x96\x07\x8f\
-3+\x00\xb0\x9b\xd5\xb6\xec_-\xc7UK\x8d\x0b\xb2\
-$I\x92\xb4\x1aU\xcf\xab\xaa\xe7\xe6\xe3\xac\x0a\x00\xec\
-A\xd5\xf2\xb8j\xf9\xc8\xb80K\x92$I{\xaaj\
-\xf9D\xf5\xfc\x8f\xe9\xf4\x5cj\x9cO\x01\x80UP=\
-\xbfU=o\x1d\x17iI\x92$iwW-'N\
--\x07\x8e3)\x00\xb0\xcaj{\xf6\xa9\x96\xa7W\xcb\
-\xd9\xe3\x82-I\x92$\xedj\xd5\xf3\xd5\x9a\xe5\x98\x9a\
-\xe7\xaa\xe3,\x0a\x00\xecE\xd5s\xef\x9ae\xcb\xb8x\
-K\x92$I;[\xb5\xcck\x9e\xfb\x8f\xb3'\x00\xb0\
-F\xd4\x96\xfcz\xf5\xbc\xb8z\xfeu\x5c\xc8%I\x92\
-\xa4\x8bR\xf5\xbc\xa2Zn<\xce\x9c\x00\xc0\x1aT-\
-\x8f\xac\x963\xc6\x05]\x92$I\xba\xa0\xaa\xe5c5\
-\xcb\x13\xa6)\x17\x1b\xe7L\x00`\x0d\xab\x9e\xdb\xd5,\
-o\x1a\x17wI\x92$\xe9\xfc\xaa\x96\xb7\xd7\xb6\xdcq\
-\x9c-\x01\x80u\xa2N\xce/W\xcfS\xab\xe7s\xe3\
-B/I\x92$\xfd\xa4\xea\xf9\xe7\xeay\xe6\xd4\xb2\xef\
-8S\x02\x00\xebP\xb5\x1cR-'\x8f\x8b\xbe$I\
-\x92T-K5\xcb}\xc7\x19\x12\x00X\xe7j\x9e_\
-\xab\x9e\x17V\xcbw\xc6\x01@\x92$I\x9b\xaf\xea\xf9\
-a\xb5\xbctj\xb9\xc18;\x02\x00\x1b\xc8\xca\xb7\x84\
-z\xbe0\x0e\x03\x92$I\xda<U\xcf\x97\xaa\xe5\xf0\
-qV\x04\x006\xa8\xc5\xdd\x9fjy\xd1\xd4\xf2\x8dq\
-0\x90$I\xd2\xc6\xadZ\xbe[=/\xabm\xb9\xe9\
-8#\x02\x00\x9b@m\xcb\xe1\xd5s\xca8$H\x92\
-$i\xe3U-\xb3\x9a\xe5A\xe3L\x08\x00l25\
-\xcf5\xaa\xe5\xe8j\xf9\xa7q`\x90$I\xd2\xfa\xaf\
-z\xce\xa9\x9e\xe7\xd5R\xae;\xce\x82\x00\xc0&V=\
-\x07W\xcb\x09\xe3\xf0 I\x92\xa4\xf5[\xf5\x9cT\xf3\
-\x1c6\xce~\x00\x00+\xea\x94\xecS=GT\xcf'\
-\xc6AB\x92$I\xeb\xa7j\xf9l\xb5<}j\xd9\
-o\x9c\xf9\x00\x00~F\xcds\x87\xeay\xe38TH\
-\x92$i\xedW=o\x9bZ\x0e\x1cg<\x00\x80\x9f\
-\xabN\xce/V\xcf\xe3\xab\xe5\x8cq\xc0\x90$I\xd2\
-\xda\xabz>Z-O\xaa\xd3r\xf9q\xb6\x03\x00\xb8\
-\xd0\xa6YnY=\xaf\xac\x9e\x1f\x8c\x03\x87$I\x92\
-\xd6F\xd5\xf2\x9a\xea\xb9\xdd8\xcb\x01\x00\xec\xb4\x9a\xe7\
-\xa1\xd5\xb3<\x0e\x1e\x92$I\xda{U\xcb\x07\xaa\xe5\
-Q\xd3Q\xb9\xf88\xbf\x01\x00\xec\xb2\xa9\xe5\x06\xd5\xf2\
-\xa2\xea\xf9\xfa8\x88H\x92$i\xf5\xaa\x9e\xefT\xcf\
-\xcbj[n:\xcel\x00\x00\xbb]\xb5\x1c^-\xa7\
-\x8cC\x89$I\x92\xf6|\xd52\xab\x9e\xdf\x1dg4\
-\x00\x80=\xaa\xe6\xb9\xc64\xcf\xb3\xaa\xe7\x8b\xe3\x80\x22\
-I\x92\xa4\xdd_\xb5|\xa5fy^-\xe5\xba\xe3l\
-\x06\x00\xb0j\xaa\xe7\xe0j9a\x1cV$I\x92\xb4\
-\xfb\xaa\x9e\x93j\x9e\xc3\xc6Y\x0c\x00`\xaf\xa8S\xb2\
-O\xb5<\xa5Z>1\x0e.\x92$I\xda\xf9\xaa\xe7\
-3\xd5\xf3\xc7S\xcb~\xe3\x0c\x06\x00\xb0\xd7M-\xd7\
-^\xdc\xb5\x1a\x87\x18I\x92$]\xf4\xaag\xcb\xe2\x00\
-\x8fq\xe6\x02\x00Xs\xaa\xe5\x81\xd5r\xf28\xd0H\
-\x92$\xe9\x82\xab\x96\xad5\xcbC\x1d\x17\x0f\x00\xac+\
-S\xcb\xbe\xd5\xf2\xa4j9c\x1cp$I\x92\xf4\xb3\
-U\xcbGk\x96\xa7\xd6\xfbr\xb5q\xb6\x02\x00X7\
-\xaa\xe5\xc6\xd5\xf2\xa7\xd5r\xf68\xf0H\x92$i\xe5\
-q\xb0s\xaa\xe7\xd8\xea\xb9\xf98K\x01\x00\xac[S\
-\xcb\x81\xd5\xf2\x86\xea\xf9\xb7q\x00\x92$I\xda\xacU\
-\xcf[\x16\xa7\xb3\x8e\xb3\x13\x00\xc0\x86Q\xf3<\xa8z\
-N\x19\x07!I\x92\xa4\xcdT\xb5\xcc\xaa\xe5\xe1S\xcb\
-%\xc7y\x09\x00`\xc3\xa9\xbf\xca\xafT\xcf\x93\xab\xe7\
-\xc3\xe3`$I\x92\xb4\x91\xab\x96\x8fW\xcb\x91\xd5r\
-\xf5qF\x02\x00\xd8\xf0j[nZ=/\xac\x9e\x7f\
-\x1e\x07%I\x92\xa4\x8dT\xb5|\xadZ^Z-\xb7\
-\x1ag\x22\x00\x80M\xa7\xe69\xa8z\xde4\x0eM\x92\
-$I\x1b\xa1jy{\xb5\x1c2\xce@\x00\x00\x9b\xda\
-4\xe5b\xd5\xf3\xdf\xabg\xcb8@I\x92$\xad\xc7\
-\xaae^-\x8f\xac\x93\xf3\x8b\xe3\xec\x03\x00\xc0\x0e5\
-\xcfU\xab\xe7\x88\xea9s\x1c\xa8$I\x92\xd6C\xd5\
-\xf3\xf7\xd5\xf2\xf4Z\xca\xb5\xc6Y\x07\x00\x80\xf3Q=\
-7\xaf\x9ec\xab\xe7\x9cq\xc0\x92$IZ\xa3}\xa3\
-z^^\xb3\xfc\xd7q\xb6\x01\x00\xe0B\xaa\x9e\x83\xab\
-\xe7-\xe71lI\x92$\xad\x99\xaa\xe7\x9d\xd5s\xcf\
-q\x96\x01\x00`'L-\x97\xac\x96\x87W\xcf\xd28\
-xI\x92$\xed\xcd\xaagy\xeaytm\xcfe\xc6\
-\x19\x06\x00\x80]\xb4\xe3C\xa1'V\xcf\x97\xc6AL\
-\x92$i5\xab\x9e\xaf/\xde\x0b4\xb5\x5cz\x9cY\
-\x00\x00\xd8\xcdj)\xd7\xad\x96#\xab\xe7C\xe3`&\
-I\x92\xb4'\xab\x96\x8fW\xcfQ\xd5s\xc3qF\x01\
-\x00`\x0f\xab\xa5\x5c\xbfZ\x9e\xe1\xe41I\x92\xb4\xa7\
-\xab\x96OV\xcf1\xd5s\x93q&\x01\x00`\x95\xd5\
-RnT-GW\xcfY\xe3\xe0&I\x92\xb4+U\
-\xcb\xa7\xa7\x96\xe7/N:\x1dg\x10\x00\x00\xf6\xb2\xda\
-\x96\x9bV\xcbs\xaa\xe7\x1f\xc6AN\x92$\xe9\xa2T\
--\x9f\xaf\x96\x17U\xcf\xad\xc7\x99\x03\x00\x805\xa6\xe6\
-\xb9\xc54_\xb9\x83\xf7\x99q\xb0\x93$I\xfay-\
-\x0e\xaa\xa8\x96\x97\xd4R~c\x9c1\x00\x00X\xe3j\
-\x9e\xdb\xd4|\xe5\x8e\xde\x17\xc6AO\x92$\xe9?V\
-=\xe7T\xcfq5\xcf\x1d\xc6\x99\x02\x00\x80ufq\
-go\xe5\x0e_\xcb\xd9\xe3\xe0'I\x926w+G\
-\xc4\xf7\x1c_\xf3\xdce\x9c!\x00\x00X\xe7j)w\
-\xa8\x96\xe3\xaa\xe5+\xe3 (I\x926W\xd5\xf3\xad\
-jyM\xcds\xd083\x00\x00\xb0\xc1T\xcf\x9d\xab\
-\xe5\xf8j\xf9\xda8\x18J\x92\xa4\x8d]\xf5|\xafZ\
-\xdeP\xb3\xdcc\x9c\x11\x00\x00\xd8\xe0\xaa\xe7n\xd5\xf3\
-\xeaj9w\x1c\x14%I\xd2\xc6\xaaZ~T-o\
-\xaeY\x0e\x1bg\x02\x00\x006\x99\xea9\xb8z^W\
--\xdf\x1d\x07GI\x92\xb4\xfe\xaby\xde^\xf3\xdcw\
-\x9c\x01\x00\x00\xd8\xe4\xaa\xe7\xd0\xeayS\xf5\xfc\xeb8\
-DJ\x92\xa4\xf5W\xb5\x9cX\xf3\xdc\x7f\x9ar\xb1q\
-\xdd\x07\x00\x80\x9f\xaay\xee\xb1\xe3\xf11/\x9a\x96$\
-i\x9dU=\xdf^<\x0e6\xf5\xdco\xfah~a\
-\x5c\xe7\x01\x00\xe0|\xd5,\xbfY=/\xa8\x96O\x8e\
-\x83\xa6$IZ[U\xcb\x17\xab\xe7\xb8\xc5;\x01\xc7\
-5\x1d\x00\x00.\x92\xda\x96\xfd\xab\xe5\xc8j\xf9\xc08\
-xJ\x92\xa4\xbd[\xf5\x9cY=\xc7T\xcb\xad\xc65\
-\x1c\x00\x00vI\xcds\xd5jy\x5c\xf5\x9c2\x0e\xa2\
-\x92$iu\xab\x96m5\xcb\x93k)\xd7\x1d\xd7l\
-\x00\x00\xd8\xad\xa6\x96KW\xcb\x03\xaa\xe7\xad\xd5\xf3\xbd\
-q8\x95$I{\xaejyw\xf5<\xa2\xb6g\x9f\
-q\x8d\x06\x00\x80=\xae\xe6\xf9o5\xcb+\xab\xe5\xec\
-qX\x95$I\xbb\xadoL=\xaf\xaf\x9e{OG\
-\xe5\xe2\xe3z\x0c\x00\x00\xab\xae\xe6\xb9M\xf5<\xb7z\
->v\x1e\x03\xac$I\xda\x89\xaa\xe73\xd5\xf2\x92\xa9\
-\xe5N\xe3\xda\x0b\x00\x00kBm\xc9\xafW\xcbS\xaa\
-\xe7\xb4q\xa0\x95$I\x17\xaej9\xa3z\x8e\x9aZ\
-n6\xae\xb5\x00\x00\xb0&\xd5\xb6\x5c\xb9\xe6yd\xb5\
-\xfc\xbfq\xc0\x95$I\xe7]\xb5\xcc\xaa\xe7\x0fk)\
-\xd7\x1a\xd7V\x00\x00X\x17\xa6\x96KV\xcb\xe1\xd5\xf3\
-\xa6\xea9w\x1cz%I\xda\xecU\xcf\x8f\xaa\xe5\x84\
-jyH\xbd?\xbf<\xae\xa5\x00\x00\xb0n\xd5,w\
-\xad\x9e\x97U\xcb\xe7\xc7AX\x92\xa4\xcdV\xb5|\xb5\
-z\xfe\xacz\x0e\x1d\xd7L\x00\x00\xd8P\xa6\x96\xfd\xaa\
-\xe7\x98\xea\xf9\xd28\x18K\x92\xb4\xd1\xab\x9e\xafW\xcf\
-\x8b\xab\xe5z\xe3\x1a\x09\x00\x00\x1b\xda\xca{\x85\x16_\
-\x89oys\xb5\xfc\xcb8,K\x92\xb4Q\xaa\x96\xef\
-V\xcb\x89S\xcf\xa3\xa7\xe5\x5cs\x5c\x13\x01\x00`\xd3\
-\xd9q4\xfd3\xabe\xfb8@K\x92\xb4^\xab\x9e\
-\x0fU\xcf\xf3j\x96;\x8ek\x1f\x00\x00\xb0x\x84l\
-K\xaeP\xb3\xdc\xbffy]\xf5\x9c=\x0e\xd5\x92$\
-\xad\xf5V\x1e\x03ky\xdb\xd4\xf2\xb0\xc5\xa3\xd1\xe3Z\
-\x07\x00\x00\x9c\x8fZ\xce\x01\xd5\xf3\xd4\xeai\xe3\xa0-\
-I\xd2Z\xabz\xde?\xcd\xf3\xacj\xb9\xed\xb8\xa6\x01\
-\x00\x00\x17\xc1\xd4r\xe9\xa9\xe5^\xd5r|\xf5|v\
-\x1c\xbe%I\xda[U\xcb\x97\xab\xe5\x0d\xd5\xf2\xc0i\
-9W\x1a\xd70\x00\x00`\x17U\xcf\x0d\xab\xe5I\xd5\
-r\xea8\x90K\x92\xb4ZU\xcb\xb6\xeayZ\xcds\
-\x8bq\xad\x02\x00\x00\xf6\x80\xe9\xa8\x5c\xbc\x96\xf2\xdb5\
-\xcfK\xab\xe7\x13\xe3\x90.I\xd2\xee\xaeZ>_=\
-\xaf\xaaY\xee[\xa7\xe6\x97\xc6\xb5\x09\x00\x00X%\xd3\
-r\xaeS=\x8f\xaf\x96\xf7T\xcb\x0f\xc6\xe1]\x92\xa4\
-]\xa9z\xb6T\xcf\x93k97\x1a\xd7 \x00\x00`\
-/\xabY\xeeZ=/\xac\x9e3\xc7a^\x92\xa4\x0b\
-[\xb5|\xaaZ\x8e\xab\x96C\xa6\x96K\x8e\xeb\x0d\x00\
-\x00\xb0\xc6,^:]-\x0fp\x12\x99$\xe9\xa2T\
-=\x1f\xac\x96\xc7N-\x97\x1b\xd7\x16\x00\x00`\x9d\xa8\
-\x9e[W\xcf\x11\xd5rr\xf5|o\x1c\xfc%I\x9b\
-\xbbj\x99U\xcf3\xab\xe7\xb7\xc65\x04\x00\x00X\xe7\
-\xaa\xe7v+\xa7\xbf\xb4\xbc\xafz~8n\x08$I\
-\x9b\xa3\x1d\xa7\x81=\xbbz\xee<\xae\x15\x00\x00\xc0\x06\
-\xb5\xb8\x03\xbcr'\xb8e6n\x12$I\x1b\xafj\
-\xd9^=\xcf\xad\x9e\xbby\x0f\x10\x00\x00lr\x8b;\
-\xc3+w\x88[\xb6\x8d\x9b\x07I\xd2\xfa\xadZ\xfe\xa6\
-z^P=\x07/\xde'7^\xff\x01\x00\x80Mn\
-q\xa7xq\xc7x\xe5\xceq\xcb\xf6qS!IZ\
-\xfbU\xcb\x19\xd5sl\xf5\x1c\xeaE\xd0\x00\x00\xc0\x85\
-\xb6r\x22Y\xcf\xc1+w\x94[\xfef\xdclH\x92\
-\xd6N\xd5\xf2\x91\xeayY\xf5\xdc{j\xb9\xe2xM\
-\x07\x00\x00\xb8H\x16w\x96\x17w\x98W\xee4\xb7\x9c\
-1nB$I\xab_\xb5|\xbcz^1\xf5\xdco\
-j\xd9w\xbcv\x03\x00\x00\xec\x16\x8b;\xce\x8b;\xcf\
-+w\xa0[>2nN$I{\xaej\xf9d\xf5\
-\xbc\xaaZ\x1e8\xb5\xec7^\xa3\x01\x00\x00\xf6\xa8\xc5\
-\x9d\xe8\xc5\x1d\xe9\xc5\x9d\xe9\xc5\x1d\xeaq\xd3\x22I\xda\
-\xf5\xaa\xe5\xd3\xd5\xf3\xdajyH\xb5\x5c}\xbc\x16\x03\
-\x00\x00\xec\x15\xb55W\xa9y\x0e\xab\x9e\xe7M-\xbd\
-z\xbe?nh$I\x17\xae\x1d\xc7\xc0/^\x02\xfd\
-;\xd3r\xae9^s\x01\x00\x00\xd6\x9c\xea\xb9y\xcd\
-\xf2\xf8\xeay\xe3\xe2\xb1\x86q\xa3#I\xfa\xf7\xaa\xe7\
-\xb3\xd5\xf3\xb6jyb\xb5\xdcv\xbc\xa6\x02\x00\x00\xac\
-+\xf5\x81\xfc\x97j9\xa4Z\xfe\xa4z\xb6V\xcf\xb7\
-\xc7\x8d\x90$m\xa6\xaa\xe5\x07\xd5\xb2m\xe5\xc4\xc6\xa5\
-\xdc\xa7\xe6\xb9\xeax\xed\x04\x00\x00\xd80jkn:\
-\xf5<z\xc7;0\xbckH\xd2\xa6\xa8Z>U-\
-\x7f^\xf3<aZ\xce-\xc7k#\x00\x00\xc0\xa6\xb0\
-r:Y\xcb\xdd\xa7y\x9eU=\xa7T\xcb7\xc7\x0d\
-\x94$\xad\xc7\xaa\xe5\xbb\xd5\xb3T-\xcf\xa9\x9eCk\
-[\xae<^\x03\x01\x00\x006\xbd\xda\x96\xfd\xab\xe7\x11\
-5\xcb\xab\xab\xe7\xccqs%Ik\xb9\xea9\xabz\
-^W\xf3<\xa6\x96r\xc0x\x8d\x03\x00\x00\xe0\xe7\x98\
-Z.7\xb5\x1cX-\xcf\xa8\x96\xf7V\xcf\xbf\x8c\x1b\
-/I\xda\x9bU\xcf7\xab\xe5\xd4j9\xbaz\x0e^\
-|\xdbq\xbc\x96\x01\x00\x00\xb0\x93v<R\xf6\x80\x95\
-\xbb\xee=_\x187e\x92\xb4\x1aU\xcf\x97\xaa\xe7M\
-\xd5\xf2\xe0\xa9e\xdf\xf1Z\x05\x00\x00\xc0\x1eR\xcb9\
-\xa0\xe6yh\xf5\xbc\xb8fi\xd5\xf2\xb5q\xd3&I\
-\xbbR\xb5\x9c\xbb\xe3\xd4\xaf\x97-\x1ea\x9df\xb9\xe5\
-\xf4\x8e\x5cb\xbc\x1e\x01\x00\x00\xb0\x17\xd4R\xaeU\xb3\
-\x1cV=\xcf\xac\x96\x13\xab\xe5\xd3\xe3\xc6N\x92~^\
-\xd5\xf2\xf9jyO\xf5<\xbbz\xee3-\xe7:\xe3\
-\xb5\x06\x00\x00\x805\xaa\xde\x9f_\xaey\xeeP=\x7f\
-X-\xaf\xa9\x96\xbf\xad\x96\x7f\x1b7\x7f\x926o\xd5\
-\xf3w\xd5\xf3\xc6\xea\xf9\xa3\x9a\xe7.\xb5=\xfb\x8c\xd7\
-\x12\x00\x00\x00\xd6\xb1\xea\xb9I\xb5<\xa4Z\xfew\xf5\
-l\xad\x9e\xaf\x8e\x9bCI\x1b\xb3j+/{\x9eW\
-\xcbKk)\x8f\xa8\xad\xb9\xc54\xe5\xe2\xe3u\x02\x00\
-\x00\x80\x0d\xac\xe6\xb9F\xb5\x1cR-O\xaf\x96wU\
-\xcf?\x8c\x1bHI\xeb\xb3j\xf9\x5c\xb5\xbc{\xc7I\
-_\xf7\x9e\xb6x\xe4\x0b\x00\x00\x80\xc1\x8e\xe3\xeco_\
-\xf3<\xa1z^]=\x1f\xac\x96\x1f\x8c\x9bLIk\
-\xaf\xea\xf9p\xb5\xbc\xa1Z\x9eT=w\x9e\x96s\xa5\
-\xf1w\x1c\x00\x00\x00.\xd0\xd4\xb2\xdf\xd4r\xaf\x95o\
-\x0f\xf5\xbc\xb3z\xce\x1a7\xa1\x92V\xb7\xea\xf9L\xf5\
-\xfcE\xf5\x1cS-\x87O-\xd7\x1e\x7fw\x01\x00\x00\
-`\xb7\xa9y\xae:\xb5\xdc\xa9\xe6yL\xf5\x1c[-\
-\xef\xad\x9eO\x8d\x1bVI\xbb\xd6\x8eG\xbd\xdeW=\
-/\xaf\x96\xdf\xaf\x9e\xbbM\xcb\xb9\xe6\xf8;\x09\x00\x00\
-\x00\xabnj\xb9d-\xe5F\x8b\xe3\xa8\xab\xe5\xc8\xa9\
-\xe5\xf5\xd5\xf3\xd7\xd5\xf2\xb5q\x83+\xe9?W=\xdf\
-\x9aZN\xaf\x967W\xcf3k\x96\xfbO-7\xab\
-\xed\xb9\xcc\xf8\xbb\x06\x00\x00\x00kZ\x9d\x9a_\x99\x96\
-W\xdeC\xf4{\xd5\xf3\x82\x9a\xe7\xdd\xd5\xf3\xf7\xe3f\
-X\xda,U\xcf?V\xcb\xc9\xd5\xf3\xe2\x9a\xe7\xb1\x8b\
-\xf7\xfb\xd4i\xb9\xda\xf8\xbb\x03\x00\x00\x00\x1bJ-\xe5\
-\xfa\xd5s\xcfjyJ\xb5\xfcY\xf5,W\xcbW\xc6\
-\x8d\xb3\xb4^\xab\x9e\xafW\xcb\xfbW^\xea\xdc\xf3\xb4\
-\x9a\xe5\xbe\xd5r\xe3\xe9\xf4\x5cj\xfc}\x00\x00\x00\x80\
-Mi\xe5Q\xb3\x96\x1bW\xcb\x03v\xbc\xb0zq\xa2\
-\xd9\x96\xc5\x91\xf7\xd5\xf3\xc3q\xb3-\xad\x85v\xbc\xcc\
-\xb9U\xcf\xeb\xa6\x96gU\xcb\x83\x17\x8fxM-\x97\
-\x1e\x7f\xc6\x01\x00\x00\x80\x0b\xa9>\x9c_\x9aZn0\
-\xb5\x1cX-\x0f\xaf\x96gT\xcf\xabV\x1e\xb7i\xf9\
-\xc8\xe2[\x18\xe3&]\xda\xd5\xaa\xe5\xdcj\xf9x\xf5\
-\x9cZ-\xaf\xa9\x96\xa3\xab\xe5\x91\xd5r\xf7Z\xce\x8d\
-\xa6-\xb9\xc2\xf8\xb3\x0a\x00\x00\x00\xac\x82\xa9\xe5r\xd5\
-s\xc3\xc5iK\xb5\x94G\xac\xbc\x84w\xf1aQ\xcf\
-_V\xcf\x99S\xcf7\xc6\x8d\xbe\xb4xqs\xf5\x9c\
-\xb5\xe3\xc4\xae\xd7V\xcf\xb3\xab\xe5Q\xd5s\xf0\xca#\
-]-W\x1c\x7f\xd6\x00\x00\x00\x80u\xa0N\xcb\xe5k\
-k\xf6\xafy\x0e\xaa\xd9\xca\xcb\xac\x8fZy\x0c\xad\xe5\
-\x94\xea\xf9h\xb5|s\xfc\xa0@\xeb\xbf\xea\xf9\xf6\xe2\
-\x85\xe5;\x1e7|]\xcdr\xcc\xd4\xf3\xe8Z\xcao\
-W\xcfM\xa6\xe5\x5ci\xfcY\x01\x00\x00\x006\x81\xc5\
-\x11\xde\xb5=\xbf\xba\xf2\x01A\xcb\x9d\xaa\xe7>+\x8f\
-\x03\xf5\x1c1\xcd\xf3\xfc\x9a\xad|pt\xc2\xca\xbba\
-Z\xfe\xaez\xbeP=\xdf\x19?|\xd0\x9e\xabz\xbe\
-W-\xff\xb4\xf8\xa6W\xb5\xcck\x96\xbf\xa8\xbe\xf2\xf2\
-\xf1\x17L-\xffk\xe5C\x9e\x96\xc3k\x9e\xbb\xac\x1c\
-\xcb>\xcf5\x16\x8f\x17\x8e\xff\xaf\x01\x00\x00\x00vJ\
-\xbd=\x97\xa9\xad?\xfe\x00\xa9\xb6\xe5\x8e\xd5s\xef\x9a\
-\xaf|\xeb\xe8\x88\xa9\xe5\xf9;\x1eS{W\xb5\xcc~\
-\xfa\x01R\xf3\x01\xd2\xa2j\xf9n\xf5|q\xf1\xbe\xa7\
-\xa9\xa5W\xcb\x89;\xbe\xa9\xf5\xa7\xd5\xf3\xd4\x95G\xb5\
-\x16\xa7o-\x8e]_\xca\x01\xd5r\xf5\xe9\xf4\x5cv\
-\xfc\x7f\x00\x00\x00\x00\xb0\xe6M-\xfbN-\xd7^|\
-\x03iG\xf7\x9aZ\x1e\xb6\xa8Z\x1e\xbb8\x91\xea'\
-\xad<\xda\xf4\xef\x9d\xb4\xe3\xd4\xaaE\x1f\xdcq\x8a\xd5\
-\x05u\xce\xf8A\xccy\xb5r\x0c\xfa\xcf\xfe\xb3\xe7\xd5\
-\xe2\xdf\xfb\x93?\xc3\xe2}L?\xfd\xf3\xfd\xa7?\xf7\
-\x8f\xff\x1e?\xf9;\x1d\xfe\x93\xbfk\xb5\x5coj\xd9\
-o\xfco\x02\x00\xb0\x1a\xfe?\xcf\xd5\xf6NT\x90z\
-\xff\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0fa\x00\x00\x0fa\
+\x01\xa8?\xa7i\x00\x00\x01\xe0IDATH\xc7\xbd\
+V1oRa\x14=\xe7>J\x0a\x92h\xec\xd0\xc7\
+\x820K\x22n\x06\xc5\x91\x84\xc5\x9f\xe0db\xc2\x0f\
+\xd0881\xb4\xe9^\xa3\x7f\x83\xd44\xc1\x91H\x1c\
+!\xc1Y\xca\xc2\xab\x09\x1b\xf6\x11\xf0}\xc7\xc1bP\
+iS\xec\xc33\xde\xef\xe6\x9c\xe4\xe4\xde{>\xe2\x22\
+4\x91N\xa7\xfd\xbb\x88X%\xf0\x90\xe0=\x00;\xe7\
+\xafcA=\x01\x1f%}\x08gA\x1fOp\xb6\x8a\
+\x86\xab\x8a\xdb\xef\xb3w<\x0f\x0d\x03\x1f\x8b\xc8\x11\x5c\
+\xd9'H\x14\x86NjG\xd0\xebi-\x18\x5c.\xf0\
+\x0e[\xa9B\xb6\xee\x89\xaf\x08\xeeb\x0d\x08:\x8d\xa8\
+\xbd\xf0\xcb\xe8\x0d\x9ec\xbe\xa8{\xcb\xe4\xe9\xbc\xff,\
+\x01\xdb#x\x1bk\x82`\xc6\x80G\x89[7\xc6\xf3\
+\xca\xa4\x87#8\x00\xb0EC\xaa\x90\xad{\xb0\x03\x80\
+\x19\xfc3\x98\xf1`\x07\xa9B\xb6\xfe\x9bE\xdb\xc7~\
+>a\xf6i][.\xb3\xeb\xbbs\x0f\xa6\xb5``\
+h\x22\xed\x19\x1bq\x91\x9f\xdb\xb5\xeb\x19\x1bh\x22m\
+\xa9\xa4_4\xb1\x82\x98ab%\x95\xf4\x8bF\xb1*\
+\x22\x17\xb7\x80\x88\x1c\xc5\xaa\xd1P\xbeh\xce\xafi\x13\
+i(\x1b\xc5\x126\x04\x8a%[Z\xffM`\xc7\xb0\
+a\x18\x80\xf1\x06\xf9\xc7&\xaa\xbb)vQ]\x93C\
+G\x90b'\x87$\x87\x8e\x89jQ\x18\xc6?A\x18\
+\x8ajY8\x0b\xfa\x8ej\xc7-\xe0\xa8v8\x0b\xfa\
+\xff\xe1\xd8\x01\x98\xd6\x82A$\xed\x03\x9a\xc4@?\x89\
+\xa4\xfdE\xba\xfd\xda\x83\xf0dt\x18\xc1\xbd\xb8\x9e\x88\
+&\x91s/\xc3\x93\xd1\xe1\xdf\x89v\x047\xafLz\
+[73\x13\x10\xf7\xb9f\xf0\x08:\x95\xd48\x1b\x06\
+o\x97#su\xe8\x1f\xfby\xcf\xd80\xb1r\xa5\xd0\
+\xa7\xda\x91\xbbJ\xe8\xff\xf1mI%\xfd\x22\xc5*\x0d\
+e\x8a%\x90?\xef\x964\x16\xd5\x95CGT+\xfc\
+\x1a|\xc6S|[E\xf3\x03\x8e\x8d\xde\xf7\xa7r\xe9\
+i\x00\x00\x00\x00IEND\xaeB`\x82\
 "
 
 qt_resource_name = b"\
-\x00\x09\
-\x0alxC\
-\x00r\
-\x00e\x00s\x00o\x00u\x00r\x00c\x00e\x00s\
-\x00\x0f\
-\x03\x0f\xdf\xc7\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0d\
+\x0d\x1f\xd2\x07\
+\x00i\
+\x00c\x00o\x00n\x00_\x001\x00_\x002\x000\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x0e\xf9fG\
+\x00h\
+\x00o\x00l\x00y\x00_\x00s\x00i\x00g\x00h\x00t\x00_\x004\x008\x00.\x00p\x00n\x00g\
+\
+\x00\x0d\
+\x0d\xdb\xd2\xe7\
+\x00i\
+\x00c\x00o\x00n\x00_\x002\x00_\x006\x004\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d7\xd2\x07\
+\x00i\
+\x00c\x00o\x00n\x00_\x001\x00_\x004\x008\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d?\xd3\xc7\
+\x00i\
+\x00c\x00o\x00n\x00_\x003\x00_\x004\x000\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d\x1f\xd2\xe7\
+\x00i\
+\x00c\x00o\x00n\x00_\x002\x00_\x002\x000\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d\x1b\xd2\x07\
+\x00i\
+\x00c\x00o\x00n\x00_\x001\x00_\x002\x004\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d\x85\xd2\x07\
+\x00i\
+\x00c\x00o\x00n\x00_\x001\x00_\x009\x006\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x0e\x15fG\
+\x00h\
+\x00o\x00l\x00y\x00_\x00s\x00i\x00g\x00h\x00t\x00_\x006\x004\x00.\x00p\x00n\x00g\
+\
+\x00\x0d\
+\x0d)\xd3\xc7\
+\x00i\
+\x00c\x00o\x00n\x00_\x003\x00_\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d)\xd2\xe7\
+\x00i\
+\x00c\x00o\x00n\x00_\x002\x00_\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x12\
+\x0a\x1f6\x87\
+\x00m\
+\x00o\x00v\x00e\x00_\x00c\x00u\x00r\x00s\x00o\x00r\x00_\x006\x004\x00.\x00p\x00n\
+\x00g\
+\x00\x0d\
+\x0d?\xd2\xe7\
+\x00i\
+\x00c\x00o\x00n\x00_\x002\x00_\x004\x000\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d\x1b\xd3\xc7\
+\x00i\
+\x00c\x00o\x00n\x00_\x003\x00_\x002\x004\x00.\x00p\x00n\x00g\
+\x00\x12\
+\x0a\xfb6\x87\
+\x00m\
+\x00o\x00v\x00e\x00_\x00c\x00u\x00r\x00s\x00o\x00r\x00_\x004\x000\x00.\x00p\x00n\
+\x00g\
+\x00\x0d\
+\x0d\x85\xd3\xc7\
+\x00i\
+\x00c\x00o\x00n\x00_\x003\x00_\x009\x006\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x0e\xcbfG\
+\x00h\
+\x00o\x00l\x00y\x00_\x00s\x00i\x00g\x00h\x00t\x00_\x001\x006\x00.\x00p\x00n\x00g\
+\
+\x00\x11\
+\x0eKfG\
+\x00h\
+\x00o\x00l\x00y\x00_\x00s\x00i\x00g\x00h\x00t\x00_\x009\x006\x00.\x00p\x00n\x00g\
+\
+\x00\x12\
+\x0a\xdf6\x87\
+\x00m\
+\x00o\x00v\x00e\x00_\x00c\x00u\x00r\x00s\x00o\x00r\x00_\x002\x004\x00.\x00p\x00n\
+\x00g\
+\x00\x11\
+\x0e\xf1fG\
+\x00h\
+\x00o\x00l\x00y\x00_\x00s\x00i\x00g\x00h\x00t\x00_\x004\x000\x00.\x00p\x00n\x00g\
+\
+\x00\x12\
+\x0a\xf36\x87\
 \x00m\
-\x00o\x00v\x00e\x00_\x00c\x00u\x00r\x00s\x00o\x00r\x00.\x00p\x00n\x00g\
-\x00\x0a\
-\x041\xa3\x87\
+\x00o\x00v\x00e\x00_\x00c\x00u\x00r\x00s\x00o\x00r\x00_\x004\x008\x00.\x00p\x00n\
+\x00g\
+\x00\x0d\
+\x0d?\xd2\x07\
 \x00i\
-\x00c\x00o\x00n\x00_\x001\x00.\x00p\x00n\x00g\
-\x00\x0a\
-\x04(\xa3\x87\
+\x00c\x00o\x00n\x00_\x001\x00_\x004\x000\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d\xdb\xd3\xc7\
 \x00i\
-\x00c\x00o\x00n\x00_\x002\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x01\x89\x9fg\
+\x00c\x00o\x00n\x00_\x003\x00_\x006\x004\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d)\xd2\x07\
+\x00i\
+\x00c\x00o\x00n\x00_\x001\x00_\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x0e\xd5fG\
 \x00h\
-\x00o\x00l\x00y\x00_\x00s\x00i\x00g\x00h\x00t\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x01\x89\x87\xbf\
+\x00o\x00l\x00y\x00_\x00s\x00i\x00g\x00h\x00t\x00_\x002\x004\x00.\x00p\x00n\x00g\
+\
+\x00\x0d\
+\x0d\xdb\xd2\x07\
+\x00i\
+\x00c\x00o\x00n\x00_\x001\x00_\x006\x004\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d7\xd3\xc7\
+\x00i\
+\x00c\x00o\x00n\x00_\x003\x00_\x004\x008\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d\x05\xd2\xe7\
+\x00i\
+\x00c\x00o\x00n\x00_\x002\x00_\x001\x006\x00.\x00p\x00n\x00g\
+\x00\x12\
+\x0a\xed6\x87\
+\x00m\
+\x00o\x00v\x00e\x00_\x00c\x00u\x00r\x00s\x00o\x00r\x00_\x003\x002\x00.\x00p\x00n\
+\x00g\
+\x00\x11\
+\x0e\xe7fG\
+\x00h\
+\x00o\x00l\x00y\x00_\x00s\x00i\x00g\x00h\x00t\x00_\x003\x002\x00.\x00p\x00n\x00g\
+\
+\x00\x0d\
+\x0d\x05\xd2\x07\
+\x00i\
+\x00c\x00o\x00n\x00_\x001\x00_\x001\x006\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d\x05\xd3\xc7\
+\x00i\
+\x00c\x00o\x00n\x00_\x003\x00_\x001\x006\x00.\x00p\x00n\x00g\
+\x00\x12\
+\x0a\xc16\x87\
+\x00m\
+\x00o\x00v\x00e\x00_\x00c\x00u\x00r\x00s\x00o\x00r\x00_\x001\x006\x00.\x00p\x00n\
+\x00g\
+\x00\x12\
+\x0aA6\x87\
+\x00m\
+\x00o\x00v\x00e\x00_\x00c\x00u\x00r\x00s\x00o\x00r\x00_\x009\x006\x00.\x00p\x00n\
+\x00g\
+\x00\x0d\
+\x0d7\xd2\xe7\
+\x00i\
+\x00c\x00o\x00n\x00_\x002\x00_\x004\x008\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d\x85\xd2\xe7\
+\x00i\
+\x00c\x00o\x00n\x00_\x002\x00_\x009\x006\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x0d\x1f\xd3\xc7\
+\x00i\
+\x00c\x00o\x00n\x00_\x003\x00_\x002\x000\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x0e\xd1fG\
 \x00h\
-\x00o\x00l\x00y\x00_\x00s\x00i\x00g\x00h\x00t\x00.\x00i\x00c\x00o\
-\x00\x0a\
-\x04+\xa3\x87\
+\x00o\x00l\x00y\x00_\x00s\x00i\x00g\x00h\x00t\x00_\x002\x000\x00.\x00p\x00n\x00g\
+\
+\x00\x12\
+\x0a\xdb6\x87\
+\x00m\
+\x00o\x00v\x00e\x00_\x00c\x00u\x00r\x00s\x00o\x00r\x00_\x002\x000\x00.\x00p\x00n\
+\x00g\
+\x00\x0d\
+\x0d\x1b\xd2\xe7\
 \x00i\
-\x00c\x00o\x00n\x00_\x003\x00.\x00p\x00n\x00g\
+\x00c\x00o\x00n\x00_\x002\x00_\x002\x004\x00.\x00p\x00n\x00g\
 "
 
 qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00(\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x92\x00\x01\x00\x00\x00\x01\x00\x01V\x00\
-\x00\x00\x01\x96R\xd9\xd2\x5c\
-\x00\x00\x00p\x00\x00\x00\x00\x00\x01\x00\x00\xfd/\
-\x00\x00\x01\x96R\xd89\xe5\
-\x00\x00\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x96WL\xaf\xf5\
-\x00\x00\x00V\x00\x00\x00\x00\x00\x01\x00\x00\x89\x9f\
-\x00\x00\x01\x922\x82\x85\xc6\
-\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x01\xe9=\
-\x00\x00\x01\x96V\xc8\xb9\x1b\
-\x00\x00\x00<\x00\x00\x00\x00\x00\x01\x00\x00\x17N\
-\x00\x00\x01\x922\x89@\x80\
+\x00\x00\x01\x80\x00\x00\x00\x00\x00\x01\x00\x006\xd6\
+\x00\x00\x01\xa1U\x85\x92\xf4\
+\x00\x00\x04\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x94\xc2\
+\x00\x00\x01\xa1U\x85\x92\xf8\
+\x00\x00\x04z\x00\x00\x00\x00\x00\x01\x00\x00\x93\x9a\
+\x00\x00\x01\xa1U\x85\x92\xe9\
+\x00\x00\x05V\x00\x00\x00\x00\x00\x01\x00\x00\xae\x08\
+\x00\x00\x01\xa1U\x85\x92\xeb\
+\x00\x00\x02\x84\x00\x00\x00\x00\x00\x01\x00\x00`\x1b\
+\x00\x00\x01\xa1U\x85\x92\xec\
+\x00\x00\x03\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x89\xd8\
+\x00\x00\x01\xa1U\x85\x92\xed\
+\x00\x00\x02\xd6\x00\x00\x00\x00\x00\x01\x00\x00i\xdf\
+\x00\x00\x01\xa1U\x85\x92\xf1\
+\x00\x00\x01\xea\x00\x00\x00\x00\x00\x01\x00\x00?\xad\
+\x00\x00\x01\xa1U\x85\x92\xef\
+\x00\x00\x04:\x00\x00\x00\x00\x00\x01\x00\x00\x90\xd7\
+\x00\x00\x01\xa1U\x85\x93\x08\
+\x00\x00\x03\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x88*\
+\x00\x00\x01\xa1U\x85\x93?\
+\x00\x00\x04Z\x00\x00\x00\x00\x00\x01\x00\x00\x92S\
+\x00\x00\x01\xa1U\x85\x93o\
+\x00\x00\x00\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x1b}\
+\x00\x00\x01\xa1U\x85\x93\x12\
+\x00\x00\x05\x80\x00\x00\x00\x00\x00\x01\x00\x00\xaf\xde\
+\x00\x00\x01\xa1U\x85\x93G\
+\x00\x00\x01\xca\x00\x00\x00\x00\x00\x01\x00\x00=\xdc\
+\x00\x00\x01\xa1U\x85\x93y\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1U\x85\x93\x0d\
+\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x19\x8c\
+\x00\x00\x01\xa1U\x85\x93C\
+\x00\x00\x05\x0e\x00\x00\x00\x00\x00\x01\x00\x00\xa8\xe7\
+\x00\x00\x01\xa1U\x85\x93t\
+\x00\x00\x03@\x00\x00\x00\x00\x00\x01\x00\x00vc\
+\x00\x00\x01\xa1U\x85\x93\x16\
+\x00\x00\x01`\x00\x00\x00\x00\x00\x01\x00\x003\x84\
+\x00\x00\x01\xa1U\x85\x93K\
+\x00\x00\x01@\x00\x00\x00\x00\x00\x01\x00\x001!\
+\x00\x00\x01\xa1U\x85\x93{\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x00\x12\x15\
+\x00\x00\x01\xa1U\x85\x93 \
+\x00\x00\x04\xce\x00\x00\x00\x00\x00\x01\x00\x00\x9b\x10\
+\x00\x00\x01\xa1U\x85\x93U\
+\x00\x00\x03\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x84\x8e\
+\x00\x00\x01\xa1U\x85\x93\x87\
+\x00\x00\x03\x00\x00\x00\x00\x00\x00\x01\x00\x00m\x8b\
+\x00\x00\x01\xa1U\x85\x93\x17\
+\x00\x00\x01\xaa\x00\x00\x00\x00\x00\x01\x00\x00:0\
+\x00\x00\x01\xa1U\x85\x93P\
+\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x16\x83\
+\x00\x00\x01\xa1U\x85\x93\x84\
+\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xd7\
+\x00\x00\x01\xa1U\x85\x93+\
+\x00\x00\x04\xee\x00\x00\x00\x00\x00\x01\x00\x00\x9fp\
+\x00\x00\x01\xa1U\x85\x93b\
+\x00\x00\x02\x14\x00\x00\x00\x00\x00\x01\x00\x00C\x22\
+\x00\x00\x01\xa1U\x85\x93\x97\
+\x00\x00\x03\x88\x00\x00\x00\x00\x00\x01\x00\x00}\xfe\
+\x00\x00\x01\xa1U\x85\x93#\
+\x00\x00\x00X\x00\x00\x00\x00\x00\x01\x00\x00\x0bv\
+\x00\x00\x01\xa1U\x85\x93W\
+\x00\x00\x03 \x00\x00\x00\x00\x00\x01\x00\x00qG\
+\x00\x00\x01\xa1U\x85\x93\x8f\
+\x00\x00\x01\x18\x00\x00\x00\x00\x00\x01\x00\x00'H\
+\x00\x00\x01\xa1U\x85\x92\xdb\
+\x00\x00\x02\x5c\x00\x00\x00\x00\x00\x01\x00\x00MH\
+\x00\x00\x01\xa1U\x85\x92\xe3\
+\x00\x00\x024\x00\x00\x00\x00\x00\x01\x00\x00J\xff\
+\x00\x00\x01\xa1U\x85\x92\xc6\
+\x00\x00\x05.\x00\x00\x00\x00\x00\x01\x00\x00\xaan\
+\x00\x00\x01\xa1U\x85\x92\xc7\
+\x00\x00\x03`\x00\x00\x00\x00\x00\x01\x00\x00y\x9d\
+\x00\x00\x01\xa1U\x85\x92\xc8\
+\x00\x00\x04\x12\x00\x00\x00\x00\x00\x01\x00\x00\x8b\xbb\
+\x00\x00\x01\xa1U\x85\x92\xcd\
+\x00\x00\x02\xae\x00\x00\x00\x00\x00\x01\x00\x00b&\
+\x00\x00\x01\xa1U\x85\x92\xcf\
+\x00\x00\x000\x00\x00\x00\x00\x00\x01\x00\x00\x01\xeb\
+\x00\x00\x01\xa1U\x85\x92\xda\
 "
 
 def qInitResources():
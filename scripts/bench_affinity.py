@@ -0,0 +1,146 @@
+"""
+Check that a pinned, low-priority overlay leaves the CPUs reserved for the game alone.
+
+    python scripts/bench_affinity.py [--reserve 0-1] [--seconds 5] [--nice 10]
+
+Every CPU runs a busy worker standing in for the game. The workers on the reserved CPUs are measured three times:
+alone, next to a busy overlay without limits, and next to the same overlay started with `--cpus` set to the other
+CPUs and `--nice`. The overlay is kept busy with dynamic crosshair transitions and size changes, so it always has
+work. Linux only, needs at least two CPUs.
+"""
+import os, sys, json, time, argparse, resource, subprocess, multiprocessing  # noqa E401
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core.priority import apply_process_limits, parse_cpu_list  # noqa: E402
+
+STIMULUS_MS = 4  # Input toggles and size changes sent to the overlay
+
+
+def worker(cpu: int, seconds: float, results) -> None:
+    os.sched_setaffinity(0, [cpu])
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(10_000):
+            count += 1
+    results.put((cpu, count))
+
+
+def run_workers(cpus: list[int], seconds: float, overlay_args: list[str] = None) -> dict:
+    """Throughput per CPU, optionally with an overlay process running alongside"""
+    overlay = None
+    if overlay_args is not None:
+        overlay = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--overlay", "--seconds", str(seconds + 2), *overlay_args],
+            stdout=subprocess.PIPE
+        )
+        time.sleep(1.5)  # Startup is not what is measured
+
+    results = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=worker, args=(cpu, seconds, results)) for cpu in cpus]
+    for process in workers:
+        process.start()
+    counts = dict(results.get() for _ in workers)
+    for process in workers:
+        process.join()
+
+    report = {"counts": counts}
+    if overlay is not None:
+        out, _ = overlay.communicate()
+        report["overlay"] = json.loads(out.decode().strip().splitlines()[-1])
+    return report
+
+
+def run_overlay(args) -> int:
+    """Child process: a HolySight kept busy for `seconds`, prints its CPU time and where it ran"""
+    applied = apply_process_limits(args.nice or 0, None, parse_cpu_list(args.cpus) if args.cpus else None)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    import tempfile
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QTimer
+    from resources import icons  # noqa: F401
+    from windows import HolySight
+    from core import FakeInputSource
+
+    app = QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as tmp:
+        settings_path = os.path.join(tmp, "settings.json")
+        with open(settings_path, "w") as f:
+            json.dump({"ch_dynamic": True}, f)
+        source = FakeInputSource({"mouse_left", "mouse_right"})
+        window = HolySight(input_source=source, settings_path=settings_path)
+
+        state = {"pressed": False, "size": 8}
+
+        def stimulate() -> None:
+            state["pressed"] = not state["pressed"]
+            (source.press if state["pressed"] else source.release)("mouse_left")
+            state["size"] = 8 + (state["size"] - 7) % 40
+            window.tray_menu.size_slider.setValue(state["size"])
+
+        timer = QTimer()
+        timer.timeout.connect(stimulate)
+        timer.start(STIMULUS_MS)
+        QTimer.singleShot(round(args.seconds * 1000), app.exit)
+        app.exec()
+        window._allow_close = True
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    print(json.dumps({
+        "applied": applied,
+        "cpu_seconds": usage.ru_utime + usage.ru_stime,
+        "affinity": sorted(os.sched_getaffinity(0)),
+    }))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reserve", metavar="LIST", help="CPUs reserved for the game, the first half by default")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Length of each measurement")
+    parser.add_argument("--nice", type=int, default=10, help="Niceness of the pinned overlay")
+    parser.add_argument("--overlay", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--cpus", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.overlay:
+        return run_overlay(args)
+
+    if not hasattr(os, "sched_setaffinity"):
+        print("CPU affinity is not available on this platform", file=sys.stderr)
+        return 1
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) < 2:
+        print(f"Needs at least two CPUs, this process may use {cpus}", file=sys.stderr)
+        return 1
+    reserved = parse_cpu_list(args.reserve) if args.reserve else cpus[:len(cpus) // 2]
+    others = [cpu for cpu in cpus if cpu not in reserved]
+    if not others or not set(reserved) <= set(cpus):
+        print(f"--reserve must leave at least one of {cpus} for the overlay", file=sys.stderr)
+        return 1
+
+    phases = {
+        "alone": run_workers(cpus, args.seconds),
+        "unpinned": run_workers(cpus, args.seconds, []),
+        "pinned": run_workers(
+            cpus, args.seconds, ["--cpus", ",".join(map(str, others)), "--nice", str(args.nice)]
+        ),
+    }
+    baseline = sum(phases["alone"]["counts"][cpu] for cpu in reserved)
+    report = {"reserved": reserved, "overlay_cpus": others}
+    for name, phase in phases.items():
+        report[name] = {
+            "reserved_throughput": sum(phase["counts"][cpu] for cpu in reserved) / baseline,
+            "other_throughput": (
+                sum(phase["counts"][cpu] for cpu in others) / sum(phases["alone"]["counts"][cpu] for cpu in others)
+            ),
+            "overlay": phase.get("overlay"),
+        }
+    print(json.dumps(report, indent=4))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
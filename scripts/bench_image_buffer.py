@@ -0,0 +1,115 @@
+"""
+Benchmark per-frame pixel work through the zero-copy bridge against QImage.copy()-based code.
+
+    python scripts/bench_image_buffer.py [--size 256] [--frames 500]
+
+Both variants compute the same masked luminance statistic and a tinted output frame, the way auto contrast
+sampling and image tinting do. The copy-based variant copies the frame, converts it to a fresh array and allocates
+its temporaries every frame. The bridge variant views the QImage memory and reuses pooled buffers. NumPy allocations
+are counted with tracemalloc, QImage copies by their size.
+"""
+import os, sys, json, time, argparse, tracemalloc  # noqa E401
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+from PySide6.QtGui import QImage, QColor, QPainter  # noqa: E402
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from core.image_buffer import image_view, BufferPool  # noqa: E402
+
+LUMA_BGR = np.array([0.114, 0.587, 0.299], dtype=np.float32)
+TINT = np.array([0.0, 0.5, 1.0], dtype=np.float32)
+
+
+def _frame(size: int) -> QImage:
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setBrush(QColor("white"))
+    painter.drawEllipse(size // 8, size // 8, size * 3 // 4, size * 3 // 4)
+    painter.end()
+    return image
+
+
+def copy_based(image: QImage, mask: np.ndarray) -> tuple[float, QImage]:
+    frame = image.copy()
+    h, w = frame.height(), frame.width()
+    pixels = np.frombuffer(frame.constBits(), dtype=np.uint8, count=frame.sizeInBytes())
+    pixels = pixels.reshape(h, frame.bytesPerLine())[:, :w * 4].reshape(h, w, 4).copy()
+    luma = pixels[..., :3].astype(np.float32) @ LUMA_BGR
+    mean = float((luma * mask).sum() / mask.sum())
+    tinted = pixels.copy()
+    tinted[..., :3] = (luma[..., None] * TINT + 0.5).astype(np.uint8)
+    result = QImage(tinted.data, w, h, tinted.strides[0], QImage.Format.Format_ARGB32_Premultiplied).copy()
+    return mean, result
+
+
+def pooled(image: QImage, mask: np.ndarray, pool: BufferPool, result: QImage) -> tuple[float, QImage]:
+    pixels = image_view(image)
+    h, w = pixels.shape[:2]
+    luma = pool.get("luma", (h, w))
+    tmp = pool.get("tmp", (h, w))
+    rgb = pool.get("rgb", (h, w, 3))
+    rgb[...] = pixels[..., :3]  # Converted in place, matmul on uint8 would allocate the float copy
+    np.matmul(rgb, LUMA_BGR, out=luma)
+    np.multiply(luma, mask, out=tmp)
+    mean = float(tmp.sum() / mask.sum())
+    out = image_view(result, writable=True)
+    np.multiply(luma[..., None], TINT, out=rgb)
+    rgb += 0.5
+    out[..., :3] = rgb
+    out[..., 3] = pixels[..., 3]
+    return mean, result
+
+
+def measure(run, frames: int) -> dict:
+    run()  # Warm up, fills the pool
+    tracemalloc.start()
+    allocated = 0
+    t = time.perf_counter()
+    for _ in range(frames):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run()
+        allocated += tracemalloc.get_traced_memory()[1] - before
+    elapsed = time.perf_counter() - t
+    tracemalloc.stop()
+    return {"ms_per_frame": elapsed / frames * 1000, "numpy_bytes_per_frame": allocated // frames}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=256, help="Frame side in pixels")
+    parser.add_argument("--frames", type=int, default=500)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])  # noqa: F841
+    image = _frame(args.size)
+    y, x = np.ogrid[:args.size, :args.size]
+    mask = ((x - args.size / 2) ** 2 + (y - args.size / 2) ** 2 > (args.size / 4) ** 2).astype(np.float32)
+    pool = BufferPool()
+    result = QImage(image.size(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    expected, _ = copy_based(image, mask)
+    actual, _ = pooled(image, mask, pool, result)
+    if abs(expected - actual) > 1e-3:
+        print(f"Variants disagree: {expected} != {actual}", file=sys.stderr)
+        return 1
+
+    report = {
+        "frame": f"{args.size}x{args.size}",
+        "copy": measure(lambda: copy_based(image, mask), args.frames),
+        "bridge": measure(lambda: pooled(image, mask, pool, result), args.frames),
+    }
+    report["copy"]["qimage_bytes_per_frame"] = 2 * image.sizeInBytes()  # The input copy and the output copy
+    report["bridge"]["qimage_bytes_per_frame"] = 0
+    report["pool"] = {"hits": pool.hits, "misses": pool.misses}
+    print(json.dumps(report, indent=4))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
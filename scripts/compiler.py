@@ -1 +1,96 @@
+"""
+Build the embedded resources.
 
+    python scripts/compiler.py [--no-rcc]
+
+Renders every icon in `SOURCES` at the sizes of `core.icon_cache` into `resources/sized/<name>_<px>.png`, writes
+`scripts/icons.qrc` listing them under `:/icons` and compiles it into `resources/icons.py` with pyside6-rcc. The
+large source PNGs stay in `resources/` as the originals and are not embedded. Run it after changing an icon.
+"""
+import os, sys, shutil, argparse, subprocess  # noqa E401
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PySide6.QtGui import QImage, QPainter  # noqa: E402
+from PySide6.QtCore import Qt  # noqa: E402
+
+from core.icon_cache import SIZED_DIR, RESOURCE_PREFIX, pixel_sizes  # noqa: E402
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+RESOURCES_DIR = os.path.join(SCRIPTS_DIR, "..", "resources")
+QRC_PATH = os.path.join(SCRIPTS_DIR, "icons.qrc")
+SOURCES = ("holy_sight", "move_cursor", "icon_1", "icon_2", "icon_3")
+
+
+def render_icon(source: QImage, size: int) -> QImage:
+    """
+    Fit `source` into a transparent `size` square. It is halved step by step first, a single smooth scale from a
+    thousand pixels to 16 skips most source pixels and aliases thin lines.
+    """
+    image = source.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    while max(image.width(), image.height()) >= 2 * size:
+        image = image.scaled(
+            image.width() // 2, image.height() // 2, Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    image = image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+    icon = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    icon.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(icon)
+    painter.drawImage((size - image.width()) // 2, (size - image.height()) // 2, image)
+    painter.end()
+    return icon.convertToFormat(QImage.Format.Format_ARGB32)
+
+
+def build_icons() -> list[str]:
+    """Render every source at every size, returns the written files"""
+    os.makedirs(SIZED_DIR, exist_ok=True)
+    written = []
+    for name in SOURCES:
+        source = QImage(os.path.join(RESOURCES_DIR, f"{name}.png"))
+        if source.isNull():
+            raise FileNotFoundError(f"Cannot read the icon source {name}.png")
+        for size in pixel_sizes():
+            path = os.path.join(SIZED_DIR, f"{name}_{size}.png")
+            if not render_icon(source, size).save(path, "PNG", 0):  # Quality 0 is the strongest compression
+                raise OSError(f"Cannot write {path}")
+            written.append(path)
+    return written
+
+
+def write_qrc(files: list[str]) -> None:
+    entries = "\n".join(
+        f'    <file alias="{os.path.basename(path)}">'
+        f'{os.path.relpath(path, SCRIPTS_DIR).replace(os.sep, "/")}</file>'
+        for path in files
+    )
+    with open(QRC_PATH, "w") as f:
+        f.write(
+            f'<RCC version="1.0">\n<qresource prefix="{RESOURCE_PREFIX[1:]}">\n{entries}\n</qresource>\n</RCC>\n\n'
+            "<!-- Generated by scripts/compiler.py, edit SOURCES there instead -->\n"
+        )
+
+
+def compile_qrc() -> None:
+    rcc = shutil.which("pyside6-rcc")
+    if rcc is None:
+        raise FileNotFoundError("pyside6-rcc is not on the PATH, it comes with PySide6")
+    subprocess.run([rcc, QRC_PATH, "-o", os.path.join(RESOURCES_DIR, "icons.py")], check=True, cwd=SCRIPTS_DIR)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--no-rcc", action="store_true", help="Only render the icons and write the .qrc file")
+    args = parser.parse_args()
+
+    files = build_icons()
+    write_qrc(files)
+    if not args.no_rcc:
+        compile_qrc()
+    print(f"{len(files)} icons, {sum(os.path.getsize(path) for path in files)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+Pixel comparison of the rendered overlay against stored golden images.
+
+    python scripts/golden_images.py [--only PATTERN] [--tolerance 0] [--max-pixels 0] [--out golden_diff]
+    python scripts/golden_images.py --update [--only PATTERN]
+
+Every case starts a HolySight with its own settings under the offscreen platform, waits for the background image
+work to finish and grabs the whole window, with the window opacity applied the way a compositor would. The grab is
+compared to `scripts/golden/<case>.png`: a pixel fails when one of its channels differs by more than `--tolerance`,
+and the case fails when more than `--max-pixels` pixels do. The expected, actual and diff images of failed cases are
+written to `--out`. `--update` regenerates the goldens instead, review them before committing.
+
+Run it before and after a rendering change, the output must not change unless the change is meant to change it.
+"""
+import os, sys, json, time, fnmatch, argparse, tempfile  # noqa E401
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+from PySide6.QtGui import QImage, QPainter  # noqa: E402
+from PySide6.QtCore import Qt, QThreadPool  # noqa: E402
+
+from resources import icons  # noqa: E402, F401
+from windows import HolySight  # noqa: E402
+from core import FakeInputSource, FakeStackingSource  # noqa: E402
+from core.image_buffer import image_view  # noqa: E402
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+FIXTURES = os.path.join(GOLDEN_DIR, "fixtures")
+SETTLE_TIMEOUT_S = 10.0  # Longest wait for image imports and mipmaps of a single case
+
+PNG = os.path.join(FIXTURES, "ring.png")
+SVG = os.path.join(FIXTURES, "chevron.svg")
+GIF = os.path.join(FIXTURES, "plus.gif")  # Animated, the first frame is the crosshair
+
+# Case name -> settings on top of the defaults. Quality and power are pinned, the governor must not pick a tier.
+CASES = {
+    "size_4": {"ch_size": 4},
+    "size_8": {"ch_size": 8},
+    "size_23": {"ch_size": 23},
+    "size_64": {"ch_size": 64},
+    "color_cyan": {"ch_size": 16, "ch_color": "#00ffff"},
+    "color_white": {"ch_size": 16, "ch_color": "white"},
+    "border_1": {"ch_size": 16, "ch_border_thickness": 1},
+    "border_3_magenta": {"ch_size": 24, "ch_border_thickness": 3, "ch_border_color": "#ff00ff"},
+    "border_fills_dot": {"ch_size": 6, "ch_border_thickness": 3, "ch_border_color": "white"},
+    "opacity_50": {"ch_size": 16, "ch_opacity": 0.5},
+    "opacity_10": {"ch_size": 16, "ch_opacity": 0.1, "ch_color": "white"},
+    "png_32": {"ch_size": 32, "ch_img": PNG},
+    "png_64": {"ch_size": 64, "ch_img": PNG},
+    "png_outline": {"ch_size": 64, "ch_img": PNG, "ch_border_thickness": 2},
+    "png_tint": {"ch_size": 48, "ch_img": PNG, "ch_tint": True, "ch_color": "#00ff00"},
+    "png_opacity": {"ch_size": 48, "ch_img": PNG, "ch_opacity": 0.6},
+    "svg_24": {"ch_size": 24, "ch_img": SVG},
+    "svg_96": {"ch_size": 96, "ch_img": SVG},
+    "svg_tint_outline": {"ch_size": 40, "ch_img": SVG, "ch_tint": True, "ch_border_thickness": 1},
+    "gif_16": {"ch_size": 16, "ch_img": GIF},
+    "gif_40_outline": {"ch_size": 40, "ch_img": GIF, "ch_border_thickness": 1, "ch_border_color": "white"},
+    "markers": {
+        "ch_size": 8,
+        "ch_markers": [
+            {"color": "white", "size": 6, "offset_y": 24},
+            {"color": "#ffff00", "size": 10, "border_thickness": 2, "offset_x": -30, "offset_y": 40},
+            {"img": PNG, "size": 20, "offset_x": 40, "offset_y": -40},
+        ],
+    },
+}
+PINNED = {"render_quality": "smooth", "power_policy": "performance"}
+
+
+def render_case(settings: dict) -> QImage:
+    """Start a HolySight with `settings`, wait until it is fully built and grab it as straight-alpha ARGB32"""
+    with tempfile.TemporaryDirectory() as tmp:
+        settings_path = os.path.join(tmp, "settings.json")
+        with open(settings_path, "w") as f:
+            json.dump({**settings, **PINNED}, f)
+        window = HolySight(
+            input_source=FakeInputSource({"mouse_left", "mouse_right"}),
+            stacking_source=FakeStackingSource(),
+            settings_path=settings_path
+        )
+        try:
+            deadline = time.monotonic() + SETTLE_TIMEOUT_S
+            while True:
+                QThreadPool.globalInstance().waitForDone()
+                QApplication.processEvents()  # Results of background tasks are delivered as queued signals
+                built = not window._showing_cached and (not window.ch_img or window._mipmaps is not None)
+                if built and QThreadPool.globalInstance().activeThreadCount() == 0:
+                    break
+                if time.monotonic() > deadline:
+                    raise TimeoutError("the crosshair was not built in time")
+                time.sleep(0.01)
+
+            grab = window.grab().toImage()
+            image = QImage(grab.size(), QImage.Format.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(grab.devicePixelRatio())
+            image.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(image)
+            painter.setOpacity(window.windowOpacity())  # Window opacity is applied when compositing, not in grab()
+            painter.drawImage(0, 0, grab)
+            painter.end()
+        finally:
+            window._allow_close = True
+            window.close()
+            window.tray_icon.hide()
+            window.deleteLater()
+            QApplication.processEvents()
+    return image.convertToFormat(QImage.Format.Format_ARGB32)
+
+
+def compare(expected: QImage, actual: QImage, tolerance: int) -> tuple[np.ndarray, int]:
+    """Per-pixel largest channel difference and the number of pixels above `tolerance`"""
+    a = image_view(expected.convertToFormat(QImage.Format.Format_ARGB32)).astype(np.int16)
+    b = image_view(actual).astype(np.int16)
+    difference = np.abs(a - b).max(axis=2)
+    return difference, int(np.count_nonzero(difference > tolerance))
+
+
+def diff_image(expected: QImage, difference: np.ndarray, tolerance: int) -> QImage:
+    """Faint gray copy of the expected image, failing pixels in red, differences within the tolerance in yellow"""
+    alpha = image_view(expected.convertToFormat(QImage.Format.Format_ARGB32))[..., 3]
+    out = np.zeros(difference.shape + (4,), dtype=np.uint8)  # BGRA
+    out[..., :3] = 128
+    out[..., 3] = 32 + alpha // 4
+    out[(difference > 0) & (difference <= tolerance)] = (0, 255, 255, 255)
+    out[difference > tolerance] = (0, 0, 255, 255)
+    image = QImage(out.data, out.shape[1], out.shape[0], out.strides[0], QImage.Format.Format_ARGB32)
+    return image.copy()  # Detach from the array
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--update", action="store_true", help="Regenerate the golden images instead of comparing")
+    parser.add_argument("--only", metavar="PATTERN", help="Run only the cases matching this glob pattern")
+    parser.add_argument("--tolerance", type=int, default=0, help="Largest channel difference a pixel may have")
+    parser.add_argument("--max-pixels", type=int, default=0, help="Pixels allowed above the tolerance per case")
+    parser.add_argument("--out", default="golden_diff", help="Directory for the images of failed cases")
+    args = parser.parse_args()
+
+    cases = {name: settings for name, settings in CASES.items() if not args.only or fnmatch.fnmatch(name, args.only)}
+    if not cases:
+        print(f"No case matches {args.only!r}", file=sys.stderr)
+        return 1
+
+    app = QApplication(sys.argv[:1])  # noqa: F841
+    results: dict[str, dict] = {}
+    for name, settings in cases.items():
+        golden_path = os.path.join(GOLDEN_DIR, f"{name}.png")
+        actual = render_case(settings)
+        if args.update:
+            actual.save(golden_path)
+            results[name] = {"status": "updated"}
+            continue
+
+        expected = QImage(golden_path)
+        if expected.isNull():
+            results[name] = {"status": "missing"}
+            continue
+        if expected.size() != actual.size():
+            results[name] = {"status": "size", "expected": list(expected.size().toTuple()),
+                             "actual": list(actual.size().toTuple())}
+            continue
+        difference, failing = compare(expected, actual, args.tolerance)
+        results[name] = {"status": "ok" if failing <= args.max_pixels else "failed", "pixels": failing,
+                         "max_difference": int(difference.max())}
+        if failing > args.max_pixels:
+            os.makedirs(args.out, exist_ok=True)
+            expected.save(os.path.join(args.out, f"{name}.expected.png"))
+            actual.save(os.path.join(args.out, f"{name}.actual.png"))
+            diff_image(expected, difference, args.tolerance).save(os.path.join(args.out, f"{name}.diff.png"))
+
+    stale = sorted(
+        f[:-4] for f in os.listdir(GOLDEN_DIR) if f.endswith(".png") and f[:-4] not in CASES
+    )
+    print(json.dumps({"cases": results, "stale_goldens": stale}, indent=4))
+    failed = [name for name, result in results.items() if result["status"] not in ("ok", "updated")]
+    if failed:
+        print(f"FAIL: {', '.join(failed)} (images of failed cases in {args.out})", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Headless check that a visible, unchanged HolySight does not wake the GUI thread.
+
+    python scripts/idle_check.py [--seconds 10]
+
+Exits with 1 when anything besides the check's own measuring loop wakes the event loop.
+"""
+import os, sys, json, argparse, tempfile  # noqa E401
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+from PySide6.QtCore import Qt, QTimer, QEventLoop  # noqa: E402
+
+from resources import icons  # noqa: E402, F401
+from windows import HolySight  # noqa: E402
+
+ALLOWED_WAKEUPS = 2  # Entering the measured loop and the single-shot timer that ends it
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0, help="Length of the measured idle window")
+    parser.add_argument("--settle", type=float, default=1.0, help="Startup time ignored before measuring")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])  # noqa: F841
+    with tempfile.TemporaryDirectory() as tmp:
+        settings_path = os.path.join(tmp, "settings.json")
+        with open(settings_path, "w") as f:
+            json.dump({}, f)
+        window = HolySight(settings_path=settings_path)
+
+        loop = QEventLoop()
+        QTimer.singleShot(round(args.settle * 1000), loop.quit)
+        loop.exec()
+
+        stop_timer = QTimer()
+        stop_timer.setSingleShot(True)
+        stop_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        stop_timer.timeout.connect(loop.quit)
+
+        window.wakeup_counter.start()
+        stop_timer.start(round(args.seconds * 1000))
+        loop.exec()
+        window.wakeup_counter.stop()
+
+    stats = window.wakeup_counter.snapshot()
+    print(json.dumps(stats, indent=4))
+    if stats["wakeups"] > ALLOWED_WAKEUPS or stats["paint_events"]:
+        print("FAIL: the idle overlay woke up", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+Soak test of the tray menu handlers: memory, object counts, stylesheets, connections and latency must stay flat.
+
+    python scripts/soak_tray.py [--iterations 200000] [--sample-every 5000] [--seed 1] [--remote]
+
+Drives `SystemTrayMenu` of a headless HolySight with random slider values, color changes, image set and reset
+cycles and move-mode toggles through the move button. Every `--sample-every` iterations it records the RSS, the
+number of Python objects, the longest crosshair stylesheet, the receivers of the signals that used to be reconnected
+and the median and p99 latency of every operation since the last sample, timed apart with and without an image. The
+first sample, taken after `--warmup` iterations, is the baseline. Exits with 1 when the last sample grows beyond a
+bound.
+
+`--remote` drives the config UI of the split mode instead: the menu runs on a `RemoteHolySight` that sends its
+changes to a `StandaloneOverlay` in the same process, and the overlay must end up with the settings of the menu.
+"""
+import os, gc, sys, json, time, random, argparse, resource, tempfile  # noqa E401
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+from PySide6.QtCore import QThreadPool, SIGNAL  # noqa: E402
+
+from resources import icons  # noqa: E402, F401
+from windows import HolySight, RemoteHolySight  # noqa: E402
+from overlay import StandaloneOverlay  # noqa: E402
+from core import FakeInputSource, FakeStackingSource  # noqa: E402
+
+IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden", "fixtures", "ring.png")
+LATENCY_FLOOR_MS = 0.05  # Medians below this are timer noise, growth is measured from here
+Window = HolySight | RemoteHolySight  # The parent of the tray menu
+SYNCED_KEYS = ("ch_size", "ch_color", "ch_border_color", "ch_border_thickness", "ch_img")  # Checked with --remote
+
+
+def rss_bytes() -> int:
+    """Current resident set size, the peak where /proc is not available"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def operations(window: Window, image: str) -> dict:
+    """Operation name -> callable taking a `random.Random`, each one a single tray menu handler"""
+    menu = window.tray_menu
+
+    def random_color(rng: random.Random) -> str:
+        return f"#{rng.randrange(1 << 24):06x}"
+
+    def toggle_image(rng: random.Random) -> None:
+        if window.ch_img:
+            menu.reset_custom_img()
+        else:
+            menu.load_custom_img(image)
+
+    return {
+        "size": lambda rng: menu.size_slider.setValue(rng.randint(6, 400)),
+        "opacity": lambda rng: menu.opacity_slider.setValue(rng.randint(0, 255)),
+        "border": lambda rng: menu.border_slider.setValue(rng.randint(0, 10)),
+        "color": lambda rng: menu.set_ch_color(random_color(rng)),
+        "border_color": lambda rng: menu.set_ch_border_color(random_color(rng)),
+        "image": toggle_image,
+        "move_mode": lambda rng: menu.move_cursor_btn.click(),
+    }
+
+
+def sample(window: Window, latencies: dict[str, list[int]], stylesheet: int, iteration: int) -> dict:
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+    gc.collect()
+    menu = window.tray_menu
+    return {
+        "iteration": iteration,
+        "rss_mb": rss_bytes() / (1 << 20),
+        "objects": len(gc.get_objects()),
+        "stylesheet": stylesheet,
+        "connections": (
+            menu.move_cursor_btn.receivers(SIGNAL("clicked(bool)"))
+            + menu.custom_img.receivers(SIGNAL("triggered(bool)"))
+        ),
+        "latency_ms": {
+            name: {"p50": float(np.percentile(values, 50)) / 1e6, "p99": float(np.percentile(values, 99)) / 1e6}
+            for name, values in latencies.items() if values
+        },
+    }
+
+
+def check(first: dict, last: dict, args) -> list[str]:
+    failures = []
+    if last["rss_mb"] - first["rss_mb"] > args.max_rss_growth_mb:
+        failures.append(f"RSS grew from {first['rss_mb']:.1f} to {last['rss_mb']:.1f} MB")
+    if last["objects"] - first["objects"] > args.max_object_growth:
+        failures.append(f"Python objects grew from {first['objects']} to {last['objects']}")
+    if last["stylesheet"] > args.max_stylesheet:
+        failures.append(f"The crosshair stylesheet is {last['stylesheet']} characters long")
+    if last["connections"] > first["connections"]:
+        failures.append(f"Signal receivers grew from {first['connections']} to {last['connections']}")
+    for name, latency in last["latency_ms"].items():
+        baseline = max(first["latency_ms"].get(name, latency)["p50"], LATENCY_FLOOR_MS)
+        if latency["p50"] > baseline * args.max_latency_growth:
+            failures.append(f"Median {name} latency grew from {baseline:.3f} to {latency['p50']:.3f} ms")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200_000, help="Tray operations after the warmup")
+    parser.add_argument("--warmup", type=int, default=1000, help="Operations before the baseline sample")
+    parser.add_argument("--sample-every", type=int, default=5000, help="Operations between two samples")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the operation and value sequence")
+    parser.add_argument("--max-rss-growth-mb", type=float, default=32.0, help="Allowed RSS growth")
+    parser.add_argument("--max-object-growth", type=int, default=2000, help="Allowed growth of the object count")
+    parser.add_argument("--max-stylesheet", type=int, default=256, help="Longest allowed crosshair stylesheet")
+    parser.add_argument("--max-latency-growth", type=float, default=3.0, help="Allowed median latency factor")
+    parser.add_argument("--report", metavar="PATH", help="Also write every sample to this JSON file")
+    parser.add_argument("--remote", action="store_true", help="Drive the split mode config UI and its overlay")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])  # noqa: F841
+    errors: list[str] = []  # Exceptions raised in slots, Qt only prints them
+    excepthook = sys.excepthook
+    sys.excepthook = lambda kind, value, tb: (errors.append(f"{kind.__name__}: {value}"), excepthook(kind, value, tb))
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        settings_path = os.path.join(tmp, "settings.json")
+        with open(settings_path, "w") as f:
+            json.dump({"render_quality": "smooth", "power_policy": "performance"}, f)  # Latency of one tier
+        overlay = None
+        if args.remote:
+            overlay = StandaloneOverlay(settings_path)
+            if not overlay.server.listen():
+                print("FAIL: Another HolySight instance is running", file=sys.stderr)
+                return 1
+            window = RemoteHolySight(overlay.state(), settings_path)  # What main.py gets from the sync command
+        else:
+            window = HolySight(
+                input_source=FakeInputSource({"mouse_left", "mouse_right"}),
+                stacking_source=FakeStackingSource(),
+                settings_path=settings_path
+            )
+        ops = operations(window, window.import_image(IMAGE))
+        names = list(ops)
+
+        samples: list[dict] = []
+        latencies: dict[str, list[int]] = {}
+        stylesheet = 0  # Image resets rebuild it, so growth shows between two samples rather than at them
+        for iteration in range(1, args.warmup + args.iterations + 1):
+            name = rng.choice(names)
+            kind = f"{name}/image" if window.ch_img else name  # Image crosshairs are reprocessed, timed apart
+            start = time.perf_counter_ns()
+            ops[name](rng)
+            latencies.setdefault(kind, []).append(time.perf_counter_ns() - start)
+            stylesheet = max(stylesheet, len(window.crosshair.styleSheet()))
+            QApplication.processEvents()  # Deliver background results and queued updates, as the event loop would
+
+            done = iteration - args.warmup
+            if done == 0 or (done > 0 and (done % args.sample_every == 0 or done == args.iterations)):
+                samples.append(sample(window, latencies, stylesheet, iteration))
+                print(json.dumps(samples[-1]), flush=True)
+                latencies = {}
+                stylesheet = 0
+
+        failures = check(samples[0], samples[-1], args)
+        failures.extend(f"Raised {error}" for error in sorted(set(errors)))
+        if overlay is not None:
+            window.flush()
+            QApplication.processEvents()  # The overlay reads the last command
+            for key in SYNCED_KEYS:
+                expected, actual = getattr(window, key), overlay.settings.get(key)
+                if actual != expected:
+                    failures.append(f"The overlay has {key} {actual!r}, the menu set {expected!r}")
+            overlay._allow_close = True
+            overlay.close()
+        window._allow_close = True
+        window.close()
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"samples": samples, "failures": failures}, f, indent=4)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,2 @@
+from .marker_menu import MarkerMenu
 from .tray_menu import SystemTrayMenu
@@ -0,0 +1,96 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QMenu, QSlider, QVBoxLayout, QWidget, QWidgetAction, QColorDialog, QPushButton, QHBoxLayout
+)
+
+
+class MarkerMenu(QMenu):
+    """Submenu listing the secondary markers, rebuilt every time it is opened"""
+
+    def __init__(self, parent: QMenu, window: QWidget):
+        super().__init__("Markers", parent)
+        self.window = window
+        self._submenus: list[QMenu] = []
+        self.aboutToShow.connect(self._rebuild)
+
+    def _rebuild(self) -> None:
+        self.clear()  # Removes the submenu actions only, the submenus with their widgets stay children of this menu
+        for menu in self._submenus:
+            menu.deleteLater()
+        self._submenus.clear()
+        for index, marker in enumerate(self.window.marker_layer.markers):  # type: ignore[attr-defined]
+            menu = self.addMenu(f"Marker {index + 1}")
+            self._submenus.append(menu)
+            self._add_slider(menu, "Size", 6, 400, marker.size, index, "size")
+            self._add_slider(menu, "Horizontal offset", -200, 200, marker.offset_x, index, "offset_x")
+            self._add_slider(menu, "Vertical offset", -200, 200, marker.offset_y, index, "offset_y")
+            self._add_slider(menu, "Border thickness", 0, 10, marker.border_thickness, index, "border_thickness")
+            self._add_color_buttons(menu, index)
+            menu.addSeparator()
+            remove_action = menu.addAction("Remove")
+            remove_action.triggered.connect(lambda _=False, i=index: self.window.remove_marker(i))  # type: ignore
+
+        if self.window.marker_layer.markers:  # type: ignore[attr-defined]
+            self.addSeparator()
+        add_action = self.addAction("Add marker")
+        add_action.triggered.connect(self.window.add_marker)  # type: ignore[attr-defined]
+
+    def _add_slider(self, menu: QMenu, tooltip: str, low: int, high: int, value: int, index: int, key: str) -> None:
+        slider_widget = QWidget()
+
+        slider = QSlider(Qt.Orientation.Horizontal)
+        slider.setFixedWidth(80)
+        slider.setToolTip(tooltip)
+        slider.setRange(low, high)
+        slider.setValue(value)
+        slider.valueChanged.connect(lambda v: self.window.update_marker(index, **{key: v}))  # type: ignore
+
+        layout = QVBoxLayout(slider_widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(slider)
+
+        action = QWidgetAction(menu)
+        action.setDefaultWidget(slider_widget)
+        menu.addAction(action)
+
+    def _add_color_buttons(self, menu: QMenu, index: int) -> None:
+        marker = self.window.marker_layer.markers[index]  # type: ignore[attr-defined]
+        container = QWidget()
+        layout = QHBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self._color_button("Marker color", marker.color, index, "color"))
+        layout.addWidget(self._color_button("Marker border color", marker.border_color, index, "border_color"))
+
+        action = QWidgetAction(menu)
+        action.setDefaultWidget(container)
+        menu.addAction(action)
+
+    def _color_button(self, tooltip: str, color: str, index: int, key: str) -> QPushButton:
+        button = QPushButton()
+        button.setFixedSize(22, 22)
+        button.setToolTip(tooltip)
+        self._style_color_button(button, color)
+        button.clicked.connect(lambda: self._pick_color(button, index, key))
+        return button
+
+    def _pick_color(self, button: QPushButton, index: int, key: str) -> None:
+        color = QColorDialog.getColor()
+        if color.isValid():
+            self._style_color_button(button, color.name())
+            self.window.update_marker(index, **{key: color.name()})  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _style_color_button(button: QPushButton, color: str) -> None:
+        button.setStyleSheet(
+            f"""
+            QPushButton {{
+                background-color: {color};
+                border: 1px solid black;
+            }}
+            QPushButton:hover {{
+                background-color: {color};
+            }}
+            """
+        )
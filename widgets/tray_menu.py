@@ -1,10 +1,15 @@
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QIcon
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QPixmap, QActionGroup
 from PySide6.QtWidgets import (
     QApplication, QMenu, QLabel, QSlider, QVBoxLayout, QWidget, QWidgetAction, QColorDialog, QPushButton, QHBoxLayout,
     QFileDialog
 )
 
+from core import crosshair_stylesheet, icon
+from .marker_menu import MarkerMenu
+
+SMOOTH_DELAY_MS = 120  # Idle time in a held size drag before the high quality frame is rendered
+
 menu_style = """
     QMenu {
         background-color: #2c2c2c;
@@ -71,13 +76,47 @@ class SystemTrayMenu(QMenu):
 
         self.addSeparator()
 
-        self.custom_img = self.addAction(QIcon(":/resources/icon_2.png"), "Reset" if self._ch_img else "Set image")
-        self.custom_img.triggered.connect(self.reset_custom_img if self._ch_img else self.set_custom_img)
+        self.markers_menu = MarkerMenu(self, parent)
+        self.addMenu(self.markers_menu)
+
+        self.custom_img = self.addAction(icon("icon_2"), "Reset" if self._ch_img else "Set image")
+        self.custom_img.triggered.connect(self._custom_img_triggered)
+
+        self.tint_action = self.addAction("Tint image")
+        self.tint_action.setToolTip("Recolor the image with the crosshair color")
+        self.tint_action.setCheckable(True)
+        self.tint_action.setChecked(parent.ch_tint)  # type: ignore[attr-defined]
+        self.tint_action.toggled.connect(self.parent().set_tint)  # type: ignore[attr-defined]
+
+        self.dynamic_action = self.addAction("Dynamic")
+        self.dynamic_action.setToolTip("React to fire/aim input")
+        self.dynamic_action.setCheckable(True)
+        self.dynamic_action.setChecked(parent.ch_dynamic)  # type: ignore[attr-defined]
+        self.dynamic_action.toggled.connect(self.parent().set_dynamic)  # type: ignore[attr-defined]
+
+        self.auto_contrast_action = self.addAction("Auto contrast")
+        self.auto_contrast_action.setCheckable(True)
+        self.auto_contrast_action.setChecked(parent.ch_auto_contrast)  # type: ignore[attr-defined]
+        self.auto_contrast_action.toggled.connect(self.parent().set_auto_contrast)  # type: ignore[attr-defined]
 
-        self.show_action = self.addAction(QIcon(":/resources/icon_3.png"), "Hide")
+        self.show_action = self.addAction(icon("icon_3"), "Hide")
         self.show_action.triggered.connect(self.toggle_crosshair)
 
-        quit_action = self.addAction(QIcon(":/resources/icon_1.png"), "Exit")
+        self.power_menu = self.addMenu("Power")
+        power_group = QActionGroup(self)
+        for policy, text in (("auto", "Automatic"), ("performance", "Performance"), ("saver", "Power saver")):
+            action = self.power_menu.addAction(text)
+            action.setCheckable(True)
+            action.setChecked(policy == parent.power_policy)  # type: ignore[attr-defined]
+            action.triggered.connect(lambda _=False, p=policy: self.parent().set_power_policy(p))  # type: ignore
+            power_group.addAction(action)
+
+        # Diagnostics for stutter reports, kept out of the way in a submenu
+        self.advanced_menu = self.addMenu("Advanced")
+        self.profiling_action = self.advanced_menu.addAction("Start profiling")
+        self.profiling_action.triggered.connect(self.parent().toggle_profiling)  # type: ignore[attr-defined]
+
+        quit_action = self.addAction(icon("icon_1"), "Exit")
         quit_action.triggered.connect(self.exit_app)
 
     def _create_color_button(self) -> QWidget:
@@ -116,7 +155,7 @@ class SystemTrayMenu(QMenu):
         self.move_cursor_btn = QPushButton()
         self.move_cursor_btn.setFixedSize(22, 22)
         self.move_cursor_btn.setToolTip("Move crosshair")
-        self.move_cursor_btn.setIcon(QIcon(":/resources/move_cursor.png"))
+        self.move_cursor_btn.setIcon(icon("move_cursor"))
         self.move_cursor_btn.setStyleSheet(
             """
             QPushButton {
@@ -129,7 +168,7 @@ class SystemTrayMenu(QMenu):
             """
         )
         self.move_cursor_btn.setToolTip("Move Crosshair")
-        self.move_cursor_btn.clicked.connect(self.parent().enable_move_mode)  # type: ignore[attr-defined]
+        self.move_cursor_btn.clicked.connect(self._toggle_move_mode)
 
         container = QWidget()
         layout = QHBoxLayout(container)
@@ -143,109 +182,138 @@ class SystemTrayMenu(QMenu):
     def open_ch_color_picker(self) -> None:
         color = QColorDialog.getColor()
         if color.isValid():
-            self.color_btn.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background-color: {color.name()};
-                    border: 1px solid black;
-                }}
-                QPushButton:hover {{
-                    background-color: {color.name()};
-                }}
-                """
-            )
-            self.crosshair.setStyleSheet(self.crosshair.styleSheet() + f"background-color: {color.name()};")
-            self._ch_color = color.name()
-            self.parent().ch_color = color.name()
+            self.set_ch_color(color.name())
+
+    def set_ch_color(self, color: str) -> None:
+        self.color_btn.setStyleSheet(
+            f"""
+            QPushButton {{
+                background-color: {color};
+                border: 1px solid black;
+            }}
+            QPushButton:hover {{
+                background-color: {color};
+            }}
+            """
+        )
+        self._ch_color = color
+        self.parent().ch_color = color
+        self._restyle_crosshair()
+        if self._ch_img is not None:
+            self.parent().refresh_pixmap()  # Re-tint the image
+        self.parent().crosshair_changed.emit()
 
     def open_ch_border_color_picker(self) -> None:
         color = QColorDialog.getColor()
         if color.isValid():
-            self.border_color_btn.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background-color: {color.name()};
-                    border: 1px solid black;
-                }}
-                QPushButton:hover {{
-                    background-color: {color.name()};
-                }}
-                """
-            )
-            self.crosshair.setStyleSheet(
-                self.crosshair.styleSheet() + f"border: {self._ch_border_thickness}px solid {color.name()};"
-            )
-            self._ch_border_color = color.name()
-            self.parent().ch_border_color = color.name()
+            self.set_ch_border_color(color.name())
+
+    def set_ch_border_color(self, color: str) -> None:
+        self.border_color_btn.setStyleSheet(
+            f"""
+            QPushButton {{
+                background-color: {color};
+                border: 1px solid black;
+            }}
+            QPushButton:hover {{
+                background-color: {color};
+            }}
+            """
+        )
+        self._ch_border_color = color
+        self.parent().ch_border_color = color
+        if self._ch_img is not None:
+            self.parent().refresh_pixmap()  # The outline follows the image shape
+        else:
+            self._restyle_crosshair()
+        self.parent().crosshair_changed.emit()
+
+    def _restyle_crosshair(self) -> None:
+        """Replace the crosshair stylesheet with one built from the current values, it never grows"""
+        color = self.parent().effective_ch_color()  # The auto contrast color while one is applied
+        stylesheet = crosshair_stylesheet(
+            color, self._ch_border_color, self._ch_size, self._ch_border_thickness, self._ch_img
+        )
+        if self.crosshair.styleSheet() != stylesheet:  # Setting it repolishes the label even when unchanged
+            self.crosshair.setStyleSheet(stylesheet)
 
     def _create_sizer_slider(self) -> QWidget:
         slider_widget = QWidget()
 
-        sizer_slider = QSlider(Qt.Orientation.Horizontal)
-        sizer_slider.setFixedWidth(80)
-        sizer_slider.setToolTip("Size")
-        sizer_slider.setRange(6, 400)  # Bigger value for psychopath 🗿
-        sizer_slider.setValue(self._ch_size)
-        sizer_slider.valueChanged.connect(self._adjust_crosshair_size)
+        self.size_slider = QSlider(Qt.Orientation.Horizontal)
+        self.size_slider.setFixedWidth(80)
+        self.size_slider.setToolTip("Size")
+        self.size_slider.setRange(6, 400)  # Bigger value for psychopath 🗿
+        self.size_slider.setValue(self._ch_size)
+        self.size_slider.valueChanged.connect(self._adjust_crosshair_size)
+        self.size_slider.sliderReleased.connect(self._render_smooth_size)
+
+        # Image crosshairs are scaled fast while the slider is held, then rendered smooth once
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(SMOOTH_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._render_smooth_size)
+        self._fast_frame = False
 
         layout = QVBoxLayout(slider_widget)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(sizer_slider)
+        layout.addWidget(self.size_slider)
         return slider_widget
 
     def _create_opacity_slider(self) -> QWidget:
         opacity_slider_widget = QWidget()
 
-        opacity_slider = QSlider(Qt.Orientation.Horizontal)
-        opacity_slider.setFixedWidth(80)
-        opacity_slider.setToolTip("Opacity")
-        opacity_slider.setRange(0, 255)
-        opacity_slider.setValue(self._ch_opacity * 255)
-        opacity_slider.valueChanged.connect(self._adjust_crosshair_opacity)
+        self.opacity_slider = QSlider(Qt.Orientation.Horizontal)
+        self.opacity_slider.setFixedWidth(80)
+        self.opacity_slider.setToolTip("Opacity")
+        self.opacity_slider.setRange(0, 255)
+        self.opacity_slider.setValue(self._ch_opacity * 255)
+        self.opacity_slider.valueChanged.connect(self._adjust_crosshair_opacity)
 
         layout = QVBoxLayout(opacity_slider_widget)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(opacity_slider)
+        layout.addWidget(self.opacity_slider)
         return opacity_slider_widget
 
     def _create_border_slider(self) -> QWidget:
         border_slider_widget = QWidget()
 
-        border_slider = QSlider(Qt.Orientation.Horizontal)
-        border_slider.setFixedWidth(80)
-        border_slider.setToolTip("Border thickness")
-        border_slider.setRange(0, 10)
-        border_slider.setValue(self._ch_border_thickness)
-        border_slider.valueChanged.connect(self._adjust_crosshair_border)
+        self.border_slider = QSlider(Qt.Orientation.Horizontal)
+        self.border_slider.setFixedWidth(80)
+        self.border_slider.setToolTip("Border thickness")
+        self.border_slider.setRange(0, 10)
+        self.border_slider.setValue(self._ch_border_thickness)
+        self.border_slider.valueChanged.connect(self._adjust_crosshair_border)
 
         layout = QVBoxLayout(border_slider_widget)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(border_slider)
+        layout.addWidget(self.border_slider)
         return border_slider_widget
 
     def _adjust_crosshair_size(self, value: int) -> None:
         size = value
-        border_radius = size // 2
         self._ch_size = size
         self.parent().ch_size = size
 
         self.crosshair.setFixedSize(size, size)
+        self._restyle_crosshair()
 
         if self.crosshair.pixmap() is not None and self._ch_img is not None:
-            self.crosshair.setStyleSheet(
-                self.crosshair.styleSheet() + f"background-color: transparent; border-radius: {border_radius}px;"
-            )
-            scaled = QPixmap(self._ch_img).scaled(
-                size, size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.crosshair.setPixmap(scaled)
-        else:
-            self.crosshair.setStyleSheet(self.crosshair.styleSheet() + f"border-radius: {border_radius}px;")
+            self._fast_frame = self.size_slider.isSliderDown()
+            self.parent().refresh_pixmap(transient=self._fast_frame)
+            if self._fast_frame:
+                self._smooth_timer.start()
+        self.parent().crosshair_changed.emit()
+
+    def _render_smooth_size(self) -> None:
+        """Replace the fast drag frame with the final smooth one"""
+        self._smooth_timer.stop()
+        if self._fast_frame and self._ch_img is not None:
+            self.parent().refresh_pixmap()
+        self._fast_frame = False
 
     def _adjust_crosshair_opacity(self, value: float) -> None:
         """Adjust the crosshair opacity based on the slider value"""
@@ -256,9 +324,13 @@ class SystemTrayMenu(QMenu):
 
     def _adjust_crosshair_border(self, value: int) -> None:
         """Adjust the border thickness of the crosshair"""
-        self.crosshair.setStyleSheet(self.crosshair.styleSheet() + f"border: {value}px solid {self._ch_border_color};")
         self._ch_border_thickness = value
         self.parent().ch_border_thickness = value
+        if self._ch_img is not None:
+            self.parent().refresh_pixmap()  # The outline follows the image shape
+        else:
+            self._restyle_crosshair()
+        self.parent().crosshair_changed.emit()
 
     def set_custom_img(self) -> None:
         img, _ = QFileDialog.getOpenFileName(
@@ -275,25 +347,25 @@ class SystemTrayMenu(QMenu):
             )
         )
 
-        if not img:
-            return
+        if img:
+            img = self.parent().import_image(img)  # Reference a small normalized copy, not the original file
+        if img:
+            self.load_custom_img(img)
 
-        self.crosshair.setStyleSheet(self.crosshair.styleSheet() + f"background-color: transparent;")
-
-        pixmap = QPixmap(img)
-        self.crosshair.setPixmap(
-            pixmap.scaled(
-                self.crosshair.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-        )
-        self.custom_img.setText("Reset")
-        self.custom_img.triggered.disconnect(self.set_custom_img)
-        self.custom_img.triggered.connect(self.reset_custom_img)
+    def _custom_img_triggered(self) -> None:
+        if self._ch_img is not None:
+            self.reset_custom_img()
+        else:
+            self.set_custom_img()
 
+    def load_custom_img(self, img: str) -> None:
         self._ch_img = img
         self.parent().ch_img = img
+        self._restyle_crosshair()
+        self.parent().refresh_pixmap()
+
+        self.custom_img.setText("Reset")
+        self.parent().crosshair_changed.emit()
 
     def reset_custom_img(self) -> None:
         self._ch_img = None
@@ -301,14 +373,12 @@ class SystemTrayMenu(QMenu):
 
         self.crosshair.setPixmap(QPixmap())  # Clear pixmap
         self.crosshair.setFixedSize(self._ch_size, self._ch_size)
-        self.crosshair.setStyleSheet(
-            f"background-color: {self._ch_color};"
-            f"border: {self._ch_border_thickness}px solid {self._ch_border_color};"
-            f"border-radius: {self._ch_size // 2}px;"
-        )
+        self._restyle_crosshair()
         self.custom_img.setText("Set image")
-        self.custom_img.triggered.disconnect(self.reset_custom_img)
-        self.custom_img.triggered.connect(self.set_custom_img)
+        self.parent().crosshair_changed.emit()
+
+    def set_power_state(self, text: str) -> None:
+        self.power_menu.setTitle(f"Power: {text}")
 
     def toggle_crosshair(self) -> None:
         if self.parent().isVisible():
@@ -319,6 +389,13 @@ class SystemTrayMenu(QMenu):
             self.parent().raise_()
             self.show_action.setText("Hide")
 
+    def _toggle_move_mode(self) -> None:
+        """The button stays connected here, the window's move mode decides what a click does"""
+        if self.parent().is_move_mode:  # type: ignore[attr-defined]
+            self.parent().disable_move_mode()  # type: ignore[attr-defined]
+        else:
+            self.parent().enable_move_mode()  # type: ignore[attr-defined]
+
     def exit_app(self) -> None:
         self.parent()._allow_close = True
         QApplication.quit()
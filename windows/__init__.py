@@ -1 +1,2 @@
 from .main_wd import HolySight
+from .remote_wd import RemoteHolySight
@@ -1,19 +1,38 @@
-import sys, json, logging  # noqa E401
+import os, sys, json, time, logging  # noqa E401
+import dataclasses
 from typing import Optional
 
-from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QLabel, QWidget, QVBoxLayout, QMessageBox
-from PySide6.QtGui import QIcon, QPixmap
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QLabel, QVBoxLayout, QMessageBox
+from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtCore import Qt, QTimer, QEvent, Signal
 
+from overlay import OverlayWindow, SETTINGS_PATH
 from widgets import SystemTrayMenu
-
-
-class HolySight(QWidget):
-    def __init__(self):
-        super().__init__()
-        self._allow_close = False
-        self.is_move_mode = False
-        self.drag_position: Optional[QPoint] = None
+from core import (
+    DynamicCrosshair, InputSource, PynputInputSource, AutoContrast, CaptureSource, Marker, MarkerLayer, RenderCache,
+    ImageLibrary, WakeupCounter, MipmapPyramid, SessionProfiler, StallWatchdog, QualityGovernor, QualityTier,
+    PowerMonitor, ForegroundSource, StackingSource, CrosshairState, default_foreground_source, normalize_process_name,
+    default_renderer, render_label, run_in_thread, icon
+)
+from core.priority import SETTINGS_KEYS as PROCESS_SETTINGS_KEYS
+
+# What `apply_settings()` applies, so what a profile preset can change
+PROFILE_KEYS = ("ch_color", "ch_border_color", "ch_size", "ch_opacity", "ch_border_thickness", "ch_img")
+
+
+class HolySight(OverlayWindow):
+    crosshair_changed = Signal()  # Emitted after the crosshair look (size, colors, border, image) changes
+
+    def __init__(
+            self,
+            input_source: Optional[InputSource] = None,
+            capture_source: Optional[CaptureSource] = None,
+            foreground_source: Optional[ForegroundSource] = None,
+            stacking_source: Optional[StackingSource] = None,
+            settings_path: str = SETTINGS_PATH
+    ):
+        super().__init__(stacking_source)
+        self.settings_path = settings_path
 
         self.ch_color: str = "red"
         self.ch_border_color: str = "black"
@@ -21,24 +40,48 @@ class HolySight(QWidget):
         self.ch_opacity: float = 1.0
         self.ch_border_thickness: int = 0
         self.ch_img: Optional[str] = None
+        self.ch_tint: bool = False
         self.ch_pos_x: Optional[int] = None
         self.ch_pos_y: Optional[int] = None
-
+        self.ch_dynamic: bool = False
+        self.ch_fire_trigger: str = "mouse_left"
+        self.ch_fire_spread: float = 1.6
+        self.ch_ads_trigger: str = "mouse_right"
+        self.ch_ads_color: str = "#00ff00"
+        self.ch_auto_contrast: bool = False
+        self.ch_auto_colors: list[str] = ["red", "#00ffff", "white", "black"]
+        self.ch_auto_hz: float = 4.0
+        self.ch_auto_hysteresis: float = 0.25
+        self.ch_markers: list[dict] = []
+        self.watchdog_budget_ms: float = 0  # Stall watchdog budget, 0 keeps it off
+        self.render_quality: str = "auto"  # Quality tier, "auto" adapts it to the measured frame cost
+        self.render_budget_ms: float = 8.0  # Frame cost above which "auto" steps the quality down
+        self.power_policy: str = "auto"  # "auto" saves power on battery, "performance" and "saver" pin the policy
+        self.process_settings: dict = {}  # `core.priority` settings, applied by main.py before the app starts
+        self.app_profiles: dict[str, str] = {}  # Process name -> preset, applied while that process has the focus
+        self.app_profiles_hide: bool = True  # Hide the crosshair while no profiled process has the focus
+
+        self._input_source = input_source
+        self._foreground_source = foreground_source
+        self.foreground: Optional[ForegroundSource] = None
+        self._profile_presets: dict[str, dict] = {}
+        self._profile_pixmaps: dict[str, QPixmap] = {}  # Preset -> its pre-rendered crosshair
+        self._profile_base: dict = {}  # The user's own look, every preset applies on top of it
+        self._active_profile: Optional[str] = None
+        self._hidden_by_profile = False
+        self.wakeup_counter = WakeupCounter()  # Idle accounting, counts only after start()
+        self._mipmaps: Optional[MipmapPyramid] = None
+        self._mipmaps_pending: Optional[str] = None  # Image whose pyramid is being built
+        self.profiler = SessionProfiler()
+        self.watchdog: Optional[StallWatchdog] = None
+        self.dynamic: Optional[DynamicCrosshair] = None
+        self.power = PowerMonitor(os.environ.get("HOLYSIGHT_SYSFS", "/sys"), self)  # The variable points at a fake tree
+        self.power_saving = False
+
+        self.image_library = ImageLibrary(os.path.join(os.path.dirname(self.settings_path), "library"))
         self.load_settings()  # Load settings before packing widgets
-
-        self.setWindowTitle("HolySight")
-        self.setWindowIcon(QIcon(":/resources/holy_sight.png"))
-        self.setFixedSize(500, 500)
-        self.setWindowOpacity(self.ch_opacity)
-
-        # Remove hints and set the window to transparent
-        self.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint |
-            Qt.WindowType.WindowStaysOnTopHint |
-            Qt.WindowType.Tool
-        )
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.governor = QualityGovernor(self.render_budget_ms, self.render_quality, self)
+        self._setup_window()
 
         # ///////////////////////////////////////////////////////////////////////////
 
@@ -46,88 +89,422 @@ class HolySight(QWidget):
         self.crosshair = QLabel(self)
         self.crosshair.setFixedSize(self.ch_size, self.ch_size)
         self.crosshair.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        if self.ch_img:
-            self.crosshair.setStyleSheet(
-                f"background-color: transparent; "
-                f"border: {self.ch_border_thickness}px solid {self.ch_border_color}; "
-                f"border-radius: {self.ch_size // 2}px;"
-            )
-            self.set_pixmap(QPixmap(self.ch_img))
+
+        # Blit the last rendered bitmap right away, the real crosshair is rebuilt once the window is up
+        self.render_cache = RenderCache(os.path.join(os.path.dirname(self.settings_path), "cache"))
+        self._cache_key = RenderCache.key(self.crosshair_state().to_dict())
+        self._cached_image: Optional[QImage] = self.render_cache.load(self._cache_key)
+        self._showing_cached = self._cached_image is not None
+        if self._showing_cached:
+            self.crosshair.setStyleSheet("background-color: transparent; border: none;")
+            self.crosshair.setPixmap(QPixmap.fromImage(self._cached_image))
+            QTimer.singleShot(0, self._refresh_cached_crosshair)
         else:
-            self.crosshair.setStyleSheet(
-                f"background-color: {self.ch_color}; "
-                f"border: {self.ch_border_thickness}px solid {self.ch_border_color}; "
-                f"border-radius: {self.ch_size // 2}px;"
-            )
+            self._build_crosshair()
+            QTimer.singleShot(0, self._store_render_cache)
 
         # Put the crosshair label inside a layout to center it
         layout = QVBoxLayout()
         layout.addWidget(self.crosshair, alignment=Qt.AlignmentFlag.AlignCenter)
         self.setLayout(layout)
 
+        # Secondary markers share this window and are painted together, below the main crosshair
+        self.marker_layer = MarkerLayer(self, self.crosshair)
+        self.marker_layer.setGeometry(self.rect())
+        self.marker_layer.lower()
+        self.marker_layer.set_device_pixel_ratio(self.governor.device_pixel_ratio(self))
+        self.marker_layer.set_markers([Marker.from_dict(m) for m in self.ch_markers])
+
         # ///////////////////////////////////////////////////////////////////////////
 
         # Create the system tray menu
         self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon(":/resources/holy_sight.png"))
+        self.tray_icon.setIcon(icon("holy_sight"))
         self.tray_menu = SystemTrayMenu(self, self.crosshair)
         self.tray_icon.setContextMenu(self.tray_menu)
         self.tray_icon.activated.connect(self.tray_activated)
 
         # ///////////////////////////////////////////////////////////////////////////
 
+        # Background-adaptive color, samples only while enabled and visible
+        self.auto_contrast = AutoContrast(self, self.crosshair, capture_source, self.marker_layer)
+        self.auto_contrast.color_changed.connect(self._apply_auto_color)
+        self.crosshair_changed.connect(self._configure_auto_contrast)
+        self.crosshair_changed.connect(self._leave_cached_crosshair)
+        self.crosshair_changed.connect(self._build_mipmaps)
+        self._build_mipmaps()
+        self._configure_auto_contrast()
+        self.governor.tier_changed.connect(self._apply_quality_tier)
+
+        budget = self.watchdog_budget_ms
+        if "HOLYSIGHT_WATCHDOG_MS" in os.environ:
+            try:
+                budget = float(os.environ["HOLYSIGHT_WATCHDOG_MS"])
+            except ValueError:
+                logging.warning(
+                    f"Invalid HOLYSIGHT_WATCHDOG_MS {os.environ['HOLYSIGHT_WATCHDOG_MS']!r}, "
+                    f"using {self.watchdog_budget_ms} ms"
+                )
+        if budget > 0:
+            self.watchdog = StallWatchdog(budget)
+            self.watchdog.start()
+
+        # ///////////////////////////////////////////////////////////////////////////
+
+        self.power.changed.connect(self._apply_power_policy)
+        self.set_power_policy(self.power_policy)
+
         self.disable_move_mode(init=True)
+        self.set_dynamic(self.ch_dynamic)
+        self.set_app_profiles(self.app_profiles)
 
         # Show the crosshair window and system tray icon
         self.tray_icon.show()
         self.show()
 
     def enable_move_mode(self) -> None:
-        self.is_move_mode = True
         self.tray_menu.move_cursor_btn.setToolTip("Exit Move Mode")
-        self.tray_menu.move_cursor_btn.clicked.disconnect()
-        self.tray_menu.move_cursor_btn.clicked.connect(self.disable_move_mode)
         self.tray_menu.close()
-
-        if sys.platform == "win32":
-            import win32gui
-            import win32con
-            window_handle = self.winId().__int__()
-            ex_style = win32gui.GetWindowLong(window_handle, win32con.GWL_EXSTYLE)
-            ex_style &= ~win32con.WS_EX_TRANSPARENT  # Remove WS_EX_TRANSPARENT, so we can move the window
-            win32gui.SetWindowLong(window_handle, win32con.GWL_EXSTYLE, ex_style)
+        super().enable_move_mode()
 
     def disable_move_mode(self, init=False) -> None:
-        self.is_move_mode = False
-
         self.tray_menu.move_cursor_btn.setToolTip("Move Crosshair")
-        self.tray_menu.move_cursor_btn.clicked.disconnect()
-        self.tray_menu.move_cursor_btn.clicked.connect(self.enable_move_mode)  # type: ignore[attr-defined]
-
-        if sys.platform == "win32":
-            # Make everything click-trough
-            import win32gui
-            import win32con
-            window_handle = self.winId().__int__()
-            ex_style = win32gui.GetWindowLong(window_handle, win32con.GWL_EXSTYLE)
-            ex_style |= win32con.WS_EX_TRANSPARENT
-            win32gui.SetWindowLong(window_handle, win32con.GWL_EXSTYLE, ex_style)
+        super().disable_move_mode(init)
+
+        if init and sys.platform != "win32" and QApplication.platformName() != "offscreen":  # Nobody reads it headless
+            QMessageBox.warning(
+                self,
+                "Platform Warning",
+                f"This application is optimized for Windows. "
+                f"It may not work properly on <b>`{sys.platform}`</b>"
+            )
+
+    def toggle_profiling(self) -> None:
+        if self.profiler.running:
+            self.profiler.stop()
         else:
-            if init:
-                QMessageBox.warning(
-                    self,
-                    "Platform Warning",
-                    f"This application is optimized for Windows. "
-                    f"It may not work properly on <b>`{sys.platform}`</b>"
-                )
+            self.profiler.start()
+        self.tray_menu.profiling_action.setText("Stop profiling" if self.profiler.running else "Start profiling")
+
+    def handle_command(self, command: dict) -> None:
+        """Run a command forwarded from the command line, see `ipc.parse_args`"""
+        if "preset" in command:
+            self.apply_preset(command["preset"])
+        if "size" in command:
+            self.tray_menu.size_slider.setValue(command["size"])
+        if command.get("center"):
+            self.center_window()
+        if command.get("toggle"):
+            self.tray_menu.toggle_crosshair()
+
+    def load_preset(self, name: str) -> Optional[dict]:
+        path = os.path.join(os.path.dirname(self.settings_path), "presets", f"{os.path.basename(name)}.json")
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            logging.warning(f"Preset not found: {path}")
+        except Exception as e:
+            logging.error(f"Failed to load preset {name}: {e}")
+        return None
+
+    def apply_preset(self, name: str) -> None:
+        settings = self.load_preset(name)
+        if settings is None:
+            return
+        try:
+            self.apply_settings(settings)
+        except Exception as e:
+            logging.error(f"Failed to apply preset {name}: {e}")
+
+    def set_app_profiles(self, profiles: dict[str, str]) -> None:
+        """Follow the foreground application and apply the preset mapped to it, an empty mapping stops following"""
+        if self.foreground is not None:
+            self.foreground.stop()
+            self.foreground.changed.disconnect(self._on_foreground_changed)
+            self.foreground = None
+        self._show_hidden_by_profile()
+        self._restore_profile_base()
+
+        self.app_profiles = {normalize_process_name(process): preset for process, preset in profiles.items()}
+        self._profile_presets.clear()
+        if not self.app_profiles:
+            self._profile_pixmaps.clear()
+            return
+
+        # Every profile is loaded and rendered now, so a focus change only swaps in a finished pixmap
+        for preset in set(self.app_profiles.values()):
+            settings = self.load_preset(preset)
+            if settings is not None:
+                self._profile_presets[preset] = settings
+        self._render_profiles()
+
+        source = self._foreground_source or default_foreground_source()
+        if source is None:
+            logging.warning("Foreground app profiles are not supported on this platform")
+            return
+        source.changed.connect(self._on_foreground_changed)
+        if not source.start():
+            source.changed.disconnect(self._on_foreground_changed)
+            return
+        self.foreground = source
+
+    def _render_profiles(self) -> None:
+        """Take the current look as the base of every preset and pre-render each of them on top of it"""
+        self._profile_base = {key: getattr(self, key) for key in PROFILE_KEYS}
+        dpr = self.governor.device_pixel_ratio(self)
+        self._profile_pixmaps = {
+            preset: default_renderer().render_pixmap(self._profile_state(settings), dpr=dpr)
+            for preset, settings in self._profile_presets.items()
+        }
 
-    def center_window(self) -> None:
-        screen_geometry = QApplication.primaryScreen().geometry()
-        screen_center = screen_geometry.center()
-        window_rect = self.rect()
-        window_center = window_rect.center()
-        new_position = screen_center - window_center
-        self.move(new_position)
+    def _profile_settings(self, settings: dict) -> dict:
+        """A preset on top of the base, so keys it leaves out never keep the previous game's values"""
+        return {**self._profile_base, **settings}
+
+    def _profile_state(self, settings: dict) -> CrosshairState:
+        return CrosshairState.from_settings(
+            {**self.crosshair_state().to_dict(), **self._profile_settings(settings)}
+        )
+
+    def _restore_profile_base(self) -> None:
+        if self._active_profile is not None:
+            self._active_profile = None
+            self.apply_settings(self._profile_base)
+
+    def _on_foreground_changed(self, process: str, pid: int) -> None:
+        if pid == os.getpid():  # The tray menu and its dialogs
+            return
+        preset = self.app_profiles.get(process)
+        if preset is None:
+            if self.app_profiles_hide and self.isVisible():
+                self._hidden_by_profile = True
+                self.tray_menu.toggle_crosshair()
+            self._restore_profile_base()
+            return
+
+        self._show_hidden_by_profile()
+        self.switch_profile(preset)
+
+    def _show_hidden_by_profile(self) -> None:
+        if self._hidden_by_profile and not self.isVisible():  # Unless it was shown by hand in the meantime
+            self.tray_menu.toggle_crosshair()
+        self._hidden_by_profile = False
+
+    def switch_profile(self, preset: str) -> None:
+        """Apply a profile preset, showing its pre-rendered crosshair right away when there is one"""
+        settings = self._profile_presets.get(preset) or self.load_preset(preset)
+        if settings is None:
+            return
+        if self._active_profile is None and any(getattr(self, k) != v for k, v in self._profile_base.items()):
+            self._render_profiles()  # The user changed the crosshair since the profiles were rendered
+        self._active_profile = preset
+        settings = self._profile_settings(settings)
+        state = self._profile_state(settings)
+        pixmap = self._profile_pixmaps.get(preset)
+        if state == self.crosshair_state() or pixmap is None:
+            self.apply_settings(settings)
+            return
+
+        # The real crosshair is rebuilt behind the pre-rendered one on the next pass, like the startup render cache
+        self._showing_cached = True
+        self.crosshair.setStyleSheet("background-color: transparent; border: none;")
+        self.crosshair.setFixedSize(pixmap.deviceIndependentSize().toSize())
+        self.crosshair.setPixmap(pixmap)
+        QTimer.singleShot(0, lambda: self._finish_profile_switch(settings))
+
+    def _finish_profile_switch(self, settings: dict) -> None:
+        self.apply_settings(settings)
+        self._leave_cached_crosshair()
+
+    def apply_settings(self, settings: dict) -> None:
+        """Apply crosshair settings through the same paths the tray menu uses"""
+        menu = self.tray_menu
+        if "ch_size" in settings:
+            menu.size_slider.setValue(settings["ch_size"])
+        if "ch_opacity" in settings:
+            menu.opacity_slider.setValue(round(settings["ch_opacity"] * 255))
+        if "ch_border_thickness" in settings:
+            menu.border_slider.setValue(settings["ch_border_thickness"])
+        if settings.get("ch_color", self.ch_color) != self.ch_color:
+            menu.set_ch_color(settings["ch_color"])
+        if settings.get("ch_border_color", self.ch_border_color) != self.ch_border_color:
+            menu.set_ch_border_color(settings["ch_border_color"])
+        if "ch_img" in settings:
+            img = settings["ch_img"]
+            if img and not self.image_library.contains(img):
+                img = self.import_image(img)
+            if img != self.ch_img:
+                if self.ch_img:
+                    menu.reset_custom_img()
+                if img:
+                    menu.load_custom_img(img)
+
+    def instrumentation(self) -> dict:
+        """Snapshot of the runtime counters, for logs and headless checks"""
+        return {
+            "wakeups": self.wakeup_counter.snapshot(),
+            "input_latency": self.dynamic.latency.snapshot() if self.dynamic is not None else None,
+            "stalls": self.watchdog.snapshot() if self.watchdog is not None else None,
+            "quality": self.governor.snapshot(),
+            "power": self.power.snapshot(),
+            "keep_on_top": self.keep_on_top.snapshot(),
+        }
+
+    def import_image(self, path: str) -> Optional[str]:
+        """Copy an image into the library and return the entry to use as `ch_img`"""
+        try:
+            return self.image_library.import_image(path)
+        except Exception as e:
+            logging.error(f"Failed to import image {path}: {e}")
+            return None
+
+    def crosshair_state(self) -> CrosshairState:
+        return CrosshairState(
+            self.ch_color, self.ch_border_color, self.ch_size, self.ch_border_thickness, self.ch_img, self.ch_tint
+        )
+
+    def _build_crosshair(self, pixmap: Optional[QPixmap] = None) -> None:
+        default_renderer().apply(self.crosshair, self.crosshair_state(), pixmap)
+
+    def _refresh_cached_crosshair(self) -> None:
+        """Rebuild the real crosshair behind the cached bitmap, decoding the image off the GUI thread"""
+        if not self._showing_cached:
+            return
+        if self.ch_img:
+            img, size = self.ch_img, self.ch_size
+            run_in_thread(
+                lambda: QImage(img).scaled(
+                    size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+                ),
+                self._finish_cached_refresh
+            )
+        else:
+            self._finish_cached_refresh(None)
+
+    def _finish_cached_refresh(self, image: Optional[QImage]) -> None:
+        if not self._showing_cached:  # The crosshair was changed in the meantime
+            return
+        self._showing_cached = False
+        self._build_crosshair(QPixmap.fromImage(image) if image is not None and not image.isNull() else None)
+        self._store_render_cache()
+
+    def _leave_cached_crosshair(self) -> None:
+        if self._showing_cached:
+            self._showing_cached = False
+            self._build_crosshair()
+
+    def _store_render_cache(self) -> None:
+        """Store the bitmap the crosshair label draws, unless the cache already holds exactly that"""
+        if self._showing_cached or self.ch_auto_contrast:
+            return
+        key = RenderCache.key(self.crosshair_state().to_dict())
+        image = render_label(self.crosshair).toImage()
+        if key == self._cache_key and image == self._cached_image:
+            return
+        self.render_cache.store(key, image)
+        self._cache_key, self._cached_image = key, image
+
+    def set_dynamic(self, enabled: bool) -> None:
+        """Start or stop the input-reactive crosshair"""
+        if self.dynamic is not None:
+            self.dynamic.stop()
+            self.crosshair_changed.disconnect(self.dynamic.invalidate)
+            self.dynamic.deleteLater()
+            self.dynamic = None
+
+        self.ch_dynamic = enabled
+        if not enabled or self.power_saving:  # Kept off while saving power, restarted with the policy
+            return
+
+        source = self._input_source or PynputInputSource({self.ch_fire_trigger, self.ch_ads_trigger})
+        self.dynamic = DynamicCrosshair(self, self.crosshair, source, self.governor)
+        self.crosshair_changed.connect(self.dynamic.invalidate)
+        if not self.dynamic.start():
+            self.set_dynamic(False)
+            self.tray_menu.dynamic_action.setChecked(False)
+
+    def set_tint(self, enabled: bool) -> None:
+        """Recolor image crosshairs with `ch_color`"""
+        self.ch_tint = enabled
+        self.refresh_pixmap()
+        self.crosshair_changed.emit()
+
+    def set_auto_contrast(self, enabled: bool) -> None:
+        """Enable or disable the background-adaptive crosshair color"""
+        self.ch_auto_contrast = enabled
+        self._configure_auto_contrast()
+        if not enabled and not self.ch_img:
+            self._apply_auto_color(self.ch_color)
+
+    def effective_ch_color(self) -> str:
+        """The color the crosshair is currently drawn with"""
+        if self.auto_contrast.is_active() and self.auto_contrast.current:
+            return self.auto_contrast.current
+        return self.ch_color
+
+    def _configure_auto_contrast(self) -> None:
+        self.auto_contrast.configure(
+            [self.ch_color, *self.ch_auto_colors], self.ch_auto_hz, self.ch_auto_hysteresis
+        )
+        self._update_auto_contrast()
+
+    def _update_auto_contrast(self) -> None:
+        self.auto_contrast.set_active(
+            self.ch_auto_contrast and self.isVisible() and not self.ch_img and not self.power_saving
+        )
+
+    def set_power_policy(self, policy: str) -> None:
+        """"auto" follows the power source and profile, "performance" and "saver" pin the policy"""
+        self.power_policy = policy
+        if policy == "auto":
+            self.power.start()
+        else:
+            self.power.stop()
+        self._apply_power_policy()
+
+    def _apply_power_policy(self) -> None:
+        """While saving power, animations and background sampling stop and images are scaled the cheap way"""
+        saving = self.power_policy == "saver" or (self.power_policy == "auto" and self.power.saving)
+        reason = self.power.describe() if self.power_policy == "auto" else "manual"
+        self.tray_menu.set_power_state(f"{'saver' if saving else 'performance'} ({reason})")
+        if saving == self.power_saving:
+            return
+
+        self.power_saving = saving
+        self.governor.force("low" if saving else self.render_quality)
+        self.set_dynamic(self.ch_dynamic)
+        self.auto_contrast.reset()
+        self._update_auto_contrast()
+        if saving and self.ch_auto_contrast and not self.ch_img:
+            self._apply_auto_color(self.ch_color)
+
+    def _apply_auto_color(self, color: str) -> None:
+        self.crosshair.setStyleSheet(dataclasses.replace(self.crosshair_state(), color=color).stylesheet())
+        if self.dynamic is not None:
+            self.dynamic.invalidate()
+
+    def add_marker(self) -> Marker:
+        marker = Marker()
+        self.marker_layer.set_markers([*self.marker_layer.markers, marker])
+        self._sync_markers()
+        return marker
+
+    def update_marker(self, index: int, **changes) -> None:
+        marker = self.marker_layer.markers[index]
+        for key, value in changes.items():
+            setattr(marker, key, value)
+        self.marker_layer.invalidate(index)
+        self._sync_markers()
+
+    def remove_marker(self, index: int) -> None:
+        markers = list(self.marker_layer.markers)
+        del markers[index]
+        self.marker_layer.set_markers(markers)
+        self._sync_markers()
+
+    def _sync_markers(self) -> None:
+        self.ch_markers = [marker.to_dict() for marker in self.marker_layer.markers]
 
     def tray_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
         """Handle system tray click events"""
@@ -138,7 +515,7 @@ class HolySight(QWidget):
 
     def load_settings(self) -> None:
         try:
-            with open("./config/settings.json", "r") as f:
+            with open(self.settings_path, "r") as f:
                 settings = json.load(f)
 
             self.ch_color = settings.get("ch_color", "red")
@@ -147,8 +524,30 @@ class HolySight(QWidget):
             self.ch_opacity = settings.get("ch_opacity", 1.0)
             self.ch_border_thickness = settings.get("ch_border_thickness", 0)
             self.ch_img = settings.get("ch_img", None)
+            self.ch_tint = settings.get("ch_tint", False)
             self.ch_pos_x = settings.get("ch_pos_x", None)
             self.ch_pos_y = settings.get("ch_pos_y", None)
+            self.ch_dynamic = settings.get("ch_dynamic", False)
+            self.ch_fire_trigger = settings.get("ch_fire_trigger", "mouse_left")
+            self.ch_fire_spread = settings.get("ch_fire_spread", 1.6)
+            self.ch_ads_trigger = settings.get("ch_ads_trigger", "mouse_right")
+            self.ch_ads_color = settings.get("ch_ads_color", "#00ff00")
+            self.ch_auto_contrast = settings.get("ch_auto_contrast", False)
+            self.ch_auto_colors = settings.get("ch_auto_colors", ["red", "#00ffff", "white", "black"])
+            self.ch_auto_hz = settings.get("ch_auto_hz", 4.0)
+            self.ch_auto_hysteresis = settings.get("ch_auto_hysteresis", 0.25)
+            self.ch_markers = settings.get("ch_markers", [])
+            self.watchdog_budget_ms = settings.get("watchdog_budget_ms", 0)
+            self.render_quality = settings.get("render_quality", "auto")
+            self.render_budget_ms = settings.get("render_budget_ms", 8.0)
+            self.power_policy = settings.get("power_policy", "auto")
+            self.process_settings = {key: settings[key] for key in PROCESS_SETTINGS_KEYS if key in settings}
+            self.app_profiles = settings.get("app_profiles", {})
+            self.app_profiles_hide = settings.get("app_profiles_hide", True)
+
+            # Images picked before the library existed are imported once
+            if self.ch_img and os.path.exists(self.ch_img) and not self.image_library.contains(self.ch_img):
+                self.ch_img = self.import_image(self.ch_img) or self.ch_img
         except FileNotFoundError:
             logging.warning("Settings file not found. Using default values.")
         except Exception as e:
@@ -162,75 +561,114 @@ class HolySight(QWidget):
             "ch_opacity": self.ch_opacity,
             "ch_border_thickness": self.ch_border_thickness,
             "ch_img": self.ch_img,
+            "ch_tint": self.ch_tint,
             "ch_pos_x": self.pos().x(),
-            "ch_pos_y": self.pos().y()
+            "ch_pos_y": self.pos().y(),
+            "ch_dynamic": self.ch_dynamic,
+            "ch_fire_trigger": self.ch_fire_trigger,
+            "ch_fire_spread": self.ch_fire_spread,
+            "ch_ads_trigger": self.ch_ads_trigger,
+            "ch_ads_color": self.ch_ads_color,
+            "ch_auto_contrast": self.ch_auto_contrast,
+            "ch_auto_colors": self.ch_auto_colors,
+            "ch_auto_hz": self.ch_auto_hz,
+            "ch_auto_hysteresis": self.ch_auto_hysteresis,
+            "ch_markers": self.ch_markers,
+            "watchdog_budget_ms": self.watchdog_budget_ms,
+            "render_quality": self.render_quality,
+            "render_budget_ms": self.render_budget_ms,
+            "power_policy": self.power_policy,
+            "app_profiles": self.app_profiles,
+            "app_profiles_hide": self.app_profiles_hide,
+            **self.process_settings,
+            **(self._profile_base if self._active_profile is not None else {})  # A game's preset is not the user's
         }
 
         try:
-            with open("./config/settings.json", "w") as f:
+            with open(self.settings_path, "w") as f:
                 json.dump(settings, f, indent=4)
         except Exception as e:
             logging.error(f"Failed to save settings: {e}")
 
-    def set_pixmap(self, pixmap: QPixmap) -> None:
+    def _build_mipmaps(self) -> None:
+        """Build the pyramid of the current image on the thread pool, once per image"""
+        if not self.ch_img:
+            self._mipmaps = None
+            return
+        if self._mipmaps is not None and self._mipmaps.path == self.ch_img:
+            return
+        self._mipmaps = None
+        if self._mipmaps_pending == self.ch_img:  # Already on its way, size and color changes need the same one
+            return
+        img = self._mipmaps_pending = self.ch_img
+        run_in_thread(lambda: MipmapPyramid.load(img), lambda mipmaps: self._mipmaps_ready(img, mipmaps))
+
+    def _mipmaps_ready(self, img: str, mipmaps: Optional[MipmapPyramid]) -> None:
+        if self._mipmaps_pending == img:
+            self._mipmaps_pending = None
+        if mipmaps is None or mipmaps.path != self.ch_img:  # Failed, or the image changed meanwhile
+            return
+        self._mipmaps = mipmaps
+        if not self._showing_cached:
+            self.refresh_pixmap()
+
+    def refresh_pixmap(self, transient: bool = False) -> None:
+        """Scale the current image into the crosshair, from the mipmap pyramid once it is built"""
+        if not self.ch_img:
+            return
+        fast = transient or self.governor.tier.fast_scaling
+        if self._mipmaps is not None and self._mipmaps.path == self.ch_img:
+            size = self.crosshair_state().image_size()
+            self.set_pixmap(QPixmap.fromImage(self._mipmaps.scaled(size, fast)), transient, "mipmap")
+        else:
+            self.set_pixmap(default_renderer().source(self.ch_img), transient)
+
+    def set_pixmap(self, pixmap: QPixmap, transient: bool = False, source_kind: Optional[str] = None) -> None:
+        """
+        Scale `pixmap` into the crosshair, `transient` is for frames that are about to be replaced. `source_kind`
+        names what a pixmap other than the decoded file was built from, see `CrosshairRenderer.image_pixmap()`.
+        """
+        start = time.perf_counter_ns()
+        fast = self.governor.tier.fast_scaling
         self.crosshair.setPixmap(
-            pixmap.scaled(
-                self.ch_size, self.ch_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            default_renderer().image_pixmap(self.crosshair_state(), pixmap, fast, transient, source_kind)
         )
-
-    def mousePressEvent(self, event):
-        """Start dragging if clicking on move_cursor in move mode."""
-        if self.is_move_mode and event.button() == Qt.MouseButton.LeftButton:
-            # Check if the click is within move_cursor's geometry
-            if self.crosshair.geometry().contains(event.position().toPoint()):
-                self.drag_position = event.globalPosition().toPoint() - self.pos()
-                event.accept()
-            else:
-                event.ignore()
-        else:
-            event.ignore()
-
-    def mouseMoveEvent(self, event):
-        """Move the window if dragging in move mode."""
-        if self.is_move_mode and event.buttons() & Qt.MouseButton.LeftButton and self.drag_position is not None:
-            self.move(event.globalPosition().toPoint() - self.drag_position)
-            event.accept()
-        else:
-            event.ignore()
-
-    def mouseDoubleClickEvent(self, event):
-        """Center the window on double-click within move_cursor."""
-        if self.is_move_mode and self.crosshair.geometry().contains(event.position().toPoint()):
-            self.center_window()
-            event.accept()
-        else:
-            event.ignore()
-
-    def keyPressEvent(self, event):
-        """Exit move mode on Enter or Escape key."""
-        if self.is_move_mode and event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Escape):
-            self.disable_move_mode()
-            event.accept()
-        else:
-            event.ignore()
+        self.governor.record(start)
+
+    def _apply_quality_tier(self, tier: QualityTier) -> None:
+        self.marker_layer.set_device_pixel_ratio(self.governor.device_pixel_ratio(self))
+        if not self._showing_cached:
+            self.refresh_pixmap()
+
+    def event(self, event) -> bool:
+        """Time every paint of the overlay, the whole window is painted in its update request"""
+        if event.type() != QEvent.Type.UpdateRequest:
+            return super().event(event)
+        start = time.perf_counter_ns()
+        result = super().event(event)
+        self.governor.record(start)
+        return result
 
     def showEvent(self, event):
         """Restore saved position or center window on show."""
-        if self.ch_pos_x is not None and self.ch_pos_y is not None:
-            new_position = QPoint(self.ch_pos_x, self.ch_pos_y)
-            self.move(new_position)
-        else:
-            self.center_window()
-
         super().showEvent(event)
+        self._update_auto_contrast()
+
+    def hideEvent(self, event):
+        """Stop sampling the background while the crosshair is hidden."""
+        super().hideEvent(event)
+        self._update_auto_contrast()
 
     def closeEvent(self, event):
         """Override the closeEvent to save user settings when closing the app."""
         if self._allow_close:
             event.accept()
             self.save_settings()
+            self._store_render_cache()
+            if self.watchdog is not None:
+                self.watchdog.stop()
+            if self.foreground is not None:
+                self.foreground.stop()
+            self.keep_on_top.stop()
         else:
             event.ignore()
@@ -0,0 +1,158 @@
+import os, logging  # noqa E401
+from typing import Optional
+
+from PySide6.QtWidgets import QApplication, QLabel, QWidget
+from PySide6.QtCore import QTimer, Signal
+
+from ipc import send_command
+from overlay import SETTINGS_PATH
+from widgets import SystemTrayMenu
+from core import Marker, MarkerLayer, ImageLibrary, SessionProfiler
+
+
+class RemoteHolySight(QWidget):
+    """
+    Config UI process of the split mode, stands in for `HolySight` behind the tray menu.
+
+    The menu drives it like the real window. Every `ch_*` attribute it sets is batched and sent to the overlay process
+    as one `state` command per event loop pass. Nothing but the menu and its dialogs is shown, and the process exits
+    once they are closed.
+    """
+    crosshair_changed = Signal()
+    move_mode_changed = Signal(bool)
+
+    def __init__(self, state: dict, settings_path: str = SETTINGS_PATH):
+        super().__init__()
+        self._pending: dict = {}
+        self._visible: bool = state.get("visible", True)
+        self.settings_path = settings_path
+        self.is_move_mode: bool = state.get("move_mode", False)
+
+        self.ch_color: str = "red"
+        self.ch_border_color: str = "black"
+        self.ch_size: int = 8
+        self.ch_opacity: float = 1.0
+        self.ch_border_thickness: int = 0
+        self.ch_img: Optional[str] = None
+        self.ch_tint: bool = False
+        self.ch_dynamic: bool = False
+        self.ch_auto_contrast: bool = False
+        self.ch_markers: list[dict] = []
+        self.power_policy: str = "auto"
+        self.__dict__.update({key: value for key, value in state.items() if key.startswith("ch_")})
+        self._connected = True  # From here on `ch_*` changes go to the overlay
+
+        self.profiler = SessionProfiler()
+        self.image_library = ImageLibrary(os.path.join(os.path.dirname(self.settings_path), "library"))
+
+        self.crosshair = QLabel()  # Never shown, the tray menu styles it like the overlay's label
+        self.marker_layer = MarkerLayer(self, self.crosshair)
+        self.marker_layer.set_markers([Marker.from_dict(m) for m in self.ch_markers])
+
+        self.tray_menu = SystemTrayMenu(self, self.crosshair)
+        self.tray_menu.aboutToHide.connect(lambda: QTimer.singleShot(0, self._quit_when_closed))
+        # The split overlay draws the static crosshair only
+        self.tray_menu.dynamic_action.setVisible(False)
+        self.tray_menu.auto_contrast_action.setVisible(False)
+        self.tray_menu.power_menu.menuAction().setVisible(False)
+        self.tray_menu.show_action.setText("Hide" if self._visible else "Show")
+        if self.is_move_mode:
+            self.tray_menu.move_cursor_btn.setToolTip("Exit Move Mode")
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name.startswith("ch_") and self.__dict__.get("_connected"):
+            if not self._pending:
+                QTimer.singleShot(0, self.flush)
+            self._pending[name] = value
+        elif name == "_allow_close" and value:  # Set by the tray "Exit" action, which quits the overlay too
+            self.flush()
+            send_command({"quit": True})
+
+    def flush(self) -> None:
+        """Send the batched changes to the overlay"""
+        if self._pending:
+            state, self._pending = self._pending, {}
+            if not send_command({"state": state}):
+                logging.warning("The overlay process is gone, changes were not applied")
+
+    def isVisible(self) -> bool:
+        return self._visible
+
+    def show(self) -> None:
+        self._visible = True
+        send_command({"visible": True})
+
+    def hide(self) -> None:
+        self._visible = False
+        send_command({"visible": False})
+
+    def raise_(self) -> None:
+        pass
+
+    def enable_move_mode(self) -> None:
+        self.is_move_mode = True
+        self.tray_menu.close()
+        send_command({"move_mode": True})
+
+    def disable_move_mode(self) -> None:
+        self.is_move_mode = False
+        self.tray_menu.close()
+        send_command({"move_mode": False})
+
+    def set_dynamic(self, enabled: bool) -> None:
+        self.ch_dynamic = enabled
+
+    def set_tint(self, enabled: bool) -> None:
+        self.ch_tint = enabled
+
+    def set_auto_contrast(self, enabled: bool) -> None:
+        self.ch_auto_contrast = enabled
+
+    def toggle_profiling(self) -> None:
+        if self.profiler.running:
+            self.profiler.stop()
+        else:
+            self.profiler.start()
+        self.tray_menu.profiling_action.setText("Stop profiling" if self.profiler.running else "Start profiling")
+
+    def import_image(self, path: str) -> Optional[str]:
+        """Copy an image into the library and return the entry to use as `ch_img`"""
+        try:
+            return self.image_library.import_image(path)
+        except Exception as e:
+            logging.error(f"Failed to import image {path}: {e}")
+            return None
+
+    def effective_ch_color(self) -> str:
+        return self.ch_color  # The split overlay has no auto contrast
+
+    def refresh_pixmap(self, transient: bool = False) -> None:
+        pass  # The overlay scales the image itself
+
+    def add_marker(self) -> Marker:
+        marker = Marker()
+        self.marker_layer.set_markers([*self.marker_layer.markers, marker])
+        self._sync_markers()
+        return marker
+
+    def update_marker(self, index: int, **changes) -> None:
+        marker = self.marker_layer.markers[index]
+        for key, value in changes.items():
+            setattr(marker, key, value)
+        self._sync_markers()
+
+    def remove_marker(self, index: int) -> None:
+        markers = list(self.marker_layer.markers)
+        del markers[index]
+        self.marker_layer.set_markers(markers)
+        self._sync_markers()
+
+    def _sync_markers(self) -> None:
+        self.ch_markers = [marker.to_dict() for marker in self.marker_layer.markers]
+
+    def _quit_when_closed(self) -> None:
+        """Exit once the menu is closed and no dialog opened from it is left"""
+        if self.tray_menu.isVisible() or QApplication.activeModalWidget() is not None:
+            return
+        QApplication.quit()